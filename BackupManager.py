@@ -0,0 +1,673 @@
+"""
+Backup Manager
+Consistent, non-blocking backups of the loan database.
+
+Backups are taken with SQLite's online backup API instead of copying the
+file, so a write in flight can never leave a torn copy: the backup sees the
+database as of a single transaction. In WAL mode the copy reads from one
+snapshot while the app keeps writing; otherwise it restarts if another
+connection writes part-way through. Pages are copied in small steps, which keeps the
+app responsive and lets the copy report progress and be cancelled. Every
+copy is checked with PRAGMA integrity_check before it is kept.
+
+In incremental mode a backup is a snapshot instead of a full copy: the
+verified copy is cut into fixed-size chunks, each chunk is stored once under
+its SHA-256 in a shared block store, and the snapshot itself is a small JSON
+manifest listing its chunks. A daily snapshot of a large database therefore
+only writes the chunks whose pages changed since an earlier snapshot.
+Snapshots can be restored to a file and old ones pruned; blocks no manifest
+refers to any more are deleted with them.
+
+BackupScheduler takes such snapshots automatically while the app runs, but
+only when the data actually changed since the previous one.
+
+Snapshot store layout (inside the chosen backup folder):
+    loanApp_snapshots/manifests/loanApp_2025_01_31_18_30_00_123456.json
+    loanApp_snapshots/blocks/3f/3fa2...e1(.gz)
+    loanApp_snapshots/.lock
+
+Snapshots, restores and pruning hold an OS lock on the .lock file while they
+touch the store, so a prune (e.g. from the command line) can never delete
+blocks that a snapshot running at the same time has just written or reused.
+The lock goes away with the process holding it, so a crash cannot leave the
+store locked.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from PyQt5.QtCore import QObject, QRunnable, QTimer, pyqtSignal
+from DatabaseManager import DatabaseManager
+from DatabaseWorker import get_thread_pool
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# ===== CUSTOMIZABLE VARIABLES =====
+BACKUP_PAGES_PER_STEP = 256  # Pages copied per backup step (progress is reported between steps)
+BACKUP_COMPRESS = False  # If True, backups are written gzip-compressed as .db.gz
+BACKUP_FILE_PREFIX = "loanApp_"  # loanApp_2025_01_31_18_30_00.db
+PARTIAL_SUFFIX = ".part"  # Backups are written under this suffix until verified
+BACKUP_MODE = "full"  # "full" writes a complete copy, "incremental" a deduplicated snapshot
+SNAPSHOT_DIR_NAME = "loanApp_snapshots"  # Snapshot store created inside the backup folder
+SNAPSHOT_CHUNK_SIZE = 256 * 1024  # Bytes per stored block (a multiple of the database page size)
+SNAPSHOT_KEEP = 30  # Newest snapshots kept by pruning; older ones are deleted
+SNAPSHOT_LOCK_TIMEOUT = 300  # Seconds to wait for another snapshot or prune to release the store
+# Automatic backups (incremental snapshots taken in the background after login)
+AUTO_BACKUP_ENABLED = True
+AUTO_BACKUP_DIR = "loanApp_auto_backups"  # Relative to the database folder (the working directory)
+AUTO_BACKUP_AFTER_WRITES = 50  # Snapshot once this many write transactions have been committed...
+AUTO_BACKUP_INTERVAL_MINUTES = 30  # ...or this long after the last snapshot, if anything changed
+AUTO_BACKUP_KEEP = 48  # Automatic snapshots kept (manual backups are not touched)
+AUTO_BACKUP_CHECK_SECONDS = 60  # How often the scheduler checks whether a snapshot is due
+# ==================================
+
+
+class BackupError(Exception):
+    """Raised when a backup could not be written or failed verification."""
+
+
+class BackupCancelled(Exception):
+    """Raised from the progress callback to stop a backup part-way."""
+
+
+def try_lock_file(lock_file):
+    """Take an exclusive, non-blocking lock on an open file; raises OSError if it is held."""
+    if os.name == "nt":
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def unlock_file(lock_file):
+    if os.name == "nt":
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class BackupManager:
+    @staticmethod
+    def backup_file_name(compress=BACKUP_COMPRESS, moment=None):
+        """Timestamped backup file name, e.g. loanApp_2025_01_31_18_30_00.db(.gz)."""
+        moment = moment or datetime.now()
+        extension = ".db.gz" if compress else ".db"
+        return f"{BACKUP_FILE_PREFIX}{moment.strftime('%Y_%m_%d_%H_%M_%S')}{extension}"
+
+    @staticmethod
+    def copy_database(dest_path, progress=None, should_cancel=None):
+        """
+        Copy the live database to dest_path with the SQLite backup API.
+
+        Args:
+            dest_path: File to write (overwritten if it exists)
+            progress: Optional callable(pages_copied, total_pages), called between steps
+            should_cancel: Optional callable returning True to stop the copy
+
+        Raises:
+            BackupCancelled: if should_cancel asked to stop
+            sqlite3.Error: if the copy failed
+        """
+        def on_step(status, remaining, total):
+            if should_cancel and should_cancel():
+                raise BackupCancelled()
+            if progress:
+                progress(total - remaining, total)
+
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+
+        source = DatabaseManager.create_connection()
+        try:
+            if source.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal":
+                # Copy from one read snapshot; otherwise every write made by the
+                # app during the copy would restart it from the first page
+                source.isolation_level = None
+                source.execute("BEGIN")
+                source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+
+            dest = sqlite3.connect(dest_path)
+            try:
+                source.backup(dest, pages=BACKUP_PAGES_PER_STEP, progress=on_step)
+                # A copy of a WAL database would otherwise need its -wal file next to it
+                dest.execute("PRAGMA journal_mode = DELETE")
+            finally:
+                dest.close()
+        finally:
+            source.close()
+
+    @staticmethod
+    def verify_database(path):
+        """
+        Run PRAGMA integrity_check on a database file.
+
+        Returns:
+            tuple: (ok, message) where message is the first problem reported, if any
+        """
+        try:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                result = conn.execute("PRAGMA integrity_check").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            return False, str(e)
+
+        message = result[0] if result else "no result"
+        return message == "ok", message
+
+    @staticmethod
+    def compress_file(src_path, dest_path):
+        """gzip src_path into dest_path."""
+        with open(src_path, 'rb') as src, gzip.open(dest_path, 'wb') as dest:
+            shutil.copyfileobj(src, dest, 1024 * 1024)
+
+    @staticmethod
+    def create_backup(dest_dir, compress=BACKUP_COMPRESS, progress=None, should_cancel=None):
+        """
+        Write a verified, timestamped backup of the database into dest_dir.
+
+        The copy is written under PARTIAL_SUFFIX and only renamed (or
+        compressed) to its final name once the integrity check passes, so a
+        failed or cancelled backup never leaves a file that looks complete.
+
+        Args:
+            dest_dir: Directory to write the backup into
+            compress: gzip the backup (.db.gz)
+            progress: Optional callable(pages_copied, total_pages)
+            should_cancel: Optional callable returning True to stop the backup
+
+        Returns:
+            str: Path of the backup file
+
+        Raises:
+            BackupCancelled: if the backup was cancelled
+            BackupError: if the backup could not be written or verified
+        """
+        moment = datetime.now()
+        dest_path = os.path.join(dest_dir, BackupManager.backup_file_name(compress, moment))
+        partial_path = os.path.join(dest_dir, BackupManager.backup_file_name(False, moment) + PARTIAL_SUFFIX)
+
+        try:
+            BackupManager.copy_database(partial_path, progress, should_cancel)
+
+            ok, message = BackupManager.verify_database(partial_path)
+            if not ok:
+                raise BackupError(f"Backup failed the integrity check: {message}")
+
+            if compress:
+                BackupManager.compress_file(partial_path, dest_path)
+                os.remove(partial_path)
+            else:
+                os.replace(partial_path, dest_path)
+            return dest_path
+
+        except (sqlite3.Error, OSError) as e:
+            raise BackupError(str(e)) from e
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+
+    @staticmethod
+    def snapshot_store(dest_dir):
+        return os.path.join(dest_dir, SNAPSHOT_DIR_NAME)
+
+    @staticmethod
+    @contextmanager
+    def store_lock(store, should_cancel=None, timeout=SNAPSHOT_LOCK_TIMEOUT):
+        """
+        Hold the snapshot store's lock file for the duration of the block.
+
+        Waits up to timeout seconds for another snapshot, restore or prune
+        (in this or another process) to finish.
+
+        Raises:
+            BackupCancelled: if should_cancel() turns True while waiting
+            BackupError: if the store stays busy for longer than timeout
+        """
+        os.makedirs(store, exist_ok=True)
+        deadline = time.monotonic() + timeout
+        with open(os.path.join(store, ".lock"), 'a+b') as lock_file:
+            while True:
+                try:
+                    try_lock_file(lock_file)
+                    break
+                except OSError:
+                    if should_cancel and should_cancel():
+                        raise BackupCancelled()
+                    if time.monotonic() >= deadline:
+                        raise BackupError("The snapshot store is busy with another snapshot or prune")
+                    time.sleep(0.2)
+            try:
+                yield
+            finally:
+                unlock_file(lock_file)
+
+    @staticmethod
+    def manifest_path(store, moment):
+        """
+        Unused manifest path for a snapshot taken at moment (call with the store locked).
+
+        Names carry microseconds, and a counter is added in the unlikely case the
+        name is still taken, so two snapshots never overwrite each other's manifest.
+        """
+        manifests_dir = os.path.join(store, "manifests")
+        name = f"{BACKUP_FILE_PREFIX}{moment.strftime('%Y_%m_%d_%H_%M_%S_%f')}"
+        path = os.path.join(manifests_dir, name + ".json")
+        counter = 1
+        while os.path.exists(path):
+            counter += 1
+            path = os.path.join(manifests_dir, f"{name}_{counter}.json")
+        return path
+
+    @staticmethod
+    def block_path(store, digest, compressed=False):
+        path = os.path.join(store, "blocks", digest[:2], digest)
+        return path + ".gz" if compressed else path
+
+    @staticmethod
+    def find_block(store, digest):
+        """Path of a stored block (plain or compressed), or None if it is not stored."""
+        for compressed in (False, True):
+            path = BackupManager.block_path(store, digest, compressed)
+            if os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def write_block(store, digest, data, compress):
+        path = BackupManager.block_path(store, digest, compress)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial_path = path + PARTIAL_SUFFIX
+        with (gzip.open(partial_path, 'wb') if compress else open(partial_path, 'wb')) as block:
+            block.write(data)
+        os.replace(partial_path, path)
+
+    @staticmethod
+    def read_block(path):
+        with (gzip.open(path, 'rb') if path.endswith(".gz") else open(path, 'rb')) as block:
+            return block.read()
+
+    @staticmethod
+    def create_snapshot(dest_dir, compress=BACKUP_COMPRESS, progress=None, should_cancel=None):
+        """
+        Write an incremental snapshot of the database into dest_dir's snapshot store.
+
+        The database is first copied (as in create_backup) to a verified
+        temporary file on the local disk; only chunks that are not in the
+        store yet are then written to dest_dir. The manifest is written last,
+        so an interrupted snapshot leaves at most unreferenced blocks, which
+        the next prune deletes. The store is locked (store_lock) from the
+        first block lookup until the manifest is in place.
+
+        Args:
+            dest_dir: Backup folder holding the snapshot store
+            compress: gzip newly stored blocks
+            progress: Optional callable(done, total): pages copied, then chunks stored
+            should_cancel: Optional callable returning True to stop the snapshot
+
+        Returns:
+            str: Path of the snapshot's manifest
+
+        Raises:
+            BackupCancelled: if the snapshot was cancelled
+            BackupError: if the snapshot could not be written or verified
+        """
+        moment = datetime.now()
+        store = BackupManager.snapshot_store(dest_dir)
+        handle, copy_path = tempfile.mkstemp(suffix=".db", prefix=BACKUP_FILE_PREFIX)
+        os.close(handle)
+
+        try:
+            BackupManager.copy_database(copy_path, progress, should_cancel)
+            ok, message = BackupManager.verify_database(copy_path)
+            if not ok:
+                raise BackupError(f"Backup failed the integrity check: {message}")
+
+            size = os.path.getsize(copy_path)
+            total_chunks = (size + SNAPSHOT_CHUNK_SIZE - 1) // SNAPSHOT_CHUNK_SIZE
+            chunks = []
+            new_chunks = 0
+            file_hash = hashlib.sha256()
+
+            with BackupManager.store_lock(store, should_cancel):
+                with open(copy_path, 'rb') as copy:
+                    for data in iter(lambda: copy.read(SNAPSHOT_CHUNK_SIZE), b""):
+                        if should_cancel and should_cancel():
+                            raise BackupCancelled()
+                        file_hash.update(data)
+                        digest = hashlib.sha256(data).hexdigest()
+                        if BackupManager.find_block(store, digest) is None:
+                            BackupManager.write_block(store, digest, data, compress)
+                            new_chunks += 1
+                        chunks.append(digest)
+                        if progress:
+                            progress(len(chunks), total_chunks)
+
+                manifest = {
+                    "created": moment.isoformat(timespec="seconds"),
+                    "size": size,
+                    "sha256": file_hash.hexdigest(),
+                    "chunk_size": SNAPSHOT_CHUNK_SIZE,
+                    "new_chunks": new_chunks,
+                    "chunks": chunks,
+                }
+                manifest_path = BackupManager.manifest_path(store, moment)
+                os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+                with open(manifest_path + PARTIAL_SUFFIX, 'w') as manifest_file:
+                    json.dump(manifest, manifest_file)
+                os.replace(manifest_path + PARTIAL_SUFFIX, manifest_path)
+            return manifest_path
+
+        except (sqlite3.Error, OSError) as e:
+            raise BackupError(str(e)) from e
+        finally:
+            if os.path.exists(copy_path):
+                os.remove(copy_path)
+
+    @staticmethod
+    def list_snapshots(dest_dir):
+        """Manifest paths in dest_dir's snapshot store, oldest first."""
+        manifests_dir = os.path.join(BackupManager.snapshot_store(dest_dir), "manifests")
+        if not os.path.isdir(manifests_dir):
+            return []
+        return [
+            os.path.join(manifests_dir, name)
+            for name in sorted(os.listdir(manifests_dir))
+            if name.endswith(".json")
+        ]
+
+    @staticmethod
+    def read_manifest(manifest_path):
+        with open(manifest_path) as manifest_file:
+            return json.load(manifest_file)
+
+    @staticmethod
+    def restore_snapshot(manifest_path, dest_path, progress=None):
+        """
+        Rebuild the database file recorded by a snapshot manifest.
+
+        The file is assembled under PARTIAL_SUFFIX, checked against the
+        manifest's SHA-256 and with PRAGMA integrity_check, and only then
+        moved to dest_path. Close the app (or DatabaseManager's connections)
+        before restoring over the live database.
+
+        Args:
+            manifest_path: Manifest from list_snapshots
+            dest_path: Database file to write
+            progress: Optional callable(chunks_written, total_chunks)
+
+        Returns:
+            str: dest_path
+
+        Raises:
+            BackupError: if a block is missing or the result does not verify
+        """
+        partial_path = dest_path + PARTIAL_SUFFIX
+        try:
+            store = os.path.dirname(os.path.dirname(os.path.abspath(manifest_path)))
+            file_hash = hashlib.sha256()
+
+            # A prune running meanwhile could delete the manifest or its blocks
+            with BackupManager.store_lock(store), open(partial_path, 'wb') as restored:
+                manifest = BackupManager.read_manifest(manifest_path)
+                chunks = manifest["chunks"]
+                for index, digest in enumerate(chunks, 1):
+                    block = BackupManager.find_block(store, digest)
+                    if block is None:
+                        raise BackupError(f"Snapshot block {digest} is missing")
+                    data = BackupManager.read_block(block)
+                    file_hash.update(data)
+                    restored.write(data)
+                    if progress:
+                        progress(index, len(chunks))
+
+            if file_hash.hexdigest() != manifest["sha256"]:
+                raise BackupError("Restored file does not match the snapshot checksum")
+            ok, message = BackupManager.verify_database(partial_path)
+            if not ok:
+                raise BackupError(f"Restored database failed the integrity check: {message}")
+
+            os.replace(partial_path, dest_path)
+            return dest_path
+
+        except (OSError, ValueError, KeyError) as e:
+            raise BackupError(f"Could not restore snapshot: {e}") from e
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    @staticmethod
+    def prune_snapshots(dest_dir, keep=SNAPSHOT_KEEP):
+        """
+        Delete all but the newest keep snapshots, then every block no remaining
+        snapshot refers to (including blocks left by interrupted snapshots).
+
+        Returns:
+            tuple: (snapshots_removed, blocks_removed)
+        """
+        store = BackupManager.snapshot_store(dest_dir)
+        if not os.path.isdir(store):
+            return 0, 0
+
+        # Locked so blocks a running snapshot has written (or reused) but not yet
+        # listed in its manifest are not mistaken for unreferenced ones
+        with BackupManager.store_lock(store):
+            manifests = BackupManager.list_snapshots(dest_dir)
+            expired = manifests[:-keep] if keep > 0 else manifests
+            for manifest_path in expired:
+                os.remove(manifest_path)
+
+            referenced = set()
+            for manifest_path in manifests[len(expired):]:
+                referenced.update(BackupManager.read_manifest(manifest_path)["chunks"])
+
+            blocks_removed = 0
+            blocks_dir = os.path.join(store, "blocks")
+            for root, _, names in os.walk(blocks_dir):
+                for name in names:
+                    digest = name[:-len(".gz")] if name.endswith(".gz") else name
+                    if digest not in referenced:
+                        os.remove(os.path.join(root, name))
+                        blocks_removed += 1
+        return len(expired), blocks_removed
+
+
+class BackupSignals(QObject):
+    progress = pyqtSignal(int, int)  # pages copied, total pages
+    finished = pyqtSignal(str)       # backup file path
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class BackupTask(QRunnable):
+    """
+    Runs a backup on a worker thread: a full copy (create_backup) or, in
+    "incremental" mode, a snapshot (create_snapshot) followed by pruning.
+
+    cancel() stops the copy at the next step; nothing is left behind.
+    """
+
+    def __init__(self, dest_dir, compress=BACKUP_COMPRESS, mode=BACKUP_MODE, keep=SNAPSHOT_KEEP):
+        super().__init__()
+        self.dest_dir = dest_dir
+        self.compress = compress
+        self.mode = mode
+        self.keep = keep
+        self.signals = BackupSignals()
+        self.cancel_requested = threading.Event()
+        # The caller keeps the task alive until it reports back
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self.cancel_requested.set()
+
+    def run(self):
+        try:
+            if self.mode == "incremental":
+                path = BackupManager.create_snapshot(
+                    self.dest_dir, self.compress,
+                    progress=self.signals.progress.emit,
+                    should_cancel=self.cancel_requested.is_set
+                )
+                BackupManager.prune_snapshots(self.dest_dir, self.keep)
+            else:
+                path = BackupManager.create_backup(
+                    self.dest_dir, self.compress,
+                    progress=self.signals.progress.emit,
+                    should_cancel=self.cancel_requested.is_set
+                )
+            self.signals.finished.emit(path)
+        except BackupCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+
+class BackupScheduler(QObject):
+    """
+    Takes incremental snapshots into AUTO_BACKUP_DIR in the background.
+
+    Every AUTO_BACKUP_CHECK_SECONDS it compares DatabaseManager.data_generation()
+    (bumped by every committed write transaction) with its value at the last
+    snapshot. A snapshot is due after AUTO_BACKUP_AFTER_WRITES writes, or after
+    AUTO_BACKUP_INTERVAL_MINUTES once there has been at least one write; an
+    unchanged database is never backed up again. Snapshots run as a BackupTask
+    on the worker pool and are rotated down to AUTO_BACKUP_KEEP.
+    """
+
+    backup_finished = pyqtSignal(str)  # manifest path
+    backup_failed = pyqtSignal(str)
+
+    def __init__(self, parent=None, backup_dir=AUTO_BACKUP_DIR):
+        super().__init__(parent)
+        self.backup_dir = backup_dir
+        self.task = None
+        self.backed_up_generation = DatabaseManager.data_generation()
+        self.running_generation = None
+        self.last_backup_time = time.monotonic()
+        self.failed_at = None
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(AUTO_BACKUP_CHECK_SECONDS * 1000)
+        self.timer.timeout.connect(self.check)
+
+    def start(self):
+        if AUTO_BACKUP_ENABLED:
+            self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        if self.task is not None:
+            self.task.cancel()
+
+    def writes_since_backup(self):
+        return DatabaseManager.data_generation() - self.backed_up_generation
+
+    def is_due(self):
+        writes = self.writes_since_backup()
+        if writes <= 0:
+            return False  # Nothing changed since the last snapshot
+        now = time.monotonic()
+        interval = AUTO_BACKUP_INTERVAL_MINUTES * 60
+        if self.failed_at is not None and now - self.failed_at < interval:
+            return False  # Don't retry a failing backup on every check
+        return writes >= AUTO_BACKUP_AFTER_WRITES or now - self.last_backup_time >= interval
+
+    def check(self):
+        if self.task is None and self.is_due():
+            self.backup_now()
+
+    def backup_now(self):
+        """Start a snapshot right away (unless one is already running)."""
+        if self.task is not None:
+            return
+        try:
+            os.makedirs(self.backup_dir, exist_ok=True)
+        except OSError as e:
+            self.on_failed(str(e))
+            return
+
+        # Writes committed while the snapshot runs count towards the next one
+        self.running_generation = DatabaseManager.data_generation()
+        self.task = BackupTask(self.backup_dir, mode="incremental", keep=AUTO_BACKUP_KEEP)
+        self.task.signals.finished.connect(self.on_finished)
+        self.task.signals.failed.connect(self.on_failed)
+        self.task.signals.cancelled.connect(self.on_cancelled)
+        get_thread_pool().start(self.task)
+
+    def on_finished(self, manifest_path):
+        self.task = None
+        self.backed_up_generation = self.running_generation
+        self.last_backup_time = time.monotonic()
+        self.failed_at = None
+        self.backup_finished.emit(manifest_path)
+
+    def on_failed(self, message):
+        self.task = None
+        self.failed_at = time.monotonic()
+        print(f"Automatic backup failed: {message}")
+        self.backup_failed.emit(message)
+
+    def on_cancelled(self):
+        self.task = None
+
+
+def main():
+    """Command line access to the snapshot store (list, snapshot, restore, prune)."""
+    parser = argparse.ArgumentParser(description="Loan database snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_command = commands.add_parser("list", help="List the snapshots in a backup folder")
+    list_command.add_argument("backup_dir")
+
+    snapshot_command = commands.add_parser("snapshot", help="Take an incremental snapshot now")
+    snapshot_command.add_argument("backup_dir")
+    snapshot_command.add_argument("--compress", action="store_true", help="gzip new blocks")
+
+    restore_command = commands.add_parser("restore", help="Rebuild a database file from a snapshot")
+    restore_command.add_argument("manifest", help="Snapshot manifest (.json) to restore")
+    restore_command.add_argument("dest", help="Database file to write, e.g. loanApp_restored.db")
+
+    prune_command = commands.add_parser("prune", help="Delete old snapshots and unused blocks")
+    prune_command.add_argument("backup_dir")
+    prune_command.add_argument("--keep", type=int, default=SNAPSHOT_KEEP)
+
+    args = parser.parse_args()
+    try:
+        if args.command == "list":
+            for manifest_path in BackupManager.list_snapshots(args.backup_dir):
+                manifest = BackupManager.read_manifest(manifest_path)
+                print(f"{manifest_path}  {manifest['created']}  {manifest['size']} bytes, "
+                      f"{manifest['new_chunks']} of {len(manifest['chunks'])} chunks new")
+        elif args.command == "snapshot":
+            print(BackupManager.create_snapshot(args.backup_dir, args.compress))
+        elif args.command == "restore":
+            print(f"Restored to {BackupManager.restore_snapshot(args.manifest, args.dest)}")
+        elif args.command == "prune":
+            snapshots, blocks = BackupManager.prune_snapshots(args.backup_dir, args.keep)
+            print(f"Removed {snapshots} snapshots and {blocks} blocks")
+    except BackupError as e:
+        print(f"Error: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
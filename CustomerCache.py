@@ -0,0 +1,157 @@
+import bisect
+from PyQt5.QtCore import QObject, pyqtSignal
+from DatabaseManager import DatabaseManager
+from searchIndex import NgramIndex
+
+# One cache for the whole application; every page shares it
+_customer_cache = None
+
+
+def get_customer_cache():
+    """Return the process-wide customer cache."""
+    global _customer_cache
+    if _customer_cache is None:
+        _customer_cache = CustomerCache()
+    return _customer_cache
+
+
+def customer_sort_key(customer):
+    # Same order as "ORDER BY name" in get_all_customers, ties broken by id
+    return customer['name'], customer['id']
+
+
+def customer_search_text(customer):
+    """Text a customer is found by: name and phone number."""
+    return f"{customer['name']} {customer['phone']}"
+
+
+class CustomerCache(QObject):
+    """
+    In-memory copy of the customer list (id, name, phone) used by the
+    customer dropdowns.
+
+    It is loaded from the database once. Code that writes customers tells the
+    cache afterwards (sync_new_customers after inserts and imports,
+    refresh_customer after an edit), the cache reads back only those rows and
+    emits the delta, so pages insert or update single dropdown items instead
+    of re-querying and rebuilding the whole list on every visit.
+    """
+
+    customers_added = pyqtSignal(list)   # new customer dicts, in list order
+    customer_changed = pyqtSignal(dict)  # customer dict after an edit
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.loaded = False
+        self.by_id = {}
+        self.ordered = []  # customer dicts sorted by customer_sort_key
+        self.sort_keys = []
+        self.max_customer_id = 0
+        self.search_index = NgramIndex()  # name/phone lookup for the search boxes
+
+    def ensure_loaded(self):
+        if self.loaded:
+            return
+        self.loaded = True
+        for customer_id, name, phone in DatabaseManager.get_all_customers():
+            self.add(customer_id, name, phone)
+
+    def customers(self):
+        """All customers in dropdown order."""
+        self.ensure_loaded()
+        return self.ordered
+
+    def get(self, customer_id):
+        self.ensure_loaded()
+        return self.by_id.get(customer_id)
+
+    def search(self, query, within=None):
+        """Ids of customers whose name/phone contain every word of query (see NgramIndex.search)."""
+        self.ensure_loaded()
+        return self.search_index.search(query, within)
+
+    def add(self, customer_id, name, phone):
+        customer = {'id': customer_id, 'name': name, 'phone': phone if phone else ''}
+        key = customer_sort_key(customer)
+        index = bisect.bisect(self.sort_keys, key)
+        self.sort_keys.insert(index, key)
+        self.ordered.insert(index, customer)
+        self.by_id[customer_id] = customer
+        self.max_customer_id = max(self.max_customer_id, customer_id)
+        self.search_index.add(customer_id, customer_search_text(customer))
+        return customer
+
+    def sync_new_customers(self):
+        """Pick up customers inserted since the last load/sync and announce them."""
+        if not self.loaded:
+            return
+        added = [
+            self.add(customer_id, name, phone)
+            for customer_id, name, phone in DatabaseManager.get_customers_since(self.max_customer_id)
+        ]
+        if added:
+            self.customers_added.emit(added)
+
+    def refresh_customer(self, customer_id):
+        """Re-read one customer after it was edited and announce the change."""
+        if not self.loaded or customer_id not in self.by_id:
+            return
+        details = DatabaseManager.get_customer_by_id(customer_id)
+        if not details:
+            return
+
+        # Update the dict in place so lists holding it stay current, then re-sort it
+        customer = self.by_id[customer_id]
+        index = bisect.bisect_left(self.sort_keys, customer_sort_key(customer))
+        del self.sort_keys[index]
+        del self.ordered[index]
+        customer['name'] = details['name']
+        customer['phone'] = details['phone'] if details['phone'] else ''
+        key = customer_sort_key(customer)
+        index = bisect.bisect(self.sort_keys, key)
+        self.sort_keys.insert(index, key)
+        self.ordered.insert(index, customer)
+        self.search_index.add(customer_id, customer_search_text(customer))
+        self.customer_changed.emit(customer)
+
+
+def customer_display_text(customer):
+    """Dropdown label showing the phone number next to the name."""
+    return f"{customer['name']} - {customer['phone']}" if customer['phone'] else f"{customer['name']}"
+
+
+def customer_item_position(combo, customer, first_row=0):
+    """Row at which customer belongs in a combo box of customers kept in list order."""
+    cache = get_customer_cache()
+    key = customer_sort_key(customer)
+    low, high = first_row, combo.count()
+    while low < high:
+        middle = (low + high) // 2
+        other = cache.get(combo.itemData(middle))
+        if other is not None and customer_sort_key(other) < key:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def insert_customer_item(combo, customer, text, first_row=0):
+    """Insert one customer into a combo box without rebuilding it."""
+    combo.blockSignals(True)
+    combo.insertItem(customer_item_position(combo, customer, first_row), text, customer['id'])
+    combo.blockSignals(False)
+
+
+def update_customer_item(combo, customer, text, first_row=0):
+    """Move/relabel an edited customer's combo box item, keeping the current selection."""
+    row = combo.findData(customer['id'])
+    if row < first_row:
+        return
+    combo.blockSignals(True)
+    was_current = combo.currentIndex() == row
+    combo.removeItem(row)
+    row = customer_item_position(combo, customer, first_row)
+    combo.insertItem(row, text, customer['id'])
+    if was_current:
+        combo.setCurrentIndex(row)
+    combo.blockSignals(False)
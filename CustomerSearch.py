@@ -0,0 +1,129 @@
+import heapq
+from PyQt5.QtCore import QObject, QTimer, QAbstractListModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtWidgets import QCompleter
+from CustomerCache import get_customer_cache, customer_display_text, customer_search_text, customer_sort_key
+from searchIndex import normalize_search_text, query_extends
+
+# ===== CUSTOMIZABLE VARIABLES =====
+SEARCH_DEBOUNCE_MS = 200  # Wait this long after the last keystroke before searching
+MAX_MATCHES = 100  # Customers shown in the dropdown/completer for a search
+# ==================================
+
+
+def match_rank(customer, query):
+    """Sort key putting names/phones that start with the query first, then words that do."""
+    name = customer['name'].lower()
+    if name.startswith(query) or customer['phone'].startswith(query):
+        rank = 0
+    elif f" {query}" in f" {name}":
+        rank = 1
+    else:
+        rank = 2
+    return rank, customer_sort_key(customer)
+
+
+class CustomerMatchModel(QAbstractListModel):
+    """
+    List model over the current search matches, shared by the search box's
+    completer. Replacing the matches is a single model reset.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.customers = []
+
+    def set_customers(self, customers):
+        self.beginResetModel()
+        self.customers = customers
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.customers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        customer = self.customers[index.row()]
+        if role == Qt.DisplayRole:
+            return customer_display_text(customer)
+        if role == Qt.EditRole:
+            # Text put in the search box when a suggestion is picked; it matches only that customer
+            return customer_search_text(customer).strip()
+        if role == Qt.UserRole:
+            return customer['id']
+        return None
+
+
+class CustomerSearch(QObject):
+    """
+    Debounced, incremental customer search for a page's search box.
+
+    Keystrokes restart a short timer and the search runs once typing pauses.
+    Matches come from the customer cache's n-gram index; when the new text
+    just extends the previous one, the previous matches are filtered instead
+    of searching again. Results are announced through matches_found and also
+    offered as completer suggestions under the search box.
+    """
+
+    matches_found = pyqtSignal(list)  # customer dicts, best match first (all customers if the box is empty)
+
+    def __init__(self, search_box, parent=None):
+        super().__init__(parent)
+        self.search_box = search_box
+        self.customer_cache = get_customer_cache()
+        self.last_query = None
+        self.last_matches = None  # every id matching last_query, not only the ones shown
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.timer.timeout.connect(self.search_now)
+        search_box.textChanged.connect(self.timer.start)
+
+        self.match_model = CustomerMatchModel(self)
+        self.completer = QCompleter(self.match_model, self)
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completer.setMaxVisibleItems(10)
+        search_box.setCompleter(self.completer)
+
+        # Cached matches are stale once a customer is added or edited
+        self.customer_cache.customers_added.connect(self.invalidate)
+        self.customer_cache.customer_changed.connect(self.invalidate)
+
+    def invalidate(self, *args):
+        self.last_query = None
+        self.last_matches = None
+
+    def has_query(self):
+        return bool(normalize_search_text(self.search_box.text()))
+
+    def refresh(self):
+        """Search again from scratch right away (after the customer list changed)."""
+        self.invalidate()
+        self.search_now()
+
+    def search_now(self):
+        self.timer.stop()
+        query = normalize_search_text(self.search_box.text())
+
+        if not query:
+            self.invalidate()
+            self.match_model.set_customers([])
+            self.matches_found.emit(self.customer_cache.customers())
+            return
+
+        within = self.last_matches if query_extends(query, self.last_query) else None
+        self.last_matches = self.customer_cache.search(query, within)
+        self.last_query = query
+
+        customers = [self.customer_cache.get(customer_id) for customer_id in self.last_matches]
+        matches = heapq.nsmallest(
+            MAX_MATCHES, (customer for customer in customers if customer is not None),
+            key=lambda customer: match_rank(customer, query)
+        )
+
+        self.match_model.set_customers(matches)
+        # A single match is selected by the page directly; no need for suggestions
+        if len(matches) > 1 and self.search_box.hasFocus():
+            self.completer.complete()
+        self.matches_found.emit(matches)
@@ -1,156 +1,799 @@
 import sqlite3
 import os
+import atexit
+import datetime
+import itertools
+import queue
+import threading
+from contextlib import contextmanager
+
+# ===== CONNECTION SETTINGS =====
+DB_PATH = "loanApp.db"
+WORKER_POOL_SIZE = 4  # Max connections shared by background worker threads
+IMPORT_CHUNK_SIZE = 1000  # Rows validated and inserted together by bulk imports
+# Totals reported per customer (and overall) by get_portfolio_aggregates
+AGGREGATE_FIELDS = ("loans", "open_loans", "loan_amount", "amount_paid", "amount_due", "interest", "weight")
+# "performance" is meant for a local disk. Use "safe" (start the app with
+# --db-profile=safe, or set the LOANAPP_DB_PROFILE environment variable to
+# "safe") when the database lives on a pendrive that may be pulled out while
+# the app is running.
+DB_PROFILE = os.environ.get("LOANAPP_DB_PROFILE", "performance")
+PRAGMA_PROFILES = {
+    "performance": (
+        ("journal_mode", "WAL"),    # Report reads no longer block repayment writes
+        ("synchronous", "NORMAL"),  # Sync at checkpoints instead of on every commit
+        ("mmap_size", 268435456),   # Map up to 256 MB of the file for reads
+        ("cache_size", -32000),     # ~32 MB page cache per connection
+        ("temp_store", "MEMORY"),   # Sorts and temp indexes stay in RAM
+        ("busy_timeout", 5000),     # Wait for a competing writer instead of failing
+    ),
+    "safe": (
+        ("journal_mode", "DELETE"),
+        ("synchronous", "FULL"),
+        ("mmap_size", 0),
+        ("cache_size", -2000),
+        ("temp_store", "DEFAULT"),
+        ("busy_timeout", 5000),
+    ),
+}
+# ===============================
+
+# ===== SCHEMA MIGRATIONS =====
+# Entry N upgrades the schema from version N to N + 1. PRAGMA user_version
+# records the last applied version, so init_database upgrades existing
+# databases in place and new databases run through the whole list.
+SCHEMA_MIGRATIONS = [
+    # 1: secondary indexes for the per-customer, per-loan and date lookups
+    (
+        "CREATE INDEX IF NOT EXISTS idx_loans_customer_created ON Loans(customer_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_loans_created_at ON Loans(created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_loans_reference_id ON Loans(registered_reference_id)",
+        # Covering indexes so the LoanView joins never touch the table rows
+        "CREATE INDEX IF NOT EXISTS idx_assets_loan_cover ON Assets(loan_id, description, weight)",
+        "CREATE INDEX IF NOT EXISTS idx_payments_loan_cover ON LoanPayments(loan_id, payment_amount, interest_amount)",
+        "CREATE INDEX IF NOT EXISTS idx_payments_loan_asset ON LoanPayments(loan_id, asset_description)",
+        "ANALYZE",
+    ),
+    # 2: LoanSummary, one pre-aggregated row per loan kept current by triggers.
+    #    LoanView becomes a plain projection of it, so readers no longer join
+    #    and GROUP BY Loans x Assets x LoanPayments (which also multiplied the
+    #    asset weight by the number of payments).
+    (
+        """
+        CREATE TABLE IF NOT EXISTS LoanSummary (
+            loan_id INTEGER PRIMARY KEY,
+            customer_id INTEGER NOT NULL,
+            loan_date TIMESTAMP,
+            asset_descriptions TEXT,
+            total_asset_weight DECIMAL(10, 2),
+            loan_amount DECIMAL(10, 2) NOT NULL,
+            loan_amount_due DECIMAL(10, 2) NOT NULL,
+            total_interest_amount DECIMAL(10, 2) NOT NULL DEFAULT 0,
+            registered_reference_id TEXT
+        )
+        """,
+        """
+        INSERT OR REPLACE INTO LoanSummary (
+            loan_id, customer_id, loan_date, asset_descriptions, total_asset_weight,
+            loan_amount, loan_amount_due, total_interest_amount, registered_reference_id
+        )
+        SELECT
+            l.loan_id,
+            l.customer_id,
+            l.created_at,
+            (SELECT GROUP_CONCAT(a.description, '; ') FROM Assets a WHERE a.loan_id = l.loan_id),
+            (SELECT SUM(a.weight) FROM Assets a WHERE a.loan_id = l.loan_id),
+            l.loan_amount,
+            l.loan_amount - l.loan_amount_paid,
+            COALESCE((SELECT SUM(p.interest_amount) FROM LoanPayments p WHERE p.loan_id = l.loan_id), 0),
+            l.registered_reference_id
+        FROM Loans l
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_loan_summary_customer ON LoanSummary(customer_id, loan_date)",
+        "CREATE INDEX IF NOT EXISTS idx_loan_summary_date ON LoanSummary(loan_date)",
+        "CREATE INDEX IF NOT EXISTS idx_loan_summary_reference ON LoanSummary(registered_reference_id)",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_loan_summary_loan_insert AFTER INSERT ON Loans
+        BEGIN
+            INSERT OR REPLACE INTO LoanSummary (
+                loan_id, customer_id, loan_date, asset_descriptions, total_asset_weight,
+                loan_amount, loan_amount_due, total_interest_amount, registered_reference_id
+            ) VALUES (
+                NEW.loan_id, NEW.customer_id, NEW.created_at,
+                (SELECT GROUP_CONCAT(description, '; ') FROM Assets WHERE loan_id = NEW.loan_id),
+                (SELECT SUM(weight) FROM Assets WHERE loan_id = NEW.loan_id),
+                NEW.loan_amount, NEW.loan_amount - NEW.loan_amount_paid,
+                COALESCE((SELECT SUM(interest_amount) FROM LoanPayments WHERE loan_id = NEW.loan_id), 0),
+                NEW.registered_reference_id
+            );
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_loan_summary_loan_update
+        AFTER UPDATE OF customer_id, created_at, loan_amount, loan_amount_paid, registered_reference_id ON Loans
+        BEGIN
+            UPDATE LoanSummary
+            SET customer_id = NEW.customer_id,
+                loan_date = NEW.created_at,
+                loan_amount = NEW.loan_amount,
+                loan_amount_due = NEW.loan_amount - NEW.loan_amount_paid,
+                registered_reference_id = NEW.registered_reference_id
+            WHERE loan_id = NEW.loan_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_loan_summary_loan_delete AFTER DELETE ON Loans
+        BEGIN
+            DELETE FROM LoanSummary WHERE loan_id = OLD.loan_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_loan_summary_asset_insert AFTER INSERT ON Assets
+        BEGIN
+            UPDATE LoanSummary
+            SET asset_descriptions = (SELECT GROUP_CONCAT(description, '; ') FROM Assets WHERE loan_id = NEW.loan_id),
+                total_asset_weight = (SELECT SUM(weight) FROM Assets WHERE loan_id = NEW.loan_id)
+            WHERE loan_id = NEW.loan_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_loan_summary_asset_update AFTER UPDATE OF loan_id, description, weight ON Assets
+        BEGIN
+            UPDATE LoanSummary
+            SET asset_descriptions = (SELECT GROUP_CONCAT(description, '; ') FROM Assets WHERE loan_id = LoanSummary.loan_id),
+                total_asset_weight = (SELECT SUM(weight) FROM Assets WHERE loan_id = LoanSummary.loan_id)
+            WHERE loan_id IN (OLD.loan_id, NEW.loan_id);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_loan_summary_asset_delete AFTER DELETE ON Assets
+        BEGIN
+            UPDATE LoanSummary
+            SET asset_descriptions = (SELECT GROUP_CONCAT(description, '; ') FROM Assets WHERE loan_id = OLD.loan_id),
+                total_asset_weight = (SELECT SUM(weight) FROM Assets WHERE loan_id = OLD.loan_id)
+            WHERE loan_id = OLD.loan_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_loan_summary_payment_insert AFTER INSERT ON LoanPayments
+        BEGIN
+            UPDATE LoanSummary
+            SET total_interest_amount = COALESCE((SELECT SUM(interest_amount) FROM LoanPayments WHERE loan_id = NEW.loan_id), 0)
+            WHERE loan_id = NEW.loan_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_loan_summary_payment_update AFTER UPDATE OF loan_id, interest_amount ON LoanPayments
+        BEGIN
+            UPDATE LoanSummary
+            SET total_interest_amount = COALESCE((SELECT SUM(interest_amount) FROM LoanPayments WHERE loan_id = LoanSummary.loan_id), 0)
+            WHERE loan_id IN (OLD.loan_id, NEW.loan_id);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_loan_summary_payment_delete AFTER DELETE ON LoanPayments
+        BEGIN
+            UPDATE LoanSummary
+            SET total_interest_amount = COALESCE((SELECT SUM(interest_amount) FROM LoanPayments WHERE loan_id = OLD.loan_id), 0)
+            WHERE loan_id = OLD.loan_id;
+        END
+        """,
+        "DROP VIEW IF EXISTS LoanView",
+        """
+        CREATE VIEW LoanView AS
+        SELECT
+            loan_date,
+            asset_descriptions,
+            total_asset_weight,
+            loan_amount,
+            loan_amount_due,
+            total_interest_amount,
+            registered_reference_id,
+            loan_id,
+            customer_id
+        FROM LoanSummary
+        """,
+    ),
+    # 3: store loan dates as plain ISO dates ('2024-01-05 00:00:00' -> '2024-01-05')
+    #    so year and date-range filters become index range scans. Values that
+    #    are not recognisable dates are left untouched.
+    (
+        """
+        UPDATE Loans
+        SET created_at = date(created_at)
+        WHERE date(created_at) IS NOT NULL
+        AND created_at != date(created_at)
+        """,
+        "DROP TRIGGER IF EXISTS trg_loan_summary_loan_insert",
+        """
+        CREATE TRIGGER trg_loan_summary_loan_insert AFTER INSERT ON Loans
+        BEGIN
+            INSERT OR REPLACE INTO LoanSummary (
+                loan_id, customer_id, loan_date, asset_descriptions, total_asset_weight,
+                loan_amount, loan_amount_due, total_interest_amount, registered_reference_id
+            ) VALUES (
+                NEW.loan_id, NEW.customer_id, COALESCE(date(NEW.created_at), NEW.created_at),
+                (SELECT GROUP_CONCAT(description, '; ') FROM Assets WHERE loan_id = NEW.loan_id),
+                (SELECT SUM(weight) FROM Assets WHERE loan_id = NEW.loan_id),
+                NEW.loan_amount, NEW.loan_amount - NEW.loan_amount_paid,
+                COALESCE((SELECT SUM(interest_amount) FROM LoanPayments WHERE loan_id = NEW.loan_id), 0),
+                NEW.registered_reference_id
+            );
+        END
+        """,
+        "DROP TRIGGER IF EXISTS trg_loan_summary_loan_update",
+        """
+        CREATE TRIGGER trg_loan_summary_loan_update
+        AFTER UPDATE OF customer_id, created_at, loan_amount, loan_amount_paid, registered_reference_id ON Loans
+        BEGIN
+            UPDATE LoanSummary
+            SET customer_id = NEW.customer_id,
+                loan_date = COALESCE(date(NEW.created_at), NEW.created_at),
+                loan_amount = NEW.loan_amount,
+                loan_amount_due = NEW.loan_amount - NEW.loan_amount_paid,
+                registered_reference_id = NEW.registered_reference_id
+            WHERE loan_id = NEW.loan_id;
+        END
+        """,
+        """
+        UPDATE LoanSummary
+        SET loan_date = (SELECT COALESCE(date(l.created_at), l.created_at) FROM Loans l WHERE l.loan_id = LoanSummary.loan_id)
+        """,
+        "ANALYZE",
+    ),
+    # 4: duplicate phone checks during bulk customer import
+    (
+        "CREATE INDEX IF NOT EXISTS idx_customers_phone ON Customers(phone)",
+    ),
+]
+SCHEMA_VERSION = len(SCHEMA_MIGRATIONS)
+# =============================
+
+
+class PaymentExceedsLoanError(ValueError):
+    """Raised when a repayment would take the total paid past the loan amount."""
+
+    def __init__(self, loan_amount):
+        super().__init__("Total payments would exceed loan amount")
+        self.loan_amount = loan_amount
+
+
+class RepaymentBatchError(ValueError):
+    """Raised when any repayment in a batch fails validation; nothing is recorded."""
+
+    def __init__(self, errors):
+        super().__init__("; ".join(f"#{index + 1}: {message}" for index, message in errors))
+        self.errors = errors  # [(index into the batch, message)]
+
+
+class ConnectionPool:
+    """
+    Hands out long-lived sqlite3 connections to the application database.
+
+    The main (GUI) thread keeps a single connection open for the lifetime of
+    the process. Every other thread borrows a connection from a bounded pool
+    for the duration of its outermost `connection()` block; nested blocks on
+    the same thread reuse the connection that is already checked out.
+
+    `generation` is bumped whenever an outermost block changed any rows, so
+    callers can cache query results until the next write.
+
+    `epoch` is bumped by close_all. A connection opened in an earlier epoch
+    is never reused: it is closed when its thread returns it (releasing its
+    pool slot) or, for the main thread, the next time that thread needs it.
+    """
+
+    def __init__(self, db_path=DB_PATH, pool_size=WORKER_POOL_SIZE):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self._local = threading.local()
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.epoch = 0
+
+    def _open(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        DatabaseManager.configure_connection(conn)
+        return conn
+
+    def _checkout(self):
+        """Return (connection, borrowed, epoch) for the calling thread."""
+        if threading.current_thread() is threading.main_thread():
+            epoch = self.epoch
+            return self._open(), False, epoch
+
+        self._slots.acquire()
+        with self._lock:
+            epoch = self.epoch
+            try:
+                return self._idle.get_nowait(), True, epoch
+            except queue.Empty:
+                pass
+        try:
+            return self._open(), True, epoch
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkin(self, conn, epoch):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            with self._lock:
+                if epoch == self.epoch:
+                    self._idle.put(conn)
+                    return
+            # Retired by close_all while it was checked out
+            conn.close()
+        except sqlite3.Error:
+            pass
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is not None and local.depth == 0 and local.epoch != self.epoch:
+            # The main thread's connection was retired by close_all; reopen with current settings
+            local.conn = None
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        if getattr(local, "conn", None) is None:
+            local.conn, local.borrowed, local.epoch = self._checkout()
+            local.depth = 0
+
+        conn = local.conn
+        if local.depth == 0:
+            local.changes = conn.total_changes
+        local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            # Never leave a half-finished write open on a shared connection
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            local.depth -= 1
+            if local.depth == 0:
+                if conn.total_changes != local.changes:
+                    with self._lock:
+                        self.generation += 1
+                if local.borrowed:
+                    local.conn = None
+                    self._checkin(conn, local.epoch)
+
+    def close_all(self):
+        """
+        Close every pooled connection that is not in use and retire the rest.
+
+        Connections other threads have checked out are left open until they
+        are returned, and are closed then instead of going back to the pool.
+        Used on shutdown and when the pragma profile changes.
+        """
+        with self._lock:
+            self.epoch += 1
+            connections = []
+            while True:
+                try:
+                    connections.append(self._idle.get_nowait())
+                except queue.Empty:
+                    break
+
+        # The calling thread's own connection, if it has one and is not using it
+        local = self._local
+        if getattr(local, "conn", None) is not None and local.depth == 0:
+            connections.append(local.conn)
+            local.conn = None
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+_pool = ConnectionPool()
+atexit.register(_pool.close_all)
+
+# Loan counts keyed by filter, valid for a single pool generation
+_loan_count_cache = {"generation": None, "counts": {}}
+_loan_count_lock = threading.Lock()
+
+
+class LoanQuery:
+    """
+    Composable, parameterized filter over LoanView rows joined with the customer name.
+
+    Each method adds one predicate and returns the query so calls can be chained:
+
+        LoanQuery().period(year=2024).matching("reference_id", "R-1").select(limit=50)
+
+    Text filters are case-insensitive substring matches; numeric filters match
+    values within NUMERIC_TOLERANCE, like the report search always has.
+    """
+
+    TEXT_FILTERS = {
+        "customer_name": "c.name",
+        "reference_id": "lv.registered_reference_id",
+        "asset_description": "lv.asset_descriptions",
+    }
+    NUMERIC_FILTERS = {
+        "weight": "lv.total_asset_weight",
+        "amount": "lv.loan_amount",
+        "amount_due": "lv.loan_amount_due",
+    }
+    NUMERIC_TOLERANCE = 0.01
+
+    def __init__(self):
+        self.clauses = ["lv.loan_date IS NOT NULL", "lv.loan_date != ''"]
+        self.params = []
+
+    def period(self, year=None, start_date=None, end_date=None):
+        """Restrict to a year or an inclusive date range (the range wins if both are given)."""
+        lower, upper = DatabaseManager.date_range_bounds(year, start_date, end_date)
+        if lower:
+            self.clauses.append("lv.loan_date >= ? AND lv.loan_date < ?")
+            self.params.extend([lower, upper])
+        return self
+
+    def customer(self, customer_id):
+        """Restrict to a single customer's loans."""
+        self.clauses.append("lv.customer_id = ?")
+        self.params.append(customer_id)
+        return self
+
+    def contains(self, field, text):
+        """Case-insensitive substring match on a TEXT_FILTERS field."""
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        self.clauses.append(f"{self.TEXT_FILTERS[field]} LIKE ? ESCAPE '\\'")
+        self.params.append(f"%{escaped}%")
+        return self
+
+    def approximately(self, field, value):
+        """Match a NUMERIC_FILTERS field within NUMERIC_TOLERANCE of value."""
+        column = self.NUMERIC_FILTERS[field]
+        self.clauses.append(f"{column} > ? AND {column} < ?")
+        self.params.extend([value - self.NUMERIC_TOLERANCE, value + self.NUMERIC_TOLERANCE])
+        return self
+
+    def matching(self, field, value):
+        """
+        Add a filter by field name, parsing numeric input such as "1,25,000".
+
+        Raises:
+            ValueError: if the field is unknown or a numeric value cannot be parsed
+        """
+        if field in self.TEXT_FILTERS:
+            return self.contains(field, str(value))
+        if field in self.NUMERIC_FILTERS:
+            return self.approximately(field, float(str(value).replace(',', '')))
+        raise ValueError(f"Unknown loan filter: {field}")
+
+    def filters(self, filters):
+        """Apply a {field: value} dict of filters via matching()."""
+        for field, value in (filters or {}).items():
+            self.matching(field, value)
+        return self
+
+    def where_sql(self):
+        return " AND ".join(self.clauses)
+
+    def select(self, limit=None, offset=None, after=None, before=None):
+        """
+        Build the SELECT for matching loans, newest first.
+
+        after/before are (loan_date, loan_id) keys for keyset pagination; with
+        before the rows come back oldest first and must be reversed by the caller.
+
+        Returns:
+            tuple: (sql, params)
+        """
+        sql = f"""
+            SELECT lv.*, c.name as customer_name
+            FROM LoanView lv
+            JOIN Customers c ON lv.customer_id = c.customer_id
+            WHERE {self.where_sql()}
+        """
+        params = list(self.params)
+
+        if before is not None:
+            sql += " AND (lv.loan_date, lv.loan_id) > (?, ?) ORDER BY lv.loan_date ASC, lv.loan_id ASC"
+            params.extend(before)
+        else:
+            if after is not None:
+                sql += " AND (lv.loan_date, lv.loan_id) < (?, ?)"
+                params.extend(after)
+            sql += " ORDER BY lv.loan_date DESC, lv.loan_id DESC"
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+            if offset:
+                sql += " OFFSET ?"
+                params.append(offset)
+        return sql, params
+
+    def count(self):
+        """
+        Build the COUNT(*) for matching loans.
+
+        Returns:
+            tuple: (sql, params)
+        """
+        sql = f"""
+            SELECT COUNT(*)
+            FROM LoanView lv
+            JOIN Customers c ON lv.customer_id = c.customer_id
+            WHERE {self.where_sql()}
+        """
+        return sql, list(self.params)
+
+    def aggregates(self, customer_id=None):
+        """
+        Build loan totals per customer for matching loans in one grouped pass.
+
+        Every customer is returned (restricted to customer_id if given), with
+        zero totals when none of their loans match, so the caller can count
+        customers as well as borrowers from the same rows.
+
+        Returns:
+            tuple: (sql, params) selecting (customer_id, *AGGREGATE_FIELDS)
+        """
+        sql = f"""
+            SELECT
+                c.customer_id,
+                COUNT(lv.loan_id),
+                COUNT(CASE WHEN lv.loan_amount_due > 0 THEN 1 END),
+                COALESCE(SUM(lv.loan_amount), 0),
+                COALESCE(SUM(lv.loan_amount - lv.loan_amount_due), 0),
+                COALESCE(SUM(lv.loan_amount_due), 0),
+                COALESCE(SUM(lv.total_interest_amount), 0),
+                COALESCE(SUM(lv.total_asset_weight), 0)
+            FROM Customers c
+            LEFT JOIN LoanView lv ON lv.customer_id = c.customer_id AND {self.where_sql()}
+        """
+        params = list(self.params)
+        if customer_id is not None:
+            sql += " WHERE c.customer_id = ?"
+            params.append(customer_id)
+        sql += " GROUP BY c.customer_id"
+        return sql, params
+
 
 class DatabaseManager:
     @staticmethod
     def init_database():
         """Initialize the database and create tables if they don't exist."""
         try:
-            conn = sqlite3.connect("loanApp.db")
-            cursor = conn.cursor()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS Customers (
-                    customer_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name VARCHAR NOT NULL,
-                    phone VARCHAR NULL,
-                    address TEXT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            ''')
-
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS Loans (
-                    loan_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    customer_id INTEGER NOT NULL,
-                    registered_reference_id TEXT DEFAULT NULL,
-                    loan_amount DECIMAL(10, 2) NOT NULL,
-                    loan_amount_paid DECIMAL(10, 2) DEFAULT 0.00,
-                    loan_status TEXT DEFAULT 'Pending',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (customer_id) REFERENCES Customers(customer_id)
-                );
-            ''')
-
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS Assets (
-                    asset_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    loan_id INTEGER NOT NULL UNIQUE,
-                    description TEXT NOT NULL,
-                    weight DECIMAL(10, 2) NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (loan_id) REFERENCES Loans(loan_id) ON DELETE CASCADE
-                );
-            ''')
-
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS LoanPayments (
-                    payment_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    loan_id INTEGER NOT NULL,
-                    payment_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    payment_amount DECIMAL(10, 2) NOT NULL,
-                    interest_amount DECIMAL(10, 2) NOT NULL,
-                    amount_left DECIMAL(10, 2) NOT NULL,
-                    asset_description TEXT NULL,
-                    FOREIGN KEY (loan_id) REFERENCES Loans(loan_id)
-                );
-            ''')
-
-            cursor.execute('''
-                CREATE VIEW IF NOT EXISTS LoanView AS
-                SELECT
-                    l.created_at AS loan_date,
-                    GROUP_CONCAT(a.description, '; ') AS asset_descriptions,
-                    SUM(a.weight) AS total_asset_weight,
-                    l.loan_amount AS loan_amount,
-                    (l.loan_amount - l.loan_amount_paid) AS loan_amount_due,
-                    COALESCE(SUM(p.interest_amount), 0) AS total_interest_amount,
-                    l.registered_reference_id AS registered_reference_id,
-                    l.loan_id AS loan_id,
-                    l.customer_id AS customer_id
-                FROM Loans l
-                LEFT JOIN Assets a ON l.loan_id = a.loan_id
-                LEFT JOIN LoanPayments p ON l.loan_id = p.loan_id
-                GROUP BY l.loan_id;
-            ''')
-
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS SystemUsers (
-                    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    password_hash TEXT NOT NULL
-                );
-            ''')
-
-            cursor.execute("SELECT COUNT(*) FROM SystemUsers")
-            if cursor.fetchone()[0] == 0:
-                # Insert a default password (hash for "admin")
-                import hashlib
-                default_password = hashlib.sha256("admin".encode()).hexdigest()
-                cursor.execute("INSERT INTO SystemUsers (password_hash) VALUES (?)", (default_password,))
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS Customers (
+                        customer_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        name VARCHAR NOT NULL,
+                        phone VARCHAR NULL,
+                        address TEXT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                ''')
 
-            conn.commit()
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS Loans (
+                        loan_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        customer_id INTEGER NOT NULL,
+                        registered_reference_id TEXT DEFAULT NULL,
+                        loan_amount DECIMAL(10, 2) NOT NULL,
+                        loan_amount_paid DECIMAL(10, 2) DEFAULT 0.00,
+                        loan_status TEXT DEFAULT 'Pending',
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (customer_id) REFERENCES Customers(customer_id)
+                    );
+                ''')
+
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS Assets (
+                        asset_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        loan_id INTEGER NOT NULL UNIQUE,
+                        description TEXT NOT NULL,
+                        weight DECIMAL(10, 2) NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (loan_id) REFERENCES Loans(loan_id) ON DELETE CASCADE
+                    );
+                ''')
+
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS LoanPayments (
+                        payment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        loan_id INTEGER NOT NULL,
+                        payment_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        payment_amount DECIMAL(10, 2) NOT NULL,
+                        interest_amount DECIMAL(10, 2) NOT NULL,
+                        amount_left DECIMAL(10, 2) NOT NULL,
+                        asset_description TEXT NULL,
+                        FOREIGN KEY (loan_id) REFERENCES Loans(loan_id)
+                    );
+                ''')
+
+                # Original aggregate view; migration 2 rebuilds it on top of LoanSummary
+                cursor.execute('''
+                    CREATE VIEW IF NOT EXISTS LoanView AS
+                    SELECT
+                        l.created_at AS loan_date,
+                        GROUP_CONCAT(a.description, '; ') AS asset_descriptions,
+                        SUM(a.weight) AS total_asset_weight,
+                        l.loan_amount AS loan_amount,
+                        (l.loan_amount - l.loan_amount_paid) AS loan_amount_due,
+                        COALESCE(SUM(p.interest_amount), 0) AS total_interest_amount,
+                        l.registered_reference_id AS registered_reference_id,
+                        l.loan_id AS loan_id,
+                        l.customer_id AS customer_id
+                    FROM Loans l
+                    LEFT JOIN Assets a ON l.loan_id = a.loan_id
+                    LEFT JOIN LoanPayments p ON l.loan_id = p.loan_id
+                    GROUP BY l.loan_id;
+                ''')
+
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS SystemUsers (
+                        user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        password_hash TEXT NOT NULL
+                    );
+                ''')
+
+                cursor.execute("SELECT COUNT(*) FROM SystemUsers")
+                if cursor.fetchone()[0] == 0:
+                    # Insert a default password (hash for "admin")
+                    import hashlib
+                    default_password = hashlib.sha256("admin".encode()).hexdigest()
+                    cursor.execute("INSERT INTO SystemUsers (password_hash) VALUES (?)", (default_password,))
+
+                conn.commit()
+
+                DatabaseManager.migrate_schema(conn)
+
+                # journal_mode is stored in the database file; report when the
+                # requested mode could not be applied (e.g. WAL on a network share)
+                requested_mode = dict(PRAGMA_PROFILES[DB_PROFILE])["journal_mode"]
+                journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+                if journal_mode.upper() != requested_mode:
+                    print(f"Database journal mode is {journal_mode}, expected {requested_mode}")
         except sqlite3.Error as e:
             print(f"Database initialization error: {e}")
-        finally:
-            if conn:
-                conn.close()
+
+    @staticmethod
+    def migrate_schema(conn):
+        """Apply pending SCHEMA_MIGRATIONS, each one in its own transaction."""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for target_version in range(version + 1, SCHEMA_VERSION + 1):
+            conn.execute("BEGIN")
+            for statement in SCHEMA_MIGRATIONS[target_version - 1]:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {target_version}")
+            conn.commit()
+            print(f"Database schema upgraded to version {target_version}")
+
+    @staticmethod
+    def date_range_bounds(year=None, start_date=None, end_date=None):
+        """
+        Translate a year or an inclusive YYYY-MM-DD date range into half-open
+        ISO bounds (lower <= date < upper) that can use the loan date indexes.
+
+        Returns:
+            tuple: (lower, upper), or (None, None) when there is no filter
+        """
+        # Date range takes precedence over year, as in the report filters
+        if start_date and end_date:
+            upper = datetime.date.fromisoformat(end_date) + datetime.timedelta(days=1)
+            return start_date, upper.isoformat()
+        if year:
+            year = int(year)
+            return f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
+        return None, None
+
+    @staticmethod
+    def configure_connection(conn):
+        """Apply the active pragma profile to a freshly opened connection."""
+        for pragma, value in PRAGMA_PROFILES[DB_PROFILE]:
+            conn.execute(f"PRAGMA {pragma} = {value}")
+
+    @staticmethod
+    def set_profile(profile):
+        """
+        Switch between the "performance" and "safe" pragma profiles.
+
+        Called at startup for the --db-profile option (see app.main). Pooled
+        connections are retired (ConnectionPool.close_all), so every
+        connection used from now on is opened with the new profile; ones a
+        worker is using are closed once it is done with them.
+        """
+        global DB_PROFILE
+        if profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Unknown database profile: {profile}")
+        DB_PROFILE = profile
+        _pool.close_all()
+
+    @staticmethod
+    def connection():
+        """
+        Context manager yielding the calling thread's pooled connection.
+
+        Connections stay open between calls; do not close them. An exception
+        escaping the block rolls back any uncommitted transaction.
+        """
+        return _pool.connection()
+
+    @staticmethod
+    def data_generation():
+        """Counter that changes after every write made through the pool."""
+        return _pool.generation
 
     @staticmethod
     def create_connection():
-        conn = sqlite3.connect("loanApp.db")
+        """Open a standalone connection outside the pool (caller must close it)."""
+        conn = sqlite3.connect(DB_PATH)
+        DatabaseManager.configure_connection(conn)
         return conn
 
+    @staticmethod
+    def close_connections():
+        """
+        Close all idle pooled connections and retire the ones in use, e.g. before
+        replacing the database file (stop background work first so none are in use).
+        """
+        _pool.close_all()
+
     @staticmethod
     def execute_query(query, params=None):
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
 
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
 
-            conn.commit()
-            return cursor
+                conn.commit()
+                return cursor
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()
 
     @staticmethod
     def fetch_data(query, params=None):
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
 
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
 
-            data = cursor.fetchall()
-            return data
+                data = cursor.fetchall()
+                return data
         except sqlite3.Error as e:
             print(f"Database error: {e} {query}")
             return []
-        finally:
-            if conn:
-                conn.close()
 
     @staticmethod
     def verify_password(input_password):
         """Verify the provided password."""
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT password_hash FROM SystemUsers LIMIT 1")
-            stored_hash = cursor.fetchone()[0]
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT password_hash FROM SystemUsers LIMIT 1")
+                stored_hash = cursor.fetchone()[0]
 
             # Compare hash of input password with stored hash
             import hashlib
@@ -159,28 +802,21 @@ class DatabaseManager:
         except sqlite3.Error as e:
             print(f"Database error while verifying password: {e}")
             return False
-        finally:
-            if conn:
-                conn.close()
 
     @staticmethod
     def update_password(new_password):
         """Update the system password."""
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
-
             # Hash the new password
             import hashlib
             new_hash = hashlib.sha256(new_password.encode()).hexdigest()
-            cursor.execute("UPDATE SystemUsers SET password_hash = ? WHERE user_id = 1", (new_hash,))
 
-            conn.commit()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("UPDATE SystemUsers SET password_hash = ? WHERE user_id = 1", (new_hash,))
+                conn.commit()
         except sqlite3.Error as e:
             print(f"Database error while updating password: {e}")
-        finally:
-            if conn:
-                conn.close()
 
     @staticmethod
     def corrupt_auth_file():
@@ -213,6 +849,12 @@ class DatabaseManager:
         query = "SELECT customer_id, name, phone FROM Customers ORDER BY name"
         return DatabaseManager.fetch_data(query)
 
+    @staticmethod
+    def get_customers_since(customer_id):
+        """Fetch customers added after customer_id (for incremental dropdown updates)"""
+        query = "SELECT customer_id, name, phone FROM Customers WHERE customer_id > ? ORDER BY name"
+        return DatabaseManager.fetch_data(query, (customer_id,))
+
     @staticmethod
     def get_customer_by_id(customer_id):
         """Fetch full customer details by ID"""
@@ -235,14 +877,11 @@ class DatabaseManager:
         (customer_id, loan_amount, created_at, registered_reference_id) 
         VALUES (?, ?, ?, ?)
         """
-        conn = DatabaseManager.create_connection()
-        try:
+        with DatabaseManager.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, (customer_id, loan_amount, loan_date, registered_reference_id))
             conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
 
     @staticmethod
     def insert_asset(loan_id, description, weight):
@@ -267,6 +906,158 @@ class DatabaseManager:
             (loan_id, payment_amount, interest_amount, amount_left, asset_description, payment_date)
         )
 
+    @staticmethod
+    def record_repayment(loan_id, payment_amount, interest_amount, asset_description, payment_date):
+        """
+        Record a repayment and update the loan balance in a single transaction.
+
+        BEGIN IMMEDIATE takes the write lock before the balance is read, so two
+        repayments on the same loan cannot both pass validation against a stale
+        total.
+
+        Returns:
+            float: Amount still due on the loan after this payment
+
+        Raises:
+            PaymentExceedsLoanError: if the payment would exceed the loan amount
+            ValueError: if the loan does not exist
+        """
+        try:
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                cursor.execute("""
+                    SELECT l.loan_amount, l.loan_amount_paid,
+                           (SELECT COALESCE(SUM(payment_amount), 0) FROM LoanPayments WHERE loan_id = l.loan_id)
+                    FROM Loans l
+                    WHERE l.loan_id = ?
+                """, (loan_id,))
+                loan = cursor.fetchone()
+                if not loan:
+                    raise ValueError("Loan not found.")
+
+                loan_amount, loan_amount_paid, total_payments = (float(value or 0) for value in loan)
+                new_paid_amount = loan_amount_paid + payment_amount
+
+                # Validate total payments don't exceed loan amount
+                if total_payments + payment_amount > loan_amount or new_paid_amount > loan_amount:
+                    raise PaymentExceedsLoanError(loan_amount)
+
+                cursor.execute("""
+                    INSERT INTO LoanPayments (
+                        loan_id, payment_amount, interest_amount,
+                        amount_left, asset_description, payment_date
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, (
+                    loan_id, payment_amount, interest_amount,
+                    loan_amount - (total_payments + payment_amount), asset_description, payment_date
+                ))
+
+                loan_status = "Completed" if new_paid_amount == loan_amount else "Pending"
+                cursor.execute("""
+                    UPDATE Loans
+                    SET loan_amount_paid = ?, loan_status = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE loan_id = ?
+                """, (new_paid_amount, loan_status, loan_id))
+                conn.commit()
+
+            return loan_amount - new_paid_amount
+        except sqlite3.Error as e:
+            print(f"Database error while recording repayment: {e}")
+            raise
+
+    @staticmethod
+    def record_repayments(payments):
+        """
+        Record a batch of repayments, possibly across several loans, in one transaction.
+
+        Each payment is validated against the loan balance left by the payments
+        queued before it, so two entries for the same loan cannot together overpay
+        it. If any entry fails, none are recorded.
+
+        Args:
+            payments: list of (loan_id, payment_amount, interest_amount,
+                      asset_description, payment_date)
+
+        Returns:
+            dict: loan_id -> amount still due after the batch
+
+        Raises:
+            RepaymentBatchError: with (index, message) for every invalid entry
+        """
+        if not payments:
+            return {}
+
+        loan_ids = sorted({payment[0] for payment in payments})
+        try:
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                placeholders = ", ".join("?" for _ in loan_ids)
+                cursor.execute(f"""
+                    SELECT l.loan_id, l.loan_amount, l.loan_amount_paid,
+                           (SELECT COALESCE(SUM(payment_amount), 0) FROM LoanPayments WHERE loan_id = l.loan_id)
+                    FROM Loans l
+                    WHERE l.loan_id IN ({placeholders})
+                """, loan_ids)
+                balances = {
+                    row[0]: [float(value or 0) for value in row[1:]]
+                    for row in cursor.fetchall()
+                }
+
+                errors = []
+                payment_rows = []
+                for index, (loan_id, payment_amount, interest_amount, asset_description, payment_date) in enumerate(payments):
+                    if loan_id not in balances:
+                        errors.append((index, "Loan not found."))
+                        continue
+                    if payment_amount <= 0 or interest_amount < 0:
+                        errors.append((index, "Payment amount must be positive and interest cannot be negative."))
+                        continue
+
+                    loan_amount, loan_amount_paid, total_payments = balances[loan_id]
+                    if (total_payments + payment_amount > loan_amount
+                            or loan_amount_paid + payment_amount > loan_amount):
+                        errors.append((index, f"Total payments would exceed loan amount of {loan_amount:,.2f}"))
+                        continue
+
+                    balances[loan_id] = [loan_amount, loan_amount_paid + payment_amount, total_payments + payment_amount]
+                    payment_rows.append((
+                        loan_id, payment_amount, interest_amount,
+                        loan_amount - (total_payments + payment_amount), asset_description, payment_date
+                    ))
+
+                if errors:
+                    # Leaving the block with an exception rolls the transaction back
+                    raise RepaymentBatchError(errors)
+
+                cursor.executemany("""
+                    INSERT INTO LoanPayments (
+                        loan_id, payment_amount, interest_amount,
+                        amount_left, asset_description, payment_date
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, payment_rows)
+
+                touched = {row[0] for row in payment_rows}
+                cursor.executemany("""
+                    UPDATE Loans
+                    SET loan_amount_paid = ?, loan_status = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE loan_id = ?
+                """, [
+                    (balances[loan_id][1],
+                     "Completed" if balances[loan_id][1] == balances[loan_id][0] else "Pending",
+                     loan_id)
+                    for loan_id in sorted(touched)
+                ])
+                conn.commit()
+
+            return {loan_id: balances[loan_id][0] - balances[loan_id][1] for loan_id in loan_ids}
+        except sqlite3.Error as e:
+            print(f"Database error while recording repayments: {e}")
+            raise
+
     @staticmethod
     def update_loan_payment(loan_id, amount_paid):
         """Update loan payment and mark as completed if fully paid."""
@@ -280,29 +1071,27 @@ class DatabaseManager:
         SET loan_amount_paid = ?, loan_status = ?, updated_at = CURRENT_TIMESTAMP
         WHERE loan_id = ?
         """
-        conn = DatabaseManager.create_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute(query_fetch, (loan_id,))
-            loan = cursor.fetchone()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query_fetch, (loan_id,))
+                loan = cursor.fetchone()
 
-            if not loan:
-                raise ValueError("Loan not found.")
+                if not loan:
+                    raise ValueError("Loan not found.")
 
-            loan_amount, loan_amount_paid = loan
-            total_due = loan_amount  # Assuming no interest is considered in this case
-            new_paid_amount = loan_amount_paid + amount_paid
+                loan_amount, loan_amount_paid = loan
+                total_due = loan_amount  # Assuming no interest is considered in this case
+                new_paid_amount = loan_amount_paid + amount_paid
 
-            if new_paid_amount > total_due:
-                raise ValueError("Payment exceeds total due amount.")
-            loan_status = "Completed" if new_paid_amount == total_due else "Pending"
-            cursor.execute(query_update, (new_paid_amount, loan_status, loan_id))
-            conn.commit()
+                if new_paid_amount > total_due:
+                    raise ValueError("Payment exceeds total due amount.")
+                loan_status = "Completed" if new_paid_amount == total_due else "Pending"
+                cursor.execute(query_update, (new_paid_amount, loan_status, loan_id))
+                conn.commit()
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             raise
-        finally:
-            conn.close()
 
     @staticmethod
     def delete_loan(loan_id):
@@ -315,17 +1104,15 @@ class DatabaseManager:
         DELETE FROM Loans
         WHERE loan_id = ?
         """
-        conn = DatabaseManager.create_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute(query_delete_assets, (loan_id,))
-            cursor.execute(query_delete_loan, (loan_id,))
-            conn.commit()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query_delete_assets, (loan_id,))
+                cursor.execute(query_delete_loan, (loan_id,))
+                conn.commit()
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             raise
-        finally:
-            conn.close()
     
     @staticmethod
     def fetch_loans_for_customer(customer_id):
@@ -435,52 +1222,43 @@ class DatabaseManager:
         """
         
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (loan_id, loan_id))
-            results = cursor.fetchall()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, (loan_id, loan_id))
+                results = cursor.fetchall()
             
             # Return list of repaid asset descriptions
             return [result[0] for result in results] if results else []
         except sqlite3.Error as e:
             print(f"Database error while fetching repaid assets for loan_id {loan_id}: {e}")
             return []
-        finally:
-            if conn:
-                conn.close()
 
     @staticmethod
     def insert_loan_with_asset(customer_id, loan_amount, loan_date, registered_reference_id, description, weight):
-        conn = None
         try:
-            conn = DatabaseManager.create_connection()
-            conn.execute("BEGIN TRANSACTION")
-            cursor = conn.cursor()
+            with DatabaseManager.connection() as conn:
+                conn.execute("BEGIN TRANSACTION")
+                cursor = conn.cursor()
 
-            # Insert Loan
-            cursor.execute("""
-                INSERT INTO Loans (customer_id, loan_amount, created_at, registered_reference_id)
-                VALUES (?, ?, ?, ?)
-            """, (customer_id, loan_amount, loan_date, registered_reference_id))
-            loan_id = cursor.lastrowid
+                # Insert Loan
+                cursor.execute("""
+                    INSERT INTO Loans (customer_id, loan_amount, created_at, registered_reference_id)
+                    VALUES (?, ?, ?, ?)
+                """, (customer_id, loan_amount, loan_date, registered_reference_id))
+                loan_id = cursor.lastrowid
 
-            # Insert Asset
-            cursor.execute("""
-                INSERT INTO Assets (loan_id, description, weight)
-                VALUES (?, ?, ?)
-            """, (loan_id, description, weight))
+                # Insert Asset
+                cursor.execute("""
+                    INSERT INTO Assets (loan_id, description, weight)
+                    VALUES (?, ?, ?)
+                """, (loan_id, description, weight))
 
-            conn.commit()
-            return True, "Loan registered successfully"
+                conn.commit()
+                return True, "Loan registered successfully"
         
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
+            # The pooled connection has already rolled back the transaction
             return False, f"Database error: {str(e)}"
-        
-        finally:
-            if conn:
-                conn.close()
 
     @staticmethod
     def get_summary_stats():
@@ -489,22 +1267,296 @@ class DatabaseManager:
         query_loan_due = "SELECT SUM(loan_amount_due) FROM LoanView"
 
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute(query_customers)
-            total_customers = cursor.fetchone()[0]
+                cursor.execute(query_customers)
+                total_customers = cursor.fetchone()[0]
 
-            cursor.execute(query_loan_due)
-            total_loan_due = cursor.fetchone()[0] or 0  # Handle NULL with 0
+                cursor.execute(query_loan_due)
+                total_loan_due = cursor.fetchone()[0] or 0  # Handle NULL with 0
 
             return total_customers, total_loan_due
         except sqlite3.Error as e:
             print(f"Database error while fetching summary stats: {e}")
             return 0, 0
-        finally:
-            if conn:
-                conn.close()
+
+    @staticmethod
+    def import_customers(rows, reject, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+        """
+        Bulk insert customers in a single transaction.
+
+        rows is consumed lazily, one chunk at a time, so it can be a generator
+        over a CSV file and memory stays bounded by chunk_size. Each chunk is
+        checked for phone numbers that repeat an existing customer (including
+        rows imported by earlier chunks) or another row in the chunk, then
+        inserted with executemany inside a savepoint. If the chunk hits a
+        constraint error it is rolled back to the savepoint and retried row by
+        row so only the failing rows are rejected.
+
+        Args:
+            rows: iterable of (row_number, name, phone, address)
+            reject: callable(row_number, (name, phone, address), message) for skipped rows
+            progress: optional callable(rows_processed); return False to cancel
+
+        Returns:
+            tuple: (imported_count, rejected_count), or None if the import was
+                   cancelled or failed (nothing is committed)
+        """
+        insert_query = "INSERT INTO Customers (name, phone, address) VALUES (?, ?, ?)"
+        imported = 0
+        rejected = 0
+        processed = 0
+
+        try:
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                rows = iter(rows)
+                while True:
+                    chunk = list(itertools.islice(rows, chunk_size))
+                    if not chunk:
+                        break
+                    processed += len(chunk)
+
+                    phones = list({row[2] for row in chunk if row[2]})
+                    existing_phones = set()
+                    for start in range(0, len(phones), 500):
+                        batch = phones[start:start + 500]
+                        cursor.execute(
+                            f"SELECT phone FROM Customers WHERE phone IN ({', '.join('?' for _ in batch)})",
+                            batch
+                        )
+                        existing_phones.update(row[0] for row in cursor.fetchall())
+
+                    valid_rows = []
+                    for row_number, name, phone, address in chunk:
+                        if phone and phone in existing_phones:
+                            reject(row_number, (name, phone, address), f"Phone number {phone} already exists")
+                            rejected += 1
+                        else:
+                            if phone:
+                                existing_phones.add(phone)
+                            valid_rows.append((row_number, name, phone, address))
+
+                    cursor.execute("SAVEPOINT import_chunk")
+                    try:
+                        cursor.executemany(insert_query, [row[1:] for row in valid_rows])
+                        imported += len(valid_rows)
+                    except sqlite3.IntegrityError:
+                        cursor.execute("ROLLBACK TO import_chunk")
+                        for row in valid_rows:
+                            cursor.execute("SAVEPOINT import_row")
+                            try:
+                                cursor.execute(insert_query, row[1:])
+                                imported += 1
+                            except sqlite3.IntegrityError as e:
+                                cursor.execute("ROLLBACK TO import_row")
+                                reject(row[0], row[1:], str(e))
+                                rejected += 1
+                            cursor.execute("RELEASE import_row")
+                    cursor.execute("RELEASE import_chunk")
+
+                    if progress and progress(processed) is False:
+                        conn.rollback()
+                        return None
+
+                conn.commit()
+            return imported, rejected
+        except sqlite3.Error as e:
+            print(f"Database error while importing customers: {e}")
+            return None
+
+    @staticmethod
+    def import_ledger(rows, reject, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+        """
+        Bulk import historic loans (each with its asset) and repayments in one transaction.
+
+        Customers are resolved from maps of phone and name preloaded once, not
+        a query per row. Each chunk inserts its loans, assets and payments with
+        executemany; loan ids are assigned up front so assets can be inserted
+        without reading back lastrowid. Payments find their loan by reference
+        id, which also matches loans imported by earlier chunks. A payment
+        whose loan has not been seen yet is held back and matched once the
+        whole file has been read, so loans may come after their payments
+        (held-back payments are kept in memory until then).
+
+        Like record_repayments, each payment is checked against the balance
+        left by the payments before it (in file order); one that would overpay
+        its loan is rejected. amount_left is set on the imported payment rows
+        only, and loan_amount_paid/loan_status are updated once per loan that
+        received payments.
+
+        Args:
+            rows: iterable of records from csvImporter.ledger_rows
+            reject: callable(row_number, record, message) for skipped records
+            progress: optional callable(rows_processed); return False to cancel
+
+        Returns:
+            tuple: (loans_imported, payments_imported, rejected_count), or None
+                   if the import was cancelled or failed (nothing is committed)
+        """
+        loans_imported = 0
+        payments_imported = 0
+        rejected = 0
+        processed = 0
+
+        try:
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                customers_by_phone = {}
+                customers_by_name = {}
+                for customer_id, name, phone in cursor.execute("SELECT customer_id, name, phone FROM Customers"):
+                    if phone:
+                        customers_by_phone[phone] = customer_id
+                    key = (name or "").strip().lower()
+                    # None marks a name shared by several customers
+                    customers_by_name[key] = None if key in customers_by_name else customer_id
+
+                cursor.execute("""
+                    SELECT MAX(
+                        COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'Loans'), 0),
+                        COALESCE((SELECT MAX(loan_id) FROM Loans), 0)
+                    )
+                """)
+                next_loan_id = cursor.fetchone()[0] + 1
+
+                # loan_id -> [loan_amount, loan_amount_paid, total_payments], for every loan
+                # this import created or paid into
+                balances = {}
+                paid_loans = set()
+                pending_payments = []  # payments whose loan has not been seen yet
+
+                rows = iter(rows)
+                while True:
+                    chunk = list(itertools.islice(rows, chunk_size))
+                    last_pass = not chunk
+                    if last_pass:
+                        if not pending_payments:
+                            break
+                        # The whole file has been read; any loan these refer to is in the database now
+                        chunk, pending_payments = pending_payments, []
+                    else:
+                        processed += len(chunk)
+
+                    # reference id -> loan id, for loans already in the database
+                    loan_ids = {}
+                    reference_ids = list({record[2] for record in chunk})
+                    for start in range(0, len(reference_ids), 500):
+                        batch = reference_ids[start:start + 500]
+                        cursor.execute(f"""
+                            SELECT registered_reference_id, MAX(loan_id) FROM Loans
+                            WHERE registered_reference_id IN ({', '.join('?' for _ in batch)})
+                            GROUP BY registered_reference_id
+                        """, batch)
+                        loan_ids.update(cursor.fetchall())
+
+                    unknown_balances = [loan_id for loan_id in set(loan_ids.values()) if loan_id not in balances]
+                    for start in range(0, len(unknown_balances), 500):
+                        batch = unknown_balances[start:start + 500]
+                        cursor.execute(f"""
+                            SELECT l.loan_id, l.loan_amount, l.loan_amount_paid,
+                                   (SELECT COALESCE(SUM(payment_amount), 0) FROM LoanPayments WHERE loan_id = l.loan_id)
+                            FROM Loans l
+                            WHERE l.loan_id IN ({', '.join('?' for _ in batch)})
+                        """, batch)
+                        for row in cursor.fetchall():
+                            balances[row[0]] = [float(value or 0) for value in row[1:]]
+
+                    loan_rows = []
+                    asset_rows = []
+                    for record in chunk:
+                        if record[0] != "loan":
+                            continue
+                        _, row_number, reference_id, loan_date, name, phone, loan_amount, description, weight = record
+
+                        customer_id = customers_by_phone.get(phone) if phone else None
+                        if customer_id is None and name:
+                            customer_id = customers_by_name.get(name.lower())
+                        if customer_id is None:
+                            if name and name.lower() in customers_by_name:
+                                message = f"Several customers are named {name}; add their phone number"
+                            else:
+                                message = "Customer not found"
+                            reject(row_number, record, message)
+                            rejected += 1
+                            continue
+                        if reference_id in loan_ids:
+                            reject(row_number, record, f"Reference id {reference_id} already exists")
+                            rejected += 1
+                            continue
+
+                        loan_ids[reference_id] = next_loan_id
+                        balances[next_loan_id] = [float(loan_amount), 0.0, 0.0]
+                        loan_rows.append((next_loan_id, customer_id, loan_amount, loan_date, reference_id))
+                        asset_rows.append((next_loan_id, description, weight))
+                        next_loan_id += 1
+
+                    payment_rows = []
+                    for record in chunk:
+                        if record[0] != "payment":
+                            continue
+                        _, row_number, reference_id, payment_date, payment_amount, interest_amount, description = record
+                        loan_id = loan_ids.get(reference_id)
+                        if loan_id is None:
+                            if last_pass:
+                                reject(row_number, record, f"No loan with reference id {reference_id}")
+                                rejected += 1
+                            else:
+                                pending_payments.append(record)
+                            continue
+
+                        loan_amount, loan_amount_paid, total_payments = balances[loan_id]
+                        if (total_payments + payment_amount > loan_amount
+                                or loan_amount_paid + payment_amount > loan_amount):
+                            reject(row_number, record, f"Total payments would exceed loan amount of {loan_amount:,.2f}")
+                            rejected += 1
+                            continue
+
+                        balances[loan_id] = [loan_amount, loan_amount_paid + payment_amount, total_payments + payment_amount]
+                        paid_loans.add(loan_id)
+                        payment_rows.append((
+                            loan_id, payment_amount, interest_amount,
+                            loan_amount - (total_payments + payment_amount), description, payment_date
+                        ))
+
+                    cursor.executemany("""
+                        INSERT INTO Loans (loan_id, customer_id, loan_amount, created_at, registered_reference_id)
+                        VALUES (?, ?, ?, ?, ?)
+                    """, loan_rows)
+                    cursor.executemany("INSERT INTO Assets (loan_id, description, weight) VALUES (?, ?, ?)", asset_rows)
+                    cursor.executemany("""
+                        INSERT INTO LoanPayments (
+                            loan_id, payment_amount, interest_amount,
+                            amount_left, asset_description, payment_date
+                        ) VALUES (?, ?, ?, ?, ?, ?)
+                    """, payment_rows)
+                    loans_imported += len(loan_rows)
+                    payments_imported += len(payment_rows)
+
+                    if progress and progress(processed) is False:
+                        conn.rollback()
+                        return None
+
+                # One update per loan that received payments instead of one per payment
+                cursor.executemany("""
+                    UPDATE Loans
+                    SET loan_amount_paid = ?, loan_status = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE loan_id = ?
+                """, [
+                    (balances[loan_id][1],
+                     "Completed" if balances[loan_id][1] == balances[loan_id][0] else "Pending",
+                     loan_id)
+                    for loan_id in sorted(paid_loans)
+                ])
+                conn.commit()
+            return loans_imported, payments_imported, rejected
+        except sqlite3.Error as e:
+            print(f"Database error while importing loans: {e}")
+            return None
 
     @staticmethod
     def update_customer(customer_id, name, phone, address):
@@ -621,18 +1673,15 @@ class DatabaseManager:
         """
         
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (payment_date, payment_amount, interest_amount, 
-                                asset_description, payment_id))
-            conn.commit()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, (payment_date, payment_amount, interest_amount, 
+                                    asset_description, payment_id))
+                conn.commit()
             return True
         except sqlite3.Error as e:
             print(f"Database error while updating payment: {e}")
             return False
-        finally:
-            if conn:
-                conn.close()
 
     @staticmethod
     def update_loan_total_paid(loan_id, total_paid, loan_status):
@@ -653,70 +1702,14 @@ class DatabaseManager:
         """
         
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, (total_paid, loan_status, loan_id))
-            conn.commit()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, (total_paid, loan_status, loan_id))
+                conn.commit()
             return True
         except sqlite3.Error as e:
             print(f"Database error while updating loan total: {e}")
             return False
-        finally:
-            if conn:
-                conn.close()
-
-    @staticmethod
-    def get_summary_stats_to_generate_report(year=None):
-        """
-        Fetch total customers and total loan amount due, optionally filtered by year.
-        
-        Args:
-            year: Optional year to filter by
-        
-        Returns:
-            tuple: (total_customers, total_loan_due)
-        """
-        try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
-            
-            if year:
-                # Count customers who had loans in the specified year
-                query_customers = """
-                    SELECT COUNT(DISTINCT customer_id) 
-                    FROM Loans 
-                    WHERE strftime('%Y', created_at) = ?
-                """
-                cursor.execute(query_customers, (str(year),))
-                total_customers = cursor.fetchone()[0]
-                
-                # Get total loan amount due for loans created in the specified year
-                query_loan_due = """
-                    SELECT SUM(loan_amount_due) 
-                    FROM LoanView 
-                    WHERE strftime('%Y', loan_date) = ?
-                """
-                cursor.execute(query_loan_due, (str(year),))
-                
-            else:
-                # Get total customers and loan amount due across all years
-                query_customers = "SELECT COUNT(*) FROM Customers"
-                cursor.execute(query_customers)
-                total_customers = cursor.fetchone()[0]
-                
-                query_loan_due = "SELECT SUM(loan_amount_due) FROM LoanView"
-                cursor.execute(query_loan_due)
-            
-            total_loan_due = cursor.fetchone()[0] or 0  # Handle NULL with 0
-            
-            return total_customers, float(total_loan_due)
-        
-        except sqlite3.Error as e:
-            print(f"Database error while fetching summary stats: {e}")
-            return 0, 0.0
-        finally:
-            if conn:
-                conn.close()
 
     @staticmethod
     def get_customers_by_year(year=None):
@@ -730,36 +1723,33 @@ class DatabaseManager:
             list: List of tuples containing customer_id, name, phone
         """
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
             
-            if year:
-                # Get customers who had loans in the specified year
-                query = """
-                    SELECT DISTINCT c.customer_id, c.name, c.phone
-                    FROM Customers c
-                    JOIN Loans l ON c.customer_id = l.customer_id
-                    WHERE strftime('%Y', l.created_at) = ?
-                    ORDER BY c.name
-                """
-                cursor.execute(query, (str(year),))
-            else:
-                # Get all customers
-                query = """
-                    SELECT customer_id, name, phone
-                    FROM Customers
-                    ORDER BY name
-                """
-                cursor.execute(query)
+                if year:
+                    # Get customers who had loans in the specified year
+                    query = """
+                        SELECT DISTINCT c.customer_id, c.name, c.phone
+                        FROM Customers c
+                        JOIN Loans l ON c.customer_id = l.customer_id
+                        WHERE l.created_at >= ? AND l.created_at < ?
+                        ORDER BY c.name
+                    """
+                    cursor.execute(query, DatabaseManager.date_range_bounds(year=year))
+                else:
+                    # Get all customers
+                    query = """
+                        SELECT customer_id, name, phone
+                        FROM Customers
+                        ORDER BY name
+                    """
+                    cursor.execute(query)
             
-            return cursor.fetchall()
+                return cursor.fetchall()
         
         except sqlite3.Error as e:
             print(f"Database error while fetching customers by year: {e}")
             return []
-        finally:
-            if conn:
-                conn.close()
 
     @staticmethod
     def fetch_loans_for_customer_to_generate_report(customer_id, year=None):
@@ -774,94 +1764,51 @@ class DatabaseManager:
             list: List of loan data from LoanView
         """
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
             
-            if year:
-                # Get loans for the specified customer in the specified year
-                query = """
-                    SELECT * FROM LoanView 
-                    WHERE customer_id = ? 
-                    AND strftime('%Y', loan_date) = ?
-                    ORDER BY loan_date DESC
-                """
-                cursor.execute(query, (customer_id, str(year)))
-            else:
-                # Get all loans for the specified customer
-                query = """
-                    SELECT * FROM LoanView 
-                    WHERE customer_id = ?
-                    ORDER BY loan_date DESC
-                """
-                cursor.execute(query, (customer_id,))
+                if year:
+                    # Get loans for the specified customer in the specified year
+                    query = """
+                        SELECT * FROM LoanView 
+                        WHERE customer_id = ? 
+                        AND loan_date >= ? AND loan_date < ?
+                        ORDER BY loan_date DESC
+                    """
+                    cursor.execute(query, (customer_id, *DatabaseManager.date_range_bounds(year=year)))
+                else:
+                    # Get all loans for the specified customer
+                    query = """
+                        SELECT * FROM LoanView 
+                        WHERE customer_id = ?
+                        ORDER BY loan_date DESC
+                    """
+                    cursor.execute(query, (customer_id,))
             
-            return cursor.fetchall()
+                return cursor.fetchall()
         
         except sqlite3.Error as e:
             print(f"Database error while fetching loans for customer {customer_id}: {e}")
             return []
-        finally:
-            if conn:
-                conn.close()
-
-    @staticmethod
-    def get_customer_loan_totals(customer_id, year=None):
-        """Get total loan amount and total amount due for a specific customer."""
-        conn = DatabaseManager.create_connection()
-        cursor = conn.cursor()
-        
-        try:
-            query_params = [customer_id]
-            
-            # Base query without year filter
-            query = """
-                SELECT 
-                    SUM(l.loan_amount) as total_loan_amount,
-                    SUM(l.loan_amount - COALESCE(
-                        (SELECT SUM(p.payment_amount) FROM LoanPayments p WHERE p.loan_id = l.loan_id), 0
-                    )) as total_amount_due
-                FROM loans l
-                WHERE l.customer_id = ?
-            """
-            
-            # Add year filter if specified
-            if year:
-                query += " AND strftime('%Y', l.created_at) = ?"
-                query_params.append(str(year))
-                
-            cursor.execute(query, query_params)
-            result = cursor.fetchone()
-            
-            total_loan = float(result[0]) if result[0] else 0
-            total_due = float(result[1]) if result[1] else 0
-            
-            return total_loan, total_due
-            
-        except Exception as e:
-            print(f"Error fetching customer loan totals: {e}")
-            return 0, 0
-        finally:
-            conn.close()
 
     @staticmethod
     def get_loan_amount_due(loan_id):
         """Get the amount due for a specific loan."""
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT loan_amount_due FROM LoanView WHERE loan_id = ?", 
-                (loan_id,)
-            )
-            result = cursor.fetchone()
-            conn.close()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT loan_amount_due FROM LoanView WHERE loan_id = ?", 
+                    (loan_id,)
+                )
+                result = cursor.fetchone()
             return float(result[0]) if result else 0
         except Exception as e:
             print(f"Error fetching loan amount due: {e}")
             return float('inf')  # Return infinity if error, to ensure button remains disabled
     
     @staticmethod
-    def fetch_loans_by_year(year=None, limit=None, offset=0, start_date=None, end_date=None):
+    def fetch_loans_by_year(year=None, limit=None, offset=0, start_date=None, end_date=None, filters=None):
         """
         Fetch all loans for a given year or date range from all customers with pagination support.
         Date validation is done at the SQL level for better performance.
@@ -872,6 +1819,7 @@ class DatabaseManager:
             offset: Optional offset for pagination (number of records to skip)
             start_date: Optional start date filter (YYYY-MM-DD format)
             end_date: Optional end date filter (YYYY-MM-DD format)
+            filters: Optional {field: value} dict understood by LoanQuery.matching()
         
         Returns:
             list: List of loan data from LoanView with customer name, with valid dates
@@ -880,59 +1828,161 @@ class DatabaseManager:
                      loan_id, customer_id, customer_name)
         """
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
-            
-            # Base query with date validation at SQL level
-            base_query = """
-                SELECT lv.*, c.name as customer_name
-                FROM LoanView lv
-                JOIN Customers c ON lv.customer_id = c.customer_id
-                WHERE lv.loan_date IS NOT NULL 
-                AND lv.loan_date != ''
-            """
-            
-            params = []
-            
-            # Add date range filter if specified (takes precedence over year)
-            if start_date and end_date:
-                base_query += " AND DATE(lv.loan_date) >= DATE(?) AND DATE(lv.loan_date) <= DATE(?)"
-                params.extend([start_date, end_date])
-            elif year:
-                # Add year filter if specified and no date range
-                base_query += " AND strftime('%Y', lv.loan_date) = ?"
-                params.append(str(year))
-            
-            # Add ordering
-            base_query += " ORDER BY lv.loan_date DESC"
-            
-            # Add pagination if limit is specified
-            if limit is not None:
-                base_query += " LIMIT ? OFFSET ?"
-                params.extend([limit, offset])
-            
-            cursor.execute(base_query, params)
-            loans = cursor.fetchall()
+            query, params = (
+                LoanQuery()
+                .period(year, start_date, end_date)
+                .filters(filters)
+                .select(limit=limit, offset=offset)
+            )
             
-            # Minimal validation - just check if date can be parsed
-            valid_loans = []
-            for loan in loans:
-                try:
-                    loan_date_str = str(loan[0]).replace('00:00:00', '').strip()
-                    from datetime import datetime
-                    datetime.strptime(loan_date_str, "%Y-%m-%d")
-                    valid_loans.append(loan)
-                except (ValueError, Exception) as e:
-                    print(f"WARNING: Loan ID {loan[7]} has invalid date format '{loan[0]}', skipping... Error: {e}")
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                loans = cursor.fetchall()
             
-            return valid_loans
+            return DatabaseManager.filter_valid_loan_dates(loans)
         
+        except ValueError as e:
+            print(f"Invalid loan filter: {e}")
+            return []
         except sqlite3.Error as e:
             print(f"Database error while fetching loans by year: {e}")
             return []
-        finally:
-            if conn:
-                conn.close()
+
+    @staticmethod
+    def fetch_loans_page(year=None, start_date=None, end_date=None, limit=50, after=None, before=None, filters=None):
+        """
+        Fetch one page of loans using keyset (seek) pagination.
+
+        Loans are ordered newest first by (loan_date, loan_id). Instead of an
+        OFFSET, the page is located relative to the key of a row already shown,
+        so every page costs the same no matter how deep it is.
+
+        Args:
+            year: Optional year to filter by
+            start_date: Optional start date filter (YYYY-MM-DD format)
+            end_date: Optional end date filter (YYYY-MM-DD format)
+            limit: Number of loans per page
+            after: (loan_date, loan_id) of the last row on the current page to get the next page
+            before: (loan_date, loan_id) of the first row on the current page to get the previous page
+            filters: Optional {field: value} dict understood by LoanQuery.matching()
+
+        Returns:
+            list: Same row format as fetch_loans_by_year, newest first
+        """
+        try:
+            query, params = (
+                LoanQuery()
+                .period(year, start_date, end_date)
+                .filters(filters)
+                .select(limit=limit, after=after, before=before)
+            )
+
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                loans = cursor.fetchall()
+
+            if before is not None:
+                loans.reverse()
+
+            return DatabaseManager.filter_valid_loan_dates(loans)
+
+        except ValueError as e:
+            print(f"Invalid loan filter: {e}")
+            return []
+        except sqlite3.Error as e:
+            print(f"Database error while fetching loan page: {e}")
+            return []
+
+    @staticmethod
+    def iter_loans(year=None, start_date=None, end_date=None, filters=None, customer_id=None, chunk_size=500):
+        """
+        Stream matching loans newest first in chunks of at most chunk_size rows.
+
+        Each chunk is a keyset query seeking past the last row of the previous
+        one (like fetch_loans_page), run in its own connection block. No
+        connection or cursor is held between chunks, so only one chunk is in
+        memory and the generator can be consumed, closed or dropped on any
+        thread.
+
+        Yields:
+            list: Rows in the fetch_loans_by_year format
+        """
+        query = LoanQuery().period(year, start_date, end_date).filters(filters)
+        if customer_id is not None:
+            query.customer(customer_id)
+
+        after = None
+        while True:
+            sql, params = query.select(limit=chunk_size, after=after)
+            with DatabaseManager.connection() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            if not rows:
+                return
+            yield DatabaseManager.filter_valid_loan_dates(rows)
+            if len(rows) < chunk_size:
+                return
+            after = (rows[-1][0], rows[-1][7])
+
+    @staticmethod
+    def get_portfolio_aggregates(scope=None, period=None, filters=None):
+        """
+        Loan totals per customer and overall, in one grouped query.
+
+        Args:
+            scope: customer_id to restrict to one customer, or None for all customers
+            period: optional dict(year=..., start_date=..., end_date=...) as used by the report filters
+            filters: optional {field: value} loan filters (see LoanQuery.matching)
+
+        Returns:
+            dict: {"customers": {customer_id: totals}, "totals": totals}, where
+            totals maps each of AGGREGATE_FIELDS to a number. The overall totals
+            also count "customers" (customers in scope) and "borrowers"
+            (customers with at least one matching loan).
+        """
+        aggregates = {
+            "customers": {},
+            "totals": dict.fromkeys(("customers", "borrowers") + AGGREGATE_FIELDS, 0),
+        }
+        try:
+            sql, params = LoanQuery().period(**(period or {})).filters(filters).aggregates(scope)
+
+            with DatabaseManager.connection() as conn:
+                rows = conn.execute(sql, params).fetchall()
+
+        except ValueError as e:
+            print(f"Invalid loan filter: {e}")
+            return aggregates
+        except sqlite3.Error as e:
+            print(f"Database error while calculating portfolio aggregates: {e}")
+            return aggregates
+
+        totals = aggregates["totals"]
+        for customer_id, *values in rows:
+            customer_totals = dict(zip(AGGREGATE_FIELDS, values))
+            aggregates["customers"][customer_id] = customer_totals
+            totals["customers"] += 1
+            if customer_totals["loans"]:
+                totals["borrowers"] += 1
+            for field in AGGREGATE_FIELDS:
+                totals[field] += customer_totals[field]
+        return aggregates
+
+    @staticmethod
+    def filter_valid_loan_dates(loans):
+        """Drop LoanView rows whose loan_date cannot be parsed as YYYY-MM-DD."""
+        # Minimal validation - just check if date can be parsed
+        valid_loans = []
+        for loan in loans:
+            try:
+                loan_date_str = str(loan[0]).replace('00:00:00', '').strip()
+                datetime.datetime.strptime(loan_date_str, "%Y-%m-%d")
+                valid_loans.append(loan)
+            except (ValueError, Exception) as e:
+                print(f"WARNING: Loan ID {loan[7]} has invalid date format '{loan[0]}', skipping... Error: {e}")
+
+        return valid_loans
     
     @staticmethod
     def get_earliest_loan_date():
@@ -943,73 +1993,71 @@ class DatabaseManager:
             str: Earliest loan date in YYYY-MM-DD format, or None if no loans
         """
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
             
-            query = """
-                SELECT MIN(created_at) 
-                FROM Loans 
-                WHERE created_at IS NOT NULL 
-                AND created_at != ''
-            """
+                query = """
+                    SELECT MIN(created_at) 
+                    FROM Loans 
+                    WHERE created_at IS NOT NULL 
+                    AND created_at != ''
+                """
             
-            cursor.execute(query)
-            result = cursor.fetchone()
+                cursor.execute(query)
+                result = cursor.fetchone()
             
-            if result and result[0]:
-                return result[0]
-            return None
+                if result and result[0]:
+                    return result[0]
+                return None
         
         except sqlite3.Error as e:
             print(f"Database error while fetching earliest loan date: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()
     
     @staticmethod
-    def get_total_loans_count(year=None, start_date=None, end_date=None):
+    def get_total_loans_count(year=None, start_date=None, end_date=None, filters=None):
         """
         Get the total count of loans for pagination.
+
+        Counts are cached per filter and reused until the next write to the database.
         
         Args:
             year: Optional year to filter by. If None, counts all loans.
             start_date: Optional start date filter (YYYY-MM-DD format)
             end_date: Optional end date filter (YYYY-MM-DD format)
+            filters: Optional {field: value} dict understood by LoanQuery.matching()
         
         Returns:
             int: Total number of loans
         """
+        key = (year, start_date, end_date, tuple(sorted((filters or {}).items())))
+        generation = DatabaseManager.data_generation()
+        with _loan_count_lock:
+            if _loan_count_cache["generation"] == generation and key in _loan_count_cache["counts"]:
+                return _loan_count_cache["counts"][key]
+
         try:
-            conn = DatabaseManager.create_connection()
-            cursor = conn.cursor()
-            
-            query = """
-                SELECT COUNT(*) 
-                FROM LoanView lv
-                WHERE lv.loan_date IS NOT NULL 
-                AND lv.loan_date != ''
-            """
-            
-            params = []
-            
-            # Add date range filter if specified (takes precedence over year)
-            if start_date and end_date:
-                query += " AND DATE(lv.loan_date) >= DATE(?) AND DATE(lv.loan_date) <= DATE(?)"
-                params.extend([start_date, end_date])
-            elif year:
-                query += " AND strftime('%Y', lv.loan_date) = ?"
-                params.append(str(year))
-            
-            cursor.execute(query, params)
-            count = cursor.fetchone()[0]
+            query, params = LoanQuery().period(year, start_date, end_date).filters(filters).count()
+
+            with DatabaseManager.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                count = cursor.fetchone()[0]
+
+            # A write that landed while the COUNT ran may not be in it; only cache
+            # the count if the generation it was taken under is still current
+            with _loan_count_lock:
+                if DatabaseManager.data_generation() == generation:
+                    if _loan_count_cache["generation"] != generation:
+                        _loan_count_cache["generation"] = generation
+                        _loan_count_cache["counts"] = {}
+                    _loan_count_cache["counts"][key] = count
             return count
         
+        except ValueError as e:
+            print(f"Invalid loan filter: {e}")
+            return 0
         except sqlite3.Error as e:
             print(f"Database error while counting loans: {e}")
             return 0
-        finally:
-            if conn:
-                conn.close()
         
-    
\ No newline at end of file
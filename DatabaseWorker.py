@@ -0,0 +1,143 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+from DatabaseManager import WORKER_POOL_SIZE
+
+# Shared by every page; sized to the number of pooled worker connections
+_thread_pool = None
+
+
+def get_thread_pool():
+    """Return the thread pool that runs database requests."""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = QThreadPool()
+        _thread_pool.setMaxThreadCount(WORKER_POOL_SIZE)
+    return _thread_pool
+
+
+def show_busy_cursor(busy):
+    """busy_changed slot that shows a busy cursor while a page is waiting on the database."""
+    if busy:
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+    else:
+        QApplication.restoreOverrideCursor()
+
+
+class RequestSignals(QObject):
+    finished = pyqtSignal(int, object)  # request id, result
+    failed = pyqtSignal(int, str)       # request id, error message
+
+
+class DatabaseRequest(QRunnable):
+    """Runs one DatabaseManager call on a worker thread."""
+
+    def __init__(self, request_id, func, args, kwargs):
+        super().__init__()
+        self.request_id = request_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = RequestSignals()
+        # DatabaseWorker keeps the request alive until its result is delivered
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+            return
+        self.signals.finished.emit(self.request_id, result)
+
+
+class DatabaseWorker(QObject):
+    """
+    Asynchronous facade over DatabaseManager for a page.
+
+    submit() runs a call on the shared thread pool and hands the result to a
+    callback on the GUI thread. Every request has a key (e.g. "loans"): a newer
+    request with the same key supersedes the older one, which is dropped from
+    the queue if it has not started yet and otherwise has its result discarded.
+    busy_changed fires when the page starts or stops waiting on any request.
+    """
+
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.next_request_id = 0
+        self.latest = {}    # key -> id of the request whose result will be used
+        self.pending = {}   # request id -> (key, request, on_result, on_error)
+
+    def submit(self, key, func, *args, on_result=None, on_error=None, **kwargs):
+        """
+        Run func(*args, **kwargs) in the background.
+
+        Args:
+            key: Requests sharing a key cancel each other (latest wins)
+            func: Callable to run, typically a DatabaseManager static method
+            on_result: Called on the GUI thread with the return value
+            on_error: Called on the GUI thread with an error message
+
+        Returns:
+            int: Request id
+        """
+        was_busy = self.is_busy()
+        self.cancel(key, notify=False)
+
+        self.next_request_id += 1
+        request_id = self.next_request_id
+        request = DatabaseRequest(request_id, func, args, kwargs)
+        request.signals.finished.connect(self.on_request_finished)
+        request.signals.failed.connect(self.on_request_failed)
+
+        self.latest[key] = request_id
+        self.pending[request_id] = (key, request, on_result, on_error)
+        get_thread_pool().start(request)
+
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return request_id
+
+    def cancel(self, key, notify=True):
+        """Cancel the outstanding request for key, if any."""
+        request_id = self.latest.pop(key, None)
+        if request_id is None:
+            return
+        _, request, _, _ = self.pending[request_id]
+        # Not started yet: take it off the queue. Running: its result is ignored.
+        if get_thread_pool().tryTake(request):
+            del self.pending[request_id]
+        if notify and not self.is_busy():
+            self.busy_changed.emit(False)
+
+    def cancel_all(self):
+        for key in list(self.latest):
+            self.cancel(key)
+
+    def is_busy(self):
+        return bool(self.latest)
+
+    def take(self, request_id):
+        """Pop a finished request; returns (key, on_result, on_error) or None if superseded."""
+        key, _, on_result, on_error = self.pending.pop(request_id, (None, None, None, None))
+        if key is None or self.latest.get(key) != request_id:
+            return None
+        del self.latest[key]
+        if not self.is_busy():
+            self.busy_changed.emit(False)
+        return key, on_result, on_error
+
+    def on_request_finished(self, request_id, result):
+        taken = self.take(request_id)
+        if taken and taken[1]:
+            taken[1](result)
+
+    def on_request_failed(self, request_id, message):
+        taken = self.take(request_id)
+        if not taken:
+            return
+        if taken[2]:
+            taken[2](message)
+        else:
+            print(f"Background database request '{taken[0]}' failed: {message}")
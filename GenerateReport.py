@@ -2,13 +2,25 @@ from PyQt5.QtCore import QEvent, Qt, QDate
 from PyQt5.QtWidgets import (
     QTableWidget, QTableWidgetItem, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QGroupBox, QMessageBox, QComboBox, 
-    QLineEdit, QFormLayout, QDateEdit, QWidget
+    QLineEdit, QFormLayout, QDateEdit, QWidget, QProgressDialog
 )
 from helper import StyledWidget, format_indian_currency
 from DatabaseManager import DatabaseManager
-from fpdf import FPDF
+from DatabaseWorker import DatabaseWorker, get_thread_pool, show_busy_cursor
+from CustomerCache import get_customer_cache, customer_display_text, insert_customer_item, update_customer_item
+from PdfReportTask import PdfReportTask, sanitize_text
+from LoanTableModel import LoanTableView, ButtonColumn
 from datetime import datetime
 
+# Filter parameter labels mapped to LoanQuery filter fields
+LOAN_FILTER_FIELDS = {
+    "Reference ID": "reference_id",
+    "Asset Description": "asset_description",
+    "Weight (g)": "weight",
+    "Amount (₹)": "amount",
+    "Amount Due (₹)": "amount_due",
+}
+
 class GenerateReport(StyledWidget):
     def __init__(self, parent, switch_page_callback):
         super().__init__(parent, with_back_button=True, title="Generate Report", switch_page_callback=switch_page_callback)
@@ -27,12 +39,34 @@ class GenerateReport(StyledWidget):
         self.current_page = 1
         self.rows_per_page = 50
         self.total_loans = 0
-        self.all_loans_cache = []  # Cache for filtered loans (for search)
+        # Keyset pagination: ("after" | "before", (loan_date, loan_id)) that fetched the page shown.
+        # current_page and page_anchor only change when a page arrives, so quick clicks
+        # on prev/next seek from the rows actually on screen.
+        self.page_anchor = None
+        self.page_first_key = None
+        self.page_last_key = None
         
         # Date range variables
         self.start_date = None
         self.end_date = None
         
+        # Report queries run in the background so large years don't freeze the window
+        self.db_worker = DatabaseWorker(self)
+        self.db_worker.busy_changed.connect(show_busy_cursor)
+        
+        # Customers offered for the selected year, and the list the dropdown
+        # currently shows unfiltered (None while a search filter is applied)
+        self.customer_cache = get_customer_cache()
+        self.customer_cache.customers_added.connect(self.on_customers_added)
+        self.customer_cache.customer_changed.connect(self.on_customer_changed)
+        self.report_customers = []
+        self.customer_dropdown_source = None
+        
+        # PDF report currently being written in the background
+        self.pdf_report = None
+        self.pdf_task = None
+        self.pdf_progress_dialog = None
+        
         self.init_ui()
         
         # Hide elements initially
@@ -64,7 +98,6 @@ class GenerateReport(StyledWidget):
             self.filter_value = None
             self.customer_search.clear()
             self.filter_input.clear()
-            self.all_loans_cache = []
         
         # Update UI
         self.customer_info_group.setVisible(False)
@@ -100,8 +133,7 @@ class GenerateReport(StyledWidget):
         self.customer_dropdown.setCurrentIndex(0)
         self.customer_search.clear()
         
-        # Clear cache and refresh
-        self.all_loans_cache = []
+        # Reset pagination
         self.current_page = 1
         
         # Only show loan table, hide customer info
@@ -110,14 +142,13 @@ class GenerateReport(StyledWidget):
         self.generate_pdf_button.setEnabled(False)
         
         # Don't populate table yet, wait for user to enter a value
-        self.loan_details_table.setRowCount(0)
+        self.loan_details_table.clear()
     
     def on_filter_value_changed(self, text):
         """Handle filter value text input change"""
         self.filter_value = text.strip() if text.strip() else None
         
-        # Clear cache to force refresh with new filter
-        self.all_loans_cache = []
+        # Start from the first page for the new filter
         self.current_page = 1
         
         # Enable PDF button if there's a filter value
@@ -127,7 +158,7 @@ class GenerateReport(StyledWidget):
         if self.filter_value:
             self.populate_loans_table()
         else:
-            self.loan_details_table.setRowCount(0)
+            self.loan_details_table.clear()
 
     def on_period_type_changed(self, index):
         """Handle period type selection change"""
@@ -494,13 +525,19 @@ class GenerateReport(StyledWidget):
         self.customer_info_group.setLayout(customer_info_layout)
         self.content_layout.addWidget(self.customer_info_group)
 
-        # Update Loan Details Table headers
-        self.loan_details_table = QTableWidget()
-        self.loan_details_table.setColumnCount(7)  # Includes registered_reference_id
-        self.loan_details_table.setHorizontalHeaderLabels([
-            "Loan Date", "Registered Reference Id", "Total Assets", "Total Weight (g)", 
-            "Total Amount (₹)", "Amount Due (₹)", ""
-        ])
+        # Loan Details Table: one customer's loans, or every loan with a customer name column
+        view_more = ButtonColumn("View More", lambda loan: self.show_loan_details(loan[7]))
+        self.customer_loan_columns = [
+            ("Loan Date", "date"), ("Registered Reference Id", "reference"), ("Total Assets", "assets"),
+            ("Total Weight (g)", "weight"), ("Total Amount (₹)", "amount"), ("Amount Due (₹)", "due"),
+            ("", view_more)
+        ]
+        self.all_loan_columns = [
+            ("Customer Name", "customer"), ("Loan Date", "date"), ("Registered Reference Id", "reference"),
+            ("Total Assets", "assets"), ("Total Weight (g)", "weight"), ("Total Amount (₹)", "amount"),
+            ("Amount Due (₹)", "due"), ("", view_more)
+        ]
+        self.loan_details_table = LoanTableView(self.customer_loan_columns)
         self.loan_details_table.setColumnWidth(1, 200)
         self.loan_details_table.setColumnWidth(2, 150)
         self.loan_details_table.setColumnWidth(3, 150)
@@ -508,10 +545,6 @@ class GenerateReport(StyledWidget):
         self.loan_details_table.setColumnWidth(5, 150)
         self.loan_details_table.setColumnWidth(6, 150)
 
-
-        self.loan_details_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.loan_details_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.loan_details_table.setSelectionMode(QTableWidget.SingleSelection)
         self.loan_details_table.setFixedHeight(200)
         self.content_layout.addWidget(self.loan_details_table)
 
@@ -707,7 +740,6 @@ class GenerateReport(StyledWidget):
         self.generate_pdf_button.setEnabled(True)
         # Reset pagination and show all loans for the selected year
         self.current_page = 1
-        self.all_loans_cache = []
         self.populate_loans_table()
     
     def on_date_range_changed(self):
@@ -733,7 +765,6 @@ class GenerateReport(StyledWidget):
         
         # Reset pagination and refresh data
         self.current_page = 1
-        self.all_loans_cache = []
         
         # Refresh summary and loans
         self.refresh_summary_data()
@@ -748,16 +779,20 @@ class GenerateReport(StyledWidget):
     
     def go_to_previous_page(self):
         """Navigate to the previous page"""
+        if self.selected_customer_id:
+            return  # A customer's loans are shown on one page
         if self.current_page > 1:
-            self.current_page -= 1
-            self.populate_loans_table()
+            anchor = ("before", self.page_first_key) if self.page_first_key else None
+            self.show_all_loans(self.current_page - 1, anchor)
     
     def go_to_next_page(self):
         """Navigate to the next page"""
+        if self.selected_customer_id:
+            return  # A customer's loans are shown on one page
         total_pages = self.get_total_pages()
         if self.current_page < total_pages:
-            self.current_page += 1
-            self.populate_loans_table()
+            anchor = ("after", self.page_last_key) if self.page_last_key else None
+            self.show_all_loans(self.current_page + 1, anchor)
     
     def get_total_pages(self):
         """Calculate total number of pages"""
@@ -778,8 +813,17 @@ class GenerateReport(StyledWidget):
 
     def refresh_summary_data(self):
         """Refresh the summary statistics for total customers and loan amount due."""
-        year = self.selected_year
-        total_customers, total_loan_due = DatabaseManager.get_summary_stats_to_generate_report(year)
+        self.db_worker.submit(
+            "summary", DatabaseManager.get_portfolio_aggregates, period=dict(year=self.selected_year),
+            on_result=self.display_summary_data
+        )
+
+    def display_summary_data(self, aggregates):
+        """Show the summary statistics fetched by refresh_summary_data."""
+        totals = aggregates["totals"]
+        # For a single year only customers who took a loan that year are counted
+        total_customers = totals["borrowers"] if self.selected_year else totals["customers"]
+        total_loan_due = totals["amount_due"]
 
         # Update the labels
         self.total_customers_label.setText(f"Total Customers: {total_customers}")
@@ -868,7 +912,6 @@ class GenerateReport(StyledWidget):
             
             # Reset pagination
             self.current_page = 1
-            self.all_loans_cache = []
             
             # Set initial UI state
             self.customer_info_group.setVisible(False)
@@ -885,54 +928,99 @@ class GenerateReport(StyledWidget):
         super().showEvent(event)
 
     def populate_customer_dropdown(self):
-        """Populate the dropdown with the latest customer data."""
+        """Populate the dropdown with the customers for the selected year."""
+        if self.selected_year is None:
+            # Every customer: the shared cache already has them
+            self.db_worker.cancel("customers")
+            self.display_customer_dropdown(self.customer_cache.customers())
+            return
+
+        self.db_worker.submit(
+            "customers", DatabaseManager.get_customers_by_year, self.selected_year,
+            on_result=lambda customers: self.display_customer_dropdown([
+                self.customer_cache.get(customer_id) or {'id': customer_id, 'name': name, 'phone': phone or ''}
+                for customer_id, name, phone in customers
+            ])
+        )
+
+    def display_customer_dropdown(self, customers):
+        """Fill the customer dropdown with the customers chosen by populate_customer_dropdown."""
+        self.report_customers = customers
+
         # Block signals to prevent triggering on_customer_selected during dropdown update
         self.customer_dropdown.blockSignals(True)
         
-        self.customer_dropdown.clear()
-        # Add the initial placeholder
-        self.customer_dropdown.addItem("Select a customer", None)
-        
-        customers = DatabaseManager.get_customers_by_year(self.selected_year)
-        if customers:
-            for customer_id, name, account_number in customers:
-                self.customer_dropdown.addItem(f"{name}", customer_id)
+        # Nothing to rebuild when the dropdown already lists exactly these customers
+        if self.customer_dropdown_source is not customers:
+            self.customer_dropdown.clear()
+            # Add the initial placeholder
+            self.customer_dropdown.addItem("Select a customer", None)
+            
+            for customer in customers:
+                self.customer_dropdown.addItem(f"{customer['name']}", customer['id'])
+            self.customer_dropdown_source = customers
+        self.customer_dropdown.setCurrentIndex(0)
         
         # Re-enable signals
         self.customer_dropdown.blockSignals(False)
 
     def filter_customers(self, text):
         """Filter customers based on search text."""
+        self.display_filtered_customers(text, self.report_customers)
+        
+        # If no customer is selected, refresh the all loans view with the search filter
+        if not self.selected_customer_id:
+            # Reset to first page when search changes
+            self.current_page = 1
+            self.populate_loans_table()
+
+    def display_filtered_customers(self, text, customers):
+        """Fill the customer dropdown with the customers matching the search text."""
+        if not text:
+            self.display_customer_dropdown(customers)
+            return
+
         # Block signals to prevent triggering on_customer_selected during dropdown update
         self.customer_dropdown.blockSignals(True)
         
         self.customer_dropdown.clear()
+        self.customer_dropdown_source = None
         # Always add the initial placeholder
         self.customer_dropdown.addItem("Select a customer", None)
         
-        customers = DatabaseManager.get_customers_by_year(self.selected_year)
-        
+        text = text.lower()
         filtered_customers = [
-            (customer_id, name, account_number) 
-            for customer_id, name, account_number in customers 
-            if text.lower() in f"{name} {account_number}".lower()
+            customer for customer in customers
+            if text in f"{customer['name']} {customer['phone']}".lower()
         ]
-        if filtered_customers:
-            for customer_id, name, account_number in filtered_customers:
-                self.customer_dropdown.addItem(f"{name} - {account_number}" if account_number else f"{name}", customer_id)
-                
-            # Don't auto-select single customer anymore
-            # Let user explicitly select it
+        for customer in filtered_customers:
+            self.customer_dropdown.addItem(customer_display_text(customer), customer['id'])
+            
+        # Don't auto-select single customer anymore
+        # Let user explicitly select it
         
         # Re-enable signals
         self.customer_dropdown.blockSignals(False)
-        
-        # If no customer is selected, refresh the all loans view with the search filter
-        if not self.selected_customer_id:
-            # Reset to first page when search changes
-            self.current_page = 1
-            self.all_loans_cache = []  # Clear cache to force refresh
-            self.populate_loans_table()
+
+    def on_customers_added(self, customers):
+        """Add newly registered customers to the all-years dropdown without rebuilding it."""
+        # A brand new customer has no loans yet, so year lists are unaffected
+        if self.selected_year is not None or self.report_customers is not self.customer_cache.customers():
+            return
+        if self.customer_dropdown_source is None:
+            self.display_filtered_customers(self.customer_search.text().strip(), self.report_customers)
+            return
+        for customer in customers:
+            insert_customer_item(self.customer_dropdown, customer, f"{customer['name']}", first_row=1)
+
+    def on_customer_changed(self, customer):
+        """Relabel a customer edited on another page."""
+        if self.customer_dropdown_source is None:
+            self.display_filtered_customers(self.customer_search.text().strip(), self.report_customers)
+        else:
+            update_customer_item(self.customer_dropdown, customer, f"{customer['name']}", first_row=1)
+        if customer['id'] == self.selected_customer_id:
+            self.populate_customer_info()
 
     def on_customer_selected(self, index):
         """Display customer information and loans when a customer is selected."""
@@ -960,6 +1048,21 @@ class GenerateReport(StyledWidget):
 
     def populate_customer_info(self):
         """Populate customer information in the customer info group."""
+        customer_id, year = self.selected_customer_id, self.selected_year
+        
+        def fetch_customer_info():
+            # Customer details plus totals for the selected customer
+            return (
+                DatabaseManager.get_customer_by_id(customer_id),
+                DatabaseManager.get_portfolio_aggregates(customer_id, dict(year=year))["totals"]
+            )
+        
+        self.db_worker.submit("customer_info", fetch_customer_info, on_result=self.display_customer_info)
+
+    def display_customer_info(self, result):
+        """Show the customer details and totals fetched by populate_customer_info."""
+        customer_info, totals = result
+        total_loan, total_due = totals["loan_amount"], totals["amount_due"]
         customer_info_layout = self.customer_info_group.layout()
         
         # Clear existing widgets except the total labels
@@ -968,12 +1071,6 @@ class GenerateReport(StyledWidget):
             if child.widget():
                 child.widget().deleteLater()
         
-        customer_info = DatabaseManager.get_customer_by_id(self.selected_customer_id)
-        
-        # Calculate totals for the selected customer
-        total_loan, total_due = DatabaseManager.get_customer_loan_totals(
-            self.selected_customer_id, self.selected_year)
-        
         # Update the total labels
         self.total_customer_loan_label.setText(f"Total Loan Amount (₹): {format_indian_currency(total_loan)}")
         self.total_customer_due_label.setText(f"Total Amount Due (₹): {format_indian_currency(total_due)}")
@@ -988,7 +1085,7 @@ class GenerateReport(StyledWidget):
 
     def populate_loans_table(self):
         """Populate the loan table with loans for the selected customer or all loans."""
-        self.loan_details_table.setRowCount(0)  # Clear existing rows
+        self.loan_details_table.clear()  # Clear existing rows
         
         # Determine if we're showing all loans or customer-specific loans
         if self.selected_customer_id:
@@ -1001,12 +1098,8 @@ class GenerateReport(StyledWidget):
     def show_customer_loans(self):
         """Show loans for the selected customer."""
         # Update table to remove customer name column if present
-        if self.loan_details_table.columnCount() == 8:
-            self.loan_details_table.setColumnCount(7)
-            self.loan_details_table.setHorizontalHeaderLabels([
-                "Loan Date", "Registered Reference Id", "Total Assets", "Total Weight (g)", 
-                "Total Amount (₹)", "Amount Due (₹)", ""
-            ])
+        if self.loan_details_table.column_count() == 8:
+            self.loan_details_table.set_columns(self.customer_loan_columns)
             self.loan_details_table.setColumnWidth(1, 200)
             self.loan_details_table.setColumnWidth(2, 150)
             self.loan_details_table.setColumnWidth(3, 150)
@@ -1015,44 +1108,33 @@ class GenerateReport(StyledWidget):
             self.loan_details_table.setColumnWidth(6, 150)
         
         # Get loans filtered by year if selected
-        loans = DatabaseManager.fetch_loans_for_customer_to_generate_report(self.selected_customer_id, self.selected_year)
-        
+        self.db_worker.submit(
+            "loans", DatabaseManager.fetch_loans_for_customer_to_generate_report,
+            self.selected_customer_id, self.selected_year,
+            on_result=self.display_customer_loans
+        )
+
+    def display_customer_loans(self, loans):
+        """Fill the loan table with the customer loans fetched by show_customer_loans."""
+        self.loan_details_table.clear()
         if not loans:
             return
             
         loans = sorted(loans, key=lambda loan: datetime.strptime(str(loan[0]).replace('00:00:00', '').replace(' ', ''), "%Y-%m-%d"), reverse=True)
-        for row_idx, loan in enumerate(loans):
-            self.loan_details_table.insertRow(row_idx)
-            
-            # Format the loan data for display
-            loan_date = datetime.strptime((loan[0]).replace('00:00:00', '').replace(' ', ''), "%Y-%m-%d").strftime("%d-%m-%Y")
-            registered_reference_id = loan[6]  # Get registered_reference_id from the tuple
-            asset_descriptions = loan[1]
-            total_weight = f"{format_indian_currency(float(loan[2]))}" if loan[2] else "0.00"
-            loan_amount = f"{format_indian_currency(float(loan[3]))}" if loan[3] else "0.00"
-            amount_due = f"{format_indian_currency(float(loan[4]))}" if loan[4] else "0.00"
-            
-            # Set values in the table
-            self.loan_details_table.setItem(row_idx, 0, QTableWidgetItem(loan_date))
-            self.loan_details_table.setItem(row_idx, 1, QTableWidgetItem(registered_reference_id))
-            self.loan_details_table.setItem(row_idx, 2, QTableWidgetItem(asset_descriptions))
-            self.loan_details_table.setItem(row_idx, 3, QTableWidgetItem(total_weight))
-            self.loan_details_table.setItem(row_idx, 4, QTableWidgetItem(loan_amount))
-            self.loan_details_table.setItem(row_idx, 5, QTableWidgetItem(amount_due))
-            
-            view_button = QPushButton("View More")
-            view_button.clicked.connect(lambda checked, lid=loan[7]: self.show_loan_details(lid))
-            self.loan_details_table.setCellWidget(row_idx, 6, view_button)
+        # Cells are formatted by the model as they are painted
+        self.loan_details_table.set_loans(loans)
     
-    def show_all_loans(self):
-        """Show all loans from the database (filtered by year if selected) with pagination."""
+    def show_all_loans(self, page=None, anchor=None):
+        """
+        Show all loans from the database (filtered by year if selected) with pagination.
+
+        page/anchor select the page to fetch; by default the current page is fetched again.
+        """
+        if page is None:
+            page, anchor = self.current_page, self.page_anchor
         # Update table to add customer name column
-        if self.loan_details_table.columnCount() == 7:
-            self.loan_details_table.setColumnCount(8)
-            self.loan_details_table.setHorizontalHeaderLabels([
-                "Customer Name", "Loan Date", "Registered Reference Id", "Total Assets", 
-                "Total Weight (g)", "Total Amount (₹)", "Amount Due (₹)", ""
-            ])
+        if self.loan_details_table.column_count() == 7:
+            self.loan_details_table.set_columns(self.all_loan_columns)
             self.loan_details_table.setColumnWidth(0, 150)
             self.loan_details_table.setColumnWidth(1, 120)
             self.loan_details_table.setColumnWidth(2, 180)
@@ -1062,154 +1144,55 @@ class GenerateReport(StyledWidget):
             self.loan_details_table.setColumnWidth(6, 120)
             self.loan_details_table.setColumnWidth(7, 100)
         
-        # Determine which filter to use
-        search_text = self.customer_search.text().lower()
-        filter_text = self.filter_value.lower() if self.filter_value else None
-        
-        # If there's any filter, we need to fetch all and filter in Python
-        if search_text or filter_text:
-            # Use cache if available, otherwise fetch all
-            if not self.all_loans_cache:
-                self.all_loans_cache = DatabaseManager.fetch_loans_by_year(
-                    year=self.selected_year,
-                    start_date=self.start_date,
-                    end_date=self.end_date
-                )
-            
-            # Apply appropriate filter based on filter parameter
-            if search_text:
-                # Customer filter (using search box)
-                filtered_loans = [
-                    loan for loan in self.all_loans_cache 
-                    if search_text in loan[9].lower()  # loan[9] is customer_name
-                ]
-            elif filter_text:
-                # Apply filter based on selected parameter
-                if self.filter_param == "Reference ID":
-                    # loan[6] is registered_reference_id
-                    filtered_loans = [
-                        loan for loan in self.all_loans_cache 
-                        if loan[6] and filter_text in str(loan[6]).lower()
-                    ]
-                elif self.filter_param == "Asset Description":
-                    # loan[1] is asset_descriptions
-                    filtered_loans = [
-                        loan for loan in self.all_loans_cache 
-                        if loan[1] and filter_text in str(loan[1]).lower()
-                    ]
-                elif self.filter_param == "Weight (g)":
-                    # loan[2] is total_asset_weight
-                    try:
-                        filter_weight = float(filter_text.replace(',', ''))
-                        filtered_loans = [
-                            loan for loan in self.all_loans_cache 
-                            if loan[2] and abs(float(loan[2]) - filter_weight) < 0.01
-                        ]
-                    except ValueError:
-                        filtered_loans = []
-                elif self.filter_param == "Amount (₹)":
-                    # loan[3] is loan_amount
-                    try:
-                        filter_amount = float(filter_text.replace(',', ''))
-                        filtered_loans = [
-                            loan for loan in self.all_loans_cache 
-                            if loan[3] and abs(float(loan[3]) - filter_amount) < 0.01
-                        ]
-                    except ValueError:
-                        filtered_loans = []
-                elif self.filter_param == "Amount Due (₹)":
-                    # loan[4] is loan_amount_due
-                    try:
-                        filter_due = float(filter_text.replace(',', ''))
-                        filtered_loans = [
-                            loan for loan in self.all_loans_cache 
-                            if loan[4] and abs(float(loan[4]) - filter_due) < 0.01
-                        ]
-                    except ValueError:
-                        filtered_loans = []
-                else:
-                    filtered_loans = self.all_loans_cache
-            else:
-                filtered_loans = self.all_loans_cache
-            
-            # Update total count for pagination
-            self.total_loans = len(filtered_loans)
-            
-            # Get the page slice
-            start_idx = (self.current_page - 1) * self.rows_per_page
-            end_idx = start_idx + self.rows_per_page
-            loans_to_display = filtered_loans[start_idx:end_idx]
+        # Search and filter predicates are applied in SQL
+        period = dict(year=self.selected_year, start_date=self.start_date, end_date=self.end_date)
+        filters = self.get_active_loan_filters()
+        
+        # Seek from the row next to the previously shown page; page 1 always starts at the newest loan
+        anchor_kwargs = {}
+        if page > 1 and anchor:
+            direction, key = anchor
+            anchor_kwargs[direction] = key
+        limit = self.rows_per_page
+        
+        def fetch_page():
+            # Total for the pagination label, then only the current page's data
+            total_loans = DatabaseManager.get_total_loans_count(filters=filters, **period)
+            loans = DatabaseManager.fetch_loans_page(limit=limit, filters=filters, **period, **anchor_kwargs)
+            return total_loans, loans, page, anchor
+        
+        self.db_worker.submit("loans", fetch_page, on_result=self.display_all_loans)
+
+    def display_all_loans(self, result):
+        """Fill the loan table with the page of loans fetched by show_all_loans."""
+        self.total_loans, loans_to_display, self.current_page, self.page_anchor = result
+        self.loan_details_table.clear()
+        
+        # Remember the page edges for next/previous navigation
+        if loans_to_display:
+            self.page_first_key = (loans_to_display[0][0], loans_to_display[0][7])
+            self.page_last_key = (loans_to_display[-1][0], loans_to_display[-1][7])
         else:
-            # No search filter - use database pagination for better performance
-            self.total_loans = DatabaseManager.get_total_loans_count(
-                year=self.selected_year,
-                start_date=self.start_date,
-                end_date=self.end_date
-            )
-            
-            # Calculate offset for pagination
-            offset = (self.current_page - 1) * self.rows_per_page
-            
-            # Fetch only the current page's data from database
-            loans_to_display = DatabaseManager.fetch_loans_by_year(
-                year=self.selected_year, 
-                limit=self.rows_per_page, 
-                offset=offset,
-                start_date=self.start_date,
-                end_date=self.end_date
-            )
-            
-            # Clear cache when not searching
-            self.all_loans_cache = []
+            self.page_first_key = self.page_last_key = None
         
         # Update pagination controls
         self.update_pagination_controls()
         
-        if not loans_to_display:
-            return
-        
-        # Display the loans for the current page
-        for row_idx, loan in enumerate(loans_to_display):
-            self.loan_details_table.insertRow(row_idx)
-            
-            # Format the loan data for display
-            # loan structure: (loan_date, asset_descriptions, total_asset_weight, loan_amount, 
-            #                  loan_amount_due, total_interest_amount, registered_reference_id, 
-            #                  loan_id, customer_id, customer_name)
-            customer_name = loan[9]
-            loan_date = datetime.strptime((loan[0]).replace('00:00:00', '').replace(' ', ''), "%Y-%m-%d").strftime("%d-%m-%Y")
-            registered_reference_id = loan[6]
-            asset_descriptions = loan[1]
-            total_weight = f"{format_indian_currency(float(loan[2]))}" if loan[2] else "0.00"
-            loan_amount = f"{format_indian_currency(float(loan[3]))}" if loan[3] else "0.00"
-            amount_due = f"{format_indian_currency(float(loan[4]))}" if loan[4] else "0.00"
-            
-            # Set values in the table
-            self.loan_details_table.setItem(row_idx, 0, QTableWidgetItem(customer_name))
-            self.loan_details_table.setItem(row_idx, 1, QTableWidgetItem(loan_date))
-            self.loan_details_table.setItem(row_idx, 2, QTableWidgetItem(registered_reference_id))
-            self.loan_details_table.setItem(row_idx, 3, QTableWidgetItem(asset_descriptions))
-            self.loan_details_table.setItem(row_idx, 4, QTableWidgetItem(total_weight))
-            self.loan_details_table.setItem(row_idx, 5, QTableWidgetItem(loan_amount))
-            self.loan_details_table.setItem(row_idx, 6, QTableWidgetItem(amount_due))
-            
-            view_button = QPushButton("View More")
-            view_button.clicked.connect(lambda checked, lid=loan[7]: self.show_loan_details(lid))
-            self.loan_details_table.setCellWidget(row_idx, 7, view_button)
+        # Display the loans for the current page; cells are formatted by the model as they are painted
+        self.loan_details_table.set_loans(loans_to_display)
+
+    def get_active_loan_filters(self):
+        """Translate the customer search box or the selected filter parameter into LoanQuery filters."""
+        search_text = self.customer_search.text()
+        if search_text:
+            return {"customer_name": search_text}
+        if self.filter_value and self.filter_param in LOAN_FILTER_FIELDS:
+            return {LOAN_FILTER_FIELDS[self.filter_param]: self.filter_value}
+        return {}
 
     def generate_pdf_report(self):
         """Generate a comprehensive PDF report based on current filters."""
         
-        # Helper function to sanitize text - use ASCII only
-        def sanitize_text(text):
-            if text is None:
-                return "N/A"
-            try:
-                text = str(text)
-                return ''.join(char for char in text if ord(char) < 128)
-            except:
-                return "Text contains unsupported characters"
-        
         # Validate selection for individual report
         if self.report_type_group.currentText() == "Individual":
             # Check if using customer filter
@@ -1221,261 +1204,62 @@ class GenerateReport(StyledWidget):
                 QMessageBox.warning(self, "Invalid Selection", f"Please enter a value for {self.filter_param} filter.")
                 return
         
-        try:
-            pdf = FPDF()
-            pdf.add_page()
-            
-            # Determine report type and generate accordingly
-            if self.report_type_group.currentText() == "Individual":
-                # Individual filtered report
-                if self.filter_param == "Customer" and self.selected_customer_id:
-                    self.generate_customer_pdf_report(pdf, sanitize_text)
-                else:
-                    # Generate filtered report for other parameters
-                    self.generate_filtered_pdf_report(pdf, sanitize_text)
+        # Determine report type and generate accordingly
+        if self.report_type_group.currentText() == "Individual":
+            # Individual filtered report
+            if self.filter_param == "Customer" and self.selected_customer_id:
+                report = self.build_customer_pdf_report()
             else:
-                # All loans table report
-                self.generate_all_loans_pdf_report(pdf, sanitize_text)
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to generate report: {str(e)}")
-    
-    def generate_all_loans_pdf_report(self, pdf, sanitize_text):
-        """Generate PDF report with table of all loans (Scenarios 1 & 2)."""
-        
-        # Fetch all loans based on current filters (no pagination for PDF)
-        all_loans = DatabaseManager.fetch_loans_by_year(
-            year=self.selected_year,
-            start_date=self.start_date,
-            end_date=self.end_date
-        )
-        
-        if not all_loans:
-            QMessageBox.warning(self, "No Data", "No loans found for the selected filters.")
-            return
-        
-        # Title based on filters
-        pdf.set_font('Arial', 'B', 18)
-        pdf.cell(0, 12, "LOAN REPORT", 0, 1, 'C')
-        pdf.ln(5)
+                # Generate filtered report for other parameters
+                report = self.build_filtered_pdf_report()
+        else:
+            # All loans table report
+            report = self.build_all_loans_pdf_report()
         
-        # Filter information
-        pdf.set_font('Arial', 'B', 12)
+        if report:
+            self.start_pdf_report(report)
+    
+    def get_report_period_line(self):
+        """Describe the selected year or date range for the report header."""
         if self.period_type_group.currentText() == "Yearly":
             if self.selected_year:
-                pdf.cell(0, 8, f"Year: {self.selected_year}", 0, 1, 'C')
-            else:
-                pdf.cell(0, 8, "All Years", 0, 1, 'C')
-        else:
-            # Show date range
-            start_display = datetime.strptime(self.start_date, "%Y-%m-%d").strftime("%d-%m-%Y")
-            end_display = datetime.strptime(self.end_date, "%Y-%m-%d").strftime("%d-%m-%Y")
-            pdf.cell(0, 8, f"Date Range: {start_display} to {end_display}", 0, 1, 'C')
-        
-        pdf.ln(3)
-        pdf.set_font('Arial', 'I', 10)
-        pdf.cell(0, 6, f"Generated on: {datetime.now().strftime('%d-%m-%Y %H:%M')}", 0, 1, 'C')
-        pdf.ln(8)
-        
-        # Summary statistics
-        total_loan_amount = sum(float(loan[3]) if loan[3] else 0 for loan in all_loans)
-        total_due_amount = sum(float(loan[4]) if loan[4] else 0 for loan in all_loans)
-        
-        pdf.set_font('Arial', 'B', 11)
-        pdf.cell(0, 7, f"Total Loans: {len(all_loans)}", 0, 1)
-        pdf.cell(0, 7, f"Total Loan Amount: Rs {format_indian_currency(total_loan_amount)}", 0, 1)
-        pdf.cell(0, 7, f"Total Amount Due: Rs {format_indian_currency(total_due_amount)}", 0, 1)
-        pdf.ln(8)
-        
-        # Table header
-        pdf.set_font('Arial', 'B', 9)
-        pdf.set_fill_color(70, 130, 180)  # Steel blue
-        pdf.set_text_color(255, 255, 255)  # White text
-        
-        # Column widths
-        col_widths = [22, 45, 28, 35, 20, 22, 18]
-        headers = ['Date', 'Customer', 'Ref ID', 'Assets', 'Weight(g)', 'Amount', 'Due']
-        
-        for i, header in enumerate(headers):
-            pdf.cell(col_widths[i], 8, header, 1, 0, 'C', True)
-        pdf.ln()
-        
-        # Table data
-        pdf.set_font('Arial', '', 8)
-        pdf.set_text_color(0, 0, 0)  # Black text
-        
-        fill = False
-        for loan in all_loans:
-            # loan structure: (loan_date, asset_descriptions, total_asset_weight, loan_amount, 
-            #                  loan_amount_due, total_interest_amount, registered_reference_id, 
-            #                  loan_id, customer_id, customer_name)
-            
-            try:
-                loan_date = datetime.strptime(str(loan[0]).replace('00:00:00', '').strip(), "%Y-%m-%d").strftime("%d-%m-%Y")
-            except:
-                loan_date = str(loan[0])[:10]
-            
-            customer_name = sanitize_text(loan[9])[:25]  # Truncate if too long
-            ref_id = sanitize_text(str(loan[6]) if loan[6] else "")[:15]
-            assets = sanitize_text(str(loan[1]) if loan[1] else "")[:20]
-            weight = f"{float(loan[2]):.2f}" if loan[2] else "0"
-            amount = format_indian_currency(float(loan[3]) if loan[3] else 0)
-            due = format_indian_currency(float(loan[4]) if loan[4] else 0)
-            
-            # Alternate row colors
-            if fill:
-                pdf.set_fill_color(240, 240, 240)
-            else:
-                pdf.set_fill_color(255, 255, 255)
-            
-            pdf.cell(col_widths[0], 7, loan_date, 1, 0, 'C', True)
-            pdf.cell(col_widths[1], 7, customer_name, 1, 0, 'L', True)
-            pdf.cell(col_widths[2], 7, ref_id, 1, 0, 'L', True)
-            pdf.cell(col_widths[3], 7, assets, 1, 0, 'L', True)
-            pdf.cell(col_widths[4], 7, weight, 1, 0, 'R', True)
-            pdf.cell(col_widths[5], 7, amount, 1, 0, 'R', True)
-            pdf.cell(col_widths[6], 7, due, 1, 0, 'R', True)
-            pdf.ln()
-            
-            fill = not fill
-            
-            # Add new page if needed
-            if pdf.get_y() > 270:
-                pdf.add_page()
-                # Repeat header
-                pdf.set_font('Arial', 'B', 9)
-                pdf.set_fill_color(70, 130, 180)
-                pdf.set_text_color(255, 255, 255)
-                for i, header in enumerate(headers):
-                    pdf.cell(col_widths[i], 8, header, 1, 0, 'C', True)
-                pdf.ln()
-                pdf.set_font('Arial', '', 8)
-                pdf.set_text_color(0, 0, 0)
-        
+                return f"Year: {self.selected_year}"
+            return "All Years"
+        start_display = datetime.strptime(self.start_date, "%Y-%m-%d").strftime("%d-%m-%Y")
+        end_display = datetime.strptime(self.end_date, "%Y-%m-%d").strftime("%d-%m-%Y")
+        return f"Date Range: {start_display} to {end_display}"
+    
+    def build_all_loans_pdf_report(self):
+        """Describe the PDF report with table of all loans (Scenarios 1 & 2)."""
         # Generate filename
         if self.selected_year:
             filename = f"loan_report_{self.selected_year}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
         else:
             filename = f"loan_report_{self.start_date}_to_{self.end_date}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        try:
-            pdf.output(filename)
-            QMessageBox.information(self, "Success", f"Report generated: {filename}")
-        except Exception as output_error:
-            safe_filename = f"loan_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            pdf.output(safe_filename)
-            QMessageBox.information(self, "Success", f"Report generated: {safe_filename}")
+        return {
+            "title": "LOAN REPORT",
+            "header_lines": [self.get_report_period_line()],
+            "count_label": "Total Loans",
+            "columns": [
+                ("Date", 22, 'C', "date", None),
+                ("Customer", 45, 'L', "customer", 25),
+                ("Ref ID", 28, 'L', "ref_id", 15),
+                ("Assets", 35, 'L', "assets", 20),
+                ("Weight(g)", 20, 'R', "weight", None),
+                ("Amount", 22, 'R', "amount", None),
+                ("Due", 18, 'R', "due", None),
+            ],
+            # All loans based on current filters (no pagination for PDF)
+            "query": dict(year=self.selected_year, start_date=self.start_date, end_date=self.end_date),
+            "filename": filename,
+            "fallback_filename": f"loan_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+            "empty_message": "No loans found for the selected filters.",
+        }
     
-    def generate_customer_pdf_report(self, pdf, sanitize_text):
-        """Generate PDF report for individual customer (Scenario 3) with tabular format."""
-        
-        customer_info = DatabaseManager.get_customer_by_id(self.selected_customer_id)
-        loans = DatabaseManager.fetch_loans_for_customer_to_generate_report(
-            self.selected_customer_id, self.selected_year
-        )
-        
-        if not loans:
-            QMessageBox.warning(self, "No Data", "No loans found for this customer.")
-            return
-        
-        # Title with customer name
-        pdf.set_font('Arial', 'B', 18)
-        pdf.cell(0, 12, f"LOAN REPORT - {sanitize_text(customer_info.get('name', 'N/A'))}", 0, 1, 'C')
-        pdf.ln(5)
-        
-        # Filter information
-        pdf.set_font('Arial', 'B', 12)
-        if self.period_type_group.currentText() == "Yearly":
-            if self.selected_year:
-                pdf.cell(0, 8, f"Year: {self.selected_year}", 0, 1, 'C')
-            else:
-                pdf.cell(0, 8, "All Years", 0, 1, 'C')
-        else:
-            start_display = datetime.strptime(self.start_date, "%Y-%m-%d").strftime("%d-%m-%Y")
-            end_display = datetime.strptime(self.end_date, "%Y-%m-%d").strftime("%d-%m-%Y")
-            pdf.cell(0, 8, f"Date Range: {start_display} to {end_display}", 0, 1, 'C')
-        
-        pdf.ln(3)
-        pdf.set_font('Arial', 'I', 10)
-        pdf.cell(0, 6, f"Generated on: {datetime.now().strftime('%d-%m-%Y %H:%M')}", 0, 1, 'C')
-        pdf.ln(8)
-        
-        # Customer Information
-        pdf.set_font('Arial', 'B', 12)
-        pdf.cell(0, 7, "Customer Information", 0, 1)
-        pdf.set_font('Arial', '', 11)
-        pdf.cell(0, 7, f"Phone: {sanitize_text(customer_info.get('phone', 'N/A'))}", 0, 1)
-        pdf.cell(0, 7, f"Address: {sanitize_text(customer_info.get('address', 'N/A'))}", 0, 1)
-        pdf.ln(8)
-        
-        # Summary statistics
-        total_loan_amount = sum(float(loan[3]) if loan[3] else 0 for loan in loans)
-        total_due_amount = sum(float(loan[4]) if loan[4] else 0 for loan in loans)
-        
-        pdf.set_font('Arial', 'B', 11)
-        pdf.cell(0, 7, f"Total Loans: {len(loans)}", 0, 1)
-        pdf.cell(0, 7, f"Total Loan Amount: Rs {format_indian_currency(total_loan_amount)}", 0, 1)
-        pdf.cell(0, 7, f"Total Amount Due: Rs {format_indian_currency(total_due_amount)}", 0, 1)
-        pdf.ln(8)
-        
-        # Table header
-        pdf.set_font('Arial', 'B', 9)
-        pdf.set_fill_color(70, 130, 180)  # Steel blue
-        pdf.set_text_color(255, 255, 255)  # White text
-        
-        # Column widths (without customer column)
-        col_widths = [25, 35, 45, 25, 25, 25]
-        headers = ['Date', 'Ref ID', 'Assets', 'Weight(g)', 'Amount', 'Due']
-        
-        for i, header in enumerate(headers):
-            pdf.cell(col_widths[i], 8, header, 1, 0, 'C', True)
-        pdf.ln()
-        
-        # Table data
-        pdf.set_font('Arial', '', 8)
-        pdf.set_text_color(0, 0, 0)  # Black text
-        
-        fill = False
-        for loan in loans:
-            try:
-                loan_date = datetime.strptime(str(loan[0]).replace('00:00:00', '').strip(), "%Y-%m-%d").strftime("%d-%m-%Y")
-            except:
-                loan_date = str(loan[0])[:10]
-            
-            ref_id = sanitize_text(str(loan[6]) if loan[6] else "")[:15]
-            assets = sanitize_text(str(loan[1]) if loan[1] else "")[:20]
-            weight = f"{float(loan[2]):.2f}" if loan[2] else "0"
-            amount = format_indian_currency(float(loan[3]) if loan[3] else 0)
-            due = format_indian_currency(float(loan[4]) if loan[4] else 0)
-            
-            # Alternate row colors
-            if fill:
-                pdf.set_fill_color(240, 240, 240)
-            else:
-                pdf.set_fill_color(255, 255, 255)
-            
-            pdf.cell(col_widths[0], 7, loan_date, 1, 0, 'C', True)
-            pdf.cell(col_widths[1], 7, ref_id, 1, 0, 'L', True)
-            pdf.cell(col_widths[2], 7, assets, 1, 0, 'L', True)
-            pdf.cell(col_widths[3], 7, weight, 1, 0, 'R', True)
-            pdf.cell(col_widths[4], 7, amount, 1, 0, 'R', True)
-            pdf.cell(col_widths[5], 7, due, 1, 0, 'R', True)
-            pdf.ln()
-            
-            fill = not fill
-            
-            # Add new page if needed
-            if pdf.get_y() > 270:
-                pdf.add_page()
-                # Repeat header
-                pdf.set_font('Arial', 'B', 9)
-                pdf.set_fill_color(70, 130, 180)
-                pdf.set_text_color(255, 255, 255)
-                for i, header in enumerate(headers):
-                    pdf.cell(col_widths[i], 8, header, 1, 0, 'C', True)
-                pdf.ln()
-                pdf.set_font('Arial', '', 8)
-                pdf.set_text_color(0, 0, 0)
+    def build_customer_pdf_report(self):
+        """Describe the PDF report for individual customer (Scenario 3) with tabular format."""
+        customer_info = DatabaseManager.get_customer_by_id(self.selected_customer_id) or {}
         
         # Generate filename
         safe_name = ''.join(char for char in str(customer_info.get('name', 'unknown')) if char.isalnum() or char in ' _-')
@@ -1487,165 +1271,116 @@ class GenerateReport(StyledWidget):
         else:
             filename = f"customer_{safe_name}_{datetime.now().strftime('%Y%m%d')}.pdf"
         
-        try:
-            pdf.output(filename)
-            QMessageBox.information(self, "Success", f"Report generated: {filename}")
-        except Exception as output_error:
-            safe_filename = f"customer_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            pdf.output(safe_filename)
-            QMessageBox.information(self, "Success", f"Report generated: {safe_filename}")
+        return {
+            "title": f"LOAN REPORT - {sanitize_text(customer_info.get('name', 'N/A'))}",
+            "header_lines": [self.get_report_period_line()],
+            "info_lines": [
+                f"Phone: {sanitize_text(customer_info.get('phone', 'N/A'))}",
+                f"Address: {sanitize_text(customer_info.get('address', 'N/A'))}",
+            ],
+            "count_label": "Total Loans",
+            # Column widths (without customer column)
+            "columns": [
+                ("Date", 25, 'C', "date", None),
+                ("Ref ID", 35, 'L', "ref_id", 15),
+                ("Assets", 45, 'L', "assets", 20),
+                ("Weight(g)", 25, 'R', "weight", None),
+                ("Amount", 25, 'R', "amount", None),
+                ("Due", 25, 'R', "due", None),
+            ],
+            "query": dict(year=self.selected_year, customer_id=self.selected_customer_id),
+            "filename": filename,
+            "fallback_filename": f"customer_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+            "empty_message": "No loans found for this customer.",
+        }
     
-    def generate_filtered_pdf_report(self, pdf, sanitize_text):
-        """Generate PDF report for filtered loans based on selected parameter."""
-        
-        # Fetch all loans and apply filter
-        all_loans = DatabaseManager.fetch_loans_by_year(
-            year=self.selected_year,
-            start_date=self.start_date,
-            end_date=self.end_date
-        )
-        
-        if not all_loans:
-            QMessageBox.warning(self, "No Data", "No loans found.")
-            return
+    def build_filtered_pdf_report(self):
+        """Describe the PDF report for filtered loans based on selected parameter."""
         
-        # Apply filter based on parameter
-        filter_text = self.filter_value.lower()
-        filtered_loans = []
-        
-        if self.filter_param == "Reference ID":
-            filtered_loans = [loan for loan in all_loans if loan[6] and filter_text in str(loan[6]).lower()]
-        elif self.filter_param == "Asset Description":
-            filtered_loans = [loan for loan in all_loans if loan[1] and filter_text in str(loan[1]).lower()]
-        elif self.filter_param == "Weight (g)":
+        # Numeric filters must parse before we query
+        if self.filter_param in ("Weight (g)", "Amount (₹)", "Amount Due (₹)"):
             try:
-                filter_weight = float(filter_text.replace(',', ''))
-                filtered_loans = [loan for loan in all_loans if loan[2] and abs(float(loan[2]) - filter_weight) < 0.01]
+                float(self.filter_value.replace(',', ''))
             except ValueError:
-                QMessageBox.warning(self, "Invalid Filter", "Please enter a valid number for weight.")
-                return
-        elif self.filter_param == "Amount (₹)":
-            try:
-                filter_amount = float(filter_text.replace(',', ''))
-                filtered_loans = [loan for loan in all_loans if loan[3] and abs(float(loan[3]) - filter_amount) < 0.01]
-            except ValueError:
-                QMessageBox.warning(self, "Invalid Filter", "Please enter a valid number for amount.")
-                return
-        elif self.filter_param == "Amount Due (₹)":
-            try:
-                filter_due = float(filter_text.replace(',', ''))
-                filtered_loans = [loan for loan in all_loans if loan[4] and abs(float(loan[4]) - filter_due) < 0.01]
-            except ValueError:
-                QMessageBox.warning(self, "Invalid Filter", "Please enter a valid number for amount due.")
-                return
-        
-        if not filtered_loans:
-            QMessageBox.warning(self, "No Data", f"No loans found matching {self.filter_param}: {self.filter_value}")
-            return
-        
-        # Title
-        pdf.set_font('Arial', 'B', 18)
-        pdf.cell(0, 12, "FILTERED LOAN REPORT", 0, 1, 'C')
-        pdf.ln(5)
-        
-        # Filter information
-        pdf.set_font('Arial', 'B', 12)
-        pdf.cell(0, 8, f"Filter: {self.filter_param} = {self.filter_value}", 0, 1, 'C')
-        
-        if self.period_type_group.currentText() == "Yearly":
-            if self.selected_year:
-                pdf.cell(0, 8, f"Year: {self.selected_year}", 0, 1, 'C')
-            else:
-                pdf.cell(0, 8, "All Years", 0, 1, 'C')
-        else:
-            start_display = datetime.strptime(self.start_date, "%Y-%m-%d").strftime("%d-%m-%Y")
-            end_display = datetime.strptime(self.end_date, "%Y-%m-%d").strftime("%d-%m-%Y")
-            pdf.cell(0, 8, f"Date Range: {start_display} to {end_display}", 0, 1, 'C')
-        
-        pdf.ln(3)
-        pdf.set_font('Arial', 'I', 10)
-        pdf.cell(0, 6, f"Generated on: {datetime.now().strftime('%d-%m-%Y %H:%M')}", 0, 1, 'C')
-        pdf.ln(8)
-        
-        # Summary statistics
-        total_loan_amount = sum(float(loan[3]) if loan[3] else 0 for loan in filtered_loans)
-        total_due_amount = sum(float(loan[4]) if loan[4] else 0 for loan in filtered_loans)
-        
-        pdf.set_font('Arial', 'B', 11)
-        pdf.cell(0, 7, f"Total Loans Found: {len(filtered_loans)}", 0, 1)
-        pdf.cell(0, 7, f"Total Loan Amount: Rs {format_indian_currency(total_loan_amount)}", 0, 1)
-        pdf.cell(0, 7, f"Total Amount Due: Rs {format_indian_currency(total_due_amount)}", 0, 1)
-        pdf.ln(8)
-        
-        # Table header
-        headers = ["Customer", "Date", "Ref ID", "Assets", "Weight", "Amount", "Due"]
-        col_widths = [30, 25, 25, 35, 20, 25, 25]
-        
-        pdf.set_font('Arial', 'B', 9)
-        pdf.set_fill_color(70, 130, 180)
-        pdf.set_text_color(255, 255, 255)
-        
-        for i, header in enumerate(headers):
-            pdf.cell(col_widths[i], 8, header, 1, 0, 'C', True)
-        pdf.ln()
-        
-        # Table rows
-        pdf.set_font('Arial', '', 8)
-        pdf.set_text_color(0, 0, 0)
-        fill = False
-        
-        for loan in filtered_loans:
-            try:
-                loan_date = datetime.strptime(str(loan[0]).replace('00:00:00', '').strip(), "%Y-%m-%d").strftime("%d-%m-%Y")
-            except:
-                loan_date = str(loan[0])[:10]
-            
-            customer_name = sanitize_text(str(loan[9]) if loan[9] else "")[:15]
-            ref_id = sanitize_text(str(loan[6]) if loan[6] else "")[:12]
-            assets = sanitize_text(str(loan[1]) if loan[1] else "")[:20]
-            weight = f"{float(loan[2]):.2f}" if loan[2] else "0"
-            amount = format_indian_currency(float(loan[3]) if loan[3] else 0)
-            due = format_indian_currency(float(loan[4]) if loan[4] else 0)
-            
-            # Alternate row colors
-            if fill:
-                pdf.set_fill_color(240, 240, 240)
-            else:
-                pdf.set_fill_color(255, 255, 255)
-            
-            pdf.cell(col_widths[0], 7, customer_name, 1, 0, 'L', True)
-            pdf.cell(col_widths[1], 7, loan_date, 1, 0, 'C', True)
-            pdf.cell(col_widths[2], 7, ref_id, 1, 0, 'L', True)
-            pdf.cell(col_widths[3], 7, assets, 1, 0, 'L', True)
-            pdf.cell(col_widths[4], 7, weight, 1, 0, 'R', True)
-            pdf.cell(col_widths[5], 7, amount, 1, 0, 'R', True)
-            pdf.cell(col_widths[6], 7, due, 1, 0, 'R', True)
-            pdf.ln()
-            
-            fill = not fill
-            
-            # Add new page if needed
-            if pdf.get_y() > 270:
-                pdf.add_page()
-                # Repeat header
-                pdf.set_font('Arial', 'B', 9)
-                pdf.set_fill_color(70, 130, 180)
-                pdf.set_text_color(255, 255, 255)
-                for i, header in enumerate(headers):
-                    pdf.cell(col_widths[i], 8, header, 1, 0, 'C', True)
-                pdf.ln()
-                pdf.set_font('Arial', '', 8)
-                pdf.set_text_color(0, 0, 0)
+                label = self.filter_param.split(' (')[0].lower()
+                QMessageBox.warning(self, "Invalid Filter", f"Please enter a valid number for {label}.")
+                return None
         
         # Generate filename
         filter_param_safe = self.filter_param.replace(' ', '_').replace('(', '').replace(')', '')
         filter_value_safe = ''.join(char for char in str(self.filter_value) if char.isalnum() or char in '_-')
         filename = f"filtered_{filter_param_safe}_{filter_value_safe}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        try:
-            pdf.output(filename)
-            QMessageBox.information(self, "Success", f"Report generated: {filename}")
-        except Exception as output_error:
-            safe_filename = f"filtered_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-            pdf.output(safe_filename)
-            QMessageBox.information(self, "Success", f"Report generated: {safe_filename}")
+        return {
+            "title": "FILTERED LOAN REPORT",
+            "header_lines": [
+                f"Filter: {self.filter_param} = {self.filter_value}",
+                self.get_report_period_line(),
+            ],
+            "count_label": "Total Loans Found",
+            "columns": [
+                ("Customer", 30, 'L', "customer", 15),
+                ("Date", 25, 'C', "date", None),
+                ("Ref ID", 25, 'L', "ref_id", 12),
+                ("Assets", 35, 'L', "assets", 20),
+                ("Weight", 20, 'R', "weight", None),
+                ("Amount", 25, 'R', "amount", None),
+                ("Due", 25, 'R', "due", None),
+            ],
+            # Only the matching loans
+            "query": dict(
+                year=self.selected_year,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                filters={LOAN_FILTER_FIELDS[self.filter_param]: self.filter_value}
+            ),
+            "filename": filename,
+            "fallback_filename": f"filtered_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+            "empty_message": f"No loans found matching {self.filter_param}: {self.filter_value}",
+        }
+    
+    def start_pdf_report(self, report):
+        """Write the report in the background behind a cancellable progress dialog."""
+        self.pdf_report = report
+        self.pdf_task = PdfReportTask(report)
+        
+        self.pdf_progress_dialog = QProgressDialog("Preparing report...", "Cancel", 0, 0, self)
+        self.pdf_progress_dialog.setWindowTitle("Generating Report")
+        self.pdf_progress_dialog.setWindowModality(Qt.WindowModal)
+        self.pdf_progress_dialog.setMinimumDuration(0)
+        self.pdf_progress_dialog.setAutoClose(False)
+        self.pdf_progress_dialog.setAutoReset(False)
+        self.pdf_progress_dialog.canceled.connect(self.pdf_task.cancel)
+        
+        self.pdf_task.signals.progress.connect(self.on_pdf_report_progress)
+        self.pdf_task.signals.finished.connect(self.on_pdf_report_finished)
+        self.pdf_task.signals.empty.connect(self.on_pdf_report_empty)
+        self.pdf_task.signals.cancelled.connect(self.end_pdf_report)
+        self.pdf_task.signals.failed.connect(self.on_pdf_report_failed)
+        
+        self.generate_pdf_button.setEnabled(False)
+        self.pdf_progress_dialog.show()
+        get_thread_pool().start(self.pdf_task)
+    
+    def on_pdf_report_progress(self, rows_written, total_rows):
+        self.pdf_progress_dialog.setMaximum(total_rows)
+        self.pdf_progress_dialog.setValue(rows_written)
+        self.pdf_progress_dialog.setLabelText(f"Writing loan {rows_written} of {total_rows}...")
+    
+    def end_pdf_report(self):
+        """Close the progress dialog and release the finished report task."""
+        self.pdf_progress_dialog.close()
+        self.pdf_task = None
+        self.generate_pdf_button.setEnabled(True)
+    
+    def on_pdf_report_finished(self, filename):
+        self.end_pdf_report()
+        QMessageBox.information(self, "Success", f"Report generated: {filename}")
+    
+    def on_pdf_report_empty(self):
+        self.end_pdf_report()
+        QMessageBox.warning(self, "No Data", self.pdf_report["empty_message"])
+    
+    def on_pdf_report_failed(self, message):
+        self.end_pdf_report()
+        QMessageBox.critical(self, "Error", f"Failed to generate report: {message}")
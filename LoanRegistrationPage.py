@@ -1,13 +1,20 @@
 from PyQt5.QtCore import QEvent, Qt
-from helper import StyledWidget, format_indian_currency
+from helper import StyledWidget
 from DatabaseManager import DatabaseManager
+from DatabaseWorker import DatabaseWorker, show_busy_cursor
+from LoanTableModel import LoanTableView, ButtonColumn
+from CustomerSearch import CustomerSearch
+from searchIndex import index_loans, filter_indexed_loans
+from CustomerCache import get_customer_cache, insert_customer_item, update_customer_item
 from PyQt5.QtWidgets import (QPushButton, QLineEdit, QFormLayout, QMessageBox, 
                            QLabel, QHBoxLayout, QComboBox, QGroupBox, QVBoxLayout,
-                           QScrollArea, QWidget, QTableWidget, QTableWidgetItem, QHeaderView)
+                           QScrollArea, QWidget, QHeaderView,
+                           QFileDialog, QProgressDialog, QApplication)
 from PyQt5.QtWidgets import QDateEdit
 from PyQt5.QtCore import QDate
 from PyQt5.QtWidgets import QDateEdit, QSizePolicy
 from referenceIdManager import generate_next_reference_id, is_valid_new_pattern
+from csvImporter import LEDGER_CSV_HEADER, RejectedRowsWriter, ledger_fields, ledger_rows, read_csv_rows
 
 class LoanRegistrationPage(StyledWidget):
     def __init__(self, parent, switch_page_callback):
@@ -16,8 +23,14 @@ class LoanRegistrationPage(StyledWidget):
         self.customer_info_group = None
         self.asset_entries = []
         self.edit_loan_group = None  # Add this to track the edit loan group
-        self.all_loans = []  # To store all loans for filtering
+        self.all_loans = []  # (search text, loan) pairs for filtering
+        self.db_worker = DatabaseWorker(self)
+        self.db_worker.busy_changed.connect(show_busy_cursor)
+        self.customer_cache = get_customer_cache()
+        self.customer_dropdown_loaded = False
         self.init_ui()
+        self.customer_cache.customers_added.connect(self.on_customers_added)
+        self.customer_cache.customer_changed.connect(self.on_customer_changed)
 
     def init_ui(self):
         # Create a customer selection layout with search functionality
@@ -34,8 +47,18 @@ class LoanRegistrationPage(StyledWidget):
             }
         """)
         self.search_box.setFixedWidth(300)
-        self.search_box.textChanged.connect(self.filter_customers)
-        customer_layout.addWidget(self.search_box, alignment=Qt.AlignRight)
+        self.customer_lookup = CustomerSearch(self.search_box, self)
+        self.customer_lookup.matches_found.connect(self.filter_customers)
+
+        # Bulk import of old ledgers (loans, assets and repayments)
+        search_row = QHBoxLayout()
+        self.import_loans_btn = QPushButton("Import Loans CSV")
+        self.import_loans_btn.setToolTip("Columns: " + ", ".join(LEDGER_CSV_HEADER))
+        self.import_loans_btn.clicked.connect(self.import_loans_csv)
+        search_row.addWidget(self.import_loans_btn)
+        search_row.addStretch()
+        search_row.addWidget(self.search_box)
+        customer_layout.addLayout(search_row)
         
         # Customer dropdown in a horizontal layout
         dropdown_layout = QHBoxLayout()
@@ -159,29 +182,28 @@ class LoanRegistrationPage(StyledWidget):
         filter_layout.addStretch()
         loans_layout.addLayout(filter_layout)
         
-        self.loans_table = QTableWidget()
-        self.loans_table.setColumnCount(10)  # Increased to 10 for Registered Reference Id and Delete Loan columns
-        self.loans_table.setHorizontalHeaderLabels([
-            "Loan Date", 
-            "Registered Reference Id",  # New column
-            "Assets",
-            "Total Weight (g)", 
-            "Loan Amount (₹)", 
-            "Amount Due (₹)",
-            "Interest Paid (₹)",
-            "Status", 
-            "Edit Loan",
-            "Delete Loan"  # New column
+        self.loans_table = LoanTableView([
+            ("Loan Date", "date"),
+            ("Registered Reference Id", "reference"),
+            ("Assets", "assets"),
+            ("Total Weight (g)", "weight"),
+            ("Loan Amount (₹)", "amount"),
+            ("Amount Due (₹)", "due"),
+            ("Interest Paid (₹)", "interest"),
+            ("Status", "status"),
+            ("Edit Loan", ButtonColumn("Edit Loan", lambda loan: self.open_edit_loan(loan[7]), color="#2196F3")),
+            # Only completed loans (nothing left to pay) can be deleted
+            ("Delete Loan", ButtonColumn(
+                "Delete Loan", lambda loan: self.delete_loan(loan[7]), color="#F44336",
+                is_enabled=lambda loan: float(loan[4] or 0) <= 0
+            ))
         ])
         
-        self.loans_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.loans_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.loans_table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.loans_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)  # Assets column
         self.loans_table.setColumnWidth(1, 180)
         self.loans_table.setAlternatingRowColors(True)
         self.loans_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 alternate-background-color: #f5f5f5;
             }
@@ -277,29 +299,106 @@ class LoanRegistrationPage(StyledWidget):
         for entry in self.asset_entries[:]:
             self.remove_asset_entry(entry)
 
+    def import_loans_csv(self):
+        """Import historic loans, assets and repayments from a ledger CSV."""
+        file_name, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Ledger CSV File",
+            "",
+            "CSV Files (*.csv);;All Files (*)"
+        )
+
+        if not file_name:
+            return
+
+        progress = QProgressDialog("Importing loans...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Import Loans")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+
+        try:
+            with RejectedRowsWriter(file_name, LEDGER_CSV_HEADER) as rejects:
+                def on_progress(rows_processed):
+                    progress.setLabelText(
+                        f"Importing loans... {rows_processed} rows processed, {rejects.count} rejected"
+                    )
+                    QApplication.processEvents()
+                    return not progress.wasCanceled()
+
+                result = DatabaseManager.import_ledger(
+                    ledger_rows(read_csv_rows(file_name), rejects),
+                    lambda row_number, record, message: rejects(row_number, ledger_fields(record), message),
+                    progress=on_progress
+                )
+        except Exception as e:
+            progress.close()
+            QMessageBox.critical(self, "Error", f"Error processing CSV file:\n{str(e)}")
+            return
+
+        cancelled = progress.wasCanceled()
+        progress.close()
+
+        if result is None:
+            if cancelled:
+                QMessageBox.information(self, "Import Cancelled", "Import cancelled. No loans were imported.")
+            else:
+                QMessageBox.critical(self, "Error", "Failed to import loans. No loans were imported.")
+            return
+
+        loan_count, payment_count, _ = result
+        result_message = f"Successfully imported {loan_count} loans and {payment_count} repayments.\n"
+        if rejects.count:
+            result_message += (
+                f"Skipped {rejects.count} rows.\n\n"
+                f"The skipped rows and the reason for each were saved to:\n{rejects.path}"
+            )
+            QMessageBox.warning(self, "Import Results", result_message)
+        else:
+            QMessageBox.information(self, "Success", result_message)
+
+        if loan_count or payment_count:
+            self.update_customer_info()
+            self.update_loans_table()
+
     def showEvent(self, event: QEvent):
         if event.type() == QEvent.Show:
-            self.populate_customer_dropdown()
+            if not self.customer_dropdown_loaded:
+                self.populate_customer_dropdown()
+            elif self.selected_customer_id:
+                # The dropdown is kept current by the customer cache; only the loans may be stale
+                self.update_customer_info()
+                self.update_loans_table()
         super().showEvent(event)
 
     def populate_customer_dropdown(self):
+        """Fill the dropdown from the shared customer cache (first visit only)."""
         self.customer_dropdown.clear()
         # self.customer_dropdown.addItem("Select Customer", None)  # Add default option
         
-        # Initialize customer data list
-        self.all_customers_data = []
-        
-        customers = DatabaseManager.get_all_customers()
-        if customers:
-            for customer_id, name, phone in customers:
-                self.customer_dropdown.addItem(f"{name}", customer_id)
-                
-                # Store customer data for filtering
-                self.all_customers_data.append({
-                    'id': customer_id,
-                    'name': name,
-                    'phone': phone if phone else ''
-                })
+        for customer in self.customer_cache.customers():
+            self.customer_dropdown.addItem(f"{customer['name']}", customer['id'])
+        self.customer_dropdown_loaded = True
+
+    def on_customers_added(self, customers):
+        """Add customers registered elsewhere without rebuilding the dropdown."""
+        if not self.customer_dropdown_loaded:
+            return
+        if self.customer_lookup.has_query():
+            self.customer_lookup.refresh()
+            return
+        for customer in customers:
+            insert_customer_item(self.customer_dropdown, customer, f"{customer['name']}")
+
+    def on_customer_changed(self, customer):
+        """Relabel a customer edited elsewhere."""
+        if not self.customer_dropdown_loaded:
+            return
+        if self.customer_lookup.has_query():
+            self.customer_lookup.refresh()
+            return
+        update_customer_item(self.customer_dropdown, customer, f"{customer['name']}")
+        if customer['id'] == self.selected_customer_id:
+            self.update_customer_info()
 
     def on_customer_selected(self, index):
         # Clean up existing edit section if it exists
@@ -329,13 +428,19 @@ class LoanRegistrationPage(StyledWidget):
 
     def update_loans_table(self):
         if not self.selected_customer_id:
-            self.loans_table.setRowCount(0)
+            self.db_worker.cancel("loans")
+            self.loans_table.clear()
             self.all_loans = []  # Clear stored loans
             return
             
-        loans = DatabaseManager.fetch_loans_for_customer(self.selected_customer_id)
+        self.db_worker.submit(
+            "loans", DatabaseManager.fetch_loans_for_customer, self.selected_customer_id,
+            on_result=self.display_loans_table
+        )
+
+    def display_loans_table(self, loans):
         loans = sorted(loans, key=lambda loan: loan[0], reverse=True)
-        self.all_loans = loans  # Store all loans for filtering
+        self.all_loans = index_loans(loans)  # (search text, loan) pairs for filtering
         
         # Apply filter if there is text in the filter box
         self.filter_loans()
@@ -344,145 +449,14 @@ class LoanRegistrationPage(StyledWidget):
         filter_text = self.loan_filter.text().strip().lower()
         
         if not self.all_loans:
-            self.loans_table.setRowCount(0)
+            self.loans_table.clear()
             return
             
         # Filter loans based on text in any displayed column
-        if filter_text:
-            filtered_loans = []
-            for loan in self.all_loans:
-                # Create searchable strings for each column
-                date_str = loan[0]
-                if " 00:00:00" in date_str:
-                    date_str = date_str.split(" ")[0]
-                    
-                # Format date for searching
-                try:
-                    date_parts = date_str.split('-')
-                    if len(date_parts) == 3:
-                        formatted_date = f"{date_parts[2]}-{date_parts[1]}-{date_parts[0]}"
-                    else:
-                        formatted_date = date_str
-                except:
-                    formatted_date = date_str
-                
-                ref_id = loan[6] or "N/A"
-                assets = loan[1] or "N/A"
-                total_weight = f"{loan[2]}"
-                loan_amount = f"{loan[3]}"
-                amount_due = f"{loan[4]}"
-                interest_paid = f"{loan[5]}"
-                status = "Completed" if float(loan[4]) <= 0 else "Pending"
-                
-                # Check if filter text is in any of the columns
-                searchable_values = [
-                    formatted_date.lower(),
-                    ref_id.lower(),
-                    assets.lower(),
-                    total_weight,
-                    loan_amount,
-                    amount_due,
-                    interest_paid,
-                    status.lower()
-                ]
-                
-                if any(filter_text in value for value in searchable_values):
-                    filtered_loans.append(loan)
-        else:
-            filtered_loans = self.all_loans
+        filtered_loans = filter_indexed_loans(self.all_loans, filter_text)
             
-        # Update table with filtered loans
-        self.loans_table.setRowCount(len(filtered_loans))
-        
-        for row, loan in enumerate(filtered_loans):
-            # Handle date formatting correctly
-            date_str = loan[0]
-            if " 00:00:00" in date_str:
-                # Remove time portion if it exists
-                date_str = date_str.split(" ")[0]
-                
-            # Convert YYYY-MM-DD to DD-MM-YYYY format
-            try:
-                date_parts = date_str.split('-')
-                if len(date_parts) == 3:
-                    formatted_date = f"{date_parts[2]}-{date_parts[1]}-{date_parts[0]}"
-                else:
-                    formatted_date = date_str
-            except:
-                formatted_date = date_str
-            
-            self.loans_table.setItem(row, 0, QTableWidgetItem(formatted_date))
-            self.loans_table.setItem(row, 1, QTableWidgetItem(loan[6] or "N/A"))  # Registered Reference Id
-            self.loans_table.setItem(row, 2, QTableWidgetItem(loan[1] or "N/A"))  # Assets
-            self.loans_table.setItem(row, 3, QTableWidgetItem(f"{format_indian_currency(loan[2])}"))  # Total Weight
-            self.loans_table.setItem(row, 4, QTableWidgetItem(f"{format_indian_currency(loan[3])}"))  # Loan Amount
-            self.loans_table.setItem(row, 5, QTableWidgetItem(f"{format_indian_currency(loan[4])}"))  # Amount Due
-            self.loans_table.setItem(row, 6, QTableWidgetItem(f"{format_indian_currency(loan[5])}"))  # Interest Paid
-            
-            status = "Completed" if float(loan[4]) <= 0 else "Pending"
-            self.loans_table.setItem(row, 7, QTableWidgetItem(status))
-
-            # Add "Edit Loan" Button
-            edit_button = QPushButton("Edit Loan")
-            edit_button.setFixedSize(90, 30)
-            edit_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    font-size: 11px;
-                    margin-top: 5px;
-                    margin-left: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #1976D2;
-                }
-            """)
-            edit_button.clicked.connect(lambda _, loan_id=loan[7]: self.open_edit_loan(loan_id))
-            self.loans_table.setCellWidget(row, 8, edit_button)  # Column 8 for Edit Button
-
-            # Add "Delete Loan" Button
-            delete_button = QPushButton("Delete Loan")
-            delete_button.setFixedSize(90, 30)
-
-            # Check if loan is completed (amount due is 0 or less)
-            is_completed = float(loan[4]) <= 0
-
-            # Enable/disable the button based on status
-            delete_button.setEnabled(is_completed)
-
-            # Apply appropriate styling based on button state
-            if is_completed:
-                delete_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #F44336;
-                        color: white;
-                        border-radius: 8px;
-                        font-weight: bold;
-                        font-size: 11px;
-                        margin-top: 5px;
-                        margin-left: 5px;
-                    }
-                    QPushButton:hover {
-                        background-color: #D32F2F;
-                    }
-                """)
-            else:
-                delete_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #cccccc;
-                        color: #666666;
-                        border-radius: 8px;
-                        font-weight: bold;
-                        font-size: 11px;
-                        margin-top: 5px;
-                        margin-left: 5px;
-                    }
-                """)
-
-            delete_button.clicked.connect(lambda _, loan_id=loan[7]: self.delete_loan(loan_id))
-            self.loans_table.setCellWidget(row, 9, delete_button)  # Column 9 for Delete Button
+        # Update table with filtered loans; the model formats cells as they are painted
+        self.loans_table.set_loans(filtered_loans)
         
         # Set column widths - make Registered Reference Id column wider
         self.loans_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Interactive)
@@ -490,21 +464,31 @@ class LoanRegistrationPage(StyledWidget):
         self.loans_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)  # Assets column
 
     def update_customer_info(self):
-        # Clear existing widgets
-        layout = self.customer_info_group.layout()
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-                
         if not self.selected_customer_id:
+            self.db_worker.cancel("customer_info")
+            layout = self.clear_customer_info()
             # Add a placeholder label when no customer is selected
             placeholder = QLabel("No customer selected")
             placeholder.setAlignment(Qt.AlignCenter)
             layout.addWidget(placeholder)
             return
 
-        customer = DatabaseManager.get_customer_by_id(self.selected_customer_id)
+        self.db_worker.submit(
+            "customer_info", DatabaseManager.get_customer_by_id, self.selected_customer_id,
+            on_result=self.display_customer_info
+        )
+
+    def clear_customer_info(self):
+        # Clear existing widgets
+        layout = self.customer_info_group.layout()
+        while layout.count():
+            child = layout.takeAt(0)
+            if child.widget():
+                child.widget().deleteLater()
+        return layout
+
+    def display_customer_info(self, customer):
+        layout = self.clear_customer_info()
         if customer:
             for key, value in customer.items():
                 if key == "customer_id" or not value:
@@ -674,21 +658,14 @@ class LoanRegistrationPage(StyledWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete loan: {str(e)}")
 
-    def filter_customers(self):
-        """Filter dropdown options based on search box input"""
-        search_text = self.search_box.text().strip().lower()
-
+    def filter_customers(self, matching_customers):
+        """Show the customers found by the search box in the dropdown (matches_found slot)"""
         self.customer_dropdown.blockSignals(True)
         self.customer_dropdown.clear()
         # self.customer_dropdown.addItem("Select Customer", None)  # Keep the default option
 
-        # Add matching customers
-        matching_customers = []
-        for customer in self.all_customers_data:
-            if (search_text in customer['name'].lower() or 
-                (customer['phone'] and search_text in customer['phone'].lower())):
-                matching_customers.append(customer)
-                self.customer_dropdown.addItem(f"{customer['name']}", customer['id'])
+        for customer in matching_customers:
+            self.customer_dropdown.addItem(f"{customer['name']}", customer['id'])
 
         self.customer_dropdown.blockSignals(False)
         
@@ -0,0 +1,207 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent
+from PyQt5.QtGui import QColor, QPainter
+from PyQt5.QtWidgets import QTableView, QStyledItemDelegate, QAbstractItemView
+from helper import format_indian_currency
+
+# Rows handed to the view per fetchMore() call while scrolling
+FETCH_BATCH_SIZE = 100
+
+
+def format_loan_date(value):
+    """'YYYY-MM-DD[ HH:MM:SS]' -> 'DD-MM-YYYY'; anything else is shown as is."""
+    date_part = str(value or "").split(" ")[0]
+    date_parts = date_part.split('-')
+    if len(date_parts) == 3:
+        return f"{date_parts[2]}-{date_parts[1]}-{date_parts[0]}"
+    return str(value or "")
+
+
+def format_amount(value):
+    return f"{format_indian_currency(float(value))}" if value else "0.00"
+
+
+def loan_status(loan):
+    return "Completed" if float(loan[4] or 0) <= 0 else "Pending"
+
+
+# Display text for each field of a LoanView row:
+# (loan_date, asset_descriptions, total_asset_weight, loan_amount, loan_amount_due,
+#  total_interest_amount, registered_reference_id, loan_id, customer_id[, customer_name])
+LOAN_FIELDS = {
+    "customer": lambda loan: loan[9] or "",
+    "date": lambda loan: format_loan_date(loan[0]),
+    "reference": lambda loan: loan[6] or "N/A",
+    "assets": lambda loan: loan[1] or "N/A",
+    "weight": lambda loan: format_amount(loan[2]),
+    "amount": lambda loan: format_amount(loan[3]),
+    "due": lambda loan: format_amount(loan[4]),
+    "interest": lambda loan: format_amount(loan[5]),
+    "status": loan_status,
+}
+
+
+class ButtonColumn:
+    """
+    A column that shows an action button on every row.
+
+    on_click receives the row's loan tuple; is_enabled (optional) decides
+    per loan whether the button is active.
+    """
+
+    def __init__(self, text, on_click, color="#3498db", is_enabled=None):
+        self.text = text
+        self.on_click = on_click
+        self.color = color
+        self.is_enabled = is_enabled
+
+
+class LoanTableModel(QAbstractTableModel):
+    """
+    Read-only table model over LoanView rows.
+
+    Rows are kept as the tuples the database returned and only formatted when
+    the view paints a cell, so no per-cell items or per-row widgets exist.
+    The view is handed rows in batches through canFetchMore/fetchMore as the
+    user scrolls.
+
+    columns: [(header, field)] where field is a LOAN_FIELDS key or a ButtonColumn.
+    """
+
+    LoanRole = Qt.UserRole
+
+    def __init__(self, columns=(), parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self.loans = []
+        self.loaded_rows = 0
+
+    def set_columns(self, columns):
+        self.beginResetModel()
+        self.columns = list(columns)
+        self.endResetModel()
+
+    def set_loans(self, loans):
+        self.beginResetModel()
+        self.loans = list(loans)
+        self.loaded_rows = min(len(self.loans), FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_loans([])
+
+    def loan(self, row):
+        return self.loans[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded_rows < len(self.loans)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH_SIZE, len(self.loans) - self.loaded_rows)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded_rows, self.loaded_rows + count - 1)
+        self.loaded_rows += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        loan = self.loans[index.row()]
+        if role == self.LoanRole:
+            return loan
+        if role == Qt.DisplayRole:
+            field = self.columns[index.column()][1]
+            if isinstance(field, ButtonColumn):
+                return None
+            return LOAN_FIELDS[field](loan)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return super().headerData(section, orientation, role)
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paints a ButtonColumn's button and handles clicks on it (no widget per row)."""
+
+    def __init__(self, button, parent=None):
+        super().__init__(parent)
+        self.button = button
+
+    def is_enabled(self, loan):
+        return self.button.is_enabled is None or self.button.is_enabled(loan)
+
+    def paint(self, painter, option, index):
+        enabled = self.is_enabled(index.data(LoanTableModel.LoanRole))
+        rect = option.rect.adjusted(5, 4, -5, -4)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(self.button.color if enabled else "#cccccc"))
+        painter.drawRoundedRect(rect, 8, 8)
+
+        font = painter.font()
+        font.setBold(True)
+        font.setPointSize(8)
+        painter.setFont(font)
+        painter.setPen(QColor("white" if enabled else "#666666"))
+        painter.drawText(rect, Qt.AlignCenter, self.button.text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and option.rect.contains(event.pos())):
+            loan = index.data(LoanTableModel.LoanRole)
+            if self.is_enabled(loan):
+                self.button.on_click(loan)
+            return True
+        return False
+
+
+class LoanTableView(QTableView):
+    """QTableView over a LoanTableModel with ButtonDelegates for the action columns."""
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.loan_model = LoanTableModel(parent=self)
+        self.setModel(self.loan_model)
+        self.button_delegates = {}
+
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.verticalHeader().setDefaultSectionSize(36)
+        self.set_columns(columns)
+
+    def set_columns(self, columns):
+        """Switch the column layout; button delegates follow their columns."""
+        for column in self.button_delegates:
+            self.setItemDelegateForColumn(column, self.itemDelegate())
+        self.button_delegates = {}
+
+        self.loan_model.set_columns(columns)
+        for column, (header, field) in enumerate(columns):
+            if isinstance(field, ButtonColumn):
+                delegate = ButtonDelegate(field, self)
+                self.setItemDelegateForColumn(column, delegate)
+                self.button_delegates[column] = delegate
+
+    def column_count(self):
+        return self.loan_model.columnCount()
+
+    def set_loans(self, loans):
+        self.loan_model.set_loans(loans)
+        self.scrollToTop()
+
+    def clear(self):
+        self.loan_model.clear()
@@ -6,7 +6,12 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import QDate
 from helper import StyledWidget, format_indian_currency
-from DatabaseManager import DatabaseManager
+from DatabaseManager import DatabaseManager, PaymentExceedsLoanError, RepaymentBatchError
+from DatabaseWorker import DatabaseWorker, show_busy_cursor
+from LoanTableModel import LoanTableView, ButtonColumn
+from CustomerSearch import CustomerSearch
+from searchIndex import index_loans, filter_indexed_loans
+from CustomerCache import get_customer_cache, customer_display_text, insert_customer_item, update_customer_item
 from datetime import datetime
 
 class PaymentEditDialog(QDialog):
@@ -98,13 +103,20 @@ class LoanUpdatePage(StyledWidget):
         super().__init__(parent, with_back_button=True, title="Repay Loan", switch_page_callback=switch_page_callback)
         self.selected_customer_id = None
         self.current_loan_id = None
+        self.current_loan_reference = None
+        self.queued_repayments = []  # Batch mode: repayments waiting for "Post All"
         self.customer_info_group = None
         self.update_group = None
         self.assets_table = None
         self.repayment_table = None
-        self.all_customers_data = []
-        self.all_loans_data = []  # Added to store all loans for filtering
+        self.all_loans_data = []  # (search text, loan) pairs for filtering
+        self.db_worker = DatabaseWorker(self)
+        self.db_worker.busy_changed.connect(show_busy_cursor)
+        self.customer_cache = get_customer_cache()
+        self.customer_dropdown_loaded = False
         self.init_ui()
+        self.customer_cache.customers_added.connect(self.on_customers_added)
+        self.customer_cache.customer_changed.connect(self.on_customer_changed)
         
         # Hide tables initially
         self.loan_table.setVisible(False)
@@ -125,7 +137,8 @@ class LoanUpdatePage(StyledWidget):
                 min-height: 30px;
             }
         """)
-        self.customer_search.textChanged.connect(self.filter_customers)
+        self.customer_lookup = CustomerSearch(self.customer_search, self)
+        self.customer_lookup.matches_found.connect(self.filter_customers)
         customer_layout.addWidget(self.customer_search, alignment=Qt.AlignCenter)
 
         # Customer dropdown (existing code)
@@ -188,11 +201,11 @@ class LoanUpdatePage(StyledWidget):
                 widget.setVisible(False)
 
         # Loan Table Section
-        self.loan_table = QTableWidget()
-        self.loan_table.setColumnCount(7)
-        self.loan_table.setHorizontalHeaderLabels(
-            ["Loan Date", "Registered Reference Id", "Asset Description", "Total Weight (g)", "Total Amount (₹)", "Amount Due (₹)", ""]
-        )
+        self.loan_table = LoanTableView([
+            ("Loan Date", "date"), ("Registered Reference Id", "reference"), ("Asset Description", "assets"),
+            ("Total Weight (g)", "weight"), ("Total Amount (₹)", "amount"), ("Amount Due (₹)", "due"),
+            ("", ButtonColumn("Repay Amount", lambda loan: self.show_update_section(loan[7], loan[6])))
+        ])
         self.loan_table.setColumnWidth(1, 200)
         self.loan_table.setColumnWidth(2, 150)
         self.loan_table.setColumnWidth(3, 150)
@@ -200,9 +213,6 @@ class LoanUpdatePage(StyledWidget):
         self.loan_table.setColumnWidth(5, 150)
         self.loan_table.setColumnWidth(6, 150)
 
-        self.loan_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.loan_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.loan_table.setSelectionMode(QTableWidget.SingleSelection)
         self.loan_table.setFixedHeight(200)
         self.content_layout.addWidget(self.loan_table)
 
@@ -213,10 +223,10 @@ class LoanUpdatePage(StyledWidget):
 
         # Assets Table
         self.assets_table = QTableWidget()
-        self.assets_table.setColumnCount(6)  # Reduced from 7 to 6 (removed reference_id)
+        self.assets_table.setColumnCount(7)  # Repay now, or queue for a batch
         self.assets_table.setHorizontalHeaderLabels([
             "Asset Description", "Weight (g)", 
-            "Amount Paid (₹)", "Interest (₹)", "Payment Date", ""
+            "Amount Paid (₹)", "Interest (₹)", "Payment Date", "", ""
         ])
         self.assets_table.setColumnWidth(0, 250)  # Asset Description column
         self.assets_table.setColumnWidth(4, 120)  # Date column
@@ -286,6 +296,66 @@ class LoanUpdatePage(StyledWidget):
         self.update_group.setLayout(update_layout)
         self.content_layout.addWidget(self.update_group)
 
+        # Batch Repayments Section (shown while repayments are queued)
+        self.batch_group = QGroupBox("Batch Repayments")
+        self.batch_group.setVisible(False)
+        batch_layout = QVBoxLayout()
+
+        self.batch_table = QTableWidget()
+        self.batch_table.setColumnCount(7)
+        self.batch_table.setHorizontalHeaderLabels([
+            "Registered Reference Id", "Asset Description",
+            "Amount Paid (₹)", "Interest (₹)", "Payment Date", "Status", ""
+        ])
+        self.batch_table.setColumnWidth(0, 180)
+        self.batch_table.setColumnWidth(1, 200)
+        self.batch_table.setColumnWidth(5, 250)
+        self.batch_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        batch_layout.addWidget(self.batch_table)
+
+        batch_button_layout = QHBoxLayout()
+        batch_button_layout.addStretch()
+        self.post_batch_button = QPushButton("Post All")
+        self.post_batch_button.setFixedWidth(100)
+        self.post_batch_button.setFixedHeight(25)
+        self.post_batch_button.clicked.connect(self.post_queued_repayments)
+        self.post_batch_button.setStyleSheet("""
+            QPushButton {
+                background-color: #4CAF50;
+                color: white;
+                border-radius: 12px;
+                font-weight: bold;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+        """)
+
+        self.clear_batch_button = QPushButton("Clear")
+        self.clear_batch_button.setFixedWidth(100)
+        self.clear_batch_button.setFixedHeight(25)
+        self.clear_batch_button.clicked.connect(self.clear_queued_repayments)
+        self.clear_batch_button.setStyleSheet("""
+            QPushButton {
+                background-color: #ff4444;
+                color: white;
+                border-radius: 12px;
+                font-weight: bold;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #ff0000;
+            }
+        """)
+
+        batch_button_layout.addWidget(self.post_batch_button)
+        batch_button_layout.addWidget(self.clear_batch_button)
+        batch_layout.addLayout(batch_button_layout)
+
+        self.batch_group.setLayout(batch_layout)
+        self.content_layout.addWidget(self.batch_group)
+
         self.customer_dropdown.currentIndexChanged.connect(self.on_customer_selected)
         self.content_layout.addStretch(1)
 
@@ -342,6 +412,27 @@ class LoanUpdatePage(StyledWidget):
                 }
             """)
             self.assets_table.setCellWidget(row_idx, 5, repay_button)
+
+            # Queue button (batch mode)
+            queue_button = QPushButton("Queue")
+            queue_button.setEnabled(False)
+            queue_button.clicked.connect(lambda checked, r=row_idx: self.queue_repayment(r))
+            queue_button.setStyleSheet("""
+                QPushButton {
+                    background-color: #4682B4;
+                    color: white;
+                    border-radius: 15px;
+                    font-weight: bold;
+                    font-size: 12px;
+                }
+                QPushButton:enabled:hover {
+                    background-color: #3a6d96;
+                }
+                QPushButton:disabled {
+                    background-color: #cccccc;
+                }
+            """)
+            self.assets_table.setCellWidget(row_idx, 6, queue_button)
             
             # Connect input validation
             amount_input.textChanged.connect(
@@ -453,13 +544,16 @@ class LoanUpdatePage(StyledWidget):
         amount_input = self.assets_table.cellWidget(row, 2)  # Updated index
         interest_input = self.assets_table.cellWidget(row, 3)  # Updated index
         repay_button = self.assets_table.cellWidget(row, 5)  # Updated index
+        queue_button = self.assets_table.cellWidget(row, 6)
         
         try:
             amount = float(amount_input.text() or 0)
             interest = float(interest_input.text() or 0)
-            repay_button.setEnabled(amount > 0 and interest >= 0)
+            valid = amount > 0 and interest >= 0
         except ValueError:
-            repay_button.setEnabled(False)
+            valid = False
+        repay_button.setEnabled(valid)
+        queue_button.setEnabled(valid)
 
     def handle_repayment(self, row):
         """Process asset repayment."""
@@ -473,31 +567,19 @@ class LoanUpdatePage(StyledWidget):
             payment_date = date_input.date().toPyDate()
             asset_desc = self.assets_table.item(row, 0).text()
 
-            # Validate total payments don't exceed loan amount
-            total_paid = DatabaseManager.get_total_loan_payments(self.current_loan_id)
-            loan_amount = DatabaseManager.get_loan_amount(self.current_loan_id)
-            
-            if total_paid + amount > loan_amount:
-                raise ValueError(f"Total payments would exceed loan amount (₹{format_indian_currency(loan_amount)})")
-
-            # Insert payment with the selected date
-            DatabaseManager.insert_loan_payment(
+            # Validate, insert the payment and update the loan balance in one transaction
+            amount_due = DatabaseManager.record_repayment(
                 self.current_loan_id,
                 payment_amount=amount,
                 interest_amount=interest,
-                amount_left=loan_amount - (total_paid + amount),
                 asset_description=asset_desc,
                 payment_date=payment_date
             )
-
-            # Update loan paid amount
-            DatabaseManager.update_loan_payment(self.current_loan_id, amount)
             
             # Refresh UI
             self.populate_assets_table(self.current_loan_id)
             self.populate_repayment_table(self.current_loan_id)
             self.populate_loans_table()
-            amount_due = DatabaseManager.get_loan_amount_due(self.current_loan_id)
             self.delete_button.setEnabled(amount_due <= 0)
             if amount_due > 0:
                 self.delete_button.setToolTip("Loan can only be deleted when fully repaid (amount due ≤ 0)")
@@ -506,49 +588,164 @@ class LoanUpdatePage(StyledWidget):
             
             QMessageBox.information(self, "Success", "Payment recorded successfully!")
             
+        except PaymentExceedsLoanError as e:
+            QMessageBox.warning(self, "Input Error", f"{e} (₹{format_indian_currency(e.loan_amount)})")
         except ValueError as e:
             QMessageBox.warning(self, "Input Error", str(e))
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to process payment: {str(e)}")
 
+    def queue_repayment(self, row):
+        """Add the repayment entered on an asset row to the batch instead of posting it."""
+        try:
+            amount = float(self.assets_table.cellWidget(row, 2).text())
+            interest = float(self.assets_table.cellWidget(row, 3).text())
+        except ValueError:
+            QMessageBox.warning(self, "Input Error", "Please enter valid amounts.")
+            return
+
+        self.queued_repayments.append({
+            'loan_id': self.current_loan_id,
+            'reference_id': self.current_loan_reference or str(self.current_loan_id),
+            'asset_description': self.assets_table.item(row, 0).text(),
+            'payment_amount': amount,
+            'interest_amount': interest,
+            'payment_date': self.assets_table.cellWidget(row, 4).date().toPyDate(),
+            'error': None
+        })
+
+        # Clear the row so the same payment is not queued twice by accident
+        self.assets_table.cellWidget(row, 2).clear()
+        self.assets_table.cellWidget(row, 3).clear()
+        self.display_queued_repayments()
+
+    def display_queued_repayments(self):
+        """Show the queued repayments, with any validation error from the last post."""
+        self.batch_table.setRowCount(len(self.queued_repayments))
+        for row_idx, payment in enumerate(self.queued_repayments):
+            self.batch_table.setItem(row_idx, 0, QTableWidgetItem(payment['reference_id']))
+            self.batch_table.setItem(row_idx, 1, QTableWidgetItem(payment['asset_description']))
+            self.batch_table.setItem(row_idx, 2, QTableWidgetItem(format_indian_currency(payment['payment_amount'])))
+            self.batch_table.setItem(row_idx, 3, QTableWidgetItem(format_indian_currency(payment['interest_amount'])))
+            self.batch_table.setItem(row_idx, 4, QTableWidgetItem(payment['payment_date'].strftime("%d-%m-%Y")))
+
+            status_item = QTableWidgetItem(payment['error'] or "Queued")
+            if payment['error']:
+                status_item.setForeground(Qt.red)
+            self.batch_table.setItem(row_idx, 5, status_item)
+
+            remove_button = QPushButton("Remove")
+            remove_button.clicked.connect(lambda checked, i=row_idx: self.remove_queued_repayment(i))
+            self.batch_table.setCellWidget(row_idx, 6, remove_button)
+
+        self.batch_group.setVisible(bool(self.queued_repayments))
+        self.batch_group.setTitle(f"Batch Repayments ({len(self.queued_repayments)} queued)")
+
+    def remove_queued_repayment(self, index):
+        del self.queued_repayments[index]
+        self.display_queued_repayments()
+
+    def clear_queued_repayments(self):
+        self.queued_repayments = []
+        self.display_queued_repayments()
+
+    def post_queued_repayments(self):
+        """Validate and record every queued repayment in one transaction, then refresh once."""
+        if not self.queued_repayments:
+            return
+
+        for payment in self.queued_repayments:
+            payment['error'] = None
+
+        try:
+            amounts_due = DatabaseManager.record_repayments([
+                (payment['loan_id'], payment['payment_amount'], payment['interest_amount'],
+                 payment['asset_description'], payment['payment_date'])
+                for payment in self.queued_repayments
+            ])
+        except RepaymentBatchError as e:
+            # Nothing was recorded; mark the offending rows so they can be fixed or removed
+            for index, message in e.errors:
+                self.queued_repayments[index]['error'] = message
+            self.display_queued_repayments()
+            QMessageBox.warning(
+                self, "Input Error",
+                f"{len(e.errors)} of {len(self.queued_repayments)} queued repayments are invalid. "
+                "No payments were recorded."
+            )
+            return
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to process payments: {str(e)}")
+            return
+
+        posted = len(self.queued_repayments)
+        self.clear_queued_repayments()
+
+        # Refresh the affected views once for the whole batch
+        self.populate_loans_table()
+        if self.current_loan_id in amounts_due:
+            self.populate_assets_table(self.current_loan_id)
+            self.populate_repayment_table(self.current_loan_id)
+            amount_due = amounts_due[self.current_loan_id]
+            self.delete_button.setEnabled(amount_due <= 0)
+            if amount_due > 0:
+                self.delete_button.setToolTip("Loan can only be deleted when fully repaid (amount due ≤ 0)")
+            else:
+                self.delete_button.setToolTip("Delete this loan")
+
+        QMessageBox.information(self, "Success", f"{posted} payments recorded successfully!")
+
     def showEvent(self, event: QEvent):
         """Handle page load event and refresh customer data."""
         if event.type() == QEvent.Show:
-            self.populate_customer_dropdown()
-            # Reset selection and hide elements
-            self.customer_dropdown.setCurrentIndex(0)
-            self.loan_table.setVisible(False)
-            self.customer_info_group.setVisible(False)
-            self.update_group.setVisible(False)
-            
-            # Hide loan search layout
-            for i in range(self.loan_search_layout.count()):
-                widget = self.loan_search_layout.itemAt(i).widget()
-                if widget:
-                    widget.setVisible(False)
+            if not self.customer_dropdown_loaded:
+                self.populate_customer_dropdown()
+            self.reset_customer_view()
                     
         super().showEvent(event)
 
+    def reset_customer_view(self):
+        """Reset selection and hide the customer specific sections."""
+        self.customer_dropdown.setCurrentIndex(0)
+        self.loan_table.setVisible(False)
+        self.customer_info_group.setVisible(False)
+        self.update_group.setVisible(False)
+        
+        # Hide loan search layout
+        for i in range(self.loan_search_layout.count()):
+            widget = self.loan_search_layout.itemAt(i).widget()
+            if widget:
+                widget.setVisible(False)
+
     def populate_customer_dropdown(self):
-        """Populate the dropdown with the latest customer data."""
+        """Fill the dropdown from the shared customer cache (first visit only)."""
         self.customer_dropdown.clear()
-        self.all_customers_data = []  # Clear existing data
         
         # Add the initial placeholder
         # self.customer_dropdown.addItem("Select a customer", None)
         
-        customers = DatabaseManager.get_all_customers()
-        if customers:
-            for customer_id, name, phone in customers:
-                display_text = f"{name} - {phone}" if phone else f"{name}"
-                self.customer_dropdown.addItem(display_text, customer_id)
-                # Store customer data for filtering
-                self.all_customers_data.append({
-                    'id': customer_id,
-                    'name': name,
-                    'phone': phone if phone else '',
-                    'display': display_text
-                })
+        for customer in self.customer_cache.customers():
+            self.customer_dropdown.addItem(customer_display_text(customer), customer['id'])
+        self.customer_dropdown_loaded = True
+
+    def on_customers_added(self, customers):
+        """Add customers registered elsewhere without rebuilding the dropdown."""
+        if not self.customer_dropdown_loaded:
+            return
+        if self.customer_lookup.has_query():
+            self.customer_lookup.refresh()
+            return
+        for customer in customers:
+            insert_customer_item(self.customer_dropdown, customer, customer_display_text(customer))
+
+    def on_customer_changed(self, customer):
+        """Relabel a customer edited elsewhere."""
+        if not self.customer_dropdown_loaded:
+            return
+        if self.customer_lookup.has_query():
+            self.customer_lookup.refresh()
+            return
+        update_customer_item(self.customer_dropdown, customer, customer_display_text(customer))
 
     def on_customer_selected(self, index):
         """Display loans for the selected customer."""
@@ -571,7 +768,7 @@ class LoanUpdatePage(StyledWidget):
         
         # Clear tables if no selection
         if not has_selection:
-            self.loan_table.setRowCount(0)
+            self.loan_table.clear()
             self.update_group.setVisible(False)
             return
             
@@ -581,16 +778,23 @@ class LoanUpdatePage(StyledWidget):
 
     def populate_customer_info(self):
         """Populate customer information in the customer info group."""
+        if not self.selected_customer_id:
+            self.display_customer_info(None)
+            return 
+
+        self.db_worker.submit(
+            "customer_info", DatabaseManager.get_customer_by_id, self.selected_customer_id,
+            on_result=self.display_customer_info
+        )
+
+    def display_customer_info(self, customer_info):
+        """Show the customer details fetched by populate_customer_info."""
         customer_info_layout = self.customer_info_group.layout()
         while customer_info_layout.count():
             child = customer_info_layout.takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
         
-        if not self.selected_customer_id:
-            return 
-
-        customer_info = DatabaseManager.get_customer_by_id(self.selected_customer_id)
         if customer_info:
             for key, value in customer_info.items():
                 if key == "customer_id" or not value:
@@ -600,18 +804,25 @@ class LoanUpdatePage(StyledWidget):
 
     def populate_loans_table(self):
         """Populate the loan table with loans for the selected customer."""
-        self.loan_table.setRowCount(0)  # Clear existing rows
+        self.loan_table.clear()  # Clear existing rows
         
         if not self.selected_customer_id:
+            self.db_worker.cancel("loans")
             return 
             
-        loans = DatabaseManager.fetch_loans_for_customer(self.selected_customer_id)
-        
+        self.db_worker.submit(
+            "loans", DatabaseManager.fetch_loans_for_customer, self.selected_customer_id,
+            on_result=self.display_customer_loans
+        )
+
+    def display_customer_loans(self, loans):
+        """Show the loans fetched by populate_loans_table, applying any active search filter."""
+        self.loan_table.clear()
         if not loans:
             return
             
         # Store all loans for filtering
-        self.all_loans_data = sorted(loans, key=lambda loan: loan[0], reverse=True)
+        self.all_loans_data = index_loans(sorted(loans, key=lambda loan: loan[0], reverse=True))
         
         # Check if there's a search filter active
         search_text = self.loan_search.text().strip().lower()
@@ -620,11 +831,12 @@ class LoanUpdatePage(StyledWidget):
             self.filter_loans()
         else:
             # Display all loans if no filter
-            self.display_loans(self.all_loans_data)
+            self.display_loans([loan for _, loan in self.all_loans_data])
 
-    def show_update_section(self, loan_id):
+    def show_update_section(self, loan_id, reference_id=None):
         """Show the update section with loan details and assets."""
         self.current_loan_id = loan_id
+        self.current_loan_reference = reference_id
         self.update_group.setVisible(True)
         
         # Populate both tables with loan data
@@ -682,23 +894,16 @@ class LoanUpdatePage(StyledWidget):
         self.update_group.setVisible(False)
         self.current_loan_id = None  # Reset the current loan ID
 
-    def filter_customers(self):
-        """Filter dropdown options based on search box input"""
-        search_text = self.customer_search.text().strip().lower()
-
+    def filter_customers(self, matching_customers):
+        """Show the customers found by the search box in the dropdown (matches_found slot)"""
         self.customer_dropdown.blockSignals(True)
         self.customer_dropdown.clear()
         
         # Always add the placeholder
         # self.customer_dropdown.addItem("Select a customer", None)
 
-        # Add matching customers
-        matching_customers = []
-        for customer in self.all_customers_data:
-            if (search_text in customer['name'].lower() or 
-                search_text in customer['phone'].lower()):
-                matching_customers.append(customer)
-                self.customer_dropdown.addItem(customer['display'], customer['id'])
+        for customer in matching_customers:
+            self.customer_dropdown.addItem(customer_display_text(customer), customer['id'])
 
         self.customer_dropdown.blockSignals(False)
         
@@ -718,93 +923,15 @@ class LoanUpdatePage(StyledWidget):
             return
             
         # Clear the table
-        self.loan_table.setRowCount(0)
+        self.loan_table.clear()
         
-        # Filter loans based on search text
-        filtered_loans = []
-        for loan_data in self.all_loans_data:
-            # Convert all loan data to strings for searching
-            searchable_values = []
-            
-            # Add all relevant fields to searchable values
-            # Assuming loan_data structure based on previous code:
-            # [date, assets, total_weight, loan_amount, amount_due, interest_paid, registered_reference_id, loan_id, ...]
-            
-            # Date (index 0)
-            date_str = str(loan_data[0]).lower()
-            searchable_values.append(date_str)
-            
-            # Assets (index 1)
-            assets = str(loan_data[1] or "N/A").lower()
-            searchable_values.append(assets)
-            
-            # Total Weight (index 2)
-            total_weight = str(loan_data[2]).lower()
-            searchable_values.append(total_weight)
-            
-            # Loan Amount (index 3)
-            loan_amount = str(loan_data[3]).lower()
-            searchable_values.append(loan_amount)
-            
-            # Amount Due (index 4)
-            amount_due = str(loan_data[4]).lower()
-            searchable_values.append(amount_due)
-            
-            # Interest Paid (index 5)
-            interest_paid = str(loan_data[5]).lower()
-            searchable_values.append(interest_paid)
-            
-            # Registered Reference ID (index 6)
-            reference_id = str(loan_data[6] or "N/A").lower()
-            searchable_values.append(reference_id)
-            
-            # Status (derived from amount_due)
-            status = "completed" if float(loan_data[4]) <= 0 else "pending"
-            searchable_values.append(status)
-            
-            # Check if search text is in any of the searchable values
-            if any(search_text in value for value in searchable_values):
-                filtered_loans.append(loan_data)
+        # Filter loans based on search text; one substring test per loan
+        filtered_loans = filter_indexed_loans(self.all_loans_data, search_text)
         
         # Display filtered loans
         self.display_loans(filtered_loans)
 
     def display_loans(self, loans): 
         """Display the given loans in the loan table"""
-        for row_idx, loan_data in enumerate(loans):
-            self.loan_table.insertRow(row_idx)
-            
-            # Unpack loan data
-            (loan_date, asset_descriptions, total_weight, loan_amount, 
-            amount_due, interest_amount, registered_reference_id, loan_id, _) = loan_data
-            
-            # Parse the date format "2022-09-21-09-21 00:00:00"
-            loan_date_str = loan_date
-            try:
-                # Split by spaces to separate date and time
-                date_part = loan_date_str.split()[0]
-                # Split the date part by hyphens
-                date_parts = date_part.split('-')
-                # Get year, month, day
-                if len(date_parts) >= 3:
-                    year = date_parts[0]
-                    month = date_parts[1]
-                    day = date_parts[2]
-                    formatted_date = f"{day}-{month}-{year}"  # "21-09-2022"
-                else:
-                    formatted_date = loan_date_str  # Fallback to original if can't parse
-            except Exception:
-                formatted_date = loan_date_str  # Fallback to original if error
-            
-            # Set table items
-            self.loan_table.setItem(row_idx, 0, QTableWidgetItem(formatted_date))
-            self.loan_table.setItem(row_idx, 1, QTableWidgetItem(registered_reference_id))
-            self.loan_table.setItem(row_idx, 2, QTableWidgetItem(asset_descriptions or ""))
-            self.loan_table.setItem(row_idx, 3, QTableWidgetItem(f"{format_indian_currency(float(total_weight))}" if total_weight else "0.00"))
-            self.loan_table.setItem(row_idx, 4, QTableWidgetItem(f"{format_indian_currency(float(loan_amount))}" if loan_amount else "0.00"))
-            self.loan_table.setItem(row_idx, 5, QTableWidgetItem(f"{format_indian_currency(float(amount_due))}" if amount_due else "0.00"))
-            
-            # Add update button
-            update_button = QPushButton("Repay Amount")
-            update_button.clicked.connect(lambda checked, lid=loan_id: self.show_update_section(lid))
-            self.loan_table.setCellWidget(row_idx, 6, update_button)
+        # Cells are formatted by the model as they are painted
+        self.loan_table.set_loans(loans)
@@ -0,0 +1,191 @@
+import threading
+from datetime import datetime
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from fpdf import FPDF
+from helper import format_indian_currency
+from DatabaseManager import DatabaseManager
+
+ROWS_PER_CHUNK = 500
+
+
+def sanitize_text(text):
+    """Keep ASCII only; the core FPDF fonts cannot encode anything else."""
+    if text is None:
+        return "N/A"
+    try:
+        text = str(text)
+        return ''.join(char for char in text if ord(char) < 128)
+    except:
+        return "Text contains unsupported characters"
+
+
+def format_report_cell(loan, field, max_length=None):
+    """
+    Format one LoanView row field for the PDF table.
+
+    loan structure: (loan_date, asset_descriptions, total_asset_weight, loan_amount,
+                     loan_amount_due, total_interest_amount, registered_reference_id,
+                     loan_id, customer_id, customer_name)
+    """
+    if field == "date":
+        try:
+            return datetime.strptime(str(loan[0]).replace('00:00:00', '').strip(), "%Y-%m-%d").strftime("%d-%m-%Y")
+        except:
+            return str(loan[0])[:10]
+    if field == "weight":
+        return f"{float(loan[2]):.2f}" if loan[2] else "0"
+    if field == "amount":
+        return format_indian_currency(float(loan[3]) if loan[3] else 0)
+    if field == "due":
+        return format_indian_currency(float(loan[4]) if loan[4] else 0)
+
+    index = {"customer": 9, "ref_id": 6, "assets": 1}[field]
+    text = sanitize_text(str(loan[index]) if loan[index] else "")
+    return text[:max_length] if max_length else text
+
+
+class PdfReportSignals(QObject):
+    progress = pyqtSignal(int, int)  # rows written, total rows
+    finished = pyqtSignal(str)       # output filename
+    empty = pyqtSignal()             # no loans matched the report filters
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class PdfReportTask(QRunnable):
+    """
+    Builds a loan report PDF on a worker thread.
+
+    The report is described by a dict prepared on the GUI thread:
+        title, header_lines, info_lines (optional), count_label,
+        columns: [(header, width, align, field, max_length)],
+        query: keyword arguments for DatabaseManager.iter_loans,
+        filename, fallback_filename
+
+    Totals are computed with one grouped aggregate query up front, then rows are
+    streamed from the database in chunks and laid out as they arrive, so
+    memory stays flat and progress can be reported. cancel() stops the task
+    between chunks without writing a file.
+    """
+
+    def __init__(self, report):
+        super().__init__()
+        self.report = report
+        self.signals = PdfReportSignals()
+        self.cancel_requested = threading.Event()
+        # GenerateReport keeps the task alive until it reports back
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self.cancel_requested.set()
+
+    def run(self):
+        try:
+            self.write_report()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+    def write_report(self):
+        report = self.report
+        query = report["query"]
+        period = {key: query.get(key) for key in ("year", "start_date", "end_date")}
+        totals = DatabaseManager.get_portfolio_aggregates(
+            query.get("customer_id"), period, query.get("filters")
+        )["totals"]
+        total_loans = totals["loans"]
+        if not total_loans:
+            self.signals.empty.emit()
+            return
+
+        pdf = FPDF()
+        pdf.add_page()
+
+        # Title
+        pdf.set_font('Arial', 'B', 18)
+        pdf.cell(0, 12, report["title"], 0, 1, 'C')
+        pdf.ln(5)
+
+        # Filter information
+        pdf.set_font('Arial', 'B', 12)
+        for line in report["header_lines"]:
+            pdf.cell(0, 8, line, 0, 1, 'C')
+
+        pdf.ln(3)
+        pdf.set_font('Arial', 'I', 10)
+        pdf.cell(0, 6, f"Generated on: {datetime.now().strftime('%d-%m-%Y %H:%M')}", 0, 1, 'C')
+        pdf.ln(8)
+
+        # Customer Information
+        if report.get("info_lines"):
+            pdf.set_font('Arial', 'B', 12)
+            pdf.cell(0, 7, "Customer Information", 0, 1)
+            pdf.set_font('Arial', '', 11)
+            for line in report["info_lines"]:
+                pdf.cell(0, 7, line, 0, 1)
+            pdf.ln(8)
+
+        # Summary statistics
+        pdf.set_font('Arial', 'B', 11)
+        pdf.cell(0, 7, f"{report['count_label']}: {total_loans}", 0, 1)
+        pdf.cell(0, 7, f"Total Loan Amount: Rs {format_indian_currency(totals['loan_amount'])}", 0, 1)
+        pdf.cell(0, 7, f"Total Amount Paid: Rs {format_indian_currency(totals['amount_paid'])}", 0, 1)
+        pdf.cell(0, 7, f"Total Interest Paid: Rs {format_indian_currency(totals['interest'])}", 0, 1)
+        pdf.cell(0, 7, f"Total Amount Due: Rs {format_indian_currency(totals['amount_due'])}", 0, 1)
+        pdf.ln(8)
+
+        columns = report["columns"]
+        self.write_table_header(pdf, columns)
+
+        # Table data, one chunk of rows at a time
+        fill = False
+        rows_written = 0
+        chunks = DatabaseManager.iter_loans(chunk_size=ROWS_PER_CHUNK, **report["query"])
+        try:
+            for loans in chunks:
+                if self.cancel_requested.is_set():
+                    self.signals.cancelled.emit()
+                    return
+
+                for loan in loans:
+                    # Alternate row colors
+                    if fill:
+                        pdf.set_fill_color(240, 240, 240)
+                    else:
+                        pdf.set_fill_color(255, 255, 255)
+
+                    for header, width, align, field, max_length in columns:
+                        pdf.cell(width, 7, format_report_cell(loan, field, max_length), 1, 0, align, True)
+                    pdf.ln()
+
+                    fill = not fill
+
+                    # Add new page if needed
+                    if pdf.get_y() > 270:
+                        pdf.add_page()
+                        self.write_table_header(pdf, columns)
+
+                rows_written += len(loans)
+                self.signals.progress.emit(rows_written, total_loans)
+        finally:
+            chunks.close()
+
+        if self.cancel_requested.is_set():
+            self.signals.cancelled.emit()
+            return
+
+        try:
+            pdf.output(report["filename"])
+            self.signals.finished.emit(report["filename"])
+        except Exception:
+            pdf.output(report["fallback_filename"])
+            self.signals.finished.emit(report["fallback_filename"])
+
+    def write_table_header(self, pdf, columns):
+        pdf.set_font('Arial', 'B', 9)
+        pdf.set_fill_color(70, 130, 180)  # Steel blue
+        pdf.set_text_color(255, 255, 255)  # White text
+        for header, width, align, field, max_length in columns:
+            pdf.cell(width, 8, header, 1, 0, 'C', True)
+        pdf.ln()
+        pdf.set_font('Arial', '', 8)
+        pdf.set_text_color(0, 0, 0)  # Black text
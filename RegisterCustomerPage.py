@@ -1,16 +1,25 @@
 from helper import StyledWidget
 from DatabaseManager import DatabaseManager
+from CustomerSearch import CustomerSearch
+from CustomerCache import get_customer_cache, customer_display_text, insert_customer_item, update_customer_item
+from csvImporter import RejectedRowsWriter, customer_rows, read_csv_rows
 import sqlite3
 import re
-import csv
 from PyQt5.QtWidgets import (QPushButton, QLineEdit, QFormLayout, QMessageBox, 
-                           QLabel, QFileDialog, QHBoxLayout, QComboBox, QVBoxLayout, QSizePolicy, QFrame, QCompleter)
+                           QLabel, QFileDialog, QHBoxLayout, QComboBox, QVBoxLayout, QSizePolicy, QFrame, QCompleter,
+                           QProgressDialog, QApplication)
 from PyQt5.QtCore import Qt
 
+# Columns expected in customer CSV uploads (the account number is not stored)
+CUSTOMER_CSV_HEADER = ("Name", "Account Number", "Phone", "Address")
+
 class RegisterCustomerPage(StyledWidget):
     def __init__(self, parent, switch_page_callback):
         super().__init__(parent, with_back_button=True, title="Register Customer", switch_page_callback=switch_page_callback)
+        self.customer_cache = get_customer_cache()
         self.init_ui()
+        self.customer_cache.customers_added.connect(self.on_customers_added)
+        self.customer_cache.customer_changed.connect(self.on_customer_changed)
 
     def init_ui(self):
         layout = QHBoxLayout()  # Main layout for left (register) & right (edit) sections
@@ -136,7 +145,8 @@ class RegisterCustomerPage(StyledWidget):
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search customers...")
         self.search_box.setFixedWidth(300)
-        self.search_box.textChanged.connect(self.filter_customers)
+        self.customer_lookup = CustomerSearch(self.search_box, self)
+        self.customer_lookup.matches_found.connect(self.filter_customers)
         dropdown_layout.addWidget(self.search_box)
 
         # Dropdown
@@ -194,20 +204,13 @@ class RegisterCustomerPage(StyledWidget):
 
         return edit_layout
 
-    def filter_customers(self):
-        """Filter dropdown options based on search box input"""
-        search_text = self.search_box.text().strip().lower()
-
+    def filter_customers(self, matching_customers):
+        """Show the customers found by the search box in the dropdown (matches_found slot)"""
         self.customer_dropdown.blockSignals(True)
         self.customer_dropdown.clear()
 
-        # Add matching customers
-        matching_customers = []
-        for customer in self.all_customers_data:
-            if (search_text in customer['name'].lower() or 
-                search_text in customer['phone'].lower()):
-                matching_customers.append(customer)
-                self.customer_dropdown.addItem(customer['display'], customer['id'])
+        for customer in matching_customers:
+            self.customer_dropdown.addItem(customer_display_text(customer), customer['id'])
 
         self.customer_dropdown.blockSignals(False)
         
@@ -220,30 +223,6 @@ class RegisterCustomerPage(StyledWidget):
             self.edit_phone_input.clear()
             self.edit_address_input.clear()
 
-    def validate_csv_row(self, row, row_number):
-        """Validate a single row from CSV"""
-        row_number -= row_number
-        errors = []
-        
-        # Name validation
-        name = row[0].strip()
-        if not name or len(name) < 2:
-            errors.append(f"Row {row_number}: Invalid name (must be at least 2 characters)")
-
-        # Phone validation - only if provided
-        phone = row[2].strip()
-        if phone:
-            if not re.match(r'^\d{10}$', phone):
-                errors.append(f"Row {row_number}: Invalid phone number (must be 10 digits)")
-
-        # Address validation
-        address = row[3].strip()
-        if address:
-            if len(address) < 5:
-                errors.append(f"Row {row_number}: Invalid address (must be at least 5 characters)")
-
-        return errors, (name, phone, address)
-
     def upload_csv(self):
         """Handle CSV file upload and processing"""
         file_name, _ = QFileDialog.getOpenFileName(
@@ -256,76 +235,58 @@ class RegisterCustomerPage(StyledWidget):
         if not file_name:
             return
 
-        try:
-            valid_rows = []
-            all_errors = []
-            duplicates = set()
-            
-            with open(file_name, 'r', encoding='utf-8') as file:
-                csv_reader = csv.reader(file)
-                next(csv_reader, None)  # Skip header row
-                
-                for row_number, row in enumerate(csv_reader, 2):  # Start at 2 to account for header
-                    if len(row) < 4:
-                        all_errors.append(f"Row {row_number}: Insufficient columns")
-                        continue
-                        
-                    errors, validated_data = self.validate_csv_row(row, row_number)
-                    
-                    if errors:
-                        all_errors.extend(errors)
-                    else:
-                        # Check for duplicates within the CSV
-                        account_number = validated_data[1]
-                        phone = validated_data[2]
-                        
-                        if account_number in duplicates:
-                            all_errors.append(f"Row {row_number}: Duplicate account number")
-                        elif phone in duplicates:
-                            all_errors.append(f"Row {row_number}: Duplicate phone number")
-                        else:
-                            duplicates.add(account_number)
-                            duplicates.add(phone)
-                            valid_rows.append(validated_data)
-
-            if all_errors:
-                error_msg = "\n".join(all_errors)
-                QMessageBox.warning(self, "Validation Errors", 
-                                  f"Found the following errors:\n\n{error_msg}")
-                return
-
-            # Insert valid rows into database
-            success_count = 0
-            error_count = 0
-            
-            query = """
-            INSERT INTO Customers (name, phone, address) 
-            VALUES (?, ?, ?)
-            """
-            
-            for row in valid_rows:
-                try:
-                    cursor = DatabaseManager.execute_query(query, row)
-                    if cursor:
-                        success_count += 1
-                    else:
-                        error_count += 1
-                except sqlite3.IntegrityError:
-                    error_count += 1
-                    all_errors.append(f"Duplicate account number or phone: {row[1]}, {row[2]}")
-
-            result_message = f"Successfully imported {success_count} customers.\n"
-            if error_count > 0:
-                result_message += f"Failed to import {error_count} customers."
-                if all_errors:
-                    result_message += "\n\nErrors:\n" + "\n".join(all_errors)
-                QMessageBox.warning(self, "Import Results", result_message)
-            else:
-                QMessageBox.information(self, "Success", result_message)
-                self.load_customers() 
+        progress = QProgressDialog("Importing customers...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Import Customers")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
 
+        try:
+            with RejectedRowsWriter(file_name, CUSTOMER_CSV_HEADER) as rejects:
+                def on_progress(rows_processed):
+                    progress.setLabelText(
+                        f"Importing customers... {rows_processed} rows processed, {rejects.count} rejected"
+                    )
+                    QApplication.processEvents()
+                    return not progress.wasCanceled()
+
+                def reject_customer(row_number, customer, message):
+                    # Back to the CSV column layout; the account number column is not stored
+                    name, phone, address = customer
+                    rejects(row_number, (name, "", phone, address), message)
+
+                # Rows are read, validated and inserted chunk by chunk in one transaction
+                result = DatabaseManager.import_customers(
+                    customer_rows(read_csv_rows(file_name), rejects),
+                    reject_customer,
+                    progress=on_progress
+                )
         except Exception as e:
+            progress.close()
             QMessageBox.critical(self, "Error", f"Error processing CSV file:\n{str(e)}")
+            return
+
+        cancelled = progress.wasCanceled()
+        progress.close()
+
+        if result is None:
+            if cancelled:
+                QMessageBox.information(self, "Import Cancelled", "Import cancelled. No customers were imported.")
+            else:
+                QMessageBox.critical(self, "Error", "Failed to import customers. No customers were imported.")
+            return
+
+        success_count, _ = result
+        result_message = f"Successfully imported {success_count} customers.\n"
+        if rejects.count:
+            result_message += (
+                f"Skipped {rejects.count} rows.\n\n"
+                f"The skipped rows and the reason for each were saved to:\n{rejects.path}"
+            )
+            QMessageBox.warning(self, "Import Results", result_message)
+        else:
+            QMessageBox.information(self, "Success", result_message)
+        if success_count:
+            self.customer_cache.sync_new_customers()
 
     def validate_input(self, name, phone, address, is_edit=False):
         """Validates input fields separately for Register & Edit sections."""
@@ -392,7 +353,7 @@ class RegisterCustomerPage(StyledWidget):
                 self.name_input.clear()
                 self.phone_input.clear()
                 self.address_input.clear()
-                self.load_customers()  # Refresh dropdown
+                self.customer_cache.sync_new_customers()  # Adds the new customer to every dropdown
             else:
                 QMessageBox.warning(self, "Error", "Failed to register customer.")
         except sqlite3.IntegrityError:
@@ -401,18 +362,24 @@ class RegisterCustomerPage(StyledWidget):
     def load_customers(self):
         """Loads customer names into dropdown"""
         self.customer_dropdown.clear()
-        self.all_customers_data = []
 
-        customers = DatabaseManager.get_all_customers()
+        for customer in self.customer_cache.customers():
+            self.customer_dropdown.addItem(customer_display_text(customer), customer['id'])
+
+    def on_customers_added(self, customers):
+        """Add newly registered/imported customers without rebuilding the dropdown."""
+        if self.customer_lookup.has_query():
+            self.customer_lookup.refresh()
+            return
         for customer in customers:
-            display_text = f"{customer[1]} - {customer[2]}" if customer[2] else f"{customer[1]}"
-            self.customer_dropdown.addItem(display_text, customer[0])
-            self.all_customers_data.append({
-                'id': customer[0],
-                'name': customer[1],
-                'phone': customer[2] if customer[2] else '',
-                'display': display_text
-            })
+            insert_customer_item(self.customer_dropdown, customer, customer_display_text(customer))
+
+    def on_customer_changed(self, customer):
+        """Relabel an edited customer in the dropdown."""
+        if self.customer_lookup.has_query():
+            self.customer_lookup.refresh()
+            return
+        update_customer_item(self.customer_dropdown, customer, customer_display_text(customer))
 
 
     def load_customer_details(self):
@@ -443,6 +410,6 @@ class RegisterCustomerPage(StyledWidget):
 
         if DatabaseManager.update_customer(customer_id, name, phone, address):
             QMessageBox.information(self, "Success", "Customer details updated successfully!")
-            self.load_customers()  # Refresh dropdown
+            self.customer_cache.refresh_customer(customer_id)  # Updates the customer in every dropdown
         else:
             QMessageBox.warning(self, "Error", "Failed to update customer. Phone might already exist.")
@@ -1,36 +1,44 @@
 import sys
+import time
+APP_STARTED = time.perf_counter()  # Start of the cold-start timing (before the heavy imports)
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QStackedWidget, 
-                             QLabel, QPushButton, QHBoxLayout, QFileDialog)
-from PyQt5.QtGui import QPixmap, QIcon
-from PyQt5.QtCore import Qt
+                             QLabel, QPushButton, QHBoxLayout, QFileDialog, QMessageBox,
+                             QProgressDialog)
+from PyQt5.QtCore import QTimer
 from DatabaseManager import DatabaseManager
-from HomePage import HomePage
-from RegisterCustomerPage import RegisterCustomerPage
-from LoanRegistrationPage import LoanRegistrationPage
-from LoanUpdatePage import LoanUpdatePage
-from GenerateReport import GenerateReport
+from DatabaseWorker import get_thread_pool
+from BackupManager import BackupTask, BackupScheduler
 from LoginScreen import LoginScreen
 from helper import verifyPendrive
 from terms_dialog import TermsAndConditionsDialog
-from binary_images import FAVICON_BASE64, LOGO_BASE64
-import base64
+from imageResources import favicon, logo
 import os
-import shutil
-import stat
-import datetime
+import logging
+
+# ===== CUSTOMIZABLE VARIABLES =====
+PREWARM_PAGES = True  # Build the remaining pages in idle time after login
+PREWARM_DELAY_MS = 250  # Pause between pre-warmed pages so input is handled in between
+# Set LOANAPP_LOG_TIMINGS=1 to debug-log the startup time and, once every page is built, the page build times
+LOG_TIMINGS = os.environ.get("LOANAPP_LOG_TIMINGS") == "1"
+PAGE_INDEXES = range(1, 6)  # Pages built on demand (0 is the login screen)
+# Start with e.g. "LoanApplication.exe --db-profile=safe" when the database is on a pendrive
+DB_PROFILE_OPTION = "--db-profile="
+# ==================================
+
+logger = logging.getLogger("loanApp")
 
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Loan Management System")
-        favicon_data = base64.b64decode(FAVICON_BASE64)
-        favicon_pixmap = QPixmap()
-        favicon_pixmap.loadFromData(favicon_data)
-        favicon = QIcon(favicon_pixmap)
-        self.setWindowIcon(favicon)
+        self.setWindowIcon(favicon())
         # Remove showMaximized() here as we'll do it after setup
         DatabaseManager.init_database()
         self.is_logged_in = False
+        self.backup_scheduler = None
+        self.pages = {}  # stacked widget index -> page, filled in as pages are first needed
+        self.page_build_times = {}  # page class name -> seconds spent constructing it
+        self.startup_time = None  # Seconds from launch until the login screen was shown
         self.init_ui()
 
     def init_ui(self):
@@ -41,12 +49,8 @@ class MainWindow(QWidget):
         header_layout = QHBoxLayout()
         
         # Logo
-        logo_data = base64.b64decode(LOGO_BASE64)
-        logo_pixmap = QPixmap()
-        logo_pixmap.loadFromData(logo_data)
-        
         logo_label = QLabel()
-        logo_label.setPixmap(logo_pixmap.scaled(250, 20, transformMode=Qt.SmoothTransformation))
+        logo_label.setPixmap(logo())
         header_layout.addWidget(logo_label)
         
         header_layout.addStretch(1)
@@ -90,13 +94,60 @@ class MainWindow(QWidget):
         # Create an instance of each page with the switch_page method
         self.login_screen = LoginScreen(self.on_login_success)
         
-        # Add pages to the stacked widget
-        self.stacked_widget.addWidget(self.login_screen)  # Index 0
-        self.stacked_widget.addWidget(HomePage(self, self.switch_page))  # Index 1
-        self.stacked_widget.addWidget(RegisterCustomerPage(self, self.switch_page))  # Index 2
-        self.stacked_widget.addWidget(LoanRegistrationPage(self, self.switch_page))  # Index 3
-        self.stacked_widget.addWidget(LoanUpdatePage(self, self.switch_page))  # Index 4
-        self.stacked_widget.addWidget(GenerateReport(self, self.switch_page))  # Index 5
+        # Only the login screen is built up front; the other pages are built
+        # (and their modules imported) on first switch_page
+        self.stacked_widget.addWidget(self.login_screen)
+        self.pages[0] = self.login_screen
+
+    def create_page(self, index):
+        """Construct the page for a page index (PAGE_INDEXES); its module is imported here, on first use."""
+        if index == 1:
+            from HomePage import HomePage
+            return HomePage(self, self.switch_page)
+        if index == 2:
+            from RegisterCustomerPage import RegisterCustomerPage
+            return RegisterCustomerPage(self, self.switch_page)
+        if index == 3:
+            from LoanRegistrationPage import LoanRegistrationPage
+            return LoanRegistrationPage(self, self.switch_page)
+        if index == 4:
+            from LoanUpdatePage import LoanUpdatePage
+            return LoanUpdatePage(self, self.switch_page)
+        if index == 5:
+            from GenerateReport import GenerateReport
+            return GenerateReport(self, self.switch_page)
+        raise ValueError(f"Unknown page index: {index}")
+
+    def page(self, index):
+        """Return the page for an index, building it the first time it is asked for."""
+        if index not in self.pages:
+            started = time.perf_counter()
+            page = self.create_page(index)
+            self.stacked_widget.addWidget(page)
+            self.pages[index] = page
+            elapsed = time.perf_counter() - started
+            self.page_build_times[type(page).__name__] = elapsed
+            if LOG_TIMINGS and all(page_index in self.pages for page_index in PAGE_INDEXES):
+                logger.debug("Page build times: %s", ", ".join(
+                    f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.page_build_times.items()
+                ))
+        return self.pages[index]
+
+    def prewarm_pages(self):
+        """Build the next page nobody has opened yet, then schedule the one after it."""
+        for index in PAGE_INDEXES:
+            if index not in self.pages:
+                self.page(index)
+                QTimer.singleShot(PREWARM_DELAY_MS, self.prewarm_pages)
+                return
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.startup_time is None:
+            # Measured once, when the window with the login screen first appears
+            self.startup_time = time.perf_counter() - APP_STARTED
+            if LOG_TIMINGS:
+                logger.debug("Login screen shown %.0f ms after launch", self.startup_time * 1000)
 
     def on_login_success(self, user_id=None):
         # Called when login is successful
@@ -104,8 +155,16 @@ class MainWindow(QWidget):
         self.backup_button.setEnabled(True)
         self.switch_page(1)  # Switch to home page
 
+        # Snapshot the database in the background whenever it has changed
+        if self.backup_scheduler is None:
+            self.backup_scheduler = BackupScheduler(self)
+            self.backup_scheduler.start()
+
+        if PREWARM_PAGES:
+            QTimer.singleShot(PREWARM_DELAY_MS, self.prewarm_pages)
+
     def switch_page(self, index):
-        self.stacked_widget.setCurrentIndex(index)
+        self.stacked_widget.setCurrentWidget(self.page(index))
 
     def backup_database(self):
         # Open file dialog to select destination
@@ -116,49 +175,76 @@ class MainWindow(QWidget):
             QFileDialog.ShowDirsOnly
         )
         
-        if dest_dir:
-            try:
-                current_date = datetime.datetime.now()
-                date_string = current_date.strftime("%Y-%m-%d %H:%M:%S")
-                # Source database path
-                src_path = os.path.join(os.getcwd(), "loanApp.db")
-                # Destination path
-                dest_path = os.path.join(dest_dir, f"loanApp_{date_string.replace('-', '_').replace(':', '_').replace(' ', '_')}.db")
-                
-                # Copy the file
-                shutil.copy2(src_path, dest_path)
-                
-                # Remove hidden attribute in Windows
-                if os.name == 'nt':
-                    import subprocess
-                    # Use attrib command to remove hidden attribute
-                    subprocess.run(['attrib', '-H', dest_path], check=True)
-                else:
-                    # For non-Windows systems, ensure file permissions are set properly
-                    os.chmod(dest_path, 0o644)  # Read/write for owner, read for others
-                
-                from PyQt5.QtWidgets import QMessageBox
-                QMessageBox.information(
-                    self, 
-                    "Backup Successful", 
-                    f"Database has been successfully backed up to:\n{dest_path}"
-                )
-            except Exception as e:
-                from PyQt5.QtWidgets import QMessageBox
-                QMessageBox.critical(
-                    self, 
-                    "Backup Failed", 
-                    f"Could not backup database: {str(e)}"
-                )
+        if not dest_dir:
+            return
+
+        # Copy in the background; the app stays usable while pages are copied
+        self.backup_task = BackupTask(dest_dir)
+
+        self.backup_progress_dialog = QProgressDialog("Backing up database...", "Cancel", 0, 0, self)
+        self.backup_progress_dialog.setWindowTitle("Backup Database")
+        self.backup_progress_dialog.setMinimumDuration(500)
+        self.backup_progress_dialog.setAutoClose(False)
+        self.backup_progress_dialog.setAutoReset(False)
+        self.backup_progress_dialog.canceled.connect(self.backup_task.cancel)
+
+        self.backup_task.signals.progress.connect(self.on_backup_progress)
+        self.backup_task.signals.finished.connect(self.on_backup_finished)
+        self.backup_task.signals.cancelled.connect(self.end_backup)
+        self.backup_task.signals.failed.connect(self.on_backup_failed)
+
+        self.backup_button.setEnabled(False)
+        get_thread_pool().start(self.backup_task)
+
+    def on_backup_progress(self, pages_copied, total_pages):
+        self.backup_progress_dialog.setMaximum(total_pages)
+        self.backup_progress_dialog.setValue(pages_copied)
+
+    def end_backup(self):
+        """Close the progress dialog and release the finished backup task."""
+        self.backup_progress_dialog.close()
+        self.backup_task = None
+        self.backup_button.setEnabled(True)
+
+    def on_backup_finished(self, dest_path):
+        self.end_backup()
+        QMessageBox.information(
+            self, 
+            "Backup Successful", 
+            f"Database has been successfully backed up to:\n{dest_path}"
+        )
+
+    def on_backup_failed(self, message):
+        self.end_backup()
+        QMessageBox.critical(
+            self, 
+            "Backup Failed", 
+            f"Could not backup database: {message}"
+        )
+
+    def closeEvent(self, event):
+        # Don't leave an automatic snapshot running against a closing database
+        if self.backup_scheduler is not None:
+            self.backup_scheduler.stop()
+        super().closeEvent(event)
 
     def show_terms(self):
         dialog = TermsAndConditionsDialog(self)
         dialog.exec_()
 
 def main():
+    if LOG_TIMINGS:
+        logging.basicConfig(level=logging.DEBUG)
     # Uncomment the following line if you want to verify pendrive
     if not verifyPendrive():
         return
+    # Pragma profile from the command line; applied before any connection is opened
+    for arg in sys.argv[1:]:
+        if arg.startswith(DB_PROFILE_OPTION):
+            try:
+                DatabaseManager.set_profile(arg[len(DB_PROFILE_OPTION):])
+            except ValueError as e:
+                print(f"{e}; using the default profile")
     app = QApplication(sys.argv)
     window = MainWindow()
     # Use showFullScreen() instead of showMaximized() for true full screen
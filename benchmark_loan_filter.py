@@ -0,0 +1,117 @@
+"""
+Loan Filter Benchmark
+Measures how long the loan tables' search filter takes per keystroke.
+
+Compares the old filter, which re-formatted every field of every loan on each
+keystroke, with filtering on search text precomputed by searchIndex.index_loans.
+Only the filtering is timed (no Qt, no database).
+
+Usage: python benchmark_loan_filter.py [loan_count] [query]
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+from searchIndex import index_loans, filter_indexed_loans
+
+# ===== CUSTOMIZABLE VARIABLES =====
+DEFAULT_LOAN_COUNT = 10000
+DEFAULT_QUERY = "gold chain"  # Typed one character at a time
+REPEATS = 5  # Best of this many runs is reported per keystroke
+# ==================================
+
+ASSETS = ["gold chain", "gold ring", "silver anklet", "gold bangle", "necklace", "earrings", "silver coin"]
+
+
+def make_loans(count):
+    """Synthetic LoanView rows (same tuple layout as DatabaseManager.fetch_loans_for_customer)."""
+    random.seed(42)
+    start = date(2018, 1, 1)
+    loans = []
+    for loan_id in range(1, count + 1):
+        amount = round(random.uniform(5000, 200000), 2)
+        due = 0.0 if random.random() < 0.4 else round(random.uniform(0, amount), 2)
+        loans.append((
+            f"{start + timedelta(days=random.randint(0, 2500))} 00:00:00",
+            random.choice(ASSETS),
+            round(random.uniform(1, 80), 2),
+            amount,
+            due,
+            round(random.uniform(0, amount * 0.2), 2),
+            f"REF{loan_id:05d}-{random.randint(18, 25)}{random.randint(1, 99):02d}",
+            loan_id,
+            random.randint(1, 500),
+        ))
+    return loans
+
+
+def old_filter(loans, filter_text):
+    """The per-keystroke filter the loan pages used before search text was precomputed."""
+    filtered_loans = []
+    for loan in loans:
+        date_str = loan[0]
+        if " 00:00:00" in date_str:
+            date_str = date_str.split(" ")[0]
+        date_parts = date_str.split('-')
+        if len(date_parts) == 3:
+            formatted_date = f"{date_parts[2]}-{date_parts[1]}-{date_parts[0]}"
+        else:
+            formatted_date = date_str
+
+        searchable_values = [
+            str(loan[0]).lower(),
+            formatted_date.lower(),
+            (loan[6] or "N/A").lower(),
+            (loan[1] or "N/A").lower(),
+            f"{loan[2]}",
+            f"{loan[3]}",
+            f"{loan[4]}",
+            f"{loan[5]}",
+            ("Completed" if float(loan[4]) <= 0 else "Pending").lower()
+        ]
+        if any(filter_text in value for value in searchable_values):
+            filtered_loans.append(loan)
+    return filtered_loans
+
+
+def best_time(func, *args):
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    loan_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_LOAN_COUNT
+    query = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_QUERY
+    loans = make_loans(loan_count)
+
+    index_time, indexed_loans = best_time(index_loans, loans)
+    print(f"{loan_count} loans, search text built once in {index_time * 1000:.1f} ms")
+    print(f"{'Typed':<14}{'Matches':>8}{'Old (ms)':>11}{'New (ms)':>11}{'Speed-up':>10}")
+
+    old_total = new_total = 0.0
+    for length in range(1, len(query) + 1):
+        typed = query[:length].strip().lower()
+        old_time, old_result = best_time(old_filter, loans, typed)
+        new_time, new_result = best_time(filter_indexed_loans, indexed_loans, typed)
+        if old_result != new_result:
+            print(f"Result mismatch for {typed!r}")
+            return 1
+        old_total += old_time
+        new_total += new_time
+        print(f"{query[:length]!r:<14}{len(new_result):>8}{old_time * 1000:>11.2f}"
+              f"{new_time * 1000:>11.2f}{old_time / new_time:>9.1f}x")
+
+    keystrokes = len(query)
+    print(f"Average per keystroke: old {old_total / keystrokes * 1000:.2f} ms, "
+          f"new {new_total / keystrokes * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +0,0 @@
-
-# Binary data for favicon.png and logo.png encoded in base64
-
-FAVICON_BASE64 = """iVBORw0KGgoAAAANSUhEUgAAAY0AAAGGCAYAAACHYN0SAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAEnQAABJ0Ad5mH3gAAP+lSURBVHhe7P3nj21ZdicGrutt+IgX8Ww8b9L7ysqqYhWLZDebbLKbo54WWgI0A6kxGAgDCBAgYTCf+GmA+RM0je4PgqBpAuJI3a0mm6YMy2RlVhbTvnzpnvfhI673d36/tfc+d59zz42Il5VFUsKsiH23W3vttd1ae+3jEslf/+dDAeiPhWHCBvaBROIwSPwP47GeYSQtCmO0EfX5U6oTSCie5uHH4fi4YwU9PALyoxjaH7EVaobJ87OjuHFlo0kWR2uPy/PSQn0RpZ304qFyftgHJrJWl2njGjVppv2s18QJfr6C4iQUNxg/G98XHK6F2LH30xj06Ju4iXqBcUimbLYtE/gWHC0Pwry4PrH84D+Yax6e33aXavAQSyS9OJ3B0DI27PcffeK6+BBja/rCxF0ZBYZd1Kb7vASAMKOkG/Ah4CuCE/CnySbP8cMowwFf1hFcmnoW37SJbWeAuAZHvQB/5LsyftyE9df+40e70yASn3gBT8YLgNHQPHKgSV66C0bTAQFtm668hVHCEFsf0vYpE6pDwxZZPaZpLADth0jaeB1mzH3QPobT+vDv+tiB48MHbS98M4v//7A/oKcSdAiOd6UFv9ejIxCNE+LSDgn78hGFoB4EJtWp6ZHMaPSA+N8suMrpw1nPC8QDsvx+e6J+/FuEA1p1OAgaC0qOmGt8TCeoMHoCCMkYhCfzfHi6IcxIsX2F9f9ewO9A7VD8RDp1OKGXw8nxOK4LdS07Z2GIRK2OLkgz/pdWGiR6IGiFh8CLwMElvgzVSRChxM6yQQeuc6k44sFm0IvFQWJcf8Xi/u1AlL141v4OMRyAJz2i7MXslgi6AWCD+e/K2PhXBl8xua8SDsPXJBzdmHr9OsIbWR4KE/o+DgLUfYqYrDDCk/Xv4fl5EjBzybhDwS87z6ILFTAmiyfg+MmuN7RsnDO5xiFu6jDhX8rScKQPAlvd3104JHMT0aIZQac/AdgyceowOuAh2K+uL8OHB+OTMfhRGMv/G4MYAWCkmXWMW8fjOjqN88cD5d9vw37tMQvHNDkyHgwrfc0xRyVWiuiOWNPhWF5T/46D68MoaFtGGXFtSfAIzYb3BaVlgl7AlB1FvzqYSPNJKnvC0ftVDXZo8hmISYoBzlsgEncSvssbEC+M5NZ70hBhRKe7Jh4aIkRjQUkb+oeGQ9F9Am59xCdgIwSOJ3ix0yzKc1w9xIlLj4AbnDBwwA2JfSEOIUgiARuMgLYJZek/yTL6m4EYppVR/Pi+Kge4JPZCvIahPhzP062wMwLdOaaZdAN+OA7Gz4YVJhTTOuib6DjYDPV8JBeeWPCXg4mtZIY2MKbiSW20zgHDvsXBcBCHF6Yc359Kg4GYPE2LS/8qYULlZmmNWsBQuD1/Q6AV+1cYCRFOyCz/Yxg0kp7yJCbTB2ZHcFiGy+yXAlZ+KACaYfIQ+Idl6pBVHwZYpV/tJNKKg8wDWURb481WJPgD4ef7yZHBMsC0UXrAQ4ReqE7GrW/AzwwD8Q5tZv8NgbIT5UkbxFN38xcoCwooqzASdAnjjOII4xnnaNG38X2AKIcHH9mGJ5WPbSRTvLQnqns/AKEQayZiBHskzwPt5yfogJCyICAYiDl6MaRMHX5WxGpBBuPjPbU/xFRlYGLGk4Hjx6330RqK5zSM8+VAy0dojMkMxuFiRYkDixO4KDBJrQ4TJSQZVucl/irhUPUA50AtqPAETBP1sOiT6j6Qpyfhx8NlMKboZDb2ryesyJ+AcAwcbhwmwy+7OAII+OBKT46EElySYSiGJByVBX1JwaWhMFLWOctDy1gyTwR+AdbtguF0E6dvUhyoQPQdzRCHG0234WjXxXalV1TB+QDiT3QeHoFpftkQgM9YfB+Q7+OMbyZtJj0N4sf51guV8PuVeV6+6csngNAY+fCEdACh5cDIl1gfrm/i1kas4I8BpsatTab56dpCmxZFj209kaKIBKSpskMQq8gDxbeF4grGAVFt8KuG8Yk3DtoZNnwo0LbRN1EDNg3gOnLSdPIH5CA4kLMDaXkDTd85etGifkIkL+A5WiYCzI4Kh18GvkJSBrj4rQDQXatGKcCtEqFSsI5hjUN5JFRxjPKQoS7A0TTSNbQPB6zX4duyjKszaSPeQJ9xJiswBKedHefGh0rjJutgiJLzyyEcOw18HAeahp8JeQdMp3hwNINfB0YxmXaanDD9MLYD4jg8Nxx+udEYfZUQ5ix2HbukuDyASz604phAR62AA0B7gGigMQS+ykxLknm+C2BSfUjmbI6HoKbDwGHxngz8ZfZVwkG7332bvt8knFBm3/r8PAyUavMQvjHqnRuBp1DiYFKeS48UZsx3f2eB/a8OfLqwJrt0zBpVFFQI1rqwysEoiJTm8ahqiDCdlglIGXqTgH0TwnAJ1umcVXoMuQwLwA1StEIGTPBvBRwP0fo13WR8Kd5Y3PwYZ8HQ8hIsqLKwyS7Xn4PjJcIw2uhY68zR2o/5fYkeVOM4+PwSSMGs40m0RiWCNe8TiVvckxZ85PiI4BSDS1d+rDNpXqYHYbxwvtLE32SlEU8zHg6L94RgGn4I4tqYKEwuR2ztmH1JG5wxsDztRz0ABB3m5LriM9xEipYzg2kdIBjgKLDf/LIIj+EpDjOI6JDJ8cA6/DFvOEBZiwN8DSPdyhV1JhdpGjB4OnaBQzpAefDKRZ0vAIzgxRTlTt0Kf70ukaIzAl9dKg0/CYd0uATiyVQGfgZ+FsWzKJqDjzRe40ik1Vf6rM9aHiis9Rpn2B7BqD36R5/5rhOUR/JCqyYjw0xGBpmsCB3ikkSdyFerg2W0Cvq2Z60/Aks3FjxMLWzdfuCTGyNrE5SvcGaUbGxVLOKK0ucfIvwLaDLP/ARgZ5LiEgxKGIeJsQ/lOZiQta/C+FVAeLJ4MEGOECJFiBdd72MwqR6mj+X5czWSx6gWsfN4ApAf5cs5xhPf+S+0SKhctJUajyaOw2EGSuvRBfoEQLoHkzYQxZ3Ak+PV8KPBGP4Rjyk+KsMf4kSQYuIuZSQUI2DLxPYhhWEEfB5YJBg/vzzDQdTD81BG4ATmyPNphfhCmO0wAj0s7EJ4Ht+KQ4GOQNAHE3AVGUhKi8n0kU/FoAqDuM5qUEcrAvg2PQkBTSGteyKtDHmkO+hLv9eBDuxhofSRN2BFpj5CsHq4kJCH6IhF0396GqAk8QPlpHww7h2BkR9nwSRZ/wC0+lC8qJ903UIOiFvf7zvtX40aPG2G30es1F9HRHY4jo7v26CCSydomPm2HQ6CsqMw+XM95KfTd7z7PnlWfE3iD/rFZJt8BrQJtoz+mLCrh1FfaZhguKxfzkasH4aAd4LD84FRr66JoDgxeEiPK23G0us7D1x/+aB4SmvUX7EQUzZgIC7PA+UU/6N+9vAjRf084j+B0iBEMyKgDd0fTId4k/0wQKYPIkxwjXO4fkdEwHWaAzewPkRxCK6fTDuYaRFCZcfLERz92Ilg8+ImkebFJDsemB2Mn1d+rD7iwgtwCQE6hcaorEIMLQWEtb9sGZ9eCM8TcmN1hugFPxZcGPyqIoAPgazWhFoZqFcvbmP3nqZFQeHNuLEeKLhVYdCqoG8rT9Bi6vdEqDh6bQhuKA8IciL4O7zwrgxhjzU3T1SBsU7WrQqD9SONF99dHvlngX4f9Vql0e+q0kIloEzaSlBpm9Ex4OqBxtF8HcMnURoMW7qB78CPaxiOPPsQlB2Ftd0aArh0L8/3Ha+Kr0HSt+1gyNGyePpry7o6NOrwLATlbJ4GrU8Y9ds4BHQ0exxHaccXDYGhH4eItEnlfZ4QJC863vvi2zHxcPy+UJjQVi0zKc9CbD8xLTZ5lHg4peHgACZYzp/4cWDqsTgH0XNAtEPjAs9H3aec3xGTJls0ze8nNTyDfIZtkBBXr01zOWMT1OVH69Soy1NPQXlB3OEHfevhMG9UD0bHy3PlDWCCRur14wFPLMSgxuHgh+kHEQ27PNdvjIbrBXjlQz5pQTAmqTCoKPRuKITTCKuwziAtB2ePgALlYdpCK8QzHtTSSPS6koLSSFB4wx/AQZKrNaBCHE6tIS1EoNCmjx8qL20TnCoI1kkerIPiSNg7toYq0IHPDuihXtCnwlJlRaWF+o2lY4H8unYTGGT7PaURHUsjVCynTlk8idJQDz9qZfhp9F0A4NNhkFUi7D/IF4y7w9GgCSjPtj9Mni2n6V6rEQ763SU6ug48+i4vqBvg+ikOwrTHccL9Gw+GNNsyDqZNoVEMIMpjwAsgnl+k+ZsCB5GyAcTR0CQvPQ4ltlx8mkt+MqVB0Lx9EJAV320GTD02P465OFA0JXwwBC0zXhCIKat82nQzWUYdM4Jwmt9PYaUBiBYeJ2aAxfA3NkE9/OgkcxBKtz7LMdmPOyB+tB5HQ/GDPE9wOIjGAbojZzLzHG3FM87nb1IbwvV6EODDtzTdkZNAUSQyVBRpGahgRjgDhZEtwKdDWBUHLA/i6m7fCKEhj4doUfSww+9CWMOloDySVBh0EOCDAS0Ae2RFK8DTNvwL+FDfXEvR6xWZvCSyqBvhRBo8wdHy0ZcLok+1v3pUGFAcXSiLTguuCaVBxWEVFttpBVEwNsYDgADCjI/yiE/6TNQkZhreGFffOpcXAdIajYMd+wCfblSGIT0i0iT8oG+0PxwNpgZlHR484tiIKW/aGNSrWWwJPYunvybqH0spMOqn2XB0nvlxHxxtV68PpgjaE19UYUTWtCMOOCax1SPRJbOOgBeA5oyVIS9+ouuncNkQRCseowmIYW5Sf7n00Zggzv+v1NIgKN3JeKaeSP5BdF32YeonRPFsY6MQ11lM8ydOHI7rK120jrBD8/CjnR4CZLGfQpM0UldQPpwc4snR9nd9ChE+4mgE+JpnBYcP0TjAKQ0VXI6u4hnn8xbicxQ09XpxBYfraLk42pXU4x/wR6FMxQGlMeB1i1xJJF9WP5EtQqkYxZHOcMcP/KQR+H0I7D6UhNBBcEubYXNMlYQCSUB4J6A0qDyYPoAg5zUPva6hAI7Jjx49wafySEFhZPOoHwoLLgHlNUR+ppDXi+GmJHCpE3g0BWsj2YFyajZUcQy6TdTVMnUin7j6F/QDa7UjhE5n/2meOv5DIUEIu3Ri6o0A+Cd/AX4ELEXNM+X4R2RPEKqwH4Gj4wsxDWp5A0qLZOA7R3D5Tmlo3JGxOPqLsE+L4M8ZBcZtnoIr76VNajfB0Q/RsGCSTBsmwYjuPkjII1pQlwehPvFw4vllf4ynE3c/HgNwNCfhRuqc1GeEUB6CX72lQUAlkzBMPTG5+zAdQt8PLwAzcA7MICEhpuh4ZyHurZ8oLQejdtjJ7nA8ZEc71Lc+IJ8Yo0mAwKg4giYeN0l8vl39ofoifERphHH5w0Yj4ON5NBy4FFUaVjiN8OBPKBPeNQGiaC5fBR940TjDqAcKQ499rNIYwh+moCBysyJFKI0ilEcOwrvAtKTMFJIynehLGcV3wOPOYCht6App4afVNn4Xfr8tCQjyJC0AKBC93sEjpAEUB6876LUHMoUfp7jUB+E0FEaOdVNpod5CUZLTebBUljYU1oCWCv6T0AnJNpRCqyeJOqyMRl2GrYYM2vA7DSgO8kELB031B0mDWjkztJ85H3Tc6Ki4EHfKm/gMuzvItLxNN2ADzlP2DI+K5+dr3AMXD3zjhfAY5j/qDvgE2BaY8Z+kNHxcolmEsXnPuMVViJQnaD/5OB44XkI0LJikeIHs8kYQg+SB8o//oD4HIORKuraOcNhnNqhAuRJKGAGSJ/aRA5/YJBxDKJI9lqDg92kqcfqlP7ThEcQUCkG4deOg9e6HE5O3H00/66C6FcIDwCAbHVd0fIIhHkqyLYkpaxJtRpCPgIc7aQIrKGqEfgRfy4eTFLSUn86oXzZab0w8SNEAf+B8NK+M6T+7qALBROEORwFGXHVE1gIjFwgxz0XBK2/qsjRZloKaxz6ZjDpexxhmSpLMLkBoT4lMQWmUIMSPQICfKMv5k2l5fikhX1tA2kpRtqez0sggjBVKwQy9AuulL4OMmgHqeGuxHikhz7TROdaPgGfp6DEZ6cHKSZTmoDBQ/9yUDBeK0psFbzPIn4IrQbkBd5DOQAlB8UlKhn0y0UfY1Q2FwvaiHtfHdNoP6Fd9uh0ueEhQ80yaXkNJ0pnbefV6jh7dwZHHLB36KweriA4WmJaj8wfB1hckMe6Dy3cIcXgWR/nUqJdH0Hyb5rIQ16CHGyrnBS1RE3YQ0IOv+S4awfNBs8bzTRH8xBQN8gKIQQoBx9AGfUCiS6avYQ8vzHeAEQ/IUmr7oJg8izABb8TRCKjI4mi7tCe3NAiavz/SpIEz9UwoO6FMCH0STgjQvCiaS4Dnt3WcT1NWcYIiCETQRu3gjsAGFcK4jr5fZwiQ79BVWI3xM6JB8HcWIdoI+nFS9XFV+IUg2k4rSMbQlJL6zGQdZtdofQogGw/KUqj5ELoaTS8SdwXJI+iocARdI7wpCCEUIfyoMJLZnPQzBRnmoCwKM5KE0khMFaU/n5SLR/Ly3dmU/MPFWTkJKyEPerVEVj5p9+WP92ry0+2WrO/Beqhgh69WR1Ok2TL+EHGUSQ4GcLA2YHHQ2kjog1MDthwKxVk8KelnoSjK8yLTcAUokJmizM+l5WJuIP9ktiSnigWpwbr43l5V3mp15QaUhoAH2a5IqtaSVANWR7MpXT2igvLgNQ+tC8pLrRS7z6Qyo09wAfiJLJQAeVGlAQdFYZQe+k2VrOlDfZCRY0MgfVvXsGusKt4AYMbDcw7fQTC2Nt1le3juGgcdU6Nzk3PCHIO5NJNvPJ1hQTjA8YF5tkwALk7fy3J1R8HUYeqKginCOa3REIzTi6fvQ6j9DpAWLan5SHS8jYB8HlAPs8d4mwD74I5zZUGT8RPJ/pKWRvAzESYNnIEJeZPK+MmH6iQKHht0gASX5OdF+VSsANF5XloImBggWQjjOvpeUhh8vtThN4Ic4tEPerQ1FKoLlExAYZyul68+f6I4BExdm6/PQzCiAh3CiMKJjoJdw9jZRh3znEBRH6Sc7xgI0uBAW4WdE3i6wwcNVRxZGdLKyBaxc4bQLuQkAeGcyCNvdiD/4EhO/qvFgnwDCnCl15OFxECOdvtyAcomnU/KHqq5B34G1aoUkJ/vQClQePa6ksauP4PqM+AjkxyC9YQkIXhzUFaFfE6K+bzk4KdoaQCHCiwDCyOTB+1sSnLAP5Pvy2/BqvlvZqbkedB8ERbGLBTK/WZNPgfNLIR0GukFWBtpCOqBXj+huDCiRelq++Gj3YkU47Zf8K99Q9/2SyKD/qD1BUWaAH90elQGp3GGebHe3eXF8aDwVqVOR2J0AMeGlxSAq58/fp4bP4DOC+uCVJePNhgByHx6AYYGnXA0yfgZZY+AaV45BY++D6H1EoFJefvVPV4mnoYPsfUgbSIlBMJlGI5ix4DRNiZ8EJhpFsZ3aRbG+EbUVDFK/5VZGswe7yJXz4SykxrvJx+qg1BzFA0JfhJ3FNHOICiWzXMFXJoPo3bYnUuQH8b16ZsyEYjwxXh0txOiEUYmuoLhYRRnHv+DOpkHL1TeIatnhYifr+CUhhXkVkFQ8AS7WgozVRI2HwW0Xv64O5eGZlfLZyW4czfn6ZY7x4cKTDg+rQ1aasmQvj0WSmYLMtBrCbAySlOSKuZkUC7KzJFpuXI0Kf98uSD/eaqL8lAqUAMD7NKTqIMnQnX4f9keyL/Za0qv1pZUF4qh1Zce0tv9gbSxC2e4B+UxN5uXB9sb0kbdKRRO9Ayv3MkrX1AQU7Bg5rNT0i5CKENxpDJJeS7Xld+an5XXZIByPd5pKwNYRX+0UZF/2ehKqg3FtbUnlXpVGp02/BoMnab0O7By9LZcik9rWQQ/GlBwNof2CxUB79qiwoBySFFJQMENOCbaj8ChcsA/i5H2gFYGlWS3C8MK/cSbAKDEhryjTMeIiOE6FVifDpHzLbhxYzLr1LA3n7Wcm88mTN/NQZNs5wqz6dtAhAPFswgGlBZ9L2xhTPBZIE3mRWkrtv2Jrj3COL14+j64MqG6kBZXkjisV3MDBPIZhx0DRJvQ5gMhppym+OkIur7TqFMahCAwTmccDsFk3OCZOvYpG0c3mnSIuokzXmyUwkHSjiCWh+jHlVeNhnEIo3aMJr2BMO4YvShE+SSP+Pdxo3yPAGVt3PAwiisR/Ds6wSQO8gEOWT0uegT8fAU7dSEUjMIYnZ8PIMh5UVrTIMToVHmoAEHNUBJDSk5eXOZdQnrcgzDP8Smg8B9Ux4AKOx63oB0Mgz89EuJ1jAwUBBTGkLfX5qEwCgUplbHbx85+CdbFt5bz8p8uz8q3+cCe5GXAnTUsDVSKllFZDeXPEjn57/a68mB3R9qNjnR3GtJpdqXVaEsbFkkPO3/eSfXt587Jex9fk7UOFAvY591Nyi53+BkoTFogoF8ulqQ7U5B8OS9zhYx8s5iQf7Q8L78BZZMALT58eCudlX+1uSv/epCU2UZSsrWuZEgPSqMARbOzuynVSkX6EOZdWD5dCPNOm/x0pct+Q5U99E2f/UNFDU/7Ra9VQGnki5JEX6ThkjlaYinpgz8eo5mL4iBA5lknlQPoD1ttOCgqKCtaWoN6HflsKIE1aC0j4Dxh/fxR3wT9eKzSUMVl14fiMgdxV0Z/RusnKAkvxAGTtawHLh6TFyd3CKTJvEjrbHFTJry+DIzTi6fvQ7De9NcDpEdLu/YrBHWRz4PrUVA0/BwSPQRjbRuB327TL0a+pJKnX/xDlzW5eASIeCCyqWAcDigcVyiatE9DAwDOeDEvBUEX89M1ZOOh/BGKB0y0GX7+BHqxgLxQrq3LT4vyPYJIH/u0LB0HAY1I2gjf+g5ChAGI67MJqjiMnyxhR5/lMUhJEnm4HASY+rAGmA6BqU9rw/EBPdahu2XSdgKNPHD3TuVAYas+XQLZCVSVgqHB8lRGpAWa2azksylZmSrK8kJeTs3l5bkpuALiPdKE8KQMI8/4A7eoeCgfDdPy7xs9uQaBfQ+qZGOQlm3JSAUYjWRWWqmcNBNpOVHG7j1bkgc1Cuu89JMF6abgMkXppgvSQ7gFv5IrSB3KoptLY8Oflql8Voqo8wwEeSaZkQZ4/zfdlvy7Vk3e73Zkb68lzd261DZ3pLW9DUunKadWFqW1uy05KNiFmTmZn56WY0uLsrK4KDPlMhRTHu2HgkZ+l3d58doH2wSlwXdumaOogh7T8drKEPwMSxmMTQ5DkJbpbELSsIQE4X4OigSdwZFlv1BYqcCipUPF4oDj48CF6UXT4XQG0Q/w/Dll8mwkFNff0Y96QUnrqe/TiIsHyAAbd9lxEFpLFkySTY9km6xomWg8CvvwgIw4apqmAZcbpB4OgErKrlScMz9hCMmAGIiXG7/2fzazBYkMEEkT9qMUgvEO8qZfDABZz1Qng2M0TusHEK00CsiPw/A7wedTsSNpCppsy3jgNK9BsH3GWJBuIIjj36ftty3gyUIwBgDj23x6EVxCqHw07EfxF63XxXVXw8oYdzSsr/St8FfLgrtcnp8XeF4+BWG+KOkyj46SEHAZGfBhOez49biFz0B0m3qL6aDbQFof+mJgcPjcBEnzgTwyAsHF46sBXB/5pJWCwCxgF720OC8LSwsyMz8n2fIc8nKST0DYp4bSSPcgGFvynx9bkX8CkjzK6kPh9JNDyeiRD2gPEvIX2MH/q+0d+UmnL4+gLPodpLexw27BKlCLIitJWBzfLDYkDWH9zvoOLBFeBOeu3YxZFxbEkBe10RcJCOGzpZacmcvJmYVZ+UUPigFkVpF/bHpGmmjDz7o7UoWC7dbBxybK7HYl0a5JslOVbnVbilB+L5+7IA8+/UJu1XaglKBAwXMJ7VuaXZBiqSDTdOiDFBRHrVqFZVKV7WpLWlBMTaQ3pqektzAvwzmMRQ7WVaYjWZS/iAF9vV6R26m83Mxk5eawLQKlmajA2mi0zE0AfGal1kAYebACjfKAC5QIGo1/E2TYRtQb5QVzcJRkNgZIV0pc81qe1AMMhdD8JTDqygUEnW8hWsYB64wD4DPHtcqHsfo9MFmjfH/9TOThAJhUX4g3oET7KQo+byG+AIeqA6A3nQDi+sVBlFYiaZVGtDP2I+K3RYMRovuWBRhGw2V8IJOkEe0IHxyOwgS8uI6b1JkKPk0LBn28zIg3LgYbJKBACNurz2/PKAz8cIEgrn2g1GyCevixUQdjbXJxiz/KRvs8VFeOaVoPK2QS022e4nC8qDSgMIa8awcCVe8Y0mcjFuCvSGI6iU1vX04UUoINumzyuKcBAcazc+zsU626pDoNGbahQOj3kZYYShqWRYoO/ZiHhcKLzgVYMOXylGSzOVgYvH4CvsFCD8K01e1KDbTbPSgEWDbpmWlpF6EATuTlP54uyn9bKMsClFpan7Rmg5LShCD+CKz8sNqUtxpt2cCOvQJa1U5P6v2k1EAc6gzoGSmgM04n6rJSLsrObkXudpOyXW9Jst+DoiNOUtADMiVdmU105czKvOQyKdmGIL8OxbmZxe4ewnwau/8ulMbjLtQIBXMFyrMKJdjGDh/Kc9CuoC/QU922LKLdl46fkPW9bXm8tSVd9nkfeGC/DUXHi/NF9P10sSjTsD6oRMulOVhBKSiOhDSheLpQ4P0iXHYgabiLsMi+i775zqAjd2Fhvd0byP9Q35FtsNJrdKUPpdNHX+hdZOgXVSBUGlBMWjF9H3Q6cC4434TH554n6qzSoNNU+poZYChEafB4Mpj7Dt9Hidbpwz5KYxLoip1ULJLnr9tJZQ4E8HJQUbMm9we/33xck3xADRaHD4kepi6Cqy9QGoRRhwD26WQt4GWPTRzAfkwcpDRcg0L8RMB1TJQXH+L4IkxKJ9Eo366eKIQnj5/PeEwJ0vYS/fJhdkZx8jKuNOiHCiAajgf56oXp60VUBwhy2pCXsXqIB0fafI24vn6c1xaKOREeS/FJ6MK0JGeWZVBekexST84sJ+Xbcym5B/x39iCYN3rSqUIQQUDJXkUyjZpkoCx4ZDKNXXoZwpbHTBkoDSqHFgRYA8KrDteCsulDsHd6UD5gqAkh2E3mwAcv/kJs083PSA47+k4evC0O5Y3pnPzfS2V5GcJ1CRZNBtOsncjIe622/AtYAW9X2lLpJeWFfktWQKYz7Mj1fkpuoAMeQxHymb08rJxuIi3PQTBfqNbkh1ASj6CgsrWm9FpJSfQSUsaO/YXyUE5LUz7aTsj9QUG2eDcXukdokKWoCDmXBtCZHRnwgUIojiSENW+z5RPhkNxwbb3Gw2suRSibZxbRj7CuPnv4UKpIb4MC264TgcCxQJjDM5UvSimXk4WZsizPlmVpBgoFyjPJozLQ+kfZvHwbbUo2UQ/GY7uQk/96Z0/ehgJ/hL7p7LalqcrCUxpQjKosnAsq9sDNH+uPz72DlEYY30RHaRpXfDsnbTwE0bjDs8ExGMMPA9dAbDlANM+tW7Y7pncODRNlkAWzJg8Crk0bjIH96lDamm/cSB7tDyoPokrDZ1TpxFRsKtRgAFEG92vwgUqDAHoHNYRVBhMrBiZ12sTOZJ026INBD5cZ8WbLAGmEYUJ+NQ7HIfnlfTw/zjJjwlz9UAFEw/Eg33k2Tnp+WIFRpAX12Dgdx8m5ARTGkBdeS1AWvM2VVkZ5WYYLiyIL0/KfrZbl/3RmVs6mulKF9Hy/25T/96d3ZG2jJQtV6BcoiQIEFzfrA+zwa7u7sr72WPZ2tqUJQcoze4op3oKaZJ1JKCqEoTdE3+mE3fgQlkUvU4Ti4LEYFVhJUrPT0s+nRGaS8up0Wv7+fEHWQCmFMosQlpuDhHxWb8s1yMY9Hs20IaBRVyE1lFI5JafhjmD33hrk5WGnJuvpoVzv5uQSlOR3En0ojLY8AN+/6PTldLUqZ6DMprMlWW/25bPH29KqQSGks9KkhhqCZ6gAc6ss+IYCSsEq4p1KvCFgCEUx4HunoEj09SG6s9dzMRWwOfTLsZk5uXDqlFy9c0u2Ox3pZNJAMaPFazz6h7HJJIvoFygFKPD0TEYys7CuSkkpYmwuzM/L/7OUlxdJu4d+SnakCh7/RbUj/9/Gnrw1aEt/F4qi1pVEDUqr3ZFhqwX+wKc+x4GRoJsImC06R2zUh19aaRDPzE8tQxpRiNBg3KWMyYwobgS05D4o0XzSd2nBGvoy4PEcB6znMPTdep4Ek/KVNvNQ0VifEfahm0qsvjB6TiOCp9GYwiZdgwFEmRsvNQKDux8GADj78K1g8iNIXnRSh02cKJPwNTmSF0RH6WP1Ie6n6IRzOEFGtJ3j8QDZpUfqGev7SFwBaS41mDAONAxH3zqloZKPzyuYjwrpcwB5c4tnUi++LsgQu305VZL/+sy8/ONET2b7HVmGEDyKsrd47FSalmOzsEYg/bd3duXaF1/I9Rs35O7de1KrQ4iCmQE6Rm935QYXnHCT29edrhE2tDjItU5uTxAxn7f5UgCvQmivYLf9qF2RdyCPr3UScnO3I+9CMH5c7Uq90pVetS29egeb66FUIKB3IdAz3RYEe0dmCnNoGgQ+rJA0FM1l0Px72Km/NJOTM+UsFE5VjiP/+MKsbO7uyd36QB51Yf2AxgBtHqBcojOAfIYQ7vYkBUWRgIWR4LUDvX4AZdGuQoHQwoDS4N1V+owIHJsHIU310YEA7wP3/PkL2Pj3ZGd3WxWo6QsqVDOOAyjmLqyoNiyuFhRyA66WTspuOiVNuJcyAyjwvGR10sFiw1jckpTcb7dlD/XnoYgK4LfY7AnfzdVjf0PJ8S4zPZ4iT1GwXW76X1PGQIfFgplD1rFAEHZRmx6Km7B6Pj4hEme+OhsnjJ5rCeNOgqDOCaDUfRSNRtK+DDg6k+AJ6O/Xhn3bp3lw+9UVU35fpUHQpNFPADFJYwwy5pwPBi+aOgH2abSjQnoBlof+pJ1pNG58GYPu5QVBPy06DRAz/wY0ABz6QSLBpoUACRY/QHY4EeTYdvIcQ1c+XJCNgI/qytH3w9zRqsJAHMKGt9LSyhjmzINkSez6qTSKMytQGgXpH0vIP58pyMUOdt2pIgRgUkoQaj+vd+UXlbb8xeaefHprUx5tNQUySngdWbDT5weRup0WBG8bQpe3tVJYmbN8/tD6oNLgqzT0wjpEZZrPe5AvZXeo5/2lblde4O23+aS8X92Wym5aejsp6ewNpVUBnQqEIa2MFm91paCGeIawT0F5bILPG3DXwFM62ZcL2YR8sziQf1bKyR9ksvJ0ui2vJjry3UJW7klW/mS3JTchfKswmRLtHiyHFgwGtBsWhD7/QIXA46dWQ4bNBvSDsS5SbSgLWF8J5HNHP7rFFXQw8VK0rNCmAdpTAU5te0dOH1mWxamiVFt1CH2Dyz5CCb3GM+CdUJmEpKE4c8m0FAZZKJGMVKHbqfhmwf85Kq/uQCqwWP6SL0tE2fPDnJyVtBxBV5TQjlq/Jw1e4OctucF1DWUO8wBM6Zyw80Hj9D3nA/kkCtMpwBEx89Mm2vJMcb8ERXFxl+zmoAICQZhAujboQ2xiPLAfwzTHYQxHoweXOxSA14lknpB+rAwIIL6v7BADkHnY+kDoQKXhQLOiNcdF92XeQDCJDgOHpmfBD+5TVnPi8ieUMcleXhD00+ImAVJcol9mDHF8YNU81zSb4fIjiPHtHE0JBUVBmo8bhK1PwaDCgQ5pDKdSksRuls9kMJwo8HmAnOSKRSmU0zAyhvLNKZG/N1WWEyok+tKFkvkUcue/q+3JB42utDa54+YDdVAOzYoK2AGPQ9oQtDwGUUGIKskeJKd5nQYSVHswiHzwQ4Gpyfyj8oASyaUGUoayuHBuVa8F7LSgJCCzB62uDNotCG0K9I6+YTbBW0v5bAIFpDpYCawA9Q3SUDS8rpIcyikI3ZeKJTnOu6sgmClD57tJ+VNU+UP0TQeuS8UD4Ntrh7weAPoCq0VfhMjjJ9TLZzE0rC9H5NEPHYhgR28bYoDt0jT4aGeSvECxrG9vSWl2WpYWlqRba4L1LuSweRmiOeYBAQzRgGGOjd6sAIZRnjeEfd7qyM9A90+B+XO09wgUUwf+HfD1CdLXoTCg+mW6mJZjU3mZAb10GzxCyfSyoMO75HROgIA6hlGXmxvKg42HHJNNvq4Im2Z45jw3vgONenENurSQ72B8rQQwMSMMhi8bmQCaHaWnxQ4ue2iI0PdjzGL8MI5AviaViQeb6yOMIY+XDisNgF9pFMaEUwzSoQZD6RyABOCaOuwAxfE2lhaB2HxNii9nsmxegBLBRX5caV0woYxonGAGPQSaYBNdXgQpvp1OIo2APAS49K3TNAgB83I8CAse+UAImXBKUlAS+g0L+IVyEUkJyUGonFqZlq+fOyrfWpiTerUmDyCM6sWsPEyk5c2tuvz3e9tSrfcluUGlUYVw3ZNku6rCm2+XpSDVjxOB1aGeTSFAJaJKwwpW1SSGZz16AI9D+9Aen19I9lvywjOX5fHentx+tKXXc7v46WFX3Wk1Iceb0oPy6CNtCJ9PQPPisz5wSMGfBC3s+pOZgh719PJpOZ0bykUIvTP9lHTR7CF27IluQr4PXt+FEighzr7sop9gh6nlkoAFw5cQ6kVu7thRT3IIawbtSLIt4Df4XocetwGoFJ0jHQpagCoF0B6gn3drdbUazp9YhdJo6xPkfJZFH9zjOKkQRxnw02d/gMaw05ddKN/ryPgF+u8d4F0H31dAl8/LbAP/U/ThRnsgze22dCobku+1ZGl6WlYWlqVYKElz0JU26kPzocTM0RjnA5+hSaIe+hwL9xCmKhENsynkiQ758HV+WZ9Bg2QgNg4HTA2Y4ybNCiCYww6ULvHGccfB4droPjBWD0GLoj8OUf6XBk4LONbH6g5yCofE937gWX8S+LiAkNIIFZ1Ax5Q3mfx1zseP62wf1zQKf+NoIWA2+y3oiIPwkW8ojyB24D2I5rM+kzS5nOYHOBE8ZO5TcoQeIHlpCtF2Mt8muPQwAqLhuAHtOQuGhl7UtoJXhY0ucqRBAPDBOn32AAJBH+LTOPKxa1VLA+WzuYzk00M5c2xeXr54Ul49eVKaEJh/8nhT/k2jKf+625N/udeQz2odqVUbcnWjgR0yqq/wPL8CpQGFQaFHoQpHAU4lkYQQdadpbIk6ZV9Hw/IKR6EK3wiSJNgtyPGlOVmcLcvbH16TfjIjPT7tDHpqSXBXrxd2WQ+vI8DisBef1VLhbbnYnJs+mEGTB1JKd+Q4BOqFQlbOZfqS4Xc10PZ30hCw4PlUOisF9BtUoFRgdQ3zOeUy20OdXezUE9idU+gDVy94s41QFGwTnz8xCsIHxq3TcYRD0FgTVA6oC33GV468dPkylGRfak1YaBw7jJF56htjZceSNKj89WYChLU6+HxK/F7WWBsvQwkl0NbOICn3YUHVYSFtVOtya30HflVK2BicnZ2TY2hfif2HvuRDlpwfqjwIoKnzjg7VjsYIjm3w84M0LcgfA5o0Hh/NZyZ4+QrMt0EHWgd905MhsOkjx5/JEOY5Ai7pABq/UkDdh67d8hmLbxMDagcSZc/CYWGOWxqe408cLZMXyYmN4jeSrsC6kR4M8D6DwBzNdT+TURVGEw5A9H1oO4jimOj+5ci76XA4H9XSii3NPJcRIHhpCtFFwXyb4NLDCIiG4yNgWSNIzKKm0rCOiiIJJUFhAEGi7yuyYX7AiLtJdSiXxk5zBcL55NFFuXzulJw8vgK0lNx8VJGrD3bkbrMvW4OU1HtJ7E6TUoIALTVacmsTu/06duBQIAKFIe26XhxWQcpdvgp1s/MOhJGGGLZx5Z1SCcB7Yq1golKZgsC+eO6cXPvsc2l0eE0EpVRQg67WQeeHYeHo3Uq8VkIBDt7QVm4bs/g7lRU5V05LrViUz8D/p6jqaiIn7zd78rDelvdgRNxLFaAYROZA5SiUQDGDfsyiTA6KFXxSMTirEv/QF4iDB32Q0bWJysNBMHb0bTkdMygMoEO+q/Joo/yjR4/kyJEjUs4XpAVrjbtd1qVjxzKU3qyiD4uCFhyVMZUy775CuM5xhjWUyyblGJRftp+QbVh4TVhgrS4togyKDmVje1O293b1AcnCDI/HFmSez4ZAgaThBhi3HsYisFy1DbZtDOInSNc8C5Ew/wIgqos7L1KecZ+E0qDTsOFAY0RyLhq3SfFuRCvWOVC6f4vg1X8oTmL41dGaVPgAomNKwwctO4GAyfMyJ+HFdjDTIumHGAg1CQ+BpxjE81Dj+TAQlxfQmAR+Vlz5uLJMculBNgIR1HBZ5tu4S47QntTHFDZGACFflQKVhVEMVBC8K8dYGEhXJWEsDT160Gk1kMWFWbly8awcPzIn5VxCZqdLsrmzKx/dvCcfbLRlowNBA3mYbPQlBcfbOE9BeM1CaN1a35MOHyCrUVnwKWhYGbyuoLt/7OAh0PRiNwQVuI3ZhCOBvCv/nkOcgvvK6ZNSqTXl0eYedBCPm8CIKiKrKNQ3cfOBJVg3VBYoy7bR4sihvXwp4bG5BXlpBoKxUZUftAfyUSorP+on5U+bA/nrakdO9jLyk2RRfgYypU5LLoOPF8FzBpZXMwvhO1s0133Yt7B4VIizHvDKO55oTZkjDdsmH0JxG3bjptt4zv2EdDGGfBp8OpeTU6dPSR0WR7PVwlCmqRPQHqMoeE1CLR1e9NcL/rQWeHdaWtaTPXmQ6sjTbWwEwCeVZgNl67zzi5deMC60StqwtnahZNd4h1ujAYUxkEuzs7IyvyCZTEa2MZ58AWIW84dP7XNc3JENvaiLtlnn5ShXPZ3H+NdpoMm2Dy1E53koboNM0yB/nDsQWAZ/h8WP8PG3BtH+sP6hAMjazw6ihfdp475Kg+CK0o/S0ahN1HzrzE8YwgMeYI7DPswSzPAeiGarCCNpyQnlohPSwaT0ER3SHMeJLcekWHqkYYOA8b6i5+FovnOMugxOA4pfgK5JpMMlsKbN+TcVBXxVFC5Mi4N5fMA7CwGQlE67KYtHFuRrr78q5y6ck/v3H0gWO825Iyvyi09uykc37kqlbV8Dohe1G9Jvt6UPITWE8FmEEC1JR26sbUqXF8Cxax92eUTV1M+rGoUBQUaFodLOgR8m7/CUN8OnUxhMp6A6f+acfPrFTWnQeiE98MPWc5dNhWDSrOIgr7z2gD8K8RSqSgMtBX6eu3BBjszPyQd3HsvnjYRUePMrj4DqvMA9lKl+SnJD7MyHLcnUd+RxcyifY4fO6wJHSmk5k+nLqfqmvt+pUS5ILz+j13/0Q0joZ2MRsBn4CQAM2PFRCMLgT1th09BsxbUalb+Vel2aUL5XrlyRXrsjlb0qqsmoAaMfeYKA5zfJVWmifQOMFe+gGtTRft6mO0zKDlibzmXkDUyOaiYr26Bb44V69FMabUvClOPY8CgQXSBV0LpfqUgV43zm6Iq8vHxUjkHppBp1aaG/qWjY1hSUAVk2c9K0Sa0hxuHs6rX5BpzFwraZVgIUzfaDhdC6YBkbVLCRACeUORmIr0UOia/g8/F3EEL9NAmiKBOLICOSl5JTz/+hSZ9YSnNcbpQfE48mWn8CmLr2QYqjCQinILYPCc2L6TxNmdSpcfimgIZDECQhEFtuUhnia2wExPWdD0E6liKdClHu7Ohs3BLUJaY4xGcYiRS2fNjMKgoTN2V5sVWtCuCmM0nsIFMyNzcrL7z4vBw9tiwbm+ty4+YNOXlqVSrVmvzop29Jvd1HUVoXEEgUSnqHEB2EMi0GCJ157L4Lib7cfrwpA+xyE/zWao9Kw1yI1msKVmmoc6DthE9JofwjosrCttXmZ8Hnd775Tbl394Fsbu8QWTIUzgNaGx0U5VELeAFt9glJkqiSw08CtLNws9msvPzcs6pEPrh2TarDtFQTkKY8SoOiSfEWpGobVlIf9ezKCrIK9Zrc2K5KBXk7vCMLygV2hZQKObCak+lsQaay/NYG+rfIlxlmoUCgjMGfGRrWT2d40rbC8Xq8HjOBWyo0JmsfMEnDcEynj8Jt9OnDhw/l4vnzUkR/NHa2lDbx+I1z1SBoA4/jeERFq0MVB6+9QHHsosI05skxKN9iNi858LeN+mix6SvUYYlxGnGceqDB18frg4bo07W1x0pzAXPl7PHj+hp4PltCK0UtnUFCemisfhSKDJFnMq7txpzTxiNP+TW+CWuycfxRPAt+GDC2vmw0SA9lMzJypv+N+1LwZcv9TcMEPjUVP6HcfZtkM603sjRiC6FjbYjAsMYjuCbNS4zkR8FQPQhp/3y3eCbCPvkTJ8tEfP3VcABBFIGYctE6RujEh++OXjTJTuAACcAwV606J/C5c4VLw/F2SL7Wg3HsFrU4nAob/vL8n3gQCjx2SmLB0/FTpVzMTOO3MCBOZHqmLKdOnZDzF87KzHRZHj1+KLu7u7IwPy9T5Sm5ceOW3Lv3ECxhF0nBAEWhdz/B8bw+ASGVxO48xQfcIHBnUgOZKxfli9sPdKAGwKelYW49pSCDYGH7fSvDtd/vBwpatDGJtprxNsnPnDurt7p+9Oln0uc1BAg1PvNBy8I8nIY0Ck0C4zyKgs+PKlEuD4B7emVRLh5dkI2tbbn6xRdSRx929XmLOvgErRbaBpesd2FFdWUPvE/Vm3J+el7u3Lsj6XpbsrtdedAYyBf9tFyF6jjXyshrEMir2YZkp4dSm4HlMT0L5VGSPNqQgnBn85I6POQVfCEB3aV3SLEXXZxcB23Wdof7itYhr5/s7W7LSjknJ2YLUqcFMoBlwbM7JWCUJp+90OdH9OWRqLc91NuG98DP/XJGvo5xuAR6t7PgF/MGdiPqRn+haAaWS1/HBOMIvB6C3XxGbvbb8mB7S8qYS28cOyonS0VMR76NOKuWTJvmLfmmBaKmLn3znjG1peAbpYJKtH2mjpBzoHH6nlN86ymuWUPaSzauaZpukpz7peErIfK3CD7/h2yKyij6cAceTzmipsgIov2mUZvI36gzPwZG1R8CDjFAOjFMYARaxeSyZqKFYTThxmEMP4giEFMmjr6mMJ0BL19x/XTnVFlQUcDX14LTQVHwFRoZ7GAZDqwO7LQVjw5lVclYx2sV8GlVqAKB32s3ZX52Sp596rKcPX0aAmgo1z75RHb3duTU6imZmZ2XT699JnfvPpQ634LKzoHjLpRWBn1ek9BjIGTo8xXwebwxDeGxNDMt12/chZCGcuLzGANaGxRcVmGoMLeg7YYj3w7YfvKsvEPAIEr6S/Mzsrq6Ku9+8KF0uYNWZGNNqADSkEYACGs95A8OvJbzWXkBbS4Ui/Lx9ZuyBkulBcWnSkaPsWhBoU28UA/HV4AM2EYI4+bOnhRzOVWIj+/fgW5pyKAGq2QPrlKXar0la6hntwhrA3jnwP9Z0M2nelKZzUmrkJcu6u3T+oC1NoQwHWQgjCFP9RvlCfSPoG/JMSW2NgKOFocCO8EIRuLwjja+xHGvVkPZpFxYPSHdVkvqjTb2CnzbMI+p2C6oI/DB15hwfAa8vZlNQv0dbCpqMG1409c3IPCbvBU3l5YO8VielgHa5JQw54lTIrSMdhsNeUwrbHlFCo0WpmRWFmenZQ4VDGB9drhBwLhmMGcxkmZYqPDYZvzx+Gs0/yc5rToMTLegq9/HQZ4rGlv2lwWv7l8VuBGPwldZs9Zx6LYYPKIfrDQ8cIIwqCZSn0YnMeElGxE/AS8KE+g5CuocXz6qyTDhCRAn2PcrE8IPggjElJlE2yUzf8Q3fApM+kxSh1WlVoVVEk5h0LpIQ+io0kCaUyz0eUGSSkLTTFyFLgQ374Ticw2dZlPy+Zx88xtvyDNXrki1sifvf/CB3L59Sy5fuSwvvvii3L1zT9579wPsCrNQDJhcWPh9CB5+ntR8WxrTjcKYggR5yi/jDMOSmMKOdQVWyhdQGvqqdD67wFtceZxFHC0LRwi1WVOMD8HCoylz4d4cafBY6jKsoc++uAEZDYFNXEdLHRMckAgSlCZ3zX1ZWViQ1199RTYeP5YPr36M3XZKX4zIO5xU+VFZkEf14ahAeOGenQCFR2H78N59eeXyedlafyy7lW3JwIpK8k2xENR14K+3eXNAX7KdniyB5yOFjBRgCdQwRByHdLkkfTh+tnagCh48WgEKCQ9ebZ+SH+0T2yhth/6EgLk91LNXrUlzb1uuXLgIa2Iojb0KNvkpNGOgz1qYLyZi/NhWKpIBL54npQma6xm+GLEnr4KRXAkWC9rbxjxrcnMAXnijrVqHrkbyxxDo8/UkVbS7CSvn6RMn5dHD+9KqVeTEyrLMzs1CsZrrJLzOlOFRIxw/LkU6OrZ2/HUN0BHoqXNpMY6ehZDSUH+0zn4l8BUR11506+ArACdPDgvEZhn1D+kIT6Q0WMpUYcELOjB8x2VYHzBi82DQLgVqqN440GxFDMMBHRnb0fuUCdoXoDA8jh9H1yyMmDyNa4Z1ZnFRWSQyOXWqKPh5T4b1M59540MpjBQGyzFMJcEdOspDofC8mGf5U8WcPPf0FXnq0iXZq1SxW/9Y7j14JMvLC/LKKy/qjvKnP/25PLy/Jrl0XtoQhtxt9ni9QpUFBBnkjU50Ch+d8GbSawsQ53FVOZuRlcUF+eKLe2A7i2JtIwS1PPBDC8XSUAL8YRijzXY4x90oco4fXYGlkJN7Dx9Ll3wcBCDFb3rz1eUnlpfk/Jkz8sknn8kXt+9KvjQFncDbRylAbVvg622qELB6ay4tI1gYPN5RZQKlMYAQTDbqsjA/Kxtba9JP9tE/vMAPXF7fabb06ff1bl8+hbuFDisk0vJ6siAX8nmBCpVNCOZ2CeNXKmFcML5o7xB0oEkkDZMqC6HNT9WqRcYx1Q0FfPaPc1Sq9LWZJr8J/qu7FTm3tCyldFIasEAGmDfA1P7jr+k2tpntRZBDC2ungrnxKD2UpzGXvgXldgcFqtxkgCatSvKV5lEVi6Noss9jJgB443dUKlAMj1t1efHMKnRfT37yeAPdOZDzi/OyDMuqgGFsDNrSZpswJuQfoaAdpKW/GqDvXKTd6lhwBK6cHucpjOOMAxF8JBcHNVsP140Lh9yXAG2rg9D8nwys6UncZGDuqE72l+LrDzcDzDMuoLMPwSdTGgQQ8yulH6Xv8vwch2eS8UseTYQ/k8FmB+X2AT3C8HFMIetPhjEhTphQlyNpgAHrgjQLKD+eZPE82hrSdOu4iOhoPVBh5AqS4Ffw6BjOF0UKRUkWy4jz86dQJmqJWGtEd6/cmVPo9CQN//jRZblw/pwsHTkiO7tVuc5rFHfvytzsrFy5fEmKpbLchnVx/cZt6UIa6y2c9hipT4VBYe8mOv2oI4B3bop58ZkfFlpZWpLrN++ArQyKU/hSYdBZfEJQNuzcURrbQp9HJOVCVs6fPSef37wlNX4wyPQcaAQ/BmyySRvIzHRJLl88L1koss8+/0J2IVQzULZtCH++ENC0gahUFBSm5BG+WhzG6YV1+DyO4+692WiiL5f07bwNKBUuOgpKvW4A5cFXoQ8afPHgUFqtAXTJQHg3Mr85Pjc1JWfQV0sow5fzdmYKMiwW0OcF6bPfYf1AxSPMOWCdHdORAAW/vq8efAjwNsZtq9aUMl/rAiXbhjXENwv3sDj0hIm+NhiObeYxHJRUF7RbeR4hicwW8nI0BeUFfjfgzEsZMS9YhJVZMLdK4w9ledxUQdt5XLW4siJHoBi3d7Zlk30E3gqIL6GdGWw++CyNa5+hYcG1R9vk3MEQrF8WNT82znC8c8FoXNMseMGvBtx8PyR85fVPAG03fRONBfaxwxlTGi5jPwIEnwjB72wHJm0SJS89rrAF5gS5GtgfV399FNKeXEQhmHQ+aNI+Bf2sODTQHEu29ZilZsGuX03gjtIpDFoZTklYP1koY3c6JVKelkRp2rxpFoolCcXBN9Hy+gFf8ZFIYGeYHOhRztdgQWQzSbkDJXEXVsXjjW09737x+WdlcW5Obt+8IbfvPtBzcMoP5QyTm9ctzAvsVNIYp5Pe+O4ibsA320uH7Dx2kisry3Lj1j3d6fe5W9fdLRxpOOeANOgIoMUHB1XxQajosyTIe/WFZ9U6uvNwHUgOOQKWZpo3CYC/Y8dX5GkoxVu3bsjDR4+lrcctZANikxYG0PXSgVVoal2wXWoRQVlYhYENuKSssuPbd4foZ5Y9srgojzbX9NkWcAyuSJx0IGB7CcnQwGoOZK/Vk/vo3B3Qy6FPn8au/EQ2LaVcQtYwvLQai9kZ6WO334dlxgsM5oE99iv7IIluQZx1sI81oBEXMGG4PjjhhegKn7zvteXS8SWpQonV+awGFQb7iEX0di20jbfXImmIvAbGqga+6lDy38AYTGNe7cKyq6NMixYYcVGU5bhB0zvB2C/41+srGK8dkN3Y2pJnpgpSxKbk5u6e7KA8j6+m0K+nsJkogWYDioPv1zJ3TZm2gkwQDtrmwiHngmbOuQTtGf13cY3GOgfR+K8CtF1fAn7VfCk8QQc4ORmrNBwcRMsRUYhB1iQfJwCmRdJj8WLgALxggMbwEJ9Q1E22MdivriCLZWPwkBZXWvnjwnWOQETSoLBUhQFHZUCFAYtiMDUrw/Is/AUZHuGbZedkiB3rIFuWYaoIawM7Vezo070WdorbcuX8srzx6qsglZWfvfOufPHFLelDkHBnfWxpTr7za9+Qza0deQt5VT5HgTpb7ZayordYtiHtsKBVeJJj8MmjJwoMZRVpusRdAyngrEM1eu3h+LEVuXPvIXC4m8SONtpm55OGVTraZ1QUVmnweIPPNlw4f1bm5+flF+++ByFDLuIA5ZFFMoNmXV546Xk5eeKYvP/ee1Kt1qTbG8IIoGWBf9DVNig/RsirQ1yPpiD8NaxUuS8HHnkkIJ1NbTbqsnrqpF4j6rWpFMH7kO9+gpUAxcC7xfp9XniG9cF8fi2v2ZVtKI5r2aFsoEQZFs/X0N7TvNMt2ZHNuax0yjmMpzmOzKRzkqV1g/pTCUhjOu1LcMWGEpRJ/AT9yYSBPs3dgDW1V2/KM5cvSgldulPdkyRfRAjlwL7l+PJNubT+UgOU6yf1fVqtXFqa4OkkNiWvtHvyGRq8mS5IspeVNDYAfNMwlZpRGiiPqjnb9b1XiCbRrs82NuX07Iy8srQg6wj3YRXfwly7BUuPXx58fmFeFjlfmi3ZRZ+xt/m6mhSvgZE3zgFtohK3YQcuYeRUFsGRjgaR+ncG3Ng8IfxNtMFYney6w9e2r9Ig7EfKVaS/+JmEO84Q4zHYmjSJChqIrEM1jig+raAIAkE4DLF0NWlSAesrzbiyXEbjwDTnTMDGAoXBi93YbebzkoDCkOI0FMSKJGfmZPnYjDx/fFpegjs3h91pjkdSCTmShDIopuT00Tm5cuUChHZWPr76sXz82RfS7Q8ll8tKuZiX5597FrvjJXnn57/QIyo+EMYLpbxYSQHAB/T0hXu6C+dkMs4sRRc3UsLFdGdIKQohxR0x+zENnlZWjsqDR2umBHfwBKVJ2i4MUIUBn46CCEJL6cHP5HKSg9Vw7uwZ+eCjj9VSMKLcA43yZ6j1zk2X9TkTPjPwLpRMGwK7p0dtthzqNcoB9XPHDAE1pOIgUzCTOBzEBAcKOjzA1fNtbSMwUY63u7awm3/pmWfk3u3b4Nc8XMdRN9yAnr0Wwrfq8hsbvVZL2hDiDQjiVgcY4CsBYc1bigslvtNqIEXwkM+lpJuHAkF7uJHXhy9BVW8vRpwHWPrOKdZET2EU5run2FyOLR/M21hbk5PHjsryzDSUHL+K2KZa1LnDNpOmUxzgWLpQ+q10UqYQP5/Jw9JNSxcsrMPvUdFAAfNIin1HNUHuSML0ERQPCPYxj5t7ezILBXF8cQGWbEPfftxCOb47qwPLo1AqycLCIqwy2ke85wDWB+hTeZApXZNskzIIsPSZrgrL5pu1a5y+l+zvEFjOvxR8qZZMqJDJUXpuSTxJRezrA5UGYSJNZJglYnEmIrp8h0B/AnKAMw5aap/8AByKww2KILBf8Tjak+oL0RzH2ZdPO4JOCKnghNJIQNgnuGB4/YLHUSUeQ8GqmDktM0cW5PnzBflvn56X/2IpIf9wMSfT82WpQ898rYhdYUGk1avKJ1+syWc3HkmD33PAAu12O3L57Ck5cWxZ7t69K+9/dE2aUBI51MUdMe+I4qI0R1E8wjAMqqJAWHfeumids+CaR96pOCDkudPUr8sBbeXoMVnDDpNCgKDHIixP3xMCSoeO5VRxghYEQzLJ914l5fKF81Ld25WHa1syYD1xgPL8psTZ07add+7IzVu3IVgzqjB0dbh6KdlV+KLNaK+5cwphMk2AR3bMD9OM8NKQ8sl08JpOSB0WzWKZ3+suy/peRY/VeNGYx1/sC306ms9jDPg69pa+nj3TGki+hp11qy8b3b5cS+ZkA3zMAecV8HIJ45nPDmS9mJRGCYooX8LUyEGo8r1Qpm/12oL2O53bkQPIJML0VJAjn2K9hXKba+tyEhbAMu9owlg3aUmmwQcUpvYH/nhUxcIDWEx1KAi+ADIxSMvrmJIzub68WcJcSRVk2IbgpjKEUuLrUUy9qAs8meMmMjSUGnh7UKnJieRQTsLq6LTa+v3zGvplE+O7DgXGNxI/XyzKAp+gR3oN85FWDD+XS8WMFiMZrbF0lTSD8AzYBAde8H/rMLEp7O+RF4H41Ing5r0D7eD94VBKgzCRFAfSBg8zYIriRj4GDqMUzBzdB89lORwfdd9yMXkH8aP5cBG0SfzpEBFdFz0WA3dOVBi0MHg3FMx4XuBOFKYkVZ6V4fSMDBdn5MLxgvyXF2bk26WCrKDcdLIgy2XeITWUf7uXlp9s1uXh5rZs1VswFLi75SswmvJrX+cxVUbe+cW7ssvnCSg4IZxUYfD8neyoEIfTRUplwbARqkagMJtpyrrGtYgmIIVtsc69KuMYlMbW1ra0ecsqQJWGlrFgCJhyloY+j8H+gOPtweWpKVk6sqIX1LsU7tFOBuhOF4LvO998Q4/f+FqR3QraCRr6NToqDfpavw2rYxwEmOYtHDdsriaXw7iGicBxg59Op7GLX5cLFy7K3u4u6jdfwOOzDAaVpSjogI8kY3FBKA7Nh6e6/KJffVc6jQ5237xjKSubaV7fKMhZtP8U6EwlclKHFVOD5akfwkKdfHuv1qDClAGArSsAxLkbN4wP9ZrDDjYQ/Ob6hZMnpQganTp2/7z4TnziMARFwOsUVDaNbEoe5vjNEpGjsFSf6jVkCxXvoF6+ft30K0sjkeOGP6PMmKIVKx+bjSaU6VCeWl6WVrWCIgO9KaCPfqlDyT6G5dEE6jFYHWenytKrVNQikXQROFBcGF9uIEjfzSNtLoCeOiRof7uMUc4TuL9b4Diy08mDsYSvDkjakmd/R3uI7tBKgxCbh0RD2oQPA24xTYRg4GPAVXUInHg68eUMS5Py4tMVTEH992FSGU0lOhcBd9NUGDyWymBXCaGgd0nBykgUypIsz4jw2sVUQp6aS8p/NJ+RMzleu+CxBxZQOinXscD+p/UMlMVAH9jrU0j22pLt1+UbX3tFb7v82Q9/JAMeeXGN8+IjFmpwtIAZSUXBh7+4L6UgUGVBgeBPTrTHtIiLUwMA5KuQsMoPTi/YIvn4sWOyA0Ha5pEXMXWxO3rWJyEqC5SjhaF3TMHlYG110K5X3/iG3HvwULawizdCyABD5Jvoy0sL8vprr8rao4fy8SefSadLq4Hsg389ZjNt0rqdr87QCoBE2UbbuGD84HEXHigWesijx7HrdntSKORlFrvlHfCpOkrxUIp1s6jjXWn0MUb8HjfGkLv9LgRqsyf11lC2wO8OX/fRGWBTkJRlWDB5PmOTSUoHgrsHf5jLmmse7GcqPqWLsDoTVZ9tZHtsAoV5C/VTidcxLs9duih5zLs2j42AgRmBMsYCI10e52E2yU4hIR20qIg58UauKLUUeEwPpdqDlYLGcoOhZbQacxcV69W62U9wrURa7zTrwzJ7BpZja3dP+uAD9pd0kN/EOuDnfht7ezKNdXDsCJRLqyWDdkeyUJJ95POojWRpgRJ02rHNCmylqcuAiT+Z+zsIrl+/KoiSO6DZpjvHkZ5IacQCCowWhfEOArMg90EOBj8GXFWHwNmXTgS0DW7uoxxLOrc/PxYrgjKZP+7GMdkpLJ3C4N04tDTyEAb29tpUHkqjNC2pYklOHcnKq0sleb5UlOVsRjI8K5eWXMei+dONplx/lJTqTkMS7br0233JQGk8f25JmhDYb//8F5KdmkE6dvwUYjwu4mSE44J3jopC3zmkyiICbIvtEwfaVUxQYYWAKg1eCDZ4x44dlT0I0UYTu2mkma7lL+ir8KQPj6ufzioM0qEV9MwLL4CeuU1WEVmHBX7YiNdzLpw5ocrp6rVP5faDx8ihEHHCmg5RX1EwgV4ckDzrsPwH9cHTIjbusQFGUpKGVdiEYj63sizrOzv6oJ1qLQeonwqaglX/lA9AvyPJXlOSEIZpKI90p6Hv5uo0u7LRHMhnkOR3oTxOQnBfTHflYgpCtJiWKuZGJz+PurPGOmWbeRGbZFktHFlQRayAOjUdP+hn8tdC8N6jR3JsdlbOwYKpY+xr4IP8KT76jq9TN5uHoayXYOmgvoVWTq7ku3IS/HyUOwLrD+OKsSJ5KvXgtSAE8oC6lBfWCWXwCFlpbAaeXzkiy5jDO1AcNbSBJXjjcgsK4mG9Lt1WWy5jrq9CYaVgLa9LAbOFmwTEMUfUgnINha9rDc56Gj+sC0BJefFfIWhVBznbjV8lxNVjfiZDXJekEnxhoQd+Rx6Kb4t+IK5H14RQIqZnNEXTw47F/bUYhxNyihuXFg98rmGUb+oLAGFMMc32nQFm0tmozTW7IBOm46KigFUzG8KGd0gNsWAG2DUOrZUhvLCdzUkqV5Bshq+iSMmlkwtyefWkKoJMpi8PMglZQ/5dKJo/3ujL/3y/Let7DezK6pJs1SVdX5fXnlqFYunIBx9ew5rHLk4VBtjgzhs7YxWk3E1yp0qBRoHhdq0KI75Hjr82jPZqmO1WZWEc4+aaxlBOHj+h70KqwfHIyVDHL7uFSoL47Ac67h4hDPgg4HCYlKMQwBfOn5e333kXLFOIsTSsIQqlfk+WFubluWeeUqH2+RfX9dkLvXWWWNo2ONalxfATapsfHoE2hT8a5njZRP57fpBHUCWHHTfqmy4UJFcqyRYUh36wSOu3juD8YF7QAy0mD2n5QUCr5QHLjHevYafdarb1+tMWhHM1lYM1U5ZjhaJM0S6A0ulxF8477KisdUQsbZJXhx9brcYJHAvWC78CZZeF0ltdPioJ1FXrYp6wPUAzfHG+mE1GG5ub9WxCpqE8TuSnZR4dXhm0ZRfzcdhFzRg33pqsr0NhYfaV/WNYDz6xgPlG4h3Mifm5GcxvbJaaDanqdLS3eVOJgLcdWED9fFYWlxb1eg83Slw3Nb5JmeuI9YA0j920PXTaQDZVG38IRw/YdPpHcFS+GlAxFQFbswH2mQ2GgamH5yUkviaA5vskkcA0NN/4MS4O9lUahwXl4zDFFGeEyKqCsr6LgSdnK64XJ/esEwwO/Pr8SeXcCBALlQWe4mMBw1dloThmJ+6+WyEUkHoNw1gXAqGjlgbiZeyyKBy/9twVOXtkRh7cuCGr58/K7XZTfrq2Je/V2/Lm/W35D1AYd7eH0q1tSbZbk2RlR954blVmMgN566dvSc/eZqoPranCgFCiAGWnu65AsgpaLnSbHriAd9d6C8hjnG1TZWGVgN5ZhGxeWzh+7Lhk0dbNrS21osxuF/9p4GHx6xPr7AeE9VUnUJykxTu/nn/mGfn46jW9HVh5A1XeRdWH4jyzekqefuqyfPrJJ3L/wUPIHN4qDD6oXICr1xOclaGOcQYsxK1iAMfMPQuh4+n8IGjbSp80nHC1fcB3Pq2ePi2PHz/StikfwA0sCwXS82mjLIL64SZ9zUpXUui7dK+jL4Qc8kWJUPhrnaFs9mHVVGsyjXmxOl2QfAEWDizDFoR4Fv2LXgQlbES0OtRLJcQkrQ9OMwwvFLA9NIXHUntUUNW6PHPuvI4F73LieOhxFboxRZ3RHaglsFEkv3lZSuTluQSUWrovtyH4h4OCkH3yrU+y66Ri1aZu45OFpCqfGviuQ1mcnpuW1Zlpub+1h7lfAE9mc9EBr3WEt8Fbo16Vi+WcHJmdkR1sDvjwIz8U1eMuwY6H+hZ0nJh2oCMyg2bOGnBhk8nfJwVLduQsET9NYVQpO8YGPAgQDwBXFt5BRSbmk0TUEdQfLzWuNBzSYZl2cFh814sAE8TPIcq6iXdomECb7WNS1BHCeaOwwsT6kc68EaIJ6gJgCBMaYWNdwGWwyKAwBlQYVBZ6SyPCfE1IvgxjYyAzUyn59jdfwKAl5IvP7shvv3FJ7u/tyf/4aV029hIQTG3Z2hSp7LWkXdmVFBZ6vrYpL69i9zZVlj//i+9LGourw11Zz1zY5Iv3RpMCP1QeVCS6C/f598C2Oa7vdbGxGBesKg1GTBqP2/b2qvLG116ShxCiDdSThhVldoTEN9bFkEdzdBBSqSyUZmIg508fgZAa6osSM8US+g27SjCdglR67umn5Mjigvz0zTf1gm6nraLNtAdOj4A0DEnnGqtK0obHmxEA2xO00/raPpdm+8jF1ZJk20keaV0I+5liURbn5+XR1gb6hWIc7WXVDliWDsUMIEy2lKZJNNebunp3Ugo7f96qy7cJd2EJbKJZjyDA19DuZWwyXkZfnOm0IUR70shlpSWYV6o+jEUbUhz0fcB48TpHB+lbsHDurK3pheo5zMse5hNfm8/rDFR++kosvrcFFs+DVE8e9htyKZWX49m0LA27cluK0sJ8y/Rb5uYD1qeKG2Vt3ewjDeCfVkcbddeaLZlCO56anVOrZwd9Su5p9bLveSMuXzx/p4qWoX9fXJyTGd4SnhrKDo25PuYF2spbhfVaCjozrqnxYBHVMRxERmk25UngMPjOKlBcLxx15mcfCE2ug2GMvoX9qNhuCMGY0ghBXIlJcFjUKE1GD1vPE/LjC37nJgMmqwvZepyv9cbUbbEUz/3ZJDgrVHiEAaFIZcEnt6kweIeUKgyEU1h4qQwWOb9BUUjK+bOrcu7sOVl7+Fh2tjfk6acvSBu7zO+987HsYoU3Kw1pYRE1azDfG01JtRuSrQPv1BEIrYz86CdvonIseAgafhSJRzUDvlCPjaPjolZBauLKKpxjPWirbW/QB1FQHJsPp88N2DAVQg+KolLdlSsQ9LtQbF0IsCTa3edFXCpKe6eY6Yc8knIyUy7KhZPH5Prt+xACGfCJMlAAC3Mz8txzz0kVguXq1U8gTCCk9dgE/1g4eg2DgoaLSMNwJtM6w/K+QNZtJyg62+EB26mbAP7bPP7yKIUhCsVWtarHZo/WHusF8gQEKWkpX66cKToGhqThQI0hlmH70Y/mg0o8kupru6sY2xrqqtbqUoSimsVGoYQiWQh/3iDADYi+DBHzzvEd3NpNcDywUqTpK/IxXyu7OzJVKsvy3JwkeSEa9fFCtXnLL/CpOFJQNLBydrEHWcC4XUBdXeDx7bjbObSXF/jZ/9oG0xbXb/pDH3Xy1Sa0GBpQhuVcQeanp0Xqdb0VWK/VsF60gVO1C/56eudXW+bmZ2Uqn5UC4vzGRx8bsQF40lum3RyEH7R3P8c1OuoMLcvibh4EWRoIUveFMRz2QwQCHM2LQXBwmAoPAYb7cXJflvy+SkObsw/lUDcelgOOShTi0uLgsHgEoB5umC2Y2WKDJmA8pjNAn3EDoyAnms1n2CRZZWEsC8lmJAEhqUpDr11AUNKywGTPwrxPJboyP5+Xl166hKJpuf7FPfR9Rp66vAqrvSd/8rPbstsEvcY6FAAWM3ZovXYdO9G2JKp78tKZWQiOnLz17kd6L/yQt37yeAOLmS/YM3cRYTRVENlJCm/UBoBtP9viO5MVTlOHdGNp4EcXoO/QNCzserst6UxKLpw/Kevb22h7Qfr5KVhURXWJHCwJ+nwdCnbXz12+JI3tXVmv1PWoIt1uyZULZ/WTs59dv6kPC/LJbj64p1+VY3vQEHdtJmijD6Go4S0OXLtATdugFpPJsL5xfrLiaz58WFcD8JtBXyzOz8kW2kFBzJ4yLBm6CvSY6OKWqlJCxa4MeaG1wNebpOjz+IeWB8aTn2hdg/+w05FCvSlnIVhPzZX1esoeFEuLlkuK75LiNQzQgeXCcVKLV+u3NWpDkhC8SWmiz/lerSzmz1NHjijaHhURxpB9nqE+4JEnqD6AFUiL8EJnIJf4jFCiJ59T8PNZDz0SxfhwXNAQbZfWxTo1Aj6xsUHdLbgK8GeB9/TMlGy1O9JiMfDCV7aQZ+K2wANv991t1mUJ5V/K56WKvC30SU/f84L2altge9DKQ3nf6QbOOpfG40jNQznzRwAtpuvYkVeTSuB420DYeRCO2W6OQBRnIhwGMa6CCJDMoes8BOyrNFxlEytExqizARMRIxDpaB0nV/ggGtGykwBoHmcHggoJS9t4LowFTEo2jQs5mDwKCGvcOP3lD49dqDD47YQs3xEF3170FiwAWhn5Yg6WdleunD8lr7/+dbl2fUNu37kjc7NFef65y7K7uycPHu/IZzc+A3/Y7dVaMoRSSEA4JSGQM909efbiihw7e0r+7Pvflw4VRZMvzIPj4uUdMNz5GalldrB2lpHFABBxTQq3zUBcGiGkNJwjwE9hN8qLlC3sCOcW5uTo8aOyjvZ0igtoO9+nRQdpw2Mp9MuzpxZlZXFefnH9oe5qk522fPPVl6QJ/92rV83T4GCdz0Lok9YqVVEfBAsFa9A0OmVDUyKADMuiD2aMLTA/6AzjmTgcfTjTHyijnhVWEMaZdFL29nbl9Oppfeq5BYHOucM5o/xoJdZnWY2TJn2AxuGhbaYMSVPoU0+4NqP9/JgVxpofVBq2e7IHoXunUZftLjcfs3JidhoWSlefzG6kMedIhxsYzgXyz7lJvn1AOoUtn4fhK963alU5c+y4zIPG2u6upIsFfaU55xBvCU6C1B4E9BeYyyczCVnJJyU/bEh9mJE6zQjeVaX8oiWw/jhP+Kd9BqCi503fPAJjL1WAX8PYvnbunH6jpKKbACDD8YiMt1CzL6CzZBcK7G63JeeWF+VEMS+tSgX009KBEuUzSWZOOiWBdoeUCONMBzf0dfyoJFCGvNmxNWPirXX2m+IAn1HPmTIGRqHJ4HDcGE+EwxDbB1jcua8SUsmTz/9hiPCXrCHo9MOA18khYPKkPAcH5TsAGifpocGr23gurBma6IZYlzQXhA+KZvC42xEsVj16yVNJ0FFh8GiqKKnyjJTyKZkuZuSl55+WpWOr8pO33pXqTk1OnTomFy6elqsfviMl4L330edYKFAGsDBS7QF2sw1J8eniXl0unDoiqyeW5X/593+Cynk0AAsD5j6/CU2GaGkYQWOcbYkBzn2XwEUGvp0CYJuDBaJh4+uumvjqW+cWnl2UmgbhyTNm3gXGI6mtak2evngeCzon7XRZ+lPTMiiXRaaKUoBFslLIyjOXzsrHH38MAZGWEwvz8vqLz8ude7fl2hdfoP0J3ekOqDDYJj0use1S4cIw+AoAEfKpQS9D01zGCMwYj3wtYcMBehB3uHRsLyOm/foyQ7gMxntmdlZ2oECM0nDsjUIBaHkXIHiCCrw7bB0b3b1DeKL9adTJFwjyjqM2hHkTOPyYVLXKJ9P5nMxRKWHO0WrgnXTcp7Qy4NP2m34cS/kGXa3E8om6efzHI6L19XU5sbws09NT0oAg5xGkvgKLz2egribq3Ua7k8mhHC0X5TIUWh1lK6DRZD0Q4uauNrNezJxyjn1nfF4HaSNMpdFBnx1dXpIWLIoW4gPwyWOsNDdgnF9QeLROagi3gDsDK3VpZk46vA6DOtvAo9XEuvi9jyGPr1gOjtYLj7z0SJHO1s82a/9qnPwqy9bnFSLkM8ObSxqPgfjUMBwGR2E/RI+XSeCKH1Qf85/EpRInnwssDTOoNvKl4JDlWc8k2C/PwaFw+H8YZiw4VEtb+wLgdkYKTNPBglOPP0hjOlcqJmsSAiOJxZpOz0gCu+hhKS2JPF8+WJBUsYwd2yI6vShnFrKwEk5AELblrz7dkj2s+hePT8ns/Iy89c5bchnWx/Vbd2VzqwKLoguF0dWHndKwOJLY0Z08WtTvS/z85x/otQseW+irvnnWT56wuEc8agrkAxcHlgAXFc156+suUB3CbAvx1GecDm2jbxebXr+wYaaPwihHutCRAv2YyJRlCCXZh0vW62jvZeQVpA5l0ZyDpTFfkhOFlHxrcQY75Y40ICSeXZiWeSjajz/+UL54/EAFGB8i06egeTRDoYk4X19hrmE4p800ABzXbpPBtjDs/AgQl1ngX8W07QMtqz6AngsDiOucu7ivSgTA6xl8y28FQq3Pi7QBK+DLoBh6St8L2/pIk2hUOBpHf2NmmUvcFGLcfUN5UkHRJYewAHp8wh87drTlcacluzu7sgIiL8MKWMyDTrova5wUsHBzCcxJdhH51eMqMmDqZ02sh18ErGMs78FiOonxOAHFwY8yUTHxzqu+XqwAEZS9m8hIo9mVvw+rh6evDWxy7mWxKcBUzHCcOGYkz/bYecKg/VF/AOHeAS8bKNRs1eUFzINNzPkWN1qKgn4GDSoQjL5yuiNp2Wi0pQTldH5mWkqo5B4rgnXP18oMoECcZW/WJW9t53ExaEIp6i3WYEeP7xwvTAMJxsxRIcPmT7Nt3ITGIT41DMQZ23TGwUHEDiDhiu9HhnlP6qA0RsdTygM7LQb8QhNBEfbFMHAYHBLbD03z9kHQ4vsRiIBDtbxx4ZqA+3EIFjQJPyowsfAw6fn97RStC+ywewUqjKwkilkZFmbhpmRQyslMpisvnlmUM5fOy+ePt+Xz9boM2xV5+twxKRRL8sG1T6VQKMny/JJ8/OHnEJBprne97VGFRachx44syjNXnpZPrn4q9SrKY1H2oDiGtN11FcDzJyV4NLti+Lw4SkFBp7su8I3dmzHb2Q4sKh5fcCdqw8TR9xS5csy3OI6OSc8oLUODH48qyiAPpQHLolWckhYW8nMnF2QuP5ATpZRchoC5MJuTDBrIhw9PnDgp9+sN+fjWbdlpNM0NO7Qu1LKAU8uJAsgs8aCFXlMVjIQKD5mOJ5yf5gPyR2PufC+sZa2zoArDBOCoVE1/UtGVIWgXZorycH1Hb8FVJoFnSDjfOPwax/TAt4CwKntFdD6p2TDHmVoJgpNOjyPtseReqyaPew0Iz5SszM7LarEoCSjvLo/NeAszLyCTmM4N1qs1IIh2IK7XFYCxw5sugHhmcUFfqNiu16TDnT9xeJMFynP3/2k2LaegXI5BydVafEVJRuowOROYl7x+oLcWaz22Pq2bcTgksVWc4yngF7G54NPgg25bv2feY1ktYIabTucxeKxBYdLxWtIZWK5ptI/PsAxgwdLSIB1e6+G304cFrtGknhzzAjp0ugX0KMJqEYG4OVoz8SeBgNx+cFiSE4gx+aB6XP4kvCdtlw8hpRGAG9AnBRTjpJvIqYPD0CfKQXj75SNLeTksOFRL0y1Ok84fL85J73bbnLiYmDyC0pcN5vjeqCIUBnbSpYIIFEEqPytZKJIpRF++fFqOH5mV7797VXa6ot86+NpTZ2RxpiQ//uur+hT3xXMXYD0M5N6dh1j8qIc7a4wxX/WxOFuW3/3tvy8//vHPZWsLO1nk6a213PSZGxARoKAhj1iwEOI8ilDFwPNe3pmCRaS+ppk8pwhUQagSQJxKQcPGtGdYbyVVZ+jrBUgXtnVKkjs5vkML/cA39ZampT09J1kI0fNTfXllqSzfxk7ydXTIAhRGrV+X7OIRuXpvTT5d35UWrKVeD4oQAmnY5x1BRmmYb2BgUWtbNaigQ2KCBlwklAjgmEbTHCBvNObON54pF80zvnr4YX/ozl37IC2dZlUv4t/lk+roL4o8p+z4nMdoboZnqfJAei7OP1qB9k9T0G5tOusCYJSRwHQeXQ0kxU0ExH2j35GdQU8fEGxXGzKNfH69kJ/+reztSRo8cxqjO1lc2+AfRTKN48m7l1qYl7y1+yQsqDkoho3KDmrlU9pJyUFpVTE+j7kWKhV5amlR5iGgdzEv95LY0ffN8aIqBvYB6+Ef20pQz4Y519F/LSiOC8uLUt/ekirmYpeK0fLmUNkLoKq377bQNt5RdhJrb2nGvJSxAx66WDhpWPopWB88tqLiyGRTkuGbhLluwYtOJOuUtPpQvEyzca0XEFQ9AUL5WtzS8MHRPQjiKmPZA4q7Ys7/ZRREHIwrjdCgPAFoMVNQf/ej4SbLYeAwuHE4lolD1+QQ3eRwNOm5PmcaF7A6TDZPYZjXmVNIllRRSJ7+tMjckswUynKulJffXj0i/XRZfnB9Qyq5aSmkOvKNM1NSyM3JX719VdrZAhZ8Ty5jYT98sC57tSbqg6WBOljN4lxJXnvtZfnJT9+SB+sV1M/vTFPo8ylaI+QpuFSoY6GpQlAlwVdOwPHuLcurPoWuefCpLFRhoE3qQAu7TbbTKUd90hvO7HqRzfULx/7RMBYkccyODuV5Dcde8ObLF2UOirOUlONLQ/mPF+bkdyFBrqBN54p5NkP+5aM1+aQzlEEV+3RYHQI3aPMuHDpoVwhCVRpUGJBm3JFyXPAbODNWHCwvwwdl3IZ9cGPtwMVdspajs2FNY5Dzy8XhqwJNaR9QaCXR5yePr+i1gX4CfcK2qIg2bPIJaTPPDBV1jiYjBMbVacQkMwKngt3G6SsO+qnf5aVlWBzATvWS0oZk3cGW+iYEP191sgqh+gIE8jQVMYRxC3zxORMdYwpWEOI1KdvFWifvBKsisl2pwoKakdXpstS7/BYGHyBtm9ehtAdyF2P/CPHfKPO9WRDmg47sDTL6PEgiAZ6sADMKiodhxmG26R+/79GFYG9kknIC/gzo3cXmoc85iXxT2Hg6N23DOefbmMvX0U6+t+tVbNp6qaE0oSAqoMXvhKQx53NYSDxebbF9fBMjxorHncoX+kJ7UsOjarRjWQcTgsQR+Ekx2SEg6YNwDBARzoELeklxENBGRQwfgP6lIEZp0O3frLhcM/kjMInMAfTH4CB8zY7HieUrDhyaxQ/KqefC8LF4+OCUvjiNjkKYzxxghyMlfv8CrgwhWZyT/PyylEtT8jR21c9dOi83W2l5d60iDZSbbe/JMxAoQ6ymt6/ehLlf1G8fzGAiP3vxvLz/yec6sfuIw+qXIszqZ569JJ/fuiv3N3Yg9PN6y6LunsgHBbUKa2Px8BZfXojnbp/XVtydSvqmVOTpS+/oiKdhKD06LDw+nc0v7lH48XZHNTqwY+OrG/jGUV1R3NViSvL7F+k0zH3g87sdfNlgqZyWqdmMzM/OyAqEy+mpsqwuZOXKdEK+NVOQN6BEp/st0Ojzhd96l9Ff1IbykFdzaxBeEBJ0vKBPpSG8EUCPYOC46vA/Gha7O3RjRGDQOR80LZoICMY66htP4+psXIFCxCSo8MO8MJaGFeQYkz3s5p/BuO9AUNcguZMwkYBhaBlmQotaU5DHP40QiGsybLqJazmEtfVMCwApzGcSuwrDZQw14iW1C9fB11azITkI9sWZaZnCvEnTVAXAZoWC8+mhDkQ52kznReu1zQ3MyaQchfKZ4dtuYVHQQmkloISA3MGGYwuKfnV2Xk4gzrud+DXArgp5MAAarEH7jwEKcOQpzymmmfAslN/xxSW5s1vRlxYqh8RRMHgErkd+SKyPenuY8zXMqV4xI6ulGVhXwIHi4Jcsy3Dn0M4klNEe3y+vnQiVxS+HMWznlgpcF1YIAlo9YwEbEZiU7sMYzog8gl4kCvtkEZQu+T4MAI34X8Z9KaVBCDAsJZ3QHtjkUaqffQj6Y3DYMlE8RKO8+TAaJEUMyo8pDRfHBOWOkl9o0zN+PnNBy6IEV4ZlMcU3085JbnZFChDsV2DOv3h6Ra4/WJPvV3NSoyBubssfPH1aurtN+ehOTarYRfFMmIv61MKUHlVdu78hyekSLJOB5LBD+/rXX5H7a4/k7gYWEL/YByGt1xwo6PXZj5w+75DS5x64uy9JEjv8BF98SP4QpxXEZyXoVInwKA2+viARwj6VhbKA4w6u3+fF9Tb8DpTCEMqvIEuwEI4dPaJ35pw4fkyOwj8G/9jxo0HasaMrCM/KsZWyLM3PywoE0/FCVhYLfTmR7Mhzw5ScmS5IiedtaDNfzV3rJ+XN3Z7c3cMOudGWdLMlqRbqhjIxCgOWBocJwkYBYWdya7eZkP4qeMEwMMNm+jjBWEd945lK6GzYpoWVBgUd4hSMVCAQVownOk05srwia1s7qnCJQmdUHZ2bfyZmaMLRc76fRocfc23AOaYxyIBRGty9GymMEHbfaTrE20jntaUd5OxCcWTaLVnGrvzE4oLeZdRoNaULwar0lTDVHH1zsVi/mYE5XAfeNKyLZ+cWpQRTcY/vkOI0HKSl0RvIfWx2ZqFQvl6ehSAXKKm61LleuJtnk6m9lFGjIMzDobYqVb5DKXa6WAuzUoXVaS7Aoy3B7puIBnQTxz5nOWx4WqWMPMwk5AQsn9PYzJWhiMrSkculnPwa1gut9i3M6zqtF774URUHmeBmCPS5QVGlwRaTX1cnwFY7qj0Mk9IVlAxphmFfRXFosP26H4TyEfmS1SaSb/yntii7Rz3b8n2bPwLFPxh3jL8nrUP9Q+ITgOsri0AJeOAEj2k38vlvff4E6epjQlJhQFDzAhzvCx9gV847ovrTUBSwLtLTWCD5WcnMrci5XFpW5wpy6uiM/MWNh7Lex04JC3ep/UD+4UsX5YvP1uQXX9yTOnZDXUxgnaSSljdWp6QMuf3nNyrQQ0WZGdTk9771gn657oPbW7BGeAsieQI+PfJEHsGXCnzwyZf8kT9+mY+G/xD1QgUgD24AwcXdVq+tz0IMWw297z875BFDA6SoIIqwEqZlbm5Wpvm0Ma/RYLfY5eKFcGjUG1KrN6XepEMcju8s6iA/CSWg3/imMlOra1qKR1akOXdElmdy8rvH0vKfrR6V51EP+/GvoUT+Pw+3pD0oYBeblVs378jnn32q35TmN6Tb9SoEDJ874YV+bpnRbnXcQrMbYO0wbnoEzvwq2KEzgAjj/jxwYQoslrFxHsNZCgZUoPm4AMbhOF/oKLj6POKjIuft1hBEvE00j3595pmn5c7Dx7K9taV0eUFY5ZLqwFBNIwDNQHCjTj0O1WTDm1FQ6Gf47jqENpH8Kf/4Yz7mAUQqshFGf+vFYJICPb0eAQXSw/jPTxXlysmjQs7vPXggt+ttWL956bIcjwUJrAt/vHOXbzDg8zEl0PxHZ87LXq0ub29tynoiK11sUCTLb74M5VIxL//43An5aHNb/nRrQ9odvqcL1mO7rf2gvIJlMzamDnUou4DxvrCwAGshKR/vVOQReUnSFnJ9BwAurV3Od66BYS4jgwLWQT4l5VxCToO/V7B5+oNCUt5AP5SwDjbh/1m/Lf+PjV3ZQF4SygXmrt7WzuegeDSqL/akBUWrCM6ICvxQMiNiBLRywkAgS9iEAIhq8xVsPCTcozghmJQegbi6fUC+YuAnjMPUQ9bhQSLx9f/E1mjJBVRNwCVPIu0mcQBhrgJQYQzQ9k3A2Zd9LYOfCWXHgdObi8nF+BMuHFUamstF53hlCsOMctFCCHNi8sluHukMsDtPQ7D2inMiMwuwp+fkSKksJ2B1rB6dl9xUSa7euycPuthRY9e83KrKc6cWZG/jobx/c0caad5RBFqsIpuDkijLty4vSre5KR/XMzKHCf7c4pSsdWry8e0H0uwVpI7JrDJSH4RAwTR8bp3o+JZc8ovFBhsCu6ukFLguYTX0sVsfYNfOi6RUEknEs8AtYGeWR1k+TpLD7ozHbnxlQxsKoVKr6MVF3qHVQryNRdXBzlTvaGLfoq94UdWdT/OIQN95xH7ikReURrc4Jf0yLK+FRZmH0vjaxTk5AQVwmneTgcZHtba8tVOT9ONtKfWGMl0uSQ4CZ3P9kTy6f0eqlT39FgNfn2GGCz/0GVHlgfZYx2EaLUDEwGII7LgGfghQjmMP0DntoxDf5mmYQfUpsM28YR8MqDSoMPm0P4QYryul0efHlxdlDlYjjxZ5QZcPq3HuGcUB3i3YGgyArq80XH0my+bpRoY8wNe4Kcc05ms6FYcWsjtxzhfOGx0/jBstVgSzENJT4PXozIwcW1rUt8k+WN+UWrsrzWRGn6PgTRe87pHJpGCNYD6hz3jN7GK7J6cWF6WNOXy3UpMNNKwOq5faZS6bklehqC6fOiH3t7fk53ziH2PJJ/v12+m8rkIWHe/KN30Y7+jLJSR/DWvsr7cr8gUGJcFbzpHHjzoRieOkR8VUGMBPYOOUhGU7gKUzKCXkFLB+O12S/2YqL+fbdeBxQWTki2RO/sHDDbmB+ZnkbeottIcKg6/yx2aKCkNgKbnnYoK59wRKw6UpIOjmZqA0vLR4OCDPy/brNekm02chhKPATA/hkDBSGgQOmA0GwAEEhBaRBzrAFpRQLB4H24SCzo8BU35CRQ6YfwCKASLZCWhjUdpjSkOL4AdOFYZN5w6NjheWKQz1SAeLol/IiyxMS2L6uCRnj0ofgvGNQk9+dz4lN6YL8oO1utzqzUuh8lAuDOry9amsfLxelfc2KtIFrd4AlkCiLMMp7MaxMOZA6+KphLTqsCggjE/BPpiFJfBvqgPZAm62BqFNawEWSaaHXSAEwBA7Kt36YXEapYHsTkuWex05joW5BAuhJG0pDzpSxM6d99d3Bj2ska7UsEiqWCR7DVoMbVgLbWk0Oije0e+Gq0DDgqG+1IGDY5+pwONiQl0UIgTXl1Qa+i6gLBRIYQb+LPwFeepIVi4/fUY+ru3KJ4Oc9IuLwIZiqcC6wS41CWGTglWR7tRlNgkFW0rLAtrG72KvYYf+YH1L9uwX+bRirQ++UxxQjLSgNEwByTzD2giCeDSDtOBsWwjj1gbrha/OBtgv8FVxwJmbCcxcUWsDYVpdU5mhPH/hhHx884FUKZzYf9aZdtia4AUckF5QD5yGTbrhgfzAeXmGZ4TJgyZzB27yeHFb8dgO7MwNDuKYQ7T4zPEQFAK8GaRdLOX1ehRfDPlxpSX369gsoH20AGAn6TUvvZkN/Z+GgpxFzWeLBVmdn1PF8TaVAvB5nYu3uH4TPPwzbKr+x+a2vA3LtALLO4m5xk/g8oK1WlJkgcyCD123SFvAeP79+bK8B9yr+sIqbHzg6TUuYAft5aaJaxTzLp3nTR+gV0rJWWD9dq4s/1UpK6vdlvQwLNQbe8m8/PpWTd6jYudGjM9BNWFhUHGo0kAYSoMX+DmnzPzmAMEh/FUojVB+LMTle2k2uF+dfp5CpE6O5pNCWGkAfCUQAJIUKS7Pgi4aDWj0S8Go/D5EXNY+vBhg/uGUhgLzdNHZsPpcXFxkmIxqXWQhBPOSxA46UZqWfmlKEjCfh1AWufkZ+eYMBP3qsuxgN/TRRlvWK12Y4gN5Viry3NFFeefqdbm7UZXGkBer09gN5WUIOr2FkizOZ+T/OJeWpxez0q7BzIdi+nhY0rP+bQpCLAyeTc9D4M+BPvbwUsDiL2N3l4e1wIeZdN2hDZzoKd4y00vCasGuD3xsQDhv8dmHRkU6dbhmVXqwGvpQMAPQTEKhJGEB8AtpA+e4w7JOJ5vZGpswHbtJhRIc4qxb777hqiZPpRnJ5nK6y3755Rfk83trcreT0Z0r9qwoRprYzUHBJdsdSUCBJbFYkx1+UKoheQioQj6t39dYPrIoGxvrcvPmTdna3tPxSMN1uVvVcbQ8oa/s6EWAqcSLAT3rQB7H3RX2wixFoRZsnFyenSdqacHnTnekNGhBGqs0h/E6d3xBpkuz8s6770t6agryyFiMxtJgDYwYsgqgfSilEYRdHh3j8DkX4JOO8u7n23mttF2YWUArYm7yS308uioVCrIMy4Nde/fhQ/2ueYP4vDsD81HveYXlAXUpsC1kETv988ePYeNTk892KrKXLUgP7T+Fuf50oSwvnFqW9x/cke9hg9DvQ/G0ef2ERNgHxtM1S9LommVshF4pJOQxLPJPmj1p88gIvDprjaAKh5YG/DTyUkVsSnKYh2UoMyjAs1Dg/69CTn6d1STaqC8jn6EP/pOtpnyIupzS6PPmC19poK38Dro5nmJdZA4O4b85paEFJ4KrL5YWkpg/uR6q3H2IT4BU8sSzwWtEOFbmJwxKdkKeAw50kDsZ7dAQq7wcaBZ+9q2HmQbBpzWJrpmotoyGuUvjXRkQFjxq4EXjfFGPXFJTc5KaW5LBwrIMV45JYbEo51YK8trpBXmcGcib1Yqs7/UlXWvIOWnJSyeOyTtv/0I+321KGwqD9rjeClvISGq2KOmjOXltJSv/1+WsvFEqyNNTRZnPJuSTalM+SmQln+jKLNAXgH+8CCE6nZGF2ZTMzuRkeiqHhZ0BKdCE4NdbVbGb3dnYk/uPtrHQd+T+ekXuVzuyXm9jY9+SOhZGCzu8DhZKDztJXnDm60f48Z8ewvr9cCzOYZcLBzR5jz3fZUUBR8dJqDs9010GMAHZb1i/3OGmIDwzWMA8nnn9xafk+u278ninjp02hA14SEJoJGo7koASk2ZNho0adnpw7aYqMz7xzNtAmy3scu/dlVu3bsgMLLKnn3pKjp84IW20gV8GTGGHyd38SKCbO9v01mCNc+OAsdSxNew61BFw8RAVv+Y/wCeYIOlo1CUw4P5tmo2gPhtQgU1ajXpdrpw5L5XdPdlDGymoR8uVIZa1NDRMz4WtI2jYBLUehl2awwuFTdxbnaY6VzsFLkEFi8Hvod95LaMHxVfD+O9ubEgewvcU+p3XIbqYJ3yjFS8e891R3OVTf/BhvvawL9tQ7ucXZmWqUJTK9rZ+C4Xf/H6MObSMMs+vrkizUZca5mDTsIdqDYduDAhJKAo+S1JMDSQN5dXC3G4Pk7C/wTP5NgWMQ5xl9foN+OGDi3R8hmMHPOagADJ5bFagyO8B7xd7bfkMc7yO+c8bofW2W85xKBB9/Y6d6/psjfaNBcub9cZgUrpTGATiTBLywbgoxOB4ECifKJ5Pe38Siqt0nsAlkq/7x1NI4wCYYAgcErN1iUURAG6hKW5M/pOAobEPEZc1EYfpJs/x5QPT3MBpLuOYYNp+ChlMQl4opN+DgE/CqpDyLNwMBP2SpBYw8ZcWRLAAvjtTk5fmEvKjbFk+3YPpDQE9/7gmT2EH/1y6LX/6yY48bGHnM6gLRCl2UBCcZVgrEPpTR6ew+8rKPz0+I/8X7vqGUExkC+X+Xasm/wa7n1wvAcWBHRT4qkI57GJR7MGtIf4Qi2G3M8RCxiKpY7LXB5KETEpUsbT26pJs8Kt+VeTXsHtCRheO3ySgg7nOr8WZC+Pc8XPBUClwvXAnh7AyA2e6Kgy0KOjYZ5x87C8oWfoZ7PzSsBRefvVrUFQd+fzmHf18Le8UM/R6qAR1cycHtqnwVElxV0eTmTOZCxcxUNd1wKecixAeR48uy9LiAuREUj/ytL29o99j4JEFj8vUGLKLXnfzKK/n7yDiRLWOvc3jrx5tcQ6wOUxiWPMQJE2mQk4xLZjnOlc0waSxDAU5j3G4c2cmBG8yg75IDOTK0orMzc3JTz/9SC0S8qa6l5acIRkBJY56DW2TxLAG8E/hafNC+RSo8G2eznXmMU6gp2WtVYR+1ETiYvx03mNc2b960weyeLG8XMjLlSMLUga/rd0qrMa+PIKi4PfL2fe86QK6RW/H5QOZL05PyTLKXqs1hR/jrWPjNZ/Ky8ulkvz+TFn+h6178rNeC5sVjIoO9Uj8kcVMtiRpjOGRnMhxWKu7OztyS4pShVAnf9pvLKFtpaVkNiuJfFb6Way3vDKjecnkQFbQtmeBU4LiGcDyfmp6Xj6G9f0D0Om3YWVDKfWwSenT0uBmCQrEXQjnejB1wXGuK6M2jb+cTwDy7SCkGBD0LY14pRFNi8GxwLkcm+tojGUiIS4NzrTl8JBKwNKwYV0wAfhhAPcBTFL6CNBXFA5YFEyG9X8JcHQmgcuK40Ezw+m+8tD2IK4LSh0T8cOFwklG4acX1/hJVj5/MScDLILh7KwMFheluzQn0ytl+f2llCwfK8Pc7crVdl/au12Z2mzK65isx9N5efvqfXlcbUsbi24Ixy0ZD1AGeQiNmYKkl2fkZZgR35oryXkKbC5mCjx478K0/+NhWm4jehvr43ZvKHcGSXnUS8lGKyVblb7sbcNq2MTCW6+LrEMxbFQR3pXh5rYMsMgGe9vSr2yL1PawarGrx4430WxKErt5PkTHL8TxaIjmOJUGv92gjouF/FAYYEVzYlHguh6kzz7iroyCxk1WfbEcm4G/N954Q+qwKj7//LricTEOobgS2GnT8ZOmvIsmgXQeUfGCIxWJCgPUP+QDBiinr8YAH3yDKY/PtrDzpbKoVPZgaU3JyVMnZQ7jQoXRgpJtg14KY6cWCHhy89qMN3gldxrWRM1Tn3nqO2fiWoY+W+1wNDxyZm4ZX4PM10UCn4IX84rPbZw6vao3FPDOMz3OCvBsmcD5vDCJP9bXIH3PaVIkzTr8mrD6LuwcQOtHfYinkEfdwhiT+VwGL96TV96Vtwsrmi8q5Jf2js7OyFEqjDosROC2sbFRCxF0etgc8HpZD2vp5Py85CiYsUlpIL3SasIKyciZ+RkpwOK4hbqJxznGTwPQXhgmzcsK6ZoYwONQAstAuNNLw9pAZWnTLu0/lHeK3W1cdB0rJfhcc7SGMI/z2BwlEWeb7mLODaQvZ4cdfRMDLR9aMWppsI2sxzq1OBBUx7QJwPw4mCDiR3BAdgBjisXCJGUxCd+DSTxPgpSceGb8ifD9gPkxKGbRhIHs6tAeQHJfOJAf50fxGB8v6/MZhF2STj5MXiwQ3hWk3yvOFWRYmJfk9KIk5mdleGRRUieOipxelFdXSvJfzqfkfUzwH6OxlVpXCo8q8vX8nJzHdHzrp+/Kp9UcNi0NSfab+qRuHyYwH77jMxiDqZzk5oryTD4hT5fychSCLgtTHEtVGpm8/C+9pPxRJyHrsDTWYJ086qdlDbuyDSim7cdVqT2qSg8WjaxVJLG2J0koi8TGjiS2oSR2tyRZhasjvVGB9VGD43fEW3AQ0nRUFFgoCeyqeIeVWhpYVCqkIZz12+FUHKo0uGjQSPyr77pX+9C4LF/XgP7jPH311ddUYXx49SpI0YIBTSoG9AFv9VVFwZ0c6h7SyoAb0CeeLloqDueTByw7U71WR4XVQlu2oRj5xHUPtE6tnpLTq6tS4EeC9nbQ7xABGEcVJLrrhm8FDNnW8YdjPn1/42ARgjwzj1GWPpyxMkaOqQEeuHS08aP0hhCoQ+zAa/WqXDhxUta2tvVhTlVs1srR8tYFZekRNG59DdK3zuG5eCjMiAUXVt/lhfON4LYCkv2E8VT+Eae11kUf1MDuDsYqA8V/tpCT1ePHpIdx2uNYIp/KnZ9l5Tc/9uDy2KicmJuRuWJeHuzuSQsbi0f9tpwDzdePn5B3d3elwQqxQUvwkXDwMYSVyqfo+7DU+P2OE1hjq9hofY59RhN9plfsFeCzHbYters3xwwAEpLCoOot2WhYHhNoAfESxF6nO5CrQOi26vI05hwVUReugTYMaGUgTNJ8/oNhrYK+ZhCcHwZycSBwIo9BPL0RIH8SiqMXzY+tJwKTyu4DqcTxSZbGKBLtCNajiyOSEQhhC4yFeeGCsMEDIIR2UCGXHcJjOL6c49P33bEUhZHuoDGBh9jpJ8ozMizPSXJ+SQpLK9I9uijDU/Pyz1bS8vpMVu7B3H4Lgv3Wdl0W1lryOsqebe7In/7sc1nvpiDYNqEosKuG4NTFqHTzsDSm5MhsUS4W+3JseQ4Kpa0XEfnenU3g/E/Ykf+v2xW500KZ5lDSMCQSWx0ZQlEIFJM8guWwsYc0KIVthLEYk5UqlEQNOz8qiSrKAbcFy4NHU21YGB0Q4ZGUHktxd4/FQUEN4TwEfwMsHh7rcFdkzGc4PTcwoGoD3aRjagUvIxSsamEgnobiu3jxomSzOXn7xz+WTD6vAp13W/HCOnei5kI76tSwryRQl+94zqxWB33WCke+4MiLKng4ovLax6OHD/Wb0ieOrcgzly9KGbvZerUqXbaR+CpQ7O5eBQvH3IoBtgVhzgXfKSiaCWv7bTISQ3kad746I7w0TF4zKWnW6nJmaUmq2NnyfUna12yALToGLj1EWwM2zIhNc3HfEZxPYLs1ih8NMwLnUGw38y477XKiweM1IoLe9cUA5ihmmNyqNWW3VpPzC/PyAjYNeYwnby/HTONk0HW1i/bV601ZLU/Lyblp2a7syF1sinawYcH2TP7xyhIsmKbch3IYJGEBQ5gPIdq1/3JZ7fAZ3ro8XZYHrb50QJdv2jVtNJ76aI/bFCggQ8cKPtuTwoZoEcwXUGer08NmrC8bg4x8VBnKU6C90NyDFbind4l1eB+yBapMfeMt+oPOdJLvj8DWvD9Ei+laiwLSYtMjMLGsDQYQSWDUK2u78FAulTgJS0Nj/IkBTTZ5DoN+UN2Ecm4hBbkhNC5IG9wHwmUPKOBwxtDiyzmhYJyNY7LobbW0MKgwStOSnJqDRTAnqUVe9F6SIytFeflYRp4vQPbCRP5zbBc3tppSXKvKyxBKhXpD3v3wE1lvDqQC03vQw/LBDps9xmNYfYdOviiFXFpOllNyZbkkX0CIPsbOZ4CF9bN2R76Hif3nUEI36wkIGfT0Rl36jysyfLwrAmsiub0rqR1YFRUoiz1M8irSa7syhEUxaEBJwKoQKApVFh0+vEeHxUg+KKT1uAfWA5zucim8nOPIMk0lBvPgmw5SIWN2n1ycRtHyKIC+3moLeidOnJCFuQV57733JJ3LSRvtMa/xppIAfYadklCHOuhTcMY5ndj0tQtNnP+sH2FVbkwHkKcWLKi7d+/K+saGvjV4dfW0LC0t6geSKMzoiMeHEPU2U4gEPc7gPGHcc07gGCslztHDD8H5AJQY5WkyftSiGEqGD2CivYtQHDtbW7Aptccng5anbwMUpBqG830GA/DiAQ48toMQKmec++M/42y7OnKn+CyODZUKZbYlgZ05n+hPCT/cVKlijqLw9OyczBYKMoc5lOVcQ/kmFAytqmoDFjfaf3R+UYq81RtC+xHSjiL/6NyctKt7somNQj+dM1VyXLge4fPO8hIVCMarA8ldgwXp+CLTRllwXpq5yT8zfmZ60BWgpM7SkoYF87ADywjTqgnLpgdlVdvdkSOlEniBJdVsShM0zEO0pt16MZxdobSwdjRnHCalh4DMfBVAnqIQl8YKo8khPN1GHRpSiRNPW0vjEMUURaeWARcIBm8czABa8NCCxXZYOAz+YUhaOsqX5wjpLCYld0fYBUlxSq2MBBRGBhZGenlZEifm5ZXjOfmN7DYmaEY+T2XlL9oNKd+ryG+mZmRh+768ffUL+bSTxQLYkgF2LaowuFvm+TyFMh96y2dlftiQ1y+tSquyJX8FlIeJnMxi8fxxZyB/3hjI3epQqlttGTyC8H9srIrk1o6kYMondrZluLup1yukCaujBeWgDpYF+JEuLYqmJFVRGIsiydtqnRCmg1JwQtcpDE4ezaMzWyoD7B+rMPSldipQEYcW1KM8uD7quHL5ihw7dhwK433pYCfNl/apgtB64aiIqCQcH4yrz6HDH4K+C4NL4FjZsPLt2kBSzAMdjGGTO0lYarvsK4zBwuy0nDp+VOZmpvVsntcUKBSyEERUIPxOg5KmYKULhT1HoKfOxPXX5QGCLMp3xhixdHithVbG6soK5khVGrS+tD+06DiQjvo2oL4Xdk7j9ifwrQul0bNKknnkEf1AS0KtCXUWR8saYPcQgEU1a3DY5wh0sRHCrJT70BENbJRmoCyeKWTlSLmktxZvt7v64B9v3qhgc1RotuW72FBUoFxuYD7stgZyOZuU35qCddpISp3vTEvR4oDCgILS77PokVdaVgs5aWA8NzJIdDzy34bdeia7mBWYpyacQRtLtYa8lMlCMYl81htKi+dRfLAPPMJGl51KTZ5HncViTrbre9LB+h6gnG6OtO20OJQqYvFAvAPBLz6J1OQqDLgBcXAQvg8B7qiQ6aXDAZSGu6ZxqOaagbHBUBGkx4ETyPx1jj8u/dBwWPwxtEiC4we+8uC5FCbxABOW75KiwuA7pGRmUYaLCzK7PCPfXujJicWs3M9ikQxLcvdBXdqPu/LNTErmIbz/3TuwMBrYzWLCCY+GeLdSnxd2sZog4CgIuWPKtqvyO996WdZ2KvLOXQiObk5msFN7JduXu5t12dyCFrmP8o93RLbhaFFUYElUtqEooCyqEIRUFnyeAYoh2XPKgRezUZ9aE0ZZ6Q6fAtsKbU4NJ2TtjzpzeT7onhHYRKMw7C7OKhBzZ42KEDlx8qQ8+9xz8v3vf0862M0bJQRQH3W4+nzFZV1wkdGFNW7SgOA5gOMPOAFtKh/QVeXHP+YByCs/UVqF9be2uS07uxWZmZmVy5cu6dfh+HqSPSgVPuNCOmY+mHL4MXW5MMGPB2nG1zIOGEScXLCvNIH5qIcP2fHiMp/Yv3DmtHxx+7Zk+LyOfcLZlIVzoGGbrkEPgWHnNG5/AoFv84J8hq3PABWZKaTjafI0AmfTNe6NBtikguUxFcder2FhjnE3zjAPYStwN9HnTWwYzh5ZkotTRUnyi4KJlNTQzh0o6c/R9+cWFuRioST39pqyB+GcnpuXl5ZK2Ptsy6NMCfxBaXBHkR1Im8/kIPgSFEsdc/selIiOvTrwq/yTb0Th9MNKZF67PyFHGzV5CpYEvx55HcqBSo7X1PTDXrpG+9JGm/jN9ZUpbDAwJjutuiAH7YWi5HzXeaUzTP9Mj4QhLm0MSOarBEdP+YsBw/ZEOAzPbk0RnlxpEOyEChVBGqNRp+DwPTDYB4PSwY8KKxef4EKgCTbH77CAd/hc0Jho3DXrQ1l8oV8eE6s0K4nSvAyhMPpLSzI/m5eLyyV5/uKy7GBC91N5+WytLRVYAmd7A1nst+RnP/2J3IeF0MLkTGGXP9RbWtt6zUCtDDDBW1CHEPS/9e1vSH1vS97+4FOBnSK5QVJyu9vyzFxB7mzWoDRQfo2KwiofWhQ7m7DvrWUBJZHCokvzllUoC62HjpMfC9XcheQpCw647YP4eWUWgIo5BEyYYEPoJ77xVgUgFyaEH9a47pp5LWNhcVGeeeYZ+d73vqf43LHySIql9bze54FhK+Q1zVobUUtHJynSuDgtMwAElCg8jp/FVdDyhqYqRf2jIiE6+AHffO7j0aNHcuvWTTQhIatQdLxwTgxeNOfT5/qksTYTveHqVd/W7RxBw0wPz2Ytp/ML6U6QEahs0Y/0uzyWObIMIcsb2hoqhCGVRrhKwwX4C5/1aF0209ZtEFzYS/dcoNSCOPhyuPBtLyqeaTtxXDZ/TJ5pG/6xXtQahOOzFLwdnFlUGnX0YQuWBI+tWrA8irAKFmdnJQOrghubFhT5LoRyp1qT6WxBZucW9M6yGnAvzU/JPCyUNb77CnR7alGgEigNwlOogd/BuMm0JMZbWbPzUp1ti+1Pqp08lsNlKJkzUErvP9qQDYwzrydRaXCDxet5uukALT642MBGjXd8ZRI9PV7lMybuDQhK2pjGGiLYZAWGmer6JgAvTBznwkgRGMuKJARRBKK4bL8DDY4h6K/PexR8RTHi98sqDYLrQQvaSZNoIM9VzwkfKbovuKaNitjJrKGwC8OkVJZHOiYHv6hmbqvFAigUZcA31RanYHHMSrq8JN3ZRZGVBXltOSffPVqQP6nVJJMqyMn1ivxiDTuqSl1eT2/Kjz64Jp9v16Xf3BWBFTGs7enT1UOen2NScuJm0EG5bEJefuUFqbeb8pOf/zUEK4Rvk290hbVQq8jK3Kxcu3FPqrBAGB/WQa+6BQdrg0dPnbpaFnoEBStmYBUT7zxy1yeCV2mg58yuHW1mJ2JFaF8yTt+NiE3U3LEuQwS7Q3MLI4+heL4MTAgV3iFDv4g+u3Llinxy7ZpejOaOjJYGybhnJYySQILlK6gboEPBahBgGefMDz33R7DlyCocxZTBN+mKwzrYB+pG9TCTaiQJvlnXzu6ePFpb1/dazc3O6Rt6y9g0UDhQuagQRyHeFMG5Yhi14SCuNWpY51TUMR+oJk4fzpbnWLVbTTl/5qxsbm6oRTTkRS/TGQZPi5pW+j7ztb+CNFPG5amzdPALb5TvnInDUwwi0TEdvAVx/ICOe8WIoUMUzTRNAzJpsLvUIY0Kh8c6TWDw5YA3+IqaelMu5nNypZiSI7DMG8Os3Mnk5UanK5faUBbTJclhkvA5p6PTM/Ibg5Z8jnmzU5oGRSgMjMM0pt9ZjM8QdB6mBtLhq3Ng9dOCId9UZPyGibYDtPj9jhnUv9JLy6WZBbn/eF2uYTNVB/u8S49vQjCbGmgVN2eQX0P77u9syQvlvJSg/Lb1rjBe48AMAmntH+ICbJeEwPSDWX8BKL72juJrGeS7sJ+mePgP55m0MQjVYWmM4UbiQdjUrxAEwmDGFw4/OlcQ//JKA6ATl76JjoPN16B1JjCxxBi4MjphA+AEtsEIMNk4FxqBluGiYEAvemf1Lil+byIBC8N8QGlWBsV56c4vQSBm5dWFlJw4fVI+2atLurYjU+kp+fh+XaqPHshLx4/InRu35O69R9LGTinNawcQmLxlj7eucqApdPK5LHYsbXnhhRdUoH7w4YdGtgHDnGdjRwSr4cTilNy6d193Z4l6zVgVtDSadSgJKghzyyqtF2NNWCXhJiQH2HhjEOx+1fP6xQU13wTNVDICRI+goFipNOj3kMVvLVOo8Wtsr7z6qqyvr8nG+rp5khjtJgW96K08gpqyR67oGBlVZ6s04CWSRcMmyjufWbrQNMH+mtaadIJtPetzjmm2n/TuMCCm0AbeydZsdfSZjy04PtR24tgxWCCn9Gn2DhQK+Q8ecqNvBegIGLdBAsPE8QQt0Q0KfrVybFQQ43WfxfIUujYh1WZD+lQULKfWCBxxgcg6jcBWMW2IuTDBVmBwECcNBEzcphGfTvniv80nuHzm2Xwt5/hxcfrmZwRBGme7ikoTd7QVEtJGdB1C+hHfN1YoyfmpjJxItGS6W5O1REZ2UH8OFsZsHsqgibW0sChHsG4y2CA9gJKh0iiAH77mPIe+mYVx0EgnpYk0fpArAWud12YGCawNKIHMMCPFRE4W0MevFUTud9ryaaOJMjxOQ6fq2hnNC+1odQb4wab1akNmSkV9QHGnZT47qw9vshzXrWsifC0JX5Nsum7WAjCRoIjOyzD4O3uCwyXEoIfB5cchxpX1iStCfAUhNAue0iDEoUyGYNJNAuQTw3cKB5WLgGKPleGkt0ELjDrnhwjEHe2wKAQgCHkumsnBsjBfmON3vKk0pDwHmzYjx6cz8rtXjsknm3vy6W5TXiympb7bkZ99vibfPL0o+fqOvPnX12SAHWMKQl1frQyTN4WBY8080tHnCXZ35Tu/+Zv6lPSbP/sZ5hsMXOsoWPv9LiyRgRydL8vtu3ekRwUBxSGtunl1OSa8KgrsjvTWXV5c1smOgbaTRFsbNJeNtUEHHkLsuGkHuamDfqKjkGQ/UXhwsdFHe/jqDoqHX/u1X4PQbconn3yiBUm3h0XKPF1UdOwL8siFqrzSGc9xwao11WPL8eglmSZYRwgtvKAfnG/DgVAAMMsSoCXBZwv64JFh+vV6XR4+eCA729tyGorjyqWLUioWpVat6Vt+9ZoJ6/HrVWYQJ78qYJ3PvJFgNj4cFQGFD3D0BoJaXU6dOinblT3pIU05Rf9qnwPf3K3EsUA5jgd8pWVpB/SZb32m8YiQWQ7HpKO8jePHc5Y+w84PhUl4FHZ0mG9oMU4cg6e88J9hTUP/oq0NKOndYVoqmCPl5o5+V+XU4pzcS2BdYaPFr1aeWp6RYSYpD1tdeX2xJNMYo0e8Xocdf498Yg3NJdNyGkvhfnIAZUM2oNB5uy7nW6YvOeDxDc/TzY6cny7K1LApH8DSWeet7hw7zEV9YJVzUueIN54AssxLTDUopyHG/fL8nF6fabT5ISlsNtkonQccLW0gG8uiIdhXaVg/gAgPBM7v8VQLPj6ClovJECUUIMfX4OiN6ALPokaUBiGgdiBo5+0HnDQ2GIKDysXBgWXsBA2AkVGCmdx0mODcOWMSUwgmoTD4xlq1NLL8iBIUxpFleSnXlt95+ZL8mK9y3q7I8VxJVvJF+ey9q3J6Zk6WoGd++L0/k26NLwGs6+sH3PuZtGZd9Ihisr306isyOzMj3//L7zPHjDcnrApVKAAsimw2ISsLU7Ba7pldOp/Y5kNGvCZiL9S5VxqYcko+gKB9rt30PDCpJj123BTBCCqDBMEF4cX3+AyhKPT9EFgkeocZyp8+vSpHFpfkRz/8K33jKXdvfbWu0D7yTQZ1UTJIH46+OiVhwQRMnPVqNADHK39JJcgGHU1T2jbV0tckgiZ7eSaAf/Yfy3NRIs5mc7zQ/hQ2EbxQff/+fVlbW5PFhXm5eO6cHMHOVz9HQkuKPOn4Wtr0XZDAfLiAd883F2dRVq0JhMHL/NycJCGl6pgL/CypKgdawvxjUeKxDNM5Rkz0HOkSbaQ4yBsDzIfPuCunAp3OxI1C4oVeg2NoMN3SdfgELTcKmkrRf9bnxWeNJ9G3EOj8UmHCOr7KP9nPoh5YElh+99M5udcYwsLqywullJzLJyQ76Mi1akt62LzNod696q5cglK5jPHgSztvQnHsoPtnoDD49oRroLWH/uIxMy0zqH9KNCmBh6PDjnxjOqnvm/p3zaHsUFmTUc4DzksqDc4B51xz1PHX+C2QfAjF/sqxFUlD2a3bGxbM5oFzwWAahzRTVIFdMQITMdmhDIXDpIyBh6JzeawIEpgWS8pmaKFxpxsyVYrjeTGWhtfqA8AthonASWeDITioXCygzIHV+QgMm7hOfg3ih5MMOx4+wMOXECb1C3ZQGsWyZKbnpZRLyPlyT1576oLcWNuSd7ebMisteX6lJNc+vo5Nf1NOHZ2Sn/38LT3aaPPNsd0O5k8f3YnORhX0c3nuagZy6dIlmZ2dkx/84AfKDXdFKnjsxNVEKAXe5rcwW5Z79x8iPanvwQk9zwB88zoPDuQ4aNu1kdbRiwWToSNjcdRzP5aOHsVwx+t2vdZloDQWFhZkdfWUvP3227p4uGPXyYd/PrhHBcewgrbTOgX6pmLzC1C+6bFuDQbgj6mfZZIdTYCrw9XjZSky4+psIMA1C4Tt4NEVLQ6eXdMK6GHnu7a+IRubWxi3hCwtLcmRpUUpFszdTrylmOX5DXdXhTLJCJzh3fjqNMwkCmdaGxR4SeyRuWFYlLXKDjYu2DEjn0J8ZGW4MfB9G6bw1zTnWLfhgwLfXI8weIECUMc0ihqEbbrh0+AqTgw+fvTf+NbZevQ0jXiuHPhxSo5XQNg/A+kpHi2GDnbtDfT3DqzpBjYeqalpWcwWZRpzPJfqSz6dkTYshDPlkpZOdVsyh/KXQfJpTLPtbFIqWM8NjBW/KMhLQicgqc9i3M4XMrKJvA/2arKZzGFsnSCE85QG44HSQNT2iHVsE69lwOjf3ZUTR5akCF7rvZ50qPSVjsE1gIgH40rDJnhlzKbnkODhOh59mgH4NDXoZ3qgeMaF221hAm//m1EaHLwDq2NtAQ4DLGMS3MLlRObrQZJQGCm1LvLm06i8Ha84BYuiJ//k0oJ8uL4tn1R7stdLy8UZKIG9O/Lh5/dl9cwJefzwU7l1b10atTbkI+9awtaHHQzywYYGE+rM6dMwWo7I+++9B+PAHYVgtlOw0ueswtzjkdNUGYtlqiD3HzwGqYQM9M4OCF8qGIvPwwvTmnFg21g3+yDcDyPQKcA+cNnaN5gsJqJ9rDnoIwpNtTIoiBiGy2YzksVif+qpp+T2nbvSaDT0ugYtC7PzQnHyShpuQrr0GNBFpVVybDTFxC0cOL8CiKmASWOT3sZdHscAvhMazNAjKETYCqLxWQG+XbVWq8rOzrZUqxW9YH7y5ElZ5EsTgcmnzvXV9HAUrmPWgAUntFWAso/Rn32kcRNxbGlZOom+VDst6WNOcsOQzkLY6Y0ItIy5mza+ub5i0o1vnNLmeLEe61OYGwXFum2e8keGiGcdyyqvxDc+nfaYpltwQc3Gj3NMoEcI2k+eECYdRIewDLhpU0eeIOXbCG9DUTzCRomvHTkPdySbkjYsb77Xo5TMSJ7HVkh7BuRW80l5Dv12kX0IpcG7oDax1riuZpH/Auq6CAWUgHD/Psqv85lz3quLeanzjeNOYY+1mOS4BwqEXI47A1Ac7P8mLA5s7DZh/VdQlqR0/gSYTPBKMUpQRAs2OMKKgMONKwtwfHJjGuAEYNNC6XF4DphnCtiRPhR8aaVxqAUNnFisw5SNghbhxNbYZLAIRgzYBQCnQpUTFROKD9fxGoZgUQ5gZSSnZyRdKkuxuSWvP3tJKhDY72yuS33YktVkQ85jh/nTH/1czp08Knkszg/f+xQTjp+t5K2uHSPcta0JycOE5pHU7OysvPLqK/L2W2+pcOVgM93tciyTet1j2O3LyuK85HJpefRoHRlIc0ddcHyCOxjUyCTygfXrZHJ9FNdZ2i3EtL4uaksW/WOEjlnYfH27KkEs7kI+p59e/c3vfENvW71z/4EeR/E16koUBIKdHNsXhOG0zawFgLiywF8N8Mf6Nkg4vMIAKOoIn20KyLHegBcm+EDxjV+mW0Gi/Yx/Y9GxN+GDEK2PLracbbR5Z28PFsi6KokL58/L2TOn9QaHeq2ufGdyWelrOXKgNYAOXIaCkg7SDcp3mOH3WbLSS+XQ7zl59sJZ2djZlQbfpsy0fBE4OXO7KZ1THOrsONGpkDZCOLBCWI/me2nkx6UFYVNWx13T4AjwzXGTjSswDMc01uno2OQ4p8qCx1OMo4jbgCirSOTmhHfc8fbtPnjcAMqdRFruSkZOZAuygLWRxVg8Devu61hbz6Wy8hTKnMmk5NlcSl7JZWQW43ISa+skyh6Hcvm03ZUf9BLSzXCTk5FBg6/a59iSGY6zHWuEzR2HiAPIor/z9+cgVq5UUc9OOidnsFb7m2vSwdgw3aEF9C2JQGnEgNZtwwquXj/Ro+XAVDWeHpQPIAaHEODRN+FRKycDi7m18b9LpRF0BZHJAx0XBRcdFx+UBY+mhvD5ts6kCvqufPOZ89AlWfnp5zekiV1SfWdTXjm1Ig9v35UeditPX7ooP/vJW1KpNKXbbumTxkZhoDrQ5y6cimFlZVkvEv/lX/yFVGs1rK2E9DoQrtrn/LEO6RnwxBcZ8q4dHppvbG5D5oIgbWK9jgH6Vgi7lk0C7W3ywnZrmH4EXBL7xDn86WJBG7h4jbChlYFFjUWpab22vPT8c9qWD69+LD2+OZQKgyyxKSjvXm6oaVyYrq0RMGyRP42aBJNokl34sKDoXhkn+HwgG0wG7eBPwzZZ+xdg+5rCRHkP+KcQNc1SQYg/fs/jwcOHUqnWZHllRVZPrcIKKeqttBSIrNNZBKok4PTmC74mI5OHpVHAHOT1tClpQ1Cen5/Wfn8sWVi9RfPKGcxNftCK5dWBlrnOZISvGyu1NFRRoF5N43w3ecbZeCDsR3G3UeAGSxVu4DOfuKSJNMR5ZMY5oK8g1zKGxshZ2nTsA8ZNz5o0S1N73vLFz73yeKkHfnhMVYcl0aCwH8Laglg+V8zJU1AQq7TIMR4luDyU8hTyZ0BzFhusPhTyFtbPLazLm9jQbaShuDuw1uEy/OiXDpx1ntLgeBulwTA9/kQA/DK1D/52saGcwzAcnSlDDlTQJGwe0RZehGff6C28FtA7NhSFmDrGQJnR0KgHEY/jz0/TIPE0ZoFxJviJJjyJQ0L06MwpwZQcd68RsaCDfAjQgT8AJuEctg4ftAjoHVBU20UkdW4SoxwnJ4+lYPqnsWgHfI8NP9cKxZHBtufp86tyamVO3rz6kTxIZiUJxXBpYUlmMWFvXf9UXobAfOevr8rjtU09OhjweQkeS5EfOnQwapDl5WV56vIV+fGPf6x347DeHoSropA7MugGA3zxS2O8fnH2LHar7aZsbu0iA3xjYptXk1N4GQFGGgeCazux1Y8C6rb5+ocwnVoU7CMWU8GGlQxIoZ94K+rZk8dlcW5GfvLOu9BnSaMTlDfgk1fyqHEkqGNp69MpK5po2WLt6qkbhTWkPB0GHK0QeGUZCsW8hCAItiw3ZmHYNgRHF9qOAX6JCDz8ayrHFkn1ZkvWN7akgQ3CFObU6ePH5cj8guSwQWljrrTQL4Msj5Iw59KYc3DJbElSmaJk4Xqweju8tbPTlBNHj8kmhJzk84ItiSSKwOftwVQcanEwTMVhFIk7njIX1iGm4PO5GuPCeeqYHgh8NER969A257un/81dWIzTx6YCvnn6G44+NlewFTTMfF6zU8UChUfFwnyGecxHHwFz4dryP4TFwLf/mg9xgAafvaBFlknA4uhJLTWQbyP9Ctoww3090HSOwqfjx6BOYBl+DnI/GHTkTSjjbWy08lifwwFfZglaKMDjYR1XVRh0EaWBf4L1gOpCBvxYrVaRAsbgLMasCiumCvrsDx7V+ohmRkUBCGHSrMwGLGjcOiViw/QATFIX4FmIxiPlwsBEs35HMI6oxiZ9E1VISfDuKQKyMEEOCwcubE44GwzBE9QRgBbhxNXY/kAcImIgNYzJq7s8nhHDwhjksXvDbiYJgVjIZuX0kTl55vQp+cu33pEqJhk/el/q7smvf+0lefOtj+TYyjHZ2dySzz/7HIuAuqJj7hCyQpL3dHPXXS6X5bVXX5N3331XdyEZpPMNr8QLzvwpXJUpjgaUBvjil/POX7wg1eqebO/sAR98UxBzYrMO+jEDGgtst3aS8ycAsyg0tJ/Qr1iUWgN3f7qoIViweJPgd366JJcvX5a3f/GudGAB8d1Neu3C8hgsQKZrO+lAi47AuIUQSxq2CV6GzhpbflSSKH5hCz4NB5PajXSlgUVO32BZHzxqXazT5SkP2AzAN7ssKm4iMAEhm0ZIQDh2MAe2Me7rO7tSx5gegfVx7vQZWSzDgmi09RmWHOZIr4B5yK/ITfGIFHMH8yRbKkk93ZGZhTk5k8jJFoagynfO6MaGc5cv0aTigKPPNB61Url7Tu9047yn7xSG7zi+zHeO/YHxpyDGXiDwB2j0AI2moyXgHD/l20/zexk854dABg36A/j89gXfrKDfCYFFNEjxmg0Et9ZrFEse8SLCJdQ7jXrm0KPz6L8FdOYiBPsSNmLLva4sd9uyCrznMc/+AdboWYT1iXLyCnyuIvqq1BC5CcVyA/Q+b3UgvKF8BuAFNPXGrQ7KgC6vYeig7aM0CFGFQeB8oNM8tLeODcJRKI0ClDuPJVs8GWDf6nZihB+A1mHpwhvlM10DsaBC28N3NMd4VPo2rBCNWwjK+ZkMm7hfj5nz4/CrVRqAiThPUI+ConOxa8yAa1SUlApDLgiEdfFwcWWxizGWhS467Np48bKUTcg3XntFfvazn8kuJtsAu7x+vSbfeeUZ2Vl/LLduP5TLEOhvv/kTJdvttIXffVDhj3iGxweYgGTl93/v9+Ut0tndxfpMBW94NZMUjmXoK5BHssbjqa5cunxJtrc2ZK9SM6SB514HMraj2A/YQdpJzp8AzEODuLNUVPSRXghnewjgv1QsQOm15Wvonw+vXpNas20UhraFPo/PwCfCNP/dRGY8OtGdYzliGdb0JwLhNCu+DbCgpevapjWaBP4YmNRulw6PIX9uahj/Ss+1I3D4MxlBGqPBjQPMZxh92YfPD/y0MEcebW7I1vaOzM/Py6VLF2V55ahan+wrPsiWgBUrM1ActCawkenMFySbGsrzhYLcSw9kG0olhTFIYL4mckZZJPOcx9i101LG3OFXAaks9PsvHEqMm7M0dMLq/LeOcY63jjnD1rE1SDL4KA9aXBsZ+BkIwgzSM8DnJyyyQM2ifzKY1znM+yzmQA7hbBDvqZ/hs0cIZ4fIG3SlyOMkyNRp0JqHdbGANiygPYto1yLasoT2H4GCXEL7lotFWYESncVcXIWSfBV8LKFePv+kuzYPNIb0W0j/DIrhU2zSegn0FRUH2jWAMB/yxYScq2wnaej8xSJj2CkNQykEgWBWPBuE62BsM7zGB8WxNDOt7a9ho9klTcUw+D5Fo+oA0XSbHICtiziubT7EKbSRTPEgmuS1IQBWwDTL0CQlQWC9ju+EfO2feqic/Jw9hwdd1I7aRCDdEc/KJxK4qzksONxgoYOIK650R8lm8qvSgM+nSflqgQzPjrmzy8LayEo+lcX868l3f+Nlub62I5892MGkBG6/IyuLZXn+/GX53n/4X+Ub33xJrn92XR7ee6zmp5qgWBSGAeCjnjIm+Hd/47vy8cfX5NZNvtcIwgOT15jEVBREBz4deeICtn4WC6PTbMnv/f7vysdX35f7j9ZRB/Kwq1Jrhq8j4R1U2jJt3f5AutpHzh+BlnZJtn5VGugvHq7pzpW8WcGTRfylF1/QO4Y+hZXFpuvZMIF9AN7Ud23z2HNC1kCYj1AUYU7HEasIMOzHLTgcnb427OaDmR82kW2KQMAa8dFelgvmkgLTI3iOHMZYj3I0jXj8BjV22egns3NPqfLXO840HZuPNI9Y0uZYCTvzXD4tTx9dlVMzS5LvJGVt0JH76b58UcCc4rETHywtZOVkoivfzfTk/WxZbsDiqPdAhzdFcA6wr3kkyud2KAg7PUnouT3idEh3c0aFIXgPCRkVlnQ2zoBqd52gJslCHh1aQrvpimhzEW3KoYOoPPh1v2nebYgK0GKkDtDl7BcUhFNrAN2i4wAktVwQ1Q2HcmXmHa0U9uEAtGm59BDnQ4C8HZ7x3VwKFkdL/m/Y0b+BNbsAJaRrOwDDcxt0vw+6f9Royh+hj1oJKNYWcnnXFPuHfYf+SdI6xiTmR8ZoeejxLy0QncMkByXDsAW/73Q+s2odf+bxJY0iVzC2z8zOyFuPt2QLOE0Qcm95ILrSUDc6bQhagDiiDOh/ABoe0RjhGfCFe2h8CV6ceFoygmIAiUTQMXFufzC8wE+85ikNdIjTJ+ybw0J48U0CD0froa8xgK1zFAyBY5C+X5frPDWpGWCWI8IFbY9Z+NS3vioECoOLOI0dTQ4L5fWvvYwdYUt+/uFVbEwKkqNJ3evI1159QT7+4Kq+Tnv5yKz89Mc/RfoA842LkfTNp0dpRZRLU/L1N74un3zyqd5VxOp7fG6DC50Kg4OojsXww5mmwsb4uVxe2o2a/MF/9H+Qt99+Uza2tkEXeVZp6Jf0UI/ZDRnwpxDr01/zjx83hi7BgYlrSdbNfsRidefaumumgEM8RcUKxBdfeB4sJuTatWt622lPFxkd+QEtCijXNv0BDR80HWCTjecSCUhhvZrhI7k0C34+gUE7DwKlYcNKXdM8fIBJp8MPnLYbCbY4wIbxo3aj4tkcKg2NG0dhR0GnFqyOJXfnUBqYE3qRWp258D1EnyZyaUnBFVMzUsqVZX5pRuZm8mr0JpI9vXbRyRfkOqyLo5mB/L1UH7vtaUlD2rYxTxvdhNyrduQtxDnD6piH/MAjhSKPUvX13hgfVRw8DsW4mM/2Aok7bPiY2ZLHjj9l02HQSBbtyKIdeezuaVmk4Hi9IY128e0FGSgzI1eGwpc5cvw7mI8dCF3dbOjY07HH8IfuYcg4EzZr08xYOqoys1Hh+uTaZD9BUdj+4hw0/ZaWTglWCITz76Oj/mk+I69gQ6cvKdSBAQ1Qg26QXQi+f4ukH7T4MsSUbHb6sgYL4z7Qm1a5cs6mIMxVYVilobsgOH7ZT61lOl9pBALVAGvlr95VxnSMzTR4OAGL6cyRI3LtwUO5hbHgkRmFMbtG14n2EerSOljUKhTSMAlwFjRu/GDNe9kBuDwHiCo9BxrURAXDuwHlx7VB823Yh0jUJZBOKjF2IdwRsEh+bRMBDTwQb0STyESPuonpBASCcASUKhngPFLfTkoeQ+lxFD/uD4fdXwo7A76248XnL2PhluWHP3kbCwq4HT6B3ZGTK0ckj0l7785t+dY3vyk/f+sXUq/WbC2gjUnFI4BCoaBvRv31X/91ufbJJ/r+JU4Uvd7ByWh3G4FjeR0sBK3Q5uLR4ylM4EtXLunbV1vtttJhedLRSRyZvHFAoaa9p/+shM4Dl6514x9t4PcwVFlYxcFdIRUG8VZXV+XMmVX54Q9/CFb4AB/5gONiIz/czWo7EdY2shLLI8gFvgsTkG3FuoK5dmARyIf6/PcKMajRaNoobto+CodwHbgy6kyCiWokFA/S6JlE5VWtMQhWvWOJykKVBKwJCFn1NQ6FC39oj0MTOv94p15B+vlFqeZLsl5MSCfdkxKUxCrm6VH0+WI5L/1EW87lk/Ldckl+G3X8PSiUV1Mt+RoE6RUolRrm7x4EdB1Cls8upOHIFd+1xKPMNMaCx0dUDPzmewrKI494CbzOoszJ6aKcwK749OKCrC7Ma/hYuSzHYDUsQEjz1YA57soxB3n0sre3q9doNmsVeVyrysNGXR63mvIYtB9327IGfw1rZg1zYR3182npDcyFTWiKLbht9Bfsd7i07Cb4zY207CXpMrKHPttDH6kPV0F6Fb469B/byvdK9dCve6A/hzV7El2eSkD4s/9Bmw8S7mJ4bqIPfgK+7mOjdqEzlKPYiNHqqjc70m61pQh6+toYKgv0n46uW1Nu7qp0ZxJ/DDBJcUdJNm4TgIDVqi80PIa1szQ/K4+qdbU4eYs2bTACthweWVKwEa8uTWPcS1JR7AFLhuonIOjSXH4UR+MEpEVIWjznwjCiFfwohC0NAHcGk2C0wOLhoHwDOs0n4yI9mqNN2o80hF4g/LgDxGTSuzN4Ps9FizBfUMeNDcS6rBxdlldfe1X++I//Z8kWp0CAt74mpV7Zk9/7vX8oP/vpm3L+/DkpQjF8/8/+HIIUtGyn0fTMYpHzBYW/8wd/IHdv35GPP7mmu7MhdjT8HrYODoUsJyh3YVqUDUCAfPJOEQgL7uoy4I+m7u/8zj+QH/7V96Vea2BzaAT0APRUATHugzchlJ567DeENWr6OASahXT2FZyeeVvnbtNMcWcJOjP6jMmr8r2//EsYaylsYt3T6WwP6qb1o8qCbaRv6DtexkErNyGPdaM0OF6IuLKKSv5NWElrls23QD7dnPDnksFHm0w0AMUlnjqGaT0wyggBtdo4cXU+WV/7h3MKY6zWqyoNlFfFS0lmLQ6rMNxt3XpLN5UwL2ZjN5/L8mFS7PmLGPdCRm/vTuXTsHAHMqd3CSXkt4s5+S76lVYAl3gP/cNNDV/yfRPpf9Rsy7/AbvZosyUlbjAwLnxRZgppiS7m1CAhOfDAo0WyzV0lrQQwLbV6Q2qwRqpwu+2mVDCuVX1djbE82GQdE264OEfgm7ZjOjITYc4rzAQTB2g/EdgnDLOfgrB1JBDE8U86xOGCdE77EWm0dsG7rhG0I5FNwjqD1Std+XVYa99EX59AW0qwKLJYI9ex3v4EltlDWBR3ml35FJuaeVhfz2aKsoDKHmLD91G7J4+wllq8ewuKYwDnbjLRo1/Oa9pGmNO+peEUi1tubAmi8PkDa4rHepzQYHUKmeenZ2QG4/MBFO5OAnPDoKlzR9VKS9cNidm6dHw0IfAY0FNDCxxH1k9aDjTomLPg8HxQyyIKrk5mkahhjDn7A1BiLA3rxwAXsw3sAxZrIg4z4HQyxaAhPbZoTKK2l5MaE1CFoD8JKei54+DRFCYiX7LHo5bp6bK88MJz8ov3PpA2dibcPVIRtJsN+Y3f+A3Z2tyU3e1tefrpp+X73/++7hr4tKnZLQxBw9xS+J3f/C3Z3dmV999/H/M8Y65hYDKy8/Uef04+nSgcEDJrfeUXjkKLfOOvwNs0T5+WG9ev6+QyCgeT0ioPLeeAdEJAWvh3/am+cx4Qhz+o2xwPjBz7kMKPnyJl/S+8+ILcvHlDX9KnH1Ryigu86LlwdJcWC1rhGIRGV8fa4ln+TdQLB+0Zgcbcj5dFXJPsJTqw+EqP/8Rlmi2jvzYeKAoKTQozCjKnDOj0Ghl9pkMpUFnwITxaFJxzeThsOKRYhM8L3QwXJDGNHWgJu2cojT6URxOCsQGhWMW85HHX74LOr6dzsoR5ybvWsKvAvAN99DdsF5kFX/y+xD0IuiOpjH6ngkK1h7rbmYJ+aa4LoUplsFGtyiPM4webG3J3bV3uPH4kDzFf1yFEtxpQGJivLYwdd/L6ECfK8annHtrbxZzATIaYhtLCGNNxjXCjwGcnjPCz8zI0/uzACGgnu3likeFpMkEDfjniIK6o8JHfSQ6linm5Beuhil39Y1gtX/D7sVAEa+jv/x7KsDjMSrbdly8wXA30Wh0KpNZp6wnDNOY1Pz+bq9dhjUG5Yu116KNN7FtzVxXrA/jrywsG7Aa+uavOJAylAz+N9X+qPK1KuQ0+eeeYoYEfpWsFOsKGDtNNXBOsF8LxywEsmvnVPA8CugCbxY0HQZWXhqLAfOcmQCQrJcee+kO71LBY8BNPOQJ2we0Lk3AilSDo6g8ABceKRhMYZwVYcCr8uDPRi95c5NhRcKFzIVNpYDGkkcc7n15+5SV9mvf2vYfYKXAHBxmI3dap06ty/swZeevNn8pTT12RNSy0hw8eaj0UpKY67PpA/7XXXpPtnW356KMPsTkyF73N7psLCRTpq7Nh17HMU0FteE5SKCE4MzMlx48fky++uK4Lk0pDlb+jh3+F6CRx4PqLvna6cxFgPoQTFaEqDypaywv9Xrsrr3/96/oa9xs3YPRjoZl7z1EveEpRYSCs1kbAl+Mppr7YNGWDv+oMu/gxiZpsW6N9M8LdB1xZANuvHHlpCpaOUyymnzTF+ExnmusPCGUzhzxlgXmUgG9cHsIWykGvlRUlwXeY8UHREl+vD0VRssqiRIUBvFJeBtNoEw1bKI1hFjtlCOx+DmOBOUwB9E+xO34Z4SyvaUHw8ZXfsP9UycOAgMLuShNjsstnAzoDWcN43O225NOOyPWWyN16S9197HYfwa1DqG7BiuBX8apQQPzAUJMCE3UNQFA3JbRQ4OsXHjHfzHGom3fw7fiiR9Te0W7TyQnfZAGCgAdEBJAO89W3gCy+xtz1uRuDAEwlZiwYBBsthHeQXgGvt1M5eb+XkBXwNyhm5F/V+nIMjToPhfuw1dDjrodYR3dR5TosshUoyQvo14sYD15vqGN+8zoSRlMVRsi68PkMs6zNdsBZxjS9HRs+r+Lo2xEQP764KHV+VMpiMd/0pcF1dXAdKd0IreBaBom5SjXNdwBDzOLbNBs2ymKUpqvC+q4+UxzpfsN88JOVroHww30cLKV0eHCL7zCg3ecmRBSQPpbqp0UytQlugVNhQBDyIiSdMXeN0uCZMu9Qanda8vrrr8nUzLS8+dY7yE/LAAuL3VcoZuVrLz8nb/70TSiBlJw7c1bee/c9VI8dV7ejLOdhDXQaDT22aWDH8sEHH6Ia7Bxp7kKwqlnIicHOVUcmvcnogMRUWBulQb3CN6kuLS3K9etfgBs+iDRSGjqejqYPjGtfWmBfReIhYJQ4rJth9hucWjvoR5rpz774oqysrMiPfvRjZEFQoV0D7Fq1LjLqfDSOvwZAbBSJqTcS94BZLBpgOFz17Nj7tAlx9IBDbM2y+X5fmLDJ55jaRI3bRD0uMRevseu2isI8UMcNiLMqOJ+MohjmIP3z0AKFsgyLcGXEyyX4UBZ0U8Ar06FsGWVnEOZzF6SZxe4XS+8U6n162JOn+tjMJHvyjWRfTmPOZvo93enzxg0CHwHgRiKNzckNCP9/jfwPIOTvIG8XykMvgzWh3FtwvCgOZcFrGoHjLeIUaBw7KgrehqrHMnCYY6os2Ilu/mqYvotzHgODQhpxTQJwbppeJj49m6ERz2e6DeqoIq5jokE7DoSgvAXuGpik+AMpoc3n0b5cIiePoCRW0UtHClm51ehLZdCT3WFXXssXpQlrao20kM6bSvbYb1jrj7FWj5TKcgHK40itKv1WS7rAawcMAHwevCAxAizFoeOxFtIZxz+fVdnBYKyijkVYmI9rDT0aZO+6suoHdYz7uu41yF+Oikkw5Tw+bJ0+uGMoxdGgRYCnZSyYLJtHcJl+mheMgl1BFpQR6w4JsedlE0C7wOLzN1QS6WOU4tJCwAmHhQhzlUqDFx+H3P3BVJdcWVKFKckVZnSCPnXpjF7Y/dM//Q9oNe98QnGYrUmo9zOrJ2R3e1M21h/L+XPn5N69+3rRjAqBdfD4qVGry9fe+LrksJA/vnpVckjjrYfE0TZhcox2ac4xnQ5ktCEYHZ2gZpR04WAhFzHB+NQ4nQN9saED0vDBxSPJ+3UWs7gGVdGq0jKskAf6J0+flhPHj8u//7f/Vtvbg6DhQ4d6wbtHM94KF9QdZWdfiCCTBefMXLBzwjoT1kzjGIFvlOco3ZQdgeELTpUa47b/UJG2m34Qxw8dlDaP5fQIitcqqBysUlDlYC1VdTx2wjjxQ11UEsIH9mbmJDELNzcryTnE56A4FpC3CDcPi2MuL5mFokzNF+VIMSVH0X/HO105AcFyhh/dAkcr2LzMYmOTB+0NbH42ySNXJRxbQKODrKbhmNhA++oQTmvC4xp+4wEKr9WTJHbUvIMqBWsx3epKsoWx47vR6DOPjnHkq2JxZ/nsL/BFayMBZeIe1tT5i39WG1iWDPMPQVeOC0mPeXhs5cradONGaUFdJKd5pj5VYJYfdRrHvKMFT15VEfLDSiJHExmZxjpvYB0+xnqpgqdzoMEjtZsoM8DGjn06h7ZkSA4kdlFmA2N6D/332caGrFeqcgybo6eOHZXj2GAu9jp6ZxkP5fhSRfeuLPa7abMBVA9n/kyMwMYYr4f2dDCPPrlzR8pTU3IaVmeO/cjxtBPYlCUY3ymcwBFsXysEaebHzXMfNA5nxgpB9jPjRLOowfqwuAEwrOPCdMat2wdiXiNi/RBEem8CcEIdhEOEgCfF1VIjwEhFSZhFH0klHiZHCqaqXoDkrowXtYszWNx0s5LOz2AxzmCzN5BXnz0hP//r96XWwMSAYUomeIvhdCkply+ckw8/+AgDjV3IhYvy4YdXpcsFiInIayHs2Oeff04W5ufkr3/xjn5xjaZol0KVk5yLgpPD7txMHBUEAwTe+c82UGDzSA1hHhNREJ88cVwF9c3bN2G9wAJy5dX//3H3X7GWZleaILaOt9f7e8P7jDSRhmSSxSySVcUqTndXDQSpZyRhBM1gpBEkjR4FQY8NzOhlBEiAoDcNJEEGEtAz3V3VrWZXFVmOLplkJpkm0oU3N+J6d7zX93177//858SNiExW9XRj1r3rbO/WXnutvfbvUFx1eIj7CYEupIdvRz8h3gPvlIosMYyLFgZfc852S2Du8+cv2EfXr+t2SlkYUhZdVAOLKD4eQujCeF8CjLUdB6WEYj5bAtztWD6KEnDeI26IEsbyjY+TQfyorIQvNxUMADFmxYPuuuMJSGWhu55kWThLIolNB8/C+W0N3f3EGyr4FoE8j5vKlpkAf0EoDGBZGC9ml7KWLsNKmQEfTiNfsC6KGSvkk7aE8V0Gn7wFhf11SOJriZ6tUHkDHiSy9sEgY7/oJqwORT0H/rgKoclu8/kGzITxW9UULgeYhlsQpPch+O/1Olbv9K1Yw1xiF93hlx6bDfkT1Ya+IMlvYCdRlxSCppCCBBSFn/XxUruEFuZXYXjpUrg7geNnxftFPJ+HEFyXIQ4sxTg3xpAs/ncepMDPeUKaNi5KQMBFMJNiMDpdpOcT6gmM+auDHCyKvr1nLTuFsa1grvKwrO5grHcx5jSstmIec1hvWrUDIc5zPY4XY+xCUR2i7ntQQndqDZuHorgEq/AU1kQHjVRgqXRAd980DwbRPnvAnjmecoTk5gkuYv3QnMuuo/+8rtSo1e0lbDD2YAFVSFjS2OeXBES+SKgTAZwbF3bp6jecIZ1jgLgolnn4M54tVk710PX4ZObnQCz7F1QaAZD4zHSCy6B5PxaYMJoYMVOAiIk8qMhYHgpfHRkUtTvkd4NTWSxoKItkcR4LuYyFnLVSpmsvv3zWDmr7duf+piXTfMoZE4b6+vWKffObb9jm1q49fLxr3/nWN+3enbv2aH1TBE9h58fJuPrCFZuamrS/+Zu/1jcUeFQgjS2F4RVFpDwQHyYr8msAOk91r3lAGH5eVOftrGfPnoK+6diDhw8ipaFrG7HFKwjuOHjaiI7yuvojQHuRwqDCgvDk8RMVYuPo0L7x1lu2s7Nrjx9vYMPB24apMDAuZmX5+C4kgliA/Yq3F+CYOI3nCUA+9z+EMKbRn6GfrvcraxR2ro7ckEDlqLvFaFXAz7G7o0zwDhUHlKaOo2hZ5PgCQV7MhqVBP5UELIAEeMlKE3AnLFUmFq0/kbPBFBQNEYoiAatiupCxJdDlMnmGD30BL0Ap8aJ1FhubuxAgn4GnPkXbt0HZB+jqJiTDPgRQA/yzB7OiA1xA/kIuZegJRGPCDixjH6D//1dYFD+GtcADj2Vslrr7NdvCJkgfAOMZFW8bh+DU9+m5xYbyd7dtYy7RhhQCp4okotDjvAnjfv7jR+DC8tENGKX7uvRLT5gAQPCroPMrn7zBhYN8zMKgj2Jk1IQcBiGsExjXy+m87YA376DLU7A+phIpm8Sa/BQW1QYyVjHefKdtF3OwRGota0AQ6+4xxDtrmesKpALWoHy3Gg07hHWxPDll58pTNu3f4gAdLlqR/9lH109EqEP8kQeOc6lUHPi7y1BHAXM2MTlpNVg2nQE2YyqDunzxaLwBfP2k/3DdBwy/MfBtM4F1RbniGUOeLwJPzRpLgPdLKg0PgSGeARJgxwLjn0w7Nj8nS67zR8B4CkDgIF2yRL5sAy7uLBf0rPWm5iwzM2H5UsbOLpVt7dSa/fLjz8Eo2FHwYSjsPvgFsUtXLtiJtWV7+5137dSZ83Zidcl+8uOfWLE4qf60W007ibK0BP7mb/5KTWsXDpSCCAqDE6MwXNJXE4X+ys9SGoAEtbMyEPRCmwriwoVz+l4DL74zT/Tis3Gl8TQItGHV8svj4rzCcNd5nCDVk8scX71m3/7935cw/fX776tMlwpD4+NOFPmlDMHGXGnjMN6v0GaA8TAhRMWTfL4ouzyxuZcLj4/ghiyMky4XrBSCz6N0hqUovLKgVeEtDF7v0vUCf/TkXlHuFIaOobzCGGDHOihAgUyAx4RFS04ULAXMwLIoAqdKKSvlB5aDNbuIds8h/3lsYFYLOb0yIwNStmARbDY79qFhN4w52AT/bYEP97p9CDnsgNXhtNXh8tXrE8hbTfVsvdO0h5a19xD/p7Ae/t+1tt1GfRle3B2kbSlXtgf7R/pyZB5tJSEswwN+uguPt3+LR8lP5FOQDHPmFIbbLRPR+hAU4E+IjbtDv5sd9ysuUJJP93Pj/M6hh3PlSig4zMI5jPFSmFtVrDlVxy0D3ryKdb4JxcmjpkSraxNIOYPp/ajesM1k2lqgZxr0uDxRtiNYXQ2UgSp1SoNIxUGeBk1rmIcK6m3QujisWgm0O8MXTcKyrMFyy4LvuVz7mh/Xf30u1tPPddAD8wiQDzzHb+e00PYKrNIyyuw2a3rFjNLdcMLwnRtVxfpdgPEh2uVhIfhCOoPyAXycIO4nKDgWJwhxx6WNAev02Z5UGl8GRIRnAQntvREw4inlkHkkJYRVxKWo3xCAbtecgnVRsiSPo/Jz2HosWXd+zgYrZcstzdsSdoZfe+mqXb+5buu1jDVZBwQIvyE8CQPl937nt+2vf/aBan3tlUv20fvXrXJUhyXShUXRtrW1FXvh6hX72c9+4o6kwHQ6L6SCwIJ3isIJWGGMsKNAOtDSwK5XO33XjxStCpS5ePG87e7u2N7eLqKhSLyg5oij6ySEUHfEFMjBTPLS49oh6NyeCgM0cu8lYhgLDW46gx020i+/8IKdO3vOvv+vvi9l1aV1QYUBl9dreEyh6xhsn03G8Wng2xfE/REgLlyMJsTyhL4LvF9rkUXw5/wcI1PwozGFOI+KA29QWUhB8AjKHz/RuoBVoYfueLdT1h1HSVnwNllZFiUgXH+brNGimIA1Mom5m8J8TaO+2awtw4p4GW29mh7Yq7mkXYNlcAK7W75/6FN04eeg49sQStdbfbuHbe0B/GBBTCsEuZ7eRr+76GMffeimLUm5nuzaAo9M4P+vMcf/l07C/mnN7PuHLbve50NuEHL1vm0107ZRObJ8q2H/oJC3Xv3QtqqHNuCL+fgEtBQGKhE6xYAIoOOpJ3axdBxRRdY4uGA8cpgvmgd5NENwMCEu6JE/DuRjmO0RfH8cUJn50DAS2fnaEl6f6Nk0wmeg1B/V67YBC6MGPi1hX/8qdP+voEi20DYf0KVS2Ifl8Y2lRavv7toGNwmw5NO67sLxEt26ohLh81B8SPBht233azVbhFX41YVFm+i7ungdCepG64d3Sbn1wLGiQxpLrMMAhZCXtzTnIDfOzM3Z+iHmh2ubBWLjluBXHXGIR3g/+00Yz6t5jMET4ehnDBgHFD1i4eNwrM7fXGlo1GQU541Q8ePABe29zwLkGWbzPhaU17tYqAneWqsjBgi/HKyL0owNitPWn8/ZmXOz9h9/7Yr9Dy+dsD+4sGRVWAufbB3ZFvYkSTBeATNUTvXtjdde1G2zn3x+z86cOWWFXMY++NWHVi5PgJd6sC5W7fXXX7Uf/+jHdnR4ALqRyUA8MgwFa9wVbUlc76Kjo+OFwmAcmS4ojRRv302DAQd25fJF29h4bEcwY5k3XNMgM0lJjTMCQfXjJ7QjOvkAXdSvs3sqV98e26ei4hHY4uIilNUF++EP/yLqtq5jQGHyOoZTGKHt0D7DcKJ2nDMCowP34TFknLwu7AS+pP8wXX7nVboPOH1D1+dTHFyFSV9kwI7T8YdTFEm6vJuOft4qC8GTpMKA4kh664IWRfRMRQlWBTAJRVLIp222BCVRTNtqPmUns0k7hTYWwIMZKN9DhDcwUQ+xS73X6tgj0Gcdwm8fG/42pEaH2KaLjUgDmqIOGjeQCQohwZfqDTAn2ICkIQCT3ZbNQEitob8/qzdto9VDdgifRs8aUD79SsOs2oaS6FkX6Y3DI2tUDmx6bsZyYJnmfh082Tc+jTxUFI6X3LyRXPgh/UhG+hR0vKE0/pOWzOPDyjTuMp0B/ivs4uP+CF2EcBj05QHsGiHUpx9lhMJAXyiqeefUEuZvARbio0rNtiG6eAF9utuxb2VTeoBvnXcNgIdZXxPhFczLBOZzowa6QFm7Yx9PCAL9yMOULujE21D4jD0/mnbIF0vC4piZmrRJLKEK6gAl3eYr0Nd1EejrA3DNsgOkIT/b2+VxIZTFidkZ29/ftxb8oDTWF/OyHDIzP330sjwjAvjIqCmi8sfyBHCFHQRvPO6pwDzPyKekkAfW19/G0nC00s8oHBcVJ6x3nwAkjKaRyVxM2GW6d/FDMFA4QPgl8pOWgMLoFSctf7Zg/+F3r9l/vlKyb+Q69mI5bbVy3m6003ajikUOxisOOnZ6vmjz2IV89NnnEAoFPf198xafkQCzwbRdWV2yl168Yt///vethcXudvtQEJwAulIW9DNeFHVpjqZuHLHxahxkfixMvlra7ZCdAKdZzudCHj584N6AymoosNEZMsdvpDQoACA0JThBp3AdhRf2C1hEVEqvv/6affLJJ2qTSlLXUaQw0Fe0544L2DYd3368GyPji8NYfFwZxNNU3iH/4mE5Ltb1h1GhPQXgYiw+Af/08y4o8gStKm9h8FoFlMXAK4zoTigeTfECN/2wDngTRbJYshSURBr0yRSySOL7l6AcIJAuzU3ZpemSncvn7ASaXul0dNRwF2LkfYRvgR0eDFL2GNbETm9gjUbH+rWupSrgnRp2q8B+nQoDGflN0xYK8VAd9B50EEB92e7AChAwfKUHP/X7ELvfKrJnoGT6qM8aUDZQGomjhmVQX69al7Fyp1u3+s6enS9P2fzUjAReAztmB5w/CpzhH/8dzYgul47vGAhx7gcO4+Alvyp6WE7vV/LpiHH5QlwIy5VHfpfi68Cf2CmWrgjV4Vx55Q5sGmvuBOYpD0XNV3Ucgt60AmahJL6bx4YP9LzHo+cej+aoHBKWadZtAnOaQ9wRNo8kO6t2S4qN0QMiUx3g312IHtgR2twF7mHtW71qZ2FtFiYm7QBKmod5XJs6pmJlrMZ1VOs1rBU6pFEbtK3C2nhhchKsmbTtZhNC1z1QLKGGjKEagS8/jHHpAZzfpdHvFAgBnlBEMB72MFK/94/kO67QKKRs9QUojVDB81EdjY/imDzE0TyE4/MRRXP44kUcYxFcupQG76AIO2ceQVAQFKZgZcCKmCjbW1dP2n/02im7kGooC2soYyf4IJmxnzTFT1YqFu3FhQnbz5bsARbhhTnsKCFAbj7esyQYM59J2Dd/6yv2/X/5fZjFKet1etgJ9nSPfAI7wvDaAcy64z5NPsfBrsJ1nKP+u3CM+Sk/IYjc0REvRruXwl26eN5u3LxhLZ5Jq0pXN3INlQarHQfWQ/CL2oVZNxWGiyO91B4gDwVZOzqyb/zWb+lp9nt376Jq7IK5O+O4qDU1Nqc0ZG2o7WMaD22PQxRPlzPg3CE42ujvmCqcAuCu1wky7YA13wjDdcdsQBZmHBUvFQU3E9xEkCf4NgDQVUqDSMWAXeOAr/OgVUE/FADDvEaRn5iwfLZgk+mEzSe7dqEEpbpcsK+sTdjybNE6sEwfQBh/VOErKTr2OQTWnU7Kdjpp67RSUAjoSw00qoLBjiDgq5jHo5YNINitRusAyN1uHS4vWgMTzbalURdvjR1gV8w7nC40anYaO9JfH+7bLsp1eacf62pA3KF9aCNLQPgN2jVYJRVLdKqyTuqo+/bmY4wpbS9eOGO9nQ1SWTtj3jpN4cXnjxw42pEVg38UEa3FRnDzzmgmuL+4H38+q/jd+Tw7xtL0F/wAVhtFwBP4SwXg945cbMkpoOehXF+YmbKHoMMjKNeqyvOrfW17eSJrn3X6dheKNgPyJ6k8MIYDWHF17O6/OVG0+6DzYSJjabE5+BprXVVwfWG9UWEoTGBxxJF+FSrwo4otFTJ27eSyJTA3vE7SAT11cqB++pKsi+sHkdrweZfXUgaY26W5WUu3W9Zo96TAeHGfxVUOrbm1xlYJLIswZQEg6lsAZlUeF1S6OhMwBsfGe79vTzdJ0D0GBbEqUgk9EX585uNQIE8UOhaGTDQO8Y4HQIdHKwe4QfDHfasYfgoQ7qApPLiLhhnPM+hEvmTZiSk7c2LGvnlhwS4YFidMVX4prQVF83OY+T/mASOgkBrYizNp2+knbeuoal+/es5uP1i3gzrPE6r23d/5lv3kJz+GcMUOHEqi28KiBpPyzo2gKKIzTRJcE0Kg6/sux4XDuJSLgSDEIRR591ShUNTx2McfX0fVZBxWy5+A8TbGIFQul3V6P2lEwM7GKQ026+7KeuWVV2yiXLZf/epXaofXafpUGH5MrMIdbcij8brxjEFo+ziQdmQ6x+8W4xBjhnXUf3o5X5xfpzDkSkFgYbI6KEE+PKWxyfXWhCxPKIbIT+vTH0HxVlld8KbyQBr8/C4F3w5QwO60RPaxrk2kB7Y8WbDTSwt2ZmXFpqdnrAkh9Gj3wO7uVmwTwnu3DSHUS9tRN2VVPvbQ6FmnBouiiuVfQQQjdXxERByVBBUGFQUFflAYusup5e5yAm85JQABBsVxuYhuYpzvYwPTYn11NuQVhpQGELvnQQvYAX92mtZvow8gKK2so1pF70+7dPKUtZC/RSVDeoC2nMqwJiWcCE66u3kgTT1E80NQGSDnhw7jxCcsowxKYxk30wpGfuewbEijO0xTWyrs45WEH819CA/sJMZ3qlSwD/f27QB5O0ijoJ/CuryYT9leKmvbtOggtDk8PTMBNwNeOgEa9MADDdC/i3VPJaR+gOc5BCdeKILVGw98ZcrAusjXRh3t6hEUTs9Wpib15gS+xRqzI8XiOunLcjI8qOt04emi7BQ2MwsYx8NqzdrkSU0cc+DHaZmoGhflAp4Ecp0/Fh8DjsHhk3lHIMR5x81eiD4mPyBep5QGI78UqDf6eTaIEY4DdCz0IKAGO5pf4SgPfsAouqirIx4IAV7chNBN5orQHTNWyQ/s3KlV+waf6mmxUNY+wQ7l+4dV+4gv+Mf/VLppry2koCR6tnbiNDYyDbtzd90mYd6/9fVX7N133rHNR3tYkNiBY8FC1MLAISNyiwK2okAVYR27CNgUo2LjdefCIYqLBuwpK0lsKpfHVcVSyU6fOmnXr38EAwFpqCcoDe0ivP9YYOVC7ydQqLIe77IkvyxIBXUawoQPL/70Jz/RxX5W2+HTw8zEAJHthTbx7358GwFi43wq+DxDIeFxLDjM55UEwsHliua3ozkWd/REpTC0IMI1i/Cm2aBAeC2Cx5i6foN8RPe0d8oy+axNl3J2YipvV2dL9srijJ0ppmBltHSzw/3dun2w3YdVkbK7vbJt90tW7RegJBLWPepZ8rBtmUrXUjVYC1IMNRvUa5FgTyCcZBhpCQptPjtBywLKwSkMWA6dDjYh3IgQO7Bi0e12366cnbQH6w9tfxuKHHkHUBCGHSqkP5Dl4bbhohyvz4k/hG6u+HR1pd6y3UrNLi/N2QKs7x0oHgnJoBRIbqBEi2iPeNGb/wx7oFfo46KkkAsNkqc9hFj9qoxDzn9QGBEoKYiqAIhkPo/O0nRBes7DKizCEv+40TbYWIjjdSCsZ9DhBCxEfmd9++DIQC19BCvs2rFq7RCbxgtTBSs0KrYFxc+4NGRIFwqHfdNmzVFEQDeO/K2nc7YHupagaC5MTus75Y8wj1QqyiS5gD5zh+ZBY4fbxw9fg1LAnF7Chu0mlD/f4JtGXm1AgyyJ1pyDoAAYF9U6SrSxsAswr3jDuwq7ILIcU8ETcaMQ6gv1/EZKQ0242Xw6hBbcz5NwTLSLGk0QwzGKLiZ65HgKSiOd5622BctMTNo8uOjkmRP2F1ikH2dK9i52cL+qVOxTy+hj83xPdDE3sNNgwGyyb6tri/bTB49sEtV95/Sqvf3LX9rdB49lYfR5hwsEK9/Br2sYNDEpTDl6ufTC9d4I2FdCFI+IMAb0W5YSmUlKI2WlUtlOnTphn3z0oaWwG+Z5rGMkFCAj0u/rYhXECFQvkX4uMnhYP4UnhSzphD7y6dQyj+VevGp/8Zd/qXFQkPCZE9av4hwLx0UM/gDMwJ/Q3vNAwsTnUxlaD1gCKot66WgO2UcqNx4rQagjrKezEaarz4RSGaR4ARvKQvm8kpASoJLgeIH6/Clc0DCVBj9k8yAFrLl+xwqJtq1M5OylU8t2dW3ZziwvQ/fkbbPWshs7R3bzsGn36wN7DGt0B7vIRhfCnWeZ3FHWj2BNHNigcYSVj909BHkXgrwHl/4Bd/9EKgp/fBRZFELyEaxV0hoKwt3RFENsRlLY2JycnbDJYsauf37Lav2UJRE3gMKhghFK2TiFw76RRyLsgme4w6YfpG2DVzf29jDGrL18+pTVK0foBuoDnWi1S66R/oQgXTApI8KdXmKMDZRnzMc5HcbGAFEulvXS9fMOoBOVIa8RlAnIf59EP2bU5hCxgs1VFUr5AcbKV3/w8C0B8hVR73SqZ7NTs7a9tW17SVoYpAfbA5+Dj/kNkGK/ZafXVuwRLJVuOikrgdf4+pxnCXwC6mXd7BO7xWi6AaEUjmDZNVDfysKiraD8EayGeqBlDMTv7AcD/EF/eOdVMp/DWixbdf/QOtjM9HlbdGg/tOthRK2yX97rBPhQoUTACKX5aNY3AqNhV97V8ywcK/YbWhoBotk9BkLS0/IcE+0YaZigk1cEo50nhIAu7DJMAYKFT4WRzhesB+Hwu6+/bFv1hv2/7mzbr6ptu4EFW8NuopIr6CEqK5stFdN2GTvUqZkJ24Ew2IfF8fLJ03b/w+t24+Eja3eoMLhIec6M3ZyOpagw3KIUATW5wKirDNONIhywz4wK0eo/lgHipTQgTHmd4fTpk/bJZ59qZ6zXh/BclIWCEPcQ1rdTpA5VvZgWSCEMwamjHSCfx+B7t7ij+uY3v2kffvgR5BhMdIT5fQx+jEYPGEKYqU5/HhspDsZ5YBv6i4TM0wBlhsVcHfEw+4i+SWjpAjXmkZaDFAL7TiUBf+QOlURQEBR+wc/jplQuKwsiAzcH5dHDwuYtw9NTZbt0/rR95fVXYYGesgY2EBvrj+3jT2/Z/Y1dO2xjB5nIYneagTCAH5sEfsqz14JCqFZtQEuiVYVQb0CA06KoOgXB3b6Ugz9yoiXBI6egJOB3gp4WBVzyEIVTpCg4v57WUBr5ftteOXvCbt69b3tVzA/6PkAbSdbDDQuvp6E8eZE8qY1EQM4Z4+QCUSfXRx9Ktgqrp3N4oDc2Hxzso0voJ2jPi/gSZ5obItdZfJIAIah05zpuOwaYpiTyhssjny/DtkLsE3UwSAxFVZfLxU1ECZuAJYydm57H1brtgjdlfYKOVBo5dD2X6Nrp+QXbe7xpG2ATHksFHma/ON4e6Fku5m0mm7I9WGxNrkMqFq1poAexN8txbmKgh7rRqyb6xNuqNx4/tstQHHybwg5onC8UdARFYN+HwH6Q7RMqV0O/X1hZsYOdHX1bxPGDb4uu9xKC0tC1EYU9xPqmuHj5eAUeouNIQtwfAHFu3E/BMfiNlEbU+Sc9o+Cj5YxnOa6IN+040cygPxBbfWccJppC1ykNCJNMHoujbNls0i6tTdsqdpI/fvcTFL1gjQSEJQToPJiqOFGyHrgrVxzYKcinb1ja1jH5Dw4r9m1YKrfW9+0vH1chCyAYeCTAXZ23NLhQ3RtAHUMQRug4Mglk+NjQogBdoASmUxr08wNM3AmdO3va1h+tW0c7SNRHJMT9AFVFCB7U4xSI80uIUpiibi44vbId/f/KG29YBQLzzp27yOisDL6Zl2V1my3LBmHE5sKYGC+HbWAe6CDpCcURD6qIMjnkXAWksuD4eRFRyoKKgMoBcZpb56er6xuyQlgGVgWtCFkTmMAs55510FrjRV4mJW2mXLKl2Wl74dyqXTqzbMsLc3qw7vrtdXv747t2e6dmO1AO3UwRgifHL/tar96EtdCwFBVntw3rgYqAwhr0we6UF5qZzjg+aZ2ABWBQIok2X9UBRRG3AqQkmMfxjS6ASqD3dJOFe3aCAsrTGXTk88OLpaytTBbso9sPrJPMgvxI74IP2UHMf1xRDHfCfPiSVbAOt+iJWidIUPWg2wGs5v2dXXvl4nmbTHesBmXXlOXnji4F8bkK/oBKd3n4FwGTnSNQVo/uGqRPUZz3IxAE4RBYwDlRJfp3u/QC4i5jbqvo7y1s5NriPUcLHu+S3XuwJM9NTlkPFtVd0LgNIvDLho4uzD+wBtb5wdGhfb2UtAPk2eH76sK1PNan1hz4XgxBSeyPrwvz04eSWMfGYg2bsmvlou1AQbeQzNkYAur17XNyuCabza6dKGTAxml7xGtWzB6UlubVeR24UwAVh6Ohqz5Gjed1oHz0KM1lGMYdU4D85b1xOCZnBKnESkxpHFf6eaAyzyk4kozuMHxskWGCdhtkIiFjUA5EF5dwZ6RdaNryxSnsLpP24ktn7OObj63SgdWRncLE9qyPXUWvlLLpibydgSXy98Anf4jd6NcgeFJYkIlcya63yvarO7vWOMIE1nYhHLi7hCDAwnc7PLfYHcOMAaN8dOi57sKIxcVS3KLkGLzLJ8LbEDoXL1yww8NDIcesnUFQGPGJDlUxCq4Ea6AT6qRCDReQ+QAfFcbly1dsBTubd955R4W4G9JDfKrfCSExrQST9xNYv9B7XBQAeZzHZ8B4Qh6OTS7mSAI/uF4xcO5kNfCaRDheoiKgyzikK95ZE7x2xWsZVBC0IrjQeBbNr9Qhp81Mlm1lacFOnzxpZ4BTEBy8tHlYrdm9R1t2695je7i5Y0c1KAb2E0Ah3qM1weMaCPs+lQIEPl+P39c1A849aAHlQOuBR0y0FvgOp6S/BiGF4FGKglYE/AOk8fUdYZMh4Q+Xc+j8pC0nz9MQ8fy+w4nlZauhj1u7R4hEAuvlfMBy4EsEIz5AHZHgALq5Qwn5QWoE3OyhDsRxc0CN2kEb23u7VoRVu4rdMcdUbzSx78KmgnnIj8NJ9W4M/PzHkzALI0XEt87r0gKobAgfL6BcJH6Y1/v5R5pNAF+ExciLxxtci2yFdFS32eYA1uLArk5MWgl0uw4FzwvXejkiU0UbPpwH2oEOWciF0sSENSDw9T0dEo5zQ3BFREt2Q+uQcS7axaFe9ktPfGOuD2sVXSM5t7RiaaxlrmdepOe7skTXQRtWCiz6AfpEZYboAnhtaWbWKry7Dnk6PKIisBG2KT9c3z7bjeZdjnOjvAEQjngCQWIETPPeAKSe4saqIbi8xyQAUsnVF/Q9DVdYUzICEhrPgyjLU/KORzP8tGrZAbQZhJWYUXnxIwHCXSifcs4gPoEdZs6WV+asNJ236zd3MGGTUBhgEuTtFrJ2MJW20+WMfQ/a/T/M5+wraGAJMmopD/M9WbD/ci9jh1tVS27v2qC6gwVVgyCgEAAjgSn4sj73xlnPWAE8oThJFEdiNCoM+pUCYDgKIB59GgrWBOQpBXvPTp0+idSBvjGub2xIuCgKiB/flgMfYHnW5f3hSEo0ArIYTedvfetb+mQr79/n7Orj/uFIg8CMOtYgwo9/9Rk/XJT0Cxml/PwBcEFIYXBM8NPURt/DsRKFv7v+4B+ug4By1gWtBCIvaCMfb4/lHU5QCnKpWDgOpFFRpGFd8NoEbx2lNTE/PW0Xz521l194QYqCbxs+2N+3+/fu2YP1R7azf2R7lZZVse1rD1KYO/APxswjOD4TMehAgfAaAxSA6doFj4+gFLBwKfyT9EP46IV/VCzMC7++1y4rg+XAH1QsEu7kFboIU0Fw7iTUgOQZ0jRIoUBMP2/8KBjfrnr29Hm783Ab1XStx5svUEZn8izm6+ICd/MTEBUAWS3DcqUyMWccs89AodjjRV9kqNfQd1hML545pbnYAd0yvMMsKH4W8TUJ6FUwFhcAUeL2eDrqCDmDK2AAyOpH5YlinJegfPjx9eQTfZtPJ+zURNFuHxzYgUwolPHj59rjuNrgv6tQiMvgtV8eHOoBOic8Hf3VCuaGVmkFvL5YyNs85nsbm0O+HRcT7xpnGefzSmcIToFQKDMddXJTCpd3W+/A6swdHtnVU6eQs28NtNPGJom05+dpoZpRDu2gOyyfBj9NF0q6mH4InuIGdwQ0F2zfofrj+zaiMILXe5hHfBIDlXVelQnheFxU0RiM5I1lSdkKn9MYwkhG/cDxbhQBGPo8HJNnBOLR9I9nizqFBDINdwuegXQBlYIEE0xm18U3TEq5XLLawa799u9+2z64/gk0P8w/MAWnaVDKWX8aVsd0yl7Im/335wp2BgRKQWiwnhyUzSEW0z9Zr1tjAwpjbw+rikoD2l8CAQg3AeZyR1NPISyih0NhvyOv+4m5Q6UBpFUAPwXa4uI8BHzR7t25AwELZpMQR7HAGJpYD94brAzIB9RJerBOpzBIG16reP31121ra8tuf/aZdvIUPZFwI7BeCSX6XdjRHP+ksfM4dKoRXtd/Z9UAqQiETkGwnSRvbeXDcwxLOcDlcSKVAv16jgJzFI6bgO6aCbxQMHnkAxUkoAuoe2Fm2l596UW79tJLUhS8rfLGzVv2/gcf2r37D23/sGJNKHm+w4nXamhN6UV9QajDL6EB5HxSyOtaAy0Mr0D6UiJUDlAUwfUKRYoF9fBVFK6+Yb1BSURHT09sMDgqAsZDOmKcTuECUX5tqmjlEnbSm+BBlO+wPZahosB8uHdIsV4KqjHloWrdpiUAY5VCxqTDpvDH62ekTQPK6MHmlr3+wmUrQylv7ewaP93qPt/q+xWQYeExwCzHpfmy7KdK88d1aJhbCYgcJgJ8amgX/wsQpufnZ62KdfiALx/kZxCYHfOs2uB3z+2YXQQvroGOP9vdk8AmiEzy8CehvRHHWcTcvnhi1e5sbIEnM7qw7up1SIXBXri5pEhWBYpzq4CZFOW6i7V4hLy84eC1xQVLZVPWgBSqkedTWAsJrD0oMj7Yq4fWUZxW6WrZvRKl4RWUU6jO7zpPHkB8FBVPi4U9sLTvloDJrHI8H8FF+XF6CHHPg1RiTGk8AfFaARqXj+TvWLKPeCJ2CKHQE1nQWUlAIP8pmChgCRK2iPRCl+f2elCtXrW3vv1NGAZd+/zmfR139LHjTeXK1ueHcGb4TYO0reWT9lohZ2exa0mTETALh5jEG9D+f/IAk7YFZXEArO9DaUCpUGFQIOgYB+iZ5zjQpAa/77sPuJ9YWIKdQpfjAiEpdGkt5GH18ONHN27exGZ9XGl4JNBVPRDWfAIadUQKlTt0v0tn3MrKmq2urtpPf/ozy2MxdSlAyZwUdqoOPxJG9KMOVs2+CtkI+geaS0HH+hysCVkUoLc7eqLS4O2vzqLgd01GHq6Dn4szfOBIrlccaSywLOaliDpK6HsJ/uli0U4uL9nlixelJOZmIThqNbsJRfEBb1i4fVuvdXBHTkkpQw5NwpU7dK8wqBh0ZBQUgT+SCpYG06QQqEhIF4W9H/HuWoJTOERnSQQk7dQo+hD3wyVopQf0IPqRjlTq6HerYa9fvWyPN7dt96juLFpmjymJqE64nBq144E+VkkfXaUoTIg8Q9B8gj/Qhzt3btss6LqMDUui3bE2r+1gPnVcc1zZ4wDZXM7R/AqhQ1zOXBNOGD4JI/1lnjgCzsGyvLC4aB9s7tgBNwSsUHRGnSIR/F5pnMKaOTs3bz8HLdvgUdWtnwAs64rzw2Ic5umFBTvgF/bYHvMKQUu4TnFwDqIEl+b9zpKBlyGU5+d6+WxIA9bLxPyUTWDTmgH/8LvkLb55QA2jPvBntw8lDtlyolSyg07XjuAnK/vqnEf9YHvOPwIKxtMcMuxJ52G03HHKw42DKAo9FePwTKURZR4vBXgaIwhGksbyMRjwCQiRjtHcrtb7uXvAxFCQ8R58vu54bn7OvvFbX7Uf/sXfQK/nrQ1TkIyfzE5AaZTNpokZK2cTNgdh9EombcUulAIW+d10wX6w1bB3NhrW3IXCqOxaon7olAaFtlcaEhZh4Y6B1hdd57DX7G4IuJ9YWEpQY4GgZUaEeV2DL0d84coVu333DprFrjVMJCH4o3pcOUZIYdCPOnhsx/P/NIQxv/Vx7dXX7DaEa6OJPQ+EEOuVMKJ0JQQ3AjAd22D/VC9cKgjU75DKAsi2fHtoTIrCHT8FpeEURrAq+I0K3i7LMN8m65QJynKx45/Xo5Ymi3Z2AUrixAm7eGLFFiYnsbi6tr2zYw/XH9nde/ft4eMNqzQwFgjcBBZiB+PhmHhur3NmKQogxh7dmkolIEQ4biVI6NMN/iHyOEhKgkKafrrHoRYpUdJLftKQY3JuHBGlKeP8g4/R/wyk3sxE0c6dPGGf3bprTQgSt1lAfvzLZZ9CvUDyl58khBhHgKs24fNuBD4vgaWH+bDjzeVs/+hQ72J7YXXNCpjjHd42TIHLtiOIV8r4eNg34eNCivgn1jb7HeSFi9VIfCg4+InKOefaRNmysCB/DYXK734LRArIALjcJDjr3WwJwvoyNkof7O5r584VGwd3dOxmjBYLn7h/GTv9JCTHQ24O2azqRnVArW3M8wgtvNd9U5zowizM4g1YFZuZgnVaFVstZOyFUsG2wfdH2CTlQNcU+sAvCQ76SSsg7yTCGWyQao269bC2dA1K/XD1D5XGsKmgxFz/mOBHiozMGyir8go7JARWHCLLM8VD3D8Grg6X4bmWRrwRQeSBN8YIx4ISxlIZDPgEIJL9Qr1SFFhkcim0qDBA2CQFDuIpGH/7O9+xzz7/VAKFwoknuvy+RjIHocN3CU1P2GA6bZNQGkUIjRns6B+jgR9BsTxotrDD27G7D3esWWlZt9qyRO3Aku2GBJaUBl2eN0YCdthxTVocEK0J4xBcFoALB28QlFKA9GBcGfSlCcF+AbvqR48ewY8dH/OHH7XtGyO9UcZVBoS5K0WKOnTXFM1fLKRLl6/oxYuff/65szBYjSwNz2B0g191EcBkFGqiNRWEtyC8S0FPhazbY3n0JKWQQ5xzwxtj6U9AIFFJ8IWA7iNGvDUaOy9aF526lTI9W5sr27VLp+ylK5dtYXkN/ezb/Ucb9vGdu3bz4SN7vHdoB42mNdtdKQgKOh47UcFyR05SaCeuC9ceOUaN06PmkPPnxusEPomBMMsGOjyBju5coJHQ0AKNoebEL0y3gtUnxcfCjOK0O4VB+lJpgI+xefnKS1d1Deb+403s/ims0Tbq1mIWxF3GqwHQIsQTXFxwXY8ArjOuTMgCUE2+YzyqqYDftvf37Qr470Qhb5WDAwPlkC+oJV+ebUbtDit0zQzDBLbJnEwDNylGgAiX3/ld0mh6yFMqFuzK4pLdunvPtqFk+ULBCFB5EJ7SJeD7WezYz84v2n6jawewQttcGz5L6DpvFAiCkgqad86tzM7bRLNtNfBPS3UjD/ODD8LF9Ajg1fXtKOhppO7TR95pWwttH3Z6mOaCvbA4Z3ODjhRHA+PgxkoshLXUQp7l+VlrVo+siTAtFQE7EHiVlftoyRX4Ax84YKLLwPh4SoARxechxEX5EQwz/jxI2fJlKA1mdqg5fAooaSTdN4w4RgcURJ5h3UI1QH+UIQY+Tozj0Ala+CHIUlkvxBA+efa0ra6t2Y9++AMrLyxak7sFCq103lJ8gWEZymN2wgqTCVvJDOxMLmPNWkVHUv+k0rb13YYV0hOWbXZt8849a0FAZZqH7qEqKAvdKkmFIQz9BXII8sUnyKfJcf7Rxcs0Px6GKPg98tpDt9WyE6dOWaVyZJUj97yrbr1ls2IkV36IiGJ57rIo4KEweC2Ez2SkYdLz4vcv3/2V6kqnMvoKoROGXoBqPL5e1c1qsXtDnbxriTTmRXoeI7njJcRB4DuFgd0Zn7jOF9yrxKEQUnxbbK6ou9GorJM5fvUupdOyHKarRKWdT1sZu6+vvv6KvfLyS7a4tGhHlYp9/PlN++jTm7YOhVGBIu9gF9iDcO2gnx0IAj65TsXHTQLnhFaALkrzmYg2LQiOi7QCamx+nFIWfryRn0iFAlflGPbl4Drh4usifeCSQgorzoHm0UsipSuOv4xjwKGbrhDgfFOxU2kkbaaQtSvnz9p7H30i64m7TFbp2vWu/BAeDLrIIbgGVbXzIz3EBUBYMfF4X40EHuJBUW06eCPBmfl5W15a0l18SkefpGAIcAL/Oi3I9vjv4+KgKJcSpaovKsCAR/4yDrTx8fzLo+ol8HYBvHUP1mYNwhYzhSaRoHnwgyCwHIT0JNb/8tS0+rhxsK8H7qL5xPRSeaEVAOvg1Pe19nKYe74IcQO7/SbrAh8wH60YKTzSQOVcU0xzwtzfnaZ+e1dt9UTTNua02RlYEY1fXl2xFhRZabJsTSyINirhdY36IG2rpbysvW1smjropxoLdRJIG0aQ9iHKuw6GARYTPQWcP+/1oJHE4pxqZ5yLdOWfjiFfylaoNOLgKgq7pyE6UGH9BECaH0UUPZI+DszvMvA3jvpVgAIMw2c+CkdIH57Dhh0wH8t/9bVr9smnn+iFYrzgSkGjC6/FsqVLU9abn7HUyrSdWUzZS4g+fVjRBbKPBxn7VxV+x7dpn3xw3873G3YJu972/mNrHuxphyEhg35qR+c6BoAHqp5mbpJ3QoSZ01iGyD+KEqUiSpPo83D6uVvgERvHReWhaxhIm52ZwWY+Y1ubm8gO4e2rj0BCR4VdfayM9EAZ1sGnf3md43d+5y27e++23b27zkLgYR61oDIJxsCVrnLmD8dPfKFdGouzT8VAaY86+1C0vPYwgBJI0loA8vvZyWwRurlkPZjWfbSbhKJOZsuWKE5Zh0oDimsyn7LVqZxdXp6wl09M2aW1eZufLtsWdta/vvXQ3vv8oT3YPMD8YfTI3wU9qSi67R4UBa9D8BZWd+TEW591yyvik3zoEn7eipqkoKfQ53xBCPDupxT8uuBNpQCFr7NpjH94tOTCUi7er9kRWTxtQhxnBkHNpp9vJ0Lcr+ZWrgfNcwwQdjyMGkBjHktRuZO3z0GQ8Bvst6AseSdgNOFwwi5ahyzsZ6j2ifrHUD++HhcROTGPA98e+6ddPAUnNhlF9O2lEyd0t10b9ExksamhxY185E9emFefxIuKdlVHiJ+wJdZYXLQAHkczIviO60mRFM/uYdc0ys9hft8slexuvWaP0JZTGJ4WpEkcWBUUTBZ9LKGvs6WMre/v2iEStPEiX5DvOVx2BnVwztlWk2OB5boGYb6PVmqYj6SacAoBq4CFhOIFoI6mQjR/fJ30OtmADrF+hHtYSwf5ojUwtj/MZy2X6Nj9ItYk+tjN5EGmspXbNTu/OG/3Kk3rgT8GkG8kIdc0rXutT655tM4/3dGI8YgngXI5TqWqE65fguAnL8FV3z3G/CoXT3sKktQit61cefaFcA9iDhUJ/mMA8WKC42A8eqySYYiVeEKBYFpsIKDeJQQi9kGUBexSl5eX7MPr1608OQUzDwNK80trE1AaczaYXLEBhFVyPmlfKzUh0JL2HtT4THYKO6o9u7dZN1vftPbWhh09emD1yoG9cPGsZbnjun9Pu3Xdzoo+iv/ZVy4SIfrEeHVVic71cW5nplQlRelR0NfJXSdcXcxFHBfk0uKCbrtlcTfJLBDqYiGgyuKH/aNVgD5TYVDAnDq9anNz8/aTn/4c2cFwLCocTrgrT+VLxQAzAOXdhWxepM5ZD5ZE9BU7WBT8ip3RgiB94efX7PpQGN38pPX1waKS5SZKVsonbSLTtdOzebt6Zs1Or63axPScHfVSdmu3Zdcf7tnNjUN7tF+xBiwfCnAsK11v4HuWrAmrwT+J75QEFADQPVE9vChNIeBeK83zZrqM563RyCtlAUWjeKKnodwhBlpEiGi5oDFd90NAGH5XgsHgeqTDMj6eTSmP0hGPeWKa5lh30oCHQXveEXb+zFn7/OZN7S5ZLjpuEWD2R8IefDuujWE7UTwh8isROFpHLCdgSAs2BzVtR9WqHQL57MhMqWjNowPsmmGRIAP5lu9HU98QN1pXDKIEjiPyAsK6YRhtMwDkWtNRNFxuCMuZhJ2dKtod9OMAAlHtjVY07DRR7cEywPxfnpux+zu7tstXp6ssslCo0iPhCoIr3t1K3+51rA7eubC8Yu3DIztUvBP6HK9GyWJA9Te0D9CNF7G61Q3yXSy+C+yAZo9Q4US5YC9KEyWsxTusCkiHcp4tY/1AofBDvm1Y71nwCDcSfN2JBscmgaxfFGR7jAsJ8rs0l8dDlMfHxcIEFxdx9xeGL6w0Ajie5GJQ8FgIiy+g4Lj845VwPCxLgUhGomCFcNOFV7h5MvHWpn3n733PPr91yw4rNci8nHX5rh7sdPv5KX29LzG7ZsmljM1Mtew7K2Ai5Puwm7LTvYJtfLpuj7ZrZlsQzvtbVsOkHe1u283r79vrr71mZ8+etc8++9T3g+P0Qp5HQeoXAux3SAsDk+P9AWJxgSYqy4GyPk4+gK8P4es9+DLBra1t3XbJhTJcLCgTFAXpIoEPP4VQ1j3PUCjl7LXXX7Yf/eRtZMlCtoaLeK4Nt9DxH9GVdzFBWciygDLmLpIKAgqBSsJysByoFBguQBkXJi0FS8L0jexJKIpJGB2wPrDgsnyNw/KsvXntqp1anLWd7V278/Cx3VrftkeHbdtpp6zehcnegekOYvLOJT5R7d7YymMmryx4ZEBE32lZOIXhj5M4HrhcqJGy8C6VBZ+4Zj73YkkNGD8YcKCh4hjDOOcfxgH0QzfMk/ML6I6EnRO5hJF0uKCze46GfipmKA0Ixix4eX5ywkrlst2+99Cy+Zyu0zDbyJwTj+ug+kIMfhctv4scxoWw6hlGh1g3UpfG8qAmLD7swEH3FgT2/NSEnYZFtLG9JWGu/S1o7na+w/qeDr4FjcUD2nHluHLgY5govgSZEDVXyNkMNoi3+ZEpnzeiSaiLDv2sDNJc/eu07M0TK3Z3c9u2+k65Kbtc8orjnUBnIsSCHUJxrCYzdgIbrtv7O1hqiGRT0hLoG4oSUQDRLOeaVZ0xBSFEuixZxoGXya98WeHDYt7yqO8alEUaVkej17RGEfyQK+rQ4BL8h+Dhfa5BlE9mYOnz+i1biup3FgYo5dr27fGfIFI4L8BHjjjDvA689BqJGwXNHdNjmEpAaYTGhg0+G8SfzP2cAmSGCJ6WdyQP64QJxsUGDO8Y0pk9CNgEU6xePI8d9Zq99/5HMOWwK+aNz6miDQrT1p+YBcctWRa7pDcWuvbWWs5uVNK2u9WxM/WUrbUGdvfDT+1wp6ZvDhhfRIddbb/btKx17Nc/e9tml5bstVdf1edX6zCPuRuhKasjJQyCf+6hN8fo0UVJEjcMxY8jimCQf4pzkODqYBh18PoBzf4zp09DaWxqJ010NSOPFAT74AWRFJeLS/H4CLuYC5cuYNfatofrG9blbae+bWf5sB0iy9K6oKLwdzLBStGFbTKrvlwHpLLIQVHAMrPyjNkElcaUaDwoz1mumLXpTMvO5rr2teVp+73zp2x+dtE+vL9jf/bZlt2tdLEAkti5YueIOUs0Di3Z4vcfalASUNi8bqRrFKAtj5m6WAy0KhDHz3XyyMA9XU0FgEUqRcHFyoVCpIII1oVbtGEaHI2xqNzwIwi0H+HJAIwLdIrC3o2FXZ0hLng5ryGCDlyP5BnRHzTXO7So5JHlEgTb1t6+nilqQWGGtR+OzrRQBYz0XteIA3ldG4IR1/vpspoQFIS+EmL5CGofpISX73Zqog/bR0ey9L964bzbhVMIYk61w1YxcvUXBJ9fv+yEjnjhikZufWXQ/gI2D+dn5u2o0rTNZkPn/4E+7sdjRCMeCaHP6Hyi17ZXYWk8PqrpjihXjoneZe/hshehO1QCen6i1rDF2TkdfzbAexw/hTPLUVBzM0NgO2ye8SMWjI8T0CGNlId+LKdE1vYgwz7Ip+xMfmCXsdFb6uRsC0txs1uzN7B52Ad/PGRfYLXTytBbr0kf1sn64OMaSJHfI0Xi2wRoTC43opEH9OX4XARQGWJhuc7jyj4JjB/HVEIXwofAhkLiM0GZnptLMLJQjysS0ulSGIJR9Sps7oipNKB1eTzFN0L+g3/3j+zX739g2wcVG2SLmC8Izfyk9SDMjNcFlmZtanXKXjlVtHy/aT9/1LHGdt0uggW6YKZPP/7c6nB7h/vujaR66hf7GQo3CNDHjx7rAu2lSxdldfDOJn5kngsljb6QUdAzdNUxuro+TodYUEMaGTRCLAekFSXBzx0/gguLC7A4Wu4OKjEEs7MCpzD4IBPvstGnS2EhpHI5bGCTVpzI2ZWrV+z6R5+BRsiDcno9BMtSUdBaA0PqAbxwNxPMYL5WniglQYuiCOVAa40WxcS02SS/u+6UBu98Wswl7VQ5aZemiljYMza3uGxdWHg3tyv20YNN26zUrYNFRSVMS0LffeDDkqCxXrlB5DUoj3w+IKEjKT5kx2cp4Jei8A9UguZysVBoQegsF4tXt0HHFypdgV9gGHdEcXlcSLw9muDD+JEnlCcyzgdC2AejOHmdRzxOr1zOL+Ys8Ahpjznj531z4KEzayt27/Fj3byhawRoVYscKMVI0Pw573hbrg3nHYkLIL8Pc0DxNMQPg8ET8noRgwySdeCbSqOurzvyVS1l8Gq9io0UsgfRG1X1PGCjAVlOjqc3eRR+KtSTEJbz83P24f6eVcEHpA4zsWduTaBnpBXjCSjH3nLzxu9dvDQ5aXudvt1twJplMhtgOVXiygZwXvwgIwV0/QjrHtbGHsbbYGGmU0AzC9AHNU8qLPR1yCV4Dx3xLfoNvuWRVwvjbKRzWB+QIRjyTLoLRZmyiUHaipmcdbEGeTtwrYjGcynQA2ueqosyUaNxPJLWGhBFEOXaU6q8w7DcWJwgeH05Qsh7LMTyBXhCaRBGhPxzgFP2JbK7Th9XgHFkACoKUtQrDNqrSQhIvkbiyktXbRrC6qdv/9xSpSkwbxZCFFiEgJtYMFucttlTc3bmzKTNTWTs3saOfb6fsd7Wnl2FwLv7cMMePHxkfVoQtYql+G6hNgR0twVZBYsDTMdFXMEO69HjR3Z0dGhXrlyxU1gwHQi2w40NWTz8op+Evu+36BXCnIIwkRpniNfAXX6MjwpAt8linGRYIj/FOgEBvbe/r9xkNNVE4aOjpKy5b1vzekNRb3ZNpvr23e99227duWvbu1XVxzJ6LgPt6CiLO11ZFlA2WV7QhqIAg/JOJ6cwylAUk5Yuz1q2PG+DyRkbTJOmk87KQL9OlTP2xsqkfW0xb4uYkzasiU8PO/arvabdbCRtHwqgCysi2di2VOMAlgX8VBxSCFAC2MENOhABPIYCJpE/xQvbUCTJPpUF0nnBFcpBR0xUGFh0uvYBP79pIoXhrQ+3kP1iEp2d11M5BsN05/j5GgfFxeIRVl0hb7xM8KpISPd+IunOhQ6/Owrk8RTCPDs/f9b4SvrNnR1dgNb1GTfbcuOCQOCrj3m8lz8+Tn1AWwxH/fEuwQ2EPyEQS3abDI1TdEUP2AX8YSb4KXM7hHI72N21C3wh5OKi7R8cWlf9RmK8nWeBsjE/Hde+RD89pBHcFBp+ZWnO6rBRrzexsUMO3uwABznRI/nRLvvJ6kJ5eWGpgDdeKJetDgV9C8oNq1TjcQNyfKTKBHSBvnwT6Vw5K+hLopCzQ2zedHcUivACN+dUt3pLibB9piGMskpXtb4N+QHMhzCvN8pK5TF6N23bmZLVwRLFwY6dsZKtJMr2ELnK2YJNY21sJRvYjPHGFKxZrWfOLHgKVdBSSnHDhb4EC5zANOd62sT7ACekixZx8OlPg7HcgmOVhgDEHGnsGaCcXyRjgDDRcWCchDGIRKVBYUehim7zjhMKyK9/4+v2Nz/5sUHUuKMpvqkSZp2VIeBmVi29NmenYGV8Z6Von2037b2thDU2Dm0aQuz0RN/efu99a0Bh9Krb1mseWb/NnTCsDR2JQHAFEkEicTG3W227f+8+Ji9l3/n2t212YcEe3H8IgdyxfD6v6xA8uuL7oqgIpOw0DtbBhUE/qRPGi/oZRj62xDslZAVAESVhMeQxllOnz9jnt25aEsK8j3R+3zrB24h59pkp2gB5+2h7kJtEeGC/9eYr0B9l+9kv3rd+pmBd0LAPBcNXdfDYK4XyyYy/8wmKIotyqdyEPlrT1zUKWBKTs6DfvPWnpqwLpZyanbLCVN5Oper2UqFpv3OyaC+szFgLY33nsGG/2G/Y582ebWE3x7ts+B1la8Dyg5LQW2C5g+axCy0JKgve8ss3x9JlHDYAul5BRQ2FMYAwJbpjJ6cwtMghBGRdUFhwZ8UF64g7pKuCgb6A4BXtY/4YHKc0VHMsXpyAMKOiZRUvR68wxMGVH4j5Dfzg7vpjGDX22vaV11+zz2/csAroxvUbXafxAkDCCBImVB0JAcb7ttzInT8eUp8JoU9R3wBMjAVVLsrmyg+TfU10gOwnlcedrS0rwbr9xssvGXZU4P+2voEt4RqBqyWq0dftYJjPrQ23XqhguSngk1ZfvXzBPr1523a7fFMtG8f8kxe837mBJvhFkMfFpLVu1YWbwXp4tH+oNG48SNsRYQ5g+YCKx+ali3V8gE3OyvSs9fb2rJPNWgN8y/XPU3A1zc0Y2+eYR8YNCP3yrptLhoFdHnPz1momQCFjfe5mylbDXKdhVSyXkvZqs25/hE3di5AFVIDrvMGF1xpRjp8E5nroY6PLz0+LFmiHtw5zAxV4h34hmjmuf6Pg8j8L3Dhi9eH/6UojDpyULwJ/i3xiIkyOBC93ZUQoC13PgGBdO3kCG98J+/j9Dyw9MYt1xbN87LSLEzaYWDKbP2urqzm7fApCsNG19+7s295mw2xnzybru3aqlLCPP77pdr7NA12M5SS4J4RBCSLDZC5SBmF+oIX92t3esY8+/NAWFxax6N8wfgmO73Riv3i0RKSloCMJWhz4187Cj0vxdIUcW1wxQjFknILk09wnT520W1BUqalp66bINBD4UAZ9mLW8s4nHSQPE8xmJpdmyvXTlgv3lj9+FUpi0XhLLLgm6pKBIUcbSxKKUSZ93QMGiSOamLVGes8EMLLNpuqDXDOKnijaB+mbLKZvD6luDe2lp1lYWZuyo07BbsNpu7RzZw2bC9tp96IiadWHGGy9o93jMB4XRqFufT203YL1BoPTh9ptMa0tJJKFs9f4m+AcQoHy308ArDSkMoVvc4cw2LIKwDEVW8opc50eyaCvwjsALJed3bpQP4Lwh3Tm+AefGyyqsAH+G4ag+tEVAmBsf96Qy2w98YXblwjksuITd5CvqEdGjwsAY3bUajsKhW8gctEeAmhFThfboi/mVIZ7u/SFIYFVRfwnkR+9VRmXAn2uTTrCY+nAzpZLVKhU7wHq4dO6cZcDrvGAO1a484m8WUzn6fOU+UjH4UZqv12HScuCBUzPYrOSydvvxprVoHWMtsi9OoVL4o2LPFwI5LM8q0D+E51DX5MysbfIdVCjH1cy3RzilwQIOUURe1S8Pn1kxCPG+YUtl55dXbYMWP+qlwqDVI/BKQ4UV5eJZn6uT6XRjbRDx5zaXXOvoDpRBDeuywSvs7Zp9HUv2u+VJ+zriL5fztgyLaQNrZwdWRZ31NbFGuLmV0oBcgqwiTag0hm0ho/rmIIrzMB4mHBf3NGBe4hdTGgTVrp9nA5ngeXBMHnfOT0YCUSOFwbsLeASTtGuvXrPPPr9hHeycWwPu0HOIz1mqOIsd8imzxSv25smWnV4s2J/e6dv2NgTY5qYVDw9srlO1k+Wsff7B57qg1YaFwd2wGIlEpxuQk07l4QnJRa1bAuF/cO+e7WDB0ETnh234+vE6BGUbu+twLzsvcFNg8KhL48S4dDFUXjdGKht9lY4WARUGL2ZjvIN0QtdRDrAwKxT0FP5QBFICtBQmoDDys5YrTtpkrm9vvHzVdjb37N5uC4pnQnktBUUBi8TSZSAUKpSJlSYtUZq2DJRFamrJBrPL1plbscEcLIx5pC/lbWoybRfLSXtjsmevzSO7GuoAAP/0SURBVCTtdKZrMNbsHdT9c5DrYQu7MBoRsDTsCMqi2bA0MNHkN0gqlqhV3AeKGugLrQreQqtrGVAY/C4ElbQUNZQFj6MGVBTe1TPInub4T/ZBJ0yDdtycBk8//Dt/AHqfF5YLj49/utKg68WlvPgJ6SGsYHAD+nAsn1MSDHs/+IHXw165ctFu3bxpB/x2ONJ0s4PGrMF6dBBqFfiAO9uWT3/BN5YbgHAUFfcDAj0jQA0+GE+iQz9dtkqLmkeetDYPYZXvHhzYGQj585P8pGwDaxLrBJk5HJbzYsz98ofx8jsPnxFSBDODRjOwxK4uzdnd3QPbAu/0EMc1xJ29FKvWJntIUEHnZUuiNdgdyWXgwsK87e7tWh1lyVl9bUaQAOQMh5LiLSIUkVY45Q4imhjPHAT4JDZou5VDa/KInFSI8nO+2CQDrBZ1BsL5ONdXxvs5G6AFrnfKObSjExUUaXL5Jzr2P8om7M1sySbR4YleS981X0Sd71ZrtsmDNh7t6tX9WFM8niJtyD+SVegLxiDlF9FoCOKxcYji6JImof+joDrHIGVLF6E0fMHjy0Wg9DjqB2WDX/EKPBuOy0PiYncRWRkQqk7AgqFmp21lbc0+uXETnJGzbgI77QQEJC+AT52wybk5u7KYtdOnZu363R0wXtPafJ/U4Y5lG3s2UxxALvft1q37YsQeL3xLaaDvPYwbxOfDYp6fMSR4Ampi+thVpSwHc7GNXfPm1qZujT0Fq4DXPLj4t2F5SMEhH8M6q0b/xSQYr57tYOWMgwBxSKUB1B1MeetmSnZ+ZRn9Ldv6Yc+SUBAU/gMoCV2kJkIBZGDOfuMkdmXTC/bBZs3auSlrw6rowirhMxYG5uM1DyvAgihNwIqYsiQW+GB2yjqLZestI89K1hamE/biZMJeQ/ZLk0UYHGXbHmTsk4Oefbhndu+oY0f1nrX5rZEdKIXdQxvUjqAYeBzFL9lVoCDg5/EU31sEy4LfanCv9HAKQu98op+KghYFMVISQO4FQWYRh0rCXWXFPHg2DrwCJy7wBQwey0uhTMyV181FAOeN5Ql+QrzsiOt/6Ap9fBSHNjDH2gTRD/6lTFtZnLcpzMPHn35qqUzWCcQ4nwlRHq4TZlzIAXzd+FH/+c8wfkg2RbkIn5euDwoY570E1h/lV0A+lyWIQhdmiosHyMNNFB8INNs+qsCKzdq1CxfAC3WrwcrkNbR4zyVQGWYUCYF1zhsDsLCdH7Tisysr+aydmSzZ+w8fWwsbQ4plWvqywtgj/Ae6jIAbvMbP6rNoiK/Pb6Jv++DDFuKkcLg5VFnW5de6kBlcdAb94q3qfL0Kb365trpqTdSxgx0+3xvFTMyKUhLazhdDP2dBSNMvnuafxooxc/1zw0gZRz+UxXQ2Zd/NF+x8OmvYKiIeG1vIwsco98NqwzbgJlvgF2zSqDRouYM4GpMefuUdiLE246ixjoWH4P2Mc8R9EumMQcqWqTQCoAHVPAqhwZEnpEVEoMK+Zk2gPAo+FcYbYVgE9SgrI2WFIp/L2LLf/v3ft7sPH9o+tG6bu1DupiEkE4UZs+lVW12esW+cytu9va7dhBA92t0129uyRP3AMo0dW5kv2eHRnu1u7UF2dfSWSzERUMcgvEWVkxAIP0JYAAnPbGAUvtaCwIVzlxefd3b0KdU33njD1tfX9RlHPk/CMfFlhMT4zpOMwjvB3LGUVxgFd73BitN2cnbSLkAZ/frxEQyFRd362ofw50XpzMQEspQtN2jZd6+et9uHHbvbL1oHVkkvwwfx3AVud+ssyvCljZMoPwt3rmwZKIz8UsEmgDPzGTtXztjJAu+KyujNm/d2K3az0rEHlYHtHvX1YSAeNVFZpCo1S4D+g8oBbHh+LxsMzA9W1eGH8hAjg7buYjVoRGWhC9xeWUhBkMaeztHuGjShw3nVAnaLjBAX8IwaCRMYfF4c/SHs3VCPc+Jp3k+IykQ/w7g4hJ0k8zAZeSKlwbmGcEjDgrx4/qytP3pkFQgB5uF3VFSKYxc9wuLGn2jgoodtulTn836fxjDzDhUHneB6FMAT/K5A5JeX7cWAUexffKdKa5lLhp+k7WDsu7CKa9hEvXTpkqa0XqlCHsJK8FWzTypPenAj6K/j8eYA3YKM9Z4HjU5MlCwHfrl91LAGyrs2fbvsH9BZG4rwqB66f5Shh+0tgO/TzaY9AvKai+pip5kDTrgegVnSn2QZw+gXs/VZBn95bIBm5uc0Rl6SggpTq8zEi/auD3Sc3/dG4SAqI56NlAbH7uQbFccgn7EsaLMEJXEin7PFJPgCeTbQu7dR7EfVuu31MbYG1hE3ZEB9LZKbDioNvuOKbbMP8T55CP0JEO/jaN7Rcs8CKI1LI8dT0SCPAdegyBz9yhEMYx0HPgPG07nwKFRjBOV1Ag5jfnXNLl99wd794H3roLu8GNwfgOFgZVh51lJLS7Y2l7WLEx17507ddrHh7W3DItnfsUSjAqWxa6fXFu3Bw/vW5oLlnTx8DBcMqDshhF55eEKKyZw3omWwHshYjJIlAV8dwvPDDz/UDuWFF16wk2dO28HhgfLxK148wuLFaAkSjNsJEYR5JxN2aXq5HyyUAe9imliAbE/ZxYun7KM6FuXkgi7yp2ldTJQtMZW3k/muffvF8+hA3j496tpeDtYWrJSBLAsqHmAZCOWSmJu2weKU2XLJBstZm11J25uwLH67mLCvQnjnIMvvVDv257We/Xq/Y+tHPati0fYOoLAO961fObLBEZTE0b4NGgc6htJOh0dPVCa8XsEPGQ0QphAEagemi9monEpDlgRpRSFJf5h7uJQsFJBYFHGuChB4MRRh2E+HAxWJlwDE42J+lhUGP12XwF/ver8gxPsfJcfSFSY+TWkAtZvEtJaLtrI8b59+ehN7hIK1yIPgMWbXeEgf55GwEYy0RYuCfXZtuONOF46yBU8UAXjCD4xFqU3GMw7+YZLrmwOfSJ8ctElhh92wjkbA50cQXts7+3Z1adkWwX+dGt/jxD6rGFzSg3fwuWdVeEyjZ7DgzyDfNOpanZ21bT4LgjXe4iZOBUEXrrOAPlpAP+sHfaUwKD/wz+srS9iETaPsXQhc3ubqyqIAkeudRcl3CJKG4UI+Fb1eT4/KeXfjPnh4vlS2E2hkD3zPh/R0XYX00ZyxTu8K6LJ2X59+Qyzp5uRb2BTrnW6Qee1szj4qFayY6duJXt0OOhn7S7T5X2ANrvdTvARoVoGy4MaM36eH69YZLY3QDzUVtamwMDaXPkxXNBB6euBnGPd0ZPknlYZ3HSA0GoHKOXz5/J/zRRnH8o8AexYg7ufEhmsZICpva6Vgbbea9ju/97u2jp3MXeziE1neQQQrIwlhW5zSk8kLeQjr03xY6sju7cBEpoDbf6jdcLrXskFtF7u803b7zm0Ivi6sDCxYWhkgOJWFY0hHYe0jxACIk99PSMjHWDIdoniLLhUF+85nGDY3N/Sdb47/hatXbGllHml9q2In3oaQyEKw8xoM39PEt792+DoOXpyG0B+AMa0Iq2lqzaaLWTt/7rQdgRatYt6aExjvVMaSC1lrT/fs2lTaLpxYtr9utmw9l7J6DtOepxLNWKoAq2UCO7kZ4HzSygspOzGH/kyl7BXEX0D+QQ+LvAXTt2p2F5bZ+k7bDnebNthBxA4UxN4+FC5oCIa16qG3KpBGq6LprmXwbDXZAfJ5DH7UCuZ79BwGbx6gNSHLzdMtWmCOrEJtRYFcvPBF/OCjAwbBI4jHhfjx9MjFT3D5G/Gb59bjeBFOlEuZnN8V8MGROEaCZ0OYPxACUhZSGLz4abaysiR+2QOPkhziG9EDGNusBKFMjNaZgvLBgbAOYffPAOJCwPeF4Mv4TA6CXy5+5KpR5/dRRMaqB65TQwjzqDHgH/1PYa3S8t6vwrLPDuwc1mMK/FkFr/B1GYMM+sU8PFKWhc0w+ENKBJsk8G0WivVGtQIhn7UOlUbUBjykEf2KDAjQGNnHoUu6LUIYr2J93QAf69saMXqTQnpnmad5RHtWQWBbBMxfl/0DT6/NTNpOvW4dEJ9PzDu+5pEQ8qleFnD1OAuJ4OJdtawffaNso/KEKwQteG2Tr5WZhqzKYtz3qm37sNa162h3vde0VjtpvSYqgtXPZ8m09rzSkNKWLGNbbgxUAuMQdWkEGMn+wtEcH5vpWEjZ4sV/5MujwUA5D+qEixVGPyE+nvoFIZoduJEXEwHiccHR1U4GfwuLi3bt9dfsz//qryBcsZtO57BAMpbhR5b4XEGpZC9Nm60uLtmPbmxjl3yA3fGODQ62tCPO8Nu8nYqdPXXC7ty+bf1GW+ZcHzti3uoYKQ1PVZ2f+kWirskrwkgAhA47xvDlErBA4PKNmXz9B99Ue+/+Pds72IaFdNGuvviC5bH7eryxjewwxSemrEelIYsAiqI4Z8nJWRtMzlty7oRNw5qYmi1ZYSZnjXLGDqcK1oeiSE8nlP1VWBANCKAfQC+0imlLFpKWRL50MYN2MlaayVhxHvlnB3ZiemDnJ8xeTPRsqd6w1G7dPj0c2PWDgX2y17NH202rbtUtt4n93e6hJQ+JsCigLHTtgkdPun5BpUGFQcUBbMNPpMLghTldv/CKQhaGVxhBWThCOvBedwQT+IcRDmM5A7kFFJYR68QhHhf8jlG9N7TgE6MwY/AXoqOfmD+EvUveiNJCBmoF+nybOnoUH/Noite32nb58iVbX39sDfBfHwucgtaRBT+kFQFeVTsG6iNT8O9aD7mC37U/jAdEgwqux3gjoVgELpPLNqSLgAE/MfRyiWCEmkMJLMx9F+ugkYLl3YLgrx/ay6dOY82mbadRwwYvZym+6DJV1HcjBvxQdgbjhnWcxS77K1MTtg9euQFB2ccacXs2zztA9/JJ+KU4mBZo4pGDgetjbQH+C3Mz9uHjDQh+zIfojU0iqggKgy8m5Dp2CgU7dg6Q8b4ORacybMwKGMfKwpLtY33UKafYJ5alZQ3X0YZtyDMEBlGZon1fw91ounsSfMKjsBJky7VBBxvJCftFL2u3oDya6YFNtmp2xBPgOmiF9atv2EMRy+LgEbDWm1tr7LMXXYKhN+aLpY8CEliBvE/NFIG/EO7AMf4YcKDe68CHlfeY/M8CFfFl6PKf9WOBubNOEBKTksUugbuxV199FRbEDoTwfezGIWT16oE0GLCol+ZlCwX77gun7eHGjn20BYJWdyxxtAWLAowKQZbqd2wCQnV+dsoeoo5uExqaDORNO024GJGEQnyc6qGbrpPwxQg7THQ/qIdfiuOiZg1UIv1+0m68/7Ed1Fp2BYrjW7/zLevi7/HeluWmoPBmVq2TzEPx8V1OizaYnoX2m7TecspqU32bKqVtLzewrckMFl/WlrBQ/rvJou3AWvgg1bFDWBd8/XgWO7luGcxXGlhmYmCX8117M9e338skbM0yVq8N7FeHCfvlVt8+2uzb5n7DDregXHdgRezumR3sWvIAFgZ2if3avvWDwgANhbzATeuCZjGZlgqCR1JSFBgzmFaLRdYFGJmLXaueq87RVUQJSFpq0QdgJMDzQxwCP1I2EZ7GnxEEr+KG8eIxYvDT9X4BHN8LRnoPAJHM7brtyimf8gDpxpUGBIKOXzwf86hjbmbC5ubm7O69h5KvUhqsRbznXLWAf9YU9c73g/UOLQkfT7/SfVjg4wUx/3h6CEfxcXCt68cTnb+MdS46KR+7jX7DSwsjCF8e2Xa6WTvqJuzu0bZdOXnSTucLdlQFD5WmrFksi5d580eeD6rC0i4kUvbawoKtH1Vsg2f0urYF4c2dtISiPzrmOiXNfPsOkFdC2IfQoRT8PJq6tLRov3rw0LpoS/zpaS1C08GPUySO/nKVB3HB0sE88vvqB9gofePkCd2u/5CyA3l04RlrXmVYG+Kc68LjwC46OopoQLjoO4/peth8fbVYtI02LIxO1w6xtsoY7+l6y+7Xu1AckGWw3AZai3VsfOH3MiyMy3EhwLev6YWXjjyK5k9AQnABLBcLPgtGlAZb0KDicEzccLGN5X0eMH8o4v06jyTx/Fkn4/hdiGKxgF36VfvR2z+1dHnCwEIYFC8i58BsRb1zaWFuyl44ecp++eHHtg9NbEe7MOMOpTD4TEAHO+TTa/OWRp3rYCBey9DFI54DihnJmIEZnwLx/gaQN5RBIKShHneLIPmpb3lYEDUoqk9v3rJ13m117oJde/VlmyhlrNdu2NTkhE3OLFp3Yd6a81hQS9iRwaKYTrfs24W8nYTgXQPTngFZLsJdBZ1+DcF8C2ZzF3TIYWFPQdEtW9PWkh1bgUWxDEVRHOTs4LBr9x43gHW7u9OwvZ2W1fca1uFDTwfAQygGWGYJYLJagaJAXGRVYHuj2/uAeliPiiKO/uJ2oJ1fbI6Oni6R39MmRj4GRoKEOG94kMCUR0FBxHsBxsMExQ3jWSZeLvijOO9ITgJD7/TLPO5ffpcCoIdpXmkoDfzLYwfuIpOYLz5T/bU3XrPH2PHu7oG+KOQEGHykmRY96eaqILhq9esCETDs45TuokZcQkgjRPngyhsLx9pUvE8iDLO6yJjXAXiOlNAUoyI9XMd0Dsd45JLVDr9Wq9vM1Iyeeeg1wTM8esJmp1fIwDou2BzW+clyycrYJD5A3n2II34OlTRJ+g0Jhbl7PsPzV7zfI+NzNgKfg6HAPQlL42Glqvd7sZwUG8t7IUtXm0YWjzD8uXR9kpdKMYsNGvieb9Zu1Bq6VskPJiW11l19Uhryo6I4BvD+SMnJTVoWtJzGOM9NTtotrMvtVhtLrmslWKVnkO3WUdVqvPgNOaLNMNck1x8tDSk3Et1VHt/zEthMXIlxZFGf4FU3EJbrcbTTx8PzlQbh2HiRFkQI8XS5gOg+BTW59PsoLC7dUUCTjwsOuwKd+2GyVlZXrFAq6EGoFAQo36WUAENm+fwCTNpiLmFfe/Wq3bi/a/fWH1mvsW0J3uXQ7uiW2iTfX3S0Zy++dNkO9/dsEwsXSxnCmszIXQWJ7a0NUS4Qy/cvDiFLCASXXj8e/jrkH1pK8pO0oBFM3HS+jN1Cxx5jdz/o1G1tNmevXly0NeyGMoUZ21ksWX0ZltRCzhYnUvbVbML+Y5ju38Pi+3uZnL2V69lKIWV3YT18APN9B4ut303aBOo/iY59M9G2V8A8i9WW7ez27EPozr/eTtqd7R6UBRhs98iSe1AQoEPiCEoVmDzCEqVbq1qCFgUURaIFbBOb6CcsC34alw8UUVHwLiiZxF5ZkFE5fjEl8RkgEjk6CUCzWGgIES/FQDzj/YC48Bc8rUys0LiSGKmD/hAciXYBp0icPyoX4oja9DDszqgVpqUBmiwuzOmdTe9/+JHSSSptSEk/7BTDxVQVB/KXbYgVXQRceIDDfvgEHx/Bc/3PyC9gOl03l8MZis3VE0UY4YQxc7HvsDd8fMkOwfvbsEqXsSYvzS3ZHNbBXqpnram89WfKdhHC+BzW9gMI4c3uwFrgbb5yxikNPgBKPouheI3A+l3brk/4QZv0ZkD/HCyA5ZlpfYnvqMbXkYDc0QYRAT8R0fEaQH4AQ/RxCDzCsnTSOsmBNQtZy2F+r+UmbAcKjhf/MaOqU7t+llRVwfXg/aodP64ZyD0qDSikJVjxry0t2Rbc+/sHei3boDmwTKVuK2hvCwrjsME1ScVRh3yjlUEasR3fFuVZvE3ACI8fB0h2OXw9vqOMOw4duDyjSiMGTzSKYIx9AIxw4bH+Ph9YjMW5wKg4oCjcgktYvlDQsxCvvv4aFMZtTHzSWmQetJXC7joFYdqGID07X7IXVybtb37yNtrvWbcOodjghSKeG/O+6q71a0f22hvX7O6dO3aAHXaKgpy3q0VKA9Wy8+iL08j0sHPHj4gpo4B8zO8T5KgofLpbBKZxElYFlUiB57lJO0gW7E6nYJ+2sduaXbCLZ5fs8kLaVqAYcums/Scw5/+XpaJdQt7pTMrKYNqZFAQQ6pnDwlqHQC+BZt9qdexqpmvlVNtuNnv23kHP3t9P2v3dDgyuurU3dsz2t21wsGm9vS3rV3Zh3u7pwnYKlkVKygIWBRUGj56gaJ2i4BtmwZjBwpCy8KYwFxpHB1pJiTIgunl4LqOOpj/J2BQ83huAEbG44/jSwXhBQCxvKDfusvcBBWPpEcTj6ZULJA/Ty+NV3hEDHuZHqEBEu/byi1Die/Z4YwsF+LAarVvQ0R9xRIue1TnH86MLufXmUxQX5XLlYkHnIjLyBw9gxB/9OIinMX4kyQXi654+Fw+BiT+F8cehMF4vGsX4Byl3pyGti0q2aLsQ2jOLk3ZmumCLiC5BCL+Q6NraZMF+jI3UPpVqF0oHfM0TAD2Whx21rmcgHPgvIpha9f2K+knvwLLIMz9RtlKxCPrvwg4fWJf1MAfq4QVskkqbx1Ay0IHVqwmMTuNxliNf3ZNFFZfKU7aH+F3u/lkl+8p1Esqxn+PAeFXPdvgPGjEExbFU6Nvy0pT9an3PdiH3+nzYFdXx1lreP1ou5q26u2NNPtyn9QllqtvW0Y4UB/LC63t/LMStjSEwbqhsjs9zPLjeHwNPVIIgmWQI9I83FOKehnHwSwITEG5R5B1ThFw+p+8N7B8eYeLYRWpm3nmQguCHYsEWYG1+xu58+gm0btOatX3rQhgm+OJBPrjHXQonEjuZbDarz1dyonSbrBarMyvjSHBrDj/qLt1RVD78c5I0YXQZJ38I499PpmvKxfe7MNxzUIjpKaunFmy/sGY320l7/3DHDhMtOzNTsH8wlbW/nwdjNrqW77Wg0XtQfj3LA5cHHftqKmG/PZGzi8muzcDy6IKRtveadq+SsBv7fXu01bTdrUOr7+xadmfDEtvrZnuPzXhjwOG2cHCwAwsMCqRy4I6k+IBeo2L9RtX62Mn0YW3oghvpRzMYu7ZwwY1HKkIMSXOHsUcLl6CxjmGgmTAs0qdDqDvAeH5WNwKhbvczCk9kBvi4MOdPgzhfCOLlhAp6QC/Jw+RlHkuBVjPTk9AhSfvkk89gHecQ561aMIVzQ/0e4Y/GqnQ6Lt5lw4/o6f0Ehgkug3MjJPPR9elxV3np0quEoV9h54/6F+JDnB+Ls5RcO0NliHRNIoQzSvN0YHOQtC2s6c/rRzYNif3bEwX793Jp+6OJor00aNtyr21ZrOku76oCHVF6OPHROEKbbMv1wR0JAdk2EX5dV0GxQ2wep7H5yvl6VM55kQ3jEC1RBq1xTLo2FyHrcu+f43NdNFVa1YZVYQbsQ9EtzU7ZAh/kxZj63CgAWLeTHa5vo/xPZC66TOvqemsaSmBmagLrdtMOqlVs1LDWsKHjETHfyfageoh1nrciNnV8p5uum6J/Ud2sj22Fdr80uj65ef7ikErA0nADHs7TCHAheK8AgRCj31j4uRDUGupUvVAA4eI3ka+ObtZr9hqsDD6J+YB3P/iL3zTv+XGhQiZj87mkXThz1j745DaYown5Bg3cbGEuaNJS65O4HWjweVs7sWrv//oDWRm63qBdM/qhCfVdCt333RPE/Up3fXYBj3LoEr3J6THBd0Dx6I1Mxae0+ZbZbM6SmWlLZCYtA4ZuzYJh5qbsOp80h7D+n+aTsDBSlgdj8n36UBnGl5XBxkI/+5bFAuMrm6/X6/b/gML4oFW2x9Wy7oBKbB5acnPH+nvbwE0bVPcsWTuwFJSCEBZFsk468VqFe7Mvdy56BxQUhBDKNsFnK8SYRM/80HrR1GnQQ1CIw+cf59TFCOhz8d7vf1x8iIgBgkqNRbs66VEQMJo+AiGja4gBB74d1hV3BfSHIN14WoAQ90Q5IIScFIZu5EBfdS1jYKurK8g0sA3MSQ805Fk9BWs4FhXEeCzeqvonZMDjaA5fNsR5N+pfqJgu40K8h1i7w7L+Z8T1GUPQ/woUhz9Y2mHeOXJ9OIi0wHpL+Vf98BbbBvi9Oj1rpyHS/7Cct/8EVvTLoNvLxZJNJ3L2GDS5RwuNL+bTZgWol1uSXo4XqSycfAsDYCfYbgD1AGsdigfr/NLaqt29dw9WDt8jhzpYjhWI/lQicH19QUETNYNw3cPMrB2ItZzMp6yJpXwRY8k3GvYYa7UFuZOmIkD9ml9WxxLsVyhLl7JOvKLVbAXEzUNxzszM6O3bbaw/vZ+ti1XfbVqn17Bau2aLxazlsGncOai6fsf6iR/volrX0giG9GGYMCxDf1CmI2WeA6CurwQY1RUHxscrYlb/F8KEeMNPw5CXQIIOH1Li1QblEGHPn79gDx6u88WQUASYDKbBn0ZaG7vhs6uLtvX4sR3yCWWYdPz6m+4o4O6Y5h3Nt07bFpeWrMGX5zEPq9DOIg5+HIEG8jvn2cB+w9FR1jjGgfWFeEwrbyekUvHMQyuqB6XABZZG+iqYoszDLOzGMihDRmAd/EaFC/DBmiSYCoxXG1hvt2LNR5vWAQ62d8z46hQ+DX/A5yz4UB4siSPeQnukV8HLmmjV9HZfIq0yIo+lpESkQLizAg2lXMmknARQiX5g2IU5VJdi6DxutG7RaIoRFlLAhLzHAeKfljSEZ+R4fmFBfGcVzf8XLTwOHBgg1MC6+bng+bk5W3/wKNqscHGSltwdqyWEFUelLGGonkTg+iWPpxl+yL6qhxEE+un4ONYV/BH6+fLZh36mBdf7Q33BFdLP3tBl/11fHU84v871w5EJXQpuZeFT47CIE3yPWtZasJDPFDN2qZjDoMBvKQhK8PvLsDxO8CNgfOAVwlmvvBe69iW7Iz88AQNPxvzsVwfhCjaTFOYTOSgthCXA2b/hwFw5uXDG4mXF8EgL8ofKi9jCRu0+6m1iYzW/MGXNPOpE31P5PDoIP7oc3gTgXBd2i4DIfUXSchhnGtbG6ZlJOzg4tH1u5tB0H5ZEQLWNuK2NLVtZWtXLGKls+OfA9xeEoZIjOvoP0SmEYTw3nqJfFIdxYq7iqLQ4+rJxdM+neNSvo+AoKDoWT6+P0x/dGH4h4Ng1fk8EOC1o7xeuXsW89/XKBT1FCiYiESWEaDpCOZw5uWZ37tzGphlWBl8xzXN5HamAEXmhloOD4JvFwt3jw2qhsfG++XFEEPzj8QTfzaEUpMs6FRi6UUZCPI7TLS7CekCYioPlCWiLd6BkwEzKiTDPS8P7ZNQd729i59YymKxHPcvuHJltbpltb9lgb9d6UBZGZcFnLaAwqCwGUBYDKItBkwq27mjUiyEtC1238MoiWBgRk6BdYdSRCF2fMC6vDOJIGA+jhMr5Ubt6ngPH8VNU/kvCsbzJLnlX8Kw+jSdp/gIS3CKdnZ4GKftWqYI3IcQ0fgp0L2TVhtCV8R4XJ2eYppoZZnnMh6Mn/R6ZMR5WnC/jPPgfn0umhfhY/+gqno5rm2nuKIezpwTnZx1ExipM4Y3+QfDwNefkXaZyy2d8gwOamsSGroANCmxuKAggDJIucsHAllB0VgbvSiIirO6NtUf0tCSfRpabxqICPE3CLr0NVm9auQCBjjhNVSgr1+V1fX8S8eOQm1YeGzVa2LC2UW/PNiqHNjk/baVC2nIlKDu+jSHLl4XyGiba0YYQxT06QnL9u41gE+XPwBLlW4IfPt6wFrrShOLooY0+UC7CqX4C8gsbPyjeqQKUk7qNH9Yn6vqq2U+Eg/KIKwrieJyUh+IcDeJ5n0CWG0OO4UkIBBsDkNP7huCY2GFIjgj/RYCzKW0Mf7NhV164Yp/duInyiECfHVH6lgXXdeuH9ubrr9gmdtXbGxu6y4fn8Hq1RTBpww4ZymZqctI2oan5tTr1Pd6nePfoj9IUcN4YqB/sK//FgTEInDHCJXEIaVAYUBr8vKQ+woSooLUPEX471bcjriTeSgfgQ9NcVBmqTPAtP2pwC1bGLw9a1t3rWnqnYtm9Az1nQctiAGbUmai/I2rAV5W3wwXupq75uGcsqDBglVFR+GMp0U20Q9ukRRjLyJiILjmA2538LWCcT9T2KAXHeemZvKXyHp8BX5g/RyBWJiIHfrzlSAuDO+215RW9DbmPeaSlHB+PWyf4CW4kxBhBrxLwz0UbhJiSAORixjvhPFzYMTfuj6dHab5uLzTpd9dbmIwfZvMNsm2tbQaQ5vrCPrDcMIwAgxDW+EF5XXNAvX2KbyiKNPjrPATu77ZhBZTK9tPqvnXaqJVsifx/VanYXR6bgg25E+czWkm+EZF1BcqxSrlBAEJ4MULjcLtfNwZ+h74P/dPFMqjaRKmErquk8kpYMsx66Pi+agBxFC1QL3b8SSqNVgcbMHS43rWtet+2Dhv2lWLJVtJ562TL1se4+vmcu/lFNwOknEsJC+Qosjy2g4x64/wZm4Gy+emdB1alRcF1h+a8aeIQiz/Zxjh6VCybtjo1YSmfz4kflCNyHHCH15c4n8w3Gj4+jn6OF1V9CeSQ/g4gXusoOCbzKRxshE7zxtOWzp+zyakpu/7JJ5bJ8U2gzlSDjNUEzpRy9uLlc/bue+8i2NWzDlIUIghq0WSDEAgXwCw5mKZ8I63eY0UmCP2TE8Kx+MiNAdp2SoLIX+8GxTHi8DcgIV4fxwqF4ZMlh+V1E7eXztj/DwIH6tJlwJDSvaTlwTRk7joY6THS3t7v2se7favuday/XbUMn7vgt5wrfCCPz1eAsfVaD68UgPHrFi4ei0BWhWcatql+oa3YWIfgwuNCQuV+A3h+KeQYz/RE+Au0HfI8J6+EDeFp2RgfTwvk0QJHgJseeHlffzaTtsnJCSiNbZDX8b6yemRfJIif1pbL5FD9JrqFLkCcamU9Pqwscb9ceYZ+CYtYHCGEgbISorwhTSmR36U5DOvaJXs/iMCH83rYHHXZuwGvkVVtpn9oJ7B2M4mC/WSrav+37br9Z7We/e+7Gfs/Vzp2p4YdPF/I14TAb4E/qUmAUgoEtulpoGMjhNnXyK8179IZdgJyoCe4i9ihZ0gophEQjx/nDb+MG0fFO2GcRN1EvnMtUW3bY1hEN6s1OwcZQwugDzdRmtLDiqlsVs+Q8d1Ser+UdzPgjSI2vi+fOmG5QtHe/eQz6ky3P2R7YQxUIvIPINog/2BlbGxu2zRkGV9sqGvAMeZxEjQGsTEM16sSRtJIkggRNY7xvOP4HKWBTM8F5gk4ClGH6ap3+AkuQX6HvL5x+swZdy2jiZ0wIt0OqOeUBtwXr1ywezc/s+1NWA+I6tDK4K2h0sBoIyDCszMzKD+wxs4uNoK8dIOJ8N1RHudBM/QD5dClJw5PTMsQwjgiiOVUvTGAgBG5IxoQmQf9QkoFu5CfoL8fwd/gCwh5rQOLL9lPWhVl7kHx/VmjaT/frEJBJK2z17beQdVSUBYJWBZSGKQFlClp5t7/RIUBWwWKVR888haFdk9oKwxd6lv9Gh/Ps8CPD04QGSMAOoa/OByT88lIhcciUd84Sd18ef9vCNFUeDyuvpF0AXyBXrIy3Ly26jW7cvmyVWHtNRoNrH0IOV9CayGiuX68OwaIG8bCrzG6/BSUYc6G8Qwf42fwiXSugVic3OAH4t+14fxROfoBUd+JBLjuz1NGOyGKFPI6NzstK/SO7JXVCcul+/bR1qH94rBnf97J2X9W6dr/Zq9h/9uNA9vrpCwF1tTXHWmZ8UiIgjNqn0J02Hc3dq4bh2GX7ZQFy7uN5t7BITafOcthfngXFKdL/VW1oW7W6esbRx/vLnBjzaBfmUrLKu2OraOtVLttM5N8mzSPp4qWyBbci0hpZei2Y9ACyKNnvhX30ok1K2N9fnTrjrWwxt1mN7TH9Rprm7yD9jpQnvxCIr8wyg9U8XVFmAnHe08Ax+KA44zGJ/QJHhiM89Y4svZjEckpW7ww+pxGPAdhPDzeAJ0IfIA1j+RHEEJTrwvBYHVxiAsNgpLfveZDfQWYd7ye8d6v3rM6dsoU9KyEDJzFJExOlOzay9fsX/yL71s+X8Rmug1G4K7ZE57tsSm1m7Dz585p53f700/d5085IZwkCEx37zcnBwWwkKN+RxV4lBN30Sf2nWNgGNnhgx/xiqPj0ng9Rp9z5V1Tab6oDePk9y3yE5YsFi01WbDBVNa6kyibTthcr2Xfg4B/96hp/xIm8AyY6jaE/N9gz/YnYPg/W9+1drdo9a2mVe4+tvb+HhhpGwy1Yf0mrAy9D6puqW7LErzAzTvKwvUKMSfGwGFoMM7nooZhjcGHhh4C07wXoLHHXAHmfKRIgFDUJ7IFlRvLPFIXQDMR7w+BgbF8gifilNE5vga1G3eVrB8HIVL+EDkK6o8UBALiXyxgoo/LF/L26rVruluv3caumUqCBaMjCM9zhOASmEkZEYeq3Ohd+rAr9CAOjhuBA/oi2qmIMnjwnvh46FU4xKE2eEO0S4nNZcirpnllkR30cSoA5JpgONADm5dMNm2L2YT99itXba/ZtF/fuW9Hg5S1Wzyvb2CTg7ULy6IAKyO/37CpfNYau+vWxpruYm3zOoLb6PCDQ26zE61ZINWSJ4cHF8/1zF7yegGf15hbWrRNrJVGG+0qN/IoO8dIP8u58BOgPL4F1KeTWsgUrusCcAYWRSFXtHS7axDr1kYVtLJ6SfQ3hb5mclZMZi2Lsb5x4Qr2gGl7795da6LeDi1+rssglyiHYuMTgrb4lcLJwewqTUxapVJRP/T4QNiEsKxcdpR+j8dAtKaQ7Ec2AlIkzwFwADP9XeGwI3SFisaP88BFrBgNTQN5dJSHucaH+jggngXnc3nIOhq4A0tjssimK4uLtrGxpQtGXWj6DphPizC07f283Y7amAqDH0ZSOySECDtE9fNZBAr9DRD67Uc4Slz6h2EpSCFMUykUIJjMfROcD/1lbJBNWY9XBLMDm0107AxmfLqXsF1L66nvvzio2X+1uW//T+zE/uRh1X681bE//fiRXZiessv9I5tuImf7EIYFLIz4hW0hdlVh5yJGVK/UD9fTIBbcWBy4/g9HMQoh90iJQE/Rinub2HwwLop3brysomLAuuLp8o/Pj6vmSUDcSN1fBFQP2gz1HVfvU4GteQRPiC1A55NrJ/QKCL4+w52jIwFOuNVbGAQDwI2ZGRRQnNzgR4I7c0dNinNp/GOTLujiiC6OfnpifroKB2QfQj945AOX/wrLE0M6ru4wpcKwHsKaIB2wVsHhlsP6mwfLv3j2vN27t26//uRzCFRY0HxFDSzjFF+9v3tkmX1go2UPqjVLYjd9GdVkO+Bn64B+jlayOLTJc30J6zjQUX0Dqq+I4zESVpriDmCZ8zUiE9msLsy7zRPzhrKeBmPo2dYh6MM/uiEy2YEF0OjYZ5hrvi7mQh4KagIWxsyEpWeWLDG1aImJWcvmczYH+fbmhYuWggXy8b171sTmkZcno/Z0VMy1ehy6/nXRzx3QaKpcthw2kElpDXYJPfMoerB/rovOi7IBFcfoEB7LK7oCR+Z4DENeyuO/HTxRayzow4TQUVmwQi42t0vjI/6LCwu2CSFPc9INzJmbeZhkXGxrq2v28fXrNjE1hYXJXfSQqGEw9FOPUnEU+QKwR4/BwTnXF+YlUTxhhoUIUae84+O1KLx7LIQ6YnUpP0Mcn1MckdIAw/TBPF3swjo5GLxQGPxG5TWY8S/nUnYbu5QCdlnnsOg+6Sbsrxsp+6udhH12o2a3btft3c2G/eLdn9hbV5dsJVu1dOMQ6wvjokmvxYR/0Y6tB/AdCos7SvH9jYNo6csy2aPIEfMH8hwHaF1Zx2G81aiNOLBu7xUwfSzPSHoEbsxPlD8WhpW64eJHtCNfuLGHMUao3DEQX3hkXSiXhXBYW161Dz/8CHwbSqBfQSCoMdbn8qs95oBXCb4eeQlj/jA+BxT0EKgMMxpp9CsPwLXh0lg2cgkj4bB+hvXTjSN+VGwc2HcKD643AQJ8eWEBa+/U5JR9dW3F7ty9bx893oeQzMEQblr/aB944LCCDc/hkTWqFXvQq9rjzQ07kynrtnCY0OgKhCmFul+z7IfGRfCuE/oeJQtAF4xJ+RCuQcDWYOWUYRHwlR/O2nN1aewaMMs6WaJjKCLidOSFPFT+rFO0YH5gGvmpjD5Hlv1uw5YLUHCTWM9zk2YTc5bIL1o+O2fzsJ5eW16wJZT/xa3PrJpxR1XqAsfEPseRbWqzx36GsFNZ7oJ51+aLeV3vkVyJxsJs6CeRf+yz0tRdIePlHwPHQ2MJijsO8QPE1tMxXLQ4ogwOo7SnoPKJAD4gYtNHv3cVwYBrS0KUu15ZBUlrgnFOnjql6xlpCFbershiNDObmPSTJ09as8GX7u1aB1aGeycNMvAqEl3WzQLwa7cDwVwulWxnd0dPhLsJB7BrzB7KhPgAEgIegjceNwZul0gGG9JQBTU+uBhfeAUythruqAp9S+awH8vDGsIOpZhq2elSAXK/Z+8hS2LQsZNgoFt7DXu80bDBbSy69U1LbDy01MY9++zehv3J27+y11+5YGUonARvUyQdoI1DT8dGFQOfI8pwfM5AFuZ2JVzEsP7RcuNkVP6RuPHw8TBeb4DQLiFaDMcCaoinj+RzASXLO5L4FGCPWMAHBaTzkBL08QhlbnrSut2OPXrwQLF6lxH41H0sxzcKVFXDTria6HXBYZrihn7mc3wW4lgXeY/5+O/6oviQxyU4/xOu97sIoXqnODhR+vEwtDTI3ljHiMt0u/bSqZN2FhbXL++s2+O9qqVgPfebsBzqLbhQBrzQzQdx6zU9O9SD5dGtVe3h4Z5tJHt2slS0NO8AhODkdQTSL6wvge+7E7rOH3eZjztv3oHFs4rDStVKmaxluQZZj/4I+EVeVx/ljVPEFN7RnUaszxNBWYEs3U1BpfH4CRu2HYylUsjaVLJppVxL37zJz6RsOtOx31pdsspE0f6sUbMGrA6Qwt9h5upOcozwayNLRLP67DT8zvqg4kQJ9LGN+KNq1ebmZqzb5jUbL2PUPY7IjWoUQq+VCb+ONyL+oJ80xm9QlEFZHofKB0w6pvMVsLOxCpEOJ94Q8o5BNJkE5UMDnuCugmOGhMGGD5Hwu9opEDRfLFit3sBku7b4IXsqlHalYtdeeUXvj+Ki5LGUzFYpDt+O+uba47WQPKwLPl3e5dkpY5XP9Uv9Qz6NR4nx8g5cX4+bhCG4xctcrqwLsw3UzViMUa9AwRhoZQj5URcojEQB2qGYsSlYF1ezoAMUyS3sxB41e1hkXStiQd19sG9Hm9h1Pd4x29mxwe4WTPotOzyq2Sf3H9vd27fs2pXLlkGbXBA0v7mL0bEIuo7fZ8MzMzynNIfKdiKI0dMDqRCHeHg8bxyOTXp69qfAkwVcvcP48XCAOK+OZ5GXtOVijXJBWKZTtrK8ZOsPH1o2X1BGvmdKO0L4A6+oUf4HFO+6OiKXQH/IJHD0Fd2Abs3RT152POeCLl1AN6xBJXoMfkLIEwuPzhtCfphRLMLhGgod8n+Z6w1C7rUXX9QLA9/+xS9st4XdOIRqp4Y1yDfcUlkIW7pFni/g47NVA90y37SDTsM+2Fi3i6vLNskjGyggCk53zMoVRTrGEO1q7SFNdMH6xkpzawB+rgPe/np0dCSlwQeDnQxAXqaFcXu5IKSfY0a8LDnWj3+CHtbTgFF/EuWzSewBs1ZNpm0fG8KvlSftFVgda9mWXZxK2otnli1TKttHB4e2wzusIOcEHE9ol5s9ofcjzikM9odhjp1jAaLdrb1dm5mbsxItJyTrZa+QMe5EQxSK+iugX+P0/jFkCbbjZDYiPDolPYpKY5+BpPMzABljgOpRdgzH8jhgnG/M5whPf2NWtQOny4k4OqrYiy+9bHt7B1Aadey4sT8AESj0+bDfpZdesiOYsvxcaxpKptdqYn4D4YF02QAB9VJp5PJ58CaYEou5S+aL5/FEdAsvBiK6AycUngKoyzEt/xhkfR5VMRygJjGMFf12F8T5bYyM9QoIl3J2Cgz397FmfgmF8Xa6aLY9sFyjb/sbW9Zex2Lb5FPdj81qu/qofA9p1qpZstu29399B/1I27mTS3oOI5Nif6g0xerRcH9jwHjc/Hrw4TgcG45FHRv24NIcLUdhLCJWJoJjyz0FRtr0Hg8Msx8RRgtMCS4TgFRw8xksRyDD+OdOrQRLcaJctt3dXT2gqYuUtDJUL49MWImvzwujgI4mHlkutB3itaCBPk/YlLkdIcNYC1IcDHtkOlxxgvKzrM/jy7k4DyE9asOnhXVAR+jih+sD/Ia9cw4K4BsvX9PDtr/47Ib1Jqa07ni7vN6n1IHSIEppYP1SWQjB/F2+saFlLYzjweGuVSu7dgGKw9oQTpAFXOtBcQUIcxX107s624dXChsuZUEDMiWH/mYpWClkwxyrgPfQCV7VBYzHoTxnK7xglet6AKefScDKKNpeN2n/UXHR/o9zp+z/MFO2f1hK23y5YP+sabZfnLNEFwNgWxHZHP/yLbqSJULQUvEeMRbNn583Ko7DetOOYNmswKrNgDapJDahlC3on55CZ/0sC0dTBb+A7hhynNpg4p8omj4D8ePqAmDo/7oAjbE3GgmQhBe6hedegc5J7Nm58+d1pkmLQBOvIgnd83zt1Wv28cfXsRlpWoe7E/afzChlMGR01xTqRYhvtzw4ONBOQO+c4YQF9DD0eYgRZQRCvAjn2hsS0yWxUY3Wj5X94DeUE9iR0GJKpLLY9fD+7bw+QpOZKNilZMfOQIE8SuUhbBKWAa7s1azUTNjG/W3L6Ct6O5aq8nsX8NcPsWM7tARfMAhsQom8/bOf2QsXL9vJtTXrgR5UtGjUMzaQ/VGfAOqr77Dr5hcDjtN7CXE/4clwjC6A8fA4PCMpAjHtGDy33LMafQpIMbCcL6rFLBI6YlEtxwVHEpsSnTNj91etVK3NV03wCMYLf22aWFfoiw8PlZOPGw9H5eLhcfRp9JAvI3Ttjiz2p6HaBaoyQnAJo0zi1iQQQ0+Br/kcYw7tnZ1ftNexRh9vPrYbN2/AuOpi8wce5d1BvLtR7zKj5QCXzwsxTlaGx3rDEtg0JWotyyDb55/ftanShC2ClbNUiHyU3A12DD2gD1LMUhhAWScoBux23Vc601yPGGsWFgfHG9FF5fnjx4k4+aIk5wlUUKoCuoNFd2Wetq79UTlnr+TM3ihl7A9hcbw1MWFT7YY1sl3r8shZL2L1bRKpEDzt1W+PspC8X33hxoN+lOUzPx249zc2bGlxEdOAjqAKyhcC58f13sWrHYL8RPIFUmMY5l98+kUBWV2LfwcgWj4Fwi220opYaOFoigOdmJ+30uSkbWxtIqPLx0ltYydy7txZWKg9u/fZZxCIKeu3wXAcIC/80oSVxUGiqhUdZ/Gax8z0tO3y+QwSNBAHSP4TsZ5HJKaHPPH8dMNkE5XosjjhDCSDwq9XhfBoiq9C0YejSpYFQ9nUhBVKWfvdyZzNoTM/Ompbez9txft1Wz04skwNjHF3CxbHoeWx68od7VvyaM+sumeDxq4lGnwLZg1rsA5BdWh/8YO/sG+99RYYaQEWLnZnVMY8BgNDu6/IgeYUcuyk6y7A9xUYfIKRPDHQWD3E/QTS5Ikyx8V5YP4ROCYj8kR98jAefrKeLwYSGGNApRAUQ4BhyPuYHs0xHMwteZL9P33ylG1t7biHscAf0TER0fvFd3HwcaqdaSE9+FU+FmY9RAXhhjqB2pn6uCG6nHJ9OOL9kB78YYxx8EN14PKRp/iWaV5U5qcHLp86ZRdXT9gv33vPHu9ug/8gpKEY+AApnw3ie6V0HKNbZhH2rhQIMMU7gWB98AND6UbHMs2+1Ro9297atbNTBctA4TiSo212Xv11AjX4pSiIlAUQshS4gaa9Du/AAtkQn4KV4bidaZ6HVQddj3Siun2EhyF/wB1ACQx4G33KLqQG9vcLSZuFSE/1G1ZstOwMlNM8341SgIzKQBFQFrABdYZezt1wHJIlEXI8vn3yUkzOddGHrcMDWLNZbIxLGpfyqUrklY/98z46qivuPw6flTaGyPx3ojRETtQXyOoAId05ROsCDpWB36HxCclkJq37sc9fvIjNRsOqsAz4vAaL0axMpBOwQE7YT3/6MxA+L+WhBhwX+EG4lgKQMTowR6ehNKrVqotkfkCcgBGICM+AQChiWLTysw9gTvjZJSGZimOToqAwKWO8E9aDtZPIFSxRLFt7esoKM1lbnUvYTCFnO9t1LLak7e/VLQWzfaZXt4PdXds4wK61cWA9KI5O/QhuBVgV9pt0+dLBhhZvo161P/7jf2Zvfv1NKxTylstnQW/0kVtBWh4pKBD2h4yL6KeC0vgD5BifBYEmETxZJrCwA6ZHvlFAhJsbF3waUBCTziPwvH4GGO/bU8o9LZ48rPn1vOx4lBvplp06cQrRKdvZ3ZfLKjieaEziExWJ4pXmIUpj5li8gJUBmS4/QGUpK/jHOAoWJQ3zifaM9PHOr1gXB1TeZwJyaMzDYI/vjgJ/8dU9X7ly0ebnZ+yv3/ulNbHGarCwGrAc9M0QZE+ykxLkEHoeozvJuH5oBUjIDyDre9ZBeguKpAeLfGt7y+awa09hsFpPqFB9B0QCNQ4hyIY5TtJEygO7cyjyOjaSExCyfPZD1wK4jomhLtVH1zkO8cN+Un6wTuVBWQkz+HnVGmuqBZlVxUYxM8Ba67oNWgV02wlnT8zKoqyLiDHz4VpaEFQQQ2CmIUbdYj91dyTsDCjgDsIHh0d6eNnVCRqxf8znQTwqj+OJwFvyM5uvPMqmNo8HjnscMSMxCLX8BjBaFCG/yLjzFnLyuTPzCkPWRi5jp2FNfPL551AMWVkGXJy0GNbWVlVs4/YdK2GHLoYj+EkcjtO3jHKyaMCA1MId7GJEDBLTE1flQkH55Rmi6vWIMlIK8vs45WH7ARnH9jktFCi0MiA4KKQhsAd8nQCUQ2KiZN2pkvVmCnZiJmevzRTto8OuXd/vWeWgbb1a3dp7Gzaf69n6+kNrY1qa1QPrUkFAMMmkl3nvF6B2dFhkUDR8JmV/f88+gzV29epVXRMqFIugxZDmzurwiiMGo6Ex0NhigPBYDOK8G+DJIhEcU/qZEC/rKHwMII8WwW8C4+N7Gvh8WoggJ/lTfMY4LOYXrrxgDx+uWxOCiWnxc2nxEPIpN/tKV3QA8l91yyNHbuC1KA7/QSAgbljGhR0gXuwY0obu8HTHx3tUXmFIB46DxowfjXcAwTiwPPA73/iGnjt494MPIeTT1uR1C/Abn7kCddRfHgtrzY6hvr8toQnhAwx3QrI//DonlQ+FPFf7ZLmsB9soRpjOXhBdv4GkCzHmp1dZfJjHPdVmU0fWvL7ihOZwTkbqiq9tyQyHUkDBT8uJfgIE+R2Ev99o2n10soIN4iPItE+gMB9WG0hHHvBIikIfbfC4KRXq8u26o6g4+v4wjS6i1B7XPccHvAsZUSqX9FoR9c3LTY4H/xFwjKIDI9WWrzMWDnR7GpJe44jW0KGArodDZI7xuCeQeYYgppEHXWavxXROkLodL4UYv2Y3sOm5GStg8Hfu34MxkdfA83xbJIpchAXy2ac3LAergbfbqh0OmExGl1XHdB4XMgmSKU9grH19/U8dEeWIrgyDDA+JQMI4VB6PLh/b8mNkfJygPko5KaCp4WhZJbHjINI8LaUtzbdgTpXN5ifN1ibt0lTWTmKn8Fd7CbvZKtjgsGqp6qElKltWSNRse2cTi6YLhVGzXquhi4kac7Tw6AfzejroQh9o9+mnn6qfr7zyitWrFSkTsIV7gpVnqrI4SC/OEH+/AHCAcRgPkwgjIILEYDzdw3PrJTyl7DEgNv2SEC9COsVhPCwQP3OuQT80yOOQhcVFy+Xydvv2XUuDb7XLxlgoGByf+rJ0OUa53uvH7PzDsIBeBYMHqDC9zj8yZoZDnshPzgy87bIpPUBo71hG8OMEv/C6DZGfOl2enrGXz563vUeb9vZH160CfuwAWROFcw9j1pk8FIO+9R0hauxDoVIIId25QOSnX32hC+Tdk81u3x7tV211acl4hxXviIo6T4cI8tLV+FgX6/BIWrprA04RVaA0iryrDWtJKwDZ3N2GCLCSsM5lGcUQ4aD4nJXEC/NYj3wkoA1lACv/o1bb/u9Qcv8C5f+4cmj/VaVqPz2o2FE/Y5ka2qu3dWdZknfSQXkQqQT0wCfHjH+H9MfR94l+OFK2vuwBTx0gr6eKeScBsaNxj0AfDyO8JSCN6Lh4kuFZOOyjw5GWlCEO6jzdY/BpgEqk9fwCk0DVQgMLy5/C5hdCFbCIRcePtLf2D3QRV/d7Q+6Wyhmbnpm07e193YUBFnAVg2ChcSqJsOMj8EiLz3ecOHHSGs026OuYmF/74zi0cIBxYj0BmCS3yJjRTZpMyDF0ixJ+ALSu/txOlC7HjLGky5YpLFi/tGrd6Vmbms7YdzJHNoEd2k92U9bdaprtVfUa80x11+bzKavWmtaCwOcrzZNQHHxBmhhl5O4TukCmc4cH+vCVKhR0v/jlL211ddUuXr5inVrN0rzwR5rxRTy08kh3WkPq+ReEMVo9jXRfBsar+Duo8jcE3/IX7ZD42rkUqKdOn7ZbsIT5aozouAEE4qbF8azjFfHLUyt9BvhiajKEAfIzoHQfCQh5oih4+MdIpzh8govygFKhoKvYuy7AJZvB+M7NL9grly7bp9jgffjwHuQmRkhhCsH6pFUBvqQABk2CQHeIWn3bbo8KDzurDg/9XfDow4OqTRYLNk2+ZR1R5zwoL2nulITbNbv1657+9heWMVdHWB9FbKxy3Ni5wiouGtAz7qLck8ixwpUSxNqF5d+v5uzMfs/e7CTtH2/t2n9RObL/U+XAbh+1bTU5aTNHsPrrHUu1oCw6VBgsD0QbYV6EI304PixxgzHKWoCc2d+DzJia1PMarIusSaDjaIxYuh5EI/5F8T7Rh5+F+B1BJ0FiGCY2QkQOmT6G+I9PY3SOFgPmdKPwwpQIwdWFUM3kiza/sGC37z00K5ath/gkFAcv7r7++jW7deu2tVpd8J+77c4xGCjH+qgsSCzUx3c8yXoB8gG5M2fP6TUOnFtelNRjR+wc+ytkr0g+t7AjRN1unJod5YkQZQIdXJ4YsGr1ibsymOdA7upTGZjWuRnr5+fh5nRh7CqwWu/aZ4c9SzcwJjCaVatQII/s5PSk7exWYGFQMTQsQUuJOyMuQvqxm8G2zimK4FKhgAn7PEtGXtLqX37/+/bWW9+0tbNnNSaCmJ00owIlRovnN4Gx8RNipBLEw3EEOBoSYpGCuH8Ix8eOA2uM4xcDtyAAKuIC+n1KFcPsCZucnLSJiQn79LNP9Qqcru4UoqCCEB1AwMQFWmiIDKhavgziV46jW+ga44I/1v3I7zY+PgCM+hBBLMxjTEkdoF+n4nOMowfeeuXKFbty4YK99/77tt+sWweCXBf8uVsmf0qYkhfpB5LvEKeHxbCWnMv6hsg1Fw+rDu8yN18BUjms2OnVE9bnsZL6h/QIWA6OynmkjFCf2CbHjI0jsNpuYc+U0lc/420GRebKh3hXtas7xLm6NCa2B2uDz5nksYaX6gObPWzbh3t1+7DRt1utvn2yfWTNes9OWcaKsEiafF6Ma1XrlTRCnaQf2yDIw3acI4zCoW/wi+ZQPqAFP2E9Bf4jbbmaSVEHrNfn54/8Pg2O4w/G+QgB3WfhKEDyIjKGo39D8CwVw3gZCl7m9iWQIey8JaR4PKKnoXPGT592UgVLlyZtdnbGHnG3Pbtqbb7uI5e15ZVl7ODO2P0H66ga+3gIY9VNZmTFZB4pCTI6BDXqTKPOQqGs5k+cPKGnyMl4KZik/C5HMoH8yMsuuUWMiYj66xHc82S8WgTCz7H6OALb15EY+sPdDI/cUuhLKlew7MSUpYpTGOuEZUpzdrKQs8szU9ZIFOzWxr7twoSt7u0Yv31RRF+nuy1bnZqyB492oS+cJdHjkRx3M7y7BIsmCeaTieoZl2/cJOohR/YL9OEYeS3nT//sz+yll16yKdTJYz9ZQBwFzTgsePWdA4uBxhgb33PhaVkR72g2igLQ17XjlLSjt0emRWFX+bigc4vBYwAxGlAbA4/DFp8L5C39sT/+T/FwVBPnlrwWeA60pACamZrGbu9A6by+ROFD5ax6JBBYDyNdnazdvZLCx9On8cIflEkIP4H4lYMfRQ0VSDRaxMsFhLAKsU0VJnoHGTT//PHrSJEYVzqbgdVPsdCzIoTsG1df0l1iP/jx39h2B5awlAPqlItRkf/kj6E2eUMrhOOiPyDDrl8uXrtvDZ39hUv+Bp0fPN625bUzunitswmNgxlZ3iMLMD4IYrXhN5pI4zW+Q6yzFoR8TrfgY7Ply5LsXEsOaaGAHCjF4zCnpFgF60d+1se6UT6LDVyxemQzjW0ro5+PHlesuYn1uo2Nw+Oa3a917N2HD+0saJvH+uWRW7DKXH2xOYnG4ByxAkGuD6iv8Pu+sL4qNsbkdb35Fp0OvKVqPQz9oazHEOfjnfJ0628c1b8xJI1GQIQcw1D/8RAS0GESGigXxAwKI4HJ0petiBCqGQjVAqyLyXwJG+2m7i7i1696aOytb70F62Pdqthx91AHbyHlvgcVO4yuG/C2UjAB6uxC4bTRRn520nLTRduuV1BfTi8I1FPZQB6NqaciGgcPl94IvSciTvAznuAmmn8CjpHXC4JA4dGPXhUCIZ0vW5u7z1wa40zZ5YmcnZ/K20/vdGx9FzVs7ttgZ9usdmCD2r4tzBRBrr5t7PD+djAvL3p3YW3o9kQoDfUBfRHj0sWEsgtYbLwTIwXU8QgWC69l8JmXew8f2CvXrukOn4y/TiREul6cSBoqwgPG40JhvP9tg2eMS0kxWgjIz3DIx6QNXClb/FGoLM0v2PbmpmVAT93ZB16REIz4xvkdv8RxFJg+0rLm2uN4kWf4VYfajieMZhP4xhzfEhFBniI/U+iyPPhssVywVy9fsna9br/+5BNrIp3WRY+7ZeYHz40cSUkgunErnReM6Qff6olmInnUj09qFHHuyIflWc4JL3feb7axu6cv8J3g7eS8IUTjY/EwKobjyHbpuDCVgMYEh8/PzGATJYsQ+bR5UX66T86+oyeR6UDfP/aNd32msUbnsDb5UO29oyP35Pse5M5u1dqwAqqH+9ao1m0inbZ0u6ETA1kpHB/r81WPtHEccixsV67rA+lFxbGLds6cOq2HoJMZyEXklwJQpa6t4RiHbTtl4PLC4//oexKPgyeUxiigMl9aDt0YjgKWExmPC0yuE6a6i4hWhlcYdDM8q5ydty5MOe7Os7AS+ADc2slTNruwYL98/zqshBLa5AddSALW5S7mymKhIuJ5fRqKgfVm89bOFGxmeQFxCZjQELjYYQ+Un8Ic/fC7qaeSB/9kFOYQhoFHOApOoDil4Z6HyKi9Ad+pX5iwfi4PKyNtS8W2XT01b59ff2R3D9J2tI8JO6hBYVQs04GpD6Vx4fxJu3PvtjVAj0EHFgS/tMd71AdQGlAc0QLjZHsmCpPAT+Dyi15pMBTf08OdFK/v3Lhx0/hU/Le+/W20UdWdLX4b5RQH54b+OGju6GHdivlvD2g8zxrUKC2cwYKfODIKWMTc5sC31cOKHh5zc+EXpxcMw0Xq542o9sf6wKKcx3h0lM17WG8MXIhrk2lM9ulw2D/X0xgoH/k6tja1Pr3LrWombUlYGRT+qxDS3/zqV2zz0brdunPLWqiCt3o6hYG6gLIwJMSCwI+hxuvaFFKAoXPqF8KBHlqL7BfrpFBlnUCGdSEd6/zTGzdsbX7esug3rQ9XiR8hqwZqcwsPRqF6ozUiZLhvTd6KD6WhV62rXfaJSL+j5ThqzukSfR/5UDGvmfQadVvBxnR/f9fWK4fY43FNA7EJTmJtd2GJbO4f2FQR8q5ZxUZweOeW+gxHnkAr1h/aegKZlX0F+HExahNKlQ+W8pvjDkhj8pJHV9CVVXmGXXuSb0rmz5cD0fnZoJp95XGMg9hRbrTYGCYzUlhRwAdrAwuO1sPyygmrdhKWm5m1NJTITHnKzp27ZDdgZfTTBeskQAgeZ3FHnAByB09MOXeQ4qcV+Y6pPBTIhA0yU3Zy+ZQl+UnJdhJNlvROJ15Dcbsq9AeoRRMbhhiOiCAhJI1CiHWE5ysEVJ9feFQYBqU3YP9yUHb5CbPSpM1kOvZ7S3X7ePvIPmrkrbe1YwlgstrA7gMWVrtiuXTHZuZm7ONPP4PgR72dlr5ImMROre9vs3XHHsNeqTdkHMQJuTPrwMoAY2Lw1seujF18++23bXl5xV587XXwGRaj6IAEXhinoqOFpLmKg5tJESUa97+tMN73cRjru4bzRcfD+SU/g2DcdHCeMQ+9as3On7tg29s71sKOkzdcEFit5ijCKHIszsfH+8YkxAU+DEgIG7ERUH7nhroliJXg4qLyDMfAnQI4vg31akOB8uS5iydX7fWrV+yv3vml3dzcsgb4hHJXrM+xdslrPKaByzDxOMUhIQhXCL/nV/WVfiHS1GHn6PiGcew/XKZuwJrju5amJydlRQdJQyuCY5M1oXrp8Me1GdoSTRGuY+M0yQ8mIY5LQHnYHgqGNcAyEboIxSvA8WhcvJbYsQwUCL/at/F4HZs9bB4OdqA0+PVMKAgojF69arf39iHyklYyf2qA8qF+Vcq+ql76nessioDMBtcNDjThWDB+1EOFcFitWhPjOrG8NHbdh6jCo+hpM4qIH2nz+Sj6/a2BDbPDQJ6ry0+m9MLUKLypAKAwUhNTesHe2toJq/GkslS0bDFrZ+em7eTKmt26t4Ed+rT1ZVmgrFyUlYVBhUE3Z30ooW4ua4liyWxyzmx6zWZPn7fDXsLa5QXrQmlQMGrBU3lJyMf6FwBdHyJ+PIpt9M8EAl2gH5s7jmLdvPiNPhIzUGCwMgawcuaLSTsxUwQJ8nbn4Za+ItavPrZBZctSrZql2jUouKotzZaselSx3Y1dS/AaBoS+vrDnmTMsolEE8/HPh3k8wh0vnxvgLX1UIKyHxyj//F/8c7t8+RIU8jlMA/qo8aOY7qjiGIBxehDGgv/2ATsY8DcA0i2a1xjEonVnnubaIRdkBvQqlMs2OzsrYaZqCHAjK5CRwY0yeIiH5eWPi3MjgV/lnDfobWf1+mj5vVJQ3oB0hnw7Dk75yCP+dUqDQVj7EDAF8MPVc2dtZmbGfvjjH2PD3NIpgCwpClduSMRj2MSA36Qs6EqQosHnIvM5Xna7XIdSHKCd2xkzisrI1cvrALyjcntvz6amJr2w5Bj44+vxg42EMf5FN7apONcmX1zIN17zZaYiBeLGlQXzOVSk0ghhHtw40CdYFFdOnbItrNudgz1Y8ofGd8JZo2IJPozbqlsT62+3emD7R3u2iE0hTwQ0NvZHFbLOYRtuGPhhnO/7kGYBXRrpI+WC/j9cf2grS0t6VQrVKWJdPtUGV37vAjXuGEbpXwLBOX83IAtDs+k7TuEkgU/BRCuDu/CyZafmbBITN1GesEPE9ybKWIhFu7I8b3vbe9bLlK3Gj8pTQbB80isOCmVaKvmiGZ/uRPnk5JT14NrUrNnskk1C6Ww2GjaYXbYOhDW/lOWOYdxO0QlMxygjEBGP4NMZ5UYyBI2JyOMduFIatDDQDgRyIs8nv2FpwL+UqtvVMyfs3Yd1q1W71t3fsX7tIZhrF6YtdiTYnWT6DVudm7CHd9exAFP62p6+400G0a6OiyfWt9Adut7PV0DrIhgZkouNioPWCcsirtlq2o8hBC5euGClEujPIwgJQlSNMfD6hrswTpYL4IRkwH874W/ZL9EvEHQUojF7hYEI/ut5oRevvmj7+/t2VDnydEctcuVxi/wp9QpCPiHD8bhYOID3s0e+V8M8RPGHCyurgvR48AXDdUa9bYFKENG8ypeBwpjK5+ybX3nDsM+xDz/+xOowpVltT3fwOZ6Sggi3jHKMDOv20zFkwcCzJIXQhSWkUDYIcodBSRBjedgO0qg0Hu/s6m41rDIYyRwMRigTIlQT6hpiJOg98g0RfHZrAvKGYVLA8TzkFcfDPikzAW6oRyHGAzXugc2DXmsz0/bh3bvuxoBG3ZL8WmG3adku5I9XELwe+fjxIzvBB5URR6WneNZIl22EtuTCITAc75PSXdnQF24U+d2gxxsbUoaT2HwzfzT33lHZyH8MEo6Lfwbq1egRIu43BbAjfmjOIyCBCmXBz5zyaIpWRhbCPT9v/dS0XT57ylr5rH1enLH27FlYBTO2uLZgD7G72c3PWDeNvCkQgRYGrBMrUOEUnJ8P6egIaMr6pTngjF1+Yc3+879/xv5XX121//HXL9orryxaGqZjOr9s6eKUpbDzT2T4kBL6RAXiztDk8u4qgSYKDhjX0Rk/QAlwhjQu/AhRGsysayb5kvVRf79Eq8esnAdTJbv2+y9dtsNHW3YDVut+tWVdMG3uoGWJatP62JEkB2Ay1DM9OW0ff/gR9GARzfN2TbSHPrgdHjuizjjUDAGpvOBGpizyROY+mEn3g9Nq4e4QybvYqX38ySf25ptfs3a1pltFJQU1FtSlI0AOiguJ7fybAjbuxvZvEkRq0CVcLNZdclj0xVLJVmEh37x1G2R2F3YD7fUIM+cqzFEARgUcB82tS1CWWDiexkTHlz4MoC+EpLTEC0GwkC3wi25wQ0BF4e4IcmOhgE7DsqCFMT89ab/9za/b/bt37P2PPpJQTiGdb5OWIMcGhFYGr5fx+CqJ+rkmWN+wFzGkQ5A7jKN8Ud88f0soevoJFfY8rzIuTJ7eh5XAa3YzmTSUHNYk/HxLh6oPEK8HCe7JbaCPb3Y6+m77HDecWFuiJxSA+qPpYmW+DmFogIrDxfFx2TzqPXHmjH1695416zVLtNqWanUsCdnVr9X1OYZEldi0TC9hlf1DvcjyJF8yiDXp6HYcsC20GdqN+hGQ0XSZh1mdYuRrUroYWxGbQb7vS8+oqAbmdX65pKt3xS8eo/gvgWShIZsj7kuB8qOkCuvHA/xUGlQW2PELdc4/B4E/ZfNQEAfQJbXlVcvOFuzs5ZO2nS3YtmWtU5iEgik5S4OKogw/hFyax1AFSGXGFcqWKk1ZFgK3dHrV/jvfeNn+J9dO2FdKKfuDs8v2v/jWS/bapXPWyU9ahxfLuZumUKSgpyDgHVhe8Aq84hARNSb+uHPDITAPkEKEt63KygDyHU+8UwvKrANrqpDq2ZvnFq0Nwf3JnXU7gJCuH+7aoH5gSZitusjdhemf6FipkLV2s22tOpgNVkb45jkFlB5+Cm2yX8HvUVFw+Rcm3gkPLEzufrjY6XLhAB49emR7UB6/870/sBrMa+7gOPs6psI4dNyGsWlv9W9Ec3zRNv81943VY/xu5h0tKHQpZE7wSBW02328YXwY1fELEGlcwCPsEoOoxyHPOPr5i+pQvXDl9WmM8H6FPY5AnDR+HNxNs/9RGspk+RqfXtuW5mbs6tUX7Kc//ande/hQz07x9eadZtNlFx+BESOecjvoiMcooNl3Iet29Yc4dwZPxI/6y0oJDCORqDro97wrxYEw86AOKuYu4g73du3c2prVDvadtREH1h9zSTPlCH3D+uaT4fyI0QRvkIHSoFLVsa7aZnsAlg/9coNRNBUtd/X87vgk1jrf8UZ6sQ29mJGbMyiG8PZt3iKfaHctw+YhB/gA6IWTJ9xnaFWjq3cUQnvA0Af1J4aByPIzyLBZnW+FgEySQo/XIwj5Y+44HhP1LKTk/A0Bk4xfzp8EcgBGkEmDpcGjKbrpAgT9tKWnpiy/OgOLAqXnJ7EQu3b+YtHe7WbtENZDBkqBR082BeVBhVFE2XwG1eQsVyzrGQh+3CQDIZ2H4PvaYt5+f6Vsy+2WFWAmLsNE/A/KCXt1dRZKyt2t1cNOmhPPt01Gx0qR4vAj4WDGgDQe4c/oqAuI8bkn2CHgZcFkoTjmdKvi1amB/fCTO/agl7Re7bHZ0SZM2D1rDQ6wBquouAO9UbUZjHF3e08TzYvXCT7AR2EvRhZ12ah36YjYzk9AHvKWFqNfIBIy9INZxczYhfRQJxfJu+++q8/gvvrqq6gGAgX0YH18fqMvJchxwA3t/TcKbPM57Uq5f4F8fwsgXUasSv0n9NnhlZUV++jDDy0DGvKNtqS1O6ICvQPd8T/CS/H04xCZ2ZwTqC7sHFeO8XR9VsU7IezDcYjCyMP59SGNgHxDRBq3BlfOnrDzZ9bsA1gXe0fgSazRSqOlzQ7zu7ujUCGVg46n/C2zPt5dBEc682jcQ39QFMIQZq2KZxfwQ5f5g1Iiz6u8a2PYDuLQ752dHZucnNB3t3XEhuIjoDo9og6nDPCPOuglX+8fHepZDe6TVCS0qXLMBPcYICVlqSF9fnbKdrY20a8uLAj3gka2JYz8VK496/CoGTLm0fqGXjA6PzOJ+LhgHwNFx+LZJ/ZRrlem6ifTfB2ovwJlmIelQXZFJodhTEQR3cXLsorQtQUqf6k/WTMBfxMAS6jjTrbRT4TgSaQtNeDz2LwmAcEP7dybzFh/LmNz8yX7d2bM/tHqwP7TpQk7A5V8q9yxo4Upa09M22By1hKlGUsWYZlAEGdyZSsmsTMf1G1qULGL02ZfP12y7728aq+eWbEJNIGOSBmQnbCPtgR28bAP/eJPQ2FAqEvgI0y5iP6y2wgNGTkApYa3PiQU6KGyUV1wvYDl8VQ/BSsD9eeyKVuxPbuEhfjOvS17dLBtzeahDaqH2AocmTUrYJwaFknT0omuNWsHtjg/Y5vrm3p4aQDhrm+EgPG42CRoCFrovj/qZwzVe+QF42tB0iVvsDwYLLI4VC8YGUl/+qd/agsLi3b69GkMxdFjkER+WWF+XByj2v1vCr5IW/+a+iM6eiCJxb+BOVybFFJTk1MSCLt72OmSTmEOgtCJFrdfjAHHgDWOILMor/M7ZBioKr0/QufIMw7kz8Av/EVYygNIocdnCsr5tL3xylUY8tiovf+xHRzVJLdbrTbqJd+Bb3Q0ikivLEbGFjD0Z6R/rv/0R2NhR3waaofX+YdliKHemGCk4IWfNKe4Pmo07AgW0PkzZ2SRU/CyblcfK4zXCT/KSUCyf0TM4cbmluWxweP33F1+5zwP2A7lCv942+4W6mFRWipqH/W7foRxIAyXx0ZshG9qePR405aWlqWwpMDHId6XMB6C6idNWH/AkAQPxlWvNayIzTk3sdinPjmsUAbIlodzw3gnb74M+iYc8veZMMzq0IOTr6KGQwhV3s7JxZbKQLPnilACsBrKGZucL9jLyzP2h1Ac/+lM1/7hXNl+a27azi1O2dJM0WYn8lZKDyzf71gRO/JJUHllomjfeOMV+8M/+I79B//w37U//O637SsvX7aZiYJ9dveRfbLdtFoub81s3irYMd1o9e0uv88BE1xUQl96UGJ8Ay3DvN+byCTHChgDiCHiClyKQzpwpRjdMY7Q3901gDLiCwOTUAhvnJoFQbv2HvrUgsXTO9qGwqjAdK1DafArZbQkwPD9lm5cKuRytru1i0XqBXxYNGEhegiLbxwduJDrP7xhHEDd986Fz+sbfN4DDMLbK3/4wx/oifFCoWDT01MojjrICXHFgfEKYy0dC2zzuRB6DBSzHBd+FsTyfxnwiv/p4NPDGAL/Uvh6Aczbw3lksry0ZJsQFvz+PN/1pb1umKcgoALtCXSEPkyAX2fpoVyUx6WNhAFOMPp4liHE64sDuhOVw7pzgsnvkDWUBIRl0n7r62/a9vamfXD9U+v0E9gt9/TdCWdRcIMR88eFVdTnJ5H8ybYpUKIwgWGUY09GgPHBjZB875F+N2j8OgHcAy/e5lPWp05ZhuNRBTEYqdP1m2tK1zZoASDML4PyxYtlvgX6yRqOBebieFo8xVha1JPYDSivZpNPr7Ap9JG0Ud/psn0XVr9Bz0KhaA8euwvWZVisSlPpMTg2EsD4iP4uii7XPOea/cli4+peUuqyqN8+n0MVGMWoTk/zL4ipxPzZf8S6BWI0xKsVgmM453sS3Q+FKZmUQgYR3IXzWoYuDgN5jaI4YZmZWSvBkriyOmP/67W8XUL7RQjOIiZ2EQOebmZt4uDAllJtuzaTsTdPTNlXT0/btVOTdn4FZgmE/ubuoX1w47791Xuf2k8+umu/Xj+yTzt5uwvhcFDO2hGsi/d29u3nBzW7+7hqW+s7+kyqXi0OoZnstYyfSuWkSRCDYI7huej9mN0Kc34B/FQWGXQWwjSZdl/hS2CMA16rwfhKsJROzE/aG9eu2Y/efd/2ml0YFE3rw2yESSGhrYWIf05Sv1Wzc2dPWA5K59aNu7rI2OPLCP1ClcWgtsM8HLPwCCP9dMHhzA1Bfv5ICWCngDmqoW9fe/NN+/DXv7ZCqYim0bbyxEsCVGmo1UPIE7KOlBnyDMEdXTLCoYSZMvgwfkMBlybvEBAH0ecDgJAeysT8LgRU+Bj/cRjS6YCPpSzIw/Rjw8K3LvN479KlS3bnzl1rtvhlPswHykWm/sji87SK+vR0cIJ9FEIcf+VD2FOJAZ/gwhEtQ1xQdkAKE34wyQUTNjc3Y19541W7gTHcuv8Iyi+nhz8F4UhUiP5H46Hfj2kcA/i+COBnKBpDSKMb4vRL8HUMI3wexoc0V466n+Ph+5aunDopgb0Py4PZos1e6JN35GF1QvSLu/B2yy6ePKEnqSu8cK0yAQOwgHdYDshrKLxp5eoLl+32vftWx9rm60mUCXWMbDiDBvXIlcv11oQMmJuZ4vf+dJ2T9pPyqCy88tN9Dqhfnk/ZN9SdxBydmJ+3raN9fTaXrxuSbMM8hs2kk3euOOGLNPU0GFMaQyfgCEQRsRQRFoMQIh6DoEDVw3zYSRufWyiWLTEzbdNzE3Z1edL+vYWc5SnICeg9X1a4iaw3BxlbT5Ws0u7b9lHDbq9v2oef3rD3P75p16Es7j/atJ2DI+uSi9AOr1HwCei9gz3tAjOJjP3gRz+3X9zdhdUyaydgtRxsPLA2H7rBpGW068Bko01pafxxWsN8D8flIzge7rxpFvhnMfgkOh8a5DuviHmMbapo9ge/99v2zq9u2f2tA2uhjWSLd0nVMYG884QLzy0+flN5UD+y33rr63bn5h3b29rH5CIODG18NoNKw0+06xj9vj9PgE9Xt8koTkAI6MjPPHBDvPdXazW9m+qll1+xu3fv+pr467KMwngE6/BeASnp/vSvtjxGfg9k9hgo5PumciPJDPt6AwRvKOPzxBKGqKh4OOYX0mE8XPaLygLCxSkM3nXEV4R09aoG7hIfYKfr3qUEOgWFAb/mi4I20C+A72METySPpQPicc5QcvaGINAu9FluQCW49Ye+c01SoGTSKTt75oye1fn4k48xhkcaH1+FIeB4qBgCjwaFIQXCOOQR/7EXUU+G7UV9iSKH/Q5u9Bsg5ndFRkHtoW0C5wOgY2L0NYe+T8/M6KNX6hXzxnEcUD+7yDFz83h+bcW29/at2oH1Tcs+KjdeFpyFgmnyAdIunjunekg/9sUdm6FPcQXLOrwTgPzJi/B8zQfX+dL8nD3a3IS4pFWACkP5eCGCgvGKOAii9ys80BzzaPvU4qJt7u1KmUlZSI6gdVUd6vG8qnoDfnnAjAwrcDvvJzGka4Li+YUhyJ8hsLM8OUymkQNqugvmLcI8ns+mbANKgR8o0rWPZMb2kO9X9V376dGB/cVuzX74+Mj++lHV3t3p26161ra6easPstbqu8+5tuuH1q6CQEeblj7csNTOtj1+uGe7O3Xb2m7ag/W6/fzHP7FEY8u+962v2NJk1vKJDgiMvoDItBZoNfA5BYX1UShaEl5gcFSaGCw+WEHullTvQoHwc6q8fTeD8WSsY6+9fEWC96ObG1aD7O9CWQxgCqe4MHlxO5j9wH6nZbly0SZKZdvkXThoxr1EjQwcFiqIJ4amHxhtE8ZwbB6ILKskMqMYkn7U4Y8deAGP7fHW3nfeecc6WEhf+9rXWBDDx3wQOHbSItBDuxqX5ID1OlS70dxziSBG0sL1KkoC0Bvw+eDq+EKZfXsOY4CyIynjdYVIjldjJLoxU2Do5glYgGfPndfDfFQgLAKRgWkBPbkw/aJHTldXAHo9jSJ0kUwVREo6Bozj3xMHGOqrd4XsKzGE0WfwcAqYzeUtg/XFMbz00os2NT1lP//5O7ogyz5TyIi/ZNmSL9B3jkMux+THpbEhDhjJgmgshGPCvt8aBeJ1Czldtou2Ro/xvOu9Luxd5JdCIyrc05q7+/CB5fN5m8CGlBaA+E1IYHlWQNfFuFT0P0SwL1pvqF9xdGN9UnkA6pYkQD94kfkMX4N/85bSo40D+0j6sS75PaoeFFZ1jg6MO+Stw9h8FPkIAfNR/kV998BycuGJ5oBhF+3yMw7l0Q+OhddMuI4pS6CalMP9utxCFInLcr863bwi5stAMgxKGP58OICEEF3+qHHv9+CYyccHZAZSPezgkiAWFmMhn7P/3c6R/WMI4R4y3YMy+Redgf2XjZx91sKQj7A7B9pRxaxyZIla1RL1GoRw1Qb81kTNI8JGhIBuHx1aDVqWn3rljr29z0+l9uwHf/Zj+/CDj+2P/ujvYxH1LZODcoCVMECb7vkR+KmpEdbxE1FpQ+TzHVIoFKhQGnpgkIoGyHdDnVwo2uTUgv3oneuWLGAeO1VLYgK5q+HteLQeBn0eT9EPhJVx4fwp67ZaVoF1RPLoO8AkoGjOiXRMLpdxESOO4dNA6XBRTnMHxiPzk8l4FOaYrQ9DMGd/8U//qc3NzdvpU6d0ZwlvJU2RBkFZxJWHW0bAIbD6Z/QEwPxx/AIQKYGnAdKY57n5ngcoy+IaGjwx1EVkDGwNwoJP0q8/egSexp4TtOXuUjtfzE94DfqxEIgzju5HzvhaG+Z5GrDDznFWCT1wsIFJYFNEK4PfqKF1/d1vv6W6333vPWtzwwJ69fvgLAoi3pUUkP0XeiGCKF+z/KhZfgc+MXRSDAb05Yd+z8PxNCZLCHqk/4kw+ZP5mRcu1wZdpHFq+DBdDfJgtlTSXTy0rCOuZBmA679vG8iqOS5Z4fjnLbxUYgK17bzDcaNO0IqbKD7geB48sL7+yA4PjpSXd3apTZ8/GoP6z747jDYS8PPaRqvDU5GKXThzFp2ALHCNOYjTIaDvvwBhNzekBTEoU9cWnwXhUSpWrvLGITQjRJKmTH11vDdiLX0B5NiHgLjQRwKq0x8hNKYGQwWE4ALE/MOgvNppaAebwG4/YTkQ8v1K0/7V5qH9YK9q/9/NffvjjX1bP8TAayBKtQVF0QQ2oCzcBeRBs2Z9KIh+A8qDCKaRwqhTeVSshwXS2Nu2JtwcRtTZ37EmlM5kecY+uf6Z/at/+Wf29/6dv2dFPoCX5C2yYAspCh41ZaUEqNh06ywERDiKckgl4ZWG8jlLg89pzMxM2TVYGT//xa8snZ+yRg02U4d9buqre3rCG5YFnwyV0uACQBXnT5+06x98pDrdB/jJXJx87lrczoXmpaMz0wCBtuNI8K4c75eyAeiZD3pZn1cYQjAxPx6UX162P//Bn9sLL1y18sQEdENSikP39hO50CRIGYYbBNWXAC7fL1xGioCuc44FpX35foyAxkE3IH4CKsjz4qRdvnTJbty8YR3s5qgcIiEv188NQOR+Vp/joLxDqqjFUG8A10RsqPgROj/7J1JxBZN3MTd8pTm/zb04O2N/+A/+gT14uG6/+vWHSMbmiOwkRI1UFHLJE0AJISL6AKRAlWXg+xPGHPVPHXsKxgQQ6wqIH4fRwGLI9DgyLuoX1ow2VRC84NtULmubmxu2ODOtuw2p0KQ4hAihqEg0QkAA/CSfqqbVjXacLHPJUTm5nr5oj9+smJqYtM8+/Rz0zaA7XJ/IhPJao1G/Q3/jiDZiYRa7jzlZXV6yEjbPUgB+PmMd9V66Af3mMfh93coHPw9QWpA13PS5frmscdDchcjxRAKjviBSDLh+A58AnwndcOEYKMk37tyQBy7CDPEsT5PPEJwsGkm1G5bp9u1BL2N/0i/YP08U7IN+zrIVDP6IO3FMSg1Ctt6E8IXA5Yv9+EBcp+GRfiDiiVQaSV5sPtq36sGuTfBWW7h9CO5KpaZbfh892LK//OGP7a233rRXrl2G3AdTYOSkO5UEL2zzk6i0ImhN8MgsoOKoPHidBvn4Nbwsduh8Wd3L167Z+saGLtAfHfIuqQNYPkfoE/oFpcGH+HS3FDDJt9YC52anLA/r5eZnn1uW1o4sESyKMNNCt0sZ7vrY0WNAefn/tHSfRXWjHgoLHZVxIfKoyimOFmh1/eOP7Y033tDZPReM+5IiNFxQHt7iGN6ZA4A7zjtsL+4K4oF4/BMQaovX+K8R1BR+eCQlhB98Qd4g8M6yLITU7Vu3RA/yuXaoQUg44vrxPXNgT4BaQDl1gX4PbCNaT3KRqj4GrxdoIY6bHyoMzA0VxrlTJ+zqpXN6HcjHn98SD3c7fMsrX2+B+mRdoO9xZSE/4kOY7XrU3UF0QzjiU3XWl4uFQxz+Hf86dGksewy6wkNUGZ/GDY6sDbhYDF30h++RymeSVgKvytoAIXR+j9JEV965QsbCwQwryKf56XEvO1S1UVki8/E6Bo+/lhYWbXdnV4qGXwbldRCO50mFgUIad4gL8USuNdARWSq1GkTVvp1aXUH7SGODngYaswCu6nFe1hXor0qQT6cQSOSmkHeC8nVBVBo9WDOuUgfMzlfas6yKw++sZF+nQJV+YRw5nmKt8b8ImDQeFyBEjWaP6iND8vu4nPwMJqHVbNis9Wwm0bXUoGPTYIgpnvs3eOEYjA13ACFGF1t3S/BiMjCFcsQkLA8+WZ0QNqAckIdKBJbHHqyN8kRegrsPIvb4sBLqYj8ODg7tH/9//olNTszad779bZC7Y8UJPmOBzsrCgADndZaAtDjgDihEYfbxVeuJbF63EDdR74svv2wTs/P2zoefQ4FAQfRhYbQwYe0WrAv4aWGQ2YXc2YDZgKuLS+7VAnsHjmn9hMYxmpPwx/jfBFDO8STKk3lZJ/2YE16gZ7/4qhEeVd2/f882tzbte9/7HrJizqAc9FZRKotgZcAfvVqDwsu1Ah4dMinB9ffL9nm0jqdCsET+NhDvL/0M0uXYOC4oEI59BVbYBjYFPMMWkoYEjo8YCQX6fdwXwRg8c27Vr4BDZRE9RwOFwSeVuQPuNNv20rXXbX551X794cf2aGNTFgi/XEeBxx0yb8jQ9Qq5aDdYHELHH8IobjSsvkZxzO9RQi7m92FnmTkcqf8JdPnHUX2FNyg5Cnee3Tewtiv1lq2uLIuPnSIljUgWekaBTbC+NE8L0H/OpbN+mAB6gqfUDYZ8XWR3KuK5+Tl7vLkFxeyUs4Quy8boQFoKEeTrTULY0Q0RCrt8vOb00fVP7NSJk1bOprGpRR70Ibowrj4BXKcdBgdx7gK3S5eLBDqtTsdKxSLaghJRNZwvuMgf+ekqdwxcwpdCcN8QEOV+PI40cEwcp2c0D0IIMl7R9KPTSSiFHHbTWUxCFYphwrpWTkFsQ3EUkF7iR9qbIEYTjI28fAxfwpfKg4jdcALMkgBhiIZdPsMSzMCBXs3RtL39bSsUIOx7sE4QZhqPtNpQNHyCt1Seth/+6Q+hXPbt3//3/3tW33xo6RwtCXddI1zn0LUNmnqwLhJ88SGUxSCXtyQsDDLOmVMr9ltf/5r9sz/+Y2t2sftB+0m0l+C3u9l39QcukNcQEhi7cNDTBfDPP71hKX50CnnFBKQXGWwcPA2/EPh8nA8t7gDwap5Qf9gdyc9+eeHB3RPP7d/78Y+hXA/sW9/6lopScEpxSFHQ6kBNUiJwIwELRF6N4TeCeOnn1RLyPi/fFwFPGCF+OCaOBS53bsVCQc/fXL9+XZaljutYivMkoUaXEV8CYzCS5OcrjIrd0Y88AF82si7YVyoMzIWmAXz1u9/9PZuembWf/OzndlCpWhcKgfXqpgduEDDH3CTw9swkx0BB7PnBASsOOApRijoLVBmgaABkmHWRLvL7MDCyNlAiKjuOoZ4RZAEA/Lr7EHXpuQsgP0D0eHfX1lZXLQMaqG+kibKHgqPAaPK4BCfrC/nUvv59FOYfv1TGC4sL7pkM3g6PHHpYj5nUF9cnlhdd6LKumEsM+dLoX49H0ejm4VFFn6RempmRpcRIUogjYdsRnZkWR09P+pkn5KMS43UsWhp60zVJwXwAp0QdLxwLXkF/GXQr4WmAdkRkjcAD41yCgq5/8bD3KwzNCjfTbVu529KDNfvYIeTRMEho2zxuQp5kvWvpGsx/uLwG0G/zPUxwgSQ07w6gaehMRO6aYCbC1ZOrPb6YD8oDW5KD/T3d0ZTmhyk6VVSN+qGYmIfXF/hO/RR2Zb985137+PrH9j/4n//PsNCmoAzSluZbImFRUFmkihAS0NrJfMmSacTzzboQHHwJYrGUsddfPWfvvfM3lh6gv1QMQKfYMGFUFlykJC7GnvSLlaYuj6XmwChbj7fA7BlEYyy8hhGYTHQTSRxGACqPhJ+EkTkCRCHUGe2q1I6L02YwYvyeXolQnF+wH/7ZnyF5oFep87OmXGgUmFqUklAoB5cP/rlbrckBxL8NfJE6/i7aAYQqQnXsv0enMCCI4ecrK/hWVM4RgTShRSbhSxqGOROSmHCfhYCnCgNFOVcXa9GxsGOWK9qzj8oAiZbAvGBjA5idmbZvfv0rdrjz2H7wr76vI0XuWsl/epcZkcef6LfeTYTxuF0vBZBHjCEu6CJEn7TTj8VFR02xuCgNeUNdRH3zwqdFeVQedcZxLA9Rcse3rb5yHmhVMA1/61sbKryyuAhh3ta8saqnGqKog4qACodzGgS9xuLHow0ceJq3WvPI9uzZM3pnG9dGlxeukY/yh4rLKeFhOXZWu3qi6kMc0th3rn/mp58P8vIVSHfv3rOFKcgexLmp5g+QfQpKjeOHIxTvsS1v6Sgd9dKLvy7kCD/LOxToiEUe9yzKMBzH/z9x/xkkWbKlB2InVEZERmpVWVrLrta6+2mBmXkYBexAcLEgzLjEmvEXacYfSzP+IMhfSzMazAgaSaMt9g8N4M5iMcAMRsDee/P06ydai+ru0roqtRYRkaH4fd9xv3EzK6urumcGOJkn3K9fl8ePn3Pcr1+/+FH6z4sPLE/5nQcBMYIPEL1KF/yEmDxBas6O9UBB9LVrsgqWqg1oXYSCCFugQ4bbaBHWboJgCOMMIgsh7x8tIbKDA+PQFZKARGckDQoMpJXlJZG+t1xE/kjroxtI4np6XpJhLly4ZD/68Rv26ldes1NPnLJMT86KfQNQIH2YfYRvfOO6zaOUoTRylQHDbNKeOHNSlsLHl6/5LAT15Y4tvWdB5UFFFurLMgW4pjCo9FbAjA0wIeIomAzmjCZC4l9KV7gDghD5IpCkVPtRNpku0k9KDrTBda26aQUoxvfff1/HjIyMjmqAJQ/G0wIsCLE4nf9i9VNC9z4UHifOY0I6G7UluFR+sX0AWuaHDh7ScREUInFfvtMNGPrKkfyIpI/CkE4lwJsGZpeGhJSqoy8Fuh+0xhjiS3uNetUO7ttrp0+dtpt37tkFzF7zmBkpb5RFPuxw1i5BS37DDbQhmXGqDV8Akd7HEfPgmOqi+Ilu6lpbkyHQfIsyXd73MEde7yhDyCqzro4uG6D4IHRJT+Rk129cs4MH98swVZ0eCswPcogPslF+FLqSJbodrvkHbwMzi+NHj1m9WrP5uXlEQKwQR8g2ANUW0kP1czei+iCJgzKpqPDHayql+YVFHWdS5o4n9K2MMhbjtQ0/wWWZiZ+IvFUXpx3bs8mXmJF3IZdH0bwXEtDP+tDVtYoRChS3iy5fPxu7iikC0oafLvCSeabDQ1i4EaB7nwSKhOuBCVKh0sAAWKlj5pHrgZxvG08vyHZy1qhxCo00iMuHxvwYER8ac0trVBbeUYgE1y1k+oGcMjIOimstrUAIoqzeMvIPxwQHJo7p1IkIL+RLUDIb9v0f/tCOnDxmr3zlVavX1608OGyZ8qhleuH2DVtncMhygyP6pvlQf8lOnjhun1y8aa1cyTb4sF6D05fO/JRaDlIvQ8qYHQbgg8hjYMQZzDI63PbIOkGD+WBifFyqvor+1w4cDEkZZGDUi9N+WU1yvS6s1+ramn104SN7/fXXNdMgyAKXYHXh6hYwZxy4Sf9uwLIeCkro3kfC54n7cPAc+It6KUv8SAGyTd5GQm+5V9uRV1fXYblDabB/1I/A4LBtzpehnx8HmQdcofwhr5CvvKwT6Yu6UEHwmVukMXf86ZBMXD//3DN2/vw59dNd8FTDcuhGWsLgQ/CjKwwIWfaveN8FtjDUISo0L1gk2I66h3g7wlV/Wl/glWj40K+Mgj+GxZWHKHB0X/RMoeJ6vO3IYpxu5Fd9ZxvjjQI411Ow6zdv6MRZHvzZwvjz+qmGO4B5QA4VIHeUH+ngfcJyIh2YlrNJKpczp07ZpYuXtDzb4NhmGsaPdUZ61TH44/PJyBPbkUrD07EfuBOvhbG2srJqE+NjklWoDfoa1NpZfSQXRlCd3ZUsIwJ49HsT+VL2NWm4EpJ0MU30A2PdGMK8lK+7j0IfJTuBeeGme1LAfHeGCbph23wkEq18sHQlw2lyx6qNHJRGr1U3t9BQVAAzDU451HYyuLanEqEMNIvwTlFHRyEnxmP+TOOWR47UXueD8S09EHLNjhtsB+MiDfPwEygxneOUs8Flr4L95Q9/YoOj/fYH/9VvW6MAphw9bMWBA1YZ2G/5of1WGRwXI33nt79tF65cs5Var2my0KGVjnrGLbV8niHmYBkugFkWBZBVqzYxsccWFhZUL72NivrolX/Uj0yn6Tyy/RuHSE/UTYKBio50DLTk7OLuzZvaUfV7v/d7uqaS4GyJU3zWUQ9k6Um7cD4bFDGF/zkgEFmIHyoKKg5ALs+jJrbszNmz6ice4seIpJPzGxD/WnaES5Dy/DyAdImQIv0R5FUJiph0hGLmHc5ytAQIRUGFUeJzNVipTzz9lA2Njtuf/cfv2dLqpleN/clZI3mQLviLxgvrHg0DCUxe70TGw/0ExR9dpMDrXoO/k/FHfiHCT+Q9hQXhKQzxhbwWFVIQ03E8RIzXcAkqVw5ct6ypIPneyZ07d2zP+KjiR3ruBIXhHpdb1QbWAWnpV32AVBg5xgStjhw6aHOzM+CBecRlfNIONFD9gUrnrvJQnqFsXCb3Y1wuY4m2aBPkQqNRl1EwMzer2WKG8gNleN13awEAWSRAP9Af4Ht7mjxHDPw6PjKCMkEs8lK6TmlIXatNnxN2VxoRPkd+6cITAgKoUfFrlTzaAg3YbBfQebDS1+theSpjeSCjiaggYKftQpgPj124MU8SCFkRyUvye5l6+ENCNTtWX6tahR9qIhPFSigNfsR51PotCcImrLEmpztWsO9//8e2srhuf/Db37GT+8o2NFG20v5Ry++dhNIo2m987RWbXWna5XvLtkWLhWVTqSEfHQMSlnnUYSzHK6hfroMOTO7BZQezm2U43HOO+KpPHGAhXWxkV7LgmhDCH8AU7Lh8OCAi60lmpwum5i4qKq9G3b8vXuzrtw8/+MBu3bqlGQcFmi9TYXhh8EVB64C+4S/DGJy+tSs8MsLfCDh5UDbrSWURj8enIoRRwHsDQwO2/8B+u333rpShhAUx9o1QGXW75gsA82ZycojviMIFw8i0rA+Qo4izjQJ38OE6X8jbU089Bf7t2E9+8jOEF/XOkA4cDIrCeQoCSP1LQZWut0pj8buA10bIPIKfPaveTYXxH7UUer4sg0IvFVdIf8SYHD8ci2nE/3ZgGBF5sC28j2sX+EC0ifxaxCzjJpTGMD+3wM0KiBbHfJRHcolIy5kGx7223KaAaaLS7isXbRxK6NKVK5plc5y6ogz1iagwoCrvfjcSGcZrlhniwO9LVugfygqE84ubPIOKs/t9eyYUN1kCFrJmSOOND3QNmAD8gX40Lqg0+vsHXA7FaEl0xnMUDQN+ESCdHwEPZswQMb0algJVApXhH/y8DXEEbFmZz+3Y2R0edVC0ar1pjRZioNHU8E5fxKWigMLo0IoXkZkXMycwx4BelPs1YHiRt8Z6zYrcBYVLlixgBiwgjSSsprqcbaCumV779KN7tnz3vv3Wc5P20stH7eVvPmdPv/qMvfbKedsz1GO//vC+1QrDVrM68nDrXGWHvLwDWRZdlqvCbWt11Z599lmbm5+3tdUVTXd9WYpxWR8mc5qJXtEf0CMA6SYZK3N3o7freTSImYGsO+ogqxRtoagiTXiSa7FUtF//+tdooh/Yx6k6FYfvpgIbR+Ym8pr5JkzPwC58jprtCo+ffnu5DwBvU1HoCJuA8OfyvnRx/Phxm19ctDUOaLSBgxud4Ij7ruCRR3A+F6DsbeNGdcFPdKEgouTTUgX8fDuffTExPm4vvPCCljT4ohm7rgFlwWNOxEOqE/syGFBA31pKPysbEfEeqDmvd+Bu/CaeoRsxVD1gkn8SzutIs+jfniZJp7EQMBXf2+ZtoOBle9g+LVMhf36Lm4qgv7eiZ6XKT5VwSMoAxHdthDEOac0IoDfJv2d82DY21myzuqn4bvSm6qL6MC3DvG4+Rrvo+eOexm0IRjoaxUTSowm3jjC+aX76xEktOfq4AiaV3p5vLM/rwnJCsDx8a6GmI1YIcUPFoyFkAlQ+j4HbP/e6AwV0Y4IID9SFzBAaIwzBqHgGA5KavafUo51R/cWCreN6EwOXx4hwYNBCDZvNkJaIBiCOD1hg7KiYb1IXugxHfDIbCLa0tJwQTuuIEZimiWsiw5XUmViaHxVZ7hmxT5baViuN2f/hK0/Z//v8sP3bZ/vtn0KB3K1t2Eaxz2r8ZjkVGjLwAUlGoOv1EHOE+lH75/U2edYOHDho9+/fUxx1aChfDMalLOXFejktNdWOqNxC/mkMYRycjKc/0kvRY95EBjCXgBKaQETlS1H60A2XyRg3KEEyNz8lyTf6uUx19OhR6+N32aE4+MKbRlghZ+2AFHIceMKYPzHUXpDyRgitSHA7MC+JHveH626+XfTD2Yi4TAFa1M07pg2Kwvi5XvZnvgizJmeFYskOHzpiH7x/BaQpaVXBlxaASf8GmoZcY18/EljNNKja+BG9iPgHTZUfGlHEeKHSblRrdujQIXv2mWfsrV+/bdcuX9U7GS3Mkn05FEKN/LfFQzKBcGnIaNYe+KmL5CvnLV9icxT/xCqlkVXZEcY2E5kH8+zyWKAFMdAluQbGtP6AnGOki15+F2MaIa41NhiXfUD6E9FmHs7H91DuTU3ZBGby3OXEsUXVkdRXebhbIJ8iPvNUvorkfgrCZrNuExNjdufuHeXLF3i9bJZLWgNl7LENqCsczSBwfycNGJ4gw+F6/dkOR/LiXSiNkeFhGx7oV956LwrxJSOcaEk7mI/nGeuk2/DjH35+cySD2ZfvnmPTuvVRkxWXnhgWwgMGUjwSOfoSEA0DEpRJGtKFJ4BGBJ8nxg/+Jft5DYHZgFXA47f59ao9wwM2vbFpG1lM/bJ5jNm8FUp+AGCyhquEAJZFQquhhFC+6kHCeSivSRwK6MWlRSv39lqOU3rUxdkHEDosojqb95S/O5vZopUGh+3c0cN2BHTfj/oe2KrZaciWE3snrKevDOHI+ByYmE5KWURkONykUmBetJ1b9cYP7Nd66l1+UpPPNxAnDjpnKDBiTJvk0cWdA8vDI2yP+3AgHYBJxwTaiC4og4oCbVKf0xpCm1gv9sfa+pq9/c479s1vfRMMmZXi4Hcl9D4LUYIvFEGQyzAKaLjxvoKjJ8COy+2Q6r8EHnX9EGA01odKXAoDLjHvJxbzpU0q9qXlFVtdraKNMHLUR0gnmtENGOkcnMeG2HY6tCgpIIA8MJPXXArLwc/DBglb9ZqdOn3azp45az/98U9sk5/pRRu4iUT9FPouCyWRgwLJQWHQApcSET+iqG3o/CbeT/gWqHYGTBrpmBbujgiTtIpxtsODIQ5MG3m7y8MBU3XxeCEO68O6wh8Vh4e5n8u+hIXlRW2R5sxAaSOdmRTgPORbbrnFPSPi+U22h13BDQRjYyPWxr21db7nwmUsjHOVR5pSWRBZT9LQ65Aelw8g07LOjKvCWBcA88IFy65BMX1y8aKdxgyX+evcN0IyTkJd2S6mj/VBnpIdKoNoegeOck+bV3Bf93aDGBzv0wlelvooBLm2Q8JgqeuHghoWYxLCIGc4e4JeHmOANvb0lsHcdRvrLdr9at1WYN01OGh7cpYt+5Hj+kiS8ktjADEMiR/c0GDVD35axCT44vKSLLR4yqfTHj+KBwQx+eF8opaX0IG0ypi+k2nZYK5h5ystfm/QWqxTMW/D8D8Hyy/TXkO7uDTVtnwDeTSYHhiZguWwQJaJOslqQOOPHDli0zPT1uKH6FlhdjjLl+vpaYHFASmM12qnh9FNGuINB3Zhl6BtIFKk3AhMR6uJSkOdRaaUVdXGf0vK7/7UfXvz7begOL6lo0aoNHJkTvah+jq0PWU5P1DQf25QvVBXPpNRvVF/KI0MFHmpXLTJvZN26/ZtvfCJlqP9IAxpwz4g4lp/uqTvCwBpQnoFOlEpMx/yCp8VSRkD+IGs1159zfZO7rVfvvELKJA6DA/EZd+wDhRc4D0qjCx3DnHXFO7FZzDiS6CMgYCqv/p0O8ryTTZupJE12wX5z/ZvQ4bhNm7uDCMm7BDuibYBu/FD5JAHXUQAbwYBjHpGheiWO/yAKmYYG9VN279/v17A85kGSlMeDvRxo4M2oIR8lTei8Tldu1W3J86dtduw/OvcRg96oABEgStFTOS1j1XWJ+GLR6D+kI8rPhbrqxNcSaGQv3r9uvWjv/sgI0l3GhJ6ZsrKCZiIeZEWXgfVTWGUfX6/ilkp+YnPdxie1C+B4I/hvNR9x3Q/bMcQndEA4N6HQ6zyZ0ESB5KHbaRR5i+CATkQYMXxU6v8vGTOWtYHabyIAbCJQdvQ/YwP0mBtKZOIMfdIIHV0qHloBf90iU6golhaXsbA69FDLx1gRhZKWYraoRSYlW43a0xfMeOf38rYG52CrSIoB2bJNDp2G3F+sbZp1To8TdSzzbVOV1SadbATCVA6yozVRlPIoHkKI0ydP/zwfctCmenBmgYo4rH+oSfcdX8XUmFqq4Mog+tAnQcg5rkbpNM8EAvp9NIkaCkhI+sKzE0rFgLt6pUrdvnKZXvhxRdx7S/B0XqTEI59xxLgJrPG2JcR/5PAjnJ4KZ6kS8QPp/BsA/iT7ShVYLxgAM8ubkhwe/tBIf/3H9KVvENXgZ8TVA+nCWlDZax1bN3K6I1eCvHh4WGdA8a389+Coq5jxsEyuXGDD4B1tDmUBBWFwe9HwbhQinwlVOXJo4685xiVgqMLIURn24AS0ggSjyXXKVT+nj1RRgfjpsLTYbvGh3c3FCg+EGUpPn6Uh65DfdU/Ptvgs52pqWk7fvSo8nCSIi6uWBbT8JymHsgHvZXN+6FA+vlM5OjhQ4jWspnZefQNeIObC1QOXSLLDvUgwO3S8+HIesT2O01QKIOlhCgHeL5p3RYXFm1iZFRv64snlBbx45gJeaHH/I/XoU5ygdzUs1VvWF+lT2WQp1SeGqvkjhEYHMMU/2HQjcRys+kGqiKfF1SSp+ODQ62nRSECN4MZhd6s5hn/VBCZhm2AWFUojbqUBpeUoU4KngZVkuLpQrfCIpDqSJcOfwKgg3kGT311TRZw+ugHZkfU+i2SREZWZ8K6ltVCYVnbsPsrG/aHH9yya5hQrGMQ3ywW7P2q2RuXb2DAoK5kVm4T1jo3/eh81QP5eeZA0AGzHg7msbFRtDtvU1evytXgRTpitPIEyuOLweP02wNxeJkKEo14HWkhawjI5xpoB8NJ0ytXrupo6pMnTykdgVayvklCZJ9KKPIG//n3nwN2lMoKkR+kPAKPcpaRK2jf/OTkqB6AQ827QaBBjXTsHmAiLHYAS9mJD0By05cs+a6FIxQVrmns8Dkct4BzffuVV1+xD95/3y5fuoR6RMHoyqFr9cIvhJ98hPqpiulqxmuFhZqlwrxvYjj4F4Fx23d3eSWih3NEiU9iJriXyA4F7QiLEMJ3Qy8vIIIi4ib+QfwYD+jWegiL4wd0nZmZEX+OY7wpbmTA8Ess8RkRlIb6gH0h5MuSWTt39ow+UsVh3SSdCZx5J+OcVj7rgXDWw2N06/0wVHyg0gLhars2+o2zBh1v1D+gpeuRoSHLUcGx7hEB/uvJE4htR5j6SXX02QaPKuK9buqQA9MzbnRjnQLGPkvjbuBSNQW7J0wlVvn4ieo6arIws9A3prMUHi5AeDRHptwHxVHW9yxa7ao1UNkm4tSRhko9z4epPYjLLQTMZxvRiAA2MPq91azsNr/qivT6JCejATQsmFWMR10tglMi4JrEFmNwiWoeg7Nmn17YsD96f9r+j5/M2/n3avavr63aZG3LsuszVrBNdFITyqMDZBZIr3xD3UKVyYxZKI7R0VGbm5vTLZbL2YdbdywTyKSsQ2CQz4SdffEZQFr4wNsNugN1J0iIsElcN0f9tIQGBm9xKy7yK+TzemN8Ys+EDY+MgHRcK85JUfP749FyZnuUvwoK/v/koMJVvruom04xDsjtqlR0ECb79k16P6Et4hUZB0gmkgfeEv13AcVJYRrIz4JQD1wnMwzxOm6RznC4vPLySy/b22++ZasrK4pHZaEzj1QfIOtA3sU1Z4VakkIfJGP1c6KnQTWAdBGiMEcPc8Q16hnjE6Nwj6gEga+TsHC9MzyN2+IofwaGe7oM5TKMP4oblCWQdOIziNt372gpmLc1W1BPApkItOeuSh5HlMU9zfSApOGhA/ttbaNm03OLiI9+YQIqDGYEOvMQQilTVkH1YyW69XoU4gfjyA0xLY8xDHlrRq84ZsswdlnNXi2rw0PjK5QTwVsDCHTSm/6kgfIgb7RtfW3N+vt6EYlxw7hjAcQ0xEu4sR92Q6f1dgwj/PMCcyOwQ1xRdPhlO0wbaLnxqHFIEc0y2oWS5coVK8CSyvdiJmBb2mnTBGVqahGNPg4geCRw3FJl3umGCdSKcBEJkSIGp5lcq+a3j/kwiMtkJOjuIgvhTlEQgsR3LNRWbaK2YJswNv70J2/ZxoVLdu/6DdszNmKdlQUrYTbSg0HM6W5b6Vlnz187iOhHxny+whMtx8fHZZ0XYEVw+552tYQO1tooJROboHZ02/IwSDV3O+x6IzBZALBW9GwLJ/BOzEH3yCBBcWjgoE3c+rnVcLxw4YIONuRJsMyXfaaj1Gk4QPnHgZqUQz+Q7jZ8oCZ/3RDKSZQFp7bgT54zBmVhMGLOnD5i1S3TyakUwHoXhX0UBmXCdkL8iKeYM+OF+of73g1+NzGsooKAi1xdIBBRL1m9wLNnzkjg/fxnP7N5KC+WyeMstEuKPEOlQeMGfj+HiXykwlRuKFHYrSsvVEvlFxElC3WtGIyLCyH9ESmMYjjRwxUGvnBhlYqTgm3pUpBOEzHJVxEYRxHlZ926cTledFN1Zxxa2ZyxF3iE/fWrNj5UsoGBMowB9DOUBHfGdTIwWOEWSj22ij5t9PRYEwZOW5twemxyz6RdvHwVbFFWXiqbAJqL/xkmF+XB65a9l606KPzhqLQEOkSG65r5tmXkNpHP0tKSHdi7VwZa/Cqh4gXw4jwt2y/aiT95wcCMLczPWxnt48Yb8huDBfSwXLoxvmeofPj3uIBcPWFMvCvsDPYWhzGPH2puDEYqDCoLWnAcmJkePwSw2NeH4DyURtE2DNNDLt1gHNXRApAN4wkFaHwxrweJ5RWIyBQAtR7+VJ2bFG4gWK1Ws95KL7IKLBbrGQC6WW6U8RQOFIq21bG+ZtXOD1Zt6t5dW1/ctP75WZv/+CPr6e21Se6eWlmyIpcFkAvboHajc3xpio3wvLlURmVYqVTADPygLZc8kC4II59auqUU03Tdx4N0f0WfWhku5Dwky5hWDBMxSQih0oEwQ9X8I/UIA8PFh3m0OPn505/8+Mf2wgsv2vDQsNJ2EJF9S4EYX1bz/vzPBSgZfSNlwZkveJLPMHjEvZXL2qLdU8rYmVNH7ObdBdtCh5Ij222+R4O+Yt+ovXSRXZqWoFGyXhzdiIxHfoooZZr3JTzyPm6TTrzHZ0WvvvaaLOU3f/Urq1V5zH7H6jUYPkjjCgMZsg70c+mwwXeEfHkDHfcAhlo4brvnYdviUpBEYbLjXhcZ7vfS/CJhqPu8hpO6TsJCeESFq5wuMkShSuOBnlY3A3g4b7BNGm6kewim4q3VNm1zdc727R+HQshZFv2bKXDHY68VS2XRfxU0a/JBMeQET7Ye4TEekBsLi8tojgZ0yBO8DPKmhb+Xi5vRH8JDZR+NjIs8+T6QX6M/UR8+yN5qNvUe1+TEhFgGEYKrH14G19MmtJE8cT/psQzFU4DRxnOtlNYz8ft0WWel8zQJ8DLk+5mIPw7tx4dYgdgQXgspJDDbIJMTqTR0pHgFHddrvYN90HwYZFAaK4bByK8xoeZNVEDbByMRlRcHEzuPfi9GEHczsHVsNeMTdc9RD6aRdG191fogrJkBFUe0cMljnB1wRkDFwWQSabjBzzsW+FXzRt32jJa1vtmot2xtbt6W55dtZmbRzpw5ZVtbVWSFtE55pecf16hVbwoploW6jIyMSIHRQqeC0pIY66z2oq5wlE0aYpseA5Cl0tNNg65T2TxQRgqStKJn8AvCBcK9qbwPBJP7VLhji4uLduniRXvmmWd8fR6MKqXB51PcqYI5PWlOeuys4988oMRg3Sc8CYMmC4szw+M4Sv2I0qf3Mgrg3fuzKxAq4Fn8cUnIBxfSs68knAPyWsCY0e+gq3RD6ZfSctQzP9EppxN0ORv97d/5HZuamrKPL3ysXWl8q5fr3Jzt8L0DAcuFstAJykTxj9+imy7ys2F7fdOQFgw7wVsa/gIPbFdGjjLRkmvWy8PSqHvkoRQ6jcM93Ufa4I+85n6fVaTrqNGHccfnUFkYqJfvz1v/8Lj19WA0YybRgaLowM8t/4QtKAaugBTQ1z31pp3Yd9BmZnkwJeQX8pJGD/XRSsCO8uQPdWHo4yBBClNtBUJJaaMFw2hIckMDeJBLVFUYC8f1OVjICqT27cGEdG7e56JnzBd1pQHCQxZZ7yLbjTo+kjdE38dAEQZlIU9wc6zMDiRxPgOiFa/qS1gGhQFLjrOMDqZ6mdIgZhdl6xuoQPNBUKMTV6gTYAV0MM/zD8SkXkQCcGAJA1lUD7Uc9116OUZiqp4eV1vYQLi1tVXMNCq4hU5HXgIMQsoAIf7QbfIrJeLwIWMZgn+4v18PepcW5q0G5WMbqxisHfvlL96CEhiCgVp0ocL0KNvRO1hCKgjO6sqynTh5wqanp9C0ls8y1LmIJ4ZkktgGdx4KMV4AMe4usFt4EkYHyLY/FBB3Wx70R6aUlctB7n3Fwc598ddv3LDNzU07ffo0orT0bCMKR1gKUtCR7gmI6Dtw98AvCEgrhQGUIeOz3w7cNpcsYIHmimXMMip24vhpu3zlBniRQt0P/fOTipENUFxOOkS6BH4KV9uBt3hfSGUFGhCpNKBESRPOSpn20OHD9q1vfdt+9etfofwrqF7eNjc2VQ6zictH4hUuk4j+UCa4j9wUzwWRu4/C2J4HwlKg6tMT2/swDOBxI24vJ17vRN5ju2JZ28rTfWIQ1ELeZyS60dOFKIc4GctC5sytN0Dngk0M9qPbKYfQ38Ue6x8cUHwuLPOjaqTinsEhG670aZbBZ7CSjZrVIS9mGsqjYmJ9Yp0Y+lh0egCZhoUEoJfh6Fflh7ZcuX7dzp06rW8PJTIuAKPKTegU64GMMB4lx7hxBbxCA4RREvmHyGoDLpMxHl2v2GejykM5QNQsfRO/8b5CPCwCi2clYjXkslLQkm7NQWFAaXSoONCBVh6yQm+v9fWVrFzI2hairfGhN/wkCAUP3+rUrhB2FquD/LqlsgQNEYDXyJEQapEKohVC621tfV3LQrLYGA//ev6wA5UMLqe2PUi3Mjdtxw4dtGu37usLg42NZbPamrWh/e/fmbKl5UXbf3Af+hgdxKT4YW0zekoGglI+oLPVUeg47uTgoWc6CI/WBLlEhA8diJCExiQ6gWl3g3A7Qoz+4A3+bw9LmISQvpUO3wV4W/XU27Cot4QXrtE2Kg8+oOXOkw8//ND2TE7qOHW+TxCfJzlPcAYKKrEb1b3kn13+1O6d+EUhpKewFm9CadCooQApla2N2W8eguPgyLBOO75xF5YmBIxOBwUPReHlgoPo18JAQC8Bv/x3RuiCykTZQXES9U160ITLoOfPP2H7Dxywn7/xc32vgd9B4HIUaU3F28Rso4FrCoC4Q0rLUShaciSg1+GviMqLP3Qfjd06gA8iTYDp8J1hQtwiJvcTwUdk+E7Ez04kRHcHcKWjDbmzVSjbOpTvwdFh0Jx9DlkEQy8qDRoPWS5Pom+eeeIJm757x7YaLbG3sma9gLEt4v9QpvzuSeI8DsY2+dJWKAjp9TEsIscT+xdtmJ6Zg2Zr2r7xuEy1HVgHSUi6zEfIPKloFUHfAimi3UkdnPL07A5JPkRePwQDRIm8O6QiCjQ4fJrtLqWAJCUwDMw449AyAGYYsOr6+3utiJkGP5mxSUtLSsOJp8MDpTQwYL2QMAhTLWRjIvV3oyRBdWUH803ahl5waTW2EJ1pmCykoyMvGUDzDWXJB46V/JZNDPfZ7TsLqE4TYRuo8Jo1qutoUt7ee/dDO3jgIGQPNDrzhRDgce/cPaSPEkkqIi904MTRI1qn5llBfLbBdibWY9JBRK9LAjH8AdgZN7h0ED+0DpceLzQxBR7+eBAGh9IAwdhaSuD7JVGoYpSxTQ0e+gj3l7/4hb388su2b98+hee4FAT6aAddsLbFN1QmcKU8HkDdErIBdLbDgyG7gfKgVa8ZBhSF+BH+nl7rcFmqXIEc79jZkSJmgvNWz/WhXqhjENBcCpUxQEz6CEAXyLqyEMag+dCmPz2zgJEgZaE68DkGkDyAtK++/jomOmV75+23bQPGDXmC71+wZTIsoIwlFOjf2pIA0bMkVSAN6BPUTf3yALpSF0qY8DlN2Gm1Mwxt5Zr6zhnBrihauEtvulII8T/FUUAM0R//hbtCvMl40U0FJ9e62AbgRtFOmzAgi3iu3dLymo3DiEEr9Z6UFQtW6etTPM6OexGVJzzkBgbs+syClqu0mw20k4IGbbwspkBvwJ9GVsZlx2OiViKCy7xBd5bFPsCPeIlh2siDenz40QU7eOiQy4qHAuvC5PzBJfqH447pNzDz7ykVUSIAebMVigMM4pAJ+dt1EwgRd8PgcAgH0hBTEbZhAA0UQlQYRKSki8pygGQ5SHLctYCZRk+/tTDLyI5UrIHaVnsKtgxsQIGoQGTGtT090NNg9dy79SCk/EkDQ415CWJ5ODsS2SAvnnXFnUvGZSQVxR95HOgPblw2aawu229/52/ZzMyUra1u6MMuVoPSgMJoVze1x/vW1RswWspW6S3qS1lttpnWDARSm2uioANP46Xw4cPNmdk5q1ar4A8yB9qJLP3hGVz6VTJrHSC2j07SVoCuEVuuQgRJFLjOzF2IzJ2G0NRtcemP4RHi3ZgDo4u6vOCMMKAv4/gSYxP4H/70T+2VV16xoaFhsIN/u1qDMQrTyD87C0yANxyd1R8aEZC+H/0BUQ7XqDM8V4p8wJ00WqYoWweYBfIrinv6CzYztwhWHfL2UWloIIOdgaxtzNUr7iDBjOskSLzPNqIsKYqICMcI40eT8lAkv/d7v6OttL+GgiXfc6am2Rr5Bvzv5365S/5gOtVBdQHgx8tMSt4FeO+zUcIqXqv/t99/KCKuC6ntYY5eR9Vzxz2Gkb76w3WCQRkxqjCC/DGQ6LkmBABSWWsZG/nQT6XfBh15cvZmswNs295x/6QBVz3yUNRbGENbpT50UdaeOXnELt2+aw3MOvkxNRo53vdE1IvFpOQDy6FXl/Dj5wsgAS7bTB7i9IbPqhgM3muTF8BD96anYev02PjYmFLsBqoC8mJa1o0BUhoIoczR8pQqzLEgc9Z5mvKHLtN7JszG/fH6oaCIymsbkFyBZJ6zWpQGrwSrwV8pDFqTCBNiplEs91l5YMwKA3tsbazP7ve3rQptfx9x59CJtRI6CHlzrTaPsDyKyWoJBEKeAwcElbZXHejATTdIXt4IqPsMA8DPeultZAh0WiBaY6clyYGtOvo9rr9zmYIDemhizAbH99u7H3yMelShRFb0bXPfoYIBTn+hx2bQoQf27dGLRNyd0Sz2WJPr5JjyUkhRWPRUSrZncq9dvXZdZXpTUC5ddRrryAqHNhLFrH7f2xrciAK2FU68/DzAbFIJo58UdKYjaXjlgbzLKgsVwAHKQCDrKMVBAdeSwqBirMLCufDxBTt37qzIXABdcuAHvZkvgQqEX/ntijuBZSLcKwHAj1wH9bFYOJUH+1YKgy/OUaGzb2htAnshICr92lmyd3LCNlp1ayDvWh2DTdYfkAOPXQHeJOrQSzXc81UZ6fqwoUB/PwlxqCxQbqwmrbLJPaP2pddetE8ufGjvv/WWlg707gV5AX8UFnzInQVNMxB2WdCSnwl25eFjwU8RoFAgipGYEkUjTRpZaBpQdwR7GwIqDv3sRyCVoPPfo1H1if0QkPn70ssjEP8RWIeIUiD8C/Vz5A1gjKW+hksax7EsF7IEfMVNOC3yV6XPapg5LFSb9vzp07aHH1UbOwBZNGLr3OgyetDGDx+2Ynvd7i4uKG4DebNVLtNUqEBVUFX4gz4gf6gPWNdw7zGwC6lAjR/QFLSXsUD6crbBsYRbU1MzNtA3oFUMttt3aJIWEZxmdJNQ5Eulw2djPBGDRkcc2/5ic6rvAQlfEOQH7uyznYh/9kQXEJCkDoV5WIDEz06kE1x5uV7LhlFIcx80yhhs2t+bqNj/rr9kfzA8YL+LQfs0BiX3qDBtptG2UidrPcy34d/QyLa3oEy6wjoOklBMqg7pihH8Gl0gISYLjyc+grkw3NBS5EBGY0ZUcrSCMXjbCNtq1u2pJ0/b/akpm5uZU9nJw3nRoWP1rTrkTslu376tj7RoNgMLpokZVSdfkjVjhTLKNzt87LBt1mo2P8vnGT3iDZEawkZNUlVZkaRVDqGsBB9oYwDc29bhATR4g1+wM3kqjdIH2FGLB9NFiOlJFyIfjENpdBq+TMXZxXUoyo3NdXvqqSdg8WyKiTX7pMDloCaSR8R6adwdkrrJgx/+i8+6adyI0Q3PV0ukBZRLJQ6hgv7JlgaBA1aC0hgpZu3Qvkm7X89ZPZOHAK+hzzlw0efod641s/9bCHNBraxVtjxE8pMEWLzGveDnQ2193wFhp04ds5PHT9jHH16yO7fuamlKBgjKoOWncvjwkstQsDbjmWSkr7uM5P2N3AXqwochfkiFNCKT7dfMQJlwtJAhHx+YaqdwV9gjkODCV54EVY3dQDeAbLToC2JGRSFlgT4O/ZwgZ/2Iuo7+vrrRsYFKrw2MQtqMYvwOQIhmWjZZydqRsQm7t7BlLSoMlMEZCimjWTH5CuXRLhBEN1TYq4UfDuTHRsaPuCM9+xgCIp5ARP7jTGhudtZGh0e07ZrPDTm2KNPiRgrRBPlI4SZ5d8B7OT3T6YFBXEB8BXuvJ3EVnzzuNwOPMUIX2exdEWnI6p8BMZc0sCIepl/lhMYQ1TBkmUWFMTBPHu+z/+b4oP2vS3l7ttOwP+gv2z/AoO3lsgYSZrZaVoCXb1drDbfB72xDafDb4DzTSYRFBCH8u0GsBMsN9eBaLdfZB4YGDcPRDUMOaCoLMR4ZLsdvNkl5cEfUgX0T9tOf/sSKUGwcxGikEzjSAOWT+CsrK8giZ3sw9RWDFfkuCvf898HttRyP1z562K5evxHqhfIEoBvbiWZ09/f7nYfCtvu7R/b6MU+/egAiYwRQybwW7hI/DTvikGF8zRxhRPUbGgQlTeFHZc3YFz76yEZGhu2ZZ5622sa6rCUtF1FxaKDDMhTzRzqAb8CK4qGA+HE/4mnAUFFw0PAeU8X74dqzYhwKFC4NcbcUBAUEQw6zwGzvkGX6Bq1TKtqh0T4JlBubOdtgX/BLkfx6GgU2NTzbpEHlfOc09jqRz/hQW/xGnuI1t5Orbh4F/6DFlr3+2qu2f99e+/nPf2Hzc2u2xe/D1+uBhpjFUOFCgUSLM9l6TouWwkR918VkwHvHPAQfB3bGfdx0uwHSpur4MIwCirRM/ynwUUA6c6yxbwP/aBxz6Yl+KAt+REsf0kLcdqli88WKbVRX7eyJPWbDHevvzdooJp0vjhashLQ3NzNQGjD2kKc/a3P5wXK0LIVit9VsW0DCuV8AXYQnJaDPKQ90wnTo/zaMMH4emuN0oK9f3wnRe2TKgQ7qGiCEBPB8tzBzLYBHQSEpHCc97rDIBPzCZQEjpBD3Iq/tRCbrlg5g9F0h3JAT/cxAFxgs/A2Noh5qYxq4F7X5hxMlO1VEaJEv1HTsEKL83eGK9VahHLbQjBqwgTxAJH5nm8JHS1QQQD5oUigIhQuQGcqUxZkmIvx894MvSY2NjoGAKIsDG+EutIBkOKDvtkJd9++1zeq6Ld+7J8GIxuEfAzuWzaJIfMSv1Rs2v7Rqr73yEnRc1bJgTusl9sKSLdvQ0IjtRbmfXrpk+f5+0YkCke+BSGmkm5CA064LqesYf0c6pz897gjgT8K3AcM8fNfbDwXWHfVgIgnRkE+gi2rJMCkP9CGEn7ZQd/L2wx/83M6eO2XHzxxDJH+JzQU/BbojFQc8ChcraouVt925qgtirwBRUbA2EfSMTX0blirQr03MJFvcLYWB18RMtzVasdpAxk4em9SpqHfavVbnksVWTQYLv0GtJSJafmyX2uv1oW6RkgqKS9/qRhlslys1hrMmbesp5uxrX/8y2HjLvv+n30VeqA+UCNecudyl4z84swhLVOR1KmLyI1HFBiDNI3rcz0bFfcTfXwekuuNvDtinwjBuyS9E8Q+fnVJZRIVB5QGlwWXIIeC+XvR72748WLL/fu9B+6ejI/bl0X57YrJs07mqXUUfbfEgVUMa8R/7eEerSHOSK00yyoVI5y+ICdDLfsOY4XIklyVlmAE3N2s2MzNnp44dtzoViPjLcTvxwa8hTwaTt8isVAZ58KorGwf6GC5FIT89yUXq5sORM9NsFI7dh2MPARYQCwmOQDXBT+hgzTZg5fElKq5pC5COdiW/yKeQTQyWDTRuE4Ok7oOnwy+QcbeTdrAAaW1paSAWBJA3dQ1Q8fxluWFAs5pVTNH0IAn58tRSijiuNWsaG1weothsVu3YsaP2ycUrVpmY0MBWR7IYdGJE5C5Z2YOZxa27U3YQimaShxHiOkOlwb3/5bJN7t0robO6umYFWLhck+efk9cFrWqtZnjtt0O8twuI/l2IKR9gRF7viLtbnooSMQCZTPmG9PGWhxFTkeEnj+kBG8MlFNlvTrb/8Cd/ZqdPnbZhGAo0CItFWP4QtlISDMDg584jkYb5pRicoEESXN5zxe8DXIAwtwpxT0KFSiNYn8BsvgcGS79lK8OWKfOt4JwdGKnY8Oi43V9cQxxWlIj04MEsBpwvi/LhJFwvPJQFpMUrPoMRQGVB4cVr1cvjHTx00F548QW7f3/a3nrzPasMj4Es3u8iHQc1jSO6mnmiHPEbb+6AXYIeCcznAWR4Fzn0+RdBNd813XaMwomwjee+AAQuezgkt4OH/Z8yOLjk6X3gy5/+YimVRgWT/pI9MV6yb4yP2rcqA/a3yxV7uZS3v3X4gH0N16cHYLjuHZE8yGrXJ2VX4C/2MYtjufKynbu1NYZ/AaQwCPQk99IYlawGH8TZBunLlw57IVuGBgZlbGg3oviNFfN6qh+Yn/iIz+DAu2gHNwQVQB/mpXghbkSGu1Hsfh8HD6LquAM5AlOAiJ8JvJ/C6CWwIWoLB3Lelts5++X0is1jfBj82XbW6hjQHyzVbWsdA4ZYbVmLSoODCNN2Ko1O2HYoIqCC7lKphYKS8oIL6BLRO56CmssAQ/waFmYxWQoShgPj+iePlKAy6evFdBXCfmZ+1ekEorMTu+U7eqeybTlbWt+0jbUVe/G5Z6EYoSwwHbYeKCEojsl9e21pYQGTjz4pKikopNGSBPJjNsgNv1H4RQzACA/Aw+/HOzFY17vmQfAbXotUyfgRCQm4lYTzN9A9/mowMUzhjoxLxRH3nXO2Qebe3Gza5ctXMeM4jhhN0CprPJ6aAxydEoS7W5BxSSBd+u7AGuA+4iexWHnmgTz9VAK3RLl7K9szYJnSMPqoZOPo+mdG+mxh3Wy5gcFnsOAww+VJADkuSWFgqt9RE25FVftkfXkZskTxr6VODl4NYvrh4t7JUyft+RdesCtXr9n167cRMa8XHzX70jIe+Rr5RWUh/mIDApA/iPwLbgj268dAJXkA8UPURXAU5OF01czPwJhGfoKu48VfEUjfNOy8DjRWP3MMcyyD/t7PgY8wzjro79zAiD07Pmz/YKxkv1/ut1NbGdvb7NhItWpHYBh8PdtnX4YQPjNcskpv2Vqa6Ya8AeJwev0SEBpOlJD1fttJn8+DohvyoYESNxbwu+/aTYUwLq+zfD6bmIXiOHnypHiIz4wZzlmv1y/xyCj3zUNkY+SFfLjBRzs3CUwb4grYBrnhR3XysDTq/g5ETumQHaBg/jihxOhokCoX/PHaT1zkDKGOmcOSbdRr9ssbVfuXn67a95s5uwWN/j8stOz/fGvelnlS4WrdMhsNa9Uwu0CnZqtwOV3HlJ4zEs8LeW57nhHrGRDZdJvpSoFdQEbaQh79QwMI5vKBM5Z2uFBp0MLA9dbioj337FN25+Ztq0HAbaEuWiZgB/KBR1qQAJGTbUIhLvUP2jtXb9r+k2etPDFpub5h6x/da+PjE7bvwBG7N7dhPYP7rZHv13a+DNdO9b4AyE3BRqYHZ7qFyi7w+neXZ/CrJsa2RSTwRoCUd8eFg/puF0hngTiJwAnXEWhVuCfUCX/JXaYhXRiHgewiuJxl8YFuG/TnQ/DrN+7Y8krNXn39S7a6MA9a+Im4mvWFgc8zgCjs9REu4gNt3g4iywOAQNKTeUJ4tDGraVR6rNlftOYgZpTjFRsYL9v+YtMubqzYFOrQ2eIyEWai4DEuHVKwa4kIxHc6ME8g82Q/0S8XfIb7fG7W29uLwZnX51h54OAf/8kf2+zcrJQOT0zu8CgQLb1u+Rf2wF9ZjRdwLjGOJbrIM/Y7+VqoehA/B6hPAqbTypu6/pxAuie094riP3R8RIZHBKnE1im/upQIK4PPgvzj2EDSOEGOUyCfHRXyGEMYs0X0VxkII6/TW9TMns8TW5hZtHr7rVHusxbCWv1ZO9Rfsb+X67MRWjI5bo0HP6osGC3I6oWBkv3WcL+VhkoYo6x/qENA0l0QaYh+esBP94si0idkQvFcuvb+pwzF+CEPUq4i+OatWzY2Nq5nG6xVIjNUZ9bRq0Mk+EGHJB3GFDdWKAJXShKOQrkhsiD2n0OUBZ+FLP0RkC4AEBKqkWR2TodonUNIdLhuu1W1dnXZahtrNnNv2X58+Z5978aqvXGvbX9+ccreX+jY1iq05moNSqNmBkGdR/pcDVZfgwrHH0j69jY2KCDLjECq+A+pKFKA9PD7Xu0OBnEV+fT2YQZQ5MOuIKDIjERaJGTIYt7279tv9+9PGT9gopkEi6IlSGUhF8iOxB/fKudaeQdMen2pZhudgh07uM/K4/ussOcI8pq0dk+frZUmrF0ZQ/792lHVgcLgUph2d3AwSDCyG0l+ZwI9CNY12xLaRmCzyWi7AOuUALy7x9oddqZNAy8jCgLtlUZ9r0v5fZ+9908UhHwozmNT+LJSPl+0Dz+8CJ1ZsqdffcU2a5tofhaKg2vS7A+0lcqUigP0aVOpxtkZ6aABEjHSZjtqlsIRxr4nbbnFFlak9feZDcIdBR+MQYhMDFhPvmUzqAMnulZH3dsNCPdN8bHPBhHOfFk3WrCqI8qWC6uUfpTFpRF+VpgnlL740otWQnk/+OEPtTuK44OfauV4cNpASSB/fh5YS2DgqWhlOj3hdqmdgMbZ3zSQhKQhfoUiKX6idb8TReeAvJYh5H69yClaBdT9dBzknaDH97PKYMQByRM6Yh8uTxXgx9T43MjTA+nCes7l+YysA2/bSuiWfuQxAm0wUEKa/o6dKLbtGOjLdyy5nx/DFPEzWuPn9Rhky+FmwzLctol76lMSgm70i/T4UR+kXCJ5HNdfFPGDf/Ia+x2XGkMIS40ljiEuRy3AsF1dW/PTpBFOsouWdAl05Wfd4EUELTEjTNu6lS/L8jKd17wM3WMi+mPbPhMdSKHPBsXdmRAu/lVXDATuM+eykgYJHzzzAfHaquXWlq2xsmLr9abNo6jNpbb1zmasZ2HTcqsb1lnftA5feUdDshvrlqfCgLChhkyUBhrsjQLE4kUopxaJ5AOZCKVBgQNm24CFx4PzcuXe7nKIGC+H2z22VV23V7/0mq2urNns9KwVwJAqjjMMls1yOcilNDqYxkIQFBDG735gzlHr3WP3lmv2zN4BK03ss/WRg3bk0D5bzRRtqv+wrWd5vlEvmLQEpg3vCkBZcbajddkgGIlRELENao8Ii8uABFolXfJHj0M6HkHXSdzgfgak08vooScVmL4fIeYv5ge9XAgikH5a7nD5Vr1OHs4W7Sc/fcP2HzioJRweHcNlHQreRCCEvpHi0KzQ+8xnH1SooJOQ9PcaZXQcvyvdKOD1QLQMBc2XtvgFs6GKlUd7bS9mG/2Vki2iXlVa/jUIjSqyadat2dxAv4PnOIiQtSsg7xvVi9IH9fSX9ehSoaEYKI2vff3rtrGxYW+9/Sai5qy6WcUQ4DgAD8nwcIURt89q4AuRfUABXZafwi8Mqn9A0SpACHMeSyEFeEAKJB774kK+i1IIQvcn17wf/L5DMZVOfk8T40TkjJMKgzzAzQQ04rhczEMG6VcfMA/4ZeTlClbK9tgQZu7jvSXbB2PgCPr1HGaQL4/127cnRuzvTY7aP+pt2tPFum31NK0OpbKFLHhwJt8FI907YI8e5D3A51jwWwERWBbQjRSE85r+3bpAQhc32D9fEL1/4yV+BLyAo+y9DH4wqgcz5kuXL9meiQlMugriMYHqGCDkxRA+qCY9GcaZMEpSaCwnlunjFheSr4ryaAwe9GAakrvbQcH4ATqj08/CeAOFczkpoGYKmG20aquYcSxYY3HBOkvrmF3UbWN2yZpLCF9dM1tfh9JYN4wyK7Yx89hcs8yWW2dUGi649UAklBMxQtC6ALfUOcCBZF7MIKrckQWuGBwdBtMgUjh5VQhmLA+U7elnz9v773+MwQJhzgENIouIJGZQFm36Q9tNZyWj0EyP1XtH7D5mSYNDPZafLNjWaNMGDw3YejFjm4Oj1u4fgbU7AMmC2QaPiIfFra25fFseAtFfBgNCMHG5KnmQC3+cgeCCzQu/XffhgDqmQZepsJ3XuwDLUDmfHS0AYiIeaUR0JkRwCwMPpKT13gbj67gK0PPtt9+1w4eP2PDIEJqKOOgHLhOyzY7IT0Ima20KDioPIJUI36eJqGcXQsYHzcJzKj/3DAqjhzPMimXKoP9wxXqG83a22FCUC5aHkoCwWoexAsMBUwKMrmikoP5qd6gP80/qxuCMFfgNDvgPHTqkB97vf/CeffzJxxjgXI7isiricVmTtNCMoouy+IDaIZW6TvjrrwNYz22IH7aDwhquFKzoBj+FN5VgoLmEOQVO8KcxPseRH30nxZIog7Q/jSEvpKOCoLFGzOu5Fvkd91A/fmeGilbnvYGGfPlxdHjY9sO6PnH4sD116pS98OQT9tIzT9qLwOeffMqePHHWDk4etnLfmK0VKnatmbFfrjXsh1tD9utNGG4N8AdIyi/hQWVYi/VAWRlokVnceM8or1BnpPNdfM6PSX8TSLs0xH4S8hpRUhjDHgddhhLxT14h38glP5B/6DJKxhZ1bLtZH2bOnEVoR5TqFuuHm0KvB++Tnznb75YT8o1yOwmL/oCfBbwNzNnQgX/mITshRbBIvOCqukmYE5yuv/VLyxkdxilnucf62lt2cnKPjRbL9valG7bUgNW+vuyDFfjEcAHTy6y9/+kdCJq6NWpQKPwmMmcsuI775wNNHFBetJBAIlgMPBuf3++gRQ9LBRYld7+cPXXalldXbXEFRBcD88UrxMWgPnfuuE6t/dkPfm69lQFUxbdEqrPkkoheHAVTBhqfMxgr9Vu2b8La5UGrjPfbiZGWbQyXrFDp2DMjPXZ9s2F3Wj2YPUHQVfm1OygvKlROh9FJYpAUJHQUiLL6Y6z0HV2Lzn4tmjPmtvQhTjqlLvFDEzq55X6WoyvlGzBe656j4snLH3c9zO8TIQLl9TyJ5AuPS16kRcljn/nC30svv2iXLl007q6T1cOIscHMM3EfA9k3sMAyUMhUGBnM7jLoz8zgiOVHRq21r9f6xvL2arFlSyjrvSqsz+ktyy5uWHZ12Zo18uIGeI4CPwyikLdb1G4Nc/mEM4vq2pqdAl+dPXvWfv7zn+n73dwX35KRgfRx4HOWAb+2UYqXHBOLTw12QGnh50FgXzwO4sfrLMGnhI4S9h4u4yq42omTTkOE3w+WdH8apViASg+6kCaiDYS/6EM3+oFcVpILmcCZA9M1aUBgJtbmWMO9crms76HzoMvjJ07Y2XNPYFye04Pfo0eOwrreg0kjDC2Qah3jeGp6yu7cuWPXr9+0u3fu28zCis2u1Wy61rTpRtumMOZWi3yvIW+nywU7iBlnifXvQB6hWeSzDhTF2xiP319atHszVauub0GRoO8pb7Q07isdyQ7OyBNpRD78I6mkMBQSfx4PlIbZsWaicQwMyD4AsHiePsFnFENDQzYzO4Po/kzN6xIAeXAWwnj81vzw8KBNT01BCkIpQ545H0a5FtsU0qaBYWkUeF0i5DKDB/5ZrKdAnm0hDmyYXHrxwwyjP1jFbqX4/mlwjAR0tlWzQ5g2jsLK+9XHF2xRMxEoBVhm3Gr7xFjRBiDo3/n4FvJoWrPOARyURpOKgw0FpgFl+mAh83M9FMIcSqPNB2YgWA6M1mpU7eyZExjQTbs3NQ2lQgspC6JmrQKT88UXnrH33n3XlleqqDk6AYNcu7jYS5FRIqBdeQikTh6Wa2nEOv2jZqMD1r9/wPYeqNi3JgbsNwYKVilm7eNM0+70gD03Icg2W5bhzImKDwMmtoPlUcyS8UQ30TP2EsP8VzXoBnm84CcN4oX3gYP7u9fyxrDklvu9fLjKlzUKft1kHf3Pr7su/5K1bwHD9e9+IPtGygAu+YMk5VHVq5hdFosFO3HiiN26fUuChfcpVHxZKKAgXsObFmQxnIKM6aU00D88yqWEGUb/kOVHx6w9NmydfXnrG2jac4Ws3dys242NlrXmILRW1q2xyVOMqTSq4Df2vSju+ZMaGlxkae7EyoGXtuzFl162SRhBb7zxc30rhUsAjM+oXYWBMARogwizZN/iXvwsK7N3+qXwIZDu292gmw9+JGiAdIL17HQDfdkP8NN1JeH35Y/3aI1TMSgcLpWmXJ8V+EuMfp99pWUlIBUQ8+JLnHkqCcRhM2nx8tvng0OD+oLlsWPH7CSU7enz57VMyY0DVAw8aaEGg2JhYcFu3rxpFy9etA8+/MA+vfAxFMQNu3Nv2maXVq22xeeKXF8qWgsyo45+30J5CoP9Sz1Nw7An37Zcb972wJDow9CrbHHJNGP3oQj+slOzq7heXWnY/fsrls8UYMyg/yGTaLRisLqRxz6U8mD/ojFsEDtZsgFBBLrRD4+8IMWukMQDkFz6c797EAHkT1DAMD/DbQv0OXb8mN2+c1t9sE1pgM6iv+RbHvQs2uBAv81CwTQ19lhvtsfrr1TJjwp/fED0nA3uf8hMYyeECgJcQ8bi0PjAlL6PmrMNKA74uS8/n23ZoYP7bGhgADONK7bBtBh8WueFID0xPmB9sDje/fgaaNCG5beZmmmEWQYbnZRIArEslklmLkCYc1kCVqtmGiXLwtrMQuGcOXoEuqTHrt2agmAZhHXDh2tZOzhWtn37DsJSfMtK5X7wBQ+PQ1lkEDFFcOWH6ONA0DMJCCbMmCCFDNMUOz0xaP9kf8W+Nli2Z9FRe1GfNVikV7NtCCR+3zmLyRIUWxMMifrwQajOUmInE4IrytIvJkhTNgW4EJvFQKWNSMfvRSGTCJMkAcEDQ9TUNQO6bgwPkRx4n07i92v/YV+w5lGZgOsZAB7wEQA/aEPFzFOPF5bmIXjHbf+B/Xbv/pSUiRRMED7bkfnrJ7gxHPkyfwoMzjLR59xNk+ntMxsetczEsLUmeu3gnqIdKLatHyb0bbDWzCIEwXzd8itrsHqhMKqY2XLWGxUG+xwKQmVgEJYq6G94y71le+6557T18c0333SrGWm4H14zVM006PrzC531I7Z1HlK/Mk9v6Q5ge3ZgEh68gOhVTXmheIxDDNdSCCEMY0TKIFzvdLv3OZ7gSgFkpQgYpnOPEC0KKHh1j4KpjH7sq/RZpbcCATUg4c+HtQcOHLCDBw9KIXAGwbV4xmNefOF2ZZkfNJu1Gzdu2JXLV+zq1avwX7f79+7pM7f8xnWTu8xQnzyUCQ1AflyJxgWVbgtjk/UhabWLGT+Uhdw1VEKdK5AHe4t5Gyrl7dLaik2D71abMOZgT/4Q5f/J8pa9fXvFNjaydhr1XZ+9b2trS5ZLdm020GXoRxp5ErLwk+IkejQK1AEiTfR2PUkA7z4EUgnpsCvcYPIwv4cftJk3OVugsTEyOiL681QKKmqxrOIyLfoPY4IKu6+vT6dczMzMQKFiloV27NylJ6ATyxRsu3gofIbSiDUCxjlYAgynQ5fTIt505ovbW8mAfJW9A829Z++kDY2N2ZsfX7QaBxcsND04b9Rs/1CfDuZ656NPkB8YgAqDlp8UBjsOg5wswrISSRgUFAQGj4qg5dGG4KDL3VI8kr2COh2BRcijRG7cXbJmHpYnBH6h0LJnT4/ZFKyMhYW6mI9HUre0Hk3CphUG72KwoC08rJDb//QSX1/FOgNj9tVDe+3/NNljI52qlWCljGxltYRxA/7Zds7WW0hTK1kes60clAZ395Fi0dpMgIEEdjwdv/BfOanIKa/AI7grxkF2SRx6kguAX8dSpOijP7gC5pP4/ScW48BrBOiffioJ/DMMPCChJEXCcAomYFAebCq/LzK3MGfHTx63Qk/BlpYxCGBNNUlzxldmIS3TMbuk7wOKx9AffGDO5xhUGGUIp/5hy09OWGMIYftL9mRf1k7CKr271ba7qxlbm4PtNY/Z7PKSZapQGnVoEhoM3ADB/pa1jfxR52KZL2e2bXR02J559mm7feuWXb12TcLLlQbiEyVciFQYXcXhu1VQXf3AD1f9w6CdIAKnENfy0RtDdYFw0jPUMSqFRPDD1X5+jg/6EebnFtHPnUcQ+pg56W128DOFkHYFot7c0CJE/VlHzhJGR0Y1szoERXD08BF9Ve748eO4PmT79u61sdFRK2HMcafOxvqGzUHwc1mESmAKBsHU/fv6MuHM9IwtLi5IaayuYtYA657fL+EznbhO738AjA9tpMA90lh1A/qhjT57Y0xuVeWfVhCyHetF4n0w7M6ivmtry/aLVtXuQWHdW23YL7MN+9OZOXt7weweZprc2Vlaum9nDozZ8sq8VTfW1W98DuDfj4lyAIWFMnXNPgV4PfUbOlQ/DuynnZC6HUG1Z1T+pJNIPiAA/cV+ZFI3NjuYoR+3a1euYNxgtkW+Y0JlwvGGeKjjGGQtWYBKmBtJuCTuGzG69X8sYNb6kzfBx59peM3lZUL5o/BLGocLMicY0qe60IYQ/OMYdPsmxuydDz60OpcBNjFoOZOActjXl9c3LN57/32M1441daQDl69SM41YFvMPwiRLYnBgYGahT8sWYBHyQTOQSoMP24ZQ7sHJMbt6f842i4MQAj3Wk63bM+cO2vvv3UDWZR1E2GRZVFDRkhBx0Rpcoivww/bAVIFg4/HaXDPvDAzbCyf22u+PsU6MiHpBK8wjzpVa2zBvstV6w3JVTA/x11DenCYzOq0E7zzRTB7vHnWRet+DJSjo6hcgmserEDd46ddVvO2B7k38iBPzlAuEK/7fJTy6Sb0kxEMevIzh9MslxTwOrSc94GefxTA2DGHZAugE5n/19ddsbnHeNuswFKAEfHAwLgeBCz7NKBnGvCLimg/R+SxLs8sSZhpQGtnBYWuMD5mNoa8mM3Y207K96Lufcs17AX08A4tyccU6sC6ttmIZ9D8PXBSfgWfJuyR9AQJ1C4Lt8JHD9uqrr9g777xjd+/e0UBtVcGfrA/7Qg+9ia4olA/62hUGc4qYgoRWKdwJCCONifH5gysG0gHxgzKg6+G4Zv1p4ASXCoFLFnSpnHOYdZPr+D3qJoyzJo033KdlOrlnUs8Vzj1x3s4/+aQ9CTx35ixm5HttaHAIs4uCvv9x/959u3z5sn3y8cd29dJluw4leg8KYnFhQbMEfkyKh1fygTY/c0y3ReUAWnBhpPtMJwCbgp+EArhPvx7ggp7JtmTSFanEQbjWH2hChcdtugX0W2+uY89g5r8BPnhjrm7F2oIdGhyw2zNrVuz02NKtGatjhtlYnLN8Y9OWNlZsZmHWXnn6CZuFYpPi4Dil0kSdXWGgWLg+blVdhbHGvKW6yUNIPCFiGngvYLgnhz/oRgH8zJULu8oJfSO5whtwNzeqet6zurKql0bJIyyedWE2RCrZvfsmIUe3bGlxETMzpGecsNSWbLz4IkAehPM5lqfSwEJVWwGZVm9ba6AD0VhZmxjbHDxDg/126MCkvfvBR3rGgHkqBhsUAhTHnv4eKJRRe+fd90CjDPRE3TJaKoIg5xRRAzE20qvMcrQswSMAuCtJXwrkrhkoDVicekO7jFlFpWJnj+y1S1PztlYZs57GOq73W7EnZzdvLdtWnUtIfACO8nhAorZJBhSjAEEoCilfdqOS4mymV+9qHN43as+PYaqO6lDU1GHF3QAXf7i8bjeLYFKupTYKoAHq2QAjYMbBDotDJGlWBJZFh3/sIFwyiocG4EUSEDwhXRd4zf5JR45+z1sh8T5deWPNYpgCw3/Xn47vYUT2ibvKV+hCn6NC7eEfXLaJAr9QLNri0oKdf+oJnTBMgcYdbyJMUAxJnsxHeQdkn1CJo+9pOPBZhlX6LTc8aq2hovVMlm2or2GnOENsZu1dstzslmXmwVco06ormGWsQmHwZFn0CQcoAZKhjL7jwH3qySfs4IH99tOf/hQW9CxvehzWTXyCGodZBhWGI+quQRkwPUBDcm8T3YigC4W/2uZ+zhbSswRhHFepsPjwOc4aWBqXb5iPviIZnkOwDM4yhoaHbN/+fXby9Gk7C8VwCu5ezBj6w0eK+KlkKoYrVy7bRx99ZBcuXLArUBJcTuJsYR2KQ8uMUEDEHPqASyJsJ2cOfOgal+y0SwwuBVU8aSGij2tHP4Ie9ynYoBz8PR/Gd0wUB1rHOrrCgEtasF2oRwnGwb7hfjt57Ii9cfk6ZvowGCqwuiEDPplZtz2lPlu8ccdW11asgTa2YLhy3NfgX5md1ekOfNFzbRmCFjyR7GgiLdWn6FtcSibQhyBeJ6D6yeOoyLzGz7aIAdjPcoHKE165LAvtY36h39CBcnmuFJ9XcOnv+rWrCJaAZS4CPq/lGWeHDx2SAuQyVpvGKPMFPf1BeKTlbrBbRVPAZMAvqDR2AhkTDaBLYnAAiLmdCL2loh07ftA++OhjWG9gjCaFZ9OyrYaNVnrs8MH9Uho8zZEd5+uJRDIRG4msfVuHCOhvE0NMQ2n4shGERpxl8FOe3ObaD4sT9545PmlXFtdsvjxqgxtz9pXnnrL3Lt+25XW+Q4BseYwJFFSmTSXGMlFYZBI4aAnK4+BzxagZB9fgS2XLoe61cs4mi3kbzGfscr1tFzZqdg80uAXBswJl0W5BADXLUCpQNkbrgPMOOOpMIMriH4pxIIMgnEKL/KIbYpzgZVACIVDe1M3ETd1P4qJMzzi4wCR/ttZdDkqF6z7/dUd+j08P6hr6vXvN/L2fHHkPdIPLN4P92xp+zbR8CNnb22NPnDunlyy5P1rbaVkBKgUOHGIowxWG582+10yT/V6G0kCf29CQtYdzmL3m7alc3fp6em22nrE7ixBqszXLLKEPNjDLqK+hv+EHEyh39AMfdlNQFwtZexYKg7uzf/WrX8Kq2xALarCRHzEAxSNBYfD4FCEHJ+PhN3l2xQC1lX5vd6IcgFQKPpPYriSSWQOvSS9URve0tOSKgvfiWjh5iPnxXYf+/j4bGBiw0bExKYjDEDInMIuYnJzEPYwNAJeI+KlZPni+ihnfTSiF27fvaGlpZXXF6nXMyDgGVK8uqt8AegeHMxZhXNYJSgHXOhIj0Ac33U+67UQOQuSh7fUSaql79IOmHAt0WbTGCgF1cZpCmIJfjg5X7KXz5+y7716zeVjZ7caivTRegWHYtPcWa3a0Ural2zdtoYaZDw9MrTesUFvXi8UbG1s2P3XfThw6YMOVks3Pzav/qPTYWsoBtsP9rATqIkRAqM52CDfoMJH/OCBdGjwfICLzBXbel1LVTaRTO8mhnP32aJZx4tRJm4ERs8X3jRCHWbIERmvD6D5+9KitLC9BQcIoYr6sCOirmTAVsCoGTOqSqt9jQM4G9n1hpSEGEuKCNQaD+TWZ311aIXwb8/TZY/bRhU8xfQVzkCFIKDRiEJ107MhRe+u9DzEQeBoon3VAeJORxDjphnkZWprSA9B8UBo+09B2SwiQPARIDlPqDAb/i8dG7NZmA5ZHxV7ZW7E9lV775cVp8IwzeguDw5emgNx6l9LGYgo2g4KRyMGuGQcUVqlka52cXbeKrbY27VKmaf/Plbb9CHWfyzXsud6MTWysgmlr1kAeDS17EMkeGFhkDvlxU50Hl7xB+unK/8KFwulISAhCmnScxJ92gz+JSwHlYe4C4XaToE680K14n//0hzAF6ye47vVrCpbIB+7yWu2kX4KRtPS2kE/mMEgn9+2DgNsPK3dKgwN2kVuSEJjq9pAv0xLZJ1ziksIg9g5gljFsLcxqbbxj4/0dewGj8F6+ZBeqHVvHLKO9hOnGGpRFdRV9vQ4e4wyT1WY94IWhMtTfa19+/XWbX1ywC59esvoWhKE3DoDIcaAFpcFjU/T6DsNDXhL0RPilROVnO+CHsFf94ZKPxFdwxWPirXDNeFAOVBARlQZ5csdWo16HfUNFB4MFipKfIeaOpFMnT+odkrHxMdCxoA9jTU9PaxnpFhTE9NS0dilx6WJ9bR386d8mR8YommPV6yoexTgg+ns2nDlwJtGA/OExMX7Px4qPl22uwsNYSuJ8BibxmD4irklDZwBH8gQJTZcI43MMRsczmCn84oMPbaa6YVtUUNWGPXnikF27c8/ur9Ts0ECfzU7ds0WecVeD0UqBi5k/d0yyLXxHhM8AxkfH7DiUx+3rV2S8sB4uzF1mCeQGfwRebtMiKb+qHK63pfVr/TFc99KAdrPP1WZkAz7ikmkFMoxLinMzMwpjNozBvuNKzcmTJ3SUDT/7yq3gqpZkKWduoawI9Cb1fjzMZTDTYIGfF7eBOpSuMzVHIBujfkWjGxicTz59xj6+cMlnGuoAdCygr9QjK+jt9z5QGn3FjDMMIeMhkpBlxLwhfElMKgwqjp6itlvyIXiHFmd50DL8YldPzp47NGxLENa3MAv4zvkTdvf6Xft0geN9S9/+5vlDnNlopqFvG4S6oUwX6T7oOdB1hQHNde+ecq/V2jlbKfDlwU2rD/Tan6/mbQaWzMr6qk0sr9vJ4XEroIMaDf9CXD074DSKjC+gH8CODAMjCnVdqxYhbgzfBjFu8tONF9I7RH83/0RpCBhOBz+JK0/4px8uaBHDunE8iD/KU2FBaErYhzBgYj2DnjrjCTGpJK5dv2lnMdsY6ivZImaGmVzJmuxzFgeScfC4YKVLoQoBy/6HwmjDWOAMIzOCmcZgxbKjLZssNe3ZbI99WO/YtVUYIrPo2yUoik0qDSB36ZHHVFdkw8+/Tozat7/5Dfv1r35lV6/dwAS2jL6D0mAl+UOWpV8uPEBPDWA+GLT6TogYnwOe7QRNtETkdSffaqYMV/fhkiZ8D8QVhT+kzmpmkbEG6rgFQUAlwXVqKtqR0VF75tln7amnn9KOLo4fvvPA5Qg+J3r3nXfs2uXLdvfuXVtaWoJi4KyB9SV7w1CCdc9606Bjv2oZCTzfVQwQpBSmEqi+XNRVEN5uYbymobVN8KfikVi7hUW/runScXpGy1uA9ornSF/WN/QX6cr6l6BMX3rynN2CMry3iLZqmblpZRiSZ4/ut09BhzUokKOjw7YwO2OrfGZKxaFVBT7P8k0wNCAboPPUvXu2Z2zEnnnyvF25fl3yVByP+ruwTQlduaQg/fwBbLvw+IoXMV4ToitAQm+aA25ptSbVbvZFCQpjGX16Cophbn4WogvtBTApo1NpnDlz2u7dv6f3orikJZqR12nobCuTsPP60fCQmQarsB1CXz0IusEWwlHnegdz4Pg3B3K2WduwZ194yj79BJYbOpBTJSkOQKlUsFOnTtm7sBLILHyDmLMMPYiixZA0EgWwLOVPwQtXlpkvUfC7z51+KI7+QWsPHbBm/4CVIEBOjg9Ytpy3CtxDfaP28bV5m7I+MMu6ZRp8JwREhfWk03W1JIZyA3Ejw6h0tk9lQygAW3JRPvBAtmZP7T9kn3yKae0arM9q3q6vj9r8QsuegsB4AvXoQZ7Xc0NQcn1IQwu5CAfpacYwb/5waQwFeTEqEIh6qHD4WKEYTBA9AiaBgBB/e3j0I/9w392UX5dpV57wTz+D3OUlBVhMF+/rQgFAMbvTDNzgfoZBgBJ9RoM7+YKVKxN27+49e+rUJCwkdkvZtjLoU7aZx7dAkFqOx7BQuBYgZPleBowFPstAX3fG0O8j/ZYfLFt/f932l/I20Sra1fWmzaFPCgtbll/fsBwUhnbooZ/RNQJaaJN799gTZ8/aG2+8YXOwxFEp22pSqaXaI7+3J7aP23M7UDidHvBD9NMlSjG4gtPzl4iYAWiZiS7KZrZopfqcW8K5TJbPZ6ynJ2/jEGBcwz6Nup154gk7fuwY9OOghAWXl/jM4d2337GLH39sU9Mz+j60755yerMFVBKMr9N2IcBpbWqWjWvN7GmBiu9BZy3PhnHHcSCFAHcb8j7HJ9NERNhO5RDzS4cpPIUc49Gv+yAE4ws4FjjWu7NOtonKlM+dqBxOHjuOIT9kly5dlpLjclO+WbcjE8M2MTJkFy98jLCmHRwbtfXVNVtc5ns5GOdaBsdMgzMOpGMbfCNDG8r2ng3A6HzqyadsHtY8VwtYvCsyYgDSWUFe78Ad4FneTMUjME4axE90lUFAQvCzvBCHrhB9SgODRsDkxARmiquuGJB33IHGDTanYERcv3Eds2QaC15EfLGv+3wowM56PQZ8juWp0Mg0MEioFqpz44BiI6PSaKyv2dMvPW2XLl6F0qDlRqXhjEEL7+zZM/YuZhoM43SRD21iR3Zp73mLiag0qDAwADO5IgQIv5jXb53eQUxdRmB1TpiN4v5kzl6c7LXBQgvTuYJdgJK4srFl2c1ezExhbXLXFKfnfMai3VqhXqwa3LjkwCZ6+6govPPQOCgrLje1baSxYsfAlJeuztoWpsKdzYbV1jetAXd5acvqnbwdPDhsw1AundaWtQoVa+X5aVi+NMYdLWxbQPjRStHPGSpAjCJv8KQDE3+8ZhA9yUWCaWZM7od0LsjjtTzhn34GuRvvez2792O4owuveE0BHBWGaEl+0UAoQLa4pb1RrdupJ2EpLU7ZpjY6ME/QgVurdQQLjAT5oTBoKBQr6HcoDsz0bACKZLBgx4sN21Ms2CyE/v3VltWgNGwFgmKTy1Jrlm20DJyDgdSxUrGj0wG4/s8dfCtrmI2Av/hOTzw4Ue2QoRJQxkrgPwh/fcmPSk0KAa6OrHGUwkBeemsd7ePDf747xCy5bZcfaipA4QwOVWx8Ysj279sDJXHADh8+aPv27tMBiHy+MD8/r5kDH0jf4Atvt29rmYkvfdHi5mwNWYJtu0KB/MvnLC6Qw3IShLgUB8ZYoigUDi5kuK67aZQXwzQWgp/3ZNDFuHClbGKc6A/3Y1oOpnhNfwwnMpx1FvqffJAhycwNSKWhB++If/DAATt//rz98te/thoUAXOgguTRIQf3TtoajITp6VlUo2UHx/dAR9Rtmhsa2G6Me754y1UNbWBAGpUIP2lw985dKNqGnTl9WktXfJZQLmP2i7SI4XIA8SOQ9pIXEeJNSWx6ghsxXqeSbAPk5UMIP4wqf5cGI8ODmH3WdHw6i+U4ZNQSeOvwoYN24+ZNGD2Un6gn85JyRp/D350pJT8PARYavCnIWf8XfKaRZMaMecGaU6h7QXS5JssXgRqri/bkK89iynzD6hCkUhpUCEjHJ/5PPHHO3seAZeeqQym82eCoNKS6lSn+MRjDAJbwyEJp9FQgwPv1Sc92HxTHcJ+VDpft3MkB+/beATtWKdhEuWCflto23YI2nu/YFrfX0crALMi2YNry3RAyOYkr64hamQ+RvApqL+pLwad6oN60eNpoS7m6ZGcOHrCbt2ZtY3nd2tUty9VXrQZ3qTVgi1CUKxj0z4+1bGJw0LbaectWKtbM9VobQpBMKuGL/PTHsr0kIX8SYU0yq0YMdMch8XS9SpNcJBjzcjfcpz943bM9nPXyy3APrs+GHJL6KX5EUI8uGN3pRmS/UXFQGFAJk44QtuAT2Ii2voXWFer2wutP28Wbd9GvuMc+p/bIRKWBmSWfY0BhZPmiZS+Mhj4o3yHEHczYs8WsDZeK9usqBtUa1Dpf6NuEVY1ZRqa5YXnyE6zU/t6SvfLyU7a0NG8XL13zk/DR40RXGMCgKPxZFpWY1zVxOZCj0tAzFtSRLoQ4l01zBSoJutzdhLwxy+bXJPldkQMH9sFgOm2nTx+HkthnfZWSbW6s2dT9e3bzxk29Dc3NAbMzs7a0vAR+qml2wL7gQ2kdg01WBc/6biMqg4i8pmKAkSaeptCgwkACxHP+RhNxLX5TOP2M10UJG6Ulcmx27yWKgn44+hHvIt+AyURa96IfwPhEAtLwjtrFX7YLKMEMmkkaks6UKQjjchrfD3nt9dd0svAGZlcNtFffkehgpoY4J44ewezjmm8vBh4YG5f9cW/qnurEZamcFEZTY1jtQNtEQ2HHNqF01lZX7Jmnn5aCn8MY5tlZuKuGdGvNNsCv8RsuCLGxMv5C2DZAmNqOKGyrvJQ5SMi0DEO7NbaCny6THIK8WV5atE0YWewGbTBBWj7v2De5BzONGwjnDAS8DFnKmYbaxcShTC8/eHeDWP8dkMtgpqH6fU4U6CJcBVeNB/G8w6E0MIAay4t25pVn7NaNu5DRENShYyiRs6AU94R/dOEja2nKiAYSwQSyAJJWIX8SRoMYCTWIaalzx1SftXg4YC+P+CjayDPD9t8+dcT+29E++3IpZ+cwQM+jHi9VyrZnoN9+2lm3xvyG5ZbBOFAamUZVb2zrGxosTsrKB5MTOdQAxaqdQLaPh+6hombVZXviHKzjmWlbmJ9DcjAjl0BgoWTr62BQs+VmyT6q9tvh/l77ymTW2ghv9FdsvoB6t6BEOjl0BgoKeYMzHZysXUiufXBGuQ1q4zdW1B3vk+QiQTEhfen79Aev+x2dYfnvN5M0ChdBhNvDI1Ip4B77S/fYf7C8hTncQziQM40mwnjCbRazt8XFFRvpG7JnTxyw27fuWLtnEBOLCujKvvczpvgsowDM9vdZZ6BsTUw0bAj3hzr2AhQySfkrCJPmGuqw2rbWFgQrLEvWhM+ZKoWmffWlU3b50i27fHXaCuWhcJIIy4DQ5xJiUGZSEEQpBG655sYLKIUylEEvLHwoH0xZcK/s2NOn+uZQTxkW7S0InU3r6++xo8f22wsvPG1PP3Pe9kyM62H0pYuX7b13P7IbF6/Z7ByVA18cBL2g3PQ2NkAiAX49gMbYkJLAONFzCPqFLuw4tsi7ZAc3QER90SRRDoyHNIngp59jUkphR5jy2omqlkPwk0dYjq6JSKryGJ8AR4IxXCbA++QT8UrkE7gUmFQaaX5C3BLo/9JLL9mHH32kr9t5ldAeZJVBv/VirB+FQn7/g48xU+vVOynjIyPwF+36xU8hMwp6dkqlwTZKkYKWicJVhj4A+RIix/RXv/pV1YHPCrhEpLtqrH5UdwfWgqFO93D7wTYHID00OuAyahKd16IH248A0QQIl8+cjp84LmNiE7NQVt/Lb9no8JANwzC9efOWuo6GBTd48ORpPq9Su5i5WgBXfmYA5wEI93aglAZ8nxtURlIQPJFodNlQdDpnGnxzcWtxzk6+9CymfNO2uVZHJDI3lAIYAsMCmvwp+/jjC+hcLhHRuvFBoHU4zTIIJB4JR2GDga3BjEHMB+Bc1y4NWHtwwCZOTdo/evGA/f29JXsKdCmCkCVQD5MM24PSKqWMraDchalNW53D1A4Kg++L8ANQ2rMvonIwReIC1YNBgQDYQawW9VcG+Teqq/bkU+dsfn5aWxY5aNt8XgLMNjYhsBqwYjNWa2VtdXEVgz1new/10xi1rQ6UC8/eaUN48txm0o//odlinBCmusDD4eH3yZg+G4oQhm3IICKhe+0MBl9wu4BrRaHrGMuO+XoavycU0B9dovdV9JPRdU3RlyzzsC8hBJCGVnxHy0EYjJydlnvtLhTw5PiQ1pY3MDttgjYtfsyKQpuEo+AuwurrLwMh0KE0+gZ6bBQzyhNIP7++addgg3TWM5j1QUljGlFub9pAe832D1fsKSj5K1du2PX7y1YcHEc/UMHxgTSUABF8leOLnDxhgEdZlDGrCajzrXoxs4Wx0uFD+BCXB8WVCjkrw5TtzWdsuFK0/eOjenfg/Fl/UY7HafBN6QsffmwfvP+h3YFSrNe2rBhmJLS1ucTClwjFRxgHrhTo97Ao3MiXminA6xa986gUBiUG49LCVLooFKkIAn9rfAU+j2min4j8HgrxthA/+Fe5AAlAoq4cInvsCoGnyFvkFVccQPIIZ6UYrzQ++IVNLg+de+IJzR6uXL0qy1/vfiE6i+esdQSG4UBvGbO1O2CTkp5hjUCY8rgTHlvCHWctvkNFpSG6BHqIJgHZIOWXleL49NOL2uo6ODhki0tL0LWMExoUHAEarubQ646A/rRiSONDAXQgPWR4wfVdhz7TOnr0qHYdViFb+BxDNENb9oPHejCG7ty5q66h0uBz4ix5gQSKbSME57EhNCxn/XsfojS2NycSYhvEsORmcNHRUWnwhMatxQU7DqUxPTVvG6sQ0uByvqovSx1C97lnn7GLn3I7Lu6pAx1dgDNDxgNS8GjZAG6w/rj1lVtts7REB/J27Plj9n85MmhnihA+SIL5g4jNIweyyHYQ+RxE+stLHbt6bwlSu2adOoi6BQbicw09oCdxgVGBRK0cqxH8bHYGbWnW1u2pZ8/b8sKU1kLRxUi+Zu0tLlWtQRlBekE55RprttIp2612PxixZYd4Mu7gmk2jTcsZCMFOr9KKnJACtFIpDFQPFkiQExWF00fxGY9A/7b+2Oln/h6WRAtARcjyBbwJfLTSCPUlyNNVEHTdUoqI++gLKn4pDOXBOFAWHBB8FoBZYasILORtbmXZjh85ZgXwwkq1BQN+ELOOgrZZd6gwoCDaFfhhwZf6snYEluRzuYo1MPu7h2n7UhUDuEaFgepAyIy0V+2F/RU7up/Pn27bvWWU0zdgNdSF5TPfLBRAD4R3HkogByu13dtrHcxcslASmQqwFzOIMhVGv2YUbcx8srmS9SLunqE+OzY5bGcOQlHsHbW9g73Gr9Mvzy/JYLpx7SZmTvcw2JetXm9iQIMvMQSpFHj2WZMCAH4dmQEBFpWFeJGDnYM+LJ2KJcWj4R6FghD8KmRYdIkhrhBpE+he0ICjYIugWQqutyGycj9+iEzPayVwRoj89QA8JNjZiXwEXpALJN9QYUCG0M9nQdzJdujwYTt65Ii99/57Kpe7y9g05Q2XNN07PgGlsGUrq2saJxSaPMBvYmwMM8uLyBb9jnRZ0Jc08pcKkTjSSjQh4hfXLL+N+9PTM7Z3/34dHHjn7p0QIwVJ+0A3/DoZUjRk2A78TKDSIB2YEZDPiOlyqZNK487de1KYqiPC2Y5joA132vHoFtET2bQRh1+LpLLxPgPISft3gx01ZDzgLkrjkU3pggrzBjmGBlJpwO9HMsByatTsyBNnbHlpTZgBBfkAmWu81PLPP/ccpugXrb4JAc7OS2l9kM3LUf6eryzVsGxQKJQxyCtgqn5rTA7Z+RdP23+9N2MDSATyqjV5pYFPndCxQrZuP6gX7NMb02awSHPVTS1R6TTa1EDjTMcfkDEvVgLh7H26bGq2bXkovtbmmp05f17HJ1zjm5pQhO0G4vEFDUR13YMwbvdDHK5L17aytlIrWCM/bK/v67FjMKJnV9tWL2NwoJ5FKjnQQlNK0pINQR24m4j0C8RX+yKmfaJT9CcuAemSYB+gTls6wfWfVBhDGBCu/YYj7+gWr0kUlBDu+Xo0wxjHlUN02ZdRadAQ0J549i+NAn5Ojc97cn3ggy17+uxhW4HgbWG2VueXECsQ1JVeCAgokD7EhbHQrGRsH5TNWfDEr9sNu0JaYbA02jAooKCfza3ac0cPW7VTsnevz9ui9dkayqjzsEt+7wRCv1MpwfCA8YHpfZMKqm/EWkPj1h4atfYwr3utp1yyESiXPQVYdaUtOz9ZtpdP7rUnj+yB0kB8zIgu3luwS7em7eqdGcyYlmxhbcNWwWN6N0jCCXUDD3AGyu2e/tyBgot8xxm2854bT/ATGbbNJZ8ijeJA8DEt/cw/LdCBUWD5j4PCyNtyGYd+XCTX8Ajobkf+CWJ+dIM/8hDR48U0DPJ7vJ2G9JJUXJbi866oMHhIIWccwyPD9rWvf81+9KMf68gSvnnOrcJeGy8hl8nbqePH7f79O7aGOKILaNUHftm7d9I+vXgJsz2MUFrfTCvag24apMhDCL+yZP6oO5BLUiyPGxKGhobtxRdexCzxFrJuafaIyJ4GoHYCtBoRr5Qv/7vxPhNIR9HDxw/pwzrQZX0OQnnevXfPt4Sjz1UG6ncMs1ruqpqdnVNfMFzL5aQVaRHqITcNu1VLmT4IUBqTKaXBWA+J+TBQg4ixccHPTodg52yDU7mx/ZPonAyIvogo3hE89qBVrdrzL76oEy83NtbBrMiTCoOIRqrZaiDz93yj0qBlyBNS8zyornfI6vtG7fSTh+0fDDf1/jU4T5aGgFkw8xy7rWF/tpa1T27MGUxYK9SpNDYh6CHUNWjRCRyQGphUHOwU1AdmFuvuTfQO5eF73Bt99OQJjNk2lMYV42cl+a6gPkRE/mM7QANNh7VLq2Fb7SzfP7L1esby6wt2eM+wlSG06vwwFWrd4JvRrDM7Gx4yIBvhf6SLgwtxB3nx4ywEVEXj/egCFE6nG5b2O/A6hjGyux6P1wEVxnvsH5StYAoAziQ8jNeuPIBQJK40eJ80hJII/UkjgB/E4s6oDHeXFXptq4nZJ+aLX3n+eZvGQKhhVlkvggbA9hCE+FiPPrKUGSzY/p68HUa+7/ZwCTJvBSjtMSia/RA6rx3fZ/PrVbswt2br5SGrYqbQ6i1j9kAlBI09DAU11g8XymO4YsXxARvZM2SjI71WKXest7djE315Ozjcb0dHxzBb2WPH+PAaeSwtL9ulS1chkK7Z7fuztlRr6EQafZgJyF04fMdC7wNwDRqzCj6I1TZvCf7AaxReiJ+EhcEu/uE9KQUiw5wv5Sd/ikdpornrRo6HO/OHOAHFXBHFpAyHw7hy0UVE8nvwK1yeAGm/ABGSiCGTh0DCb3TEB85bUho0JtF/MipwzQ9fUWB+/Rtft7fefttmYEUzTQLRiyL5LY1jx47arVs39e0WBYJGnLUfRfgnn36K6OAf0J508KUpIONJWdANCL+yjvmjTH4K+t7NGzKIX3j2WR2twhckWT/U3uvF+HSZBYBN8jz9+rEA6aOMYS2Yvy9Pwb4pl21ycq/du3dfy3TMW+RA/U+dOG5zs7N6Z0c0RtvVxsAniRvh89QpgNqTxi8MsXBZOjE3VhINwlR/A1NFDjA++OY9/wNwECGODp9jn6VBeYaMY0OVHGkDtqAEWoWMNXtAUGSwWq3ZCgQujwT2yMwURAsSnFebfMi4xXuIw50uKFtv6apTnApJ/VRfEhoDFwR3iwx5sbJwtRyANMtLy+B1CEUoDq0dQxF1+BIZXybbXLUOPzy1vmS2MW/Z9fvWWbpqjaVLtjp70X4wW7B/d2HRJrbu2t/ZW7Zv8AW14XFrDO2xnqFJy/aPWJsP+yEwdTQ71761Qwc042wuLNVJ+KIufmKoKp/CNKBN/BfBiRg8oC/xC0NSRPSAFvCjNnKJrviiOIOPioP34Ko/FY/9FuOCXLmKfbq4ZVP3btrTZw7aAJSDjUHBHIGgP5231qGsDezJ2eBgx/L9WZvNNq0NFGfnBu2lYt3+4eGi3cCM8j1o6amBAVvs77FNzk5GCtaZQD77KmYHoTQOj5id2mt2dtRKp0s2caxmTx5ctN86umb/6MCG/Z2Jmr3St2mDhQ27tbRk/+Gje/Y/vr9gf3GtaR+t99tCpmybEEZNngSwtmxNvjxa5zfzwQvcrbeBWTZP1d3i9/BhoDRgQAgxw8U4gPTxa26ikJ/LmlvaGgrNA5cIRRKVjBSH82TkTwmFgH4NSu+G7OuQLiKNEXhAfiBc/QW+cN6I7mPCzripS+UT73PMEdlnNCwoKDGD59EpnK2Sn/kS47Vr1+3WlSta8mZeSb2EzKhjPRgTfGudn0qV0Ax1Xl8H7ZE/hT0tb80yOH45likfSE/6ZSwGhLD15T7SES6vgcVyr3360Yc6tJGrJJN79uA27rMJwSiSLKEhxFl0WCGJPP1YgPbEEZFGhpcw/rWMSV5gu9G+OFPsgVzgd140ythG1p1eIf1K4Kjrz8AYbwfmMn2p5SkRWVV7fEAaNS2mpYtOp4bUm7DQkPki96nnpB1v3bqD2xQkjAYrnVvaXn3Nrl+/ZmvUjswjNdNIKK180QlkKnQG973znP12uajDAzsVCNbBPliGFXthrGjjPQUrRuEesiDBlmDJ/ngrYz+6sWG3b6+Y1erWwSAmtsMsIDII3WRAkmDsIeWFHy69oG1icNznUQ58U/fypUtg8pwsSuWhFwbJgEAwsluV7GQgOx4mabPhh70tbKAumDnt3TtshyoNzDrmbZMWBtrK7XNiAA7s2J7goeD1AdIVzH6Lroc/gHSSa/wqXnSBdLeh7u5+X9euHDSdDrMOzTAkBJxOGkgaUGF2ATr529FAKj1uaSVNoxLkMwbwDd/MvlNdtRKs/lN7eu3YSI+9NFiy/0WlYn+n2GPfhnD5BvI5jXy2IIyvgMYDIMRvgoey4I9Pmm27jgG2Xs5ZowKDooJ+7APVBniAX8HGh3K2fzBrx/vNzvS27BxmFkeKGRtA3lwOm+mU7Ua9aFdXs3Z9oWX3Z2o2M7cKQ2jDOjAKOtVlKIYFa24uaVtvls/mhJi9xu/DQPBT2PtLpJEfAgZec56nny75DiTy0Q7KwiXyWj0ergPy2o2AVHiI+3AMwC5MXz8S2N/B+wDEG8hv1yx3pCX/iDfIJ/Cz/4HJzkvM0E6fPq3j1z/88AMpDH1WN+TNrNJ45NBh/JpO3o083cm0wRcNfRWQW1G54SZZ4xfNWVfSm24KA0gwExiMPz54Zj1WVvyY9+cxCyav86RcvrfDWY3aRQgO0zFP9WcadlzG+PRIhmqcQHGCv33WYeDZYesfGNR2bK8qBTnJl7Ezp8/YjevXwXKQJQjXMzG6bF/wOzBh8D4moEaqHkf4XwmiHJVLicWKqGKsqFeWuxVmZ+a0k4Fr9FQWJCL/uMbPzlMHJw3aDViKA+MK0TnacZPrsSZ3UnWghNaq9vHKhk3DYq3xPQ4IHVaOjFNFPfh9wD/b6NitlZpluesKzNmGgGoCdVCe6sFCVBSgWycxT9I2dkDQ5Ii8hpkU10oJtGRcCMASoLWoZxkQHrUNzDogaMBsneUF4KK1YbHm5u5afW7GrkEgvXV3zt65dsn2F+r21SeOWF8RDFHMWhFKKTs07N8c54wDMw99Q6IHMw/WXTOOKHyd0boCnt2cNMhhh9kTSS/L7XMB8wn5sxweLMlyhdHP/vZ4fM4klwpD93dD/KvucDEr3GplbGWwH7OIuj0znLG/O9Fn/81Qn/1v0bf/G7T1v0a//VMYA78HQ+ElzNLOo1+e7y3asVLL7mKgvJcv2RKffUBZ9PVBoQy0bXgIEwzgJPyTCDvY17bjlbadLDbtULthlY0t21hq2vX5tr0z07Y3p83ev9+0T6bqdnumahvLMDRWMXNcnjJbvGO2ct9snafnrlprY8Xa60DMLGwTMwzNLrozB0cIPmFKeQTF4dtU0fbAa64QGEYMfEc3Khdgd706hczkkbgddmaxEz3JjsAd6IouZIZqxQmMg8fRtXcxO5sSD10PPpExBv4AUj709Q/Y0WPHtLuSm0J0VhZoJHqATnoGqvwc+Y0PHrPBJUHKFcobblvWcSG4LpdgZJLOkYYJHZlf9AfFTWUupU708Uzk8yge7UJYWlq273//+3pB+cVXXtUSJJeSKPPoUp601T4qAPJ2bHQX2M74x/+doLGgdJ6WH8DiponYbAFczjJ46GudR/cTSB+2PUZMI5rX9bPPkPsjMMZHK/4qQOENh4XqWjXBf+hUIDuOSqIJy5vH+rITIt0UJ3SuAul+FjAdUZqcSXKW65TgheC0ko1ki5Zf27D7sOz+v9Mz9q+Q3WXL233kPQOh8lMIyv9+qWr/03rd7sOq5Xk9sngpZClwafEiLqsSFZOaw/aEPwUQA8PpuBMAH8z5cdZglKjRxXxkPAoHCo2gPPhJWwoVKo2VRcutzFhm4bbZ/HU9aLu02Lb/+cKyzc5u2D9+6rgdhzWcK2C6DcGZGxr1t9653bMMLEFxcMmKR8RTYUCQ6kP5wdqJwtdpF/wiXvD+VUCKxzFygEMMowNXl+4KGS7ABesUUXUmS4a0cEndZgFhI3nrG4JS6Omx34eyfx2sW+jtWAvY4dn0pYwdgGHwt0H//258zF5Cl/5zzBzfhiKpgx7FPO6XzJ6HIvlN2BJ/t5Cz30PcV4GHCkVbhnL64WbL/uVqx/7lYt7+eLbH3rqdsfvX6ta4tmqZG/OWhULPTUN7zN+1xtwtKPpbtrU4A0MFRgAQTGBZfueAxoEUBfo7KgnMNHwXXVQYVBTgEwkrUA9ePUvDpWahCud98FgUcvTjno8tEeivBDGvNHrGn43oJeFuIOGScrvpuo4DLsK18uIP+1+86wYP5cbv/53fh8L42DY2NiD0fSOB6qm6BqA31L9/oN+WeVQI/Np9pnDcZzqMy3IBFjvvkba84Tcd5QemaC/6Mx8qi6A0hOhDbnxhnRqQaf/+3/5bfe/8Kb4IiL5l/fnMVs86pDy4ZA5FyDZ+BqCWweeQ1B/AIcJrytEmldkOoFHOSHUoVoz8QJZufwkRmPSNIgSvynk4pgGtQEBEEgv/2wp5BCZtZLqAhHiPjC4/iMUP21CIsvF+Ew46gGfwK4jl7wRlStcvnbGI1Ny4ppzPI06+YWO2bM+dOGJvz/TYn92o27++vmb/fKpl/1dYi//d8rq9C+twpc4dNQ1rFnO2xT25ECpa9uIxFmTYWJiq4vVhB4g+qnMX44tUqIkrDbjU9LL6hBjsZDCuScMy0To2BEmGwoSChdtxVxesuYJZB5SHLc1aZ3He1uZmbW5l1d68fN3euXHPzh8+bF86fsAO91T1FnOmDyZypV/fDPEtx32acWT48hkUB593+KzJZxzb20Q/IDRnO3n5G+M/CmKcHXF5yQ5muRwkwXXUTXe3xUM9UV/FTwkOV+hw0VeVnqy90F+2c+WCDWUxW81sKRmGNND/MNeyoXzWjqNfT0PIPglanG817FmonvMwEg7ky+juiq0UynYn22Ofoms+XtmyS5g53J1uarLQvNmxxsV1q11ctI2rs1a9OWWN2/fM7t61ztQ968xOWX1hyraW56wDxZ/ZWLbMOhAzCiJnkhl+UEoKI84uoCQgYFxRkCfIG1QQjj7uqBScn8Q/Mko8POG5B4Bhn40yeB6C3XhfDNSFO1D5hSz9OsDD6g8e8Ifg5BX6ubkkZ73g7a9+5Sv25q/ftJvXb6C/Oa4QX7RhGUT4McYk2JDbMGbjjMPnF+ItxYeXTYWM4YGEPGZDdGbtRAKmDLCtwoCkDCBnGhTUWl5kHxJh8KJv2V9F1PdHP/yBjhp56aUXYINyt1VTrp5zkI8pGyKvP1DYdtBdlc8q8Ic1xqwF5Q5g9sVj0Vmu4vE+oJfbwxFW5ym+hFB/0YdtVryA2/rfkWrmYaj4ATlEEdhtQsLEqigCPgNjGgdmHvKK95kXPHwFn9tr9XCqDC1JgvMWAQPIt5UipRqShpCRZ+bIaSuZDIJBWOhYrqcBLVu1rz1zyNbnZuzHl5v2/kzRfnxry/4/d7P2LxZy9n9f79idRtb6aOpm0PlF1AeCyPgNaL5YhT89tE01StUXRA9doDoDXjGTd1wNQp4uj01xhcF7ZCxnND3M5LElnNZCoGQhULKYdWRrq1rGaK+tmq2sSHHYIgTT8pTNwGL46f0l++TDT2xPa8t+96ljNlp2y6U0MGg5vj9Q8l1GbS5T8R0GPSTHrAOuz5y4DAQ6kb6oobvwJWHwgyb8A0e7uxsEEjhNPC9HB2ZF0tLDwS9uUP6gqegaXIR7Kt7HNQYSBYWWqqgoOLg484sIhdEzgIGIQfl6b9n25TD4szWr94IPlJcKlb8FbxM8wvXdM+jXvwfL61uFjD2XbduROoTL6pZdX6jZG4tV+97Chv1oqW6/Xmrbhdm23b9Zs9qna1a4sGo9l1escH3RsnfQF9NTZnNAKIos+ia7CuW+uWIdLUGtYoaBPttA362vI2zD2lAcHe7aibMMzTKjoPGlpwcw8FNsiRM74sOAAxj3tyHDtqNT5rMxdOpjQyzu4eARGIdteiiw39HHRF+SCgIWfHP8+Al9OpYfg+IR7zqdlzSMGaoSwWUY7vG031V+C4SzvRgR90Vf3K8hvIhxIctZzEqg63wUQ8S3umA8Imip/gNS6bNPKbPCGOcMhrMOCuz33nlHz2a/+pUvuxJDWi5V+eGUGI805qg0xPNeTqrkbSA5Cv5g+RT4jMWyKlAOWn6DP9KAbeKb8qyH6qRgpvX7jl2+2InOg49Az0yjeBt0bwERcSfuBDaEGDNS8xHPFQYrhHQgJh/SbMAC4Pdruf0wEVq4r2caTMdO2BVCjaQ04AXyWCBu589AqJSay/adoxWM24z94NdXzNbnzWbnzO5hmnob7jQG9krVbkNIbyDN4XbGYKcjPTKCgOU2Tx5lIaEliwf3gKoj4/GX7WEHqhMDyk+rF/f1IhFmU7As1A7tyggur4VkOFgIsET54J1LGLRKs1UKHwijtSXLrKLOywsQUqj34pyOYPl4vW5/eum+vXerZv/o9Rftb43B8oaSGuoZtlxpTGcvWSlv7RKVBmYefO+Ax1mgbTpple2iopWJ4O364oA27wqkEfN19DLIFXBFx1Q4aYw6cYcMFQPr2H0eQ4Q/PhQvQawNmB3rzdsxGBx8L4ZbmnXuUsyX5Yay+VsCmUso426mbn+5tWb/enPV/hTW11vVtt1e7lj9PizA203L3YBQvw4BcwP8cWfeOtP3rTF3w7YWrllj8bq1F26iDzDLWJrGTHDWWmtcippBP6F/MMPoIF8+6G7zs6l6ZkEFwd1N4H++hMdBzSUoeGnt+oua5BnyOwKiISSa4lq4HbqCnfmkkXdj2oj/qYDju1v93ZAgGRCE3QNAXmT/Qkm0yZ+BT2l0DcKS3ju5xy5evKgXLaUw4nJMWkYwfwCXgejfMzkpRYOScU0aBZnFcYqw6mYVAhxjXbyjpADcY5x4rSwZFvy8R1QY8oyrB+hr7mSL13yOSTnG8ljvDz/4UDMlCnjKBO6s5IN9XwYnz/uuKn+ux/+kQglI5qoSqbsIY/0500gDl9D4TIOvLYSQ4AKSNiAnOAnyWqGM/Rh/rA/Lj56I2wrbBR6IHypAgrqicPB7uoFbmG2gUdzPPjExblatBuHhcWlBaEeVhLCHPQCMK0YDgu7cmcXVrkxj1Y7uGbCDg732s5++iUgla8FSt5UlDHZMUxeBKzXLbGCmUWsaRfspCKR+yjNt6UPnsRPBTNEC8MK8cqpOql2ESHDdxT2mYJuoHAsUeCF+t3PwExSHdmOJ6XypStsvgZx1ZLgTh1tzab2uA/mgFe2owXpa2WrbR9dm7Advvm1nnzxjv/Xas1B8VesFHxb4QJ9nb8HSaBd6EOCH5Wm2Ab/aF6fFbJ9ov72dXfdR8PB4GgB0079hdGrpQeWCGqyD6hLqE5UElUaov1DXGGyYFQ4gXR/yIQtQOUtRPwwgwOuwBjcQebGRAd81bXamhslC1aozEO7AzL11y9wBjadA7xnQeRZKe37OsovTllmegfLGLGMVxgeUtq2wTzCbwIyQisK/ycHnFlyGQn4QHtwJxzeM+UJmPOSPrr7mx75Hv9Pq7PJOALGKfnCfYyosJ6RQYwtxHkTP668Dkd1j4TaeZlgE1bObX7qd9G8D9h0FPQ0sYFySZFs5G/jSa6/bu++8C0FMC35L8kGyQYoDcUlf5ql8uT4A3sDMuwf8cuf2Hc9ffeDpOC7J71y2KZCnkM75J1YsRWu/BO7wqw/hyg9E3jxWXYqD5aA8vnnNt7Ep4qen7uu7LF/+0pf1DEKGMxRknqsBVB5sL8elxgIQ1XHV4KhiQ9EM6vrRXqTjtloBApmOMpbL/1IanK0jLloUEjnEPkmQt3aGpVBpd7nvuQsJjATiJNePAw+Ly06Qo07njgM+oBodHTVuR5SVGIQMH27l6GfHpPNTxwIDU/nSBfzhsgVhu6+vba89d85++Mv3QLC6rc9hoC/CGlyEi8Geh0WeX9q03FLL7oCe8xttO5npsUHmxeUpMm5Pj7XQkVIa6BBfX0VNgE4p/nRBNWRnherqLhiG3xbmB+4jsNPUcQE00EFf2FYQKLRKuVRVN55/xecdPOQwA8s1w9NYN1aFUh6YhbShPDabHXtjoWr/rzfetEJrwb7x3EE7OIyMW7CeivBw6zEUBY/E6ICBdEIsvzvA5SoK5iioqUDYJrRTS3LCz4JUnyRESQHz4q4pJ1aC7GOlVFlMimv2syws1ofKAkiakf7cAcdBHV0qDvQHai+LvVmnZceL7XTdCe2ejNUyLVuvbll+bstK91tWnupY31TTeu/XLDcN4T+3ak1+N4OW6cK8ZRYXLEdcWrAsFAUxh1lffmXNcmuYjWxAQfAzobWwzBiXnsDbekM7OfgPFeQ1/D4oOai7+KAE/WzQQP8bRFWJ5XweTNKjTWxnaCvvxSam4xGiK+DYg8EmwSmBCS6Ey11Bf//v/329/zA3g5kdZIYeWMfnQMyDQpp0lnABwGnU6jY6PKwVjPVFzNZZuuLgfhT2KIMzDQpWyR7+hSwESX5MB2R6IjNRWLhHgKu2U1lwdhn4QLITUVhvxuT3Tt5860178cUXdfSIr7iQtTlewdXg8e2Kg7WCG8YYSlAYUfIIf/pAF679YXeoi2JTjPVow4Bm8qyB6gxMt4UAR20X4ife34HefzuvHyYtGJH4KECcB6LxGoE+68B9tKapl2XatgkrYmhoCAMPDSaBIkFoSdHPNDE/UgEU9iUVIF0oDM4wkBl4qGmVvor9F3/wX9obb35otxdWwDyr1l6bs84qCMe15/V5a20sWXN5zZpLVFp5YMv62luWraDpvSibLwXy4VjQ/j5dZBl06HavE0jq6ZWNFsoWBIksGRJZccBEaLcsHTFUDAd9GEfKlMtVrjwyRPq5x59bc2k18AEr3NwGhNj6beCitapN+7NP79tHU6v24rPP2Vdf2GeF6pz1tAetmO/T+yv66A/apIfjyYwDwlkzjtAm/IsZiWrBQ+AzbzroY0kE0k+dF4BeXeIHZbpVCYTg8LXsoDigzJLvUnAKycGNNpRBtiNQFiWSi7SDcOaKD23O3YC14Fm2U1st+6DesOmVLWugz2trTUwQMNPALK62smBNzSS41DQt7Gjpad4a4JdWdcVa4KVOHYp7a9WyDT9SXd+210tfRFRCyoIKwv1u9BBZi+iP144SNilMwuDbDf+mgWWwGp8HCXSCtwvx5i4gOcgUWilAX3OskQcCL9LYeunllzRT4NcHOe61Zs/NA6QrxwuVRzK2PLtYKT4/mJ1Bf4IPtfQX39FCJAlQ5OdKA+OCvI9rr5OiBNfzSq7poV/X0a8LeJWrj+0GDAcoDikRlMlz9fjMIR478uMf/UhnRfFLi0xUgiHHISDicwzQyBN2jVXVjeMlxKM6IRRLXE7PQlyEF/iA8ZQKto2feHVZqugA0sIxzqaEIe1OCMXtCjEFR3gCOyPHDB6GEVAdufFXSzAaQH6trWpoCNfh9GF7amZk4I1mFKQRFRUbv0jLhlNj0uU9WifwuyDvgO+y9p3v/Jb98hfv2kcXrtj6Zt0am6uWq61Zvkqhi4G+uQzBuwShsAYB0YC/gOAMZgQt64U1ajnUqwcCCp2oKWMu7jpCESqH4K7C5HFHl8EftwzrAzCsJxmLzA3ULhV1WFAeCaLNdEkb0KMNZaF1cS5Z8WUwzsaqm5aF8jC9TQwBVl2yzvIcBN6azSHqpbsL9qd//l07cnDUfv87X4NgbVmBy3aYYWgaTAEMwbtzqUpKQ4PV6ctmCOFHjVLjkvUn8trd2HD+0U2DmF0uPMw30kydDWQ/crCSRkCnNQcLlwh9jZe7ZHo6TSj2qg211uww6nl2YMw2+gfsGu7P58u2hYyzECg5VJTPCVwAI2v5s3YbiuWTesuurjZtfW3L2uCNDgZTe33N2lUehc9nSeAJ8IdBGfv7FZjRbYHWXDakcmhBgUOh6zPA8GsHXPKiJmcXFBTej64w4MY+DnTxpaYuRiWRxu4YSOFfAZSF+urxcXvhj0DGT2E3jwBpv4BMEBiB/U+eBC9IaeCaL8IVMfYOHz6kHVO//PGPtANJeZPWoBsNBY2ZmDdd+Sk3/FlBf1+f3bpxU0s36gsh0zjdOZOpY1zRRc5Kuw3Uf8Ef8nbY4dclfhTfXY1jzoAo1+D6m/jgD9zj51b5gaz/+Cd/YgMDAzrSfW0JBiDazSHhss0Vh49LXDM8PX4YUWFUOEVEz+nlPVYmGhycfeQRvomZBtsYn6+ojsSkDYS0vwuxOELan0DIC9lzQqRJkSI6BmZmhz0C+XYkq6Bz/0PlfBADEUUGKBEl8aUbKo7es2cwq+M58NDMENo84ZO0UmTmywS8JhG1fASBThdhPWA6Wncvv/iC3bl1237x/TesLz+A2cWmbcGK3IIl3uZaNPfOcz16ERYlHyyjbFvesjqUxq2Njh3sKdtxCNhskVtWyzoOm8dga1kEAo3KyRH1AAQnBawjG4a2k0kqvVpn1F7pCJEmRHYiUJ2J+nc7FGmZHgOkE55zZCNScXC6CWzCSuIR4XoAV4MSWVuwam3TNgu99j/+h5/Yvel79ju/edrGRlD9zJaUKh8i8mwuDVTSUHSMipGCGxYfMTKsmDMgIXSFh4X7CnD+SKLihwJA9KIbkMzr+9RBT1qYQC6Z8ZsZ/NQtjwLPQ1BgJKBeqCfKQA1tX65uL/c37O8fyNnXJwcxaazZ/+PmXfu/Tc/Zn0IBrLYgaLZQfhMIWvK5AY9+zmBG0qw17Y8Xl+zPlsAPM+CvddCvDj6ogSfqK6ApaMddT0CYnq6gqaz15jaQGxS4AwUzlTbybwJbKI/npvnDbV+O0nKEHoJitgjhoD91KV2iE48sErF7bzsyHjcOa8DAx/+Iu8X/LMTPtjIfhSqHxVIIPgYmZSEJQd1PTyjbvV0/b+rlNiJ5jEIVvME4Kh/0q0BJnIAl/sbPf2b9oyNaZtJnaCWIu3TWWAkovpO/ZQN9FRuCQOZzBB1Omi4fDqPSmJtfmMOMJiclpTomhGAMxoVf6ei68yCEOETRhOPa3+HQ2/5RcYgvfRZaw/gto35v/PwNKa5v/8ZvKhtuLdbHkyJ9RCO6LIc/ccwROmDVqlUqFQyjDGgEOYA8OA4RC2MdhiLG2hJ4n8tUnOU4zVhX0olu7D/KH0eGRfR7XWRYGiO5WN5DAHcfF5mpfO7XHwvhQCZh8a/nBLCQ+Q3jQ4cO+fILk6GBfMVfx/4qE88rIWKKkD2YEdSWl+3cmTPWB2Hzkx/+0HoHBzHWaT1SoLql7g+VaZ3zgSWXeCAguDsJymN1dcM+3shbPwh8ogKB1le2Tm/Jmlz7D0pDD8dD2XJjB3pvsjlqX1JXusiPnardU2qKYtGzHRSMHzKb8kCuuubA4EDhS2CwjHmkCZFtAqPRUu5s0FqGCwWSqdasAVpuQlE1YZK8d+GSvfXhJXv51RfthReegA7Loy604nq0DipLBnWU8tU1LS4A2yehHu5zYO+CtOioBNKKwWcW+BGNEC8qFsZDXr43HUFUFnwnRooDTWVa1KHD71AUitrpNNDZtCOVtj1/eNDOnzlqhdExuwDB/5Prd+2d23PWudewG8sZ+5drm/aHUBw/g4K43WjbXKMDNLsK92cYSH+MPri5vmUz16fNpqggINS5xMHtzVvr1uFONSoOKgs9l6BgAtKqZR9wsKlf2CcUCI4KB4qf6Q99l4D8oAbaHwedMPljGiB8CT4weBmMuAky/ucHL+/x/kKh4uzHRYHqJ0eobB4GTEReIII+MibQ53ynifzJB98XP+GnEWoyvGhQ+kGCaD/pTWWtQgChMApLAtPz40p8YM40bqwGutGfah+fA9Ai12rAwyrs0ZVWkFzvQMm1HcgwKLkOBTqNO/IdeEsPyPksDHEuXPjYZmZm7Otf+xoU3aDCpDQk41hLuqQTvIQYRBfZV3rLohMKQ3BoH/iEtCTy9QbyTlInYuTXpPK7Q6JDU5iOHnkml+1Ln3L7+UD1iC0CqvEJULCQURCGTsrCsuysrdme48dtbGzUrr37nuUH+q0FYXgESmATgnD2/n3EhVRRxiHfQMxCqSTGOPnEOU3x/vL73wct2pCp3ik8vItv3LrABeEkBMg8LB9CUuvmmNXAul2uDNrZvrbtKWftgxq0Mo+bhUCmgtGDaFqbXI7gUbXIg0JDgj1SkNRk29i5EMaa8qLjxiYnoXPyNjM9jWvEIeOrw0KnCVUjADwCCmKGhet0XF0jBpADQcIrPZh4E/H54K2FfFbW6naz3VUAAAD/9ElEQVTzxmU7cnCvnTt71u7fn8ZA4fZm1o9R+cPMPOtdQZUJqDaGfqTLdHJ5H34qIi0vhdkK/ehrKQspIbRKfqCURs5yfAkRCiNLawiZcKvinuFBe/HcUTt5YNQaG/N2BfW+DoVxE/pyppG3zQ5mJ5s54+dO7+QaNoPmr0JhVJttm9pq2q1aw97bqNoPl1bs+8BKoWKz1+dseS1nrRoigwY0JDib6HC5T/2LzMkjEVNr4IFYoHHoP7kYoAj3gerNfwA0ynYCw5iWjufh+Ydw3fd7HuZ5d8sI9x8bmE/wPiZ83hII4gW67gC6/BFBlKKBQP6hocJb7Htc90DY80iQ3/+939f3zvkcw0mCmR1neuRVYVDUEcR7XSOGz0ImJvbgRsdmZ2dF36isGRbPgaJRSllzGuPi7l0eKc6TKEL/QilxSd0N3BQKmD54H4BwI0QFBfCHMnHtxgXz0Q0BRrD+5ufmbW11VYcw8tvjfNbr5TEhY9JluUC0Ue+voM2sLw1uLj/zfCm+/8HoxCKM3n379tlV0JEzGG7K8baxjYG3QxkqIgKDYkgsPgIudl4TcpnKntSBhcnPY4Hzh8ePqRLFgc7SUb5BaPDALU5T+0eG7eSpU/bhW29aAUqjCWv58MlTsgJm7t51QaSWIJ+YF4hDYTw0MmL/5J/8E/t3f/TvQew1VxhUFsm0EIKe1iNRhEI+RCoMLjupPiVrF8dsb2HLjuwfsIsbDasDMytQOLU1KAwqDXQilI8+Oi9iB8WhejnR9cCcg4ECE+2jcKz099kAZj5376EdgQG1lCEB5J1G4cHL2EHMMf5GJ6b1+IwcrFFGYDjz4rSdYUqDH1pZ+ONHfa5du4VoGfv2t79mt25etZXlNav09Skqk0v4JfUPdCbyOvoj7TlA4ecgZZqkf+knPdl+oASD+hqMLHp7GB9uZ8HkfJbCb7qXSiNqU6u+bAdGs/b6S+fs2LEDdvX+vL3x0XW7tdS0TStaFTOHNhRDsZmxnrq3r1MD8v5yy65AQf4EM4bvQwl8b23dfrawbh/eX7P7dzds4/4slNBTdufidfAGrby65fnNXVqBsv4ifzhtXSkAnUJO38g/od+c1rwfIcRNwMXU9jCA0ngYKReoF7LaHleGxgNAfot5PAbKofs5cWc+D8XIGkFJJODXjBF5JPKYv49D3sjpYS2FXRP98tJLLyMoZz+BAViBLOCLaQ1a0UyvJUDSHJcYD+RthZNfeYV0fC+B+Zw8edKmp6aVng+gVUu1idExJoioR2tjw06ee0K7mrhM5EYYy2hbFo4rdL/2xrBwZaZLL5mo2gh3goexbMRBPiwj9it/kTPCOlAUG5BhK/bNb37TplD3TcjBIgxaPfxX2YioQpAP6s768/kIz+HiW+F37tzRcpTKww+fB03s2WPXoTTyUMh8t8V5FxgNTbWPCbqg8wJTkL5SFVg+XV6rHTw9rnccSqObk7pnez6PBsQXo8gNYbxAQ8UsdIHcBlpHx1LDvnfpondkvWGHjh3Xs45pEEICnvVRRp4ZP3zDtfHf/M3ftL/487+wuzdugRGgTXmSLAe3iEJhAMGgh5Uc8EASjXlRuIGQypuHGJYGrS/TsvGxim2BoWvLW1ZbhZCqrkBhwBLl+vZWzXdEMI8gYMRUBM002L4oNEFIMHAO+U/unbRbt24pCjuKD2zFnEANfvyzG+hnFG8hfkOHhAhy9BMYDxkk1975QDIC84Vf1g2uubknn++xxYVFWDRz9vprr9nQ0KDNL8wrSzEfClB/sf4S/lEB+MD2/oIb+o5puoKAaREO5AzD429Pq11QSJvNMw7ig8b8SiOTFUs87XjEnn36vB3Yf8Du3Ju2dz742O4vbIA/eq1psED5PW++3o2u7MAw4O6yDvoDI90y61tWX2nYxlLV1haWbXV2zVam121tpmrVBZ4MjLSbmEVAUZzZO2Lzi4syOrYwKPXsgUTQzMJp2hUU3sfJQEvccF/0BzA9wcnhoEzlCUgI/uReKomCuuF+2b3eBghPF/WfHdj/21z+EMgXwScPOBx97zNNN6wo6Kk0yE/7D+y3QwcP2fe++13rHx7WIXt6gY9koEu6i/a4DrRxnpVPfMZjM7icxdNrb928qfRcjYigZIjKdJI1KOPY6dOakXCZXOMRZWhTA3lD44xlenkCtUk/KQj3k2gsJHgJMXxbn3K8M5JH5GyAhjIV2De/+Q1bnF+QIiFVlYw/jMrxBOTLgTznim+9r6+va4nLl9m87EpvxUZgVN/EDISrOlQwCR9HheGxu/ViEbHTdoH0HaaI13yGuAMeCPhs8FoYT5GVi4oKOcii4A4dwinp6o0buN+xyT2T2qJKopAYqryQeXb92VLRtqCRX339Nfvggw/s9sWLOs+eL9FImMcdR8Q4y+DSg4QMd8lw2WnNbGMlebaRX5q2JXhvTJmdLOdsgke3l4apnSC4+FAWyJfNULdQIW9mBJBIdEsRj9bT2vqaBoXW/FF/pYmu4gf0H4TDZR4Jkmahg9XhaB8FXIvtYptcmXlb6VI4wl3HAICgzNQgZSFkW7Wm5Tp5m7o7b9//3o+hqDfsS195ySYmRy3TAwut0qsdYzyGnW+Q6zvrsHK0y6oAvxD3oHx4LLsrWyoEtMQbBYRCkOKgi2vSKiCNFyoIajJ+3bDdadrE2Kg9ce6oPff8fhsbK9j1mzfsh298ap9cXbPqVh+EdwGDGoKdL81VoSjWW9be6GAmSuuTy0p8sW7N2nqQDZosoJCpvGXvFKxwJ2/l+3krLeUsX83YeqNk1+5OW6Y6ZScPDELhrKM5RdQV8fXOCvsWbWL9YXx4ZQEJ/VP9kCjr0Ce6Tt2nYIsdm/J6fHoIHihLTWExPF52rwUxSginuHnsP6T5vIifWOCjkWmCX78eFDxw6eUPukdKQ0YDFYafKcVUfJjL487fe/ddCUM++NYhnzSwqDC0W4qIMGIoxEsEMF84XJ5mXmwDjU6iNqUwLnGbHynAp5yZ0EInINjZOQ0MjOXQr8twvQ1iHCLjEbt+lp2Uq7ZhLHOW28BsF/dYD76/Nnv3nmYaB/bvx7DGGOZY2gnMUzXFrBt8zKV8xlPfhTt8/0QvQYLOKpOVkRPiwHERjTFJP5E3eP8hmL70vJgA5OePX3skXe9I8FkYIVbI0f2uPDwSX+DLc7CubUKrLsHKnwCDIBEa2YRwpKUuwUQBFSzYfG/Z2ph9fPVvf0cMcfmTT6w0MADZCcESl6KSGQbcuIeezCKBi6kqH3hGxbEJxVFbtubGPZte37CL91dtEGkqlZI1+iFIy31SHBKiqk8QlhIqILGmcmnkL+0HPhzKWBUWQE8hZ9zdEOWrZhwEeUgk4Dbi0c+wiH6tYRHD2BYirQe2W22HwggPyvkcp1WrQqDyOAsMHCiOrSrCQN9NKJMPPvjUPoQ1//LLL9qzz5+z2tIMLP4+K1b69a3tDl80AjNy62IOCkO7yDC76/T690pyetejx9pQ4Nww0CxBwBdBFx7DQvpAYXJAct24AKVUKuURDGUBmg8P9WO287K9/OLz1pPttQvvz9iFD6fs7u1lPaPgN0ya1U0oCPQp13bZt9Vl9BNmCNUFuOwz3OdyAhUkFIttcovsjNwO4nGpq1FfsibjckCt1sFmWfvh/U0bgrI6M9lrrcIWDANYuVCExd4BtJGKE+3MFCwP9H4OnUbaRzf6dU+BITj0T9Kf4UbsW14TJfwCItzHVhc9Eh2/L4yJk7AQ9DcJsYxHoEgBV9VM3dBvoBONiBZdKAQ938Jg4EoBt4vyy5Rf+cpXZGEv8OVKJOSpsPqoEIVe2KEmFN3oAr1AlE+DzC1vWtwHDhzQC208aVYv1SGNhGagXbyWAkE9GCceOxKVis82AxLoKI/gj9c7MI59IeMk+cBPiNeSRywLKCPQFQd3OOUg4/g8Z3BwEGIG9ErzGQHpmR1lKYP50H9tbVXxKFP1zAbAsculOa0YxDqo7B3l8zrWK0HG3Q13CUQYepSeEOY/AWLgIxD/Xm0Sz/0kohcYIERtUkmM77Hp6Vnbs2evFbRbCUIIDSnBYgBF9JCUAzgHBuPzjvPf+S07cuSIvfGTn0Dp5CEYKCQpOKEoKDi1C4ZWuAtQhUdUPCAt8xqFEmccEEjrC7a1vmyry6u2ObtiAxSMZZSLGYwrDVrctEi5iwokUidGxcEGeYvpkuE4+BWC8jgNjh28G7iwCLMxdOQD10KEcdAgTMgOx7WWyhiu9gXFkUJ+gzyeg8SlOx5H38DsI4NZx+zMgv35X/y5HT540H7r7/2+NTtQMtkWFDPaDMxBgWTLg8A+KBH0RREKVN/sqKAvKhC4sOhKHtdAL22TpTKBhUOlksd1AQqlB0pjq1G10dEh+63f/R37xte/bhsY3H/+Z39uH7x/wdaWW6gTLM42mJuDh4yO9vC7I1koPB3kiFlUtrEJ3EAYlIBmV7DCeB/9zfBMk8+f0KeYRbTra2grEEqqiRkl219vdGypXrBPLl23r0BZjpZaVuG3SVDPbLlihf4htS0aCTrkkYaCltaAGIwu8EK/ywqgwCLK+3iwW0SNB/w8ChPY5d5n4d8gJMpObgxzlwAORW0RQLqRZkEQ8kHu5sam/cZv/44+RXrho480K6d1rI0cFPi0yOG6YGNGzC0CxlggPCnKccZZNpe4mJ92TzGW0sT0CnClwDwhUKmg/FBRj+O5AekHqjF0IzA9nN3Q4zpuD0Md4jimq3HMetAFsp0sH8i6cBmZ22R1Sm3IyzPED64ZxhkU3/cg6K1vReAMqyEaFpGeS258fhP7J4F4zaBdET8PwdjfERkfEg6J/MeBNz4POKWFifAjYXjNPxCGGpFFUWnk+gftowuf2sjouPVWBiCQMJvAvQLcHJQIP8fIgduCENl39Ki98OKL9kd/9EfqBApNfnVLwpOCk1o7dkQag3XCTtIH+Kk8uGOGSxsba1ZYhUBanrbc6qwtTNcM4sMmOpvWw6MNoDAkQKDM2pppICzONNSbKSAh8QePX6Ne7DROPQVIRuuLfU+InUkmjsj68jbJ6Nce5u1wxovX+q4ClYZmV0QqRioMKAouV8GvrxDqQMRaUBxc54XVjyyaWy37w//fH9nC/Kx9+7eetb0HhiEYMaDBjM1cr9XLo9aEFZ6tDEGwjkI5jFm2d9wKpVHLlHkc+yCQ51z1Wh4Kgt9u5hfMKFw1yyhkbXLvmH31K6/b+fPn7O7du/b97/2lvf/Ohz5mQUd+HzsiZ0WcJXXDfNbkyHt+v3vdvR8NgsSAEOJec9OqWysgEZRLFdP/hYb96u1P7A+eP2X7e2El9ZWtAeuuU+63QtmPXmmWcE0FSORyHHjQTySlpcxnVuQB70j2Z0QXigxnBxLjNS9iGDEVBjqEH3din+s6+B9Av+3xPwP/kwMKxb8rUpmKoa2gFx9+R8UB4BL0uSfOgbx5+9GPf4QZaQ/sPYxl3ksrDLaXzEKGja5nzB9kz77w52zsr8HBAVtawKwUcRMjjP5AOxfc4RpKg8qF73rxHnNk1so+/HpACA2u8oy44y+Cyz2MTY1VBigwIP7T7SFyKQ4u67CFmQOVgl58Bkg5hvaSnrGe3CFF4AxLUQAua8myeYTDmAJdYtuVCGXyYTeopXx24qPA5VIXmS9Ghd/swuNk9WjwinvdfZThH+3LZfO2cvOWBmah0quj0hu4nenhNkwuH3CnVAFGYMW+jGnsH/7hH9o6v26HsAatTGRIYaP1wbj2qTVDdACRHZFCKRA+HOdMBMKUb1nneI7Q6hymyot2dWlLR1ScyixZbw6eHN+apuDw9zW49q21e9Elkp7tSjENq8GyonCBYKfyUEz8hFjBg1RM64RJOkJ54cKnuvAHdOskXtMf2sSluERYAoNQleCkEmF7gT7rqGGGRqHMXRZ99t67H9tHH9yw808+Ya++9rT19aMv+jBj6MfMr7/PMgNQGgFtYNCqg/3W6B+AEgFTF/vRF31QEH2YiGHm16rZ8GjZnnzqtH3py6/Z6Mi4Xb583X75xpv26ceXMMnjIIUCbrT9YSdmB+2tTaArNh36x+VDuag3FZ7cx0PNNNW3dLf8fR3QoI1yqEA2ILzen120j+Yadvbck7aPM45+zC4wq8xScfRCEfJU4NSzHfa9Tt0NioMzD98JhM5UH6PP2L8BE+GYRhkbcLch4zEcSF6K7kMRadIIFvCf3bDrPHDrrxN3gtoFdoRXs/LY9kAHPfgG/YaHhrXx4Yc//BFIAKOQMwwYP4nCoDHEsaxy8CO/F4icAgm6NOeW2bGJCeW9yBd3WQ8JZcSTy3FCDPnAzaNcPjdgnZiz8mLeAB/LYRx6wHY3gkcTxrHbxXgvfY0f1oN+uFKtqbpxSYmNoyLgG+ME8VSsWATkw+cZBK7AEJgl20KjnAqHD9JpmLlsYQR3RToiLnei1/PhuDOIgN6NWQbYWdm/IqhySRkSiRqU6xAgZVgJ3FG1xa0/xQJmGj3aGsq3n/+LP/gDWCQ/thqEAd8ablFRgDi0SGVpkxm4xh8eLrk/IgUqXHZSELIZPkymYOJbwPpgzqrV1lbszlLNqpjenh7AtLWDdBAUemOaD0rjQ2AMdHZkEOmhLQRS0n1SGhQ0BC5vhDh+G/4QzynvGBVHDNt57X62wZVHVIK6hptVu5pa3tFylRRGsMThT5DLVqCfZh31BiZyJVteaNoP/vJHat53vvNtGx2tWKk3Y32je6wAwV+YGLXy+IgVJ8asOTYOZTIMK30YE40hTIXLtoXBPjw8ZN/6W9+0L3/5VdS0ad///vfsrbfexUxmWUYj2asKBb2F/uyoXxpQFFQWfKBPJeGKQq6WoMI13Ueh0tIf0wfFwR11cRaCeBBJtlkesI+XOtbKV+z5k4fQlIplh/us3tdrrXLFcjwhuJdLVTsUB4mTUhwS8uzWoCS0zZi8kULFCeER9SCYLq9xX5+6BY/pGq5j2t9FrVHHh/UhPX52QcIO3vmbwOilwFVb4OdlVBakU3Ap0Iv8NGmtal/56lfsk08/Bfu2oR/aEJa+XV7PMcjXVBysu3icSH8oj/lLkILmLA9lUQ7wnYXV1TXbhCyRjNE4wTiK6ZkW/mjR8wF4DQKXG3J4LaG5DR4IcGC9IjJO8Mv4QzkR/T6jsC0RPcjjoy5or4xCthtIOkDy2+LiovVB9mkGlRA1uAQk4UxDD7tBN9EDwB2bhEqlD0pjEzRHeuYfyxV4XT18O7rieAgKdgQiTS5bmfhnKh/ohIf/cUEJUbDXH5B4dI9Te+1SCbtVeAAdl34y0IoDoxBIAxWbWZq3yvCgjewZt7n707axtGy/+3d+Xw/JLl++xIxgKVPwUTBSGcDVDIOMETAhQESEqQqoDxjMp7TwA9kpfGjdzkNgZGBVFwasP7tmx/aX7b37VavWkVbnEIERwZhab6fCYrn8+Cjy5gFholdoIx/86UEUhPiZc2ft5s2buI2OQn11ZAgHhOoZ6roNSD9SnhnqP/wQdtIW1/hDzrrSQWW6x/an848u7zuKwXG/jVlXGyOvAeYrlYdA45uQi3n7+pdesEKnbsvVQSiKSSvuL9n+/WOW7R+01SZ3lg1YCdnmq6u2d6xsr33pSTtx4qTdvTNtP/vZm3bv5l0wNax3/FGBcq2Vz1h88ALV/iAghBw0KX+CO6+J6PedYcorhNPPwRTTkioZTOXbQLr5stXyA1bA/fMnDtu1rTVbHixau4/fG8nrq2vNDvo41s+pK/ptQxE7hEvIs5wuqq+EMYz/DIdwlcu1fY+nPt/pZ37i11SY0vk1vB6Gsh09ToggjGn8Ol2fMAZYRnL/86OXGZRFEoZrjAM+j9QW27BBoqdU1FlIv/Fb37G52TmN5xyUIGcJPpZJb/YdaE4eCTyb+JmXigEHw8+jZ7idm+WRn5994Xm7d++ezc3MoUhfemK4aEJQfkzv9MohPZXY4NCQTfMFXMWhUgn9Hsv1ZI+GR8Xj/SArBIFeXeS2dChX0I3KYO/evaoX6+BL+oiCP84e2Kax0TGdEn7lk08sB55VW/E3OjaKNg3a7du3VZS2HcexRZdjA+3kPeYYgSU80FyU043hsRPED91cpnf8n3UT0cfgrvO44NFDrvSxcFlpwVoTU/XoBNZy3yCm/207cmq/3bwHpTEwYnsmR+32jev22iuv2giI893vfhd5QACxU/kAfQtMRmYDIfSyTyCGtDYJIgKy/kTcY1VYBzCLtxYoq01VgdLgMhSwpxfT1g1MnUdsYb1jG7CMOWXMwnrNUejRUufSDyxXWfs+EVc+GuDMDC6tKiqPo8eO2v3794wfmG+z3uz8KNCQXsAqpoBVS1xl7R0Xgrfd74YzE0f+ya/86afDaw+P6fijF/HgIaO2Ozko7wlbRJuX16p2/slnbGy8z149OmT/qxdP2u+dmLAXD4xZm18LrC/bvokBe/aJUzYMBr1z+769/c57dvMalE6Gb/nmYdxjNsN209KPELmSdSMNJOQRkAxSuiFc90OY/OxXp7ncBNPpgGFQJOgNdf7rgaHCFxv7Bmy41+xgpWl/8MIxe2Ywb/uHemwFimWB66MEZOMCjB6UgWC+1SIWorAFIZGt+tuVhqPPJBCO+9FSjPGpJNQB5JXgKjLcuFVZrtDz8DgB6Q95ejz3C7VQkL4O7m7phemwh6MUg9Dzl1IIiMYqjGNasyW6GEvcps4t3NxAonGe7dHYff7F5218eMR++YtfgrRuvOgdAi0vs89BZ9GcCH/k31j/WF8qEG1SoKDNY1ZcsXPnz9sHH3woIUnZ3KKMIET+IjALNh1154NkPlOZmJjQC7j+HMLjanYCv97kflxA3gmm6y0/C1ZIAF6HMFWIHrQlKEIqUp6Ey5f2CKSd04PJGLejeg/A4L528aKe/zJ4q1azs088oe3+VDiMqbfBg8zRMj3zQrs8nyRbr0tw0rgbcIYX70lpbI/8sGQPAzCX0ni6eEXCZKQw2NEkDPzotGxP2UqVAQjshj31zDG7fHvF+gbHbWK4aP19FTt+4pT9uz/+YzEYp7Ky1PUNA1omJAYIAGHsL+SQMFFxUBQSuoRWCPpHnSS/x8jy9U8+9EaHtcHknWzLBjDbObJnn926ccOqOrZiw7J8P6BVdYXB8iBMVBbLYFZxYIUBlYOFtWfPpD42VeNBeRwkrG/oQPx4j3kVE4id6YA8dZkOYxzdgcvORxYZ0CVmFOsUlOVuoDyZBwZ6lsIUNOEyXAuzv3ZpwDbbZVuptuzZUwX7x09O2N8utOykrduzfW07OJ6xYm/G1lpNu3zlil2+dMtm7q9qGzRf2utACLQxE+NywzalkBqI7KvIvH6fLySyhxjHGVtPjoJfYbyXCnPkgzh3k3xBY6Zl97KdtMz4bWaed9Xmw0M+vK+U7eTBQfvdJ/faP+xv29/qbdqXoDSu5wft/bl18BfqjdlRbquO/Kj0cI2uzWc7OgGF/asXFKkgaB2Cr7kU4MKURgPuS4ginGG6RyXiPKJwoPOL50MBKOWScnnPl73UECD8UcgonHGZT7S6vcyMPijGsUYjxuN5fkSGpcJ3wySt59lN00U3AuGHy80TPBImX+S36XuhMEowwMqWxWwzj+uefMkOHjoIwX7GfvAfv49h27YG0JeO0H/kg+DXtfqVPIwiUB8ajK5UA2KsavkXSNrxK32Te/fZe2+9rZkylz/JB3owHJGAPPwoEZ9pMO8DBw/YzVs8NQEjCGV3VwKcp8Sfnji4AXZcbgPWVYNMF8FNQXI/uOxT+NmHOhsOsH//fr142MQ48k9gMxR1Yv/A3QOlwYMJeZovd5cSeFAsX5a+fOWynovwGZHLySArmQ8clRzLT0GQkp+JgsSD7hDhEgyhnxMeTIsStPjYLUksASuFA6KKRuQzRcuttW1ybB+mlll7+vikPf/cM/av/ug/gAF7rdmhJczdNojM9XARgBVGrmIINJaFAiVAgt8BpKAX8fSyEAinKaiWtijc4G5tWKa2rHcBNjbrduHqtB0dK9twAQIDTNYpQAgUUQf6OZj4fIMDhp2tDmdxKkQYacDvoPOFoyafNaCT9KfOejh4PhGYD9sXEdcqw30RQs7wefk++OhGP5F0cyaiYKey1VZehdPlERs1hDVtM1OyucyArWcHrc0Hw5KYEAawGE8Wszaz2Lb/eGHFpqplW4dl3mxXkU1D+emETz1HIqOGvFFeRsgwbqv1a74hn+VZP6F+WuMNg9bPC3PMEElD0FNugiwTYYwH159vBdR95EV6JiQPfvThc4P99tsYa1xmy2R6bA/69H95vGT/++eH7B88O2rfOT9kr58esPMHezELwSysp2O5TtNqG2u2tThvjfk5ay4tWmt1xVowKngSK3mFS5NciinB6Okd6LdiBUKzt2w95bLluI2cx6hAOLSgdFoQ7m0YF8ROyu30QPAFFxJ3B4LvcE+CE8hvv/BZINfCmTe/meJbhmnpA/lMRsjtxEC+rJk8rwHq5U3G3wWRji+4RlQ+4R4/8NWBkuDW61apYq1ynzWLffDDCOROtPKodXrHrHds3PpHOvbq6y/bd7/3C6shbo0nMWiW4uPBl7iI4ZqCkcpCigsdRpQiQzs59oSkQUFnlg2NjtnS6qp4TUqWY4y4DdD3acClTn8NzCHFJE/4wYXGGAOF9KeQY+uLAJMhvVaq5BJZD5TG+mNcUHnxecvI0DBYGeMnlKflTPj5Xoo+58odUugHXvPYlCOHDyNe2+amZ3XCr5/EzPGFspDe5SLL8iyJaXC59XAkkDxed0fNNHRHEDpQvkejQ/QxLX5jxzGf0OmavoKZ9dIYLZNKnzTm5Pi4VSYP2erasn3lmVP23Z+9bUv1PIi3Ze06BiQFUZUPRiHIIXwkSCTwQAQJHVgoXpqDVyBcpMGXDUQCKgHEcUsRg5aWNqyi9VrTnp4soZ9adm0BghRKJdfizqNNMSaRQss7AAJOeSHnYM3J2oNQ4DfQ2aEz9+/DhRBgXckYrDfTsiOUeDskdAvglzHM3QeaF+MwzxiuSNGVx68JVHaomwYjGUyWGwYjBEKrd8hyA0N2el/FntnTZ0eQtgMTey1bsKvI/wf3WvbpnQ3bWl3T1uV8u25NKhwuGQI5GxOdEoXEdtOiZD+hfuwr9RuZMYSJFqQJMfhDvyp+Kiz6mZYDrrsOHV0MkNBOtiu2TTMNCG/r67dX95TtG/y+OkaU+hJKdBp0uLy4ZFNzqwgzG+zt1dvrPPzt4KFDdvLYMXvyySft7NNP2Ynz5+3wqVO2FwN1Albh0MiwlUtQDBBmtPjqmKVUoUyaqA8/b6zNEQC+TMbvm3BbpPgPYZruk2+AnKFobZs8SRdIq14zk8hfsd/i7EH3gPI76pptpzLheANyK7H83E5MhSJFAJfKIBHGuE78aUyloWWr93Qwa+PnhfkirDYQALlyUBmyTv+Q9fZhjDc37WuvP2237s3Z1MK6NVE9nYWE/mfbva+DSxCbso0YL2oPn424UhSyrqwz6qAZDvDEyZN249ZN29BSKPLROHP+CJkDA43DWOAOTM4IDxw+aNdvXFd48iBeiDRMD0eCnenTyJ8vBJSplI/bkf3IWjoPZK0PxgZf8rt3+5Zo4eV6XPIQeXJ9bc1W1lYVn7OKV15+Rc8yZqemwFo0smlkpdtEmnTHBsHJ7vT5vMBU25RGrKBX9rOxC/GKafEba8d8xOQcwN75tFLIcPnBAcuB+fpH99ixJ87Y3Ts3bP/wmL1/fc6WtvLWrKPRXCqg4oBgig+k08pCGDo2AVUgeN1JwrS2nJ4p4Jo7D/TxHyiNHBhzoHrbDoKhLkytaVuoLFnuzEHnZLk0JaWBuoF0nTjnk1XkA5YuDyzkLoh7165h3PWAKRGPnShmDPV2VgFuh4R2O0ACBvfi/W68HfEVHvKOa88MI6Juaj+XMSS8KFRdkUuoQJHzxegzozk7XOmxYSiMbL5pN5HHP59atR9fuG0bEKy2sqCPGfELg3yRkH3ju7UohCkYnGG3raXS8iGnik8RDo/uiXs9niPDWXvGDaj4gXbKL6CuUV68Zp5svprLpSS2LwofCpySjfTV7fihgh3Joi+52wr1+l6tx/7V9SV7+9KqXbm+aJ9eumsXP71iF9F/V25et6k7d+w+BuX9+1M2OztjS5hpVKubaGYLMqyoc724bHDg4H5YfUcgzE7YKSgWvpDK3T37MdDHYRwNDQ9bPxRXBUhFUyr3WgkuD6njkf96cQvN5c4iIoWfSED6hf6TcAGfcR2cSxpaxiHfSdGwvbzm0pG3XcIX9+gKtymHoAx4ZA6FMv07EbMSvjmfQT2hDaB4B836iUOW6cfMog8INzMwYjY8ajYyZiPFpn352TPWB3p/cPWWbdCyatX0vRO0xP/QP2JLtQnXFJChXuRFVxbss6LKzmK2loXsKMDPb7AMDA3p4L5PL13EuOWb0F0hqZl05B2SjWWxDNCJy1NUwoeh9Kk0aNT5kmrgoag04Be/skPSSIcgly1REY+H/IkuUOMZfzRgaXQwU76gd+jgQbv26SdWKNOADX0P4M6vAwcO2vzCAvgPxhrCuKJBg+ZXv/qVjBTN3Kk02IZ4DV7qyg2UorrHhgDg1XiE92EoiHkAd8w0eC+J9giI8boukybp4cryiYMWjMCPHWG0gE97rQMlMT8waOdO77PWxoLtG99n1+ZqNreJJvBbzBBKfPs3V4PCwEyjE44pd8sVGBhjW21VgeBP1SvG0nQUyAHoLtcToZ1zsEBQv62lWTt9/JRtLi1Loze3mlYE6sEuLVtu4+QyiIQYqc3yPD8NADBkubcsIXHr4kU0O5xaGQSpMyTrrWoFSDyCXelPWhJTfsHOuLxUGOpEpYE66Zp1JNIihTDRAJXS4DZnLlX0WH+ubl95+ohVoNB/eHPBvtcctmW099L8hv3bX0/b4tSiNfkJXX4vuwalWocC0UuFnAWib6LCIF3YRiEHH9vcHYSa8jKMRFAQXcdEWaSVBMN1Px3myNlGVD5MpTY6EcR7bQzG5FBFtLHU2bTx4X673zNsF7IV+0kzZ7fX6nbv8i1bnOVX/bgVeNOysJT9eyYNzaY2VldtBTyxsrSkD4lxe+T8/JzNzMzaFGaU9+7d1QNMPlzlsdtXr16RyweTVDL8/gH7jG/8DkN58FBLHn9xEHgIAuzIkaN2FErmwKGDUDSHdY/KZs+ePUJ+IpkCgi9S0lImDfnwN25Z5dIGBQz/OJsh31GpEPngl5Y5Py2QhyDiWrg+B0zBTMVCfoCf291zPVA4EFx6Xwpum+OVMwsYFJxNQFoDoSAGgfzWP/jc9oxbZ3LMbGLIyqN99srxcTtx9IT9xZWaLWcqVkPHcIsrT33QOAnKwZVaUA6a+XAVAsi60SVSWUlhcXZDP2Y6wLHxMds3MWY37txSv+tdB+avsQY+JL/wjljfxwDHpgwJKBAqjRs3b2A4wFoPwlXjE3kk8sU5CvwlR/2Xhu1XjwalZz2AcZZJfiWfcmbJ6vMAQhobfG6YB000qyZP4x779eDBQ3YP/MY6cxbLZyDki0/efRcytQQbl+MQY4L1p+HBdoEWcVSo4NAuB/hFq0fAjsZmMqNnt6XaSZzdQcM7QFoodwUahbJbDbBY0NGdMjqeL4jBMun0Dlv2xElr791j//irJ628eNeG8gP2Zx9N2ye3ls1mps2Wpi23MmNZDFh+OKfd4MtaIAo7mQKKwgLEcWEUgGVvqz7rRgWBQHSIz3iKsL7IpDxOotfy/X3WGgLzD45bv9Xsm6+9pP39P70yZYsQKBUIks3leWtV1yy7se7vGfDzn1QeLEuC2K0/dv7oxLg9/fTT9r3/6d9Y78goZBBfsPM3nrkWz04Vh0TYhd47+4D1F/MAkntwGf5Al/M+LTcOSDCkP1QN1iYFBdrtx7XQiitZAQKhjjh/8NvfBn037GdX7trS2BFrWMVe2NO0ExBY/+aNO9benLMMlHtnHXRfX4LigALhAYkcqFIaZFD4001LLlB/Eot1YzvUhMg3bJtfR4gzqy4wn5hXUDwR4FVcKga1mdY1XLYRAyoD3svASs6iHa88fcyOjJft05llWwUdpjBD+o09Y5ZfXLXv/eoTW19Ztfo6z69C+/guCPsLbdIX2DQjwiX8qdJZe695kC5cRqBlyy2TXJLRg1amQJ1lBXNg05WwAr3YP+iXLBRKPxQ2X/DqBw5gRsJPmPb197siAH/x2QmJxfYyjCe88uiIKl1grVa1tbV1W8GYWdvY0Pei9R4AilGlNR5hvCEtBSgVEOvLGY+EmKKxNd43dYyVrWLF2hLs4BvONqB4rITrQQhwPsOBf6iQs0GQf6xUsCcm++2ji3fs1wsj1lwBj8zeBt9gDK/Mg19AWxp/Gseol6z8QAfSkTJD/Io+5PNPKC8uLZZ4tA0VC8rhJOro6KAd6O2xn7/9jthvkycZ08jkOOMRG+JDIGnF8Yk8qQgLnLng+stf/ar9+Cc/1iyEpx+3OeskneJzuSBsCWkuJMS+3zlGHwYxHunpbSMijHxCXgX6Uiq/tNlj3/rmt+wvf/ADtAuKgW1QDfzFvtdff91++ctfqu94Qu6rr76mM7wuf/KxVkr4Ei/rz2eHsR3JTPWhEFv0mICsvqDScOiSNaRhp0ci0Z9SGrQWOtxqOwALZc9Rs737zA5N2t99atS+cqBipdqm/bvbDfveh9OWuXjTsjN3zFanrMXPcvJ73xDarjRADGC0CB6lNIjsMAlPCHXVCUqDuz30mVd+uY91guLg+VcnJvvsq+cm7X9+6w5mPRhU68uoA3Bt2TIYhJ06mJJWqJQGyiZTggGkNIDDI8P2pS9/2f79v/gX1nfkmNU2+IbzZyiNCDvonu4HKT20gWFd+jLI10QdEIBrNRltjTvX4hqxW5S+xq21Yc0ycjAgy/b1b7xu0/M1+/Ay6A2BVUfcXKVkE+0N+81vfcv+zXd/blurS5gRrkF5ov76VCqQy4dsj/qkO9AeBNRb9fO6qw1AF1Dh2n1C5cIosXW6Db/yj2VQebgrhRpmTlpuLMJPpQHrtcQH0oWsnTm630488aS9ffGGLXX6bI3VzbVttD1n3375GfvZj35l0/emrI4+btd5+COURpxhcklSz05QoAQc64Jqod6xLapvbAcc9Y8CWT+FhvvhYht4fpwtSFAE3hZSyaAfxWfoO75TohkLlGAZfi6R9aCtxVLR/RAeUgboQyqZHGhC8lBx8VQAfkeCL8wSucyxCaOo0cJdCOl2BvxBnhLmbD1ftpXygDX5/AIKApoMLsZzBfQdLUDB9dpptO/bmKXsRT2hnu1/wNh4q5W1xjrqPAcazmH2ttS07PqiFaoz1qqtYsKOMUTagmeyFGoScG3DKEJdWX8opmzJquBBg7HZi1lhrTdv7UrORnpa9uK+MSvOTtk7t+Zteg4KY3kBRg0PtoRRx88aqL9AOzIIBTTozg0DPPqGS0Ecn79+803jR6AaoMHDlAZ7qvswONVvzDJ9/ZjAsajlRCaV3w0cbrTh0hkf0n/jG9+wxeVle+/tt7VE5aWz6ws66JFv1PfBoOAS5quvvmo/+OEPoEgLViPfkqboB9ETqE0mkfm+IMTyCTGrXKYy/s/UiICPV4TH8iQhIQFOd+DgDixcvllNTSrrj9YKBHXm/0/df0bJlWTpgeDn2j08tAACWmskgASQCaREalGZWbqqNZtsdjc5Q3Jmdvbf/pqd3V+7h2d2SJ45M9NsstlsWayq7tJVWam1hNYytNbCQ3r4ft81sxceASATqK7u4tyI62bP3nsmrl27wp49exUNtPwqsXnvevzLezbhabq1e+rzWLeiGal4Cpfb+jE7MYGUtpvgALYP/Gve3FsQpjDUmb5jI1DZSxN8KAgClfUK8/2m8XksTS8BS0WyMDuGXRvq0DE0h8kZDrTiLIp6X8MsxDKmCiChrHyIGqyaQpCLefHdd5Gmp+EsPc0tekaW4DFGXFJRf7g0zZFSP0TR09PWQhe1dBeqfYxbfTT4XBiUmhSHlJoYVBsLsjHYtHkdnn3qCZz4+DiuXO3gOQ5ULTwg8yX0NvXYKDasWY1RfSaX3p+mDW0LlyBQjTnZLpl7vj9u1Q5J0KiaoQ32u/RKxaN0o5Ew5M3Qv1zpUH3vr7EbHb9Ze9UfGQoJtjexMEvbpBH37NqBD06cRt/YFL2JGbNItax6pjCCQmEMG1c3ofXaVbZH8+J6sO/7OvS3+i/CsjTrWw1QrVAT+mPFed6leTrpnD+O0HiK7SFPs+ZkR/IR+dM8AQr9DL2NJHlKU0x6hqGlmNqzaXRkFP0D/batdkdnO/QNl+vXr+PatWu4caMFLa1taGvrQHtXN6/p5bVDFEZjmJyatcWIcfJ6vqoWDU2rsGLVWtpw67Bu7QabU19HXLN6lT14XavnNQ11WE/rfjPH6OaGLNbXpbC6No7HEnP4JpXIC1Qo+2n5b0kn7auKM+TxRnogTZVpekoppKvYHgp9GY4zVY1UPCuoeIgV9SjlalHK19GgbKDBIqSHUstrauuxwHLRWIe5VTVoXlmJQ83VOFCfQ0NjFS7PTaJ/PoNCkfKFvJAkT3AEoyjesPFIamqcW+ifBRHlBa5eswYjFMzy0swTVN+UyRRD5uWdx5vAeDQw6l1BGMNEhUQz6hRnqHOaitT05dULF2yKyu7iackV9YceeosP9O0MGQltemjOP/elPsePeobopm6dfLwV3hGw4PJ7AjkS8YoV/5NOuT/BbSh1E4SiQ5YKmIdaGOIiiKZKTChLaWgVR5ZueDPqqSiOPbANf7i2EmsplCtLs9hIzbqqrhrfuzyASb3lqe9hTE0iQaWxQJSwiNZRewy1MFDZSxIC+HqJC8hAZpmWYVh3P6845tBUk0ZVvVZYdGJegkrCQdaIBj8Hub0bYPkyP68w1FahXEy9pHPx7beRbmik0tD9EkQMxdCR0hAsq6yqaH/uTLjKJfg2WNQutDSL2LFoTQxKIgwcIdsnT0NKQ5bqLD2Gow8eweZN6/E33/kbTIxSiJbimKLlZfVjqFUY2pK8rqoC6UQJ3S1t7IcFKnFeIyUqYRcthQ5tEqpOZcCkSLgTbCAaeqHvku04pEd5hTgtR1sVo/73N8hytpL0o/aTz2zVkQwVLU9Vm3nfxlVNeOzhB/Dya2+iZ3QcBfbhwugIEvZp33FMz02j78Y1bN+2HpNj4xgfHqMQcQ8TTaALJVA0IE1hkC7yMv0AjRSJHYfryq8Pc8wazEvTXRpDCS6GQYDpE7h2zHB+ds4Egs1jS+noGk8XNV0CJKDmxMUbOj1PwaEPnk1S0Y+NFzA8MoEJKoz+oTGzzrt6B9DZM0Cl0odOKpXunj509fSgp6fXPtg1ogf+42P23koteWlFJo5VNPxXZUtYmZ7HxnwcX8wm8VWyV0NpHlWsazXrU5WvoEczJ1sMdPK0HyRqmlLI0StBrgaxKiqLyiakqDBSWe39VUVvvxaxunrEOF7iFIZpeusZyoHiSioTKoz8pho8s7ER/3jnSjxCAyDbUIVPizMYLOUwA8oU0iTB8uPsl3l5GaKMjW2F4g2OHSkNT6fm5pX2jpEUh2hoY1N9JIx4jvTVydvAZ5y6PYT6+Li9m6OcJCMZN8XG+u3YuRNnqTSCTJG80uIJPd/SJqDyMjZt2mzP1rTD77w3Pkw2si3u/TWNFebOJDbGmqSh46SLB4vaBXcOvIdKo4FKww1gK+SOMMQEZXERopwoXtPbw3ChTY9kkapZgRX1lXjh6B7cX5lANsZGJ4u2VHEhm8Kf3JjGRGsH9NlVfXRHnoZZuBrIaj2JE0oXLI3zqDyB4A55xneSE7qeqWSdso6y7BbIdHLnUcpg3869OHfypK3asAdMEhbS5uoUDWibKCZaHspbAjrGJtLi2rIFFz74EEkOBBvoul6MGZSGMALVxUcJ5fWPkq2+7kh1DzQWFazcsjoYrX2bDGVdsU7JTBJZuvtTLdfwpd/5beQyWXzv299DZUUtdcQcZik8Yxz8JQoWWcRxKgj2Ft33Saxtrkc3+0MfRLIH30YPtsWUqAaa2qVQFVTNXP0Ei7EAvu8WtQf/mcbAYUjz+QrtHoeK689AGXnaqN3O05B3S/uEAq2uImWe1Pe//32MjI1RGLMfZtjOop5XuG95lGYpbMgLM5Nj2Ll1C72NK2yXew9EwluLH9h5duxe7hSW1S1CTwsbsET197JQ1l/ghXJ094R7OdgtzXnU7uXFcD+vkVeiuAkKKhLypD0Ql7LRog2Le2T9tRTaPCd6zHPz0+xaGQg0wuiBWWjpM0TyAO+ZZn7TzGeiMIMBCv+2whyuFGZxaW4B50n206TvmWQaZ8lT21MVeCCexXRgQXbIWDyJK1RY9Fsxn44jm05gNT3bjfSYdq/M4XBTGg80ZXB0RRaHVuSwtz6LnfUZbK9LYmt1DJvzMWyqiFMpJbFhbS320kv5R9UZ/D49jQdZznqyd0MyhopUJU7SYxwdn0Rp2j0/mmeb7HmJ55PFMa4xI+HrVio1rWgy4dzT28cax0kjT3svW6L7f1lgPF0GnvejZ5U2Vt1zqikaavcevJeeYostoNDshSkNauAVTU2mNPS8bCcVy/Xr1zgU2W4z9nwbyBMyTtw7Gq645cULnAzhCQW3baur53KM6ym8bbjFnAPauc8CnreybgnuZlcXxkNjItT25kWMjM/ias8YhnkZWdsIOJXIoYNjb3qKP8ks6ZhAkQRb8J3vxI0jdKiiwhC/PehO104NcBt8oT4S6hp4NgU1RcNyAVc7KGB4vG/HBt9xFEZSJqqHCWWGBqyPJ3qgnb3JKdDWFTwOAr5c2C+F0CqfVdnxXYHyVrUiZUGUtU3vQluYK00D5ev/7b+wvXp+9P0f0XrJY2qCbZ6RUqYw0ZcNNSc8xTZPEqlM+sik1dk0MmRq8zKkMEQ/CbJARwlXxY13HI0DBg/BXetwufCkhGNaQOUX8nb3mnWteyx0va1fUcqe9yxBdRGFA/M6fGAvPnj/PXtDX30xVxjFwuQgUR/iGiOOMz6BhYkC+jt7belwY12eA05Cdg5xKQJZrnpDXEZDGbqXC2Xduo0jjQ66NrRX8ZCma+36pXkElGdjwl0h6xC2iNdcu/rFKWqiDCevtLWbb4yehO3qy9DOKVQfGZKftVxcqD61D5FN2PPB0gT5e2IUxbERzI0NYXZ0CIWxYXqcQxgfGcTIED0NTUnSIyuQRtMjo5gcHMXocAEjo3MYLpQwu5DGSDGOMQo61gKzZL45jpMPOX4+mZ7H9ZkYOseBroF5tHQUcOXGEE6d78OpCx04e7UNV9p70NI/ih4qpZF4CtP5GpQa6IGsWoXK9WtQv2kt0tUJ1OXmcX91CpvY2ym2PTVfwir2/UF6PbUNaWBNA6+rR1yru+i5IEX3Ri8vUn7Y7IbGLRWZWzTiUFt25PXujrESGcZQgyeMUfGRwtuAY747R0EIyxPIkzY+/BSs4tM0bibIk40NDbRBdI514tjTCjQd625NTUluT07q+Q1TdF3Eg8rL5ScweR7BYtzSfZmKB7RLyrEMAqUSsZw8DRHJ0g2WH98MOh8uUKjOYAlL7mEuElwM9fKS8zS0DjuHeKoBY5k8OnJZ7G2uRTNd3kpeeWo2gW9fHMTZaxOYGh5FdmIAs/oGBgeUrav3g3LxTUfXMlcDB9bpS+qx2PJIwAhMEQmdVa7PUtK8RjGVp4tbjVRxCPcd3otPr7RZB1mH0BKToDD3T3UJnoayZB6y9PUAcvu2bbhw+QplNplV84u6T3moMy1c1hu3gCUKpqzeS5RPSGe5wdOIlJosFA4YW8fO+m7bvh0H7z2ITz4+gXNnziMZpx9BOs5KuCgrqm4JNr3gFufA1E4r+kzrzMwkXeHV6O8eoHKhNyjhpDZIsAfhrnYFOqtqMnF83wQUhyh0gySkCW6+xiDcX553gNBub0w4z4oelbyqBHMpzeHhh45gfHQYFy9d5bkkpjkQMacHsBP0NlhvexdIBgPbI2+CsFCklbd/Jy5duAzmZPSw8tnXTjE4y9+lCcWHGnSLx+XnDAN9hL6Nt0JnBinOMoTKWwoy3O/LtzrIozHal2N5muc366MQ98fiRaG8ZkMqGuNrhVJeVFbEIj1P7Yyc4DUJeh4lfcxrrogE+bmCZTSTN7bSFqmNz6GRwllPZK5Taf27kUn8hAqje2gWvX3T6O6aQmt3Aa0DM2jrmaCimMPV/nlcHJzHhaE5XBymFzM6g0sT07g4OWPYwny6We/hxCSy8QIVRAxrqQgypAxKCRPvE9N9+C4VYG+JBs0QjTU90KaBJ+W5KBs8GK8wiaHeZ2ls0DszFWhpaSML0TMVXYzG/r7y/iuH6FDnfPROwfqflRCoPhYKZczJO3ZyUoaZNnPNVVA+trXbcw15wtU11ajMV9qS271799ruvrbpIvtWXqX1s/W/eFQ8VA4ady62RK4QrApleDso1wmJWKbe9p4KRLDgs+6OQFeaqohAt/n+8ZWTIFUCUYOaQkwPxIsZchuJMYMkTrCfP0UK14vTeHsUeOVyP0YKFN4TtA4naQ3ZaiUxrISVpglYIingNKiLW3nERVC9/HmBqmChv9ICH5eAjSrN6yV0s1kM9nRi/779LG8Wne3aRIyCyQ9CExx61mFKQ/cpH3W61n0v2Ate3d3drLYsVnWq5qP1giBrpQEssPJvDaFjF0PnWhvy2KwmnTNF5xWEvCHVnYNCz5DEbHp4Nsd6HHzyCWzfvg1vvPIa+sloWm0RpjD04RhnxZPp1C4JF9KhRO2h73trr6uKXBpZDtqhgSE2n23SdWJU9YENMN8mqx1Bh3YuoI4d6oqAAVyrAuhCQXm+DsJSXNd2ttujrUJhUipNq3e2gOe+8CybMod3336bWWiKTcKEQlHPYGaZp5B9YsJU/Rhb4EAoYai/H9s2b6UVWokO7e8jWvo2WpsZF71MJ/JWhRI0wWpbbGuI8yKVYcLfH+sCnrN7Q9yiLs2UxU1xh5an5RXyJQZlsATZN+of688gTIhSEuw/pyh8aHQR8rzuEV2EVA42zcE6q37aKUGKhY4rquiRP1yTxShy+MuuafxgegHfGpjGd66P4XzrOGZah1Fqo0Br6wI6O4GebqCX4WAvMNwHjDAc6QFGiYqPDRKHiaNIFmaQmOZ4mY5hJpbCFGXDCPl1DQXmGvbTDHn9Crv9ddYrRf6f6h7C0Bj5nP2epL8T0wIHtnnRgvehGsExomnohroa1NZU4drVFvIOZZLRx9OZdLI2+1siVH9Ex34s3iEaqO8sWpam0Ma2HuErKt6m+cBr9Q5GG+WOvpch0Ltfmqrq7enFkSNHcObMWVty7abOXX9rGlMvUQpcCco1oINQtIPF9LuBRCxLT6M8J7XD/dwVhMsVuuyUhzAIZRJEnoeEm9Zfp3NYiFMQxatwKZbBcGkaM6lKMsAURun+ztEtLk2PoVSQ0pDrzYEvxic6y44dbH9suMWXgSV4oqh4BVYPn2CBtdSBTmlEKG995zpXZZr84K6NaG3vwDQFjeazTYEpXwlZY8aQF+VXkpYC67d5yxZM0M0cHhpmJ9Ju1GBkh+o+e0PTXe5+xUwKXYJB6A+FillodLSDMqEpy5qWCoWb0C04cKtudKwtP178nd9GTX0dfvyDH9o0lNblu0ESkG0Q04W4Bo+NENZTSoltTLNdq5tXoeX6DeoppvEa2x5Fp1V/G5ie1gKLlh1bfBF1m0EUYbqPR8aArmNaUBSCRQNEbXcohaHtIVzfFnHf0UPIZFL4+Xe/i3xtrX0/REIwPsf8RHtVW/VlW5Wr216e7fHH6jPttHzx0iXWZYGk4b2kvfWh5zsT3ATWwEDk8lU2DP1mlffXumPGrX1lcaJND+s6If9dfu5cOYY8FhWJrpVXyLjdq/Y5ZAcZz7n+VVyhhItP13HZObtPeTIfy89oRJ7leT2/k1Fhw7c4i5Wk77FNG/Da2Rs43T+L622duN7Si47uMUx0DKLUTiVBRREb6EN8aABxva8xIsVAHGdcOLF4HJsYRXxijEiBrxV6U9pWfwGFuRhmk1n0sX4VVFS1mThOUcD+ZHgcrw8UUFuMYX22Ftcv06ibkqwYRWJqinUum+rUGBVRyTthg8faqjxWr2yyN/+TuQr2LXnE2szrdI9oo7ih/l1o9P8FYPl9gZ+Vp+SjZghUlD2TZB3HKDt27NiJnt5eVmXBnjc1NzfbvlPabaKpaQVOnDhhY1FfOLU+5DXqNzeOlTGRmbrxVA7+nOGtwWoX6ngLcEpDl4Vr3B3R4ecCM1fx4Q5XFn+iDBQXkuOE7DRtox1P5eh15Hisl5cYT8WwsyqOqsIgOmZrMa0P9xQGyGxjSNFlK9ITsQ3rSJRIaVin+rgvLQKOKEcWd87qpWpY4A/Crz9pnUmdFkvSO0hWYrBvEPu3rcQCGbV3cJTjUILDWSLsKXaOQgFL4r1SGpqK2rx1qwmZ7rY2tk1WvetIbbbohJOrmYPy+CKY4Ikq7VCBe1lPyGNZTlIYDO1BcJKuLBWfGC9Hy+zY88+if2gQr//gxyyb15NO7g1iDQwxmlNmi9aoa4/pCpar3UH17oDqsWP7dlw4cwo5DrJ53mdCTvS3+vu4tU03K+2zwN1jxQTQ/SqLUUP/467hr/7LFKcpDLZd69u1akjPMbZu22jLMfWJ2cr6BhQmCijRknbTORR81ka23/pR5XlBaXlrW5k45dggauvrbaVKZ2eX1VQepD0UD+2y6ltFPOp38c+lsa68zvrRbmNol/LH7r8d8kfIg+XK42aPxp1348CjBLyFZWkBrc8cLSxufa8+F5blQ5CBpCk5mkGst6bPikjS06jLZfDsscfw8pvvoatjAAujkygNjqA0QAUwMoDYcD8So/1UCBy7+h4/BXmsMO6el+mZiqabhRanQUiMaXECjUItq9fXHGMzHPvTBbJlnI6QNjiN0Wsu4cxYP/4/XQW8MZJAZ/88Wq7Sax6bxFONaSTGh+m00GvRs7kFKh32l/M21B6i+pdjUVNANfkM1q1ZhbNnLyGZzbEczWIssL2iDfuZ4eI4df2grvOkuWtw/U4oz0CJ4g3jacXduNZy+OLoKLbu2Y0hGjBT01OsTgkbNm7AwMAAlckO+9ZQZ0eH5WcKz49j5yH5Nt9UWaUxiCrjQEfL8VbgzjnuptKo/59cbkQ7c7vbbg2uarzH/vWjX6udTw8hryVhbN6fjiT0LQvte5PKI0FBNFdZge2VMTSnYzhNXtOnQaE9jsbHzcsoLehdDWpTDX4xg5ie5ZQLYJW0FNw1dsJOumstGuoVxRW41RUlSnet+k7nsix62qZ2Ll06hxS9Iy1/jOa1Qwf5fCXAtcprI5VGkgKo7bzb9955GnqzWBalZ0ZfLYu428uAAptof6obaWZTUgxNolsoD4NKg0JTPoy2htBbobPDw9i0ezcO3XcYly9ewrmPP0U67bYYMKEZhOdc0RRINB2herF+qpMJOlVDXqFowoG2du0q9PR1c0zpG+hqN69Q+yNcbJNDn9dN6PIWuobfCvmrwC7k9VKQngau7W4qTspSU0izs1NYs24lB9R2fPjBp7w5ZvyzoKkXW23ENpuF7fvOkOlqL7NUUbbFO481raePaB06eAi9FEJ681bX2HMtE0IE3RDxn2XjBK5AF3twMV+AQqc9bg3h/gA8VH3K0a6JUNe4+OJ51yY76c8tRZ26xTXuxGJ9LdBxiQKCUdGGgriCvPbYg0fx6YcfoqWjD/P04vTS64KmlvTyq7wFvf2tt+onaWRNcuwWJug56CG8HsZPcSz7h/OGHONCTbHIEDH+1DQL47SgS/QOK9iHK6eGsY2K/Ma1XlzvnEaxdxQL/f3IDk1g4Fob+vsGsHnzWlTmYujq1pJUygqNYfWz2uYFslYnibcrsxlsWr8Wp89RaWj7DRkW6toy3nDemqeV0chIYtS5G9RPNJ4sH0uI2MS8C/G2RjxlhqajtMx65bp1mKYs0Vv9gs2bNtt0lPYz+/jjj1m1BXu+aC8Mk342dkU/hvoThFCxKCrwZRswffFQdfPRzwAqjdole08pb2viHdzsQBe6i03A2b+OXS2NFT2RNOilWRMlCmYOevfRFmKWwrmyGitL09i1thkXRmcorKkgCjN0VydRJEJbd5jVWGZBiFBWjH4C0y8HV48AusauU12W3aH6a97QjEQKKr1UNVEoYgsZcmKkDwU9CDalwfIDg8lKEzMwKwkxKY21mzbRIs/i2qlTVIh5NxjEiMaE7vqoHrp3GRiTiWA+rrra1J4JTCHT5F1wEEiAprRVBq0ovRB5+LHHcN/99+PV119DT3sHclQY9gF/FaOH8jYwaW1H0xSqG9HXKYCVK6XB/NXcxkZtxJhDZ2sXBTX7TPkZDRgxetyO/n8XYN5sq/okKAzbS4qeavCytEy6aUUDnnzyEft87cSY3umZpyAgv6huap+UtilGWZG+vapzGe01wFSOvCj1o14M1JRAd1e30SL6KA6RPcBuVLt9m8vysWPVtQzcWf4yWWfK0aDs/ghulbYEdH45ChiWC7tytHMOXdk+TcA6B15z9dcx20rUEuZUMo6j9x2iJ9aPq5cv2edH5qgItL1OjIohTm8iqdVojC/Qiyhp4YHGrVZuaWpZ/UFFIG9iEWnhhzl5Pz6CUtc4T5C+2elxHKxLIRfL4Ny5dsyOzGKeFndyuA+xgRFMj02grzCFC2c/xq5ta7B953a0tbdSVNBrUVutPU4wq33yGvOZJDZt2IBTl66SxVNmCFr55eMh8IdopWxEkYhuEdXuGGz8WX1C6HOyelFuWDW9IUh5mM3lbDsZrfwTT+rjbtoJQG06+/EntjfYvOgnT4N1jp6XKlT+5XC3lf0coD7Wn3Np9acS7M8X/nnIH4e60+L270ExXbfA8cU4G6ddGLWc0B5wz9KlmO7DwoQeiI2iS0v05vPY21CFFTla0NUNbjdNbUOi/fhlyZOwIrxI7sn+2eCqQOSP/bu/wKBmIRqjSLBo6anehibxWT+t3BqfmsNpegzHjj2CAq0YPTBVhzsh5isiYD7WRuI0rVN1uoSV4w1dryBc7IHX8o6bQGm6XsieAb1zV5Yh4xRuUhjaCkS7fs7zBsmwo1QYcl//5I//A0ZoiWnOU9tG2MBnWyVgnQAtQw0WG7AuE1NsfuA6uixgbmYW/Ryo2r0VtHz0XMQB7zETzWps/SxeckLr7tHu98iCjVxCVc0JNClMWWTOwyqxXZXVGTz11CN4+40PMErLk1rRr1v3bVEbrK1BOIW2+bjOK06+lKuvYvTdAr1drSmqVDplrbOy1W6GwWO2Oi0DxwL2Q3TxRaGjC8pQnSZcflyedhPqx9HnlmjlOTTBV4bl1rPV0crRMWlgdBefOJ50cdcXc3PTaGzSip40Tp8+QTrJc+ilctAU1BhiY6OGWsZrXoaQSgR6HimlERQHebGkqacIlUaPwy8J1hY9hlQUJeYbn+vHyMhl1K+twXEqhb6+DhT6rqDUfwMljsWJkXY6Mh2YG2pjXyzgR9/7CW5cv4Hnn3sGlRUZRw9PeNdXDrWvk6Ze5YGXnLS2dBujy0F0MtqQRhGdRaE7BCOmixpzhXgI1QfRRSWy6ry9yDc+Nm5La9OpDOuatLe/6+sb0E5DMFaRZ5/oWQbrQhRfWb+pntbHSvC4/PhzcUl1bokJmKfhCeoDB1Hkc6DsJhvY/ojxELoUCXsXN82qAciBbx+X0fYiuSoU81Uo5fPYUxfHwMQMuoo8preBgiwVMpYsFQ7waHrIGumIZmXdEtTSW4NV15gmJAhZP3pBC6He7LSxoT7cs3sHkrQAtJIqIUvXOoj1UKcYc/I+KTQKn0ZaqFr9cPbd95CqrqFMosBip9o9JohdvSPhEpXPiPGvQo/yMCL0x0xPsF5pMtcM6ZGsTOGhRx4kA8Xwo+98xz7+4zwKx0T20DowmE3XuHqHpcscLq58H7oHzipPVr3K03ODErZs2YzLrZ3MU9eRSZWP+sEYU+ja4/JzTBzSXLql2m+EZeddGkEXigZldHBTc6pPePhPTzCbxGNs99nTp9B6vY2sRENDPKIBzr6RkDSPypSj6hrKYr0i8Mcqh6CNAdUv2mpaL2ru3r0bV7Slg6YZ1V5dbwPV5RX1oVDAQDm5I/drOVvUX1MGls9yuClNxwEVMLRDhctw+bVLQGmsTaCtVYw/RmMpREdfHYsHtBptgYMrU5XHs889i9de/jnGR/VsT+9auQfWmJ613ajlSbjlyxyvpqCJXhlZvWys6Fh9wTTjGaYLVRX2r33lkHU0/uF1czPj2LF9M2ryFTh18gzmNL9f0HOScdsCRt+8sekuvajIcafx0Nl6w3YWfpDedob8OzE6gjiLjaVzmKeHXEzpexwxbN66CddbeqB9t2jSurqJT8yY0NhYrKOrj2jloCx6h6A82MjoRjXYywvjcYVhvCWN1zSzsHHzZrT19NnHu7bt3sZLkzh75oLdMjdNOquuNpaJGt+BpgIFd1/ROwLV1kc9hMJCh94pGoSQENIYugHmG2TMM4e4Hj5pXbVQD8UmRzE8PYdrZMTq5BSaV9HDaFoF1K8DqpsRy8vjqLJNBvXA1z53SWLbgyTCslYsgii8HFQ11sUJNdbHQiI7QZ6Qpjb0RrRekorN0GpiXV/+6cs4ev8B1NdUGEMlObjM4g4dbgxPYJqmg7LaVppl2ydC7USgjVjQl22DyJdtms8q5uO8SQoi6ZH5xKlgtVunypClPTUyjFXrVuMLX30OnX3tePett5CuzLu5TrrcYamvvT0sF9zm+IViMle2WePWRxooTtAGZeP6aoFNpBIfGGZaDM3NKzBHethzBmtYqLMChqE9Pu9ydOm6JtymeDkyjeC8CkbY7KhjjcbyMuK0uhKYHx3A0SOHbS37jSvXSZ4ihYymMV0bnUeruBdSKtvaFMpSXHTwA88rF72boLqq6ItUFg209jZs2cpL2QYqJVNa1ueqI+vj/wyYrcXUjjJ0VqAiPM8wKBxDguv6pWk3g9IDCsqPl6MH5mXlhTYvB7VBbTFF4ZH0VfuSnueyFNhf/tpX8cqrr2BscJhWJr3XyQK9jCISU7NIT00hbg+x9TB7yj3QluJQPxiSvhrrekEyKBSbJiT9g8AzvvPXSenPKw96tIwf3bsfZ0+cxczoMGLjg0hOUAkQpTzi46PEccQmKD/oAc+NT7Df4uju6MDrr7yCDatW4plHHsbaugak85WI65sftQ0ocGzO0XJvWrXGngVqelyzGFpZJd5zf2y/J6cjnT8gqo/DcL0jZFNv5n13aKEZYcpVfcFxTdqQEnpzCrEc5Q3HdLI2jzEqZ72t7671EPIMvB3Q0v9+UL42I74SFpZV6G6BeTpiKKJoSPAEs8Gr1U9iECqOGZJGVormPqk0MDmD6YlZjJDKNauyqGuaQ7aRRGtoRKmmCfpKmL5DrK3N7ZmIMboGMNEKLCuLaBaCoLxJlmRi264p6TEy77FBK2KTke3taCoMe+hemEI6liIj9uLq5Su47/AhZFJxji2ttqHwZie7Aad6sCCmaQdRzYlrG2n3VqdOedq6f0eL5R0sMGHEUEut1CyhBrKWlSaoLBMpVFTV2DK89ft34fHnHsfP/uZlXDl1xcrUg3tru7KjELRtkqUwJDzLlIXQ3FnFWRd5Te6dDa8wRAdaYSKTqrQwMYX+viFs377VphLYfNbFWuIgtIHtsbKjdrmyhE4RKa46LNbD0N3EkNfZSOOh0YE/JtgYJhOoyOcwPdiNZ77yApXCDM7quRH7361QY529sgg7fZpQCmUpf0OVpSJ9/XSN6EK0bTn8HPcceeDE8eO4/7777fqUBIuEipS59ZOvm9IUJ0Q0LUeVaXzvpmmFGiMBedLX6E6h/Gp3/yKWga/TzeDrrnFjytjzMHnXPSui6M2mMEtB/8CTj+LSmXPou3IDdDaxQMMuSeMhTv7TfnDa0FNbkWibEr0YaF9w5Dl9ltd9aZO0jPqaGRiyCtZuD4zrobXRzbdBhs+B/fvtE6hXz55j35TMup7XjtHawUCejqxt8nuMHkiM17mH7Rx7pTiFaxE/+NHLaOnpx8PPP4mG6hy0Z2yydh3SVavJYxWob2yi8aXl/5r6djskixa26GQJ6Zb2190if0g4HwaesLHg00M/EDUDo8/5TjF9gkZeXUODPcCvravGwDANt2TGblGdPKlcvuWw/PgzQdfeHbKW5cf8WXJ8BxggqqgLHbEs4tKCoCCx3J4+c2ZJmNLQvKaUBhmgNLOAVrm8lQlskp5YXYWFhlqgRjtj1qKkDzhpqwB5G3oxR4QWOlEcQTReFNoAcYcGvl5WRx7YPHzoVAkQWaiqlzwOCpJpWlZV1XX42Q9/ipUrV6CuPk8e1vMKWWUUGESt5bd8yXjTZGa99g+tARdz8LxOBVhCGwuVahV1dZUgMi+DcbP4NKDJ0FoyyHwLU9PYd/g+HDx8GH/+f/wRZqlo03FNn7j8JPRstRSFpnkYpjS0hFLnhVSSvNBq5WkglMUT0t05naZalfClRXbl6jWb29b3FOw2A3+/Hes+CU3S0AvoIEQjQWoCtAz9dbrXFKQng1OYnh5C0iBBZT05NYoHn33aPo351ssvI8sBZh6V8RXLCcpRYXDZo74tR6arfDsvdLyp+zXVIRqmOVgvvvuetX/Xrl1kB/KDrFEzEpyhEC2ZXALM32hSXsZi2aYT/SU6Fo1D2m2Rlzpc7J/FtOXnF4/LwSxo1tWmH4ORY/UnmmJme2gIpKgw9Onaew4dtJ1gj7/9ti3h1rSUGRWkr3lx8sypFKQwbENR0nDRs1SbWHG1PdDBGuzgVvVT3nquNE/U1OD6tevw9htv2ji3b9kHXjZ+lkHkMM5jKTHtUSdvWsp+jnVMcsyeud6Kt+mpPPP0M9i9YT1WVSSwpakG1eSlihpa8NruXbMC+oSDxpgpDvatamf0Uc18bYOBvdiMzwW7XaHxCG9cHDguHnhH493GOWUZjb8ieW+CNG6kvFHX6DnHwOgIZkR/d8fNENFbIVHh52JZ/9wJsvQEMlpyq4oH9FAW/VwIDV9CZB0upuvPnSeKOdkxZiGSOO5lP2KuDqmaWsw3JFBTm0F9Yga9iUqMFcgklOG2f47cX7m9JI5NpzDZZAvbL7BBocRQTji+FUTpymD5RVImzJRMJI9Gu4bqhb8ZKrhtO9bj4rmrZGzaLmZJaQqHw5WX28obtunAgYP49MQJ14kS5lZfCQgeK015iwE1YI1ZHMMYhygedmoVMl3Kwr44QMXx9PPP2zYDr/z0FRadpHyN0UjWElqVReEXIY/n3QCWlSjnReWqpeVo4CPWZ0QpYrns1n5mk6YCHB4axP4Du+3Tp5OT9BTlFZiw8G2ydrE8UY433SzYVIFbYHQBf1isWfKig9FCSJpq/6xYEXv3bUN9bT1+9Lc/oA5NUzlSyLOtegkvUhKMh2m2JYMnAtXLHRtfCsJptZ3XhimoeGUV2js6sH//PrS26YErs6WgkhfmBLrrV8vAygihi0bHivNm10z+qgzFPVrG4T5BuPZWyJ+b0ogOQr78VXYhSx6qXFvAIbT2icbiMXKQVu0QE+k45ji+6ims7tlzD957820bq7bbLsebvecT8ZYT2rbDqpjkdqAKhdCXb/ULdWH/ysMRqk5aFafPuVZRUZ18731kslnamFIULJflOaUho4jIuug9Bq1uU7+Zh6B82L4FWeUVtRS+GcyNT+HJ++7FE/eswuHN9di6tgFDPN82NI7JaeZHJampMWott4rKjAjJF9GTf8zY6kywd57UlDtE9+PBaO/aaYJLddU4E2p2Qp8tqKywFVT6rK2WuhcK42igx3Hh8nU6U5o6l7fF+qqOVlfxOkPjM6HKscL08zkQGOQOgZfLTGdEmQf0oLzuFAOECgcIg8BCDTI2TmgdImaj4NEcsrmZ9DYmxjEzPolrswl2dBwbMimkG0jIDXQ5mjcBK9YDtStRqtTX/6pQyuad55GmpUABLmvYTV1RAbFjzBNQ50Rtc4IgOra2M2rIn3JUJ+jZgFZ5kJkknKQ4Ll+5Rq1fiY1bN2FWc7Qm3MQEdCuZp5bwaddYDdB8RQUz5inTaooo5PXG1BLIDE0oelRekaIQI5GBKBhT5rEUUVVbhS9+7cu41nYDr77yMh0iDhoyjDZZtOkZDiIbVIYuHqw+1weO/vKsypGJqqZB5AWJEe02/jBuQnTUb6bW2GjlWlsM3b0W8nqds6RQrsco71uB0UfoBJuVJ7qRFpm8hMYU1q9fQ+tzPd59+12SRZ/S1e6mar/a6wcP89fyQ00tyrPSC1s6jmhgPKi6+EP9mNAn6H6hBJEEEmmuKoyNDGNI779s2kSSUpCobkx3rKSIu52FuEwj8HmHJH/OylwOy9N4rOtuQnfK42K6ElwbF9NvC1ZxH6qBbI/alKChMs/70uTb5599Dp9+/DEK9LJnNT4JbhGHG7uOvyS0ZcCprECERVCq1eIzquLuY3+Tj/TsTApCnxfYTKVx/NNPUVlfT4XlBbq8m8Dbej4n5aE0nrONG4X2jEp9yGznyIczRaSQxDwNjpW1Kfz65gb8zqb1eIE8/KVNa7B/7Qr3RVFtbUShbYqLYzMWpwyRvGDdQjtMTBpEKZ+DDqK+8EEwzKztGj/iJ5MFftwT9fndyblpVNVVYPuOzRjl2LNxkaERp4xCHwqs36PMlXAXePdAlnF/ZRS5ewiVDmiDV3GeI0OJmR3KKpMV6JjPrHR2tN4IdQ/ExzGn3UcnFjAxtUAXMoWV8SlsakyhoYmduELfIl5nn2YFLYhSlooj7ZRGSQ+0hJqjtPlJrX2WTpQQcp1vuERB+mPVM9Td6iymI4pBxbCqmwQJcV5bRJ+7jC9/+UtYGBuhFyKm0vSYFBStNZar6SkxSr6Srq8fUKqDls6apReYxCwMMcpyxvHnpPyY5xwHSNPq1fja17+KH/3oB7h68QIzYv2MjmQhDSgNJBswRBtYOi96qy+IUhBqnxoYtdUj09QKUUSnBS7u8tA1ZulpdUpnJ6qrq8jXrKNAddfFdkMZBGHp0WdL0EEZCuxen4nooz7zSUkKMj14T2YSOHL/Ybz/7ns2t73AfrDpEikL9ZXqaahj52nYW80so5z/lpQdUKBQ93vBaNNURNvQkX1z/vw57NmzByUqEO3pFQ38gBGU5Wd5/zKwDEK+hiFtGQos7g6cZ+NP+bRF4DFP2wer2JfyGr74lS/jwvkL6G5rt9mAlDw6GlCuTE8j8ZhozTTLvwwipRUwFB7QQ4i6aV6NHy2DTaOqqsrihYlJ62ut+LO3+lVeUA7G4w5j5P0Y+dOuEd+bASWkwTA7jyLzaGqqxd6ta7AuPoM6Xr+CWTzYmKPXsRaJGsoVTU9RbkhhyOhckCHIOmlUWPtsnLt2uVDj6bMwXOMa7UIBQ5HLkD+STYYqQ2WyDokM5rMVKLA/kqV53Eu+myhlUdQzTRomJq8NGJbR04ErjwUuxj8Ldd1n4S0gGvH2y2tuhZb/bYEnSRx3kYubAGKB+gvgLF5eZ881HMpysS2hxZAanPPaamAAGJpmR8cwzE77vao8/h8rFvAbewbRuIUWwUoqjbqVtA6oOHINFGQ1pjgW2OnRy4KR4mCn+853HeI7yLfZKQyh6u3ranEfkgkTxqSufprr1nLbi5+cgL6U9tw3vm6DKSWGi0kBsEyeXygUyLML9llGfdxIaaqH20mXqDqYJ0H0dVXc9ozioBHal9qkPNhFB48ewRNPPoHvfPvbmBkcsl1Hk1QkcasblZqsPXk9ijPNts3WlIEXgJGSJu3FyK6NS9FWcDA0ca0+sjSFvJ5VlkWfyFfi2tUbqKP1l0xrOkF0FU3VJo8C5ekiRPGG7/syfoggDBzlo/aqnzzoc6UasBlaXf/4d38HH7z3Lob7yB+si3t2QVQbgxATPaQ8ra2LA9jaoLaxeE3ROQW5iFbHUD/RQcgy1N+qt95zGaWyGBjox31PP41pesRSlmb5se4yFqKVN0QnaoQC5f/LQAfKcwnylCtHwJj4mdaJO69nbfpdDF0qf0lv9Z9QfCYLe5btvf/hh9HTO4Djr75uW+fbA2hNhahPJZD1DtOsU8q2VoP5lsOicCQoLhQ9A4TrLeCP9btTGtrmY7ynC4cOH8KNazfsK5Jz8vZDX3vetlD8bXzN+shAYBm26IP95tDzBPlBW5Oki9Oo0HokXaO52sQCalDAyiwVVaIC6coaJzvM0icPEt2zUjbBMMSYt4WfB4vXSxZaHaN7w/0xTTgjabKDqNmSLGVcRT3l3HrkNu/AthXN2FjXjPd75jGOLK9lPiSbvSoQsrLs9OPzX9YnUT/cCj8P/HWBz4SJWKZhyRvht4KoCsvqshwCW1rcKs5j34AQqppm+UdrwiVMGZrwzNkKKdQ24p7mSnyTHsaD2QR2ZVPYW1eDeFUDrhZmMDlLAlNwpuWpmB/qUUWYYFboynRTQzywkOWoHgENQkiwdLsxOrYWhWMytuqeojsry/PJJx9HR3cHJiemyGNkOJYhIVLkILuXVnFfb599alNTVu7FP9XTd5QGi1APuhnanC4Zx7205xhXbPb0M8/Q8qrEz19+GZODg/ZCkiwqWdhaHmqDQ4Mn8jA0oFmGBpMxhcpVgWR7NkODOvTFElBbiXapzgtVP6OdMGlTBxOjg9h/8KBttWEPLlWuH7iBwQKTqUyH/A1FlpetuAao8leo9ntFpO85a449k03j+eefw7vvvI2WK1c5wElLWpUSJItvtat80cHXg6hSTGGwfMVdqa4uFpZXw/4I4bQHu499asmsq97OfeSRh3HZPn5DwaX08raq7QQzkCy2LEPCLWl/h+Du9PeToIoZjyvUX1Scr4fOuYvYDhkvPJCSMD4TvwlJaxopVLNYt3UTmleuwps/eRm5mlrzcO0LjqJzENxa8kmaB6VY3kKLL/7cBMGbMBpYvdjnFNLiefW36lC1osleUP34w4+tn60/Va5C43HWR4q8jO7KzpQXj/Vtc+Ml4yu2jxgnz0wlS2jetA7N9dVIUc4UeP0nc0WcGxjF9PAwxjlW5yZluFLJqFyG0fs+waCwAhyq+p8P7qqgSF3b/XgyGjAk7Rf0HEMvMOubIDX1qG9uwG89dBj/7f4deGplPdK8/9ToOKYHJhAf5bifnsACjVinJD2K/33dnAEkULmu7NsD62S/n43lYFuj+7jBrW4QCm6VXo4BXDUcWMyI5dKM3BHhFDrGkdKIUeMjVws0NOLpbc347xTlNVVzJTQtJFFVE0f/9DSuTleiND2L/CyJqC28iXGaPXonQsqipI9BiFg6NMZh+QrNohEz+fJDHawDVb8QZ9TXV2E4bXWnNaSlr+q0qdkC9uzdgfa2TvI0zzE/ufjz01PYd+ig7Zja2dFlTGsPqbXU2Oqla8vrIRqwblIYokMqaS8qvfjSS7hB4fzRRx/aUsM4B4Tm6bVXjg1mE5CeaTSwNJiVfWAeG1XlDKQgMLyOHTorimC0CKGnhdFI9VO7pchK2Lx5EwYH+zHLeugBvHkk1j7mI4ZlsCjAPFih/FGeFvV5C01huP7RsbbzqKjMY4Ze6NPPPI3zZ8+i9cYNt3CCA8UGtbWZZdmAUZlEKQvVIWrR8rb6gIn+yEDX2PSV/YW7eIURk1VSvxCnx8eQZb127d6Fq6yT7YocrGjdr7Jl8bIu5fkHUK6/LHD1JaigSCOrGq7OgnKlEdHa6C1eCzSXRU2Ll4Lr6GOP4uP3P7TpIH0O1ZSzLHryllYo6aNP7nkVy1jWwMXD8nM+ovJVF5Wt+ihURDxF6179nsikqKSm8aWvfYUG2Xn0cNxoLLn+JV8r9PHgCVufs49MgSl/5Sm+jdrplQYNnmHW++r4JGK11ZimPBmfi+N/O3sdn168hEfX1KC/ewgjQ+PMlrKEbdfKTm0HbwojCOTQHqVZ3JUd4ktQgT8KYDJQilvj3ehB2qfJQxl6GBl6dRU1SNXU4JlDe/Av7t+L5+IzaKRMq8ynMVGVRPvlQUwMaKv/QcqfgvVLGPfROBAuKfWzIcjluwH13t8LGI0VuiBKcF3LuHU8G6wOUcOpBPSCkG2XPDBAV7IEbcWnT1IiSULQpVzP2j5YUyJOYnMdGa0ihxQHsV5ok9KZF89wIGulkVYZactsWasSxmGFiAZKSWm8zpDMCqF5OjwfGC6g6syO0I6f8aLqqI/UzKOqrgEXzl9CDZlwRXMTqhkmeb+98JfJ2KCrqMiTMSRsmbcUoykH1UXlKZSVpWW0qmvaXqSanxhHZXU1/ukf/AE+/fRTnP/0OK0qUsysnyIZRu+QkCb2/QNPO02fmcUvuvppGYl3iytNqFOLYYT+nKHaqp/oHj9gdJKDUw+B06mcbRm/enUTjTEpbLbFaCXiKwPHhD67CJw77c7ZhWFw20DycX+sLVjGO9rx8FOPY2B4CNevXmP72BZPA9viXErKBozQCZUwHSfB5t47cW00ugRUuxjadIZHSzfgMc/LijUFxPzcG+Vz7P95OsFV+PA730ZdXS1WUXHaQ1MvdN0UldpgIox5hbZ6UF18fX4pyLxsxVD48/m7slwQQIcmSiSkKIjlcSwImZaqyKJYGMfv/v4/xbWzFzDc00uSau8uvWTnl7NKefA4UhgGvkyjtfiEKH6xOgQkBKGkkEkm2MXPmpKRQCf9hPpC5obNm9FQW4/zp84go+eTytusfZ9vCC1ra7Wrg6GVYgsfYnoArr11WH9Nfy9QriTJJp3X+/Fv/su7+KNXP8bLl67i56+fwJUbY/jpRxfw8JMPIZfT9G6BMoPKMcN7SSPbPVp9S3516PrWflXm7dCDb30ES47DAa+Pg3IglqHco/LetBlrK3hSRjDbnyav31eVQ2VqFqOpGcxp1aJu409AV2aI3DmaNy66ejRj5HPwlp7G3xk8YS0sZxpLU1VDXEJCA00MpAdQjOvtzGwdNq3I494ttcjqHVTN3/OO82SuK+zAdK4edbTEV1RW2Cc8ZwtjbIjmnmUhTRshTICz02W1Bgs2DGob2FYF1cGjpfM8yzA3WqhTYhzWUeUneY6ZGSNx3FLQJzAxMYGjR4/g1Onj1AN6DkFVR+Jv3bLJ2thyo516Ik2jWMKXaGWpHOeWq366R2l6D+Ce+4/g0ceO4Qc//CE6aQVl9U0IDigJN9u1VYJTHczOW2JhiAfKYfmxgEVbutplfx5UJwX683F7YK+o+kcDm4pNRWreWTuIbt26ERfPXLRlx/o+s5siUj0ULhYeyrA+tzyF6gch46ZIRVOGSiNoX52HXtCy4pwt+TQFqfxNUYQ4BXrUduYeyjZQ+a4OKn+512NpZeh+omAxXaH3NlRXzfnrM77D9r2DHWhtaeUJnmd7XRmKsw5qv4jl6/D3AYt1ZSwclIOSSWvrTv2I5814cvS2aSp6F9p08Jmvfx3Xr13DmbfeQa6qmkpDipdIfrMNQs2r9aPWN8mad0fAOvgxZFMzysTzv/PgFHf44IMP4dyZc+jt7eN4plKT0A+8pXpE/a1+XqyIa2d4bqPnEBq/VJDGYy5OiUCDJ0svYw5rGmvR3dWGlt4Rjqkihnr76dm04bmnnkRvZyfH9KjVUzsgaNyRWiyWRglDCU0rW+Xq+Lbo/gKoC/RjNFC9RA/1gz2AJ2qni1wV0lW1WL+mCfeur0eT9viiMTnJMfcpvaS3z1xFT+8QMDNmW8fbcucgDzRVv2QMCFjoYhVuBjbj5tO+fZ+BVBp1v3ylIWBGZoFZ3IUinBFPItiIpwRPRBMeeiiVRqakh1JzKK7NYXdNNWrmeB2tvX8/PoVvj85iuH8Kc709WFGaxtYNq7B7xxasal6BvJbr0YKXlV0Y11f/KGzZMfbJRA0WnSETmMLwDOUEl5Bx1YXMa4IznFPn8jjBY7K4xaUUZMjIg5iaKWL9hpVoXFGDG9fbqfMqbNCtX78aWVpL16+2Wh3m7fkLB18oW0qDoe23w1D76N/3wIOob6jHq6++hkFa2nFtTKYt4sUcpjDIuOSJYAkvMgmP1Z+3BRUqLIMlh2qMQtWFEeskH7KqVl95R+wjKQ19u2Lnjq0c4BdsJZEteY3qo7qpPssrFPITXQPy2ISYBjaPrVxg1+EDaF67Bm+//Arm6VmZ0FDeXnGY8DClEcoMqDJ9uWXRO4FwqargkD9MlGUd8Qt5IUFeGqUnvHXHdjMYJsYnjHROmLo62HQd7zPLLJwLBQS6hLRfFPnjyWVgI6zs2A55QdQW1l8vjdlzDNFb44QV23fffcan7/38FXrtVVZ329dIdFW/UoEbnV2Wrmj/u9gWHwZYUjHVzCph5drDZY11euDaFkdpCzRCVrG/N2zciDfZ5/LQZThYufO0fkVPGQsaQyorlOeLsfa5CH/YTzZOGTJvU5AsTx5/lvJlZbaIXeubcfb0SczQw5qhAVDi0JoYHEN/Vw8OH9qHgYEhFCaZqLxYh4SVqb51/WulhfA2EKpoV+nf19EMWNWNvG9elr4rJMWRz6JUSYVdWYOJTAqbV9Rhf7qAApnvQjGB/x8Vxukz11AapEKjN6RXAbRqLIwFKdXFMVAGOrwdCgLt7gDClbdQGneeyWeBs1Q9oRharOzYxX2oOXPfsZpamiczDdMtuzwJvLPQiI9KCXQWh/AWXeTrhRL6+4Ce9kFcvXAVV6+34tz5c+jr6cLKphU4cGA/9tyzF1t2bkPDmpV05Uq0JLox39ONIgdOBS33ilzWuessWt/Qtq23RUXVJQgzH9cbsgtibA62oiG9DFls9IwWqDTmaGkPjQzhC889h9bWNhTmEphLVaOqMYf6FStw8XIHLTpeZwyvvLVCI83Bm0E2VUEGiNOxqsBXf/PXaGEN4Z033jClI5fYTUNp4ArFGGRBDmZnVWsQWSscOteJGCBwhUDt8VGDJQf+UNcsQ6MFkcwt70p9o+m0IsveRE9qlAKzUCDzxiiArE6+HhYG9PlroChPG8TK3x+LxpqeI21FnuZN63Hv/gP4/h//R5KJgyk8t5AA8WgPwcNgCe30gcq34srw88Cmdfz97nonEBy6CRlTBGyjkZn8UKBBcvDQQVyVdV5dY+eVjX5M2DFkcyyMIMSj0AW/CIh04tlIYAbQsVWcNRfqgPWVV2tb0XCcqb1aRqtVcPccOICP3n/fdmYWTReMz4gS0qY0iAaWKQtVSLC2+jSDEBfypNXD94X6mHFTGDbWnWet/dOkOGQsHmA9Wq63YJyKWCumzHs1nnL977wM5hvRcynxQlv15xQTqS8FKQVFntMb5truZOPGNRxfs2hrbcHkZAHz9OJL05NIlmiMDvRicnwEDz7wAM6dPcvbOAZZvk0GqVwh5YlKjjxx62WL+NDhzSqF7bBTXmlqHMgQkwfPeoKKMl6ZRb4mjdRYF3Zv2orW8TT+j55J/PsTV3Hx/cuY6upGaVKrJ6lQpdgZuv29RJtAH9GM5QjvABZr/PkYfhPI1FBpuFJkEd3EhL8whHx8cUbkxbhrE4+DgCYxtQmhLVklT81TuI7MJHFtvIRLvG6OngeqKtHV3k8hnUNhcBzFiXHMaudLWiWTo8O4TOVx4rvfxfFTJ1GiMli/fh0O3LsfDx47hi33HkAil0P79WuY6eywOd20VmSx8/QwV96AMZhVUfVioMFGtBVOssyEEp5kQD3Es46nZzE5qm2MG7F79w6cu9HDeq5EbSXofTThSscIB6xYhsymiKaiKAy1zcgMBe6G9evxa7/zm/jgo49w8tU3ENeLfNpbR4OVloQNHAkhMkT4DGf0KctgWYiYRlur/C1g2TnfDxHYIX+YHvWTUANPNCFKWVh7Wf9ZDugVVIjNq1bgyqXLbE6eVWH7/LiwOomBVbFQN8uLqDz8gBZNU9pCnn2hqag5tun5F1/At//8r1BLempLdtuyQkpCAswEGY9tgAhD+1XIIhgfK3SHZZE7AV9ngruNv/x3osKXx7oXpqbobe0gT6QwSM/DbSPjbhQtNJCNy5fVLQImK/9fFK0+jEhIWoLSLGQK6Rn60TxZKQsJJ/E4+VnvQsxev45f+8N/hldfeQVDnV28h8JMwkc0Fr8pFH3572isUPl7KI+rApECcfUKPKSorWwSfYTifyHHFG1BZNj/2kft8KHD+PTjT412tsTXyvZIfpO3YVNDKleZBlCalePabLJF5amtUpQar+wvGYqF/h488vijOH/2NIYHB6EPdWn6TW9Yax8zPUIYGRqy9K985Sv45P13EUs7g0iK1t5NkrGmcsTDKl5lCSzQj9J9WqCRGNLowvQwBtgfokPJZAv7h3IkkaVCxxSeO3oA+ao6fOutM/ib0xfQfaMD873DKI0PYJ5KA1NUFqKRnmVyXBhtRCeVoaKseB/xVfnlgIwUVhuZxY8wBcL/ckAV9nn50H4tLj2scOl5UyDqbDJOkgymRVB6iStDBdI7n8bebBL53gG09iYwMzwATA9gerCPwpfWyXSBnR5DitaTtiTpa2nBxdfewKefHkd3V5d9Aau2qQEHHn4Q2x95APXr12JiqkBrg+4M7xNja7WIhKNb7qkH2OxQ1smsFnW0GJDC3jrbmIZIRVBR3Yjzl6/h6P37MJ2pQu90DKviM1i9eh0+7R2hk0CmtOkpAi2rVGUFUhyY27ZtxOGj9+Dtl9/F+ZMXkW6otVVZ2ozN3E3xAWkRo4ehB3zuIS8FqBj388CT1CBipLLEQHNBOMe0m5WG2q5pDac0bFM3XltZXYsdu7bg1AfvIZmrY9XEsLxHg1h1VejzNMWjESkMeZq3JvoxjTBTmsfXvv4NvPfam/Z9db2BX6KXYW8DS5iRHs7DoCKVdhJd9KdiBC4bAzfvvAhLj24BS64vy4ggAWwKgX3t+MBhiQptZmIKjz75BI5/+CFJwzbyXsvKaCAhR69QmShN7VR6WVlLS7pL0M1EG0c+I9d3/Pd0Vd31ZcNShoaY+I7KQsczVHhf/hf/3FYptZy9aFNueg4oPnPenBSG4l5xLFb51rDkvA6IVpdFfrKXYMUH6ncaC6qntoaZHR7C0WOP2UpD7VgsA87ul5EQ6qJ4uZFwU4VUjv260n1ZsZQz+vTlySmO9a27tqGmtgonP/3EvyCq5bXaeNEZJnqGQqmDgfZ2TFMgH2PfXm+5QduNwpnpWjaftBd9QrvIBwoFKtjiHi1QKAx8w/bbWJDSJOqYSilOhZZKamo9jocfOIxcZQoDHAPnLl7DHI3heS0OKgygqE/marcJ8zKIrK+UntHIeI70MdozWAI+4aZ0gup9l/APpjQsVha6QJ3sr7M0x+zsamOYsBVEaUEb1SWwCpPYubIJly52oTRBYTzSTzdNu1tOkIiTSNBiKdLVXKACYZcgQ88kTQUy2D+AnmvX0HqjBV20qtqukhE46Ldt2YpDhw9jy3YyExVKqrrSppIm2WH2tjc7NZXNUolkzGpxQlPTKOp4IhVIPJvGHM9lqAjmZyawd/deTI2OIMNBuG7zXlzpoUdE11fMlY7XIsH09EIBjz10FKvWrMbLb76Nwd4hZDL6tCy9JjGD3E4/SMyCMEvCWdiyxEQpo6TRLKAghGWcEK6JrvVgUX8c4rwmDHJDtdO31db2q830sPRgf5ZC/dB9e3CRFmtxjoJJRfLH5p8VKkuBBgyFmK0g83mJllrZlmTfFCn1K2qq8JWvfRWffPQxOm608hIORrbTbR8hReEUhtFECsOaxx8VGppq5XskBMURZlM+E/y1ERitFsGmV/hnixbYBln5aXqLQ339WL1xA2obG9HR0srzPGd58QobyF5pBAjlMFD6L4LloGoqx2jMWp8xpNBUnW3OnMq+SIWhKdYM+XWWdXrs2adtRd67b76Fioy+ke0EZ+RhWJw5m9JgqEJuQv6E+HKwyvKHqLq5B+DycsgD4iONJSXRypZnfezhY/jgvfehTwooQ/vutfo6KK4gFEOBvrkGSrJjV54ZnixPswbyMIT6Rsrc1CRe+vKXcOrkCfR1d9tzQfPmDVWGPHgiQ/FmHw3NCRqaR4/ej2utN1Qr5k3FoTqJj0N5whC3iiiuwMmyUJ/A+4Zqv4wwhSwrlc0xmsK+vXuR5rULNKB6aWxeu9qD+QkaUON68D3utlqi3IpLiWlxAg0oWzWoMaG6W594GimwipSBPyVeXjxjF94F6IXEtKanFLeWusws/ksAl5mLMs8lzB2BuFygNKKEJBtuNoMJyQV7/oWFHBaG2nF411ZM9vZjpKeTHkbBPi+p7xDrS3u2dpmCRrtdaqmdPsgzT+IakeQCknG1pYCmf8aGRnDj4kVc+OADXG5rIRkqsXPPHuy9Zx927N6FtVu3oYJKp7u3B0V6LawVUnV19oGjBXasBqOmVvSMo0TPREt/5+dK2LxuLZqrs/aAfO223egcGMVsmuXGU6icT6KGjso3vvQ0+76A737/h5iZTxmjug/Eu9UqpiQkcExhEG3wOlo4sBZ5OpZjAMbFC1GSP2/HUaID5RGlu+kMl0aUxWrMLgHkXH1ZSSkKmgl6aPcc2GZLi7u7RniJVlex37SMWkwccmQ+tmTR7pfC8AsTKMj0EF3fB3n6+edw8vgJ3Lh8xQSb2mnbVmhwqM02VeIEh5uiEFoRhCiyLK0s/fNA+amyghAaULDwlJSEPfeyLFkHCWRel6ZBceGTj3Hs6WfQ29ODAvnRpul0nQk99qHi7kYX8t/oYsf6uTuwLlcY/SjNRdwMkfrMWdg2PUMsagqEFdZWMOs2b8L6rVvwwz/6j8jbC3wcJ8Z3ns/0DCkoDqtvqLsLPh98AwXW964+jo80VaTl5Y4H5icn8IUvfgnDA8O4cPactS08OzIFJj4y3lfcV8Da6tGS9KNyHNp5xaU0WJ42D9UiFBmGm7dsws9f/imtetKEMsAUhpSjFIEpR1t35SQS85iYGGfRRTx67BFcfOctJBsb2K2uPCtDAf+UEikJ/rtQx0QpiUhh8JhlR54GUQpKXmrTiibs3r4Dly9cwj379+Hln72B6ULJlkObUWyfzp02DyPGuruNQkmbQB/WwpbPRqD2+OhyUHrAzwO1Zxlw5HpPQw1VEP3cApR+h6hA4HwJVzsRODojoruIRwFDawy1Jv/0vlzJ1iSTqUvaWmQGUyOjeHB7Pa5evoqxaVpQpn1J0Dl6GnMkqJbc2r7+7kUkP04ZMkceiwm0+klbaSco/LSkla4Dhq7dwNWfvYqzH3yMUZZTW1uDnffswdHHH8HOBx9EzYqVGKQLPUnrUkpC71LM0Z9ZSPF+CsKSvjxYu8OY4/CBLZgsTaF54wq6msDFcb1DksWRGlo7zz6EUxcv4CevvMY8GoFJdr6WNspV1lYgnglMAIsKYeCoIUGgByiLLgFH7kWwe/zF5fdHwDT1h5BlhH6KBjzbFHkaspDI9GLPusYsmhqbcO1KF8cDBwHrTZ/f1Vn1V7YcgrLOlY+WVNv0H13ybEXOHiY/8vAjGB4cwtmTp5ClING0ge1YKy9DbTYhovYrb6c0rAU6Jwxx18sOlx9/LhIisvDYFVAWJ78wrg317FsYdo4WF+kxzzpVVFchX19LC7YXKabZdviqgwk+V9/ICgxZEqIi7wbKb/LxoDTsWEglYVOrrIt5xor79BdffAnf/rO/QHXjCpumktKwLTmM71i5ckFk7eB9wlsCM/VFL4JvoHU+6+GFp5su8iumOF7mSkV71+nokQfw85+9TFJxXMpQ0P1WLtHetZAB5SuhrJmXppJdH3gQ33qUR287TrDd9o4W2z7Psh586AGcO38WfW2trj4zZc8LvaFmyHx5N/nZeZQD/b3I5rM49uKLOPPOu4hV6tPTukJXusZbczVOWLYd+TYLrb7WF0RTHgxNcThFkuN4mJkq4Ivf+Cpe+fkr2LxhM8fDMK6c0TdEqCRmNIvCUF6YlxPaBl51tjfWjQ5CcegtwOr0d4CQvWXu8vKeRsjYC4y/YznLYTF3/ejXl+NjgsUGMxaYJAIyTqxoy3GH+wewZ/MKCvYpdDBub6nOTtFlKyBpzO/cNidkAlPwfj+AI6tCh2TIec0R0nrQlEtF82rE8nl6MT1oPXUKp99/H5e7OjE6PIqKbIV9jOfgAw9i48bN9CrpubDTKrNxylEyWIzHuVpUVyWxZX0dfv3oPhxpzuPo+hVYt3YNO7uAvVs34L1TZ/Dp5etIVNSiMDlNPp2HXhzUgzg9r7DveHuhyx8XGolCSBAN7Xw5MM3O6ye6sAwVhHRCWTwMOIfO1rIBoWvE6GRsN6Ug64iuUipjCjeGaezYvhPXr3Wb8NRKE9XdasZbbQBLWfBeCS8NGK2Y0bTU5Pg4Dt13CJWk98fvf4IUr3UPQDlU5XpbX0mAaUA7ryt62KfsdX45CZYf3xX4m9VmFyGWZWj9QKrYeRfOzs+jitZ6a3sb9h7Yj662Dgo0CinVX6D6+jpLzFkeytKytZ9lEMpehJtSyqtHtMNQZxkVJqCCZ+cUtZ4lJbJpfOGll3CafD0+Oma0NqOKY0NfqTT62lhRnHUThjr67BehPKEsblF/H/s9LN+2Z0HkHfcSq3tWqOcHB+49aEuWL504bjvrSnEE79L6l56A1SXqa/Kn8rKYB6WbcGaKlcNr1H7xHA8XiE2rm20Xgzd+/GObEShqGbcME7XXlIXvp2jc+Xx9Xt3Xr6Oyrg77jxyxZxz2nEjlybWzJqpc8reFGic+rnpYnVg/eRehb+RtcQxYETSg/skf/j7e/uA921H43n378dOf/gRpKjx5Yuwo1pWKQspdsyZCKQ3V29fXKVBfb4OyeOCN5RAuuc3pzwIqjWoqjfJCf4FcbgfON3dxARugweMGng4VEs2v9h2n63WoQB1onSPLm8RaILHZKUODvdi8ZysuXT+LikQGsxRAmJtCQsqCbpt9EEaDQcxH5tCHlDQg4lQOtgKJxeghO/WQxTU9JJTVpW9D24M6MlcsX4mZsXEMdfWgvbMLrTfa0N7WjhEOOq0eOrx/Fw7taMSGtZuwqnk9KirSWNFcifvv3YGvVMexZnoCa1jv7XUL9Fyy+PbHrTjTPYRCSQzBukq4xOQRzSNBBRQ3y0EVc2SxH6OhizrkjwajoWNIGzQ6do61u6YcA4S4ku3PQbS6RWkKjfk1EKkMTWmI4Z2HYS8ipXNI56swNtyP+w7dh96+YYxPUQHyWt5leWiw2dJkIQWFaCpvJU0vbYZ01guRmzZvwE9/9BP2S8KmEvXsItoehf2R0PSBTZ24gR28L2MOgQ8EassvigZleZWlEsrK86FqoWu0mkYv/NlUEOm1a9dOXPngAySqquxSe/4UhJ7A4or44zsBXhrGi4GPWppVI0pg/xBJYwlMZ2Xr+xj6SNUsnv7C8xgfm8CpEydZHdKS9HS09mNDisPTWWPCwOp9q7papXycsPwS8SLPO0GuOHmI9ZCHkaCQFG9laSwcOnQIP/7Rj0xhzHPs2hStGiU66RmWCXbX5ypNHOuqxB8LlSh+5Rk/Ftxb3OJbmj56lsPxs3XPLgz299tecHHm6V5WVDvFZ2ozM1JcGPqKmes9Fo0rbYTa2daGfHU1du7ehRs3WpDL5X13qo1SDmyjodrnxowpbilLUxjyfJzSFKYyWaPB4194Bqcvn8eN6y3Yt2cvujva0dXawrpobzl5F7NOYXgvw2YklhiWrrOc4vAgYt0J2C3uYkffO8PFZxoG6pZfHiwWJNL6vD2zRTynDldIAmiQGdhNihMtjR1bIuFoOsRJrJnJQazb1IwxhpNDM/TiKHDkws3POMHrB4OYLnxhzLwN5SdCG5MwW+t11i0wUEBzixWqXFaGXkRC71eQXLNMn2R5bZ3dOHX+Ei619mBingpi/Xrs2bYB925YhcPrclQWupp5pONIkXHaR+fxp1dGMU1XtHpuArGZeVaJ+QuKZHDWI663jEQrFWmCm4cadDYgFHrUBUqzMBwTdUP58a3ilq8PdawS/TkNNjF3sIjMStUAsAeYbL9/c5WjHLF0ngJzBlu2bDGrsWdkHHN6z0YKg3XTIDIPQ4OI9+n7F1IYRTL8zl1bcPDQPvznf/t/ciA2UGHMUdfrGZT6Sn1BBSqL07wM0sgGM9PVd/x3qLjSXdyd8yeDor0b0D2OHASfT8iPqFOeWgxFL/6rjaSbHjhPyUo8fAhXe7opfOm5SoAZP4mvXd0dS+tHEMIAUeFL4OZUX7ZOGJKrFYofKJTt3QcTWBTQjM9NTmInPbqNWzbjJ//nH1Gh1dDDnud4CUKZ40L1K6+nivH1c/HlwFTPO0sgJJGfVL5TbESzrMk/4gvWkSoLW7Zuta8CdrW1Gr/IaLA+1piUwpDBoPoovzJSWbE69nS06VQlUmGa9S86iIcZ1/5lWs5778NHceb4CTMg9SxD3pXKUbvdAgvPRyYPGOeBCWHmYb3NcaCPnvX09GLVytXYs/ceXHj3XeSbVnDoSkE5pbCIzsBy3p7OMVS/UHGKDlLqcyzzvqNHMTo2hrNnziJLxXTP7j32zoyMuDnyky0H1pjg2Ch/3unoYkRgHUUFxQV2EAV3A+W3iL9FSqXdCv9elcYiuFyjX19IZEF5RnVHZcQgOmEg4aq5cg5QpZdmKLhH8eixh/HRj1+hDKPLScJqjxn3gXrPCCSyCO0Gg5C3ijE82tfXdB3RDXChXbQYV0hlpSmbIo9nyXjzzEgvnlm5HBCjU3O43t6Fq3RjZxbmsHHTJmzQHmTxIgXpPIZjOZyfBE71T6A42I7seA9QGCfDTlE3Oa9Iz2Dof1hnaT7VvSnu0BOGJ3TSM6YNDiecLa7rDJWue8qOo/MhXn4N4yFkvlIU0Ty4kAwuhWFLjc3LqDCMZ/O2YixDy7G5rhItg2OYBpWEyGf5KQ+vNDiI9NBYq0Kamqrw0ENH8Sf/4T+huq4Zs9NeYdjAYL/J45LFWTZA9HDU+k584oWFwMWXogaTu+Lmc5+NtwN33r7cxmZFwLjaaV8PJE/Mapkw6fbU00/h5KuvI5mvcLzGOgZh7KqrNJfFYsRnHKWXAdOicSJQVMchZBeRCUwYG7IOEnJSGLMUxM1bN+HIAw/gr//o3yPdtNJ5F1LMHmWEmfKIeF/1dKiyrUplxTuwwl2UEMVCshkOohd5ScYJaeS8Hzc1qa1LHnvySVsxlSCPaNWgG2e8VXWxOqpOoQJlsOzYeTOOd52xQ+RxKpfF9HQBOw/st+cnLZev2mpMpyQcHy15YVChr4PL2IcClqF6ZtJZdLR3Yvv27dh56DDO0GvL6gNO5G8tjnEGluP3CKXADfU8xz345mjHtp07sXb9Opw6dQp6H+nQvQcx2NeHgZ4+zIyOWl20TYg8C/fAXugUvMknD6r6LwT+PtHPuozHofsMdH45+rP/gErD5axfVz6HNyNSBFGd/K9tk8E4Wc6OLd18Zj1UjdkS1vGxEWzeuAF1TU24cUF7INFdtAfgekbAa82FI1NIMbiCHGFklnmmcUwSzoVj3etDi7vzNpAkxJgmt3WeAnB2bgqzFPozyGEuVYuxTDVamX0n+Wb/ympUxgockOP41gjw3fMtWDc3jAPNeezd0Ijd61dgw5p61NblbHuDFDGbzVj7NFU2PTHp9priAEhzAGjA2ZSDGNAPjCWKoHzQRLioXKLryq9fcr9HpbEcl19ADXr3FnukNDJ5xKrypMssDm5uxvWRKYxr80LSxjwN5lU0L4PWlT7VynzyVVk8+fhBfPDuhyhM6O3jBQoMrd4hnaUoNE2nOdygMEK/8F+MY9wpIaE0AQMd3gw64aN3CiHPm4B18DGFVrxFFGeNpOApKBJUin0d7Thw6BCmmFcfPQ57mKps9RN4zULlxp+oTIW3QoErPVIcKtf9yJax/pKiMO/CKw7nbbj3gQ4++iA+ff9DU85627tkSPracwwKIQlSohsTjLNO5QpDparoSKhY0fxT2/35CHSg+oifdKHxFnmABlZ4nqGHvjvu2cdL42i5ccMKKWoBi26XELe6UVja2LNcbwmhfJVj04PiU8/Han+KPDdfmMDDzzyNCyfPYGJ41LVdbSWaZ2VGimuoeThWntXEoQKNBzuU7NFqrBRaWlqxdes2rKFx2EUhryWz4nOaO669piwWlYZQ+3xJkamfVq9di6MPHMWbb72JqcIUKml83rNrN45//AmmxidMsdvUupYCm8LQ2GDdmaa+sf3QPKhqFlokHN05eCoa3Ond5Cw90xBExfsK/BLB9UuIEnwBNmjKz4ggPGsMEc551C1kiiLPac20+r6/fwAvPnsMFy5cwNwsrVopChLYCK68NRB0rwjtAvdjIVHAUNc64eRPWFxMK2RcGJ0XsDKSHIY8ZJ/GZmm10WLQjqCD/eO4OJTCudESOmdm8Pq5fly6MYjzLR24eKEVNy73oq11AH2D48Zk61dr/6zt2LJ5MzZv24q1VIYNa1ahsqkB2epKzLBNMyODWBgcgO02SmtNlru2gpBwcNMRYlgh66S4CXs3iCI0ZVB2bIOM1/vBFhhe6+njUhS2mVqaWakcehqJDMvOIabpqWwFFqoqkaI3dWhdA66NzWKkxPupqPWSZZICU/mEj0nVZObwjS8+hVMnTqO9jZ7WQtzeiNfAtS/sUeFrB2H1n3l9AtI28EE5c3smCQeOXyL0yXbfXUDUt+VQVmp58f5H5dk1pJ3VksftnZ04cvSobWmvRBPAiqhNoQwLfLwcbpF0m4IjheFWSrH/KSjD7s2Zihym2lrw2Fe/YluM6zskUhL27E6WPNEpCyeIIj5n/UxpqJhQ14ig7tgoorQovQyUxHTzjslT9gCcPCSFIVS6FMSzL7yIEydPYnRk1KY2bazJUGBcgj2iVUAr26MvQxHR36ZW1W7Pw+bNSDlNT2PTwQO2l9uJDz5GikI/PC/TWBcdgoxQ+YvjX1krZL4qR/lK+Ush8FifOVBZ12+0Yju9hcbmZrR1d9GO0qoq8r/4nUpSfK/ZiCTbr/e8MkRRdu3aNXiSXtarr72KifFxyq0ZfPHFF3D+zFm03Wgxha66yCuKtgmRwtCx6q26ulpGEI5d3/iDuwDX3M+/MVxRpjQEv1ihnw/KdFnG1j++kywk+uLdlTy2TnTpBtaBjlHSmSxG+/vR1JjH2jVrceHcdaYlyHduOsruXc58/HfZMR9FmRaUSoRLju0iQ7O0dCxFRAYkm7IcJuj5Bxk9QSZMs4Njs/O2AORKbxEfd41gjIzaULUSF09fQD8t64mhGcxOlMjUJUxOTqGbFumlMydx5v13cebdD3Du6lWM011vaFqBdVQe2kdr/70HsJu4ha72io0b7U3acVpRM7Rsi3295Cm2mcIiWUFFwnOy6EQn926Ft8JsQLnQLFOf5s4RZRGRwaUopCBi8TSFINOpSNwUUwYLHAjaNqWkTday9OwqK5HhqT2N1WifBIbnqdQlAEgbLVhYsHxKqGa//OZXnsHZU5/g0xPaFCZpiw7Mk9IgkFcxM0VaknDsszAwnMAVqJ+WghPYirhgEZig+25K/xwIRd0EoWz+WkQXSmD5Wxgxz0pKkjQskCfXb99mPDg8POzqKZqwTu6ZnTJhGLWtHJan6VordBFCEvvOKQz1neu/Uso9+J7u6sKDv/4NVLJ/3v3eD0146eU9UxRmuVIwMb7kOZ7qZ+X7OtxUtBPSLk3hkpMOlGS0YN3MGKGAtXdyZDwkMTs5gfsfeQS5XA4fvfOOTVXZFJEUhnkY5AcTjq4+ri7LaGID0ZcthSFcxuNaCq3NSl/6tW/i5PHjGO7qsfFqLzBq/Kof/NRUUBYuR19WaKdCkzlEjnnb04qGou2KwLHQ2dmNA4cPI53P0ePopbKuJs/nqCiyRnO1XQZWMp1FRS6NGhqAjz3xGL7zve/ZMw29YLx3926sbGrCy9/9G2TosczT89aUYVzKlGNE0+22069VU3RZbH45uCRTG3eNdwv/gEpjOaiDfCctiQvUibpHnerP6DBQi6EURyqXwbmfv4YnaFH1DnbaViGy9mx1iHLQjRJI/h6XCRlMfzy2VT6W5sGud2VGTOuZylDMpo4TY5Pp3F5QzJUMUCpSCLKDhXq5MFWcRnZ2GgO94zi0thqxkQ50dfRifrKAOQ4ebec+OzNORi4gHVuwr+LlqusYT2K4uw+tH5/ApZ+/jpO0ks5duIihgX5TiHrhcM2mDdi17x7sfvQhbHrwCJroncSoMMYmJzE3OAR9pCmut0zJ3HqRyVrJ9kpRSKHYm8J+cGuwab52Qe60lAIFvb63Hiejp8j8yUzO7YdFLOX0oZhK95UxC6tRV1GD1fkaWnSbMT5ZxGQ2TSeCwiCWRpH3VKTm8dy9G9E/MI63PjhjnoqWpIbvM9DkowDjMekX9ZXorHOiv48vKhDSW1HrE4U3o/WvhctRXCFcmm55KabA/Xhgmv2HNHfsrnE0dWdIW73ASJ4UHdva2/HgQw/Rejxj/RqElbUhlGX5LAcllp9YfkzwQtIEpZ8ac8+gXLq+Y7/lwAHsv2cfvv1nf4YE+UDlJ4olpGi02HMjKQxVw0L1gVCZq34KCUuKVVt91IAHSxPc9ZHXKgUapmgYp8LQiMySd5986im8+eabtpJLTZElbc8h2ffR6q1Ap1CXW4HutTJZHhWFW9bLaCaN2ekCNu/bi3Vr1+HNH//Edp6WgDbvQmNW7Q5t9+UF/nI9qrKZTvlg7VRIWltI1IaqcywnEUvR6OuxqSZtezQ2HcN0thnpdB6pijymMjFeW0kvpBaVHAdHjxzElRtX0DUxZisNK+nB30Ol8eYbb1BnlpwR5VcRmodhi0FIE9XPxkOAWxPms8h1OxAJy8HkosLPwH8gpbEM1LqoHN9JASzdHYdLygWG60Q39G1lQnUtxsZHse/ADpw7dQ45CrM508y8QhmIMew2ryBEFMsjMIQuWoRwFIROBKpDGGASbkT3gJbMZbXhsJBwUyezfE27yPXWdH3F/Cjuu3cP3qMi0MDQtsalOY+zbusQCXr3Rb55utIJpCmgU7W1SEpgM7+h7h50XbqIG6fP0DM5i2utreimcOqjtTNbmMaKhkbs3rULe+49ZF7J2nXrUFlX46Yt9D1vWXVsq743sjAxgYUplsuBpi3Z9TBXzyziFOhxeRv0EoT6PoispaJcaymNDJVFRsqiEjEqClTXYK4yi1JDBk1NdRieHkNPznkssrTq4iN4cOdGVCVyeOvTcyjS6pqWR6HBQMXqXirTAHEWlZSvUwjqM9HbKG/0DeD6xB07viDtrW+WobuAaJd41LH6yuUTUOdCeBP460PJFirqr3VDTNdQcZCesnS1bLu+vh41DfXoam2jLqYilfLz5RtYoGMGgQeNHy3iURBCgqImJCXEFFJYsn/N0+Cxpkiq62px5MhRfJ/WrL0kKVJK4ChOdM8viL4ui2PLh+VFG2i8+GgETChLtCZQYQjdg2B5PlIYNFjoVeirgHoHY8/evRTgWXz8+utI5fMcIzIW1P+ypjVuXN0W6+TraSV4VLFCtT8oqRBnnbQMWvts3XPfQZvyGe7tN89DijOaktKgvIkGylvHjFpc+THfSE74coTy5IkLNKym2dTugQE8/eCj9uZ9z8Ik0tU8V5HGTLoSNZRHObbvgQPbMU1FcPJaCxaoLPT89Z6tazA5PoHLF6/Y9Nkcx6RT6lQY8roU51iI6BFC1s+R334icLx4d3C3d6iMBJJlSuPuy/wFgIWUMdwSsGQRxhEn/CrZob/P7tfbuTETrsMjg9hB4TRfjNGiHSTjuC0tLAdZFrol3EtwqzqYonx0nZ0qOx+SGJJFXERgiWK2wHRSFGR2E3LutO0RRebXSitDMkD7tXM4ePAAJmjt9Ojhn3kj0xSeQllAHDRUFppzldKwL6cZUpFoYDFPMb4etiZpNSUolPV9jZnRCRQGRzDKNvfTPb565SounjuHi/RMunrpkmczWL1pPbbt2Y2tO3Zg05Yt2LR5C1Zv3Ij6VasoZGj1cyBNarsEfRGQrdV7GVIiOSoJWWhxWcq8Dll6GblqlLJVFkIf4q+tRP2WFajeWIN71lSjtiaFG00NmKd1W00iPrG5CmvylXj/01YMk0zjtAD1Po3N1fr5WnsZ04SHH9AReoIqYn25eGigMIqHSBnYef4swXDCg6L+8FZZOHD8o9OLPMTQ/ZcBryA/yYuTB6e33R89dgxn6G3YezC82qYXpDwMGFqhPhe7xp9zl/u0cJ4ogSWFkeSBCWaPTNdnaGf6+vHkF76Ajz7+COPDI7yMCoz8ZNNS7Gd7fiC+9bwb0eVWEKpi7sByYJrVzV/GuD1TM/QKwwvWeCaLIsvI5LK4//4jtKrfpLFCxcI66b2MaF8xKQ2rmy/4s+qmsoMAV/0MWS7TpaCzNVXYtnc3PvrBT5CromEjr9byZ1/S4zJes3LKaGDWigPXz0qjoSllocOoHKI94NbzPSpDjo0iDbLRjl7so2GYaopzrK3F7n17UFm9GqnCBI7s3IyaqgzePnESo/GM7S+VnJ/C/l1r8MlHJxFfSNoDcBsHJgsWl9caCZbQwhKIqtRSEFlUd525U4yyLQOlu59bAz2Nqn9gT+NzyrjpXLnQ568ePluHMmQHkhU8nyXx/Beexft/+Weo2bAZ2lBP84+yYiLKMJAyETriulzDT6TR7VhgN1jMrF1F7dClkfvc+Wggunx1Xn/u/DyytPT7+nqwf+8uXLt8DvqsrW2uqHdLglWhetqg1gASisnF3M4Kk+Jw3kv45oEGnZiqRDKwTBaX5KDVswTRKMm0ge4+tH96CldefROXPvgYl9s6jFja+mPb9u3Ys28f9tMiu/eB+7Bt/27UraBnk6aLPT2J8dERDqkFKikqDVpUVfWrkKpZgbmaBvtYDFY14tF7a/FP9jXh9xor8UxdHMdW5nGsLoctmSJW1iWwqmETfvTuBbTMpTE3R8VUGHZ00gNJtZX0sak9ts1o5+lO0cs4KakB60ntmxiFro90TbiJ4U0Y0n3I7CxufUoMocAHBj7Z+EPXE3xQBospYjNjS0KYMppoaUH9urXYf+AAzr/6ChI1VLKCUI7yt3usIA+MWGK4SHGlKeCPKQyvKEwop42e8kZn6XU+8xu/gbGREVw8fx5p1mGehoV2Cnb0Fs8w38CrKkPFGA3KQ48q0/0YRHQmWL/IwLC6kUZeidlcvz0bY93oaUp56LlYNT1meV7NK1fg1PETSPO83ki3Z1lSGhG/s2DVI+DtoExJmOJg2VoxJfowN+zdvw/d3d0YGiIPs90yRtyYYZ7yZrzSWGKkWKM9WFP1Q7QyFGc5areVx7Iob2IxeuL0GoqpLEZpoKU51v/vTz6O39/ajGca83hiUzU2rqhDIbGAv3zjfUyl8iQ9JUNPF77wwAPo7uhHV3sPCuNaZcmaC/VCn+SBaFPeT4JympT1RwDxq117N3hzNreFwAO/mumpW5WhCpWnh45UoB+dt7gHa4A6kAKSLnBfawdWbViFPQ89gOOfnESGbqEs54gwvD5ifJ+PCXaFyj4k2rXhFne9TyKEG32o4zLFYcKPabpWy3LJnYzP2xRQz4UL2HtoP0aHBjA6TG+I97htv6UoxNBEm8N0TG152UAiKn+mG6MHZreQ9WJ8QQqE187POqWi6xUmeD5Jqz9T34BsfaNtBtjX24trH3+MU2+8YbvKnrt2DX39fZiip9HA67Zu24579u7DYVqFO3ftxMpVK1CRzyFHhZSNl5DP0eOpy2IdB8Y/pcJ4ujqBgxxD9QtzqIstYAOv21xbgUpaln9zqR2t8ykUpBtnxuldTPr2aSqKqHbQ4hXtpfgimhvKG3TH1g0+bgPY0lw6c7DjCN2Fi6ixblF3vZC/FrE/nVdSuC9ELQzHKsXHo5Dgky1vHTK0JAqxdF0drpG2jz7+GLrGx22lkNtiXU2WMFBE7VdItAyUaBkq4kBxHXrhuOhhpGzqMaGpQ+az+/77sXXrFrzyyiusrlYpeV6QcjaFwTJNYahMK+jmsBxUZlQPFzoaqg1WITtfvtACWmWnqU5a4FpBlKSXkaustM0tn3zqSZw6ddI+fCRy2st8MoKk0GwMsG6qhwS7QlUpFF8OoV6Rl6GvKdKjobKqqMrb9OsDDz+M9/RxLHrk+lSy5cV8jd+8waXnkSrHGYpEK0thWaFWFlFlBUZRmfKkkmk6HFnEMnrel8d8vgL3bt+I317fhPUaDxz3DVQi8ZpK/OCTM2idLJnujo1PYU9jDXZt2IDX3vqQBpp7qdUthZbCEF280gh0KAelhXq5nwicQX13cItsPheWTU855r8bdD93C6GTyqD82AglgiliBwYmNHgoAWNehDoyFXdz8/lqXLpyHs88+zSGR0fRNzLODs07HtCP5lytff5PcaXbBR6iohix+xRdLN8lO6WwCEy0zhW6gWnfu9C++7Zyu4hZMWhFBcbHR7F79y5cOn/BPAF7oS0oBw1qm7JhPFIYssCYbgOeDK58wuCXsI2EAItSaMfyQDgYeb+Uid46l3uu3WjnmS7aaZ45WVMLvZyoN4OH+gbR2daNq1facOlSC1rbutDV3YOJiTHKpwV6DTncu34ljmxswv7mKtyzJo9HtjfiG7UpbC5Os40a9BxIjCWLo6iju11XSuPPsglcny2iYmDKaKKPZemtfRNkEhRhekA0ta7Qj7IhlX0YiK1pEltmav1FVFxhuCfEFQtRd8ig7IAQzkepFrfM/b9+7MxNoNoGsPrqWv2qG8ItrKumqWTpD4+Psc/3oK21nW1wz9VsQ0P1lyDicWHIIOTrjzVfLy9DglmWvFn0CRPW6ueVzc04duxRfOtbf215i0/MC6XiiPhFYcSnKosQwluBFc0fhXq51QRnSJOVz2OlmbJQnJa33vynonAvgjoFomtWrV6F9es3UGmc5t3uuzXu7X/WTwJS/GD8W1Y3gZW3DJQmuodyiVq1lqalXyCtNxzYy2zn0X2thfYcx4Ly01gKdJACZeCmpzSmeCCIGGJ5oUpXexUS1WZ5UlTW0CpC7ZCQqwJY/v6d6/GPV2eZJk95ASm2rauYwfudY2gfLCA5tYDGYgwvPXI/3n7zDXQOTXpv0NHBdq61MSKlsay/XHUdhCouryrB8frdge64G7xJafxCcNe3lVfhNhgxz2KarVAhs8qii7Q/rQlyjc2dxmIZdHT14MmnH8WV1i7M8JjDh9cStfuq/fFe7WJmbRUyHkF0RVn5gtBjRLM63Z1muSwBHluSC3WN3joX06nehYkJ7N27Fx0dbTS6aXGRMewaMo4TpKxnGNw2iHwZRGNyMVIZ2pSVxTkQTGFpQPjrLC8dM/Tz17reludy4JhSUR68XA9w9S6GDXgOdu2nNDo2joGJKVrJM7gxPo/rI3O4OBbHuxM55Jvq8NiuRmzngM0asQgawIqboCfrZhKYSi5gor0bC/1THEBULqyHLMI0KFwWaJGCFiIxVuS9tMqMtqSTaOUsWOal/CL0/Rb41OJMC+mBJyxcrIu7VHFFWBTjZjTw0DxCi/OecJ3OMDQlENA61iI+6k8o5IXGk/68reThca6yyj4GduC++zA0OEijYdymrqJdcKX4dYvycz8EVzd3gqC85FlIUdhculcYDFPmZSzgi1/8Ev76r79lwlLvwBZpCJjCEC/YQ1/xAVH8EMpR+cshpFngy1coOlrolUWgsZ5NqE5xLfPOsYoSpCkKzRTm6ZGmKUxnJ4v4xpdfoDFyES0dXdR/VHSqm9XVK7aIHiwmCn38JmA9xGuiiWgkL4d1SapMevFPv/RFnDl+kgpkktWkrNA4kKLQGPBjTGPJPA32vckHkxEu96jZAsXVZmurkHGVS8/G9tLKaOWavCoaX8lKbGuoxe7tq9BEvk3JACxl8PZMAn92tgNT9DCy9LYf3LMRbe03cPbSJcyxCkV6QrYDgl5M1sxD9HKrJ4LRQ3X0xwECf9wE4bo7RKPxzeheIFyODpYqjV8EWHlV/07R/dwGRAirm37Che5ON5C8QCG6JXZxpKnp5WlID2Qr6ijsJrFhyxoaAdUYHJ6gDSyG0Bx/gvShOx8jU4uHVIaVpTJ5TegYhq5kd96Vrog/MGCcqDoptgQ8o9t0SzhJBtALR3MUGjMcuA89eBRnf/ITJKsqMT81RaMszXx4sZjbGJtx3uOWBCquUOjysvcYVI6EvikZollTHpluyxfDoDPG8/n48+5erzyIbssLf8rfp/cs5uJZTFHIF+IVGIlXYXShEus31OORdRmsJ931sSkbUCIjUZsc2gBkH41laGnGsmjIr0EDtUtivkAXfRozQyMoTkyySvOkC9UGB6AZ0BQGeuAflgPHOfic4FZfk54atDYV4tAsd5UdlINQcTvWfUSL6xpXR4srwn9rpaLqq3LjQed0bQQqW3xnF9t5B+FYCcrfn9O1rN8Cj1Ps46HhYTz88EO4cPEiz2sBh+7VjzNQ7PbQVwQrJ7RJAlLtNWUha57IY73AN0deee655+wNZX1czDwMTb+Qj8Lb1eaNKi5UPPDCLUH1scq4Q2uP2hXapr4Nx0SbptG7PVQY6SwVRwZxWtzQw+Fc1lh576492LVjC15+5VVeSyucic4D0nMF8p0EpOpm/CmeZ9aG+nHViEKB0STwgOI0GBnXS3K7H3gATfUN+PiNNykL8pidoeBWm1WemqQK8dgtlZe64DkvHxY7QugDtdHKEXP6uLwnUxoM5XHE05RBeVRReeRLs6iqpJfd0IAZXnd6okSF0Y63L7Yiz/qtqUhg88pqvPLmm/rYA6YKVGxULjF6FwtaVahnnPI0pOA1rgQWsvKq/+eBVd3X/y4gtLocPwsSMSqNW910x2iEvnO4u8vDxQzJScbQzGBRaUjAJFFUp9MlLCVzdFMr0N7diScefgz99DqmErRqU5VI0rJNzWYY6mtx7BSXq2NOokKpAKcGArprLB5pgHJw11NEMO6GW7jDrrdk/rCutnKFA74wNYH77juM652d9DzGKQQoXOzZBpkjWEV+cFuRql/5YA8KwzOT1Vvo47YFC6+XB2LLge08q2HH/j4GhpYvUVLMkHEbxPJAdIGuKSKhQaZvhxjGsHtlFgfXVWMrB5E+W0vTw4afwFrP69kivExT6sMbQ5jpL6K5Yg5bmrLYs3EVju7agH1bm9HQrHdA5jEdc995Z4/6Zvq6sOJSJPqQjhRLXFM07GtNVbm34PXQWejeBNaX4MIqHvNUxBcB1Q8BTfApVIXtx9Vbv4roXHn8ViiwMKS5JAMdS8CQP/VSm74nvnnzZvM0xultujJFU9cNCm0cqd3uwNpm9RRGq5E07aP9i/TdkSl76VO7Lb/33nu8id0mISkBTF7TvkXact+WeId+VmGhX5eDtUXFO/q6NvnyI2VN4WneBeN68Kz6+OXVCXqp2i6/VEEDKMt+zTRSsSXw1HMP45MTZ9DRM0Cnh1wqT5eerO2pZF6vpmLE86wX6xaGjdUlivhQEKx9//BdLw7qRV9tI/7kSy/i1PHjGBwacteqyfLi1fYwvlSG8bPMNJarAtUdKsQK9IUpMF7ybRcd2GZ9E0RTb9DUdyJvHpbur8gVsamxGitTFfjLtmn8+55Z/O/XWvDhxRuoohFYOTaA+3ZsxtmTxzE0NkU+KJAO9DI49uP2iWeiyQHV19EighAtS7ol6PxdojVZ8XIQKezPkWE5mtJg+ItD1LN3DssrcTt0Px6MidkQm+phl4uhZfkoNCZOufXPdJeT6RxWVmTxxNH78c7l65jJVGCODDuXqKJQpZDWjrk+W6OYdZAY1oeW7NIVF3uZJ3ALcM3XdYHMDiyddZOCC0JCwqs4MmJW0KH7D+Hc+++zrnpbd448SaWnqQSVa5YXb9OPr5P+3Y88DV8vC8N5d41TIIzawPDANLfc0w8chmaBMs2usXt92fw3tB/lLoGst8DdS2SZdDVi1TlUb1+J/TQqK3UfM5FlrjvsUQ5hmOX8ycgsXj3Xi/4rw7jS2oYL166jpa0drS2d6OsdxhSvqamtw+YNG7Fv915s27YdazesR92KRuRqq5GskBWbxPT8LGZJtyKVrAkdCs4MLb0M+zwpwUE0ZWECjr3A0N7Q9ufCeadUJAScQlmiVER/heo4C9kIQ5+mgxDXoUFZWkhUoHqoTNbTvq3B/Kb1waljx3Dq008oTElP/yeq2e2EYIA5haF6ejRBlbKH3vYlOiqh5rVr8eQTT+K7f/NdducCPTiWI8PEFAb5x4RkmL5U31rWvq63AN8ORxfHswqNdpoOo8Kw96JEW1NiEpw5OpKa06+gm69QHkYFUtUN1CW12LNpDTY1N+Hnb3xIxVJBWnDckddlWbtFH+xLM1KWegBWHVU4VDWqMiNSGCbMHY3tC4Bs+7rdO237nTe//wN7VqelxjY1t8TLYP4sR3kvTkuprcpaP4wH8Dxh9PeKyr7+yXaXvIeVpMJIkacyyRIOH9iG5jUb8PHFPnx4pRU32row2d6P5NQcFvp78dDODZijZ3HmwhVMTBYwr00a52aQkKfhFUakQA18h3l6uEMfXyTIMgjn7wbKpdZnQ+DPX4nSuGMoz9qYmgzLjjVPQ4LYd6z2qdfStxItgJLeZM5UY2pkADt3bsHK7dsxRQFUWNWMxEwJSXZCsSg7mAQOgtIYyDOsCVKFwrIqfEYzHQkkpP1FylJRqzNzs7hjTimMlpMncezF59He14uxvgEbnM4aZB5qk5SG8ruJtot1CgLH7rFToS12ICpZaHXSNR5tLtfKIiru0xfv5x0qV8JBdNZWENkaCogkPXEK6swKFLJJzNZl8FBTDg0cUMpTD90tC+Ik++PCfAl/3DaJtpYxFMfiGJ6YxsTULMamtJx3GsPDk+juH0R7SxtuXLqEkx9+iPOXLqK7t5flJLF6wzps3bnNvl+gVVxbdu7Auu3bUKd+5ACeoGU51XLDlMkcBdA8PZGMHvBzYMu614dyJOys+USnSIRsn5QGUS/iSUDblJiPG1IQhOlPJzQUOpo4hRLCkEZk3Alb5a98vJBlOarLYE8Pdu3bh+qGerRcvGgr/uz+CHycafalQ5UrlHDWdAjrl6VFrfNNK1fi69/4Jv78z//clIVe4rNFBnouxL5IzKkvKJCDBR9A5QVUeWXHqrO9nChU/aV0WabGluqhfcTcTq3uRVDbIt8wS8+iArGKSsTzlZirqUeqvhGVVCL37d6BtktX0Dsxh1ny3PyM3tOhYKSADJ6GCXO9r8MayeAQOqOwvN7+R3SXt+mVhu2zlWX5vP7wA0dw6uwZjI6Osd3iaZJDH1tSNlIc4nnSw74NzvFuXob1naeBKQwryAUsyylLj+Qrt4cWDVMtJxaf8f5KelZfePZx5DMx/PTND3FlNEGFMIkUFXtmuoTM5Dg21lfgvj2b8eprr2FokgYQz9u2OVQWmp5S6BaJUOGH8WhQRgPFyw9/SXCzjPl8+L+O0jBwAk1/9q8Oj9MFj+uV/irYR39kjZGZeyur0clO/3/9zrP4bw5vxX93/06s27IKp29cxnhBq4vovitHE5jqKC3QVdxNzVjRIRREkVuDI4PrVT1Ess7goRSQ1dedIY/S22AZ47NT2LRxI1pofUsI2stHdoW/V0xux7rX5Wu/ISurdwi9wLeQabo1nBf4eGBG1z6Xs8oL8/emvEzQLQ4WeW/xXA1ipOsC6TpX2Yy12Xk8vgLorU5iNBPHioUEcrEkFbITtj9h+L/0L+Di+SlMdU6gNDGEOAdPaYrxuTH7xsP81DRmqbyLCxIYC8hxMAq19LC3vRM33nkPF37+Ks6+/wFudHbalIL2Ulq/fgO2UYnsv+8Q9j3xGNbduw8169dSKBUx1t+Hue4eCqcpjr95m7ZM5zJU1F5Ae0Wh6axIwFso4eHSTFgK1X4fltMj8gB0n4SX3aN8mD/zk9ANxowpJylepmcqq3Ct9Qa+8MIXcPX6DbZbM+oygXibiG+aTf9OaZjSMsGoaTnWmQJSb1NrW5gn6GF8+ulx9A8MGB9HS7fV8cxXU1OmMMQPAdR+5alQAtHqvRQdXdRO8QHrwLL0ASIZC+p/KQik9N5Oxq0aorJAvoroFEaJinBBuwTkkti6Lo9Va9bjw9PXbEeBgj4FQOs6eBkK5XXYyiG9ryP+VD0Vso6BJw0sTsqI7kZ7JrBuSdJEgj1dWYH9+w/g3b/6K+SbVtqKJFturGeDwesSzxvfk981DpSn7zMHCn1cyaIFy4qQ5QlNcWS1SiyBfHoWX//qS7bS8Ic/epM5p93WQLPk73l6E8lZVMwN4KuPH8Hrb72Hju4+nmdf2bMLhkR5GVKiC5qWUt+xeGcQWsT9+MN/CLgTJZKIJf6OSsMo7KO/ZIiyDRFrEJnHpqUYJ6O7gcCOjFOoifFpDZnbWJfHr33jeXxpbTVWYwpNmMfK1Q1AXQPeuDFiH2lPyeIxC5mMZR3mBpqEvk3nCEKH3VEbdbEYU6B6MhYY1IOESEVVFbpoFT301FO43tJig167wtpzD4ItKRajC+x2VwllY8gfCRflr7iDcNaBu4fHdqt+iPqXFRYus1v4E1C05MBwQtJZyjF6bqVMNXK5FNKxeTTXVuK+HZuQomJ45XIfrk2l0FFK4eR8EqfpybXNFfDW2AxeudaLiU5awKMFLEzQTZ+ZRGyaSsO+e0xXXG+Hy/LUtiaytNgfc1QkWoas5chpCqFEdRXSpJW2V+m+dg3XP/0UZ999D6fOnbNvl/R0dWFydNxeFtu2ZSsO3ncfdh85gp333oumtWuQyVdgloKpMMUBzP7VYFSozezs07Rsp3tWwnaa0HQC0xSDF/yOLhJiEqikd0gT2rWKK/Rxn4/erI+Q5yV4pwZGUbdyFTasrmf921kWBS1SFPXKk31jeahs3sM89AxB9I8TMxTQRQqjg/v2I5fO44NPPjaBqWkY418ZHRaynRKU1r+hXkTLLxyrjPJzbBtpGF7O0xSvvHY9rygxfSGpzSoZFy9ohZQs7Xy1UxhabkqjIl2Vx97d6/DMY0fx1QcP4Ni6Wlxjey+MzmBihIJU0zGz8jSoNGRdaypGdSa6KaNFcNzKv5CoUDQUXdUGovZQy1CJTbEv9x4+jF7ywtDkFEng2m+75ZrS8F6GxrX6XOMxGpPMK4D6U4kKSBOV5Z6dOIWhcrUdihSI4o1NDXjxuSfxySef4sRJbV9Ubw/eS1QWMRpCdB2QKE3hsfsOYLi3Bx8dP235z9PT1k4QMcke1l3PNEQLm6YzpSbwdRTaoeIu+ZeO1u67AyqN8jfC/+sDa5K3wtxgJYN7VGKJFq7tlcSOTDLkL5VGBptXV+E3nz6MvVVZ5BZo1VAR5GJzGEvl8a3Lo6AfixwFl22WRuaygUahqPcJTOCWdZoY2FH4DoD3qKqyZiT8VefIshGw3togsChkns0b16Hz8hXyZorGolMaoakmDHQULCU7uxyc4nAKpFyRhKvdfbLkLA/VJWqKhKCEGq8wgadBIsGh6RDSlJacti1J5muRis1iQ10GX31gBwaGJ/D+jVl0jtbj+FAMr09M4KdjRfywMIPOuVEUSM+5gQlMUjfP8lxsahjxKVqahVGGBXocHDj0tMzimqeSmJNlqH7QYNdLabMcR/RCOJiMJhz0EhKJijwStNi1EeMcBcRIVy8GWtrt29xd7R24evUKrly5gtaWVvukrLbF3r5jOw4eOohtO3Zg3YYNaFzRZN97rqypoUxMY5oKbGZwAMXJgkwGm6/W7qvhQXsQtMEaLxe0Lly8xmjIuISMU75EPThmXCupsnVrcZ3K75Eju9DZPUZPK49iLM1zLJjZGP1NWPEeCmhN/yQyFTTuK1nPWezftQG7tm7HG6+9j2nyqVYqqy8lDBenooiqi5WvftR0kkJNM/k6lSOvi1EJ6GU88yYsdGUb0rOQ8lBc2+EntZ0Mw3hVNfmiGnHt7FrdjE2bm/HbX7oP/+OudXipJoU9NRXoqqjBG33DKA6M0WDQHmt+ekpWtUIJc1N2i0ojsKZTGPohKmCbgsBWvdU/UhqzFLwHH30YJ97/CJlSwqbr9J0W9zEnoo2dRWURyonytvwX0RkPpAt5PygM7dumcaLPEWhDxAceehDbtm7FG6++ho72HiqqhNN/5Ll4cRZZDrZ8bAGbV9ajqXEFfv7a2+yaGFle7aeSkLIgPZI0ksKzHfWdxqbJGl9X/vi46vsrAtFlGfzdlYYR28f/noBduViGhTr2A9WsNKdEzI1k52r+dTafwn2PHsU+Mm/OLA1aT7Tqzg5N4zvnW4DJIfbTDGZL1PIccPYdcfvcqiwSBkINQoVW5l30nK63TmftIqIrVF3FmBQgdOUHR4bxwKOP4Nw776CqvoEGGMvnfbrSslC9re6uHiGnmyHcUY78ZeCKd35HSHcKgmk+dNN8Tti51SFeYTCe0xvlrMLaNdX4wpefx9unr+N4SxdGSKtJfSiKygD0IOjM0XICqqkwmlIVwMgk+kfjtplivDBMxTGG4gSVRoHCY4rXa15XFhcVhFlbQg0gWaAc+PbVMm9B24tqUiiyInVsfaVqJqHPZyos8pxc/1nmL8U5MjSETiqPq2dO2xTXhYuXMMC0CtJ9/fr12LZtG+7Zuxe779mDLfv3YeW2LahuXoGCPJOebhT7+uzB+wLpoNVKFRXkIwpyPXg3Wqor/WotEzImzIiko3kJQUhLaeiYOL+QsA9tpdL6PPAmepnXKX/pQUjoi3/Fz+Jfe2YgAZ6zdx1KFEBr1jbh67/16/jW93+CEdJ6Pr5A1nB0iJjD7ld5TlmY4pHAFyoeIZVBCLX6R4qBx9rd2KXrXk1LaVVUhl5fBb22vFemMs5ioOpAFYurSi6gqakCT+5dg989uB4rqQRTHDcpXpOuz6NrcBztFzpMeM/Psd+DkCSd5WHIwg6ehikKNsWapHgAY0+Na9Je/GrGTAZThQnso3ept99vXL1m01KaxpThYUag0AwvMrAfAQY2KIgWKFQBTmGon2wMsO/00DvQwV4e5Hj96q//mi2V/fHf/i1zZP1ZafGevfPEtog22UwKwwO9eO4LT+JDKrOZqXlMTfq2z0zRcGIH0rMu8djem9K9QbFFIEJ49IefC2rPEsL9EkDlLsP/SygNFRDRw8pzSkJhOI6XrSHX9NVYoYA4rdIj+7dBG6TNkOkGSnFcGBjHh1euY3p0iMbdAgcsO5JMljCLxDFZeM5hForAOk54l8D7VHMJZfM21ADWV8yph7VTrGOuMo97Dt+Hcx99iApav7KuVa411arAOsjajooPdbk9iiQqK4T2q3KVwLoY3TRINDDkgrM+pnDNuvLzthQQGihxbQ2yqh5Pvvg0/stPX8bVLgnSNAozkyiK+UUjKdciPQFaXBqfqyuyyHJgtYxpH6tZJCaGqVToaUyOAUy3qSkqDFs9YkpihgOIodopYWJCJSgKKQ4NyKA0XFyD1G2f4tAtJLCG0tJ0A1FTDOlcBSroWchKlHAxRfLuOzj77rs4cfwEWnp67GXGispKrF69BvceOIDDDz+Mnfffb1uMV9fXY448McTrpvt6zbJd0BfY0vIeWJ5oR0Gq/tSzh+gBuoR3nMLHaC0aC1MmfEfGxnH06CG0tl5mPlnMU/As0GO2xR0S+BJW9DD0dcQKYnU+g29848v44atvo72fVnu6iqQi37oGu/ssf/WfFIbzDJwC0AezWF9a5baLMdNiDDXtFUI7R+WQ8pa0oRSElCCZcI6ewez8DFKpOBob67FjyxYc2bUXB6ls9+zfi6btW7Fn0yocqqugMolRabAv2Kd9VCAnu8dx5XIH+2yeSRScpJ/GmBkHvm/tg0PWFv66gMCIY2CvmB1t9aEpPd9R/eb7+/D0176GcydOY2RgkLzK+oof2M+2ckr5mxEYPAxHLzuw8aD2aTwKRXtvNDHU8xz7HoaVRcVB+v6j3/s9nD17Bu/RyKusrmJTpmnfkC9VaWXNdqdTCYwP9uA3f+c36PG24PTJs1Rg5E/SI0bPOsYxE+d9dIVJBtZTtDDe9Q1X4KNL0u4QbJwrvCNkxlaGRyXeAfxylIaFLvj7AptCsZYq5ED1VrsNyjKwzickUtXo7BrBp/rIERnnbTLYW1fb7ZtJe6oyWBibpjU6SlJp7xc9iCLzirmsAz0Tm0D0x6EDl0No/y3BKQurJutpOfAgzI+rzAIFyEOPPYpPT5+E9uRXbm6aivfpBg0o1WEJ3KYuHkKVTEmoDgyNlRQqTeVwEDoLWJapBgwHJgeIdu7U3K3t58PjzZvX4KGHd+J7b36E9sES6xbHvAS/PAwJeikhCr040qxVChPE1Zk41mbjOD2oD1LRixsfQULeSIH36GG4pinoWUhhxCmQtP+QPRBVOzWI6K2YxWjHZSghEAaZxUkHxk2hWOiuU3eFaThNe+nFL1mhoquET6K6GokabTufwww9ob7OLrR+chIXT5zC6VNn0XL9BvrpaYyOjZpFu3rDeuy+/zB2PngEa/fsQuOqZvuuiV6ClKKQAJthG2T56yttbqv5DD0OJ4BMmFMpyHsokvZFxmvyRTxw/26cOHMFqco6zGvzO/8cIUaBH6eHkc5UoZ745EP3Y7C/B2+dvoFszWq2Q3xFupL2eoYXVjRpWkn3IpdHPOu+rqglsfq2SoJxvUehRSLaE8q2+GDd7MVYdqHakM5oyofeZS6Nulop0ZXYvWsH7r33HhzYvwe7dm3HqpUrkBEPTUyhe3gEFwZH8H6fdg+YxrbmZmzO6t0d9i+vOTufxp8e78TI4AC7fYR97JaW2ouHpjR8PzJkjgTXZw4YMV4l+VhHGTimkEnvNPlzZmIC2x55APWNDfjglTfoEGQwr2dlUha21Jb5lujFMB/xvvGSQPzKfN1KMZ5Rnj5/M5rYZ7YAQOPVj9Hdu3fj2KOP4tVXX8Hl8+fts62aFdAWPTKSrM42Buh1UJY8/Ogh5HMpvPLTt8jHvIQehdqtKanEVFheS34Xj6pexqvCkJdQPwKf/pngqCdyOYgidwDlmVvBvP2zC6RZsCq6wgkWf3AXILfSCai/P1iqNGgVcyDGOPgWonc1ZDXTIuCg0CZi8/k6oLYR2XwKFfWVyDfU0KWP4/EHDmNlgooilsHJsxfw4cfv00KOoTBIAaFlcLSCS951FMr6tfXTsgpuBZ/bbtXXMaWseBMkZHAJI1kw0xxQT/zON20q6OU//2vk6G3oQ/uyvG33k1m9LTpDArCbjO99xy7p1yUHvi+8gvDlL6GfBooUhupDjJQGBUeqilasruH5557/AgdlI37wox9gIllJ+tGOpNLQaU2ZlEr6GFOtPQyN16xEvK4J8/V1eKBhAQ+trsC/OzOI6YlZxDtakRzqRGmwAwvD3U7haF5XWyeQtrZFtpSBDZwyL8u3S/y1BOwC+/FCwB9HYTkupplFGeIBmSYrUrsDq7wFKiJ9j8U9YyGSPqk8BS5D2wSSofZSal6zBo3NKylgtZVHyb7S197ejsuXLmNhsoDKFWvIm7SGKVj0oHtBfi37O0mBk6Tgq8nO4Z/8o2/gnfc+xslrQ5jJrDRrXHSwetILqGL4wrZ1yDQ34rsfvI+pYsamOvR1yNLsBI0cCR4yhdqoHxGNbZGnqP7WwuvQ7ykqmWxhBEXyuJSnFFtNbS2qqUCrqytRWZFDjsK4QqvNqDgmJ8fZpiH09PbYG+3zqhtLsbfOyQOZZC3m6ckX8pWYbVyFNdVx/N7DO7Bt/TrUVOXRPVRA79AELlxuxRuvfYgZekaDo/0ojgza8w17rsVxZktOKUjtuQyppPzV88bsVnd9I4PtkIIj3WKsmzwh7af2jX/yj/D+e++h4zwVL5Wt0mxKivRx3rl4iXnJABGdFBe/kP+1XFZ5G300FkxhaHwGb5HpNI6e/vrXkSJvvPb6axQNBY5beoaBVwUyBlhKQl4bx8S6Davx+OOP4z/9xz9lnfJWJ/F3zLwLohSGjKRQH+Ul5SmIFIWHcLwseTm4cb4Iy49vB+J30fyOwWfL0bLoaVjaHRa4BHjLnVZUYNa33eQTIlDC7TAA4yzL7rdfd865oO7hs+qiB49miVLeY5YCsZRGMZ5BW8sNHNixHh9//CGOHXvYhEOnbRmuPDyjMS833RE6TfG7IK5gOT2UlZSbUIOZjClrJ8NBe/n8WTz9wgto6+gkn07YvLmbtw/lu9By5E9os0+5CcIiAesTq4cP+W8DwisJ52n4uAYkhU2WA36Gdfjab/w6shQsf/G//wfEq5vpTZO5qbxidP21VNIE6izL0NNY0llKUbt+apvoRsxg79oV+KhjgBYZvQDml9BUVkEffxplHvIyeL/eJZDCUF4aPDYYSX/S3vpT7TZ0isTi6hf1q/ojCBh/nztHNAtQcR+aNevii1NeDP0UmGjt3nfwQpvluHc3kiRL0r10xmtj/mWxyfFxXG9twaUP3sO5N9/EudOnkWuoxyOPPIqjRx9AZW0dbrS2YprCNltNhUpDQfsyaUl4Uf1Oy3+agqJA4XbsoftwZWAUo7kGs/ZLVCpFfUY3W4VaeiYv8PyP6f20JSmA5sThFGxM1wexFipqsEAvpVTZAFTWo1Rdh1RNHTKV1faCm4RrPMV+ZVtSVCgHt2/APbu34+iRI7j/6BHbPHP9+rX2kqR2P9aW6h+8/y5OvvE6zl+6RE+9C+P0hPXNlTla1jYdMzNLBVDEbLICM7xvhh2TpqJqqkyjqb4C//mtT/CDS1346cVOXDp5Co9u3YRKCuTz506RnuR7LX4o0iBT31i/i6YUqupf9aW61IAR8qxNTTH/BSlSlifvV6sNN+3ahU2bN+OdP/8LpOtprLB+6id7lqH+Vb6WjecRy4+BVxpC5a3xsGThgsaJXQP85u//Abo6OvAW+9jkCq+1lzWVt2WpHw0j8Ykehs/gxReexl//xX9BOkFvhMpRbbQXGvUQnPXW0tpoFZfA8vL180kOlh6r6rdDd6FTAYs3hfhnIe93GdwV0NNodncTXAa/QC6/EHihVgbOOmK6HViSXRO0oRFFHR6ErxfA9pBMvaxQHU9dWNSXwfLVtEycq643VhPVNeCYxPbVeTz42DH8r//6X+N3//k/w7Vzl/HRW+/bvGNcjEzhqCWC2kzMPA4JODGihGXEhB7EAMvB2lXWtnAsL0NTEAo1jWHeRpLeRh8e/ebXyWTT+PDd91BBYT1DS0zTNvFiidYhBasGloSeyrYq+NCgrD4ER1eiQqOTQl5lg0EehpDpNliclaUHyikOyumxEXztD/8QwyOjeO1vvo/6NesxPDbJvmGdtcSnJJoLmFdSXl0lPY1KJOpWIVa7CvGVG7CxBnh073pc7B3DuSvXaakOIDU0jGJvu332dmFyBDFavJrj1XJbSiQ2h/QNtCwfVCxGzVMgWOp1iId8LEQIdifbaqFve3ShaCBYfiy+0oWiF9OUKiFhlqjRzQkN409eIovUnv0wVLqtjBmfwObDh3Do8GEK0DrbpPDtD09gYGza9kKLxbOYofKYpUBPVdeiIhnDNx7di45sCmeY707yxCSF3mny347+KXzp3qP2dvEnHT0YjqUxP0Lr3OrDlqkf45rOyrFb1I+sVGoOdcVJrCKuSM+jPlNCYz6JWiohXo2ZwhQGhsfQ1TuIjs4edHZ0Y7xvwPE1lUu6Io2sFBfHwDy9QPt4kfpBXhiLlXWcMP6hB8VxlcjlkaeCquS9X/7aV/DBieNoHaBXnOBYo1KYpqGmVXC//8J2nPv4I5w51cKhNW1K1zxoraCTMTGl54pSHORuE/bqOSLb6laxxVFMkO5Sgqofaf7Yk0+ipaUFrddumELXp1Jte3F5G8ojGBYRL6kdbATvNYURUMfqQ44DlTVPZd68eQOe/9JLOPHeRzj+2utINTZw+HvvU9UiDcwjYn7a0YEJNmX79Je/iP6+Hpw7c5HtllHC61kv86b0QjHzcNNSqo6vk/KxNt8MRo8wDj4DlsvR5ce3AsvV+rQ8fyZ8/q285FemNASLZWmYmtIgWqqvlVMaOnBog9gEoUe7k392rFDDg0ymzsxXIUaBZi8hpfW+QQbpdBzV2QUcfugBrN24Hv/5T/8UTz3xFEYp1D545x1TFmkSssSBO08hLsVhc/fqWCkUdbo6OtRJwu5WYPUoA19fTaG5KaqsvSQk6ytXXYnxyXF843d/Cz/53g8oSGnNkQlNach6okWqKSpTGlY2QZ3to+Ug8vDX00NRCT5/wrwKDXqHNjXFUBbpPNtR2dSAX//138BJWognPj1ubrn09ezcApus9hCtTMuQhxnEsu7zr/HaZpRqViLRtB4NtWkc3LUeq2ub8Mrb76NtdALxoV7M97UjMdKFBT0Yn54wxaFlt+574aSx0VMYBnoZ8FClup+loP4PoGZKsOtfOURtLw/1IwESwM4JHT+5axT1NKRwcYpDxz6NtLQ3pOWJkI56tiG+E3/OTk6iccM6bN6yFVu276aeTaCnpwdjff0YnSxiJNmAwQZ6B2sa8D/sXYMjezdTzsaxguQmt+HKDAVOoYjzPeP4q45JjEzL+2Hek+55QDWFdBXrkqeySRKr0jlUEPWcIp+KI0sBlZgew8xwL5VCJ0b6ejGs3Qfo+RTIV24ZM/lKvEQhqa9LSlEsyAOwOMvXUnT2gQwym7bxdDEDjWOrRI9SUzUyNH7jG19Fa08f3jx5lhTI8z4ZcfMo6F567w0L/Xj+kYdw/dINnDpzxu6ZGB2jd8D+16KIafY9ed4MM4G8EPUe26gFBgr1yWLQwNIeV3pu9Mxzz+F7/+lPka6rtxVzMq60z5RTGtbz/PfCWLzk+8z6kChF5FAecspWsGkRyr7778eGzZvw4Ycfou/iVcSrqjj0ZdAoP9WJGfFQ791I4GqBhTzzg8cetX3AXv/5K8yHhh7rImUc47i1faXE32qfTUUpL6uZyzOM6SVgFL8jCEpCWVnG/jjArfIxI8Aidnjri24DCSQqF6en7Ma7uPvvDItlOcGv42Xl89BNZ4kYPFYj1fEGuieKuQgvcC/nMarOYLIteyVTxPX2MQcFhzguX72CNWtWYzsH9k9+9jPs2LMLBw/di8uXL9nSTS3jFLOY0FFeCpWPhIaOXQ8p4sNlsLwt/tCyMMHDQWCCyD1Am+cgTVXnUVtTg87WNivfLcNzAtQsArUnKvfW4OghuqgMV2BYHaJVPrbligQcB4yEXZoDUP7L6i2b8DwtpW/91V+h40YLKA5NadnbtbYahYKLtItT4GgrZ4U2raRyKBxsu4k475IyzKVpGQL3b21Ee0sfegsxKt8xxOY0j62ltm55rX3qVXmYgNLADMoioAIXV//fDqNrFep6orOgFo8jDALFrFGHbhqM5Rt9fR3snNIU6lgDPqS70O7jYVQFnl/QU2UaK5OzC+gdGkd7Vzf6eruwblUjDu/ahH3btqEmswLnqzNofGAf/jmVxjO5GA4tFLCxNIetsXncnyoilU/jcmoBryfpGtMDSMTJizxubqjE7nUrsHNVLbavzGNTYxwbKmJYQeEcHx3HYO8ALrV14eLVVpy90oYrrf3o6BnF6AQNESp/rSArztKLoGc0NzVBw2icfTNBo6RAgSvP2i99lvBln9tqtUAP0iZMfWrXaBlQRw4fxMrVzfjbH/8EMzQyiuNUSoUJGhrs55lB5jWGxGwW/V2DOHhgD2VmEW1trbaEeVbliN5a+BDKMP61IshPTrBrjOghtb3MSCPu4JEj6OykMpyYcN6FBLHqqYffpnjUGQGYkaqsfMyr8HkyLi9R28vPsWwZTk+/9AKVdwZvvfIaJgeHUVFVzSZSEaluQoEC8TvHlaaXtXP1LsoNbWPy7f/8Z2QNKjjxCfk6KQ9aqwQDn7OO0ZQrM1K8/HgpquaBGJ8N9txayMvdncvACYUlEK6LztxZUQZLlMbdwJ24QJ8Pi3kYgSTgltX+lg9qjMgBJDhcfaxKRBP0Al0nq0mdIzIxXKCAkquZpXVx+s03cfSZp8wqePcnL6NxxUo88+RTOHPiBHmLnS+Gtmx4rzLXoSvM5R3SDZRmJxevMfChPzYVIQtMx6Y0FNcKyRwGh0fwyKOP4Oybr6O2eTXH7QzrykGg+rMoZ6V8PhgtpFi9UjIlywHnXvJybrjm7GuooManaBVv24iXvvRF/Mm/+Xcsi/ezyHlaflIYbmquDKU8mCaBb9+FsHKYN70nPayMp2iF5utQQAZHNzegd7gfNwpsY2HUeRd6R0NLD7VkVKg8TSATWVWrQDkojY23wBJuB7rPofqNv4tppgiEOmZoArAsXcchrTxu53iL5REwVJMRKg/+utO6jgJDL3HZLdav8uYSoHrE1c4efHJtANO5euzZvwuP3LsJX95ci+foBNeyfQkZOhRmWrWjFVYNHJo7KcBmqEx2xmbxaHUWh1dWYceKPOrzSUzOJ3C5fwYnOmdw+sYETlwfxtnuXiqpLkz0dGFqsA8LWlY+MYJkYRjxSXp3ejdpcgQLU2Nuaii8YEk+ixSFQmLMXpAjso3Ge1KUahbbpTn8DL2NFU21eOKxB/Fv//W/RbKyBkVN0ZGfErMFdmnB+AgFTclM0+guoJ/ezle++hVbmSahr7fx5VWLlk5pOF6PwAv4BdFFHnllJeZ432Nf+jKO0xPWNvDzMzQEdQv50mYBdL/GVjl6/tfzEHmEUkD6Pr68BL1RXlFXg9//53+I69ev493v/C09KHptvMcWMShf39eWl4D9k6JXJ0aoXbsKz3Hs/PH/8//t3pIXzaho9MxONHZfJmQenq/Chp4+Jwud1Lv57xcBl99SNCZV9e3Pp/HHwgBLDj4bfmGl8XcFR//FmlpzLLGMXBbxLV4CulZBWUhw/Eb1YFzk0tztrsMcUy4wKiwiX9+Aj957F08/9yxG6GKePn6cTJrAMQruixcvMAcKABMMzMSy9HkqkDC2AsvKkhVmZSsefvw5QWgfr3NZqa5kYh4s8L7ZqWk0r1uDLN3ctosX7cUqt5Zb5Qt1j4+HuiwHK4L5mjCXgtLAowDjYNEzjFKSaouDRp7M2NAgDrGt9x06jG//5V/zVg4UDuLwDMUGohheg9HQPQx2u6hSGUs8SjgKqZA0DRNLZTGboYVGj+OeFXHMMu3iMK/T98EL2r5Fq9OcsFr0NDSoGCo/14kOAn0Z3qa1twTnZSiyDAPYsU9UaIJRcV++pZXF+R/Vjeh60YHbdVn96VBnjfaK86J58kmRtE7mK4HqNegrpnFpfASb65J4gUp1PWmZUd/zHikLNz0bQ3q2hBzTBlIxTE3HMDSRQO/gJFra+9HS2oO2rhF09Y6gf2QcE0MjVBKDmBvuw/xQL+YGulFkvESFjVFa++PEiWGUCmNu/y+/StApDCmJYAm7l1z13kTMrH+1j42Q8mMohaH9nhJpWvz0fI49+hBOUngPT83Ta+D9youKw22NoUUTRSpDetGzLJOe3PjoqL2x/9yzz6Gvvx+jIyPGm5oOE/3jpLkz1FSmaMhQXoGEvBYPTIzj3meetfPnz55jfZ1Ss+XW4k8ZVaKfeJ7321Qa87eXVsn/ibSMmpR5F1LQ02TbFWtX46UXX8Trr72GM6+8ivwqGmsaA8zTLakN/U9QyPy18kz0SFZk8fhTT+GVn7+MedIowQ7XFwltkQdpYFudU4FYvcRPZXmFLI3GQsXLUOBNEoNfjpFeBsxauf8i+f7KlIYDVTughoqCxTRHNOFy4JVqrGE41r8dWLIDRXh/GPgmnMSUFHdM0+6gKXZ2V38fjjx+DO3dXWhtbUWB1tIzTz+NLlo1+lC/LBL3YSIV4lEZMhTRbforlBVAh/ZjEQ8urnuE9nyGgtocFAoXMfo4B/MTzz6NE598QoankBejiXkF1gbV38cNGFHcsuaP5cWBZlaaXHDGbdC45xeJrL5tzIHKex768gtYsboZb/3532BmokBBQLrI8pMAMEbnRSrbkMcUJBrY9i4L0aogZSQPQ14MvQ29J1DKVtqupysSE6huXofTfRImfaY4NMerpYdaQbV0ekro22KwNB6xxR3AzYNwqaCPwLECkT82oHlddJE7juIRKO7zk3DScx/2mwkpC9mPTJM3Z1te2LsT2rafSiFVh5maVZhcswU7NtbjwRU5rNM9LFurqrTiT39J1kur0uYTMZyYLuL7bbP4cXeWnkUa7YMJjPTPY2JgBJN9HSgNXAF6ryLeewOl/h7wJJXEAJJjg0jSu0hMjtHTmLDtW2zxAfs3TsEmTy98DMlZ6e4lO+3FJoWhKR9rC/vXjAH2sdorY2OaimnD4e3I56pw9tMLVHYlmzYyvpnWG/5zSBGLCxS+JfY1+UrfBJd3OzI8jJ6eXhw4cABXrl7lkFRj1b9UVqRr9D6F6GK8y7K1FJx01CquF7/8Jbz3/vsYHyIvqSuMR3mPBDUVju0IwXrKG5K3oAf3Uh7yVKR8tAJL+5FV1FRjy5H92LR9G976yc/R29GFTFUNnSw9Xyurh3hAdAiMYSH7cmIMR1941qaS2y5eYQqrIuVLGoi35a1Fikw09rwU2Mv1NMOIx26G25/x+YTMIrgp4TNBV39WGbeDX7HSWAQj4S3bfItmLb8u6lCXj5jJKZyyjrdjnbCTBuaRUFiPDwwgk0nj+S88h7MnT2Kstw9XLl/Gb/z2b2GEA62vs8OsEy8mF8sjkLWNoSKmiiq3WKfFtEWQkNHAMMVB5tYcayqdxlhPN3bs34fKhnq0nz9nbzRLuUV5mCWmNixrm07L+7GP02iwsWYa8EIOOlBwaYttPUScKRTwlW9+E0ODQ3jtpy/bINGSRvsmg+ZjvRBx6IUK/23pqVnjDt2byCpLSsm/nKaX2lhGoiqHLJXBmtWbMNw/hHkKL31PID6tB4MUYJrrjaanhCwg6qfFwIDpJiB+YRBxpKTdkUFZHwrsCv5YFRiqf+R5WaLaaP1lV7m6WboEqlP6zrNzhkAmp8UOmg7JQp8CjScqSfo6e3Adnx1DQ6qIx9blcF9zNZpsAynqUTlsDKmCzGIVfQvpOL4zDpy+0I+pG0P0IDqAgRbEBq5jnvHSQBcw2At2JEqjQ1QW9Oa0yIC0XtDyZhog+iLcPD2KedI77Odl78WYwghCjSgjQKEIIEGsdkrxUciq/bLQ9Y6K3jqpWdWMZ556Gm++8ro975oaZyWpJGJCTW8x/1COM0DYt8xfm0TmyM/aJn7n7t02RSVFYnzHoq1c0lReq6HK1jtNVBizo8M49MjDaGxaibe//0OkamrdswP+m+BVf2mBiXifeRoqD/E+DaV0JfuB+WmfsXuPPmDTwPr88tvf/T6mp5xC0wIBkx1BaTBuwD6VApJsyZK354YH8Phv/BpS7KePfvoze5teCkPL0ZNGA7aHebml3aKtMhIqB6NshEv4vBzs5NJry/F2sOQ61nvJ8TIUWBgO7hD+K1cagdi3Ap+uAab7LHAZyLJ0UYYmBXw8SB4L+KNBzj/tyd954jiqmldi/z17cfnCBfvIz1t/8Rf4yh/8HgbpVg91dSNtH8+x3JkXC1CE+RvP6lgo0DEDf+Qj0RGrwZqKyVm+rFNTHLSMVB9tGnejpRUP0fM5d+UqBzwHnQaSGM/KtNINnIejZN0vJUGkNeWsfw0aoqYT6EbL0pXFO3/lCv7V//w/4zjbe/y991FRkbcPBM3LKpJy0CCfI6OXKw0yvqxhK5sD3yigaqhcoQSnLG55Rhq48maqSCtmtX3jRsTGRzE2NY2JsUlbZluaVjjFfKU0KMDkcfipQ4OyNnpql1Hv7wDLMgnKXk2wcxZXv8jm1bET6HbgPy0qusqLMEVpNJaycHS373gQpUz1IbBUtsI9TCX9psfGsaauAo8fvAePHdiP2sZKxLMJbIwlTc9TIyPJcpJ6kG6vaMfRRX7QN0kunLiGeFsP5kY6qSTaUBqmwtDU08gAQGFKwlJRjNKTY6g37233YNKXSsItGSeNpZj9FJR5q0FJi+Zqn2uwfiw0K528aB8cYlzvkMjLmBkawD/7H/9vePPVN9Db2W3WtLwMLYwIwlIbTprANN7x5agAliUZmsnmMFWYwoF778WFM2dIU5aha9T94nXPS6Y0UhT4uTy91xSefPpxvPfuxxidcZ81sGkponjEGWFOiRsfqn+ocLRCUS9UTo2McCzN4p/8y3+FtevW4U/+wx+j4+Jlm6JeIJ9bXqyc7XMm+ixjFk15yqibmZrC4eeesZVx3/tf/g3ya9dijoaQfSmRYzWh8Ura2iIReWymMJibeMtijDNJ8aUl3AzhmrvBJeDJHlA1iK4ru3j58efBfz1Kw0ZuObCVQXgsOeXTLJGogNe5wFHH9IjSiHG6vVIMdqEJPLrhehqlweKnq2QVJWtqcP2DD7Bu5w7kGmrQQbezYd0GfPz+B3iSTAIK3oGePqTIkKqrnnUwwvxUshXLmJhXKRQiYmt3iQNTWCpXabzG0J23t9opIDRg9M2EQns7Vu3cTt5PYYBekJZ1GvOpfWqcb6cBj631QUkEhWHKg4NOnoYJuQRy+Tz+0f/w3+Odd97BmQ8+RCKXQ3FaA5y0kLLQII+8C4ZGI4+hPILobFVRuRqkhhKiQikN522ks3VYVdeAlalZtIxMYWxyGjEqDMwQKdTsmwrBy4i8DZUb2qdCrCCVFCXdEstA197MT+V0d+gytRNGVtcO0U+Cx6MJIaLR0ykKLZO21TwUpHpvQEtdbSsPXROXcK2kkNXutFkKvBLu2b8ejxzbiYc3bUaumMGHl7vwF619uF7ViIP1GaxOlJDQtI6RmWWRd66kYvjZ5AL+84ctGL96A0W9US9vQm9UmzdBJaG9vPR2fdgAUsqCBkBYnWZoU4BC0Vjo+9PoKjQC6MfoYDGGNt1IoV1ke7UkVQaOFmYc+9KL6KXi+OTlnyNTVcWiWTbz0xJ1KZBoHp88pOXB8kyN9fVD0hqf8G+G1x8+fBinPvnUtsF3slX0Fg+zbCkNfQBM26rwni1bN2D9xjV47Vs/RKam3qa71Kbo+ZWUhvjPeN7dlyAf6mE2W42jjzyC5156CcePn8CPv/892wokxfMz2mmWhds7GEYXUYAo/igDrTKcpSLYvHcXdm7fgb/+//5rZDduIitTOautbLcpTfKxFE/YDy0oCNHa19Ro7iltJ6P0JcDUW59wYLcvraPg5pRbg7K+Kfvb5Lkc/qtVGoEXDOzUMiKWXx7iS7LwZGFGJlYtdKBQMlqh8QjPy73MNTbZNhD7ND3EAXHt3DlUVVfj7NlzuP/++7F+00ZcuXrF9oiyCupe1dtQ1qkT4LJ6oqraZe7PDuy8FWrX2b0UTFY7Mr258E2N9p2Nh489igvnz5H5c6wfWT+iUdn9vNft7EvU4DbrTINHU0VJDsg8ihzYW/fsxUMPP4Kf/+xltJw+gwQHqr4pbd9QDoJEykMopbFEwBAD+GYLrE1WB4YmbCVUVT7LTmfpbTShtiKFbfUJnB+awahW0szo/YxgCQehJqssDNqIcg7C4fL0ZRDqtASYaHdZ/1jKYtzQ9YV76dH3hXkUbIvaI9qSnprWKPck3JJld43eVZBw1dYSWq2UosGxftM67NizDfce2ofNW7dicnIW1y614/zVLnxy+To6h0YwMTGFoeERjOTTmK6rxQKVzzTz7aPbcYFVOTlSwI/eOYXTp7uAgX7EJwZQkqKYoqKYpaDWNhymLLxnIUVhwlr0dALV9aHvx/IlxTLpRZjlJGXTnTKlWNCUi/iSx/ZJVdJ/9ZaN2LZ9O37yX76NdHUNi2YdlLctdWUowSv0ZS9581kgXiHdJD616KOxaQW2UABfOXUaSXq8CzYeqCykMDxqg0cp6cP3Hca5cxcwPCMjTwJZCoPZqw/F/15xh5155XFoH6h9+/fisUcfxvRUAe/SWLp26SKylZVsKhUXvZ3gYTga+TqKFwzkcenhf4rkncaqjRvsu+yvvvwKihmNSbbVpqXoyRnd1XZ6K8oz5OfBRd0vKcyo4jK+XHgzCuzKu4Pb3GJjtRzUzS5wcJv7bgW/EqURKruI/BWz3g5udao8rexe43mLOeIrbt5FmeDTNU5p8JqIqWNmlQiuXbxE7+JZpKryuHH6LBVHLU6dOI7VmzbggQcftJUbWQpyrbCwbbDJaCa0FYbMPahtdqRiFpMJGiD899e7ZxsSRsorbtNFG7dsQYH1Hh2hsNAgkoYLDWRoK3fE4CrbLF0NGgpsXUuFUcmBPdXRgSPPP4d9+/bjpz/+CYZ7ek3IRaujwkA31LEXAGybe+Atmoh2vmzSS8W7kDETuELVwysNlZ+twBw9jZpsDHua0zhDWTcyyTJoGTtvwwu6oDRUjtHf90fUL+ojBf5YdfCgWMBw9VLgmXB5qKfRz8ftWErX0dx5F05ZWEjUWn6Ly8ugUHdTUs76Fq1nRkawMDaK5t278dDzz+DIg0ewYfM69A/24f0P36fBcRm93aMYGSqij80cI01n2PbUyBimB4dwpr0Vb/SPYWAqhvbxIk4Mj+P7ba0Yn47h1EcXMN49hbimnSb7qWwn7XmQrXqS0jCFQY+NAkuLCmwr+fASmeLknbAli6OfBJmQfUdech6Ap0cA0sO8JrZNSkPt1HdH5ljek195CT/7wY+QS9EbnmT54XmFni2IZ9SPXmm4MpmfQuZvfxLIWr1HGsornabiePKpp/DBiZMksbwZTS853jVeYh2qa6uRpWLds/cevPnmu8hXVFFO0/hQ3qyfbUBpvJ9CQtNRVL6zI8NYuXYNvvLVL6GB97/1xmu4cOE8WbpoBoAedmuqynhdID43XmH9PC1UXy0i0U7PMuSqVzTihRdfwjtvvmVv+muyQkaXnstFn65lPqaEbMz4cRLA6KDQBXcCzqC9GVS3XwhucZvIaGCRO8v3H1xpLK9WRIAyxg3vR9wEoYXh0nJmV2J06C40xuVAUbLDRSWiayQzFFp54V4JDgr0M6dO4nf/8T9Gz9AQutra0LByJS7SItJa8UefeRKfvvoa8g2NmKNlag+ENTAUSuAIlaENFpWga5S56uMLYuFWG7VB/7xHy2+d0tAHXzIYHR/DI8eO4dx3v4v0imaOS5+3smBZtkpHg8vccSIHmeZxtSWI3vuY7O/HC7/129i5Ywf+4s/+nIbppBVnqzpsGsoP+kh5SPhwYNHF1moWRydHKytTgUJFlY8iarNNKwhZfxv0VBz2Fn4O+coENq+txdXJOIYmOMhMaWjpJ0MJPz0Ml6AzgUe0PhMwVDQcLodwzmOol6YFIw/OElQvxi0t1JPHRkenLOwbDSao/HnzJBQS6VlIENneRwy1M+4slUSRtF2orcGTX/winv3m17Fzzx5bGfTqK6/jg+/+GO1dg8yLNCglKU+KlK9TKErQa/qI7V6Q4iwQJ2YwfbkXlz68jPfPXsSHJy+i5Vw7FgZH8dR9R3Dq/fcRL2pLj2neP05FwfvpsVGKE0U/Kl4JQ6ODp59QgtAriMVjHye6F15FJtHCI//Vh+5ZBtvNtqfzOUy1XMPX/pt/jks0ljqvXceMpqDkoSovm9b0aArE1UFZGZCeZkzxj6oCC9oOhPnm8lUY6h3A7r37bKfaq9eu2XQRO4S3iP5JZHN6AXAGBw7vxiDpMTRUIKuWWBSNQOs75qXxksrYc8lcRRYT3V149kvP45nHH6LCPosf/8mfYaGygdklMTVNBUv+sDfiVU+B6m98wTLLQGSxTSpFFtb3X/6rf4Uf/+iH6Lh4xZ7J6DmOeRjylo1veRPpbQrDlJAjp8AmpqShRS9T3Hbx56Du15/LpxxvB6rz7e5ZjgHCMPlcsOvcxb8ypaHQoWMo/+/BEe0zIWRQdlc5BcyKUj6MuLgOGSlnaIK7xV8gBifzmPVOxvrwk0/wDD2OAq2SoeEh1FRW40ZLCwVmDF/+9V/DpydOkPcWkKaQFpgg5eAzr0H/vj6heAMlWbq7xqZGdGwCl8i4hL+s22ky9vadO1Gii97b00chTCHEqrn7GdF+UAkqCn3qlkpjQSukyOASgHSS8dxLX0SeA+8//cc/oT6YQ5p5LvUwGAYryYeyVk1hBAY3UNzRTe60a5ZvlQ406ILANaXB+nMgg1ZhRT6DlQ3VmM3UoFf7T2nJrT7pp2kqCj03B66Bx7JswLmyovw/AyIjwH5cimhuqUqMhGGoW0CmkRZRqLpH9VecPCBvgv2gZbBaZSeFIcUhhXLg6FE8/OIL2EvvbXh01ObJX/nhj3Dtgw8xR6GXr19hddD+Snrzep4Kwt4M1pScvR/BkEogyXanp2boSYgORcyW5uk4zCAxW8Jwbx9WNTWhsTqH61cu83LSyd6y5vUmqEU3ofpNtPNTIqKbkU4/ToSw1kYXCwOKPuU0Cm2PDBCH2s7msa9/nc2O453X3yBp2L/WV8xf1nqkNDxPGf/48nwZGuOuLPd8TYslFKY4noZpGD3w4AFcvNGC2WQlijpHpaV9pjI57Sg7jceffhAnz1zAREE7EFMEs57ugXcaaS3xZnli/ab6KnzpG99gd8fwN3/7t7h+ow1Va9a7N+GLs6y2DCH2p3jdeI2o/lfddIb32Tc5SDspDE1F5qsq8cJLL+KN11/H9eMnUaltS6bcLtRuSlBjRh4dKyG6eKXp+iCADjwuSf8sEP189K6grCyPd5TPHZXl8vuVKg1y0dLjqOKq3HKITjrQ4dKbPIRjDdtl+fDQ0nynmgVgXgZDxhUoJgGideHa2bOvfwAPH3vEXkYaGRxCNS2k3s5OXOtsx1e/8XWM9g1iZGSELnQOc8FjsQFClDXEuPvTKaUJ/TUWakAtvoikt6q1v84Cj22A8JoXn3kK71MgpasaneAyIchRksxSuOU4zvVuRBqlqqx5ERlaXM9/4QUMsM4/o3WkB+op3mPPMMjsjuGJGuRh0IvZxfzQoNeUBusmmjiKWFXtmBE3D6t6EFkfEw42iGWtcxCGjwDl8qxLDvXVtWhoWoluWoHTovHEqE1R2bsCEqBSGsoyDDxf5iIsPyZIkCudZVv5SvJK19E+1MmjzoV4lOZDKQhKHQkKeXgSRLZeX284V1Zg1fq1tIj34v4HHsDW7dsxMjqCEzQYzpw5gxtnzmFE7wxQUWq1VHyuSDpTQUigEONUFra8WC/UWdyluZe/piCPozhPWoCKg9ekKMi0zccCBeIpWvZPHD2A9pYbmJwssN9YH9GMaO+4qAw/LWIkCmSSYtcfmcet1CM5mKztdSxO+tgVar/xkpAn6KVqilOKUptp6uNLO/fvs612vvPnf2lz+7YzsDc29JKnXmSzHQKURh7SN2mYm0qzvIPysO9TkL72rI1llMjjiXw1+of6sH//Osyn8uifzqIo3qkgHTmemCEePXYUpfQsLl7rQDFeYR+sksKQQtdXDaen57BuzWo88dAhbNmwCm+99yFOnr1EBaypxaR9zlfTWdpdVmNdxpB5A8bDjhbOM9W/q6uW3+ZYB22R/9wXnsfpM6dx5fQZ+159+GyB7fRML8O+DSK+tek50cCNHaO3x6WdczcQ7luK6sdbpd8ebnWtQ/ci9Oej8Q1jwl+J0jBGKlMYAezYfsTSt4DyRMUXbyiD0FAf6LQdqswy8JeZV6Az/LfLxEz818t8ekdibGAQQ1QKX/3613CjtYVu8gCqK6s4Xmfw6cef4Jvf/CamONi15jxfWUmmLhN6GowqV+21cpiuQANUYMxa5t2QyW1g2cM8fWKzEt2trXjiiWOsVtLeBq6g0nJvkdMSpIchJVPMuLnXBK3RhpXV+M3f+gbOnz2Pjz/4ANrugFebha9ND01hSNBoKkpTVF5Z2ICyevu6B3pE4I8khBTqxzgpIOtvgpmKI6UvxnHQSwBXVFLYVGHruiYM9HZieDZu7xDYah9NTxGlPDSYTZRZXTyd/MCOylBiVB7/y5WDPBwqALNAjZZMlwITir5UDPLANOXi0nSNNmvUdF4K2co8rdwYZqlo56gUmnbvwNEnHscDDz+M7Tt2YJiK4bVXX8PFt99BT18/qz2LeXoIlqfaLqGpjSVJXz0gtZDCVKGtKjLFzLaZ0BX9eb2lB2HGcxRmWqoqi9imUOhJNOUTqKIR0E0jRQ+j3UNuPcfweZjSIN1EKk8ui/CfFDB0PyKnEnktq2u0Iw2cxU56yMMgLTTnLxpV5CuIefLe4/izP/ojZEQf1Vf8Ih6yqUxfB01nShDrnLXFivH1Eb+oLKL1ARWGnkFQwS5oWTKFc5LGzK5dB9HTP45p8Xe+gX2yEk2ZOXzp2afw9ifXMTARo2LhPerSdALp2AKd1V68+NwjeOiBwzh15hLe+eA0xukF6NmkVhvOs75S/ouKlUJSdDZeZ81ECMbc+0ZaFUfDgXXT1O5ETzd++w/+ABcuXMAFjiUtt9WYl8LWOy5GfxoIUkARz4bQGk46e7obXxsqfucYfv+u4GTPraG8vM9C3yTDX43S8H+3Apeq2t0KeNdiTxBvncdSsAtdtAycgGRJFIIu4oKo0ymYtY2A3s0Y6e7ByOQkvv5rv4Zr167bN4L1pqle9Dlx+hS+9LWv2O0dXV1mrTpvwHJjaCPU1TuqhvLXsVCM6xSHBq9cd32CU/Jcn+HMUEFpr55Dh+5n2R02v1qUtcWu00PDuNz4qgrWdQYb1q7Cb/3Ob+CVn/8cp958C5X6VOn0tE2T6E1vJ6y8Zci22du/Zt3Lu/ADyhPC/QZwDG9gNA/Hrv7hWY61QSiloS27tQtrrhrzyOPg1hUYH+1H2ySVhrYR0QNc/zBcGyBqwDnFUTbNEmoR0cqVF+JB8AVlpTeXnedANEHoQ7tGD3jd1J2mBPWWf4peUJFZ6G3hme5OoKYaj7zwBTxND3LL1q3mUbz22uv4+K+/hfar15CpqTFr0+3JRQHpnwtpozxZ2s6Dc8Iz+q6DVxTOEvVoAlbxcI0XPmo/McH6aToom0qgp/0a7jt0AFcv/f/be+8wu6/zPPC9vU3v6L0Xgg3sBMEiUqyiJYuU6aY4tnedTbL7ePfZP7Y8+WufPFuSOImdxElsx5JVbFmdFilKokiABEmQAEECRO+DwfR+78zcuu/7nd/vTsEMMINGSMI3c+6vn/Kdc773+049xPzRKgYSgm6JjqD5K4GtPPSFkvzgCd81soPdcM5Y6Hhmgzgsz5h35Id4o0msahYa6urAC7/92/jh977P7Iwjo/4w+mmj7bzyo3g7TVuO6bGwFAtHEsa+9WdNSgQkG1mnpkvNvWD5DlfVIhuMY8OGTUgP9mOgsgm5VAPrQCXu3bAQjQ01+PG+MyjEa5mfLOuRHOLBLJYvbMALv/48szeIb33ru6x7/czrJLLZDFmiXfW0xpzHawMKRm4ST0gqR17Zcavd0n/GKT0wgD/44z/GSVp477z2UyQJmC7PmXYPKH3LypVbz38fNDxnnLBzO5mT0++FpMzzTieQbl3MXYwmhnMxcJlIn5KlwcLkLmeg6VlWJksc3ezSOC25T/2M9X88P/3gGU8WCyQoKDpOnERnXy8efGgb2mltaLihJjuNFHM4cuwY7z+ExpYmWz03Tk1FHWgqLybEdM5Tk3G8MM1U4Zjgc01TrhJLC2alImhYpzb9V1PJ2bNtuPPu+wQT6BoaQpDau3YK06b3quRRaj5r1i3Hhvs34qc/egOH9x1CkpVNW8kKMPzmKLeBElOkQq8RLyzszlTn0SLrJ1ykCE4mv1Dp4EDXizuvbEl6nrtRSBQKYc2GZkVM1GI0VIP1zRFrdz7QV2ScGB8DDU3yU5MN46h5GoyH/DXwUgU06afAxC/nxC+VH5uha2HJqeIrbB6pzTqwmPCMwlfgKmd7S1PoMcW8poVRXYFVG9dj62cexSpaFFoPac8HH2AHrYpTez5EjsCQbGm2bXC15Lk0VxOUSkMZCCjAbYE/CROmQ8LU+OwEjB0NTPiurpU2E2gCbR35vgkeDzD5vS0GWSpYXFevWIKO1lNU7gu2ArMJLgMqCW8HGsYqEfOxLHJ8wWXXdLrwypwvLB1/BBYsczyPsMylh4fw2ZdexPGTJ3H6xAnrD1MYNsSU1pTWp3LLjbj4m9Of5Q/zwXdenhhwCCzIwxKtaO1tI9AAFaJCogZDtUtRWRnFpiXV+GC0AmhehJqGOO5ctwiHT57AiVglgSWFcC6AVXUl3LFuPlYsbcC7ew/htZ+/T+ymf7S81UEfBIW7N7zYWRVeukWWdsXHi6cUNFoXGqYb0RBxgRrf0VIlJxjujpf/AamGBlO8bPMlT7mRsqC0y8Kya/HZY7GBt8LxwivThNPZkPngK7QTyQ9ngnNvzTEA0Rw+cUlxH3yKzVMXITHCe8Hed6fT00Ufzkzjn4nz3oE3XZOHd8N7Kc+CoR3YpPEPDw/jwQcfRNv5Ngykh61ZQ+2mh44cxsqVq6wp45MDB1BTV2teqvnLNYG5yqxRK9RrzF/jg4EGKzErXEn9FJ6loZm4QWpWGskSq29EhhXi1o2rcYrAFa6tQzBVZfIxkMtg+913YvnaVfj+G2+g63wvovx2LN1PrZBaqYSbBJYBhQSXKpQTUr5265JqsbV4uYR7iZ9AdkdxnnDu4s0K6KVFI7pK1m4ds2a2QLIW+XgNFlQW0LhgAfZ0estLyMqwEVQED7XN24gtLw5WCSWIFIQDWfPfdwzHBhwIFCSQ/KP4yHMtJKfZ73oe0falqRSF7QiK6SEUUnEsWrMKa7dswh133YXlK1agv7cXe3Z/gIMf70crLYqhrh56F7aZxOKX9msQ+JrAN01bgpLxNBBwwOA3QbmZwI7H5uxcgkVCRmljojxBY9d6hzetCBhT3Ssm+PmN9riIhigsVy6zCZmxygpiBvNNICUlwPPfsU6C0n3tPNGPSODhyp/TXMQnCU11Sot/DjxkiY1RCXric88Sd4N488c/QUR8ZThqanNNm166VHb8o4JQ5OW8fJgETOoLYZlUn4k2H0OSgEHFR0vIo4IWRPVCRFJhrF23EAOM36LmJDbMC2GgOoWDowQs5uOiwAjuW1iNjatXsu514p339+F85yCjnWD0StZvobQHA16ZNvLjpLg4a8ImCxLAgqxjakJVGdUyJWqSGhkZwfPPP4+2tjbsenMH4lqLSs268lv5r/TKb5UD5Tv5rrQLMBS2H67VED2YRH6cZkdT35afFtY0bka66MMLyeqWjtO4icSSkhoHDXs69ZWrSxYJL3IzkZ6LazrMKTZzelmvK2umycxpAhZwqEmjp6sbI9Q8XnzpS9h/+BDSo2kkWAm0X/lxWiPzFszHQw9vx66vfAV1K1ZRo9VuYAxDbe4SqJQXrFL8Uejkg/onrKKxYklbVyVjIda1VowNRFiwK+tY4EvYQs1ry2234NHt23Dbxk1IhPK4985bsXzxUvzXr34NGbW1ZKmdalkJdZqaZuiEnARc0ISdKpXTaK2QewV/cnp1MemGR4rveMESueHGTIP+TFgoDRr6m6AmL42ymtpkNSpDGaxhnPedHzbNzVZatWXS1SE86oSRZYUn4MQoxU95IUHna60UIDa5Tu3jtGRMU6SwU7OgPed99U2ECRYaBZTv7UaOlmHD2jV44MkncO+2B7GEguccQf/nr/wIh3a+hY7OLpvprwmU6muz/GF8JCTL/Q/kk2mREg4GFrxn1oMHEnKWgIs4HUgu5x0PrQwqP8zxnOmV9aZmFyWbGUZZlcXWO27H7nffMwDMScNnvvqWhn1H53lv52Wyc4ZHv5RVjpdOgJrWwbBi6ngm/3LU0NfdegsWLV2C7/7Zf0SymoBv5YegYUfxgY5xNT4oj8QXPzz57QVkoE6/bbQU80hNUxLYsjJkKZe0ORrLBSobgIYlaGyuwOKGCG5bsQBbGqPYUFXEEQbVH0tiXiyEe1csRCI7jJ+9vQftfWnbryQzmjdLUMuA2FwRprME5ofxguErLsxNlU8rk9qbJOis4CKdrB4tM5JIJjA0OIj/6X/8H20V3vfe3U1803ato/RbCoHjgQNM5b3q0YS0+24KKXTjR5kufGcmmlzLpiE+cu9cGfmhmE+OhdM7LzS5UCBY8S/KH4kmJfLqk4XFMC4ZyuXGw//MEnop8uJhP/zAMt/dMMHB87LZT5KsUNNT56lT6Bkcwq99/tdw4tRJWh80i4MUkKWojTdvaWnCM7/1An6+421WkGYUQ0lWIGpXoSq6mFWgogCEhVnWRYnfsUaxLrvlN2TGIxSnyVzJgl6NQKoZ9Q1VeODOhfj9ezbj0dooHmiMYfPGFTjW145/+e+/hXiyAaGRDErDaRQIZMhrtI4PGizsJuCkHbqJjq7SK3EugRN/Z6Qys1QhdeCPOd9aIj+ZpiKtJQGGOvM17DZQUU0NfASrV69BZmAY6aE0xiSgqdm55hxVPvpjQsc7NWCgn3IEBe3aVpLTCr0URHbPAMrrwIx6o5/IW60BWBjsQ6mmEnc+8Rnc//yzWLZ8BXo7u/HGaz/F+9/6NjrOtBJYKmwmss2jsL4fgoSayrIUxIxXScKBQjlInpllIQEinsqZAKEzwamjeKd0XMSRvxSnTKaEuMqYRJr7zkCS6RYPHW+D1oQmy3egqx3rNqxDTUM9jtKKlXZscVB8GLY6fVVOBUD61Lw00k3fiV0+72jBWhnjOe9pxreu6+Y14/777sM3CBiV8+fRGGR5YhiOLwxPQtJLo7MyePSCsXJgZcABkZ371oXAQi6mDnDWg1gFddValosWhBsXoTi/AZsXJPDc0ir8VlMKj8Qj2BpPIhLIoTpaQj2F+tun+vCj0xkMsf6MMNw88ydHa0uLFpoAt7or3jJaGgSh8hFmnYwwPLpApJLJrUSM9SkYr6IFXImS9tRIxpAiKP3eb38JZ04cw6s//DEitOY0AdM16zLdqkP+ueqSDyAKU7wXAyx88cIdfQmno878vJmN8398P2ZNyoMJNMevZ00GGt65F9drFdR4IvyF9i5GemOcae5qsrtaRL8melfOdD+engZn59phr0SztRLtBIuugX488ujDSGdG0NXdzXoRo/WdwoH9hxAmCHz2ic+it/u8lH8WXHW6SgB6FcocKxEFbIjHEDWhkExmgpI0oEg0aQU7R6GWr27AssUNeHHbOqyuYBgFtd2WkI0FcKSvF+/sPc/Ko1FJ/chmvFnDFNJqfzZnmhgjIa2Yld0qmQkqS5mRO/OvXVrLpNt2yR/ywfLFTnVGePV4ozRZ0xHTZENuaW2YRilLjBpdbUMDGiIBtPUPYUg8Ufu8KqQEsvwwx/vUsqWpWp+FQENbfRqISBC4EVAa/hmRpsjrnHV8ZsmvOCrqa7Ge2vJdj2zHurXrbDjsvvf3YPeOnTiz/wCDy/OdRvqh0TBZsklDY31hIB7JEmNSJAzMoiB4EOBMgEhYeO84LdN3/KB8fjHn3nN9NjqnM2jQkaS0G3Ay/eSF3WX6tVVovpTHPffchXd37jRBr7iZFWRx8QQXPy1baHJKiN3nAxPiAgzxUM1F5Ke0f4Jtjv4kqirxmccfxysv/4ON0hrVEF/6LbCwcAwYFSHPT75j+W95Rr8ZJzWtGlCo/8JAQpYm8575X0pJgZCVUYtgVROKtfOAxhYEF89DcVklHl1Sgy+3VKCJ4QSts7+AaGUKHQSuI10DaO+iVZrJoWKsD4HBbgQymiQ6hjDjFvKA3QbMqQwyDrLQQ7EqGhXViBAkSqlKFBiPIgEhX51EsSqOFNM+j9efue9uHDtxEq++/jriWh5FkzCV32N0apbSzG+VEfHanJefHlgxWMcW92Pk6sRUGn8+K5rWj9mTfX2FfkxHk0DDknT1wyiTvDaBY3RhQNMGLbXL/U+had++TFKsXMycU6WwB1aH7Y6uVTlIGlarUTTd3V3o6+vDww8/hMzYMFpPnkQ8VUfgqEV7ex9GhgfwyP0bkaHg7qag1F7gWVU+q2CsVAIKAkZEfRd0Mt/z1PiKBhrUkDRSR6vF1jdhSXMlnt04H40Jgoa2RAvlMRSI4SQrzo9+vA8FCrbCWD8NDFkZmidAJwFnhZ2FuywQeS5tkQk0YeWl0xI+6cJuOCqf8kSCwjv3b9tR2qWe0ZXUmS+BQVeMx6lVVqBUWWsdjbfNr8TJwQx6ZV352puio8Itj8RiMZ0SwISSmqMidL5GTD9sGQo+G+vqNP9Xb1iPTXfeji133YmFq5aj9Xwb9r7/AT7e/QHaT55GuruPXgYZHQouClitOZTXZDkBloSAki0hLiHg8cwJSw8oxDc5CWdPSFy+45/8MFZ7eSDSQwl24wOdFTw+5bnm3Zw/cRQPPLwd51nm+tvOkw+0uvymMRPovvCif8rjgMtju2ngqzJH5wGv7gc1YIN+VDU34oXf+BJ27ngTHfTbWRdeuZGT/yL5Lf8sIKbD4qu8kf/yV2Chzm4N5JACJIWh0vVdCDRYnoOV82wf+WLLYkQXtiC+vAljzSU8kgrg8wTIQIjhqQwwqCz9PDlawMl8DA2BKNZFg1gWz2NRMoJmCvt68qWWaagyF0VlKmGrUwfNiid4leig/b9p/bIeRZtqsG7rJqymtV6zqAHVzP9H7rgdZ44cxu79B1FgvRtLa5l3KRI5WsKjCBIwNJlSI9UETEHywjXvKt98p4M7Gms8mg44fPbN5MrEbz2fLyCrFzpews2GzKqdBbkQHQUCYeaYRzNF8mqSJUjMZGAT4+sir/sT74pcrPzbF8bx6sV6PJsUOVYwVgpNjFObbJEFWOPLpZ05k5vCXhWBFaaGhfGP/tn/gNdefwNvv/UhquoWYZQVIMo4L6+rwUtfeBI733kbOz46Qb+SGBxWEwgrokbisIBG/HHuwRJycVoMcRZ8mtORimYCSA2aW+ZhaVMI//RL92B7cwqNEhS0Nj6gNfIvXvkIP/vaGyikezE2ehro06J2BAxbzI4akmnSrIgSgBIy1Fg1gc/n27i1oTR7p6LpSpNVAlZsvzKo8JJHQTVJiU+hMOVSGHlqdqhqAGqq6ZoRbF6O4uJVaKlP4vfvbMH3zwxjXz/529EFnD/vlvceVT+M4szjmBzP8yPkyxhCjK+WcNeIouGTJ4ChIdQRIB544AG0NDcTMHM4dvgIdrzxpi3vEairtWYqVWRrk+dR6dTCdG6orNLvkZIvsJAzAOENHf2yIAHs8cgpExLzTL/3eG5EfknI8nMbpkwSm+Wftb9TsLvVADQIgmWOvCzRygqmYigO9uKBJx6lbI7g9ZdfoRGXQk7WgIEf85VpEhgZkJiQZ7zlp6nfHlAI2KldqwyrWU7zGdSf8Vu/+zs24/nY7vdtWLGW+rbmOQG6eDWBB5Zwu/bSQKc0uDXHGHfWDRsIoX65uAcasjQTlYhW1SNbMR+lZloZzbVYurASixoimF8fwefrU3guEULUgND5//NwDN89N4iTHSHEM1mkRjKI5TKIBFmGA3kmk2mnFRZhHYxRsQgrrcpHiyN5qkkddLlsEWf6u3Hr5jX47LpFqEkGwRqCvd1Z/Pm3foi3Pj5E6zyHsZ4eV2+GtXIwLXXy12bgS3GgUx11zYGOvyoJ4osUAJUvlQ9Xn8QQT8wqD0iyAMflyyzIvlO5cJdTaTpAul50g4HGxJMLSY8ujOPVjfWkjGU8bUiptCdWOgGHaVOq2NZO64CjQK0wWV2BF3/zJXz8ySHs3X8IgVQL8SSGMIFhaUsCL3zhWez++BO8tecIMqUkRrVapzSasQwCFI5ucG8AxRjDouYUrKxCMpJETSSFefV1uOfBe5BNlLBlaT3WUh7X8tPXjrfhX3/7VWTOFZDuaaf2fBbFAW2pSmFL873kg4YqvrSlQo51ivc8S0OcngQa5bTryTT5QH74zVF60/JRzQG8Z6NjKJzUwVqIUVBU1QHkiUAj1LgShWXrCa5JfHlLCjszcezupsDpplV0voNA12tAEchqNJUm/Q0hpD2mc2lqenQUFJkBWmrULh948H7Mm0/Bw3ifOXUS+/Z+iL5DhxiZEFLNLbYC8ahm7fJ5ngKoSMGoZkYHGKz4LESKtl0LHCRkxAM5aY9lASmnw+Rz1w80DW9mRQ40yqSIkKwpynjp+OmsNjpp8LRONd8lRFfoOo/f/Cf/BD/44T9guIdAS0Fny7KoGUV9RIybAw06ee0Bhs1NMeBwgCHgiKgZlEl5/InHid2deP8f/gGR+kaWyawbWusJb2sGE0/K5PGDfNQIM6Ibw3B9JbKUSxoKTguzpLXHtGd2hfrkqADFU6isrkOotgnRlkZaGdW4dVEtFtKgrq1IYB6BYBHyWEsQU9RZivH11lG8euAcek8OodDbhUJfB8KZNPWJXgwP9yBUylHPYrnWsjfWAV6wlRnUTJysqEJNXRPq6ppRT7dp/WI8fvsS3KLhuIUs8oz7oWIE//r7b+Krb+5Ftq0dGPT2JLHJpwQMWqRStgw0BGQsLzac15wgg/wxdhh82NHmGVkKlL1OQRD5PPQuL0rmV7ls2GF64juz8e9q0wV9GtfaiXyU9K+Nyg8v4so06eIqkwvM/Sr7deaKgc5d8ZBzd0zmBOIsWyEc+OQgbr9zPerqozh9uIemcjWKqSg601kcOXkKd66dj/rmBTjXP4pAsprCVaY8/aFSVoqHEaQ2Fk7RfKcJn6+Mo6kugse2LMTmVYuw+9hZfPvICH7YPoivnk3jtUPtpnU1p7tx8OQAhUeIFcotQREgMISpoavvwpZ9ZnQp1j2BxwJv8ffIL9WTyKXtArJCyj//G6/Q6tqOFHjWua+mN2vT5k2NAIvXokQQidYmsLghgDSFRwdoTYECohRCjEIyGNHIJ1YyCkrxuEDBl6xMYX5zA27duAEPbn8YS5ctQ0dHB/Z88D7e3fk2Try/11ZKrWhogCZCan2mLIVenkLP9jmX0GNSBQ7WJERQkKVh1ob4YvWYLxhYyDlt0NJiAsDjk/HNkUvp5ZL7tsw/j+zKgtCP4uEdFXn16fB9zVwvDg5i6fp1GMpk0NvZxcrL8ifgs7QoMd63+o58FFjYOlJ2dMLdhpsybwq01rZ95jM2aui9HW8hUd+ArJY/sf4vxzdXXoxJLpJ0Lu50AiNZ3lSgbO4FgSJAIPKBAlV01fVUGmRxNiBZU4Hly5pwy+pm1oN6rGosYWUii6pIAScJePup2R9gOfhwYAw/Gini3/Sm8cbRDM4cHUSmsx9DBIr0aD/zNmsLDyqttC2Yp3IEwmIUhVIMAzzvz0fQkw3j3EgYxwZL+KhrBAvmJXHPyvlo0OAG/hEKkCCPDh7rxFsfnkRxiH4ODSMyOmy7S1KrIx/cnBx/pJTxw5QKAYPHF/G8TL6ccM6I31xwbzbkl5E5fUTid3P9ZK7EUpQkaCjhzk0t0FeVGIR8V7IuCGWaYK3geufTPb8UubDm5nxy5/r1CoUdeD3pSNJRGgj/pFkcPnwEt916BzZuXoVDRz6m8shKJYEWTuB4J60OAsDaVc1oPduHYKoGYxpNkmDlStajROuiuqISqVIGd66swP23b8HZzjTe2n8Cx9p7qVCyIPd1odhK7evsOWRb2/Dgxk2or43i+OG9Zp5rZngxN4IwtTBVfjdJTP8s6H47d7nAe+lUnruTCW4aKhdI+SHHK2nO9r2OBAzbD0GWmLRaNL56bQAAYZtJREFU3k9WEQgbUKxrRKqxllolCIYp1EazyKZyGIrleIygkgKtKj+K5kgGG5bWYtvW9bh103o008pqPXMWP/vJz3CIFsW5tlYM9fQyXSUGIeChnMuq/0FgSPLMUStjSrcvUNWE4zXjWEVmnKkxuWfm9LKcAw7zhKT0Wp2Q864nk70xBzeZfCFsFgiDlN2mewaesjjMWmA1pdOmR1093Vh3y0ac+GAvUiwvbqtULz/Ne3qiowl112SopinbflYCnn6LRU//xou2Y+NbP30dUQr7vDp7PQFpgOkLO8VF1qQsIMZJ1oUGEdigjZhGQiVpGWsdqaRtJRCqrEFECkJ1DWqoEK1mXm/dsApbbtmAluXLUKRVkaN10JSM4WQkgdczeRygdpEqFrCMWv07rSPYdyqN9kN9yBylFdrajmJXB0p9nbQEeqyZrjBE8BhO07LO2DwKrQCcI5jk8lkaSAQ+WUlKpMBMfTnREFpSIWzfshJ1tEjUN5EPR7GHrPvBuwdx7JNjCAz10TqntTtGK1VOrQAGyHTiiZUROgMNv3yIT+SR8UrXXhaUyV3Z7+QHsyN57ofD7+XFpd34N7P5zl5zZxcle58/OrIkCTR8cgX2WtHFfLZ8IDEG9qLxyyP7boaPdXsmJ5ru/kxO5B91Nn5PkeGV5YMKCk8sfvzxP2ah18S2BCvSvldew4Z7NmPbtntxYP8B5Fj5x2iNjIRq0dZ+gqAxD4888ChOtfegUN+CbEUzwtS+61iwa4JFfO6R+7Fl0zK89sYuHDzTj05WrDFpf9SCAjSdA2k124whPzCAd3a8iccf2Yqm+iQOHPwIUQoIVhMW+oyTgcZYnUiweIXeImwJGKcpl9OSBIh3qmoiQed8510JOHMCDb8ZhMKGwBhK1aFQ24hEDbW95bV4ZGUzbmtIoKaKQijKdFWlMI+a6l0b1+K+Oylc6irRfu4MXnnlVbz72k/Q1t2DZJxWCcMvlNREwEBpTdgaTzaznU7J8k51tGwhECjGKkvqd7HI+pVfFodAxAQB74vsYx11j+c+kPgv8KCmLqsj5XpiIc3SXUiuvjm+ul8eKaBt5B4FvdvIT8KaoEGh3z88hNUb1+PY7g9oiVVjTKN7FN9yfEjKB5aDcl+Gjnyujm+1x//2H/4Bevp68fOvfY3CvdYsNPFBI8acZeqnmzESWDBPNSJJzVtuwcEYIvyuQCuylEjZRl/JygqkKlIGdpF4FIuWLMYj2x7Efffcg7qm+ehlvM92nqO12YDGhQ3o7iVADOZwpBCxPqlVVKwCrV149+wIus6PonCil4BxDujuQHCwk0K9h+W+D6XMgDUd2dIzBVmTzEf1M5AHrumIeUqyvkiWj3icx0IGW9etQ5R1MNVYaTzpJbv+cscRfOPbP0SJSohWXtYimtpXvSBLhv4bUHig4cqJ/Pf4w8JgckGnXvmYkAMTSOXFO50l+a+7xQQvTXP1fxJdtP1rCrlkM36hhgkxU+u0SumNR5Y2uqlstCTr5gxpv4Dvl+CwXp/4iXvbuyNt0LQ/VxmtHV/O7+Og1RCm8IunKjB87iwe+90vYtmaefjxGwfQOxpHLlaHcGUM4eAYnr9zHRqXbMQbp8ewm2Z1eGwAz4S7sGXxErQPDOGv9u3HyHAWqbEihvpYYViItViaCrPara3tNFhARSKM7LlW/PYLT6Kr6wjeePMTjAyNIZwdRDad8TRIvqu2b28oowBO/tjRBISSODHVl6AyD8kLnycSLASL8sgpjVSiVhlsWoxQ0wrkFq7Gmk2L8e+fXoKtVUlU0fQvkI97s0X8ZCiL1nQQJ9sHcPjoKXR9fBiFzm6Ei5rF3YfccJ8tR11U84lWK5UmaVaD0uDib/tJ+KSKLQFold1vXuALNqZfr/Oc17brrwkbWmQSCI4RdHzJo3HNzaXZT7nuOJ7pjn937mTlk/xUzTOykWMqX0EU1DQV5XnU7eOhRQQHsyP47Iufx4/+9M9R09iC/qFB8sLjgy/c6IUsEwc6tFLiFO4U5squJ559Bj3dvdj9ne8hOX8hMkPDBlDWv0M+2HwUlzj+SeBRMVC+WrmnXzxauVdfCwW9rI4U60JNLIamqkqsWNmElWtWIFYzD4dyVKD6ShgLprCqMYwNjQUMFhvxQXsaB1gmxxBBVTGDh6PnUFnViLcPtqPt/CBGOvuAXgrygS4EmfehsSECQAbFvBzLgNJo1o8sW1f2LAvEQuNZ1JZdV59iY20lHrhrI5LJ+Xh51x7Ebl2H+poajLZ34sSuD5Btb0M4QzAaGUJxhKChlQNsVJ3r+FZYKj8CJJUTBxS8tqOpS7MmXyko00U+Vha4loFL0yR/p/g53mc5Tfh2fZFIzECTLA15eqHHNwgxWuPJH6crie10VpV/Z+KT8fMJMbAC419bFlvF1QzSbK6AmvmLcPLEKWtzf/CB+1Cg5t/Vdg5haszBihqc60mzMldh7cqFaIjksaalARVN87C/LY1dR8+gP0tQGi0gNzBI7SdtloN1zmninmZTW/szTXMeq6npHTywH0soBDZuWoMjRz7mayNU9iOUmRSaEgos6C6a/NHRT9SEQlVOzqXI/KET/wQa5nTuXfsaLitvIKmJVNrONIU7b1+P319bjercMEKMT5AVs8hK3sp0ne4bwLmOLmS61Ck+xjqbYxKHWZlHEKew1/7ZtpSFLAsTkKrQFgkL1+9MttYpOcXTSLkkp1NCLZ8ZSTgrviakWeolhCRYee2aYyiM7LnXNFNOp6wr960JVDqrM/y3993JRdxkcnfGa53fIW5+K24RhqlRVeRnPBpDlnzbcPsWHHpnNxJUTka90WHOA/etdaCL/8x/2yqYvKyor8NTzz6Lk8eO48N33kOitp5KCcsTvx3/3KVdabbZ3AIegkJAI6EICjqGCEDJ6ir6H7ARSy0NNdi4bg1uu/12rNl4C/pql+DD4Rg+7iyhOz2KeQ3VWLOkheCSwEdtGRw904v23kEMDg8j3tePmo42PLagAUcOn8LB010oMP8LtEgC/e0IEjQC6V4ERgZYB1w90KrIpjQIOKxMT3ayMBJU4LJDQ1ixqB4P3X83ursG8Po7+5APRnH+8BGc3/s+uj75CEW+E9V+9elhszAEGDYvxzq+WW/kp4XjASpzXkLYeOUfr4im98GKkZ2Ml+LZ0nhJmh3N9X3RLxRoKGZT3dUkH0R8f8f997niZ6IrMK7t112b8w5yo6OjLMBx9PeN4aN9u/Hs049hXl0NjhJIcuEk+gK1GBgpIMJK8MymFtRROX/1BHAmU0Q/5UBwhD9qt9W+0ASMgIYXqsKordWzOOQ0siObG2E8Qjh+8DRqakJ48smHcfT4aWQoFGKs9AWNhlGMJR3krJlKR4+UGLvWc7szO5KQMZ7R+UcTWhI21EYlcBKVKCWqUIpVYOMtq/DFJRQ8RfJGwpiVsY8C8TTTMByrRAXBZVEshWQkwCQOobe7DWNt5zHaTy2wmIcW03P9EOQ7wzFtzxNyJijNSdjzOF7z3Lmc4mZHvcfv7X3v2jRpBxCmpXtHp7HTitJz7z27r6PekaZr4fnOC6Mcrk79ewIcd8snd24v2ZmxX+HwfYufLA3yUpMZtaryKPmw4Y4t+OTtd2nMETRUDvSVHxa/1cKMyk4bPktLc96KFfjSSy/hpz95Dcc/2m87z41mpLH7sdG3zEvxR2EzfTZznKCvZTZk6WjttVAizrKWRZZxuH3LZjyy7QFsveMOpKqpBPUN4UBbD/aO1eB0eD6yyXnYvHox1jdVYPDsOXx4vB0fdxBIuqkYDHQjlBlCfU8bHpjfgGqKoXf37Efv4DDGqPlHaF0EBtoRyFCBGBmk8kTlwd93RdFVev2y7FvL5JUGUyQY39HBAdy+YR2efOJ+7HzrbRw42oHhUtBWr63p70ViVMPS+1FIawdJggbrqk2ItTolxUQKSYGWqMKYaGHQiVT+LB6OdFvXk7T6iS9cJvlZOhc3laZ7Z9z5Z3OjXyjQuB40FTjGaSJnnHamo93jxXjziE7o4mEUWLhKoRQraTXe/Nb38ODj27F++QIc2fc+zedapPNh9OUS2HvsDKpqarG1hcKprx2FoTRGCwGMjLFQlzRfwVtZ1RwLtq/9sPJqRzhN0CpQ49RGS0f2HkauEMKDX3gK+/buRZiauTaV0TLvLopOI3PxJLnS7pwJEZJ3uCRRyFgHrvGMzkq5EzrSjB1oVKCk8fqVNQhWx7BxdS3mSQgxDbLK2iJx7BwYxp4zAzjfnUGE4Le0pgZblszD/betxp1bN2E5hY8GZHV2t2Ps5EmU1DGazSJCYVVBwZmIp1z0DUw8wc+4WF4aMHjO4qQOYp1T2MsZKMipec295wDC3bOj0iRhas49MzCxphEPRPjOOLAwXB0Vvg9Udu7iZeTdc9d613vf5x/fNU3fZsOH+R+mDBdo5LCRoHFAoCFLQx3hSry+Ux6omZDCXkvVyChrWbQYL7z4Av7jf/gP6G89i7DtBeMBhh9H3zHtNozW45MNzWUYmlyY6e9BMBHBo48/ihd+4zewbM0mHGkfwivvH8XbpwaZj43oqViA2kAedzYl8JlNjTZi9bUPzuDgmXYMDPYi230cGGpzQJDJoTnYjYfvWInvvb4XbT1DBJM+gEK9SOuiOMQ8tqGv9ERNRSyUVgONX3QWd7GOR4KpVgeIMs6Z4V7ccd8W3PfwVvybP/kLKm055EeztLwHCD5DBIdRjBJI1Y+jDu+iluaXMmbWhSwYV8+sSVNNwKor0gzFY5Hx2jvOkcp5P0syEFIwl3ATJdPcyH0nb+ZCk/o0FHi5bfUGo7n011wN8jP4QoaO31FTQllYqIKr8y2sCht1M2A1qztciTAFW0V1BQbSXfjcs09h/uIlePm9A+jOa5bsAkTViRgHVjZHsWL+MowNj+HIiZM433EOA0P9rGMZG0pb8JunVMhlPVCAuH4KJzgiFFA1sQQGac7XrZqHB7fejVe+8z0M9fTZ/IWcJv1Rm7IVO6kxTqwkrtIIUJSwWRYjpd0TntbmbY5Ci5VYe4SXUlUI1rWgWL8AWLASzasW4w8fXIZHNixCJWVSK6PwTvcQDhaCqBgLoPfkWZw5dBDD3f3IDg8iHhxBAxlTT16mkknEyVelY2xkBEPUJk+cOIqzZ85gWEvAU3iGo3EmiWkQWLPSyzKxNbFI2oXN6qBpjS6Zlm5d+QLXwJhPJFD5b1akgEgX+k5yRPeMP66pwr+2IZg6es/KmqmEjm7ZD8Owx144Ih6spHkFXLvmSWhr4UXt84Gk+oiipuVXk5+DY0N44R+/hL/5f/4tqhparJnHlQUXX2vSosKijv5mAoZWZH755ZeRGRxk1oRhq/WW02pBknhNPmm9L4GG4qA9YcKJEHGziGVLV2HTLXeiom6eWQMnzrXjTG8/0oEkwtXNSFIhiMciaGqoxrpFC7F4Xg0+PHAcHx/vxtBYCKPD7cgRBAIBavTS5uU3w/rspkWoo3Xw376zG1EqF1laIMGRYQJGN5CmYxpYoly6FGWeG5uURpa7oECe5S1OIJTFJWv08c8+hpraFL75t19HNetWIRuwEVZj2hqXCQ5RGdOIwpLqjO6xXoW03piVf1cX/I51yycjj1eWn54bZ94V0/RgwrJkBdBy5/JpWr990jMrqXOim6BxEZqamdMVFXvFAw4DDwOOCIrqGLeJTpqnoLWXCBDxOOLU1lYsX4THH92GPYdPYe9ZCsia5UhHqY0nArYE9NaGOLbMq0D7QBpv7j+Jk229pjmmaaaDpru0r+CI2l61D4VGecjiYAWg9RGhyROjsNG+D6mmejz9/HPY9bM3cPTDfTTfGTd1IAsw+L5tik9hqv0RbLIbK6kDDqbSF2oXIyZeadZmUCZ4JaC1Oi+1Phuzr/6M2iYUCRyl5uVoWLIU25e3oHLjEgJFGoeJYb3DDG8ojycCw9hcHcFwdhivfHiKgkmd/yMId51HnFpqnvENhUuIxjWKiMIsUiT4NqGxsY4auFao1U5uY+ht78Ng3yAy6REMDg2jf0CjbaitSnum8NXErzCBXasWa5gmI+4sCiXXT7tkhdR0/gso1Eyh9m0DDTlPaAiYBBISMOY0B0bP9Nhe1De6FqjoE4GJO9oNHQ2UrBDpiQMNWT3MQzVPBQiYJQFHMoGGZA2yxQy+8Fufw1/8m/+Eqsb5GB5S8w0Bs8iqLO9oRWXT/Vh3113YvHkzvv/972NkYJCWWoxKh8qIxcTC9c81NFfbm45qNFp6GBXNzVi6bDlWrGpBHRWZocEijp8exLm+CAbyFMLql2usRInWciEYw5JkEA+ubMaaygIODCXw3pkhnOildcx8iwx302LoJq4xD5Qe8jgazqGhKYCn796Gb33l7zEUqEY+k0FAI5iG+1EcUce34uq4ItmpvijJAIsxi5ksWfXZaYZ8LldAy7JFePDR7Thx5Aj2vve+bT+gpWO0/0hegKK8NV6TBAoECbdUigCX+ca8tLXG9Ix/EqW+ImCBil92omvPTSGXj9PQDLcvReMd4Rf34KK4cFFiKp0Ac5ezpJugcQmaCBw+oy4oLvYKOSfQYIV3G+drRBUdC7WNJhJo8Kg9GsLaz7uUx+/8oy8jzcL78uvvoFTTgoFYDWKFYVoL1PqKQdyyfCFuWTYfJ84ew89+/ha1pRiFnTQ3aZdaaoNSV6OiCBrmVNEIItoLIUxNrMDalsuk8Qf/8x/jzdd/hkPvvGcdo273NedsPDqP/vBCLQ8+J+CQwFW6ralGtZkaoDrAlV4KOdTUo0hXaliCqtpKvHDvCpwOL8SujhwVyUFqiNLsQqgr9iM+1IfN8xdi/foW7NmzC2++uQeV9D+cH0WawjFPzTCgikQtUTvYFWVxaakHaYjk6/JVq6kVL0V9fYM5adZpCqOhoSGca2uz5dDPnjwJtLcT0Jk39fVI1tYiGksik3EAoK1WJWB0btVJ+c9zrTVkVoSEhwlcxkM8847qn/FHIJVHZUkYiex93/HaP9cFn5mw8Qq4VWJZGtKi1USUiBE0qIAkU6ivqEeISsUXXngMf/av/wqNzYvRlxmgsSnQIKAS6KRR3/PQ/diwYQP+0//7/9h6T84SYTwnErV1WxWYfBghf9DXh/qNm3DPffdiybJlxNkRfPjxIRw+cRYFAQ4VHy1xjyhBLBhFTXUT4syzO9bPJzjdiQNnurHnTC8G+4dp1aRRSFPwp3tQGumjgB4hL1jGmLaYAfQwHnx4I9Jtw9i/+7CNosrLwhgeQDHDuBDMHTfIf7GJ5Nd/uxSLtKQ5FZOhtlZsfvIJ3HnrbfiL//TniLDcq99LgK7Vi7VFrfzQys4CBA3v1bbHVv6lGPjk56mcQmEY6rO0PPfzqpxn+kDnl0/TWxeTabajpyyyM9DFgxE0XjoeU2kSaIi0zML1JMe8S4f5aYGGTxY84zqRWVOLjVV+ad6qGHIGGjwagGgtHk2GiiJWVcXTFDK0HL74xV/DQmrgX/3OD9AbTCHP7/MhgkqoAvHRISyMZvHY9ntoalfg9Z/uxKGT5zDKAj7GZ0inEbD2aWd1WFOVAYiEV4mGTYLBxjDU1Y7f/uf/DO++/TYO73oXEbVra30d+hNS3witEn/xO7M4JGQ8zeySlcOzLqx0euAhSyMo0EhUIVhdh2J1DUJNS6lo5vGHz92Nnefi+LAzjNBYq03MsrkWyFA+hhHrS2NBVQbPfOZeDGUC+Ltv/S2GB6mBKlms6DktxMi4amaw5qSovEbUJBYKYFiCqt+NvlJaguTrxo0bsJRA0tjYhIqqShpEQYJVgbjRbtt5Hjp8GOmTp5lHzJuaWqSqGWcCvbYK1Yq4tpw4kyZ5UaAgsmYLXwCLP+ZkUXjOvWhCS31NDoC9b5RMPTe+ku92j+cMwMqOSPxUk5+apwQcVDBkoSJVgZoqCupgBi9+/gH8yZ98A/XNS9BL0LB2+QIty2AOt99xJxYtXYmv/Mv/C4kVK034G3gJ0HzitSYKjmlYKyO18e678cC2B21ByNbz5/H2rnfQQY09vnAdwsn5GKGFVyRwlViWLEoUyssaF+HhuzeiMp7Hj97ehxPDYfSHmmwCHobpBjuYD1RsiswvlTGmUxZbTaW2ZO0n8H0G//B3P6YVpD0xCshpg6y0hg8z78gS44fHkokkUNVijdFkHCOdHXj+938PiZpqfO2//iXiVNY06MN22bOXNWvc9TcW1bw7os5u5omBg+O7/57LE5KhlBOlZcCQc5lHR+Ln5fNrSRMtjWl4caVkBsLFUWVamgY0vJPrRor09BG3u/yZkF1lmg1SXzPywp6OVRYvv41fgKGJbgINWRw6UpBLCGgceTiRxAgF4ZbNa7D90Qfx4Sd7sPtQJ0ZC1NAjSVZQCmCa0KHhNG5bPR+3rKpBJjuMN9/ejY7uAMZoRYSR45FaGgWHNVOpn8M0XsWGFYYVPE4tPB8O4qnnn0M3Ne4dr/7YPafgDbNCaE8LWwdLwk4CnMLO7dLmV67pUurdU7MUAdINP5W1oVFTDjRCWha7shqlqlrEmhZTTBbwR7/5DL7/9hGcGqDfuU4bG48sw9UidNR+aWMRPwgk6QE8cNdarF63FLve24XzR9vR19mDmAYYMH5j6t8ZH31AmlAeJFjEe1KBloYWODRAq6lB8/z5BJBGVBPI6urrUF1TRSU+gRwFeFd3D863d6C9o5cWCvnBdI2OZh0b1I6uvFVyI8xf8kTbrxZtk3E5Bkbnmjh4IkDgub81qkC53IxlQtxQ0N5TMnwL3/bSJmhY85SAQ/1DtDK0xEx1bROqIyN46ak78WdfeQ3BZAMGB/uY79TVaYE8cM8y1FQ04tt/91MWPcV9lPlPRYfhFRWuLEr6GYmGUcnyd9ddW9Hc3Iy+wQGcOnMah48dxQjLWrKhweYbjdCyzQWrzNqxIbfROJbVRXD7ihasaanDgXMZ7Do5hJ5SkEYu00ILAyMa8dTHvKU1bH1t5ANJ6UuwDmT6W/HFF5/HmdbT+HD3PgrxEgpjWbOIDTDEO5VJfqbyIJA3vvNfaVK+jrDczl+6CPc/sh1nT5/B7jd3OmuL+aVmWSuvygfxWE2QiofqhPheBmoXKyO751/aA0cGJBOdf+qfe0efFM+rSo53l6LLl4X8TvXWu5otBQJTQGPOPlwVunSiXdvb7Omag4rn/2R2eWHqmQlTCVE60xwpTAUg6utghVTzTYigITdG07xlCSvB/fdYM8sb776HwaE8QaUOYwVq3xJYBItUJIdl8xtw1+23oKujG2+9/Q7Onj2HJEFoND1MwSQtjQJC2lS5wCt4gZibo/DMU08SjAL4wfe/Z8s928QwVix/GQlX2WRx0A/54wvBqRXETznT6kYNMQwtISKtX6DBNAaZtmBljbV9h6rr0dhUj1+jBfH113aiJ6d5KNowipqoLBtZSVrynbiqpjmKKGqkA9RkQ9DuhAsWL8Brr7yKUwcPI0reqXNTTXzjRcc78c0COcWNQiasDnTxgLe0d4QNQeZrauJIpZLEcOYDLcH6xgY0UYg2z5uHKs1FYBoHaOX00w0MDlJA0xGA0ukMRrVysK2xRWAkwBcJltpFTtuOKrvEQ1u3iAJLR1lwGt1l/SDis5pHBBqm+Uojdk0FAg2VF9cRTr6apVFhQ5crGlswL5bFi/evwX94eadNmgsMDNDCSOPZx+9HZ0c73vj528zOkDXLyF9ZPsPtbSb4l65chaXLlmLx4oUElDHs378f3d3dGKCWP8YyECI4hciTIsuuzWchYEQTjUiq2AZyuO2WtVi+ZgNaWfaO0TrrHs4hXYhghGWnoN0iNWzVW524bPF6QjrIsiHwXL+2EdsfegB/9md/zTTnkdWqsn4/m73PTKKT8irAUNnVsGjruyDP8lSQ7nvySSyYvwA7du7A+VOnEI1qifcCy7CsGn3PME3p0QQ9WX8qw+PA7fjCgwoBjwZsOirNduKR/LL77qjH9lT3/aN3egGZX/ZTpslXlyC+bH0qV0gXl4Msbxd9Pj1RQZwCGjcozS5xF3/n0l7MnYGTPXXnxlDdL2tJPEqw+taGnAcc1lGeSCCRqrJ5FVvv3YDHHn8IO3bsxhu79lHrW2LbcEoYUZKgll4MnD+J7ffdgq1334cDh47i+//u34K1CGGGlae2piBtvX9VQsVG56GgtV9nW8/inuefxWJqat/8b19BQ20dejs6PctCwswTavpWgsecq2jlylImd23aoHYgtPROAQ2tclpRhyzT/PAjD2JBTQQ/2PkO0sE4Cum8DYc0AWp9M3QERkaWaZAGVESMFbZEgVQ5P4Uv/PqvoaO1E9/9ytcQTlUSXJwGrdEwtsaW13lt6fX5rzjrGeMkwaOVb6WxhqMRr0rSKgkRVCj4NRKMPlEIZuhNgYZJJRYsaqGgXYKFCxcQSGqQoPWUSY9iiO5MWwcOnW5D54DbfjRM4aURXEH6rV3/NPonzziKnaV8gPhLXgqM1VwjvhowM72MI1PMMF2cbZ0oxrEg0FDfS7wSUQPeSiyvBJ5d34yv7T3K53EkutrwxPatOHLwY7zz9n7EyeeS+oBoPaSZ15GGetz/4ANYtWoVLYwoPtr3EXZS2MrqSGlRQfJJzWA5sinnlROFqSagSChFcA5gzaJmfPG5xzE63Ikf7T6C1nQI/Vr+Q0JaqxKn6TRTu0TnWxdSSJQZ4r3SRys0xOM/+6dfwo8J/h991Mr7BBnNmVC4Uk6UV3ZUvhBoyAuzGBW//j7ULV2Kz7/0Ik6fOo0ff/f7ThlgORnV2F4LV98zXCu/BAz6pVLk902YxeXFR2FIoLomKBeeI/9IKp/674wTc8rqmI6zJr5cboa8BGnklP6uLSlCqrPe5SyJVmPdpJj5ZvINRUzU7Nin1Psc0BdzZfrE7x3NymLhO+W3VBC9UyP7Xk6Z4yqkVmQtamtXCjLNslUThGaKx6jppVk55i1fSBP+czh9rg2v/nQHtb4EdbIYZSIRI5tBPBnFaFc7j2F87rknUFcXx+s/eR0H93yCKIWpVj8dkQZnAomVROQJ0nhFBb/txB2Pbcemdevxl//fv7LmiPzIKOu9hkRSG1PFlQAWcJgV4Ak463uYmDrvXM0IIVoOGiApS4NpC8a16qkPGjUY6+3BP/pf/xinPtmDnR/uRzYQRYCSypZvl5VjmibD0NRvVpiAKg3Zpb00ouEghXEQQ4N9eO6FL6J54UJ865t/i95TrTTMEhaNkTEtL08NWR35SrMBNfluQMajxwYjPrN5EHSuWc1ZSyEKIbd1LIUR8yQUjSFDnmSVdo08ogCra5mP1WvWYGFzE+bTcko2pOiflrnPob9nAKcJJD20QmyF95EwOoNJjJYqGGgFchggK7XoN4Uc+RpgXLWstwSlNWtJsPGp4hWU8KclU9IOdIlqJGrqEakOY8vSaqxKZvDWyQKGafl8/tZKvHOsBzv3nkSc+RXoO49g3zksaKrFtgfvRaoyhd6BYez7+BPs++nr1syUamoyS40RZ3hUNAj0JTGbIKWyWcF8i5PziWAej23biqXrN2LnBx/h7X2HEK6i9UsAHE3LumAiyfeI+FOktVpg+SkwH+mVlCQ1L8mq1ZI3OVqV9927FZs30Er63/53BBatREl9HtrL3gQ388gSrxjxT7f4nZZOSWfSWHv7FjywbRvee3Mn9r3xJoI1NbSUCfHko/q6rKyrnAoUxAeVARPqTrDbMFvds34MBSTS0QvXfhSonk8l/32R3nFniuNlkwXjwpo2RIvWlQQwGyKfTT7NjYgRtRNipuxSjt9gZAycDU1kwOUwXN9fmokXZfSEuI6/5fy1a7X/UxiVIgIOapE8l7NhqtKcKAQLAS1xPozHnn4CCxctxKuvvYG+QQqvUpjVKMSKSS2M3wZyAyh0nMKaO7dgw/r1iFJjfuPnb1gzhS26Ji3NtDhpXhKmDJ9CUbOL80ODWHf7rdj+0EP4+le/gsHObmr1GqI4wkooa8M5a1pRhVQzlvkjT3xHUs2R0BVoqE9DAtnAUJYGhWXKOa1I+j//i/8DL3/773D0zDlq4Cxno/RTe0HIaSQUK7b2z5afJTX0h1jhJcuo9YYo0BgjjA32Y8GGdbjnnnsxNpTGrrfeQjctpUqGMUbgUxOQWR8CO4sfuU6nkW1O25T/usUfAQrLu1mx5tQUIs2WToMYQlqgL+KG6fLaFsHjx2at8Jji/WBNEnWN9WisbUBddS1SNbUoUtBVRioQpDbexeAGKGCHejMYG+3HaJ5WCS2qYlYbRDE99GesFCWgSDGQJsx4MyqU3kw441CVQHV1BItro6hKFrFs9WJ0DHUj31fAiqZFOHf0E3yydy8i5F2M6VtKy2JRfS0yVBqOHj2Eo8eOoPvsOetLS2jLUwpWTaoUsAowpYtrZzvQQtJqtyHGpDoRxdply3HL5k22qu6ufR+jX/ENV5qVVdBscgKjFg0M0akJrpBzgFHUuF+CvJVzWghqFoww78LBLH7t+SfwnW/9kHzIYpQgYnOOlF4DDTomXNaFnPInxzJT3diABx/aRp4XaCHtxNCJ04jX19PyzrL8EwSYHo2kk7IzbmW49BkAyVuR8t7u8Vx57R3M0jCG+y+6Z0b+rfETjyb4ezXIi89UKgfBx9O/cRVohrAvRr9koHGlJAbOjokzAcfEeE5+w2k8ElQmYG35cFoZFEYanmtAIiFv7dgURrwOhQqoqori2WefoTKex8uv/AQD/WOI1s2nDGdIhQxFzRiVLAr2Ug4tLbV4ePs2VsgM3vz5m2g/fBSRukarYGYxqIJYEtVUoG2f8qhqqMNzTz+J137wQ3S3tiGZiGN4SJ2YrGTSfqWhsUIG5Ic6GSV0dY/ixkj+schohV+tw2Tpo3ANxJI2GzxUWYVsJISFSxbhC7QS/vRP/5TRoLDK0wfbGS1nS6ZoXL6WrNaqHkVq7iUKH+GK+mJs0hmBw2/jVvt7hPFcsXYNbr11C44fOYp3X/2JWW0RNTsxjoqWhKOG0JrGyfwy0DAh4cjyg3F2TZ90akJUvxPT4sBDCeOR4Wr4q4BaczwEYGFtsBVJYkQgz3wMhyh0ZaXECDJVcdQxfo0VSSRpBdZWp9BUWYEKWg7qO8mQ/wPDBXQPjeFsegTto1H0FSqR1hAxgmUgEkCUFkouSqBsiWLLvALub8ihOVJEB/m6ayyIO4Kj6DjUhv3nqnFnvAfrwt20KDI4cvQcjp5oR0f/IIbUz8VyEWY6NM/FAT75yQNTZOdFxkWd3hGmIz0ygi0bluL+OzfaEOeduz9Bu1qeyB81XeVHGD85NcVJm89rrs8Y5bT6DrTkeB55WoQ2VFiAp1MqKJpkuX7dYrQ0JfDD79FKIE+LWVpcZl0yMoqWBDolcZRAnKPfyu/bqNSsoVW3c8cOnDl2gkpNiBjh9UkxTFkaOsrSUJOqK68+YMjJX/2Y15PyXmRlwl6amaYDh4t/4cjK1tWiGWSNT5cbljOq5v71TdCYRGLg3Jg4HXgortP7IuFFoSohJD4LPAgaaqqSpqdO21KYX2qZC2rrkVTChEju9Ek88MKv4+67t+JnP9+JD771XcRv3QqtK6RKovHoEgzCm9Ezp3DPc8/i7q1bcZTC9Id/+RcANchYbQ01PGqIXsw0VFWjs2wkEAX0l//w9/CNb34dAx9+gtrmeTbLWv66ykgBoYqqobmyOqTNqVKaR3SMrgMNXqhZQqChiY3asa2qEmOZIWx7/jksXLwEf/Ov/wSxlgUY01wTWjWBsTxCoxqt5TotZWkINIpMt2YlWxOTdYYKMDTDm+e8pf4HzfLW/S/95ku2iN43vvo3GG5rt7kX2mdCoKHo6eisDMZbcRcxk0yQ+CVLB/lt/ntHacvME5v1rmY3AaLyz/KQ1g/zrkBwCFDgBggIRd6T9VhMUquPVSBGAV/k8yDzl9ymLpCy2csVtEyW0BpY1FCNZCpIgCADKQAzuQza+rrRSSthNBg3/Lp1RTWeWdSAW8MsO0zreSZoNwX5/nOtyBNYimMJdB9txcE9H+JY61EENWKKYEy4JH+yVDbU3k8+Kb8Enl66gwJjpkv7pmuGvfah+J3f+TyaWhbjez/8Mc6cOotYRTWGs1ItmBdq9uN5YIwCnUcT1AZEzDf6rXkqKtV5gqZ13rP8RgngVQTM7tYT+KN//k/xt1//Gi2VLDLK++wgX6afBmTCmbABfoaWUXDVSvzGl38bY30D+Lt/96eINDezbMgyY56W+94YF3+QgawMKTJ0OirPld+Wvz5oePfsnBflu3owV+LHUxqhpyHP48sPYvZ0EVC5aNh8OKdwPJoGNC4niVdCswjvMhM3d1Jc5pb+mSyO6ch/1/81IWvAISuD1ga1soC0SwoHNSOZdqsRPtRYh7o7UdPciBe/9KJqPL7ytb/FCIVtsRRi5YzZzFcNr4yx0tp2pxQUzzz9FJYvW4Y33ngdH+7Zax2h4qTqjrRxa0vnN4VSHqn6anzu88/jg7fexqEdbyGerLR4jlAA2axmgYZZHBIWdBLAvrVhoEHwKVsaTAu1VyQrEK6qQHZ4AM/93u+iq6cPb1MghatrkNcG/qNpN6R4xFV8G+nC+BUEGKrxMjvkpwlt+sujFgiUsLNmDGm0FH6jPV3Y/JlHceuWLdi7+318xDTEauuIcU679jdb0sQuEzDGAAkVz/KQsOHBVT5LjHMS5gIqC19t9AIM1hB7xms+y2s2ugGLLEaNpiKPlXZaIbaMjMAzmqTlmECIRy0pox0bU0xfkpZkZWUYDdpPhPGtqqujZUYgqE4gy88rcn14aX4ctzPfYmrCY7hj9P/w8Ai+0lfC+51pdB84jP4zAxjtH8XQcCeKgz2IpAeYXWN0Xse0moCUQCoKLoWaw0OrJxxEmoB+FxWQR7Y/hAOHP8TLr71JJYLgxrSMUSkZEw8lqD2egWXOLwssZOavw3YBaRC5BNNP0AjT6osznVpM85FH7iVkhvCzH79Bb3IYYXkAAU38j5KHUmYEiFpH7fFnn8OCxWqSfQ3ndr2LqoWLbHKmAYLC9ADD+jAEhnZPYMF7it9Eov9KsQGIf0s//oXl99zp8r6aTJeSG1NScm1IZdk7nQux5CcmbMIkUnSvn3PRvkTUr0YuzYpmEZcpdDmg4ZNrY3UFXo1F6jCU4KSIsqPuS/hr7LmGmWqo5/79B1iZR/HQtvtRSYE8PJzGcFeXzcJW5ZD5rnbkMGvywX370MFnAo6td92FTCaNvr4+N6ZdnfEMQ5p2iBpyrn8YrUdP4JbHHkDNwnnoOHHGRhnlpdEpqxh15VWZQxIiykM+VLLG+wXoJFD5rVZnFfCVaDHdfe9d2LFzJ0ZzFLhMkxaLA4VEgHEJyBJQ5adwK9G5JiWPNwpHR4VFoWCT5izeYg/PKUS0CVDbwcM42dqKVZvWY+v999smQ4ODAxSMEeOLVtW14a7y26Lu+Vs+l5On4rvv+K4EEuPrwJKWlrRrtaFLkCodnuAyC8yaAemUNrXXa9OskQGER/sRzGgToX4UMxTo2QzlbhHpYgSdhTDOjMRwNJPEx30V2NcXxsGhItpCGVRF0viNRAi1BKY88zRP1jEiZFs//tXpHN7qDKCzJ2/pzA50IT9A7Z0Kg/ac0KgtS4OErMc/AbssUusfIpisXLmIAv0uNFc34ic/eRs79hxnOSKo8ZvRwTRKI7Ra6GzVAHWcq59M53Jat0lgRL9tPgXjF6JpVBCQM981Ui9I0G9srMVnPrMdr/7oNSogBO4CrRqmX1ZujGVklGVSyszKjetw32cfQ0fbebz+ymvoPXMOsapqWiaySjzQsrxQnoj3dAIPu1bZ4TPFRcDIV63M6iiW2Tl/7Fp3dNOd2/M5ulnRrF+8kCxW/Fe0fboC7y5OU2TSbGga0Pg0yHL1Im4auozEXprk5zXLHpbbC9PiCrQzra2w21GV3F1bYec9CUhNXtL1uTNncPTocTQ3teDhhx9GiZWu7fhxCqwCIuSLswJKiCQS6OnqxJmzrbYk9X333Yd169ZjiODTSz+S1G7VzGJ9APRjlILs2KHj2LxhC5auW4NP9u2xWdQCDtPVJHjlFIbPJwMJOmnfuieNU9o5BUeRR1kMTfObseXWW7HjG9+01W4hwavhmhS+Wto9qP4NzdPwhFDZmZBQ+h0PzKk8kAeuKcI9M94wrQLTs6dO4/Spk3jiySfQvGQRjh87ags0piopDAVMIn7qio9+5OSnO/j8LoevbwQKnnBS/vhNdrbfuLRua7qhEFNzoQlVHZk+NQ2NZdzmPlreezRDsKQb4XlmkADSR1Oun24Q4ZwsOmnf5EchgDEKYXXoL28Mo4Wae0WBgpbhD4YTeHs0gFcODKD7LK01AmWwtxsYGmA6HWAU6Y+lRYlUmbGBFklEI9XIDvZjycIGPPfko1i+ZDneeXc/9h08gtaOTlqpUcaTVipdUE1BIwJ2DyR8QBQ/DHjFIwZCYAjI2qK1nCfghJJVzPsEktXVCJZG8blnn8Chs+348MhJFBgPmjFMRxhVoRit5w6suGUDtm/fjrq6WvzsJ6/h1Pt7TYkJMV+18ZazIrw8ETgIrMVrHzD8vFJ6eVB+urz1SQ+8/KbzruzXp8lXlybXF3ApuvClyfGaCzlwm5Eu29/LoxsENGZDc+TMZeWQvrn2OVC2OFiC7Yw/bvkJVQLP6ZrOmoZMQDrgkBYo7VlNJKc+2o/3932Ip597Fvc/8ACOfHIQ6XNnUTuvhQW7xPpFIaemEwr6DIFi76uvorJlHp597jksWL4ce3fshNbEqtAqoaqIFDBViWp8TH+WbViHBx+6D+99+1tItSwQhDG6rrnGAYja/J2zZiPed0c6xi8Yc6PCVMEWLF2Chrp6fPTGDoJGFS0LVfwxm4luVoY1G/GeVX45hqS0l9PvO/HFPRc/jGciHq25zXs/Fo3gvVdfwbxVK/HrX/gCBvoH0PrRPlQ0Ndrr4r/7Uoy3G8754emp+eeH5eKiOFm8vOd2j3lSXrZeaaALCDQsbTkEKXQDnnauJbh1rWNpLE2jgdZIdpjXmq+QpnwmoDCNgWIYWc13IderosNoqq1AbTiJUQrag2ToX37QikOH+zHaPoBgZxsiBCGbXKfJjloRQNOpmeeWN5EoNCclShAf6+zC/dvvxwtf+ByOHjqIb37z2xgdiyDNuOWpuTvAUNwIeLIsDCTon2n2DjCNH64EOP+pbGhV41JMy8ZUo5RIIlJbhVA8jE3rVmL1yhX462/+AMGqBiu/NYkqZHq1U14av/tHf4A7tt6On7zyKna9/DI03FlDqPOZUWQ198LywMsHgZUPzOS1s8TplBcWJ526/LT6Zbf8+y57pyNfq58L2etz/MbR9B/NHLdxd3Ga+Q0r2jrO4C6HpvRp/KLTBFbMlBMXpSth5ezpkk1afK6mBFUiGzZLp5FVRTX1WH8HBQqFQIhO7+VoTdz6xOPYfMft6O3twQ++9z1aHCGEKXhy6rxkRdRS1CFqhcPWAT2Gpz//a1iyVJrmbuz5YA/BooJCEBjW6J1QFLn0KJ56+h7Mb6rGX/35X1MAUoTlijQOJBzpfIFi1gGvvXgbMd6hpJu8mKend913D+KxON54+UcIpipMOKmpI0ABINCwBeQkaCkcfM74PDJry4jXtGhMy9MzWTxMk209Km2afPBBS9gWZ/iZwQEsWrsaD2x/iNZVGj/47netf0NTQQyEs3kDYRM+JvQ9Z4KbARswuLB1sKD9X8/iMgAyx9fpBObMOYuTQNba+ukUdxs1p7wUmErQava1N+O7FK0EknUg4gONixCrrUV9KoBnN1ehqqGa+RLR6lz48JOzOHaiF8X2LqC/D8VhntNKyY3ReikSoJQ4WSuKmxo9aT0mojlUU6b/2tMPI50p4ZVXd6K9tc32cEkP0gqilRfwtHgDbwlo8cHjjZowjcxPl/6wLFRaJqV4nC6JYLLarWDQnEDtinmYlwxj69I1OP7xUexpJ8ClxxDREiVDHbhj03Ks2bgMpw4dww/++m8Q15pfzK9hAp+txMuwbbkV/qn50cXHi5cpVZ4VrjcMVLz4iXjq4mhP3dmEx7ox8fLqEUN1wV41srJudPX9NvI8nSs/fglBwyNjyFw5fTnfzJ0uCRpGfIfv+Vq8AQdBwwcQ26BHz6hJxhMJjGTSFDRVWLlqFe644w5b1fXDvR/aGP1IVQ217zgKrIi2pwKF4chIBvMWLsJdW+9CQ3099u35AIcOHkQuFEc4mQKrLUZ6O7Bpy3psWrscr738Ywz2UjCxzmrUlmuWUQVnZdZNv+KqNlOQhykEQgSIAu8/9cxTePP1HRjSiCwJJi0cZ7OJBRp5az5yna3joOGTu/bEgPdjIQlA1CxmfCBfPCcgEc80o1ka9qjAjUB7+513WH/H/mNHsP+99wlaOVREE7agny1wp2YQCSgfPMQrgYkAhgFKOCmJfnz8uHgxc3mq+OiORl8JKAws6AQiAg8Cm20Pa8DhOowDCQEH+RQXaNQQNBqA+gZUpqqwdtECPLB5Od49egyt2SL6hkcxNki+DdAiGFSzFvNDzVGaH0ELo1TM2tL4YYJGRJ3cQ71Y2FzD8nA7Ghrq8PbON3Hs2Bkq7IwD//IS0OUmH+WlhDOd7lnaxWmllU7KCtPiRo6Rv+EY8rYCb5LWhjbYqkT9msX48tP344GNy1HFT1oJSH/x7Zex73gvwqMFbGxuwPqVSxmHg1RW3kbP+fOo1Lpa5LdmsGsujyw3JsH4L8CwiXtm6bi80b7drplXvBbpfAJNubS3/Hs6KjuuAk0J5qI0ubpPurgojYPG5dOlZM1c0uETS3d8QvMUA7gKEb0hyJg118Rczjdzp9mBhohZqsqrSuJrWFaZdU/P6Q+faeKTRvgEqFV2tXdi3759qKyuxkMPb0fTwvno6+xE/7lziKcqKQf4ISu/OtZHRkfR2tqKw4cOYtv2B7Hl9lsxOJDGuXNnkayvQLSiGR3dA8jmh/DZJ5/C8RMnkacgkQXEql0WJOYUvglwOgps7d8QSSWRY9zuvede7PrpmzYiKyfhJCFlgtoT0gIgCe0JNJVFkwq3njEdvsWgPiAnSHzH2zwqreqQlebf2XYe+/bvw/LbNuOe++9DX38/es+cRaySlo8sCqahXEkl/HWuA924pj3xSEf/bTCDny9Mg/o65J/rcC/wFq95tAUDFUd7V9+6o5q73H7cBBFNiosxwFAW9aUsfvPpJ/HeO3txqrUPA4N5ZLr7UejsQLinnUCrIdEEPIKG4qBOZ8U7zmOElkOOgPLko/fjvjvW4NAnh/H2rj04daqLnIjYpLmiNuSyZjO/KcrLEx80lB+Mm9Jvo8aUvwQ7f4CDRscVK2i+VFfRUJqHaH0Ntn1hO/6X+9bhntAYloSLqKiJI18dxVimiIdu3YTocBf+/gffwykqMhmCn5oxRzPDNnrKLVeucAkMBBFNzixbPWoaE5iQl66/zyPG7VI09RVdX6krl4O5Ej92Ko/vLkIuIDu9MprZD8tbxkNvzMWxJEwEDdKsBdoNTpaOuablcr6ZO80eNDySYPEFkYSTJ3hsZy/zynvOM62vpHkJ50+dxt433sSG227DU889i/oF8/DRu+8gT826goBi4GGfa4ZzCe9S+w7RGnnxpV/HyhWLcPyTj5CJpJBoaEFPRy9GKVz++3/yhzhx/DTS6RFENfpKgo8CRSOTtItaiE6d9bKMtAyHlkbR5j6rVq7AvrfftcUZ8xJSvoUijV7CScAha2UKW6Znk1LpOe8FyZEg0+8LY9Mm+agkoZ3N0XuCKuOopeJPvvkWhikcP/fiF1GiFn7m3d2omzcfY4yPzV2Qn6ZNuyYnN4xY9yaG64VjPNQ98kG8sHuCK6ZFtpqa7gJMpzqmbfVhCkK+a4CmqBMkNBkbEf5E1dQGJKJBpChEn9l+H3pp6b389i7k+cVgZzsKfT0oDVMjz6XJNvqncKSFEyg06VELVRZHerFqfgp/+I9/i1EL4qvfeIVCupcsiVo/QoFCOsT3grTAigzHhLLlA50BOa8N8JROWU1Mv4BCzYC03NQsqg3BIAujogKh6loUq+dhSWML/ujB+3F7dQAx8Z1xSgaiWFDdiHNjUXzjuz/C+x/sR4xgMzjQT2tnxO2dMVGJsGYyAoOBluKleRjqS1GcJvDb8l15wsMlaOor05epOdLV8IPk4jIbz/jOVQpzKl0OPy4EjWsVuyuhy43SrL6b+NJsA7oyHs349aVy0K80Bhys2CYkdU2nSs/KX8hmKeiobUZjJqQP7ngTuz85gPr6enzmySfRsnAhjh8/ZnEQ0Gj4ZZRgkaiuwbnubvx811tonj8PDz34EAVEHCOZESqT1Tg3ksXxniE89ZknqB0XMTTQh2K8BoVogsKOAjtCIRLW0igUhDZaJ05ZE8WKpUsRo1A8eb6L8onikoLB1yjNldPC46T0M00k3dLdCzljKfAcr8gHgYT5o3serwSKBgQkNUPFq2rR09aG3bt2YfHa1bj34Ydx8OAhso4Cnd9qEx8T6HIEGt9/o4kaZjlCCkdpcOE66Oa57umoTmn/HT/vPL9d/xRjqGZHCf4YbaJCFreuWoWFzXX42jf/BqWE65spaeip+oJsZBQFbCnPylsg7pQQCah5bwjzmpLYdtct2Lh6Gd4lSP/9N77N/E3xk5zt8Q0KaXXEm3BWB72vxTNOrpPbi6Olnz+Mo1kYGvWkJjUDNwKGrEiChdZKSyXiqKESsmnpfNy1ciGW14QIGjlaTyUMBML44FwH/u//9A10s+yIFaODg9bRrjkZsnJsMIM6t72RWQYajIcDCtccVY4X/40sP70M8A5G/vMJZI/916+Wu0rkiuWVeygldGL0JjrxROFMve879zMN4y5C04DGLzi5nPDIM6+9qwtJT2Z+Oj1dzjdXRhcUCglDOmv/pSAOmfB14soKAJ/ZEhqsbGGt/ZQr0HI4iOOnTlnz0COPPoLFixYbb4aHhtDb2W17mpeoORZiSZymgO/o6cOm5UuwdfM627DnfLwJJ7MxFKklbt20DrVV1NoHKWCr6pENURCFawkeFSgmWKRsie0UhUMe92/dirOnjqO7f4gYwThTMLjhq4qzJxA8gWtkrFVJd9cuzfy1+5NJzT12m++qicYEEI9BhkMcQ8T4pBcZHO/r/bzek9bMe61HjqGzvx/3bd+GRQsWoKujA5meXsSZXsVI1ka5PMkjnevepMi4APw7zvqb4Ca+q+8NKNTE45rxtCKu+l8CBI14PIo4zx9+4H785LUfkS15G7hgQ1/90UwEFYFGlEI5HiI/xzKoThRw161L8cBdK3D2+GG8+fo7OHuiCxWJahRGh9zQ3tEBG8Vly8EQPNX5bXuvMA9cUxpTrKgyfa45io7x1NBp7TYZUIe9NhCrSCGSStEkqsLyRYtw/6YNeHDzcsxriKKQBJorQkiFmQf0bxfj9ic7d+HgnlMIjhRskmcho/kfGi3GNBHMSqPjcXLNUCoXDjCsjCi/xDr9qR74+TGRr3Mi5cmNQS4pM6WD8ZxlVCc3eU1xfh2Ziab55FLulxw0dOmu9Xsp5/9ePbq6/o1XGEcSgq5NXRqZ2nzz1kyjDly3mZLXmcj3tCvb6MgoBgcGbKhtmtrePffchbvpKqsq0X6+HenzHQjHKhFP1aN3JIiTfWNoHchi48bN2LR6ESpjBZwLJHF8NIwlt96PdS3U2vv60F+9moCh9bOojWo0TSSFZLIO6aE+PPzINhw88gkGx3I25UKT+QRo1iwlwSAryXeWPjpLpq519G5fQNPeJLEKMb300LVS8dR4YsKIfDGN2l40jzPDaRx9excqamrw8OOP2fLjZz74AGECB8UmXyLv1MFu3/BazTVyPimaXrx9by3CflqMvGv192htEHWCq4mH1yEKYu2docUC0yeP4wtf/jI+OfAxjhw5ZMGMUcC6nRRlEeQojN0CgZXxCAbPn8Yttyym9fcYBXAQX/uLb6O/K4NcRsCsjaqGkMn0EzgoqNUcRcBWeVCZsQmS4rlLGOPHwASIAgxvMIFZQN6yIPEaAimBLkvrYPnqlXjise3YsHYZeZRjGsK2sOCJc+345rFW/Dwbx6uto/jOKx9g/8/3Idfdh/xgP0q0dEojWgnAGwhho+bUXCnAUP54lgXjJmujrBRMSzM/+YUhFQv/5BrSVLlxpUTorimX9V8KmsKguTDsEpg8B5I/l+vXxb+zpzOk0bTDoDorIybENcKqSGfNIBR8WnZDW5CmamsxkqUQ6epA8y234JHHHsXipSvR2t6NH+/Yhc7WDsSWr0W8tpEAUoWKeBJrNy7Fuq2bcXgY6OodoOY4hEdWNePE8TP4yccd6B/uw1hfD5CWECiimmGG+o/jy1/6PL77ve/jfEeXrUoLglZRk9ykbZrAoJap8feMlwS9E2I8mhPNlCs+OExP0kzVzxJUHwv5o7Z5Lc+iPSq07Idrp5fGLy2fPBpJI97UgBd/8yWz4P7yP/9XE14xClGNMlKfiDpntVheeWIhBZ0taU5nzWMSxAJxuUmR1gWdLBwtMSLQkFAmUEgwawfH7PAQ7n/mGaxdt5Zh/xcCeQr9fdqOVXkX4yFqM/2VLjuW8vid3/kSqiqj+ObX/x5nTrShpWmRzQ4fG0tTDpO//qxtxdfiSe/KPGN8VG4sagzDHM9Vhui/hgqHCEwJgugI05plfi3asAFPPvUUKmiRnms9a/0oixYtoRXZj5273kPfcMYWVESvhnXTv+ERJPI55Ee6bNkYWTqa3OhGzrnFDi3fPaAQ37SGlQMNxXP6/HVPFNnLoen9/FUgJyYul2/jdBM0LoMuzTCFebnhzv7b6dIm4SYBYMKSQlGd0oVgiC5oo3T8pT0C1BojtAqyqsC5UVQvXohNt26mFrna+iNOnGlDV/cARiKN6ImtxHB9PWqWNOGJtQ1Y1Ez/QsPYOziKxVW1WNLahv9yJo22AfrZmUVgKIPI2DBuqxnEppUr8M3vvY5MbxuyA90IpNU8oSYXap2madJJuHmWgBMcnqbpiYeZ6GKgIZKAtSUuxA9Pi5YTmBZkPYgXBhzU+KMRyi8KsJER3PrwNqzesM5GoZ05dARZgp0EtS2Yp2Y/WUoWV3pnwtgDD8WHriDBp4eTosfwy+tS6ciwGWaQ51qYceHSpXjxt17Cf/7z/0wBPYqcmo/87wgcWqgxNzJmG0Ft2bwZm29ZjY/3fYLd7xwiC4cRjwUYpTw0SS+r/gITxoxT2apTPOkMKBwf5NwSIOQF78upj0vKhQBQTVFqmlq4fDm23HmHlZdh5p8s10RFEh3d/dh/6Dg6e/qIh7QwaUrmqTCEcgFERgsoECBs/ogmMmp2PC0emyVvgKE4+nxkSnl0+a54Oz66uBoTJpH48umCxmz9uNw4Xj+aRoRckm6CxjUgx9DLDVffTfftzP5Nl0Y3nt6BhxvSScdrWR7WTELBYIJDy4nHY9RMKbhZaWsaGpGqrMKaDeup9a63tutTfVmcG81jgHGorK1C7ca1iKxoQEMlkKJlMZ+CoSuQxAfn+3EoXcDwEC2HgWG8MC+CbNcIvvPaEVodJ23vj4j27NYSGgSNgg37HEVAnePSNiVs6dz8CKe1CzjGCyhFxYTSeinQ8EngYf/ih9JMp7kuAlOigTnNl5B2raW5R2gJVTY04I67tqJuXiPefecdtL6/1/Z1D5mc09aiOcaFcaMgLs8I94BjUrwtjsofhisLg/4baJDnAiw1T8VocXzxxRfxg1d+hJ6OdhvEoOXstU6Uvi5omRIK/8233o67t96FkydOEtA+RGdbOyoq6yioCTK5EQuXb5s16QYbKD68JSEs0pFlxSwJpt2VEYIFAUzAlUylmHeDjFsEy9euwdIVy9Hc3GIGSkJzbpgnvX0DOPDxJxhhvvcPjyIfIODSui1p0ucYQUt5KaCS9cg4OSfFQJ3vBEIpCb6FofjSWZ4aeOic3+rIWwYM05RtvX75oCHy+DGFxn2c/rlP9vTir3ieXUkcb1z65QONMjHDrnOeTRTel89U+TE14hOvp0/UTOBo96VZ8qi5HFoPyiYHSsOW0OS1hJgm/VGkEk8iFGISbEEMZ4axcs0KbL3nDgqRTQhWN+OjgTz2FsLoamjCAwuCWFYnoZFHLQVCnlrp36cHca4/h0QmgN9vrsT7Ow7hZ8cYTut+5E8eRGigDwFbd4lOnaG2cOGYExYecNhoHgoOa3unc4KXVD66g5HuTWL2pIspxOJufHBNMOKLmu5kcRRjFOAU6vJOy7SofV+DBiKLGvHrX3oBg+c68MO/+w4qKNBlaWj1XzUW2VBnE9CyNvixwIOe6E/QYdGxKDEPBBQCjmTKgEp7gsii+OzTz2BweBhvvbMLCQJITtYf062lxTO9PahobMKXvvgiYuEY/v5b30J7eweSsQrzd2R0wEDMAYPCI7/KAOaHTbJyoPQzl8UD5r2t3svzSH0VhrXyLC2/jdu3Yf0tmxk/bciVRR0tGy3/0Xq2FW++uQPZ9BiBNYlQMUKMIEAJHBhGoBhAjMGOanSXhgHLejRwEIiog5s8yuWsb2UcMLz48ugPYnCg4SIty4c+W55NJPd0+vI+O3I+jB/HadzXC5/5xBgrcnZ+UZr2lbnEe2ocriTNV49ugsZ1opmE+lRymTHTu7rvu+npYuFIYNgWpwIKgoT2fzDQkPAQiEhYek1Xcsl4EuFoEgNjRZtzccfdd2HDlg1oWjIP4WreTwJd+TRCVSm0JCtQwUpfEy1iKcLYlKy1EUyvnU3jX+4+g7Z9h5E+fgKRgS6UhrpRHO5zw0i1/lKewEEB5ISvExyueYr8kACRENSVtFGf7KGfVl5I8HjcE5WtkPLRHcQ6W1qdfHLLeaupKmhLnIsPWppFbfVmlVCwl6IhjFJwP/2bL2HewoX4yle/gtHWdlTWN1Amasc6dVCXrGmr3GwlkjCU4CYpDHWA21Begk6wqspmqwuYwgz3hS+9iK9+7esGZvLHmmkY4Wx7G25//hncffsd+Oi9Pdjx1a8huWKlS1u+aO/mKYTdnBs/XJ4LQOyeu2VlQs1Qsi68tEWYz1IU8nw0Rktx2bb7sOnuO5l2gkV6BLXM98LImK1n9sHPfiZfkKptYFqZZaO0GJgnAvQigdJGwylMptf6e8QHzcOxDnyBAO/pvsBCgFKOK490Sq/LJ4GHlAU/4k7ZuXbkwpwrOSvnMuNln83mW8ZruqjN+vtrR9OAxtyZODe6XglmOJ8ub2dNzATvjNyfMc7+g4kvTHfP0UzgYblrwpIVkoLMliMRYJTBg/fVdMV76lRHKI54RQMiyUpaJxSq8TCaFzRh/rJFCC9fierlS5BoqESiOoaG4gierYhjbSxOAMlRGw3iNMP466Np/MUr+3DqZAeiPW0oDrh9H4Jp9WvQFQgcarqQUzOGhAu1ZxMeJgR9wUInecN7nozxnN6zB+58InkvqgnEf6ImKuMPnY5FCtOimqkoWM3xngRqiE7t+7FkAoNdnZi/fi0+89kn0NfTYzsjDvYNIqE+CQrJvAR41uskZ0A274FOYdryIWrCEV816VEd4IyD+h/+uz/6Q/zDK6+g7fx5i5esDI18mj9vPp5+5ikcOXUc77z1FkbaOhCvruXzrIGFzSSXM0CdQArbS6iVAP5IY5ffEU3IZPqysgAqE8y3Oqy9ZSPWbdpE6zKOTCaDvs5u9LS149yxk2g/edqamSpraw3QRzMjNhjAttI1q5ABmWM4/rmAUs1pBBMtB2KTUC0vBQb6bmI+iVc6p5KguIr4ng/+9IEelJ9cA3LhXEgz3Xd0RaDhEz+fWO8vJK+Mz0DjbLnQj4vH/sppGtBQpl5LUiIvxqyrRQzjegRzHcgHgAsLg89L301PMwGIvjHLQ5qwgEOOgq3kWSJOgGpRRC0+WIlgRTVKldUI0BWTVYjUL0TdwnlYuLwF8dV1WFEZwP/Z1IiWVJBadR6pbIZ+pfBRXxH/+IcH8f6xbqDjDCiZrF8jSpAIFSSIhgkewyjqfbXNS0ulgDHBS6Ho5nWMj1pyQ0W9JPBogDCxhulc75pAkptSpo0fShsPZaCYABoiu0dHMInG4wYemlkeSyXQuHQR7rn3Ppw8ehy7Xv0JIpVVBBgCT04bPSm+LlyLryJooEH/CcpBAoaapbSM++/943+E02dOY8fOHdByJ0NnT2PRxg24bcsWaImUHW+8gZ7uLounDbsVSSh7FoyReCHyoq0TNZuJGAOzLDQPpLqmFl2d5HsiipVbNmH5nbegYfkijNF0GOnqw7E9H+Pc/iMojWSRHU7bRMgKrUFGsBBgFJgn/iZWtoeI4mC8VUBeHEi2NAqzSxaJzdAnD9R8xl+Lj32g/Ch/Mw4SIlMOPPKbp64/efGcka5+vC6ooyo/3ulsaKqMmMu3c6WboPELRhMLl8s4/1rHiecXkt2dUjjLfhA8zBl4SMDxGJI1IkBxO/GFEhUElQriCB1BpFBbh1BdnW30X1y2GquXNOP/3rYEd6aAqhK12WIeWYLGARapnx3sR2vvMIY6TuPMqWPoONeKkx8fw9Anh6iZEiSa6hCJhpGIMTwChjW7UEjb3AI6a74yAPEETllg6dQ74SOnvbHC+cLHE6oOcLxvfRIv9Lo5pV/XvrMX3D0K3VA0Bu13rWalHDVjWSbPv/ACWua14Jtf/yY6qJmn6hoo9IIY0Z7nDMuBBol8FRDb0iqxqK23dNcD9+H2227Fn/3Jv6KVVoWRgQE8/fznsHLZMnzvO98hbz5CvKYGo0PDzg/fLz/6BpwT0uKdyqLQsi5aCl1LuAwMDSFnwJPHut96AdseeRjzmppx+shxHNj3Efbu2YNsB8HcOrQJauSvD9Zm7dks/pzlhWuGktM7AkVZcE7v9qNiiw0qqmI1/TJryPtz6M7vJ4E4vzdeO7pxQONidPXiNKNCZ3ybG8knx7NLp+BK6JcYND4FmqkAXAOaqlmM8/Ti/HXfXfjc/BFo6LmcAEMCU6BhQ1OjdDFqrRW8JGiEk8hWJFHQpkpV9RT6y1HZXI/ffmQ5fve+1VjJz1WSTvPnm3s78O6O3baaaWNVBBUVEVRXplAdTGEsPUxtugNtbedw6sRxnDxxDMM91IjVhCJBntJWqWEEvBFE0nBDJU+bVsXynQlpHXUtrVaJYuD2zHHJwMV3PokVfr5Z2t3ppHviC4W++ji0T7mWmdd8j+xAP2594jPYtn073nvnPbzz9jtIJCqJgQQJBqEOZAZm2r6NYKNXVdWVqKmtwmc/+wT+6q/+grxIoLamCo88vJ1gehovf+PrlsYogSRrAwWyLh4TouzS4E5t3S81N9pt3uS1Ul8gWCCZwLIVK3HLrVuwcNVy9BI4Dh09gj2v/RQ41WrDf+NNLTb5UX0zAmdZElpZtij+WzOUJWRC+B5Q6L6OE+JiJJbbNzzXfUZMB+aCd2MqaIyzWnRjgMb1pwvAg3wVty6Lpvp1lekmaFw3ukiarzY7ypVtOo9nuG+3vWf+uR0FHgSOIIEjRE05HLcx+UGea12kQpLCLVWHZEUtssk4QmsX4bGta/DIpuWgqksLow8/2DMAdFDbHexFsL8NxUwPYqEs5iViqEwU6N8oqioqUVtdg+pUBfEpaM03w0NpnO4+j9a+TuQG0siltUlQFqXMGMaGMiaITJtnBVMHtk16Y3zHV5SldszntoqtVULe07+eiZQ+79Q7kMbPjAww6MQHfqDKrc5iWR5RxnWopwtVq1bg7m0PoKW5Ga/86KcYHta+6wxewlZfkX/qw0iQPxKan/3s4zhx7AjBshObN2+gVTWGvR+8j7N7PkCovs4NRdYcFhPWEyIoZ3kigzBigt7muvBGNBFHZVUVEpUVaFmyEPOWLrYFGrXqsfoous53oP3kKfpRRJjvqbPfwFb+Cyg0Ciqr/gr1K+UICo53Lnxnvznite7J8vCAw932j+5d16/iRZbf2Cg4O5V88d71aKKM+1UDjatpaUxHM/p/BcQcrp4St6sR1YvRL39BuLpEXl0Wu/yPJn/sVWl3MYHKHfB25I93bSOurENSfRwRas0aXRTjKQVgJIpSxO3aForT6qDmmq+ptGaRSt7XPIhMMIGRfIwBZOlLFuGxNIUhhWKR1xSWWa2NlB02YEqEAjYzO1jIU0mOI5JMUfgtQn1zE0GFYEJBFwmHMTYygv6+flt5t39gwPY97x8cwPD580Ca/tvQV68cU3AmtJucAIWX0v5NWPJP8w60FpW/V7rKvn01oQqo0lmfD8k9c7yxTbCYZgFnnnEKMIxF8xbgqcefsEX53tz1HrqGcxhJ1iPHb+LJKBqQwd2bV6GhsQID6QySldV44/WdtLCOIT9CHjAuWqjPds5TkxzlJ+HZ0p0jT8aGaT0ofYpJVQUqFy/CvAXz0djQiMb6eiRjcVtL7Pjx4zh74hRGRzLkr8CH7zPdceaLgMBZFRT65INvNbilSghS/gxy8cScUk0nUJATTTov/xhZ+eKlKz66Yp4yXcZx1/nE++PviyYLtsnPfJ9+Welag8ZEuloAwjytutpxuwQp4r/cBeGq02VnNr8ro8H0NLUgTSyqJgDoDDS0PAmBwzYRMvCIlWecq8mmaACiXdxS1HprEY5V81MK21AJuWLGXMHAQtq3wpjodCghTIEVKYwhTOGlkHPUzsfUt9HbRy14xGn8en/ePKzdtJECswW11MyrqqutI1lxl4WS7u5Dum8APV1dOHvmLNrPttoudyaIjR/0g8IelZWIxZgO+qsZ407zpoBTs5KnRZf4vmnjIp3bkfcJGtqZsJSsYJrpF9OdIngOnWvF5379Wdy+9S787O33sedMN5I1dQghj80tKTz3xMNo7e7Bno/34cev/QTJcMrAIDuiVWBz0Pph5CZGtEgh38MAgUJ9PrTKGtevs6amlvnzbHmPaCqJzt4enDp5Eh/sfh9FsySYvsoq1FfV0M8RjJGXWaXbAMGBgdLmOqnHj3Zf70jTFw90T+n2nPgyuaToNp9NQ+Ojt/iF4hPwQMNx7wK6WsLsF5GuJ2hcLboJGr+wdCkeTpetPu9nz39ZGkSMsgtq6KjuERDUTm9rXUkTDzsrRFvFakn1QIgAoiG76hkN5nlNzTZQoGyiJi3BZJKFzqscJn/4Y23kvKMY6kwzltWU4uZOSK4VkVUTijRuTQw0v/igrg6NzY3U4htQ21BPGZ5EoiKFWEUSAW1LGnZt/VqwsZ8gNNjTi/YzrRju8cDERgRRaObpn/pOCIJxOs12ZgD80mLD8Oj4n2OYOfX1JCs1XdqcNrmKEUQy4RDWLm3E5x69F0tqqzFfTU7ZMRTjIew50Ye/fuUUzrcdRCjbg1J3PwJMhxYVHB0kSIzK6iqiprEeS5cuwYKFC6wfJB6P2eKKg7SwBhj/kydO4PzhI5rd58C0uoqWGa09NVkp/lk30skxliSAEK880Cg7PRdIivd6xqNZIPpG5/YxSe8xz5yx4O6KFVPJBwxHFC+65o/7m56ccvILRNc7uhMZdwOw6lMCjYnHm3R9ScJ/LrzXu6rW+k4drgQICWkbaaTOXZ7btQMQWSRqxioZqOiZXqOWSm0zQADRPGlXCzw3ISqeqJpAekdzDBi+mq54Ve6voIYW1ppRFNA6z1NAFtSso2YWRVV+6VkyYaOTtGd4VP0QBBDtV15FK6OmqhpJClqzNhiGJsnJf+0kNyBwoRsby9JLbx5GrkClX0tl5N08DvpTYGC8YvyiiNDisn1EGprQUh/DS89sw0tbb0OSsVGUOkp5/M3ru/HNd84R8HoRyvQiMaIVa9UZXo0qglyAPuZoVQ3QMurr7UVPTw+GaYn09fViuH8AyBAoJeSZjghBTc1uecYvqy1zReKNQMO3LHRtjON5+VoAwaOBhi7dfeMw//VjOaF3PXJA4V1PPsxI0+XmnGiqB9eM5hrQ9Cm52hbTTJacT5+WhTYNaMw5a+dAExOp808n0b/aJPE1V77rGzpTLSkgeTDtkKDg+jt8R7Ej0FCzlF17n5q6SUGka+983F2arC1c/hhQWeDu3Pz27jEuNmnPbuqxG1WkIKwznMJelcyf7a0Z75ropuGz2pLVrBFp7HThRAxVdbWoocVS39hk61ElNNKILkagUFNYlJZVmOmkraHWF0KphrnKyoohG0nx+zAeunMt7q2KIykgK4UwGI3gg+5e/P3HR5Dt6UZwcACZrn50nO/EyTNn0dHegUwmTaMnawZaiPHX4oUS9m53RPKVZP0R1kkuICAQ87kbsaTE8oWyRTHB2X09d++IpTY4QPfNBpsA2XbTf89emFGATX/3KlE5QnOgGeI5MymQWQZkBVikMOjK19PTFQl1pmM2Kfk0gOMmaPzKkUladzpr8r4x0JiabyxCFGg+aNjRJ576pckVbl3RlYFjJnL++xVCb8rSEFCULCreOQ/WUa9LiwPjIgtHQpSVzjWtOT98v/SevWt+yQP+23BaWgm0TORXnpZETqOS1K9Aa8OEsfkj/zzSnt4V1UBzM6qbmlFDcKmrqkVlZR3iVc1INUbxG1/YjqfrQohrkb5ADF2RCF4+0oE/+Jf/AblDx21RR6UuHAsjHicIBWkxjKZpNaShCXRuXoo7jgt/xkVO59b34gDBWCqSsLFnAhV37eI/0fF9W9OEpPd1zV/rt7BX3Dv2rgDoIuS/eWlSeF6Ys6VLlpOp5Ps/i3CsLF+MZg73cgT1XL9Rrswl5aLLidfl0E3Q+JWjcUE6e/KF5XR5xmsVGRVYOvuzV1joy6/qni78sjWbMuY+1mf2toEEz7xwdG3v2FHPGUcLQ+LPIw80LGxz3m2e2zt2zR8DD8/xXM/1p/WpZFUIfMyp78aOAhxZJnEbOZXlewVZHrSyQuEkgrFahBtSeOFLT+GPH92COuILRThaaTT826+8jG+8+g5SI3lE0hmkMwPIakRZSQv7EaSKmtTollMhevG+QEGOMfaBowwivKf7XoInWQWaRKe06Zbd9l7ybgSUOXyvbEHwYFyZ4J+dW3PiDMR0+6/OjhjmXKiMhHOgS31SLpQXi4s8mcYjlY8yqZy44+XSJO+m0AwxuCS5KF1+nGZDTPlN0PjVoisBjck0rtmozPjvjJefSaFcZkG2r/TD732fXbh05aPdNMvBZKHAwtzkd8rxtft24h+c3xOe61qX/vpH9q3ue1ZKIJSgZZKgxRG2iY8lLfZIACnJAonXAlqFtrkBn394M269ZRnGMIr33tiL915/H9neMZRGRpHXfhN5DUGmJUKgCGhFWFshVtaFb2HIYqCQLwOEu9baU35zlNNK1bzkLCzeMgCxsws0aj2lM0vDndsb8s+OTJv3jfNpetDwZx7fcOSnY0byy+nFyPFlWrJky4/x9F+SE5fJqwuybg40XjevPt0EjV85mlzgZ0fTv38tC+ZUknZ/AQkYynFzgGGCXfcUN4ufju6+kR18ELAzO7emKvfECURd2lH+ebXC7jFM3aeloWHHbrkVgoU1bxE4eB/BCpRifCdUQrJUhUxfL8LJIBLxGDGBlsTYCGU/gYNO+5g4q0JgQeeP4jJQ8CwLOsXCOqwVE68ZaWJTkhPwsi7sDffrTi5BvtXhXYrK59N7YHeNFzqZJZU/mgvxozl/Mn2cxyXwbDycwQ+fJpW7udNs682VgIZIZfkKojkj0d+boPGrRVdW4B25MnI9QeNCkrBXWhz5QOELfS+G9ms0AXQmxtsAY9JRnfs8mtXi3vPByHfai6KkUWTBMIJaKdiGHKuDXX0iBJBSjBYHBXiwhLrYElvttxTIYXRsiJbFMP0gUJSyxIhRNxNbzVAGDr5VoaMCJhR4AOIsBw805Lx7k0g98vbcI7028XoGugA0LkH2qi0yNQdiGPqbC1nc59pENZUnPrlMdOdXSlcIGrMii+6Vh3Et6ijz8SZo/GrRFRZ4p96680vQXIXERekCr3jjAlWMIXpCX24iqEyiCRVpkg+8Ly8V73GvBSa8EOjYPReGOtxpSlB+MDxrsuI9WR28X+T98igyz0owFxAAuKYn212v3JEtxxiX3D4iNkNbIDHpmZcqn//+9USaLm+mXE4m7+EcBbp9NUfQcE1esw/DEXlwI4KG+XMRvy54dBnhWhCX8d00dLWBg2Wlco65ciU0MfJXNyEX0rX2/xeVLhc0WEzss+tYXCbQ7ISa3vGBQucTvpnhc/N3wjOlbmIlM8CgK4OIPeNXAg6GpfsGTro2S0OgpfsajKuOc4KDBJ881n4S6pMo9094Tg8NHHyrQn0T7rZ/z7uY4ET+0aep16Lp7k2h6wQacwlDJEvjxgQN0Rz8mvTqLL+z6M6g9FxFuhyOMB+vJ2iILieal0PGdXd6kybQZYLGdFrsDUdens9BQEynhfl3LLV8PjHVzpLxBKD+J4CIKrk94zEAWhrkdSGomfD2JT30rQ6dEhj8YbH6MWAhcKgJygDE3uK/XvCsDffy+NG/NOLFXAWsT3MWqAxnjvLsl8vSuAKaprxNS3pvtu9eAc3M3pnD/hRAwydG6pqGfO0Zfv3K4NUO6HL8+5SKiU+zrkB8rywgZvHNdEJmUlhTnwsUPNFv73nXdPrzv7VJhnbfLnlOIKFXbg6JwIEXan4q+6/jROeR4mdO706gC2r71Os5Ujmis6ArAqc50OWGMyPNMfyZyKJ1BX55ZeRa03QK0exJ307/Pf2tmJIz1ydBRnMtRDcYXZ/oz5x5N2k68vlFd1VkzkRP6KdVRDkd/HP//hSadE+QQkukbDH4gOE7/zDxHr/3358Kbub1lHs36TqR8sU7vVY0sZxdIV0eeMz8Df1LTUj+1Yvop07XQaLfBI0blCxjrhHPJgGFbsy2ncb/zieBxkTgEHnPBRC+lm2Hie/cpF8NUlmYYxvgDHRZmHERugkaV0A3QeMGpRsWNHxSlfNBYwrpkQGGVy3t4J3fpF8hUnm5OqBxtenGjNVNukk3PPmCfLYCXe8JJAqemwoYek43CTAmnN+km3SD0E1L4wropqVxg9K1tDR8ksWhEVNzomlAQJc+UJQfTXnnJv0KksrvjanT3wSNK6CboDETMb6fqty7Dvwy0JhrONMwxW7xR8AxtbP7Jv0Kk8rWTdC4vnQTNK4jTYmflagbPc5XSJYtVyGNxiv+3ASNmzSJWLauh4CZTRmeUi5vgsYV0E3QEDFu14cRs6eJ/QLXjKgF3gSNm3TN6HrVqRnKnNXp6eNwEzSugK4faNxoNCVONxJoWFSuh/BVQFcr3X58b4LGTbpRiGV7huL4KYHGta4cSvC1T8eNJCuvL12vcnKTbtJNutHoUwANP7hrBRxT0nANJftN0LhJN+lXka610uvTjVnHpoCG6HpE9Foz3U8DjzdB4yrSBL7epJv0K0uSX9dDht2I9Qz4/wGBGIkLbzJ/1gAAAABJRU5ErkJggg=="""
-
-LOGO_BASE64 = """iVBORw0KGgoAAAANSUhEUgAAB/8AAAC/CAYAAAAYax8lAAAAAXNSR0IArs4c6QAAIABJREFUeF7svQl4HEl5N97V3dNzaXRZsmxZ9mp3tV6vvLY0mj0wECIgCeTjSAiIQP5AgBCWBXLwcUNgvYSQcCTcf+4jQEhYk0AC4T4UAizLrtanZMse3bdGGs19dnd9+vVWDW1ZsmZGM9JI6n6eeUZHdXXVW29XvefvJYJ1WRSwKGBRwKKARQGLAhYFLApYFNgmFPD5fC5N0/bKslyn63oVpRSfekmSPIIg7MU0KKXGt67rAiEkIopiStf1jCAIAUEQQoIghEVRjKqquuRyuRYefPDB4DaZvjXMLabA3XffXZ1MJvfIsuyhlLoJITWCIDjBg5RSOyGkXhRFkfMg40ddFMUFxpNxQRASgiDM4xu8SSmN6LoeUVU1EovFwqOjo6ktnqb1eIsCFgUsClgUsChgUcCigEUBiwIWBTaHAuTEiRN1mUwG+m0d9FtBEFyEECd0C0KISxCEGuga+DbruYIgpERRzFBKg7quLxFCYoIgxEVRXILOK8ty6KGHHopszjSsp1gUsChgUaDyKdDd3e2IRqOwGdZomlYtiiJsO3WiKGKfxZ4rw54De6IoirApxnRdT1BKVUIIbIcB2HDwd0JISJbl+VgsFh0YGIDNsaIuUlGjsQZjUcCigEUBiwIWBSwKWBSwKGBRwEQBOFuz2ezjBUF4FqX0mYIg7BcEATKsyJrh50JlWooYAfbRBUHQBEF4VBCEc4SQXxBCHunr6xuklELQRzvr2oUUaG9vVxRFaSeEPJUQcjel9EmCINQzfuN8Vwz/cWpy3jLzIyWETFBKwYf/K4riI4888siZFeS3eHIX8qM1ZYsCFgUsClgUsChgUcCigEWB7U+B1tZWx549ezoopdBvf0sQhMeZ9FuzblGojgviXKVX4HdCyKwgCL8SBOFniqJ8++lPf/r4yZMneTs8w9Ittj9bWTOwKGBR4DoUuPPOO5+kadqzmF3xphLYdFbaFLHX9lNKz+u6/j+yLPf39fX9mtkU+d686WtUzCGy6YO0HmhRwKKARQGLAhYFLApYFLAosPMpAGerzWbrFEXxjwRB6BAEoU0QhIOCICDLYbOvtCAIyJ6YppROCYIwRQg5DcPJs5/97AvMYMLHZBlMNnt1Svw8n8+3X9d1BJk8iRByhFJ6kBByI6XUUeJHFdNdUhAEGO2GBUG4Qgi5IIriL3lQgBWkUgxJrXssClgUsChgUcCigEUBiwIWBSwKlJcCJ06cqE+n079DKb1LEISjgiDA6dQqCIJS3idft3eg4Y1SSgcJIQ9LkvSTRx55ZMAUOLCFQ7MebVHAooBFgeIp0N3dLcdisSOapj2DEPI4SumtzKYIRJXNvpBktCgIwowgCNOEkEmWcPRLRVEuPvjgg0CBLGvCEenp6ZFOnTqFgeyWC1liyPDK5yqkbT79VWqbgqL88BL19vaqlTqZ9ca1C3l+PZJY/7coYFHAooBFAYsCW0aB48eP75Uk6Qgh5I8ppc9hmf1bNp4CHvwTQsg5TdOQRTElSVJEkqT5dDodPXfuHKDdrauCKdDR0XGAEHIDIeRpy6gPzxYEobOCh7vW0AA510sp/S9Jks7H4/GxS5cu4W9WMMo2W8ztrl9xcu+UefD5MPQPwO66Tp8+PV0AWxWkXxfQr9XUooBFgd1NAbG7u1vczva43b18lT17y1ZamvW59dZbPW63+zCltFsQBKDW4Xs7XKOCIHxZEIQfy7I8/PDDDyP4PV//yXaYnzVGiwIWBXYoBY4dO1Zns9lupZT+gSAIL2ABVtthtr/Qdf28KIoPCoIwhlKQDocjoKpqtK+vL1yKCZDOzs43EULuXSbMJUJIlNUsGKeUaqIozoiiuOpGr2m/iReQJMkYC/7Gf175u/l//OeV3/wefKOflc9Y2T8nAP+7rusOU33NvYQQ43dCCOo2NAmC4BYEYQ+l9NlnzpwBUXFxiIZr6NnZ2dlKCPk1y7CZopQaURqsXuwMajvIsryQSCSSTqdzpq+vDw7xijO2dXZ21kqSBMjcBlEU9xNCqpcP9JsJIfsopYg4bFuG/bnjV7/6VZQQAwziunPwer3fJYSgBtEkgw4CLZCRBPoUtXZrra2ZJ3jf6/GaqqqiJEmABEadjjpW/xfrvkcQhH26rt/7nOc85z9NGXvrzRcRkciyQrYVIiON90SSpORq78FqY+btOF+v/ObMt9bfzXTl7xil9ABqzQqC0MjqQSFyFPPdn81mT1y4cGHEtJZ58yWMXLIse0VRlCVJmnA4HIhAiv785z9HvSjr2l4UEH0+XwvjSWTO4v083dfXh/c1b54o95S7urpu03W9XtO0GUVRkn19fcZewiB4KmacxdDh6NGj9Q6HoyqbzaKGUI0sy0Y3qvpY/BTOEEmS4g899BCi/yxDcTFEtu7ZthTwer0dy7W03s0MI05sUdt2Mo+VDcAHNb4uiaL4+L6+Pu3kyZPCyZMnLaNJhSwsartFIpHfXc60eQ+l9EaGKPHYxrz9L9T6TBNCziyjFfxDbW3tD3p7e7nCVpFnqdfr/eQy/OhTCCEosYGI+HFRFGc1TQtB+cWZabfbJ3Rd1+x2+xybT0XOZTX28fl8h/B3yOuapu2RZRnoEtjroI9BD6smhHihoxBCPvTsZz/7w9gztnPWVWdnZych5JvIaBAEYR7ZDYSQy4QQ6FMJrCd059OnT+P3TZN7+FqAuGaZTNM0Y41EUURNR6wHbAYNlFL8fR/TrURCyMyjjz7a3tPTQ06dOgUeXHNfR4ZfKpXqw9zB15g/pRTIHbCt4Pe4oiiT6XSaejyeYG9vL4LFtg1fc9uCrutVrDZmvSiKVZqmNTLe9giC0M74OvLoo4/+tnUWFnXAiMePHwcSkiRJ0hz0hV//+tcI7uJ7RFGdbvZNPp8PdaobmP6zjxBiE0WxRRRFUVXVetgxJEk6SCmVsC8KgoBa1ahNTSmlE6ijKknSkCAICzU1NSM/+tGPjP9t9jwq5Xler/cGQRCAQgUajLNxgU5QLrldLoAatTabbVzXdV2SJPxdw1nqdDqnU6kUdFDUAIdda1vxU6WsQyWOw3zOaZpm2H5wtgHBShRFt67re/DewY7IZBOcc3g/YSdFDXl8fnr69Onnb2c5ZCvXBnYtSul7BUE4wehp28rxbODZ0B9SgiCcFQThradPn/6FqVTeBrq1bgUFfD7fP+Ds03U9QAhB1u8cISQtSRL0H5xxOAAnGLWyJvvotiGgz+fDuY/9Bb49bouuZf4ozA9yN9D1qgghkAWQfIu9CfXTDd8DpXQBugN0Q0KIH7Lz/Pz87JUrVzJWWcZtwwplH+jtt99+cLlOI2w7SOYAz21n2w70S8hzWSCQJhKJ9sHBwcSKUi4F05R4vd53Live9xd85za+IZPJ/H5/f//PmJEWRAVxr1Egjh07dpMsy1A0CrkAEYtPJVxwDOdjSE+GQqEbR0ZGcMjoPT096qlTp1alCSbl9Xpx8AMWdVte2Wz2xYFA4BtOp1MbHR1VoQhd7+Dwer3bTrlMJpPHL126hGAF8PeaPL7aArKgFwh5CBJZ7TKEEdYvnMhX/QzFk1KKzQmHtRE4YOpEJ4RAoTcuKKWEEPSxbZEkSvQS2BCsBHqIolHC2rasNMA4zC/AgRmQ14ym5rWBgQ1Xrg0LdFr13dd1vevs2bP9bN/De77lTqnOzk7UNV5tT+G8Bn7iTjXsr/j5qqxa0AUXC2C6ZllMNXZy/zP/bbX/r7e2hBAnpZQrdHwdsO/CSKwUARUNYR/zClNKg6IoLui6Pi+KIs6hUVVV/fX19QO9vb2gwbbbl9ajp/X/3UEBdsYA0v+FLNN6Owvnay1a5vTp0whCzLa2tmZHR0chvO8mlK2KYmaGLPFcQRCeyjJvYOTc8ReTv85qmvaoJEnfsdlsD1aaob+zs/PLy8acFxW4GJWka602dAhyBUMK6rp+XyAQ+MD09DTkMuwZa+piBdJrU5t3dXX5KKWPFPBQLusVcMt1m66lv2y0/4nTp08DqtdslFlVhr7rrrv2ZLNZvyAItQU8FLqQoT9V6AV516yb5DVMSmn/mTNn7m5padGrq6u1gYEBrpfmdf9ubtTe3l5lt9vPIGljBR34Hghacl2c69tw1iAIcaW+s9p7AV3C/HesbyllsnIZYEOEkKCu6wsMOhVBNkh6+LWu6/6zZ8/CmYL570hdyefzHdN1HcFVpbxWnqtm+w2eA77CuQSaGsQlhCQopVfZcJg+jX3xuuhXlNKUKIpX8elqk+G2kS20GbkJIaJ5HMxWsyrtEcDC7DDXWxs4u1ZzCIOukB1WlublNgbep2FrMD2gpGcepfS/z5w5g4xJ6C3clrgj36VSvUBdXV3HKaUvQdkwmMtLvI+Wapgb7Qcyzf/ouv7A2bNnf2wFAmyMnF6vF4k/RhBOgVely4qQIzYj4AXBxUuU0nlBEOZYIFw/IeRKMBh8eHR0lPvkrL2rQAbbLs2PHz/ulmX5RctlS2BTRLDVVpZQKRfZ1EAgcNvk5CT4HDJT0fYB4vP53qnr+q5y/kej0T/2+/2/hLLU2toaHx0dBRGvUd7vvPPOm1RVLdT5X65FL2e/qfHx8a7FxUU4niDYJ06ePJldK1Ntuzv/E4nEvePj499KJpPGXFmwxpoO0O3o/F9YWHjSxMQEeDfZ1taW8Pv9fJNYl4/ycP6v24fVoHIpEIvFfntubu5CJBLBvpeG0r7VUZPXcf5XLiG3aGSEEI1SeglQbKIoPqTrer/D4VhgGZG7PYhmi1bFemweFBDvvPPOVlVV/3w5uOV1PJgpj/u2bZP5+fmnTk1NwVASa2tri/v9fuy5lgK6SSsK1BVZltuXswVfTCl92SYZIjZpdsU9BshVoih+T9O0f9U07VwsFptixpEt48sinf/FEaDC78pkMv8wPDz8MVmWU9FoFLpYejuihhTh/K/wlXlseJTS6UuXLj1RFMVUIpGA/piklGZXk6GLdP5vCzoUOkhd1wfPnj0LtBXooon29vZUf3//qnQrtO+d3v46zv+dPvWNzA8OS9Ss/k84qggho/Pz81OTk5Ow+2zZWbeRCa28t7Oz8/GEECTjWJdFgZJTQNO0f7t8+fKbU6kUnGc46/DuVCTCbcknX0CHPp8PKAkIxHnrcuDR/yng1p3Q9LymaferqvqLgYGBeUC0bLU9cbsRdQPO/+021S0ZLyHkp4IgfE/X9Z8v2wHGzp49y8t27Qg5YEuIWhkPJR0dHc2SJP3JcrAhoPIMZImdfAWDweeNjY31wabY0tISP3HiRObUqVMFJxXtysz/paWlV42Ojj7kcDhCqVQKcCKITL3GaVJk5v+24ztAhI6Ojj4tFAotOp3OsNvtDi0sLKyZjb3dnf/hcPgtw8PD33c4HGGXy7V4/PjxxPVqpm1H5//s7OwfLS4u+jOZDAI6wOMQ3PPK8L7rrrtuzGazyDIoaRTxtnsxduiAwRszMzMwiiDTKtLT05Mq5vAoFXmgK3i93p+vkflfqsfs5H7gUMT7jff8B8slTz71zGc+8+x9991nKWE7edW30dxYVO7HKKXI9t8150ooFHrTyMjIDwRBAERvQefwNlreihsqjHGU0r9edtS9EmWRLKf/6ksEVABAKRJC/p1S+sE/+IM/mM23HFYpF91y/v+Gmslk8mOXLl36LGSzurq64NLS0qr6aSnpX46+dqrzX9f12bNnz6KGJDJisaejBuOqDkXL+f8bzmKZ2C9QFCWRyWSWmpubI9PT0xVVfqwc70Ep+rSc/xumIoz82EdRYuRbyyUpPnX69GkEUHPj/7Z0AnR1dT2NUvq9DVPH6sCiwCoUyGQyX+7v7/8QK78RbGtri1oBzL8hVHd3txyJRO5ZRjp9kyAIKK9pRmHYTTyF/TNIKf3CmTNn3s6QIrYlYtVWLJrl/N80qsPPB7kdJXA+m81mvzgwMADUGstWumlLULoHdXV13beMkPuXrCTbSpSc0j2ognqKx+Mfu3z58ueZ7rmm/3q9Ie/KzP/5+fnXz83NPaSq6mJ1dfV8JBLBZoBo9Kuu3ZL5D+f/5cuXexKJBKAkUG8TCtKaBiev1wvUBMBqbMsrHA6/a3h4+AeKoixmMhnMFU7Qa9afT247Ov/Hx8dfDOc/auOxD3g8r+ggK/N/W7J13oOemZl52ezsLGD/4ZDC+44yDFuaMb7dA4ryJv7mNRwVBOEhZLw4HI7/evDBB2e2u6Fr80hnPalUFDhx4oQznU7DOPJ/BUEw6rztpisej38Ogrrdbl9Ip9OQNXAOb+leu1Pp39PTIw0PDz9V07TnEUKew2sL79T5lmFeaULIgK7r3xFF8SePPvro/2wWnKfl/P/Nasbj8c8ODw9/UVVVKPbzPp8v3NfXt6Z+UgY+KEmXO9j5P3/27FlAIYedTuc8AjTWcmJbzv/fsJKmaSPnzp37M+jbDocjkEqlgidPngSyRV5B6SVhym3aieX8L/3CEUJOU0p/oWnaN9Lp9MODg4OwecGJtW0CAbq6up5PKf1a6alj9WhRQBCY/vJlOBrcbvd8PB4PwV682zO7WU3pV1FK/0QQhFaLV66iAMqwfEEQhE+fPXsWpWd5EMC22Vc3ez0t5/9mUzz3POxnPyWE/Lcoil9/1rOeFWXB7xavbtmSXP/BPp/Ppuv6iwVB+GugrVToMMs2rEwm85PBwcH74L+GfYDZFNctm7RyQLvS+T83N/fm6enpX8Mp6vF4ZqLR6KrO393k/B8cHPyTbDY7r6oqDNScoeAsvmYT3O7O/2Aw+J6xsTFk42H95w4fPnxd49p2dP6PjY29PBgMXmGBHPM9PT2RU6dO5RWJaTn/y7ZvV0THExMTrwqFQgOiKAYymQzqI8H5v6XGZcv5X3bW+Bal9J8IIf2nT5+G0LCtjFxlp471gFJTAGgeh5YNI19k9dVL3f+26C+bzT544cIFQEFCrsJeC1nTgs0s4ep1d3c7wuHw7ctlJP5eEITfKWHXu72rCULIp7LZ7L8nk8lpv98POaEsjrrOzs6vLNdn/P92O8Ex/1gs9oUrV658WVGUhUwmM7ts5AB615bKZ8Wsy052/vf397+IEBLOZrMzzc3Ni9PT08j8v+bdsJz/Vzn/R8+dO3cPgiYcDsdcKpVCYHreiHTF8OBOuefWW2/1uFyu04Ig3LxT5lRh84B89hEg4ASDwZGtLoOTL226urpeB70u3/ZWO4sChVAgEol8ZGhoCGUzgi6Xay6RSCAgESUAdqVzDOe5qqovpJS+XxAERyG03IVtk7quvz+dTn/h0qVLqGnPk892Je9cb/0t5//Wvx2UUthn/pYQ8u22trbJfP0lWz/y3TMCn8+3n1L6IUppjyAIuyLTf+Xqapo2ce7cuZfgTHa73XP79+8P+f1+nMkFXbva+a8oCnd+AbZvV2f+w/mfTCbh9M85/yml2moRntvd+R8Khd4zMjLyQ6w/6mTvYOc/Mv/na2pq5sPhcN4Zh8ePH79RkiQL9r+grXT7NJ6amrp3fn4emf+GQ8rn88W2MrMMiEtdXV0/X4asf/z2oeK2HCmUL+zx30mn038zMDCA9ecGa0sh25ZLWpmDXt5T3qDrOuD/aitzhJszKl3XR8+ePYtsRzg6Ztva2sIWbGbpaN/Z2fkKQshbBEG4QRAEuXQ9Wz2ZKABobtTy/L6maR88f/78FWRHlDJDwsr8/w21Y7HYF0dGRr4kiuKCoiizhw4dCg8MDBQc2b/VHLzTnf+qqoacTudsMplEMKXl/F+H4TRNyzn/WSDcgpX5n99bajn/86NTCVrFlg3L/YSQD5w+ffqbQKWoZGQKr9f7rmWn2jtKMG+rC4sC11AgGAz+3dTU1E9UVV0wORogi+wqewFQxYaGhl7M6kpD17CuPCmwDMsNhNGvnzlz5nWCIIB3Vk0qzLO7HdnMcv5X1LIiwOnb0Wj0tX6/P8503bIEvVfUrCt8MF6vF9n+7xMEYV+FD7Xcw9PPnz//+yxRe7a1tXWpmGDVXen8DwQCb56cnAQk8qLH45mNRqOW838V5/9a8LQ7xflvcn7u1Mx/v91un0+n0xzJIS+4Ycv5X+69e2v7n5iYuHdhYSHn/K8EKGor839zeYJSGiWEPKCq6pfOnz+PMi4Qbi0Bd3OXYcc97e67767OZDKfFAThheWYnK7rS6i5nM1mx2BUAFpRJpMJq6oa1TQtrWlaQtd1g48lSRIIIbLNZqu22WxVNputXpblRkmSWmRZRoDbgXLXaMRYL1269PLl0gcou2Fk8VqwmRvjjNbWVkd9fT1qbr+ZUurdWG8bulvTdT2oadoUpTSkadqCqqoRTdMWdV1PwzmYyWTSWG9KqRFcrGkajKZEkiQKngR/SpLkkCTJLUmSR5KkGnyLogg+bRJFsY4Q0kgIqZRaollK6aOAGpYk6XuPPvoo0KU2bMyzMv9/w4c8858HDLGa8pbzf0Ovaulu1nV9nmX+h2RZtpz/eZJ2Nee/lfmfH/Es539+dCpxq1/quv5vmqY9cOHCBQRv5oWcWOIxXLc7r9f7JUEQYBS3LosCJacAQ8l9mMkic+3t7aHtGIi4EcJ0dXU9c7km+H2CIPg2Kds0qWnaHHRHfKP8k6Zp0HFDqqrGstlsyqznYm6iKBJFUVyEELskSVWKokCPqJVluQ76riRJe0VRbBYEwbYRWmzw3vOUUiCJ/Wt/fz8Q8DasN2xwPBVzu+X8r5ilMA8krOv651RV/Vx/f/9ly0a6NWt0/PhxtyzLJymlbyjHCJb7jem6Pq2q6jhsN9hvGQo69lrsxUAwyZXMxl5rt9trZFl22+32BlEUYVdslmX5kCiKNxJCyr7Hjo6OvjAWi/mhf7Kyc6sGn1+PXqSzs/NthBAeOYpBS+Ug8Fb2SSnVkcGOTHaMY3Z29u2zs7OPmGAVV3X+33XXXTdms1k4yQAvAbrgUylGuI2SFEZIKDMajJODg4MvXZn5fx3n/08FQXgcMnZhvGQ0qXQIDmO+4IGlpaX3jY2N/RjOf8D+rxX8wQns9XoBTYh5VvT6Mz7HetKJiYl7FhcXh1imb0HOfwv2f6OvVmXfzzL/B1bwxpbCynq9Xuwpj6eUyhXk6KjshSzd6L6VSqVef/HixTEg4CxHt8Npuqsi+0tHyt3bEyuThDrhLaWiAqU0QSldSqfTDy0sLHxvYWFhmhthZVkGj2qqqnJZhpeyWAvNgstu+CY1NTUNTU1NT3M6nc8khNTCcFKqcfN+4BT2+/2viMVioyzbEVkQyKS23q8Cic1qvd2yzF+fFQThRIG3b7Q59kUEloRTqdRD8Xj8XCAQGMhkMlhLXGbeM9e4NP4OXmV8aqz7sjIr4HdZliE3E1U14jKNn1d8xJqamrq6urqjTqfzhKIoRwVBqBZF0VUhutp3dF3/QDwev+D3+4suJ9PZ2fl5Qgjqp3I9q9L1iY3y08r7+R6mR6PRfx4dHf0qsu1YwBD0U8v5X2qK59cfXxeB2w8opfNnz559OQvKmGlqagree++9ydUyhBlM8AVKaQPTk3eK/SA/6j3WyrC7aJo2fO7cudcyus01NjYuvOY1r0lUcmZ1IZMsZ9v29vYqu92OhJWb2HNgj8Aeacgy5Xy21bcwo+v634TD4f9obW2N9fb2wo4E49eWy3BdXV3fp5T+nrVGFgXKQYGpqanXBIPBgRWyyJbaisoxz1X6RGLkQV3X/7nMZetgr40jiDidTveFw+FfBwKBi5qmGQqBLMu6Sb/lekUuCInpwNAtzFMgTL8wnw+iJEnKvn372mtqap5qs9l8hBA3IQR6xKaeH5TShzOZzCsTicSl0dFR8NKuR5/0er3DzG6C83zH+eA26Z0t12MylNIPx2Kx9/v9fqACWOUrykXpFf2ysmkoO/OEEj4ypes6AqkuLSwsfHNhYQEI2ZQlZvAkuNw320vX2qO4vQbvrejxeGr27t37ZLfb/QxRFPex/bWEQ3+sq6mpqXvm5+eBzo1SFbC7wA6VC1DI54Goy9qo63pLOByu1jStOZvN1iFqTFGUgzab7ZAsyzfLsnwkn84qpE0WDvtsNjuUSqVGstlsQNO0FCEECWFZXddpJBKZy2QyQUVRFllNRUCiXyPQtLe3Ky6X63AkEnGlUqkmVVX3SpJUZ7PZmu12+02yLLfJsnx4i6Pp8iE7GHsqk8n0q6o6lU6nRzOZTHRZoVEppSq+I5HIBLLnWDY8jE7RtWD/YeSPRqN1iUSiPpvN7qWU1oii6Ha5XIckSUIUzM02m+1YuRg/nwmzNmomk+nLZrMXYrHYZUTxIAMrHo/PJZNJQGpi/Xkd3jUF2o6OjqPLcKc18Xi8QdO0JkmSWlm0zz5FURDtcxCZWgWMq1RNU5lM5lwqlTqTSqWwfmG2nghwmCSEYIMDtDc+qNeaV+a/z+dzaZr2u9lstiaTydRRSg9RShVJkvaIomgnhGCNG5CRhuy0Uk3G6mdzKADnfzAYxF6QK/GxlTVlYUfx+Xw3p1KpPclkcq+qqg2SJOGdqrfZbAckSWqUZRm/txBClM2h0q57CoTaH2ia9oZz585hT4QgYSEB7Do2KG7CPp/vibquf10QhJKcB8iujEajp0Kh0OlwOLygaVpGlmU4+jVZllV8Mx7FmYaPwa+KomiZTCbnsLHb7UI6nTayrRVFMQR0/JzJZGA8Nz4Oh8NZXV19sL6+/tlOp/N5xVFg9bsQVTw2NnbP0tISFIzZpqamxbUcRaV87k7rq6Oj48ByVDUMcU8UBKHkQRpr0EuFwyoWi303FosNxuPxUDweR8YK+E1nhjm+T6o2m03PZrMGX9psNl4yC/yYM9qZ+ZEFDCCKnKTTaUFRFMNYl8lkDD612WxiNpuVbDabhG8YhWRZtrvd7nq73V6/Z8+ep9rt9t8hhNRt8XqDHigL8MPlDKXXnT9/HjQqKEsS65tKpfZrmrYnk8ns1XW9HsgcLINpnyzL0L32i6K6zMQ3AAAgAElEQVS4XSFXKQJHkP2squocpTQM3QMyO7K6NE3LEkLUbDarp9PphVgsxpV6fK8anL7Fa77u47u7u6uCweBzdV3Heh6klALBog5GEVEUqyVJAnyjc92ONqkBailms9lhZNstG6engY6USqWCWBdN0+D8h46IdcxGIpEx6FeyLM9XV1cvLWdIwvhyjbwEuOD+/v4juq43pNPpxkwmA90JejKy8pCd1yTL8j5JkpoJIXs2aaqlfgzoM6Fp2gxoB37OZrPIXExns9kl6KR4YCqViodCoQmbzYb/zzc2Ni4GAgEE1lty5vorInZ0dLQlk8maZDJZD1uUpmnIiFKgPzkcjr2EEMNuB56y2Wxt25if1qfG5reAreySpml/f/78+X836ctbyrtdXV3Ipr1988lhPXE3UABQ94lEArZFo0SkIAiQ7Xa887+zs/PdhJBXCoJQFrsugsLT6fQvg8HgD2GLjkQi3KnIs+ENnZbrvFyn4PqFoig69Fy73U6ZfmtmR+gU0HuhMxiJi9AhoOsyPUJ0OByuqqqqBpfL1erxeJ6jKEqnIAibaVuDQ/Wrs7Ozb5qdnQ2dPHlS281BgLfffvttgiDUwccAnwohBGf4HiYnwucA/Rd2UaAVWtcWUIBSOrKcYPnOs2fPws7Fg1a2PABwC0ixKY+84447btU07YeCIBwsxQOhcyeTyW8vLi7+nPmAebb8arbELLMlcvuOIefx/ZbbbPAN+TuTyfCkBSOBHnaa6urq/Y2NjU9xuVyvKHVATyAQeMvk5OTPcCbX19cvBIPBeMHOf3Y4YNNHbVZEp1c/FnAmIxtFxDcixvbs2XOrx+O5S1GU22VZRvZJxdTX1DRtMpVK/SISiTwSCAT8gH9lhjVuoDNn4hgRHTabLQXFFHBG3d3d8d7e3rUco1hUtyAI9eyDSLmcEdnlcjlra2tv9ng8XkVRjsuyDGigSrgQDTiYSCR6l5aWHgkGg4CdNebOogWNiEImXPBvKOKgCbLTrsdMEChgtIHREXSpYjwjqqpqRBHKsizW1dUdqq6uvt3lcj1RluXjm2ToyaqqeiEej/90bm7ukVQqBThWzA/zNV5k5jyAsWaptrZ2MRQKXdcxfvLkSfHjH/+4KxaL1SWTSRhowA9XRd5XV1c31tbWHnI6nUfsdvsTJUm6sVzvSDqd/t9EIvHzubm5PmSeaZp2lSGazRX8jPXEWgZ7enoSp06dyjcyCGuI+WFdMV+ssRNralpf7A/YG2z19fV7HQ5Hi8PhuMlut7dLknQYjtvNfAkAB53JZB4RRVFgqM8FHcqm+3LDxt9wsf4ArZX7mTcy/23l/wHnSykVCSFOZJXCcb1cSxBQv4i4rdlM+pifxTL/Oew/R4XYUoUORtJTp045+J4iy7JHVVUDaYPzHc6h2traxurq6sMIClAUBdDdR0RRLInDsZD1UFUVqBqrnRnIEE3ho+s6hAvOh/ybiKLoAGIKIQTzdcIQzngCZ++mRmGvMmcYcd8xMTHxzaWlJX4GFPQuFUJHq+32p0BnZ+edoij+O6V0w0K6qqoDcLbOzs7+KplM4vzCmYX3DPsTPmlFUeAoy6TT6azD4VBFUVQTiYRWVVWlx2Ixc/mKlXxrOFerqqrEWCxmGEPwsdvtSjqdhgwMObd1//79r7XZbIg0LoUxRJ2cnHxVIBDAfou9NlDgWbz9GWQDMzhx4kR9Mpm8hxDyRnY2bKC39W+llCIgdCCZTD68uLh4OhKJBJk8ZciNDGkCjn4EGYMfefCJ+TunMHo8HmRy54JRamtraSgUwkCMgBQ2IvO3waNut1uMx+M8CwTGOjmVShn8qiiKnMlkoGTaoGS2tLQ8zuVy3Wmz2e5CIOr6syxfi3A4fNfw8PAlvKc8SCLPp2HeOA8hF0HmxFmIOeL8B0oCspkMeng8nr0ej+dmp9PZBieXzWbr2CTdIs+pGFnOCLC+lEqlEDTiTyaTCDiOsWxRns3F0SL4N/Qm6G0IHkmJogjEk0Wfzxfr6+vbUvks74lf3dCsR8CIXifLspPJdUZ2mtvtrnU4HHVOp7MZjktZlgFRi28E1ZfTxoCA+FGgeEQiEWTcjeC8Ye/6VRl3K1A7jDPFZrNlstksguUXWlpaIhMTE0gwWEtOkuvq6txLS0uwr8DOYqB2mLLzDN4GbC942263NzscjhttNhvk3KNbqSusWHfQzJ/NZq9kMpmhRCIxmkwmoT/Pr6ARd4hizzQQTrg9hu0JoBuyVWD0T+1mo3+B75XU0NBg2CEQKM35iNlbQGcjsJHZ7gQgG9XV1d3mdDrvUBSlY6vPBqZLI6kENgnoR0hAAbITzgp+JkLPxvuhiKJYxcreQGf2FEirsjXXdf3LmqZ95MKFC+cYP+f277I9dI2OvV4v3iXYaazLokDJKdDf3//cTCazqCgKyqtx539eSUQlH8wmdNjR0QEZ+r3lyPaH8ymVSj2YTCb7ZmZmHmFl6gz0Xewj0C8IIVyv4Pqu6nA4sqlUijuoeHBATs816RRCbW2tEAqFuD7Bdd2cHsF1XogwiqLYMpkMdFzYcA80Njb+jqIoj9tk/86Yqqpvj8fj3x4eHoa9aVeWn4T9s7e31xkIBLifyfAxMNsnON+QESmltoaGhhan03mjw+G41WazHZFlGYEDm243BNIwMo6R4MBK2xkoeCxYNkMIQbk78CuSbrPMPn6NjAykV2YLtfGyFfCxMJsozv1Nn9t1thogdXwhkUj84+XLl4HWYCQCbMLWtKse0dXVBZ5+oBSBjbquz8Risf8OBAI/jcfjKKHC99ysLMsZVVUzsCkCXS+TycCmiP1WdbvdWjwe5/uRWVfPrUVNTQ0Jh8PcHyw6nU45mUxCbzXsiYgXcLvdDa2trfcoivJ/mI1jw2sZDoffNzw8/C04/2trawPr+TBXeyB/qWBkgcCNFw1OXcOxqSiKlMlkDAWeZaFgM5KdTmdja2vrW2VZPlaqyRRJDS0ajX7V7/c/YDo0zEY4LCgMKUZGBa8xoygKRS1O5uCG8Hy9eglYWGQaVTkcjipd1x2gCWhjyiBDZJ2xMSPaY//+/X9us9l+ewuzVLVYLPbA8PDwvwI+yBQ9mBMoGF1QDsHYvDKZjOZwOJBdF8PFjHdrbWqkra1NCQQCLiBGMPpwnkEUDLKWeLYSjHdyY2PjTU1NTX9HCDlU5FqvdxsyMhYWFhY+PDU1dUaSJH3ZibXSccCdCPhOud3ueDwej548eXJVyEbTAzkP4B3h8+UlAMyCFQw6Eoxbt9xyy7PcbvdflhJKGIdsIBB47+zs7Gms2XK5DmRC8jXNINsMhxHWNJPJcKEx0tLSEp+cnAS/F3JIYX7YC6rtdruHOUewrpBOzdC0HHaQO2oxf/Hw4cMvdLlcL4SzezMObwR8nD9//i2opQuUD1VV1xIiDahdZpDi8FgchtdYcmawWvkzv48baFe9dy0m5QYZ9A16AN6+oaHhZrfbjaAJHwRuURQ9bM/ggSXr8XxR/5+YmHjVwsICYP+NaO7u7u7odYKfinpGoTexEiJKdXW1OxKJGOcQO39yB6sp6IrzGlKAxZaWlrv37NnzWmSUldlgnJvWyMjIy6PRKJx52GfWggQCz3DjZ+5exgP4O3gpB/nscrkctbW1t1ZVVd1it9uPSZIEAQgBIxAiNhUKTNf1r8zMzLxhfn4enipkvRilcwpdV6v9zqaAz+fr0nX9VxtFPwKkeigU+szo6OgPsYczuQUZ/mk4wgghSSazpaqqqrKSJGXD4bDa3NysTU9PmwV0ENzg056eHuP71KlT+FkIBAKkt7c3ZxhpaWkRkR0RCASw30IGttvtdqeu664bbrjhGR6PB+Ww4JDc0DU3N/fG6enpB01lViBf5RuIt6Fnb+ObSUdHB4JKoODsLfM8YJxYAtLE5OTkj5lRDrxjyM4wXkDOYg4/yFGAYMeHO/+zdXV1OmTOhYUFQ89oa2ujfj/AHh6Tubq7u2ljYyMFL/LLxJPGn3w+H+nr68O30NfXx+UqDt3J5UycA4bj3+Fw2FKplKFg4pxAIMD+/fvvrq+v/ytCyIGtKJ+zsLDwBxMTE6fr6uoiS0tLMAYZ2dJ5rB/Qf+S+vj4uY0P2xDzN0KXmTCboW4asDai9gwcPvkJRlKdvoc5l7Du6ri8Gg8FPTExMAKKbB31w4y5HLskFIjO0CLTTFMWINYIuptvt9nQ6nYYxFJl2Bdfzy4Pem9XEcFguLCxAb4JcB1411pHZFDAOQ8ZjupPxc0NDw4H9+/f/XxY0XuogADWVSn3/8uXLnwHiAtuLjfecG+KhS7EsOwNNBoM0IXjgV7QFf8N+AP1RvY4TG3NyuN1uTzwehz6kmGwruUQChvYBvdl410EPRVGqDh48+AKn0/mHTJfarHUzP8dIJJiZmfnw0tISgkMNfmWZicZ+h4Oa22DA0/iZ2VxAPyNLkX3jPk43BPdhH81nf9iKeVfaM8EXSlVVlScWi2GfdDA7FOxZ5vPCsEcxPjLsL6qqyrfccsvz3G73y2FUL/fENE0bTyaTP0mn0zOJRGIklUpFYrFYlMl2uXNxRXA015eMvZTpTsa8amtr99fX1x93uVyPl2X5VgTUs71kqxwDCP558fT09PdY1tVaOmDZSM1KQWD/2dKLOYG2ZAyoO1om+xIqO1TEvvTYFLek3Cw9d+7cM5bRAGOKogSY8x/8tuOc/ygptpwM9le6rr+/xIwMNoqHw+HPj4+PAxnLSNQynZmw28JRChRXnIXQL7LQcWOxmCE3NjY2ana7XZucnMwFEZvKjBl7JdMxoN8aQcVcl1hZQgx8VFdXJy0tLRmBxE6nU0kmk1yHgGxmP3DgwPGGhoa3AWlzs+xOmqZ9NRKJvH50dDTIZKktC6gq8frn2x3OOVtVVVX1Mrw8zmfYP3MocCY9iMuLPNNYqqmpabrhhhveKUnSrZtk/8wEAoH7ZmZmBoHIyM70lbxpzJsFhV7zMyNKzqa+CpEwTyBbOOvr62/0eDy3K4pymOkD3CZaar0g37VCu5lkMvm8SCRy5vDhw5ne3l4elFNIH1bbVShw9913N2UymV8LgrAhXyECUmKx2Nf8fj+MLrkgK+yxLPkbejV0kdy+W19fb6A2zs3NGTpMe3s7HRgYWJnAZ95vMQNDBmlvbxcGBgZy72VVVZU9FovZwMPpdNrZ2tp6R21t7T+WAqkxFot9YWRk5IuqqsIHMd/d3R0p1IdjSBXIbD558iReJGz+uYzmqqoqEovFjM3GHNGAiDFKqQtZUg0NDX9qs9kQ0bDZlxoKhT48Pj7ey5y8fAGxoPgYBjqn06kmk0keNWdGADCU/e7u7uu+uMwpxZ2/cO5LkUiEK1p8I+b14I1D1GazOfbu3dve0NDw3q3ISs1kMr39/f0fYAwPOqRsNlsSsPcmw6VBE5YtR6urq/VIJGLOsFtvM+NGSO6Yuqr2hcvlEhOJhPEi8Mw6HFKtra2fFEURdVtLeqVSqe9OTEz8MxRMFuwAIQrzBsID+CHtdDqzyWRS9Xg8qiRJ4B+zAfd6gj7p6ekRT506xaN5sN4rjbOSw+GQWHaWYZy98cYbu/Gyb9QxYkh3lCbm5+fvm56evsiE76vW1eFwpFOpFDdG842OG7TQdr31XLkeYnt7uzwwMGAYlquqqqRYLGZ2+hOn02n8nkwmcxsey0xDRCnelb0HDhx4nsPhQH3Msl7M+f9mWZZhqDfWmxnwrllXm80mPJa0Z2Tw5H7mv+Ob/58PerV2aLNWX/zvCJZg/XEjNj8sckY/ltEGwa/GbrfvARSX2+1+is1me1w5iAbnfygUuoiDo7q6ej4SiXAo43I8rpA+jT2lvr5eCQaDfE81eAz7CVAUTLzGsyANXpNlGQ673/Z4PK9H/e5CHlpM25GRkZfFYrFZFnyDoCnYP81CAs8Qo8wIynkll/EJHsE+Ygqm4Zk7nDcUt9u9B5GDLperDTWfZVlGluOGHZL5zJlSOhCJRP50eHgYWcvYQ/j5mc/tVpsdToGurq7fopRCsN4Q8kYqleqdmZn5YigUQjASP7O4zAIHAT7Gns4h/n0+n97X16efPHmS3nfffQj4Mo5JJoivZ7QzG4z5vsyRALghxN3c3HyssbHxEyyoqOjVjMfjn7l8+fKXFUVZMBnQtmMmb9E0KOTGY8eOIUP4s4Ig/H45M7qhHKbT6Z8Fg8HvhkIhfzqd5uUj8M1lw5SiKGkEnjidThg6MrFYzAi4bGlp0ScnJ3XGi+bs1pXTXY8fze2vcmacPHnS+L2/v5+cOnUqFwjQ3NwsTk9P89IVuShz0MvhcFQ3NjbeXldX91pJkoDStmnX/Pz8vVNTU7/kmb09PT2pAhCnDAOYyUHMnf34Oy7J6XRCBsgFQphQEOxNTU2H9+3b9yZRFHFGbvqVSCROjY+Pn8pkMnHopEwW5Xop5ydkFmgsk4vL6Tm9tKqqisZiMVpbW6va7fbs3Nwc7gM/FsJDmz736zwQPIs1hcwCPs3ZF6A/QKZLpVI5/YGVZgGyBXyWDqBa1NbW3l/KzN9QKPSRkZGRHzB5Bu8ytxlwu4ERBOB0OjVmOzDWx+PxUIbiYQ7q4Ou6XmA1t6/YPB6PwdeYO9OpzAGuZl0Kzn/YWpSGhoYbGhsb/44ZeDdtfSmlmXA4/MmpqamfAWXOhMKTM5gpioJgcx44ATrwQABOJ7Pdxfh/a2tr5s4778wWsDds2pwr/EFyS0uLbXJy0hwQbNbLjX2SB9TAJoFAc/AQpdReV1d30/79+/9eFEUga5TtymQyP+zv7/+wKUgEASLc8YVgEs4TPHBzLd3CbGtDQAxqVzs9Hk+D3W7fX1NT8xRFUU6UwqBaDDEopd9eWlr6y7GxsemTJ09mIY9u1l7NYHGBslP2CyVQgHaH4DbUf89ms5Nw/MAxjG/MWZJ+E5+OvBtzsDjsqCsHydojYA72LaBIGvI7SrPytsgW1TTNuBf98d/RFvchUL6qqupVpSZAJBL5VDKZxHwxLwQjC/yZeNZq8+HjY2MxxvxY/pFg3It5oA2/l7U35stRJvlcTfMl7NmKzWarkWUZ5ZAaWblRlM9pLvXceX+U0siZM2f+mCXJwcmARJFYoU6Gco2vVP16vV6UkjpFCOlCQGmp+sX7Eg6H/yUQCABJjNuluW5h2KeZ8yntdrsz8Xg83dDQoC4sLCB4WPP7/eYEptXki/Vkwmt0iZMnT2J6IgsOwN7KdQib0+m0J5NJ2HudNpvN09TUdKyuru41zOZUKrJcrx9/NBp9hd/vfxj611plhzdjIFv0DKmlpUWZnJyEjGiLRqNc77nqDHQ4HIb+w5HgWHKu68CBAyfq6ureU277IPTm8fHxvwgGg5PM7sn9DvzsozabDXZP43dmC8/9z/S3lWRGQDBs72ZbuSErc9Q3KAV2u73O5XI1OJ3OVqfTCTv58VImWea79kjG1DTtn86fP/+B9vb29MDAgIUCkC/x1mjn9XrbBUH47kYd/6qqXkKw8sLCwjhDc+N6HnQYw6ZYVVWVjMViXH8zw/vDrkiYLGcc93lOC/cYH9ae63KQ1R0otVJTU3Pzvn373iOK4p159rlqs3Q6/Z3Lly+/31S6GaUBMZe8Lz7Iq5x6pkhKY/NBhtTk5KTZ0c0NNIi+dbS1tf2hx+N5SzkNdStnpKqqf3Bw8I0MWjmtqiqyqWIOhyMuy3KKGei4MY9HqhsLiSyc3t5e/GxWStckGgsAuMZ519bWJvj9frGpqUmcm5vjBymnjQHpfPTo0b9VFOXZea9ICRqGQqEPjIyM/IQxA+iCaE0jQwFGy6amJqM+qcPh0P1+v3lTNmhiSKfrZ3maGT3HPyz6hbS2thoIANPT0zm6QLior6+/Ze/evajjUTIhKx6P/8fQ0NDnWRau4RRnAmvM5XIlEokEz9biQSDcKGH+XpfyCJLp7e3Fx5hvW1ub8f74/f6cUdakeOOFd3V0dHxJFEXUqd3QtbCw8LfIJjKVLOBZQfjGfM0ZLDlDNLLLTp06VYzTzlhfNl8ufAiM5zEX856x0niVy6RUFMVx0003vcjpdL6+FEEQaxERzv+LFy++UVXVJGpKiqIYhWV/5cbtdDqFZDIp4BsXfmYX5rPmJs/bm59vutf4M+97xRjX2mOvieBkvAOUFRhr5Orq6n1NTU3Pt9vtTyaEADK0JBeD/R9gUG5Q6irC+c/2WczREPhMGZBmfltJN85ryKbC/gKEETjsygp/DOd/KBSatNlsgPKNZjIZvIM8m9fgI4fDQVOpFPjiqqyQZDJp5gk+t9w7ZLfbEehgBD8wZRQY04ZzEkavffv2/bbdbr9DkqT2TSivEUkmky+/dOkSjOWAaN3VtdlK8gLugE7uuuuuPdlstk8QhKJrcEOJjMfjX71y5QpqqOIdMQvoUafTGU8+tska2RA9PT3aqVOnzMbVfIXy9Sieex99Pp/U19eHdw1GEHd9ff2hQ4cOfYoQgrJFRV3pdPq7AwMDgJIE1PEs228LEtSLevA2vKmrq+tZlNIPCoJwc7mGj3qbqVTqf2dnZ78RCoUAZcpLQRllJVhpCSBN8ICTnOOW7fFQDvGBEdjgwTzk5VJOJyd7+Xw+kfGrXFNTY1NVVYnH4xBuDN3spptuelpVVdVLGIpMKcewal/BYPBvxsbGfmK32+dRu57J4flmisEyDlrmAiPN+sTo6Ch0UcJ00RwKAORKp9NpSyaTjj179txw8ODBjxJCgJqzKRf2sUgk8tmxsbHvMhQg7hiFbI79K+l2u7HXGah0DQ0NGkOIMPay1tZWOjo6ag4cxLjNaCal2uc2hR6rPIQHa4hMfzD4t7m5mUxPT5OGhgZR0zRxaWkJf5fcbrccj8cRTA1kC3tbWxtQWP6pFINPp9M/GRwc/CcWnAG7QUJRFMhvsaqqKrPdQGfBPZz2ORmO2Q+4vlCMDYG/v8bWAV15dHSU/221QAAjIG3fvn0IbvkKIWRTSqrB8R+JRD4zPDwMYxxkW0RkpEAzu92eSKfTPFiC21m4Ac2sVxv0Y+tutjUUGoxeiuXfKX2IPT09RjBYd3e3EI1GDcQYrpMzfsLvZl3JgCKFBbKhoeFIQ0PDJwghRctu6xEylUr98OLFizjHsRfy4E2jTi5DgMgFPiEYCudnMpk074FILoB+njsLmKOKJ53wbwOMdP/+/d6ampqnw1FFCClLne7rzHkom83+9YULF37S09OTLtLesh5Jr/l/Z2dnNyHkpwXfuM4Nuq4HYV/NZrPD8XgcJTTHQ6HQAisXag7cQOYmfl9pQzSjJxoOffbIleeYsYdyJEZ8o50piH61kfJ7DOS8Q4cOeffs2fOhUtNgfn7+bVNTU2dNwU58T7vqUSbkPvydz8/sdDXPGU4s0Isj/hlzZ3PmNDPTy+hzxTP4vUY5JI/H01RXV3fM6XQelyTpFkmSIDeXxLaKcrrnzp37c9iO7Xb7nMvlCiwtLe0k1DKxs7Pzucvn6UcEQQBqZEkulBOKx+M/mpiY+I6maSmWnMh1CwQTQ7eAXGjWL8wJimVHEeG2NpOzynBU1dfX24LBIHRfw39hs9ngVP692traVxJCyqaTmQmvadp7otEoAjRRgng3OVTNMuDKgD6zQ1GAzLzsE+DORY5aiADoE/X19R8sZzAcc/6/JhgMjnNHKtNzgDasp1Ip6nAY+Un4mdtBqdPpxBnPlxq/43w3293NdlGUujP8KrCBptPpXMC3SQ4wAldcLlft3r17u9xu95NZIMCmyMd8IpqmfWJoaOj+eDwOByz3w5RkL9lNnfh8Ppeu6/ANPn4j804kEt/0+/2fZbo49g8kgiay2WyM2RQhj/JEIgOZME+fZ6HDMt5hJqsbSY3pdNpls9n2Hzp06EOSJP1WsahFsL1euHDhTays90xra2t4dHT0Gn/X9QZsFlLWbGdyfvMN6aqIBhhJDxw4cKSxsfFrmwEphoEyg+pHmXIB5xUOCnxzYzGcFEZWGJ9YGQx0ZvpBERPn5+fFgYEBQ9Fyu912VVWrbrnllvfabLbnFso5xbafn59/+9TU1CPM4Y/6aqANDFEcYu8qJ1WxzzHdt3ID5wIspw93HoMuzs7Ozp8RQkqRkUTj8fg3Ll++bDj+2QuNFxubcLi2thZQwunu7u5sb28vD2owC+nFTn3le2PsHffffz9BhhaDFzaU0/b29t+32+0oS1H0pev69NmzZ1/JDDDG/BwORwhGq0gkYjj+mVPOsEUzPr+uM7uQwZicsisVHPM6r7bWPNvFdfz48c9KkvQ7hTy3kLYs8/8NTFEJpNNpo67gKqUOYGw1asii/8nJyZWPuUpZhbGZKWwwOq9UZHN80NLSYvS18tv8jjQ3NwswdjY2NoJHctlsHo9HZFGeyGyDERu8Y9TigtEPtRtbW1s/yhAz8tqzr0e7qampVwWDwQFRFAHlVjHO/+uM2czLuUAUE/qGOWvX2dzcfKSpqel7pVKCVxvXyMjIS0Oh0JjNZlvKZrNw6mF/5dm8OQcl1hyXKIrGOcT5jfOJKYjGEOhhBNd1XQyHw5gzRz/gAQ7gB2QAKNlsFmgHQBf5I7fb/TKWGcd5qpBXJ5+2iEr/w0Ag8EsG5bybFLJ86LOr2tx9993VmUwG9U43YjxOjY+Pv35xcXGMOxaYgB51OBxRRVFi/GwzodZsihOMIWGhnAgy7FwtLS1AAEDwiwHVUeilqur58+fP/xVz/sPZjFIavM5tod3tyPZM8fv7ZWXmL8s4wWw8Hv/XoaGhrz+WlGVAcBqZOAwtKGm325PpdNowzDU2NqYDgYDq8/m0m266SX/ggQcMo1wZ9IgNTRny2fOf/3wgU5kDtA3nP3QzGPBuvvnme5xO55+VGxZyaWnpvaOjo//NSwptsF59zmnAZFCmoxMEpgrmQFw2L5vb7UZN+aojR458XxTFmzZE2DxvNiGtIdsfvMQDcxFwzRTPRMEAACAASURBVA0NGucjFsAExD18DFnBPL9K5LE8SZFPMy7LmQ19xpTZzVdlOdXU1CjL9Q1dt99++9/abLaX5fOAtdog6Gd4ePjeSCQC/RD7L+wF2Iu53SDT3d2tsfIc3CCExTG6LOF7f40zjOuPeA7LHDFsLe3t7SQUCskM5cN54403Hq+trf1Oud9jjGOFEQ26FBw/oBW+Dcj+1tZWbc+ePVpfX5/BxyzYvJy02wgL7OR7jffKpKsbuipz7hjvVFtbm+j3+6FXAoLUW1dX958syLHkdGHO/w+gjKSqqrA/RauqqtKiKBqO/nA4TFkQFJ5tBNAw/XiljMf3A8MR4PF4ZKYryyw4CLWr7UB/A+KmJEmOffv2Pbm2thalb2qKNa4WQ5B0Ov2ygYEBBLLyQPD10ECKeUzuns7Ozj8hhPzLhjr5zc3gHdiTvoIgNlZW0ghAU1WVOyZ5kA8PTDOCfViWJ4I6UH4CPfISH8Y+x8rZoGzKVUNVFAUJQsZ6ow3/v/nnlXNjfeE5Rt8333zzXdXV1V8oEQ1y3QQCgbeivCY7yxEglkVpVD5mfGOepjkZ7xv7O+YCGqw6P9N8r7LR8XmvoIUxV9YXPyf5O8Ht8NwxJjc1Nd3S1NT0JgQCbJT3NU3rP3fuHGxq2PMRtLzY09MT2wloLd3d3XIkEnkfpfR1JeQd6BffQiIaQ3xA2TCjPBCSktiZyb/NqLP5JtyVcKjXdMV5UWpvb5eYDwNBACgvg0/Vbbfd9lqHw/Gn5bSr8VFRSs8EAoFnTU1NIYCYo06Wc/4V2zfXDUznOcoYGsF/DMHB2AcgK2ezWeehQ4deumxH/rtyTYg7/yORyBAhJJTNZmFrh86DwGbjzFtYwLIJelNTk4F6Mj09Dds45fZPFvBMmB10ZcCTOfCB1NXVITA4FxTrdruleDwOW0wu8ctms9mz2azx++HDh//Y5XK9lPkiN2wvz4eOuq73jY2NPTcUCsGeDtQKq0xqPoRjbdrb25XlhLZvC4LwuwXctrKpurS09IHR0dFfsCRZ7BtJFtwNXZwH45sTZTfwuIJuNeRX8GdNTQ1KizbdfPPN3ys2AJdSunDmzJkXwLfrdDrn9uzZE5ycnITcmbeNtNgXw3g5WZaU4eiGkenWW299usvl+gT7vSDKFNo4Ho9/5fLlyxB8sahwvuADpXSr4YnNChcWGnXZGvbv3/8BSZI2BQFgcXHxXdPT0z9jShc2oyUGv1lMBnihS7NW+1zgSEdHx3+Jovj0jXYMh+/g4OA7WI1WGHPAC6Gqqqqw2+2OM8hMno2w0ccVdD8vF3Hs2LFqWZZxOBZ1Ae5/eHj4nkgkAv7Gyw1jFfqDASuxTq3Jop650ZtWBAsZAQANDQ37WlpafkwIQR2pkl8m5z/oAkUFNIKBamVt5ZzCtQLahY/JMCwzeCwulHBDCv97bvymtuY55YQZ8/9XaSsic4MjSbDDgUM2mstqIAK36uabb36Z0+ncsHMEzv/5+XmUjzDqxVRK5n8xTLGC1zjNnMeOHXu7LMt/XUyf+dzDnP+jzMkBGmLv4fWNzQZu4zDOg9dy/MfOVhIOh2GsQ19cuJfC4bARAMA+Ro02h8NR29TU5KupqXmpJEm35zP+ItoA2vXtk5OTnwmHw3ivuCGoiK6sW7YzBbxe7/+/DAF5b7FzAFza7Ozs/YFA4CLLiuCOBezdMDQZDjOW6b9y/y72scXcx0vfuNra2jqrqqoADVkwAgsyKM+cOYPSWEsul2s2kUgEoUCX0JlUzNwq5h6v13uHIAifEwShaHSF602GUiQcJL8xNzf3Q6acG7U0mQMQvJdwOByJVCrFA4d5VLgZdjNvpWqLCcuVTKmpqck2NzdndzqdrmQy6T548CCy5D5ACDlQrjFGIpGPDA0N/QfORY/HMxeNRvE+l7vEBdctOMqYo729/SXL8JCAnS7rpev61IULF/4CGV5MPkeWXCidTmPePOCaZzlvFx4qK83y6NwcGGDIdK2trYfr6ur+RxCE6jzuX7WJqqqPLtdvvA/6osluYA6M30r9eLUxm+lg8DZqwi47vL4jiqKvWDrkcx/OrCtXrrw8Ho9D74RNxZxgwQNdOaKHxdf5EHXr23BdAghi0Cf/kxCyoSyrtaaUSqV+cPHiRdTPBt8YAY9tbW0pBmWN267JFl/FcLkyUIjDVfMzTq6vr0fZNEXTNFsikYAB2ZFOpx01NTWNe/bsebzH43n1JpbezOi6/oWhoaF37Nu3L+L3+w2kg3Itu9frfeeyrnj/RvuH0z8cDn9mdnb2oWQyyTO7c6WPWE1y1CXPojTSirI1qyHU8BIpK4OciMfjMdY+GoW6bAR8XZUtz0qrrNSfr3KSs/kafR08ePAJdrv9mxulwcr75+bm3jI/P/+wqqqwt+GMSHg8npwugvIveD5QN1bw7UqeNXedsyd5PB7CaHDN3sn7XYUWpKqqSkCpGLfbLcbjccPp73A4ZECA8xIxDoejav/+/X/kcrlevRE47Gw2+8iFCxf+Bkia2WwW7zA8eqvZ1EpN/rL2h7JiNpvt3ymlTy7Vg7LZ7KOzs7OfWVhYQDYRL59r6BbML8EdTythpivx7DT7d+DDsCMAEz6egwcP+urr69+9GYG1lNIxoE4ODg4+xHQ1Cy1odYbl56HhXKx/DK7wW4SQzlLx91Wb2GOw/68OBoN+Zv/EvoANnZcn4zy9ZrKcKfB5LbmXMpsp/m/YyRnC0VXBwcw2yhPlDPTXTCbjQKnUpqamJ1ZXV7+OEFK0zlAA/RA89+Px8fGXBYNB+B54ubYCuti9Tb1e718IggCkqGJRa9RgMPjBsbGx/2X2Buh42HPDLpcrkkgkuG+Y2+i3at/N2SgOHTp0S319/QOEkGKSFNSBgYE/TKfT8D0YgXlrJLuuyVTFOv95h/x+qbm5WZmennYdO3bsbbIslzKabtXBJxKJrw8NDX2aCWdzTU1Ni8sCmxl6eavfJE4bw/npcrk8hw8f/k65NmTzZGGAGxsb+4YoiqgxC+bg9SC2iuHNwyNerxcR58/ayAIBmmxoaOjVsVgMyiU2Whw+3CnOX/StdBzw6Ylerxd8WVTWYCaT+UV/fz8y4vgccdBinpgj38g2Qspy38sNDsrx48ffL0nSq8vxwJXO/8bGxoVAIABjfiXwQCFTBkyMyNAjxObmZmT9GDVTHQ6Hu7W19V6n04n9tdhDUpiYmHjVwsLCgMlxXRGw/4UQ6TptDQG4ra2t3ePxQGko6r1bbyzM+T8ChbjMTo6romB5IMCyAiYHg0FziRmHzWZz33DDDc9wu91/JopiOYJs0olE4t7BwUHs39wAXDbj1nprYP1/0ylAOjs7X0EI+fQGnpxFCZvp6elHmeMfZVoiy7CpMLKFW1pakpOTkzjrKmXfxvtnIBYdO3bsDcuZvW8rZu+9cuXKc2Ox2DiidOvq6hanp6dxNlWCPLaBpdzYrYj2VhTlecsBFR8TBKFuY72tejcCln41NTX1Oeb0R6Z/VlVVKIbI5kqgPrup5jevXWh2+pdhWJvSpRGE/MADD8gsi8fJggCqjh49+i5FUf6wHNnD0Wj0s36//yu8xIXP5wv39fWV2/lvJihXru1er/d0OctH4KHhcPgTw8PD32YZ/xG73R5Mp9PcocydP7v6Pd8It/Pgzra2tiqPx/MzQRA6iu1vYWHhPRMTEzAO4d0PZjIZ6FJcN66U8+Z60zPOoo6OjheJogi0u7Jd8Xj8S5cvX/7aCt062NLSkpicnMT+acl9ZaN++To2IQPIx44de8YyTP43yvG0TCbzg/7+fjj/IdfNNjc3B6enp1dD4iv08WbnqjnoS2psbJQDgQAPjOalb5y33nrrS5xO5ws3qRwAMuU/PDs7+75AIMARRnJIcIVO9nrtvV7vB5btXiinWOyFOvT+2dnZDy0uLo6uKFnDHZccmtycLac1Nzfr09PTuQCO9vZ2OjAAk8JvZFpWti83tpW/rxw0//963/w+oKLY7fYnCYIAqOCSXoFA4C2Tk5O/ghxTVVU1H4vFYF/MOR9Nc1mZtYpxrBassC4d0CcuVsLD+Nn8N/wMmOyBgYGVNgEu80gul0tJJBIGbPuNN974hNraWsjWBgZ3oRezPb6LIY3OeTwe2NTgzN62e7/P5+vSdR3nWluh9Fitva7r0Xg8/rWRkZFva5rGHX4GzDQhJJ7JZDj6E94jo+yTKfCpFEMoWx+mxBqeVONwOp3uZDLpOXr06JtsNtsLNhJckufAY9ls9o2Tk5P/FgqFeNLJtuW/POe8kWaG/bO9vf0pdrv9W8XYKtZ7OMv8h/P/iimB7Kr9cb0+ivy/4VNj6MbmPTCHfGJOinqsEq+z7sYbb7zXbrfD31T2IABd17959uxZJMaAHpCTrYCVdRa7s7Pzd5eDUIGsWfQViUQ+PTQ09F+SJAFxAaXJjERgZlOMTU5OGvKLCRm76GeV4EZuU7QfOXLkWU6n80vF2GLGx8dfuri4OAj5uhh/10ad/2Y6GJvOnj17Gg4dOtS/HMUByK2yXZlMBrX73kMICbKoRDhEC6p5ULbBXd1xzvnZ2tp6rK6uDgJlWa9kMvkffr//o6qqBljUNc++qQgjlNfrRQYHhPair6WlpQ+Ojo7+mBkn4AjH+sM4gRe9kowTCHYoWlhhtcfOMIPVgs1mW2S1ZSppjvmso3T06NEnKYryk3waF9pmlcx/HqVcNO0LHUMZ2hsCDsqJ9Pb2QgB3uFwud1tb2+ckSSoaOQPO/1AodFEUxfltAvtfKGlBN8Xr9aIe4olCb86nvcn5jz2WoyeU3cnBIcAATf6tb31LWlxclEZHR3kQgMtutzvT6bS7vb39dXa7/UX5zKXANkBUefr09DQsPVYAQIHE287N29ra7B6PBwrfwWLnEY1GP+f3+2FwBkQ2hHQjs6a2tjbc0NCQZNlSZTGWFjtmtgdLvb297uPHj39VkiRk8Rd0zczMvHp2dvZRJo8t9PT0JHcCfGZBRFjRuKur6/PL2R0bgvJe6/mA+B4ZGXljOBxGVDR4TTU5/eOSJMWSySSHZOfBJpWW+bsR8ubuZWUsgASgzM3N4YyoRh3Pmpoa1DpFYEvJrkQi8dWhoaHPqKqKSHTQnjtXS/aM9TpiZ6R0++23v8RmswFRomzX8PDwK+Lx+CSDB8acF1pbW6Ojo6O7Gqq0DARHfd53E0LeWmzfp0+fhgEQ64KyaYFUKrXQ3d2d6O3t5RnsxXa9afcx3rZ5vV6cm3BwluNKnj59+vnMUQEZz+DrlpaWaIXp1uWY+67ok/GR7PV6gV72WG2yEl4m5z8CoZA1vFYZvlI99Sr0l4aGBtvCwgKcoE5FUdySJNUePnz4k6IoFh08VMhAVVX9zPnz5xEoaqC/lAMGmCXRFI0mqqqq3+/3vzmTyaQIIZoJmhy1cSEfGY7/lpYWdXJyUgMSF2hw9OhRZGVeld1ZhFH9ug7yfGnt8/merOt6yW1KyPyfnp5+kJcvMiH7rTa0QuayFlKAud98++P2ezPvi01NTfLc3JyBxnvbbbe9yuFwvD1feprbpdPp71++fPmfoKM5HI45nJesrO62tKn5fL4n6rqOAMKS+D1UVb3s9/vfkUwm47Is491AYDHP9DeQn5qampIMgZY7/YtZii29Z0UQAPgKKACelpaWEw0NDZ9gJSfLOUaazWbvv3DhwocYesxWZ++Wc66l6Jvcdttt+xwOB+wN+0rRobkPk/P/st1uR4nd+e7u7mhvb++WObo50rLP5xP7+vpywSos8Klq3759t+/bt+9jhJC9pabHyv6y2eznLly4gD3XHABQ7sdu2/67uroepZR6i50AK0/2OU3TOJojRymD7YGj71XimSU3NjY69u/f/25JklAWtKArGAz+7djYGMobcwRnzDXvIPaSHIJ8xMzIhDrEHbW1tXC84JAoy6Wq6qWLFy/+pcnBDSWjEp3/mL+RzXvq1CnH0aNH/0RRFMDmltToZiZyNps9c+HChdcpioLM/7llR1B4YGDg6oJbZVmV/Drt6uq6RCm9Nb/W17bKZrNnL168CPhGHp0MxRIGCrz0PNqq2O5Lel9nZ2cnIQQZSAVfmqYNnzt37i9Ytho2skB9ff1iMBjkEZAF97mVNzDnEbKl95d6HGbnv8PhmGWKyraOUl5BI17zSKmtrW1sbW39ZrEoIlNTU/fOz8/3K4oSwP5ggmwq9bJsZX/k+PHjz5Qk6b/KMQju/Od7rKl0wmYHWBlny+nTp2W/32+gzODctdvt7paWlt/zeDzvIoTUlpIGlNLg4uLicyYmJs4zWLuywluWcuxWX8VRoLu72xEOh1HPtGDHN39iOp3+2cDAwPuYgIqzG2ca5DY4MrBXVzKSDWRl1JPrcLvdvy6UiktLSycnJyd/oKoqBHUEDCFgsRIVkkKnVnD7u+66a4+qqqdKCbvJBwEjO7JWJycnvwOjHHNgGbXfmCLIM3GS7e3tmYGBAV4WarP37YLptsEbODSkgWLhcDiqW1panlFVVfXeUhrvoIgPDQ19FKhjiqLMxmIxnv24weEXfDvqpXfY7faHy6VraZp25dy5cygtBJ0D+xjea3xvR8Spggm8yTdAnrtbkiQ4ZAq+NE2bPHfu3D2yLKP+LvRFoxxeBdsMrjdHoMl9RxCEpxVMiDxuUFX1/MDAwFuZfo33l9Nq20M+5zH93dQEfATI9A2hMK5GsFQq9cOLFy9C1oNsN8Oc/5uVsMDPOl76BpnPbgQB3HDDDc+tqqp64yZkASLY8MvDw8Nvq6mpiTzhCU9IlzjYE2uHbLmnFsOwmUzm11euXHlfJpPBWQW5G+827Gf4QDaFfM6RkPCISgvINaZdLuc/y/x/UFGU7ZYgwcvOwgFmOGqPHz/+CUmSnlsonyQSiVODg4OfYXoa3uGCoYULfWaZ2iNw8P+ywMH6EjxDi8ViX5uenv7veDwOGQI6RMpms8VEUYwisNgEMw2H1E4JKub7qq2urs6eSqU8DQ0N7XV1dW+XJGlDyXz5rAkQG86ePfsatldtdXnnfIa8lW0Q2IfyayU/283O/xVlTyshiNbwaTJ/m4xAqEQi4VBV1WWz2Q4cOnQIiBXPKfPC0EQi8deDg4Nfa25ujk5PT1eUT6rMc8+7++7ubjkUCn2cEPLKvG9a0VBV1cHBwcG3QY5hyURRh8MRTKVS4dbW1nglB+HzANzm5uZ9e/fufbDQcoyxWOzTV65c+TLTzwIsACfvd7Ckzn+2LnBSIevyXwRB+KNiF3W9+3Rdn71y5corEokEhJLZ1tbW4OjoaKU6/wFVQp785CdLly5dqtu3b9+3CSF3rTfHYv9PKQ1fuHChB4Zmt9s9BwEFNfwqocZse3t7FaAxi4XjppRGxsfHXx8Oh6eYcSLkdDoXkskkdyDkHflSLH0Luc/r9b55OfrsHwq5h7cNhUL/ODIyAnQDKGiLbrd7nmX9b9esIsBGf3Ijm/1adITz/+LFi29QVRXGqqJgUIpZo02+hwvfSnt7+x/b7fYvFPP8FbD/O9X5L3R2dtYSQqbKEYS2Cuw/nEpb6bzk0f9c6TcMXgcOHDjW2Nj4OUJIUzG8stY9uq7/cnh4+M9kWZ5ZWlriBqSd7kArJQm3VV9erxfGo68XO2hkYk9OTr6J1UQELCKg/mFMCrW3t8cHBga28t3Jd1oGulVHR8eHRFF8Vb43oV0sFvvUlStXAIeO/RZOQg6TV0g3275tV1eXj1L6XUEQGks9GWSyTU9PfzAUCo2xkhKQk2CUi2ezWRi0Yw0NDYmFhQWujO8Uo1whpOQQiXa3213V1NT05OrqaijgJSm7wJw+7+Ww/8z5syV62dGjR+sVRRkTBKGqEALl2zYSiXxqbGzsmyzbC+80PrwMWb7dWO3ypMBy2TD3cknBMKW04JJXqqqePn/+PLJxYqaATXOd0jxHURHNoEchaAdOzJJfqVTquxcvXvwoC5bCGc2RrbCfWjJeySm+ZR2Cj/6BEPKmUo8gk8n8sL+/33D+O53OmWQyyYOiNo1/TBmryLBSAoEAdKKq5ubmjsbGxveJoni41PNe0Z+eSqXeOTEx8Znq6upYKQMAenp6pKGhoV8sy1J3FzoHXddDU1NTXBaHsTiuKEpIkqRwMpnEnsjLp1aULW21eZbR+f9mBvtvRk/N27Be6JqUoX3OUXvbbbfd5XA4YEcsKOEsGo1+ye/3f9lms4Wy2Szs7Jv+Dm+ULj6fz6brOupJQyYtaP6rPRu29Wg0+sDQ0BAg1cEP5sAZvDv8/eFoYpu2322UVgXcb8BWNzY22pPJJJyqew8ePIj99CnlLgOgadp/zM3NvXFubg6oYjyYbCfSuIDlWL1pZ2dnDyHkgQ13tKIDM+w/SyDj8mGl7Y886Rb6goEChPP/6NGj71AU5aWlpou5P0ppLBgMvjAYDD7U0NBgIcGtQuyOjo6joiiiNK+7mLUAjWdmZv5mbm7uiizLaUD9s7J7wba2tviLXvSi7MmTJys9wcZIKjp+/PgrJEmCzgX7TF5XOp3+0XJJx3fzzH+fzxcppMRiOZz/GLjY3t5+h91ux8KW61KHh4dfmEgkRhns/3aISjQOzRtuuKGlvr7+ItuQykKfpaWl+0ZHR5EdMNfc3FwxNWY7OjqeI4oiItKKulBf6fLly6iRAaELghagqBBMAONuxTkQvF7vj4qMztZGRkZeGQqFJjFPBq8DRYRnsxVFvy2+qWzZ2Dzz32azhbPZLHf+76TMf/PS4YBwer3eXwqCcLzQNZ2YmLg3FAr1i6JoZP4XGjFW6PO2qn1ra6ujrq4OqBtHSj0GOP9jsdgoAqw8Hs98NBqF0b8SoN1yWS8swKrK7XbvveWWW75PCCkp4oaqql89f/48YHjNgVeWIlZqZquA/rxe7/QGEFu0xcXFd4+PjyMLF0YRnNuQ14Lt7e3RgYEBnh1RATNddwhQJLH3ouxF3uUPEonEA4ODgx/nyjIT1Cthv1h3wqVqcMcdd/yupmnfZhlJpeoW/dBUKvW9oaGhT2cymYwJ4h+yEjfIxRlkJOq+aZUQCFtKAhTYFy9FZvN4PO69e/f+lsfj+ddSGO4ymcz/9vf3388MxXOtra2LWxiUjexIlFm7s0D65NV8bGzszyORyDgLOIUBjJeaqninSV4TrLxGKKGGc6hgKNNUKtV78eJFBGFH7HY7guIDwWCwIJjESiJHV1fXSymlRQX/rjePWCz2hStXrqAuMmRajlSzLdHm1pvrbv9/V1fXPZTST5aaDggCQ2a5qqoG7H9LS8vi5OQknMpboR+YUW9QOs+lqmr9kSNHPi9JUtmScBhNteUEpXump6f/s6amJl6qshnt7e2KoijnCCGFImhqgUDg3ZOTk0CvgvwJu5lRegvve3d3d/qnP/3ptpGPOjo6niyKYtlg/zk6Ynd3d2Q7lYcxvc9GMh5LuvnTQt7zcDj88eHhYSCDgDe483+r3uFChp5ru1xy9Z3Lv5wsFdT/zMzMmwKBwAALLkYQO2rSG4gZ9fX18WAwCPpsJ322KLoyeoqtra22YDDoikQi1UeOHHmp0+m8r9gO871P1/WHxsbGXhAKhZDtmt5KuPl8x7wV7Y4cObIHiZGlfjac/1NTU68OBAKXofNUV1fPRyIRbv8s9eNK0V8uEKq2ttaRSqVqbrnllvtkWS5LyUE+YF3XBy5duvScdDqNNahI/1QpiFtsH16vF+Wsiy7DFI1GPzvy/9j7EvBIjvLs7rmkkVbSrnaFQJbxxpZ3bdkrdc/YJo7hj0gghITgAFEgOGCDwfbaBttgMGAOmXDaXIFwhis/t23+mBBIMJcNCUfw2lpJM6NjRrdGmns0M5qzu+vXO1RvxrJW0z3q1kyPpp9Hj3YfVVdXfVVdXfW93/t+c3MPiaJYsFgsKaroBr8ibL1XKlOVdr/0PnyjmzmO+yHLsn+stEIotHk8nttp+maQilSlWNQL/C+C3BzHfZFl2Vcr7YzachsbG1+dnp7+fHNzc/DAgQOhcDhsBFm6Yj7qwcHBe0wmE1jhulyCIIx5PJ6bBUFAhJwMGlfdKcXz/AMMw/xNJZ2WJGnV4/Hcms/nMc74AeiPhVWWFq2pKB+qcgDmkWqpqXw+P+pyucBUwWYSm284YdBfIy1qTxlmh8NxMSFkTIso3NLKtzL/SxyxNTUnKpn3290DyZxQKPSnNpsNsvaQd1N8ybL/Jfns5I2J4jqMUBA2Wl9ff5RhmD/Sur2U+Y98maXMAAQf1colR71aoXxw/PjxF7a0tHy+0ijL7TqFyMtQKPR3KysryC2GNRhr1X5k09bKmOvSDofDMUIIqfhQLwiCb2pq6k4qMZq22WwRq9Ua2djYkNP0GGqNxroSi8Ugba6Y/Z/P539OQVEcTrBRh8O1ltYLXeaOXCnHca9jWfbjWrOwwcRZX1//4uLiInJ5FkRRLLL9KeifaGtrS7W0tCDvprxvMtRc03FQzjhEEABw7rnn/l1TUxOYmrvKI05TjoGRLOd6xnyv1p6VdTgc797MRwznr9ZXZnJy8tpMJoM9ebGvPT09sZWVlcw+DyzR2s5Pqo/necj+/6Hah2QymX+bnJz8NN2nYP2VAzUMuR7wPA+5bwSWa37FYrEPLS8v/4wCt3JQi7y30/x5jQqrZwGHw/ESQkjFZIyztTyfzz/scrnuK/0OEEKQW74a4L/czGLQW09Pj83v97f09PSce/jw4Q9YLJY/13kE1paWlv4qHA4j5WFqZGRk14w0Gtg+wzBMr5q2Yy/udrvvFEURam3woeHbhW+Y7EOrWt5mNf2Qy+rF/A8EAm/z+/341hTz6RoY/IepQMZDCiT0BwxYRVc8Hv/I3NwccgoXwf+jR4/GqhjIqajNciHq+wHwDx+7Kv/Ydg8SRXF+aWnpg7FYDGQsgPv4HsJvhvcG51g5t7Sh3h9VRt2+cJG5KudWP3bs2EtbzMkAAAAAIABJREFUWlo+okUg8U5tI4SMzs7O/m0ikUBQiqxUUs1viwam1LwKBMvim3OeljVT5v/JaDTqLQkOrWXwX+6+rHrXbLfb2y+88MKPmM3mV2hpmy11Sblc7otut/uDdA2Vg433/Tzlef5VDMOAxFvRRQhJer3e19O0gtjLRFtaWsLpdLp0H1NR3VW6yTIwMHCt2Wz+otLni6I453a7TwqCgPMsflSlsdML/Jc3HGD//1elEu/ljAAp2cnJyZcSQvy5XA6bNHyMjcCmMh0/fvw8u91+Wst8m6X2wssxPz9/bTqdnqJ5vavOTL3qqqva0un0JMMwPeXGdru/x2Kxe5eWlh7dzN2UY1l23Ww2h7LZLA4uMsO7phZVCnSfUutQRd7alZWV20OhEORMNgRBgKNKltYxNGDgdDqfKUkSwP+OSubA2e6Rmf90M17vzP+iGS644IKntbe3I3pOFaMb4H80GnUJggDgGvNKlqzXckhqoi6a0/JqrRsjy/6DGQAmGWX+19S7SWUvkRfRcurUqZYTJ06ctFgsH9AqCp7aNOLz+f5CkqS5VCqFeWTUlCRaT5G6qI8GsI0zDHO0kg4h3VAwGHyX3++foBLsMYvFUkzTMzQ0lDEqm+aiiy7qs9vtCHpRJFkmCMLj4+Pjd1JHKxjRcaM40ioZd/keKk97EyHkn3ZTz3b3SpIUWFtb+3A4HJ4WRRH7/rzVak0XCoWiQ66zsxPSe0XHEPZUVQYetO6+VvUVU1lgHl9yySVvsdlsb9tNxaIozrjd7ltkxicUPkZGRrLVkt9zOp1/JknSj3bTp+3uRfqxqamp6zOZTFF57MCBA2upVEoO6Kmpc4jWfa9ifXBmgon4YrVtSKVS35iZmfkXKmGMgHgjKAWetZuXXXbZpaIo4rus+RUMBt+8srKCc0W0tbUVZ6l98a3S3JAGqJDn+ecxDPNjrZtaIvsfs9vtgUwmI79vVV8bsSd54IEHIAFu7+joOHz06NF/NplMz9XaBlvqW5ufn39BLBZbon5KgIQVBx5deeWV9mw2CyBSDbFEDAQC7/D7/Vg3kA4Jcu4Yl5hR9+J6Mf9DodDblpeXi+A/ZbYa2UfCHjt27HBrayvW9HOUzvNoNPr+lZWVYhBYa2vr6jOe8YyY1+ut+dQvkPonhNxKCEHwkeoUQVvtg4CZubm5d6ZSKdmHDn8z5kO8vb09mUgk8H/ZLlVf35SOr4blZCUxBJYc6O3tdRw+fPjLJpNJtUKTmjYRQhaCweBL/H4/QGgAgPst8KKcuZDW5zdap5gulf2H7xPk2/X1dTmFVrk21cLfLQgAzGQyR84777wHtLbP1g5Go9FrFhYWQELD+VAOVKkFO1StDZv7TuDCV1XYACkcDn9waWnpV1TuH+sysIzo0NBQ2og+Rfjqjx8/3tPa2gpF0XYldgEZenJy8gb8tlgsgcOHD0NdSzHRQk/wv8hw5zgOALdaaSolfS+WCQQCt/j9fkwkmU1V85sTgC9DQ0PmeDx+K2VDKe6v0oJwdkaj0TdRRlQxKmRkZCRXLScc2s3zfD/LsqcIIci9pura3MyFPR7P9blcDpMbeRsjkMLv7u5O1eqGdHBw8EUmkwnMbFXvmSRJK6dPn76RbijX8XHNZrM4pBlB2WLHcb300ku7rVYrwP+nqZoAZQpT8P/NNApXzqtcr7L/sjVMHMd9h2VZVUoaW2T/6xr8dzgcnyaE3KzlXENdc3Nz18bj8fmS/LHYgNQU+F/S52LEa1dX1+He3l7IIGsaCZzJZD5OWXVhp9OZfuyxx4QG0Kb1jKtOfYODgzdsHuIhC6vqGya3Np/P/44y3iHHnkLAXi6Xi/T392+43e6aS9Oj1MpglsTj8a+yLHuNkntolO4NVJps7ejRo9F9AP5Ddv0LDMNA/QsAs2aXIAje2dnZkY2NDUQ7CxaLJSsIAoJ/sQ6v9/T0bBw7dizfkIQsb/KRkRHTV7/6VVs4HG6/4IILvmkymcAqruiSJMl/+vRpyCnGm5ub1+i+FY65ioGOihpCb7riiisOFwoFzaUvqQrZzfl8Poo9QFNTUyCZTCIfvWEkk3dj12rdy/P8PzMM8zq1z08kEp9fWFh4kGXZGNKC9fb2RqsoQ662+U8pPzAw8DSz2YxzjubX0tLSjQioouoIquUkNW9Qo0LdLOB0Ok/QYHxNnyEz/61Wa/F9q0HVwqI6KRirzc3Nh48fP/4l5KzW1AhbKsvn859xuVz3dnZ2xqLRaIYQUvE5aWBgoNVsNoP4opjVXCgUHvN4PCOQyZVTSTY3N0fW19fBSDTkXlwv5j8F/5FWEbLWAYfDYVTZ/+IspEx4+N0uVjrHw+Hwu1ZXV/9bPrP09fXFZ2Zm8rV+todS3eaZ4J2EkF0D/4SQyOzs7O2JRALvGgKM4VNct9vtsUwmA8ATe9v9IPNfdtpgjnm9Xuv6+npLe3v7wNOe9jQoyhwse+MuChBCpmZnZ1/U1NS0tvnONhQAtthSD/KTDP4nEonpLQQyvAeGuHDmHRkZaTrvvPMu6uzsBIlDt0sUxd9MTk5en8/nAVAnYb9aX0N1MwbDMA6H40WEkO+pyW9f2h5RFBcmJydvy+fzRfWVpqamMHyKfX19UAMwAv57NvOaOY77AMuyb1Vif6he+ny+1ySTSQSBBrq7uyOBQECxr6Uih66ShtEypoGBgSvMZjPA+V1/iLd7biaT+ZfJyUmwigBiASBV3HkV/dCjKNj/T29paXlMLXNXaWMKhcKvJyYm7qC2qXo+So7j3s6yLJinai9heXn5TaFQyEudvHG73R4Ce7CE9a+2Tt3Lcxz3ZZZlVeeVyWazP/B4PJ+2WCwZuvHG3EZfEfhg6MhSp9PZIUkSIs8V50tWMlBbmf9Gl/VU0meU4TjuL1mWRR5lxdc2zH8jSDYp7l9pQZ7nIfuGXK+aXgaQ/d/a3yLD88ILL7y4tbX1lyzLHtDQIInFxcWXRiKRKSo91JD/19C41aoKgVo2m22GENJWaRsikcg9i4uLv5XT9JRIcxldRpg9ceLECy0Wy/eVHGIIIenR0dG/pt9xACpG2quqHn6wbyRJgtzdbVqn+Mnn8/81MzPzjzT9Ew572PMnm5ub49lsVnbIwZndSEGifOSK34eenp6j3d3dyKFbkToXDqSjo6N/K8urd3V1hW+55ZZ0FYOOwRbH/FAsd6vEZKIoLrpcrltFUUTwSamCkmEcYEr6WWtleJ7/yOa7jiBfVVcikficz+d7kO5PAP7HjAz+I+d3U1MTzoOaXz6f75XpdHqFKs4FhoaG1o3IptHcMHVY4WWXXXZcFEWoMWp6lcr+2+32NZoepdbyhcuMVXtvb+/RI0eOfJNl2Us1NcSTKxOSyeRJr9f7Q3wfh4eHsw888EBFqTgvvfTSc61W66Katq6vr39uYWHh30RRBOs/arVag+l0WvYrVSU4T037tyurM/gP5n9pWj8jf9uxD0IgruLAORoAgbMbfMdyEFgtB4kg2Bgpp96rJijmbHMQKlY+nw8BxrKiE/aR+Df2fPCZYT0zgtLwbl8zNfeb+vr6rF6vt/X888+/sqOj4xtaq7xubYwoio8uLi5eF4/HI06nM3vq1KnGmFAj8Tz/mc1396SaASxXtpT5L6dFoUoYRlsfgUk2XXzxxS9obm7+Jk1dUa77Ff19Y2PjnunpacjcI4gIwXb7co4eP368raWlBcEWfRUZEhMtmfzs3Nzcv9PURViPZXzM6KoK7MUXX/zM5uZmBOkpYf8LMzMz1+RyucVCoRA8cuRIKBwOY24p2svpDf4Xo2s5jvsZy7LPrnSwd7qPEBKamJh4qSAImAAhp9OZOnXqVK0yMJ/UFciPzczMfJBlWWxYdLlWV1evi0ajv6PS/7J01Z4DyH19fU1tbW2IUDmitqOFQuG0x+N5J83nik0XHOfYkNZsxDLNyYb+Hlbb30Ag8Fa/348FAOMlS/6D1WZ4WSOn09lCmQYXqLXLTuUB/ns8njsFQYDkL5gGhs7pqcI2Fp7n8T4o+VgUq11aWropHA5DXkZ2Wtcz+P+GTWnET6qwp6KiOGxEIhHk05IPxlVPq1Km4fgWy2o832JZFkCkZlc+n3/Q5XIhx14xurVEBk+zZzQq2lsLaJCXKzI+Pn493aTj/SgGaA4NDW3UA5gwODh4jslkAkOyRcnIzM7O/s36+voKHGldXV2hUCgkSxUqud1QZXieR5Dn2zVutJjJZH44Ozv7ZVEUc3Q/WGTi0B+sO7JDTtEBSOP2Gb06U29vb9OhQ4deZbFY4DSqJGC78MQTT0CWHWMChzHe+WoqMMHpjTaoPneU2W963W737aIowvlQVJoaHh5OVQrmGH3i7FX7HQ7H+zdTybxD7fPW19c/tri4+ENBELBXVp0fUe3z9qI8z/MA/xUzf5W2ye12X53L5eCkDHd0dAQMJumqtJuNcgzDXH755ecKgqAKRFZiuGw2+7DH44HsNoAynMfxu+YCPmlqNHznms8999yjhw8f/gnLst1K+lhJGUmSpjwez3BJKs6K0qRR9hwCT5Vegs/ne20ikZCV/oIdHR0RnueTRt6LN8B/pcNfJIrcxrLsJ5Te4ff73xgIBOCHPOPjIIQUapW16nA4/pwQAqXVXauMiaK4Njs7e0eJ1D98zdjr4Qdn2YbM/NknEgKJLR0dHa1tbW3Hurq6kKpJ1xQAgiD86+Li4lvW19cRrJhtKL79fnAcDsd9hBCkG9TsKgH/p6G+jJ9EImFEHzL8oZirdo7jvqJWQVeNQSVJwnnx5VQFKV7NVHhq2q11WY7jLmdZFmTwSs8tmcnJyddmMhmkD02azWaw/uFz3qjlb5NSO1LcEPZxKrlnbW0N6cF/J+PfJYElZW/XG/xHA9jBwcFrTCbT18q2psIC6+vr98zOzn63JALEKNIPbF9fX9uBAwdcLMv2Vtj9HW/LZrNf93g8H6O2wYG+KtHXDofjJYQQyACpvlZXV+9cW1sDWJmB3D9yBqfTaTgXa+4wKXducHDwJSaTSXV/JUlanpiYuLkkqinQ09MTueGGG6qWN1X1gO1wAxgrNpttTOtUIFtk//cT+A/n9k8YhlEsWUiZ/26TyVTM12TQjZuiaclx3DUsy35dUWEVhWTZ/y3gf80HnUHu6oEHHrjSZrNhg6HZJUlSdGpq6mqahzIyPDycbgAhmpm3KhXxPP9zKEZW+vD19fVPz87OguUERwlAF2zSDc002mILM8/zP2UY5o+V2CgWi71neXn5J9iod3Z2BqPRKBxKFTG/lDyvWmUcDsdbNiU3/0FrtvXGxsbXfT7fAxT0x1qL9E/r+Xw+3t3dndzMZ4t9/76MqNdorNnh4WHTI488Yj/nnHM+pzSlxdZnu1yuv4bEIfJB5nI5gA0IXK1aMAbP88gJqmmwqSiK0y6X6w4w/5ubmwPZbBZrm+HTcmk0j3SrplIlp3g8/rG5ubkfUOaNDEYaxU+wrT15nl9gGOaZWhv7iSeeeKEsC26324Mcx6WMDBBqbZ96qu/EiROHLBYL/EKaXqXMfxpsI/ueqvYdKNNBBADY+/v7r25qatL8vFjybJLL5b7g8/nug1QtdVqrlv93OByvJ4SAya3oopL/70bQJAIxWlpaAul0GgEZinPEKnrQHhfSE/xfW1v7NZW1RrCYTJza4x5q97jNPMvP28yz/GOlNa6srNwSjUZdsEFbWxvSGtVsakOe55GqCiCzJoqGfr//jkAggMBuEenqBEGIt7S0xNLpdCnjX6kp92O5ItEEa+r555//Rx0dHcBnVKf7VWO4QqHwHQRs0DHCumZ4spya/m9X1ul0vluSpHt2W0/p/RT8PxmNRnGuwvlODigzGvMf3Sqq/zzzmc98Zmdn5+9Ylu3U0lYldUnxePz2ubm5/6S+MHxP9p2volI1bNmOmUzmBzMzM5+R9zFUARz+5lw9+Jvhn3/ooYfey7Ls3UrmYSKR+JTP57u/JP2wPK/K3r4X4D/T09PT0t3djfxJg2VbVEEBQRA8iAYxm81rbW1t4aGhoYyBJgLyPHyIZVlNo7NkMyLX7NjY2CtL8sbLDPIKLF35LTzPP8AwjKrc5HhaLpf7pdvt/jByklmt1nWav1Nm/dfsx4bn+S9ukqyvV2uxZDL5Za/X+yAk/00mUzifz+PDikAHQzuqZDtA7cLr9SKauF+tbXYqv53s/8jISDXlZrXs3k51sXT9UJQnBhUB/A8Gg26bzRbE/BoaGjJ0PrudjKMj+A+ZsTPMf6fTmTCI4kxRjYfn+d8gMFjLSbqxsfGp6enpzwPk7evrWzd4/iUtTWO4ujYlIiH7jcOdvZLGE0IyPp/vZDKZBNCCPQe+Y/hu4981HySjsM/swMDAC8xm838oKZ9KpT4/MzMDx3LdyoQ7HI6/J4QgL7emjp5kMvk1r9f7HYDIFoslJwgC5pHMxMG/sT/a984eJfNQQRnLRRdddLndbkfwj2q5fJoSB2tHkRFP3/mqBbnwPA8n7oUK+q24iCAILrfb/RYK/q9ls9n9ojSl2EZ6FHQ6nbdJkqSYvSi3Acz/2dlZpMeSmf9YOwx9puJ5/ncMw1ympZ03WWKp0dHRvwGrBkFqhw4dCsViMVmmVMtHNeqqAQvQNHx4FzS9ZPDfarXGKdsN713NAs0lCgD2EydOfGCTYHKrpgbZUlkgEHiJ3+9/rKurK16JAhTHcR9jWRYpPctehBDJ7/e/NRgMuui3GN+qUH9/f9LtdmMNNOylJ/i/vLxcT7L/zHOe85yuVCqFc5iii6obzm5RiKy5PTbHcQdZlj2tRSCcJEnJYDD4odXVVdSHcyoCOrE+Ro8cOZIMh8MNqX9Fs6dYqJhKDD6EY8eOXd3a2vqlCtXEFD8xl8t9ZG5u7hNgBpd8b/Zc6Vhxg3UuyPP8mxiG+aiWj9lG9h9nPCMy/2WzwCdqHRgYeLXZbEZAnS64KIidbrf7JXQ/hPlplBTlmkyfK6644nChUJjfTYBWKBQCgeZ/LBbLBk1LJs+9Wk5Ho8p+J06cOGGxWICRlb1yudx/UHw03NbWtnbs2DHFOIQuk3xrixHN8OCDDw5brdZv6fRiZRYXF/8+EonIUta1LsFcaiI4kK8wm80IjsDHUvMrEonctba29gOwcehGZk9flCuvvNKezWax6VQblUmCweA7V1ZWnihhD4Z7e3vjy8vLNXuQxAByHDfFsuwxlYMprK6u3hEOh2cEQUAED8ZLdp7WbKCDyj4yPM9jYTuh9r6dylPZ/zcLgoB3fw25Zis5VGvZpr2qS60899LS0sl4PO4ym81F5n89y3o6HI5rCCGaMzkWFxevjUQi2MggKj6YTCarllJF7Tyj0YVvYFn24xp/j9Mej+fPs9ns0pEjRyLhcBib27pZt9Ta2cjldyvbLknSisfjeYMkSQmWZWPISUWlX+vqwEOD2fCNPlRuvLPZ7E89Hg/yURZlNA0UMFSua8W/8zz/CoZhsMfX7ILjOpPJ/D+v1/tVURTBGsS+D2vtGeB/eHg4b6BgX81so2NFRdbOwMDA281mM1K5qDonBoPBN62srDwmy/4PDw8nqzk+HMc9zrIsr6W9StJMYR7KSlN1tbZpaS+t6uJ5/iaGYT6rtr5EIvERn88HFZrS/MVGB/+h3nSVWlvsVJ4QEh8dHX2FxWJJ4HwgS2rWo0KNlnYzal17AP5j74cgsMjIyEhuZGSkVpn/GMJiYPR5553X29nZOc4wTKte45rL5e73er3vyefzCIrAfgb7GsUgFc/zUDH5CyXtgyqbz+e7JZvNRmhaRIwHlBgMr1TTAP+VzIAzZaASiUBZRWnKfD7fKxOJxLLNZguVpKmoWhDndj2lgBL2mkdVWWKbwjhrpNPp+6enp+Evgt8C+7mY3W6PZTKZeENOviILQ93Y5vV6EVR1k8Viwfl312kZdmhJIR6PXz83N/cwBaTloPCKGm/0m3ief+Omb+IftewHwP+VlZWbQ6HQDCV1GB38h3lM5513XndnZyeCfrq0tFdpXZFI5KbFxcVHOjo64HevC6l6pbbieR5kWJBiK77m5uZeE4/H/XJaQepnVpznvuIH7+2Npk3cYoYQcn65x4qiuDQ2NnYtFNHz+Tz8ECAKYy9Z9lLl1Clb29kLsMePH39GS0sLIk8P7qKes96ayWS+Mjk5+SnI1NGor5qVhN/aCafTaZUkCZv55+thG1EUfR6P55pCobDa1dUVpcoIOIQpPmzspl08z39k84DzZrV1SJIUmpiYeD3LsukSMBw5gyFDWHMRqHL/BgcHeZPJhA2pqmAOQsjG1NTUtYVCYV0QBESGATCRD2l7MlZqx6iS8nqB/+Pj42+2Wq0JGlkHJ1/d5lQutTvHcRzLsgiQUXStrKzcFI1GIfsfqnfZf73Af7AbU6nUHI0+LJUFNMJ7ilQ8/SaTCcyxipjdZ5tosVjsDr/f/zBVLJGdWormZaNQbVigr6+vqa2t7be7UWrK5/O/crlc76M5qGS2JeaDoQGXbUYIDjWAMH9UbvSgwuR2u19bkne6bhR9+vv7n97U1ASHuaa51TGPNh1HHxYEoUCl3orAf1tbW+zw4cOp+fn5inLmlhurxt8Z0wUXXHCkra3tlNqUZLFY7J75+fmfYf/a3t6OtEJVlczVCfwfHx8fh9oS9uc4dGONa4D/Or84lYL/0Wj0/SsrK0i5Usr839MgeK1NQ787WoP/sYmJCQRxJS0Wi5zOot6ca1oPhWHre9azntWez+exD9H0yufzP3a5XPdS8CyQyWSiUIOq1XzhJZ0vBr6dOHHiTy0Wy/cQDKCpYf63snwgEHi53+9/4siRI1G1gdI8zwN46VPSNkEQnnC73e8SRRFgP75XOK/KaTONcF49azd1BP9BmPqNLPtfJ+qIOKuAsKAoVczk5OTLMpkM5krw4MGDoec///lVDeLcbhJUqrC6XV2ZTOb7MzMzAKdw1sC7gncE+4V1p9OZOXXq1L6T6VayvigoU2RWd3R0tJ533nmfMJvNr1Zwz26KZDYl6f9+YWHhlzSwat+eEXUG/6GoViQoGn19hPLPc5/7XHM4HH6Z1Wr99m4m3073ZjKZb0xOTkKJoZQMY+hvsFJb8Tz/fxmGeZXS8lvLIYhxYmLi1RQPlPcxCL4H1ltPF+twOL5MCLlOQaeEJ5544gVWqzVmtVrXSlI5lZ1TewX+ow/mwcHB75hMppcp6FAlRfLT09N/sbGxgTx4WJCMJFUH9v+zzWYz8jGpltlUYKzC6urq69fW1n7b1tYWotIQe7KRufTSS7utVusUwzAdCtpZWkTw+/1vCQQCuBdONbzsIbD+X/e619V0BLmaqOzSDqfT6X/zer2foxvPyIEDB4KpVKpuAAK5r3qB/x6P504a2V5kYg0PDxsp/YfK1+N/i/f399uamprgYEeOrbIXwP9gMOihsv843NWTFPeT+r9Xsv9Gk1AcGho6sL6+DgfS08tOGBUFNjY2vjg9Pf05OXBpZGQkU+NsHxW92x9FL7/88qcLggAVpbJs9rNZZH19/dNUZjlBc39XXf5bp9FD2pUvsyxbdqOOw8vk5OTfS5K0SgPU6sIBy3HchSzLAuzt1dLGhULhd8iNm8lk8H0qZfwjMFL+ZtUUE0nL/le7LgQli6J4L8uyt6tpSyKR+Cefz4c0XzLLuqpKbA6H43FCiF7M/zPg/8jISLbxrVMzU9SX3QX4/76VlZWf0mBNON7ihJCCAcDIsxpJL/B/dHT078Caa25uLk1n0Vhn1U/Xmr9DR/D/4ampqfsoiQHncayTcNKWdUpW22hQRhsZGWkeHBz8vslk+hO92lMoFH48PT395pLUjorY/1RtSrGimrwXR+5ys9kcomoecqokvbq3J/XqCP6/jcr+F3NaGx3cKvG9gdk6oGRwxsbG/gppjZqamtZyuZycsq1mvgMOh+MdhJD3K+lLuTJgUPp8vrdvbGwA7M/TFLP4d6y/vz/jdrvxvtWyakm5Llb173RNtR4+fPjIueee+xWWZXUhOsqdlCRpemFh4RXxeBx4ELAgBHruu/HTC/xfXFy8ORqNwn8opzA0suy/PG2KaSpoOi1NlYnlB4iiuDg2NobgWthNXlMVf8ur+hLv8uEcx42zLHtppdVks9l/93g8n8b7DDWapqamUDKZrKpvodK+lLtPzTl3dnb2b9Pp9Bx8ij09PVG/3w+8tOw+e8/Af0TWXHzxxZ12ux1gk7lc5yv5ezKZ/IDX6/1Wa2trqKura31+fl7RZrqSZ2l9z/nnn9/R0dEBJqamuSnldqbT6S/Pzs7+E5Vgk6NldP8Ychz3OpZlkQNW1SUIgtftdt/OsiwcNGBzY7Gsedb/wMDAH5jN5kmlQKxsFEhOzc7OviaRSARovsW6lPxHf/UC/8H8p1JPsgwrond1n+OqJrZOhR0Ox48IIX+mpHrI/ofDYaiwhDo6OgLr6+t1C/7ryPy/Nh6Pz9tstnCJJJ6RcpmDBYAo99cqmTNKywiCMDY+Pn4zBXyxuUVQyr7Y3Cq1Ua2Xczqdz5Ik6Te7aefy8vIbQqHQFM35WpR9rVdmrNKNOiEk6fV6XwvFELCFe3p6YisrK0Zgw511KgwNDTWvr69/V6kErdI5RQhJe73e6zOZzLooilhXcciLgfGfTCbhzNnXco5K7bjLcmxvb++hrq4unxrFto2NjW9NT09/Hs6Ntra2AD2gV41lrRf4T/ebUZxpDx8+HF5eXjYEuLXLOVHV25WutVsbGY1GAf7/zGQyyfs1nIENne/a4XD8khDybC0HhBAS2wr+j4yMbDSCWrS0cu3UpSP4X8r8XwPz3yjgPx0d8yWXXPLHNpsNhBxVCo5KR5cQkpqbm3vp+vo6vq/YH8NfUfYM6XQ6j0AVU8lzqF/p1YlEAiA2gk2D9ZQSUS/wPxAI3OX3+3EGKqoXXXjhhclTp06VHRslY1LNMkoDxjBvRkdv+qcsAAAgAElEQVRHkVYCQWBQgAmPjIykauU7QNUu/1tpCoOdbI73cH5+/g3xeDxosVjyLMsmC4UCfBcA/lNut7tqe9dqzhUdno111Hbuuef2HT58+FGWZTt1eMaZKiVJ+t3k5OQ1uVwOax8AsX03jnqB/5D9j8ViMyWpoXA+r1k1ZhXzzMxx3B0sy96n4h5VRdfW1m6KRCK/slqtwY2NDZxDFMm0q3pIjRWmBMVd9TMQCLzF7/dDXRL7GNmnCOyi7jCeyy+//I8FQXhEyTD6/f7XBwIB2EVWIFSEe+0Z+I9OIGJ1ZmbmhyzLKgKplHS8tEyhUPiviYmJN1HWIXKMpWtls6KgLyaO497GsqwmkYzbPC/r8XhekM1mkS9jT5QRaD65UwzDXKCg/08qkkwmv+L1eh+wWCxZQRBwcJQPL4qiWtQ+T6vyHMe9kmVZ5IxS9W4JgjA5Pj5+p8ViyZXkSI7WI3NWR/D/Thqxu+/A/8HBwfeaTKZ3KZnHKysrJ4PBoAvRcw3ZfyUWe2qZLbL/mG9JQohgJCbZwMDAn5vN5v+ozAJnvavgdrtflMvl5O/MvtjcamzDqlbH8/wnN52Rb6i0EZB3HR8f/1sqzxVpbW0NlBxyykakVvrcat03MDDwLLPZrCRYIrO4uIiD3yRlVRo+IILn+X9hGEZTGUcAUMvLy3eFw+EVOOMEQQDYjz0gfuTUEXV34KvW/C3zXMvg4OCnTCYTcq0rurLZ7A9mZmY+WpISB9+AqjnedAL/x6nSlMz8x169wfxXNEMqL7Qb8H9hYeGnlG0TdDqdsccee8xQ+7WtVtML/J+YmCgy/y0Wi8z8b8j+Vz5la/pOPcH/qampe43I/KcDxvb391ttNts3WJb9G70GMZfLPeD1ev8hn8/DJycHJO24t3E6nc+UJAmM1rKXKIrTY2NjUO6B4x37TVlu2DDEqJ06OTg4+FyTyQTVKU2vUCh01/LyMvb0GJeA0+msF/D/hwzDvLCcsSRJCpw+ffraLcHbNfEd4Hn+vM0+IC1dd7l+KPl7Mpn8ktfr/VcaDAjgBO9JtLe3N7m8vIz3pHHWUGJIZWVMPT09zS0tLc9ua2uDzVuU3VZRKTGTydw7OTn5Wbq2AjvYV0QUvcB/mfkPkg98yOvr6/VC8mEvvfTSXqvVipQGzRXNujI35fP5H0xPT98DIi7ScIdCIUVgrR5t2as6eZ4/yTDMZ3bxPHFsbOylVBUb+6TV7u7ueCAQgO3qzqdIv3FI0VP2CoVCUCn6hRykR5VOyir0qAIoy7aifAGwDeFE2s0k2OkpgtfrfUkul/OW5Bw2SrQm29XV1drb27tcgUR+ectDJzWV+sTMzMyXZSCdEAKgWbcXh+d5OBG+qahxJYUkSQpPT0+fzGQy+KBANjhMpcpk+R61Ve5ZeZ7nkSfuxWofmMlkvjs5OfklGqFYKpdabzmS9WT+nwH/aXR73X9U5XnGcdzzWZZ9WMm8k8H/OpNs2rbrOjL/rwODFzkB29ragmA3GhD8bzWbzQAvFKWLUDK3UCYSidy1urr6U6oyIzN+GgdopQascrnN7zZS7RyrtBlU2gybfXyvt37LKq22Zu+76qqr2tLpNBxG1jKNFNbW1qCIcFoQhGIuTSOnpqEHuo9rmaqKEJJPJBJfXFhY+AHLsgIF/mOtra3RjY0NsAvgjCt7sKnZyWLAhvE8/8cMwyiKQkf3CoXCrycmJu6mTlTMcxnU0O2ssZNZdQL/JxCsS/soy1rXdGCyAafeU5rsdDpvkiQJzlxVF5j/FPxHOrVAKpUyvOy/juD/KwRBwForB1HjO16Vd1fVIDcKq7aAXuB/Npt92OPxgD1XdNQaSfa/xIimEydOPNtisQBc1kWtFD64hYWFl2YymUmwq4eGhtKPPPLIjgxKnucHGYYZVTLY1K8EhTf4Qkolmo3iF92xm3ox/+FQX1tb+7XJZAJBIpBIJOpB1hq+twcZhimbelcQBOxvoKQJlmWRUVgrZLrd5o4unVCFQuHx6enp90qSBNWmDA1WwlkO/cZ+ruG3ULLQKC8DzAkKAPaBgYH3mc3m25TfWlnJeDx+7dzcHBRcMKb76vy4F+A/VVaoF/Afk8xM15hXVjbjdr5LFMW56enp6wkhKxTXqifbbdt5nueh0vJHldpTkqTYxMTEqyj4LwfcV9WvUGlflNyHlIuSJEHVoKxvPpFIfNTn8yGQSk5RtPHII4+UDXLac/D/+PHjB1paWpb0ArhzudxDbrf7vVQWArlBDSPFiLw4Dz300EfV5thUMplQRhTFJ8bGxhB8ETxy5Ejk1ltv1VXOj+O4X7Isq1qWMB6Pf3RxcfFnoihi7DCGcrQy/l+zmzGe53sYhllROh4l5cji4uItkUhklsrbhg4ePBiOx+N4+cu+xBU8r6q36MX8p0ys4mFlv4H/l19++fk0T3dTucEtkf3HexWql6j27fqtF/i/uLh4XSQSgXz3Vmnjcuavpb8jX7mXZdnztWzUxsbGt6enp8EeB/AD8BfO4wZgp6WRdarL6XQ+Q5IkqDZUfMGhMjk5ebcgCCma/gHrDA449ToHENT6PUJIHyHEQgiBo/gpUrEsyzKBQODetbU15N0MHTp0KBiLxfBuGO4b73A4BgghjykIeFA1j8Aa93g8APcwV+Cwxv4Pzjg4XzOQI9UzYFVVY/dJ4d7eXntXV9ciwzBHlHRZEATP+Pj4rQB8Wltb16qt+qET+D8+Pj7+Fjo3V3t7e6Ove93rcgZSmlMylDVXRgPm/xnwvyH7/9ThJYTER0dHX14irRkmhGw01tyaexU0aZCO4P+PPR7PvRT8X+vt7Y0YkEXLOp1OuyRJSON4riYG36aSeDz+zrm5OZBGZHXLHQkfHMcNsSz7cyXtiUQiH/T7/Y/SYJ7ieb+W5NuV9GGnMnqC/8vLy7+Wmf/0/GL4gAmHw/GFTdDp9eXsXigUfjMxMfFuvL+UUQjwP1Pt/Y3D4XgNIQQEtl1fCLzx+/23B4NBqGgAFIbvsCj3T4NwDHcu27VR9q4CS3d3d2dPTw9SHT9Tz8dKkuT2eDzDIIT29fUh9V7dEerOZj8dwf9botEo2PHFb8rQ0FBCCeCo5zhrWLdpYGDgL81m80N6pPxBSsP5+fm/j8fjXvhI+/r61ut5TtI9JjDf9krHSBTF5bGxsRvhS4ZisUFT7arpPnyK3yKEnIBPkWEY+BW3TT+VSqUeWlxc/H8gIlKfu6I0znsN/qPzJp7n79l0eL5TjSWUlpUkaW1+fv5V6+vrAFLhNDSSc5V1OBzPJoT8Qml/VZYrrKysXB+Pxx+jMmNwqOoixzk4OHiFyWRCtA8mrporOzc3d2M8Hg9YLJaU2WyWWf9ydFTNMhB4nv/gZrDJ29R0FmUB2lJHIjYlcoqDumXM6gX+g4m1RfYfkbv1Cjg9aZr19/c/vampCXlfyjrol5aWbgqHw+4SJgDeLcMfbLd77ziOu4am4VD7Wu5YvkT2X2ZTyDas2fVpmw5hg4E1+kotjSMIwuMej+d2uhmRgV8cpI1kGy1NYpi6eJ7/PwzDPLqbBufz+f92uVzvs1gsCTDcOzs7Q9FotJ4DQLCPxj6njWGYLoZhOi0Wi10QBGzWWYvFgm+8bFJ8j2AL7E33JP3SbsZyu3tpOifMETDQNLsIIetTU1M3UMWnjNVqTdDcm4jwBvBvaJluzQy19xXBGfIqs9n8VSWPhvKH2+1+nSAImONgfSKAo2oywxzHPc6yLK+k7UrLCIIA2f+30D7KufYaErFKDVhhOQ3Afzj3sSepaiqKCrv/pNv0Yv6Pjo5CsU9mfDbAfy0Gq0br0Bv8t1qtMaSPOHToUOyGG24wYloUU39//2VNTU2V+LIUjXqhUHhkamrqrYVCAetSdHh4OP3AAw+c1W8xODh4DiHkzwVBQGBCez6fP8CyrE0Uxac4h6PR6GOJREJW38Fv+JXqRqFmr2T/afCp4cFgnuevlCRpMJfLHRBFsV2SJLsoimaTycRI0u95Vfh3JpNZXl1dHcP7Kyv4VTutEcdxR1mWhdz/0xS9WGUKJZPJr83Nzd0viiL2bfDfRNrb2yOJREIGTxr+Ci0MvX0dODNbL7nkkqtsNtu/6yz/j/M3pNZvz+VyMhmlLv2dW02tI/h/M8B/m80WpkBsXbHXL7744gubm5ufYBimVYdXgITD4XcuLS1Bqbf0m1yzxNbd2GBgYOAPzGazC2ofldYjiuKsy+W6VRRFzLNgR0dHiOf5ZB0FnGxnGpCIDlBMB7hOi8VisQiCgO9SKXaPeQOiDPZ28CkqwnP2HPwnhCCXVl9TU9MplmXhLNX6EsLh8G1LS0twTsIQOMQaJtLr6NGjzYcOHfofhmFOaG0Y1FcoFH4xNTX1JovFEshkMnDKaS5tBMkKQshvCSGqHW65XO5Rt9uNiPEc3XiGuru7o4FAQPN2amxfAGnYmF6usl4SjUbfv7CwgMNlGh9TsCUhI65XYIbK9mleXEfw/80UMJDlKvcN+E8BGTBKkQ9tx0uW/UcEHfI11Yuk3Xad1ov5D/B/U06syPynGzg5F3U589fU33meR3Tr1Vo2ShAEr8fjOUmlzUtln7V8TKMuHSygBbMil8v9lH7D18EawUb95MmTVWeN6GCuM1UODw+bf/7zn7eEw+EOm83Wkc/nocCCzXvpRh3/xg8UjPB9jw8NDWUMdoBBgOrXCCHXaGlPsEvn5+dPxuNxAMZ5fMcR+JnNZrFHldM9NZxxWhpdRV2U/Q9FkIPlbkOUPoI4JEkKFgoFWRK/agpsejH/qdJU1G63r9KzVE0rk5UbNyP8XSvwv7+/P+52u3UJfN8rO+oE/p9h/jc3N69ls1mZQNFYe/dqYPfwOXqB//l8/uGpqan7NlUs44VCwaiy/xiJYmAnz/On9PLJwQfn8/lelkgk5tra2kLU91MuWFoONoVT+BB1rJssFgtyJRVnkMViIdRRDHATwU44q8qpk/Zwlun3KB3B/6Lsfwmbri5k/ymTFbmsD1mt1q5CoQBwAenK5CDl4jpPA5Yxb9BvzBv40au2h7vyyivt2Wz2p1oRFSC97XK53iiKIl4WGTgp9nNkZKSh4KTfK1usGTgQLuRVHxwc/JjJZAKrV88rH4/Hb56bm/tRV1dXfDOtB+ay4YN5yhlMb/Cfrg3BOmP+MxSHg+JPWX96uTHY7u+FQuEnExMT7wGQ3dnZGYxGo1iD6nI+chx3OcuywLfKpcU8qykFQZgaHx+/naYBD9JUE/VMKJL3ni1QTKA+xRar1WouFAqM1WoFlivbC+B/vrm5OZHNZrHPU0R433PwH63t7++32Wy237Isy1Xy4pS7J5/P/9TlcoGBbcSoGvbEiRNXWywW5HDQ4xJWV1f/TpaeZRgGUY475hhT24jLLruMF0URAQyqWP+QQ6GSg1gE5XzB8sYTARw1e11xxRWHKUtNVRsJIYmZmZmTGxsbYbDWzWZzCLnf6lkqWy/wv1T2n25K9hP4bxVFEQy3S8tNQDD/4/G4G/nsaNSmIpmYcvXW4t/1Av9LZP8NnUeR53mwOa/VcuwkSVqemZm5MZ1OAywKHD16NDY/P1815qeWfav3unieh9QjlJkqvjKZzA8mJyf/sTRf5PDwcHYnNlPFD6uRG5Gy6f7777e43W441vBTdKhtbZ7dbieZTAb7G7wP+D5hB2+YiG+O4y5kWRZyf5pe2Wz2h9PT059mWbYgCAIOwtgDIZIZQVWNtUNTa1dUGfIgIvcxlEF2vERRXAP4n8vlAPqsdnd3xwOBAMa0KgCiXuA/VZoCMw6y/5C1rppzvNyY1MvfdwP+r6ys/KxEjUjOF2lY0+gE/sdGR0dfUaKgFmnI/ht2ipRtuJ7gv8vluo+CzsW0KAZeH00cx32KZdmbyxq0wgKJROJen8/3LVmVhBCSKZNqA741u91ubxdFsS2fR7yk1VQoFIjNZmPy+TxDf5Ompqa8yWRKZTKZYuqkegIZ9Jb93yIxXA/gDNvX12fzer0A/Tswh2w2mxnzZZur0NzcnM5ms5g3G4SQQrXSvzgcjhsIIZ+v8PV6ym3xePwjc3Nzj1gslqwgCEhtUAw0bsj9a2VhxfUgQN4+ODj4iMlkciq+q7KC6ampqeewLLty6NChxNLSUrZa87my5qu/Sy/wf2Vl5eZQKAQ/APyf+KmX4CjZyCBzwof1BvVWL38HxbpeaLPZIvl8fs3pdCZOnTpVl2oUPM8/j2EYqBxUjDeLojg5NjYG8B9BaMVUExQjM4zvrPys2LYE/IggErXY7XZrJpM5Y0O7/fdCCplMBn4Vsb29Pd/Z2Zm+7rrr8krS81Q8GBV25MyL5XA4XrKZz+C7u6znbLeLgUDg1X6/H9G6sgxCuUhanZqivtru7u5WmgvnYvV3l72DJJPJjy0uLv5fq9Ua1CMfp8Ph+Aoh5LqyLdlSIJfL/WhqauqTkGGiDO7gkSNHouFwGI7DmpZvr7TPhULhtMfjuVsURRzKwHIDUwqOqbp1JOoF/sMZi48DZawAPMC8qfePw5m3iOf5nzAM86fl3juZ+b8fZP/1Av8p83/eZrMFkUuMbn4Nt3njef6jm21/U7k5o+bvhJDw9PT069Lp9AoNwAN7rMGKVGPEKpXlef5zm4DdrqLwad52HJzidrsdkq8Rv9+/H8Yfsqvmo0ePmufn57G3Znt6ehi/HzEwv7/o//FNwg/2NPhdFVBU7RRzOp3PRP5EraXwBEGYdLvdbxdFEXMkY7PZYvl8vhj0We9BI2rHoIrlWY7j3rYpL/yBcm2g6//rafCXLIlfNeWuPZL9r9s0XeXGey//vkvw/6eCIDRk/3cYMELIGeY/3buF4Kisdyf5Xs7hWnqW3uA/VW9cMzj4zwwMDPyh2WxGDnhdLkEQfuvxeO6AImc2m4XPspzPqyibjUDTtrY2WzKZNB04cIBJpRDHf+YiBw4cYFOplNjV1ZXr6urKG13tZKvx9xD8VySlq8vk0L5SAK62gwcPNsXjcTlIGfNp6zkEZxP4NBAZkCeESNX4DnAcd5BlWchG92hhikKhcGp6evof8vk8zhsYV+wJ4KPAy2MYlWAtbFEDdRSVVU6cOPG3Fovl63q3J5/Pf83lcr23o6Mjcs4552zU23q41X56gf+Li4uQ/Z+hQGxpak+9h3DP6tfr2yJ3YGlp6ZpwOOxqaWkJptPpGCEkV431VW+DOhyOWwgh/7Sb58BHND4+fhv1s4PULe+R6h3fYZ1Op+XUqVPwLRbTiHZ3d7OBQOBJ3+re3l6yvLwsjoyMCO95z3sgq1LWp1gt8B/zAFJaowzDXLKbSXG2ezOZzBd8Pt9naR4tgKqGAVPBInvooYd0izQGM9Plcv2tIAiyHJtmkiNOp/MiSZI8lYxpIBB4u9/vH7VYLBs0l2aor68v4fV6wfyq2cvpdB6RJAmLkdpLWl1dvWttbW2CRjGV5g83TLCK2k7rDf7TAIp9B/47HI4Pbzrq3lpuPJaWlk5i00E/oPiQ1lW+ptL+6wz+l8r+y5GvZT+65cZnL//ucDhGCCGQn9LsggN5amrq+kwmA/BfjtLcNyocmhmyChVxHPd9lmVftJtHQ/Z/enr6Q2BU7MPgD5YQwvxe0fCp15a/GWqt4Hn+M5vjeXI3c2M7k6yurr41FAq5WZbN0zkT7uzsjFIpPE1VqTRu+76qzuFw9G2me4DDZ8cL67/X670xlUot0Pe/qnsxvcD/8fHxt8BpTAOcon6/v25yKZcb42r9vVLwPxwOv29paQnKFfIZC9+mhuz/loGUwX8afA//QEP2v1qTfQ+eqxf4n81mH/Z4PPdarVbI/hse/EdQJ8/z4wzD6EHIYURRXPL5fK/d2Njwt7e3ryUSCflMvtMeUXYI4zcuedMpp5oq3tvf38+43W454LSunOV6ATSbsuBvW15eRrAHvheyj8Rwwf1nOYOw99xzDzsyMmLu7+9n3W7E8xbnznZzrcgqpH/b8/MK0qn5fL4fEkL+TIvlkBCSX15evi0cDmNvmrVarVGq2CoTrmqaZKaFDWqwDqxfTZuqct9gWfYlOrcvGwwGX72ysvIbSrara7+UjuD/yUQi4TWbzZBgr0fmP6ahied5YE+qFKyVzt9IJPK21dXVnxUKBXxfsM+uWoC80jZXUk4pLrFT3ZD993g8bxQEAcx/GfyvS3ttY4cn+RRlH2KpL7Hk34q/0dUE/80cx7130+H3jkomVLl7aKTIa5DTmsqoawZwl3u2Bn9njx07dri1tXWR5vLSoMonVxGPx+9eWVn5HmWt4oXSxBHicDg+QQhBhI6qSxCExzcPKO8WRRGRl7K0R2R4eDhd63LBHMddvZnCArmzVV2iKC6OjY1BSk7uczFNhRH6rKqjWwrrCf6XyFVW1eG8G/tUeu/g4OCNJpMJzN0dr5WVlZuCwSBOfKGOjo7A+vp63YL/HMddw7Ks5hHFYP6nUql5QRAAbsvMf8MF7HAcdxvLsp8oN2fU/B0ysV6v97WpVGppi0RT42CtxpBVKMvz/K92m1cxl8s96na731+iZCMrPyjemFah641H7mABh8PxckIIZGk1PTPkcrmfuN1urD8Fi8WSMpvNkVwuh2+3zLRqzJkamZkISv7e976HQNUdARBCSGp2dvaGTCYzR4OvQ9Xc0+ok+z8xPj7+ZqvVGilx3sBRVFfgSo1MvTPNqBT8j0aj71tYWEDO4Abzf4dB3Ty7xyYmJl4BJ1tzc3Ogra0tHAwGN5QwSWptrjTaU94CeoH/+Xz+4ampqftoMJ9MMjEMAWcby7GDg4N3mUymD5a3qvoSODP5fL5XJZNJBJTDDwTCktp0R2fbm9XtHmoPwH/5fF9PzP/SCbrTfr7q88bhcDgJIb/Uyg8uCIJnfHz8rRaLJScIQrKpqSnc3NwcoT6wRqCx+qVr13cQAqIqazp+/HhfS0vLb2k6il3Xe7YKCCGLMzMzVyPQqre3N7m8vFy3+3a9wP9S2f+Ojo5gnb4/AP/LnncrnaiJROKTPp/vO01NTYGWlpZwLBaTU3BXWmVN3rdJGvj6Jmngmt00ThAE7/j4+M0U38H+COe4/QL+78Z0Z71XU0eeyhYit73DYrE8pvI+RcUhURQOh98UDAZ/AmnmVCoFZqaRJH0QHPEllmU1zccsG69QKPxqYmLiNrvdHshkMpCs1OJFQp4UBCz0Khqk/y1UWF1dffva2prbYrGkS1j/YBDVfE5ch8NxPyFkWGWfkavjuzMzMxhj5J0CQIKDBg59RpqnarvNNMB/1SZTdEN/f78tEokcTKfTBwuFwtMIIW1ms9m2FbDJ5/N4x7DRQMSmDLTU5cFHT+Z/KpWaozKy2IwYkvmvx+EAEfU+n+816XR6SRAEOUqzLje2il5MAxVyOByTmyDv8d00GalsJicn72RZtsj66unpabBid2PQKt/b19fX1NbWBpWui7RsiiRJYY/Hc1IUxQ2a9iiKQ3A6nUbwpxb7US2b26iLYSD9/3GWZXcM7oVM+MLCwo2xWMyHPe2hQ4fCz3ve81LVCuLVCfwf93g8dwqCgLOTvMbth9QmVX0PdgP+r6ysPEn2v5o5jLUwosPh+CUh5Nla1CXXAfB/dHT0FTQAX07Zsa/Sp2lpz1qvS0/w3+Vy3UdTGMrgv5FBFnz7/phlWaTWg2y61hdZW1u7cXV1FfusumYCamk4PcH/tbW1X5tMplA+ny8932vZ/EZdO1jgyiuvtGezWShU/oEWhgLrf35+/mQ8Hsd6hG8afK3wgdV1mlUtbLcHdQCLsvE8/5FNn+Stej4P2FAqlbp7eXn5/mw2i/277JuqerCL1v3Ww78HeXoq+z9NCWQy+A/yU11dPM//gmGY5+jRqXQ6/c2pqSmQ9WR1VPiQ684Pr4UNJUlaOX369GtLwH+s2w0f0S4mZjXBfzQbAPd/sCz7/F304ay3CoLwu8nJyTcUCoWifN3IyEhmZGTEKMwMdmBg4LlmsxlsBc0vsHMmJydfnM1mVzo6OkLr6+v4AO6Kucrz/Ls3gcZ71DYWaQimp6dvy2QyiK5NUrUGWW6wpj8ol1xySafNZputJFpxbW3tTaurq2Bgw/byB0AeB7VmNEz5Bviv21BhPQdQcyCfz3fmcrk2bKjxNIvFwgjCmVcJGww4qnHowQGoXH5B3Rqsd8U6M/8b4P/2A5j3+XzXJRIJmfmPta3u1zW95/Je1M/zPMZMbfDek5qG7zndqMfA/O3p6Qn7/f4GMLYXA6j9M0wcx32QZdmy6WTUPnpjY+NrPp/v21TuHwff0MGDB2PxeDxFCBEbbFO1FtW/vNPp/EtJkr5fRgEiv7CwcFM0Gp0qkVmvWvCX3uA/ZP8zmUxD3UT/6YfA4ZsYhvms2keB+U/Bf4wTwJyG7P82RjwL+L9xFklotcPQKF9jFtAL/M9msz+emZm5dzNQDHtABJFER0ZGcgbyvz1lpJxO5wWSJI0xDNOixzCmUqmvzMzMfLGpqUmWUq7aN1OP/ulR5+Dg4HNNJhPSuWh6BQKBtwWDwV8LgiDL/svB/Zo+p1HZ2S1Q6bf+bDXmcrmfu93uj1osFqQXK543StLa1B3oZsC5ZTrnnHMOPe1pT0N6lWfo2X6AibOzsy8XRXHu4MGDcb/fj8C0ulOm1Av8p8x/pICT02jV5frI8/x3GYZ5qR5zMZvN/rvH4/mIzWaLIMCsv79/3e12g/hZVxfP86cZhhnYTadoOjI5KDnQ1dUVCoVCjaDkXRi12uC/6cSJE8+2WCzYvGkeTQspraWlpVenUikX8pI4nc7kqVOnjJK3iT1+/PiBlpaWZYZh2ncxxme9dWNj45+np6eRxxXgDCLgsPBUFBzB83wXwzD+SvKjRKPRjy4vL/9MFEW8zGhH8OjRo/H5+Xm1smd6mGnHOnmev4thmA+pfbAoirMul+s2URQBigCALY6BwQJU1Ha7WF5P8L+EsXBAGaQAACAASURBVBIeGRlJG9nZUJFxf5+fqIlhmFa73d5ECDFns1m2ubmZzWYx1Yp53fBTaG9vzyQSCbxzFb/3FbZxz27TE/yPx+OQaCw6Bwz2bTljfz0OB5hPYP5vAf/rNrXEnk3mPXgQz/P4Fh3czaMQGT46OvpXJel78I5g8am7w/Vu7GSEezmO41iWPYX8d1q2lxCyPj4+fi1VPcI3CAo0sgpNze/7tLSFkeoaHBzkTSbT73Y6r4FZs7y8fFM4HPbQfW3Q6XRuVOvspRP4X5T9p3t3mdkKJkLdsYdqaX5WCgicRfbf0I42nZj/8dHR0ZdTJSuAtiEoeTQCsWrpLdCuLTqC/w97PJ4i899ut69CXdLo4P/AwECr2WyGsmWndiPwvzUVCoVHJyYmQKApBVSM4q/UwyRl63Q4HH9CCNGcILUN+F+vsv9lbVytApvfenx/urV6fiAQeI/f74fSMM4bkdbW1tDGxgaCABvnDa2MvLt6gEeBEHoHy7L37q6q8nfn8/lvu1yukZJzp6H3g9v1WA//nsz8TyQSM0h72t7eHkokEvUI/kPJGoHGN5afTepLFAqFX0xMTGD+weeGta4uVZ95ngcuuNtgHjI5OfkyBJJSNVngZQ3wX/20O3NHtcF/5ujRowcPHTr0uFbSPltsQZLJ5IcXFha+Y7VaA+l0upI8Wrsw765vRXDECywWyw93XdP2FRQWFhZeHI1GZzo7O0PRaBQvU0VMe5oT9ttq2wkQfGxs7I0052vSbDaH7HZ7GOyvStuitg2Vlh8aGrLE4/H/Yln2WWrriMViH5+fn/8x0hyYTKZi5BcFS3DYq2sHok7g//j4+PhbSsH/ffpxYIeGhsyPPPIIggAQUHUGtDly5EhxmobD4TMBAADk4KyvV+feHoH/2Ihg82s4R41Oh4MNr9d7fTab9ZcwJ7CeG84+atd1o5fneR5jhLVjV1cgEHij3+8HSCjn56pbdZFdGarGb+Z5/psMw/ydxs0k6+vr/zg7O/tj6njDvhzAf3R4eDhTLXl4jftYl9U5nc4OSZLwvSsqCp3tCgaDb1pZWXnMZrOFwYynymJVWf91Av+x37wTcxb9O3ToUCO1yR7MeK3A//7+/rjb7Tb0WUsn8F+W/cd+drW7uzscCATw7a7rM+keTN2afIRe4H8+n3+Yyv7j2y7L2CMA1NDziOd57Gkv02MwCSGR0dFRpI+EOgnAAKQ/qusUkLu1o16y/wD//X7/rxGI0d7eHrjwwguNRBzbrVmrfj/P8yBUgVilySWK4oLL5bodKcbgq2lqagrncjmcOfD/ButfEytrUglIj89oaWnBu/dMTWo8SyWEkPDU1NSLM5nMCiUdIni3rggKOvn3ZNl/MP/rGfxnHA7HfZsq2TjnaX4VCoX/mZiYeIfVao1ZrdY1ik8afo+01VBaBXFFo9F3U/W20KFDh4LVTCWo+WSoQoVVB/8JIYiu+TDLsgDuNL+opPwrMpmMv7OzMxKNRuWPvebP0qFCtq+vz9bW1oZF9lwd6mfi8fi7VlZWHrLZbMFUKoUDv+ooSKfTaZUk6X8YhuHUtnF9ff0zs7Oz/06ZgTIDXs7BVJEKgdo2VFr+iiuuOFwoFBbAslZTByEkMTs7e2sikSjmEmtqagrRjei+kHnTCfwHE+tOmhMGB+fwfgYSsK7iKpmX+DcZGRlh8EMvOQhAzfQ1VFmHw3ENIeTrWjd6bm7uulQqJcv+Y77h3TVc5LDD4bidEPJxLe0DxR2v1/vabDa72gD/tbSs/nXxPK+Jc1aWMKWOXzCZjLTv0t/QBngCx3F/wbLsD7RuKvY/MzMzJ3O5XEQQBKybpax/QwNyWtuqFuvjef6Jcnv9SCTynsXFxUfo2Mo5c+sJ/JeZ/0Xwn8r+GzmndS1Otae0qVLwPxwOv29paQkM0Ybs/w4jTeU1ZeZ/MV0i/XZrsi8wxCTbR43UC/yH7L/H47nXarXGqew/0m4aWvYf04LjOKQy0MVXifrdbvdf5nK5tZaWlroFA7R8vfQC/0Oh0NvW1taKsv8N8F/LEStfF/Wrain9LgUCgbv9fj/kp7NUZhsBrOuEkGy9El/KW7r2SlC/JUiPf2WxWB7UQxG6tNe5XO4Bt9t9z4EDB2T8o66CrfQC/6ns/zRVqQkNDQ0lHnnkkYqIo7U3C/+3RZWmslbSp0KhMDo5OflWQRBisjoSxcHqZq+N99nhcGiC4+Xz+R+5XK7322y2ECXLNghlSibaWcpUHfxH7si+vr62trY2fIwhV635FYlEbl9cXATLCE5oANxGWuCRc/WTLMveorlhQMUsFH41NTV1e6FQgIMOkvtylL/iBYjjuNezLPsFte2Do2FmZuaWjY2NiMViSVKgCI5gmfWvuA1qn61FeYfD8WlCyM1q6xIEYWwzt8s7RFFEpKEc8IDf+0I2VC/w3+Px3CkIAqLli+D/PmX+q52OdV1eL/B/cXHxukgkMgdmI92IGJL5z3HcezZjRM5Eg2gxGbCuT01NvT6TyeCbgu86fhobNS2Mq3MdWoH/giA84fF47jCZTAG8H0NDQ8l6PBzqPBxVq/7KK6+0Z7PZ3zIMc0LrRtCATwQVyCmPsC/H/qfBMNXa2DrUx3Hc+1iWvXunqpPJ5Ge9Xu/92Ie1tbWtHTt2bL0eZf+tVmvUYrHI4H/dsTZ0mD67qrJS8B+y/2CNyCprlPlvuGDNUuPpxPwvlf1vgP+7mq21f7OO4H/dyf5jNB0Ox98TQr6m18jOz8//XSwW81EfBgImsvswdaFi8+oI/t+1vLz8GzmtH8MwDdl/xaOyu4I8z7+BYZh/BDawu5p+f7ckSVGfz3dLKpWCfzspk62GhoZSjTOpFhbWvA6W47gOhmF+y7LsMc1rL6mQEJJfXV0dDgQCYzTQsa4UCvUC/xcXF2+ORqNnwH+Kq9Ud+O9wON5KCPmwHnMQ4P/ExMRbtwRI1t33XiufIuDK8fHxF1LZf2A8ss+9pnFCPeaOFnVq8nHVoCFmnuc/zzDM9RrU9ZQq8vn8D1wu13uMmFd9ZGTE9OCDD15qtVqRq8iqg32E1dXV69fW1sDcLwZHEEIEpdGQw8PDZq/X+yOGYf5Ubds2Nja+Pj09/S3qBAbbP9jT0wP5TDjRNIkWUtsmpeXpoRn537BJUXVFIpEP+f3+RwVB2KDgoWz3glK7q3pgjRXWC/ynMqwN8L/GxruazdkD2X+AG4FkMinnvDLURoTjuI+xLHuHlmMkSVJgenr65kwmg3Ut0NHREVpfX4fzpO4OB1rarRbq0mqjjjkwMzNzfTqdhjIOgj/wfW+wumthkBW0YXBw8M9MJhMA+l2ngCh9nCiKSy6X6yTLslgLEPAps/7l4CBDrZ8KTFl3RRwOxx8SQiDLedZrY2PjX6anp/+FBmGWShjvuT10kv0/w/wvAWoMz2zd88FR+cDdgP8LCws/K8mnbfjvkU7gf6nsvxxEDdWexrqscq4aobhe4H+p7L/dbg9AGaUeWLYcx13IsixAD10uv99/QyAQAOu5QWBQYGG9wP9S2X+qXlaPOa0VWHhvizidzmcQQqYIIW1aPZmqkHyCkqsQZCwHG+8LspVWdtzjesyDg4N3m0yme/R+bjqd/tLc3NzH8/m8nL7TSOTQHc2zB+A/zu/BemX+OxyOWwgh/6THHCwUCqcmJibeviVVcc1jX2ptoZVPEc/1+/3XR6PRx0FWPnr0aGx+fl61Urna9tdr+VoB/xHpdTXLsv+qh6EJITjQXk031LIEbVUkKCvpH3LLr6+vf5thmJdVcn+5e2hwxLupfWJq5NkGBwfPMZvNXkJIc7nnlP6dSt+/IZFIBC0WS4qy/iExCPAWjuGadjbwPP9ChmF+qKbPKCtJ0urp06dfT9Un0FdsONDvuoo43MkuDodjjBCiKaNQEISi7D8FmeQ803WXw0ntfNvv5fVi/kP2Px6Pz5U4k2VmQE2vW1vnA8/zX9Q66E4UxTmXy/VGURSLqibIzxSLxfZFShOjv29abdQJIdLq6iocmY/b7fZgJpMB66Ihi22ACdLX19fU3t4+Twh5utbNTSaTX/Z6vd9FwCdy3RUKhVJHXE0HfGptCwPXh/PahwRBsEuS1CpJUpMkSWaTyXSmS+l0enJxcfFRm80WzefzVc1fzHHc4yzL8lraWxCEcao0hXUN/cPvhjNZSyNvU9cuwX/I/hedlfUQjLYH4H+D+a/zfK529XqB/9ls9uGZmZn7WJaNy8oo9QD+g43M8zzyQuviOw0Gg29aWVmB4hJ8GKHh4eGNBx54oK7yUGs55wcHB59rMpkQ1KXpBdn/5eVlBDhif1qUiG8Er2tq4m0r43n+nZtS7/+g4ZNEn8/36kQiAR+rnGIMY5pUQ3LTsD2NqpRZAOurled5P8Mwh5XdUlkpQghy2F8djUansI8fGhpK14sixB6A/8X1sV6VHakKyScrm1k735XP5385NTX1PkEQ4s3NzWvZbBZrFM6Q9eQHwX4JwTSakEgSicQHfD7fQ83NzSCVRQKBQL3ZS4+ptm2dumxgK2l9b2+vvaurCwuJqvzpSp+VSqXum5mZQe7nkAEjRkyDg4N/YTKZvscwzP962JR2vkw5QkhkcnJyOJvNLlHnCIAsRQcOnud/xzDMZWqbksvlfup2uz9usViyWPyMpsrA8/znGIa5UW2/M5nM9ycnJz9nsVgygiDAYRg04HxU2+0nldeR+f9mKFfQD2l4ZGQk3ZDM29VQGf5mHZn/18bj8XmafyjodDoT1ZI13s0g8TyPvGqaBpUJguAeHx9/s8ViWRcEAY6ThhNrN4O0h/fyPI/IY03SL+Vyue+53e4P4Bt35MiRSDgc3jcBbns4ZJo/Sq81Ew2ljrhiwKfZbA5DgjORSDRY/5qPou4VItgXqldH6O8mi8XCCMIZcRdisVhydG8PwBXMOQT/7PmlE/Mf4P9bWJaN0JzW0YZEs/5Du1vwnyqtBRuy/9uPFSVKvMJqtSbMZvMaVJsCgUAjHYv+U7sqT9AT/Pd4PPfRdD4AsuHYNnxaFOSwdTqdyBWuGTO5dOAp+A+fWuDgwYOh5z//+ckG+H/2V0Nv8N9mswUpI7gh+78HKxTP88sMw5yj1aMKhcJjExMTSGuYQ7CxxWKRA9GxFinycWvVlkY9qi1g5jjunVqnpdyuFfl8/rszMzPvyefzwIcS9cIo1hH8PxmNRmdocFSoXpn/OgQjnZl+uVzuR9PT0x8TBAEkKZmwWI/MfwTHd6t++7e5QRTF0bGxMaTaloO4oUrWUJStwLg1A/4D1B4YGHiN2WwGE1HzC3l/pqam/pphmOVsNivnAzfMx//888/v6OjogMx8u+bGAQ0iHr97bm7u+yWsiLLSNxzHXc6yLNIFqL2yXq/3pmQyiQUPLy8OhrLkTs1LAw8MDLSazeZ56vhU1fdgMHj3ysrK4zSHGIJd8LOv8mHrCP6D+b9eEkWHuVVPUXSq5lqjcDFH4zWEEAR9aXrJzH8Z/Kfvs+FyyPI8/wuGYZ6jpXFogNOnKbuuCP5TZZPGu6iloXWoi+d5HEQOalR1YXl5+ZpEIjFGQV459YOh1DE0soVhqtlUNQLz7AqtG5xOpx+Ympr6KgWBi6og3d3dsUb0ttaW1rc+ACCXXXaZ5dSpUy0U+G+12WzWfD4vnyfl9xvfQwCHYM3hd1XU1nQC/yfA/C8F/xvMf33nHWrXCvxvMP+3HytCSHx0dPTlNFinwfzXf0pX9Ql7Af7b7fa1w4cPR5eXl+tC+YnnebwXmqsiYSKEw+F3LS0tPbJFUa7h3D7LW6KX7H8J8z/Y3t4eTCQSDfBf55WK47i3syyLYHHNLqo0BoJD2mazRWw2W+DpT396wuv1lvVva9aIRkWVWoA9ceLEcYvF4qm0AqX3SZK0dvr06RfLJMR6UeLVEfy/mYL/wY6OjmC9pvV0OBz3EUKAK2h+ZTKZBycnJ79AzyIAyOUAybryk/I8P8swzB9oZEAhEAjc6Pf7gTsCP4RvoeYxQ436rmk1tQT+swMDA11ms9mtk8yLGAwGb1lZWfklnTQAXI20AQD7/w6TyYRoaj3GLT0xMfGniPan8iNpSPfulIOe5/n3bkZPvkvtjMzlco+63W70A/Y/w/o3ygeX47hrWZaFE1vVJYrimsvlul4URbnfAMVkqRfDBKKo6vQ2hfcC/G9rawuHQiE4nOvqQ7pb2++3+/cC/G9qagomk0k5J6ChgE2O4yZZlj2u5byIx+P3zc3N/XhLCo66i2jV0ma1UpfD4fARQs7Xqj3pdPpzU1NTUMmRpZbrwgGslX1qrR6O417Jsuw3tG4XISTv9/tvCwaDCJrckBm4NGiqcXjT2uA614cAAJZlrQzDQAEAvy2tra3MxsYGvn/sgQMHSCqVEg8dOiTEYjGs/RjjquzF9AL/aZop7N9LHTeG+v7rPE00r75S8D8cDr9vaWnpp1h3wOY8fvx47NSpUzWfXm4nA+ol+z8xMfEKQRCwnwXIKRMlGvNa89lc/Qr1Av/z+fzDLpdLZv6v9fb2Avw3PPOfyv5DIVMzdnLpLIhGo+9aWVn5BVVMkwkxDfD/LK+Kw+H4E0II0rloem2R/QfIIJ/vNX1Oo7LfW8DpdLZIkgSQ95la2mRpaelkOBwG+ITxK2WL7ht/q5b2rEJdZp7nf8AwzAv0fnY0Gr17YWHhIRp4hfliJHxoW/PsBfhfYq+6+05xHPd5lmVv0GPuJRKJz/t8PgQmgQghp46rhz3Sk8zF8/x/MQxzlVY2LBQK/z0xMXG73W4P0HSiDWWyCoyrB4hcQTPO3GLhef5HDMP8yW4qOdu9uVzuQbfb/UG6WEGmMWMgWXC2t7e3uaurC3lpztXDPpFI5LbFxUWANgCl8fE7q1P2oosuOtzS0jJXifzZJtPrLr/fPwamDI3GDKZSKUTw1PzH1ul0WiVJAlv2D9WOAV3skboBeUrgNAz09fWte73eqjlG1fZBi/IOh2OMEHJCi7rkOgRBmKDOWMwjfEhlp1VVHM5a9q1RV+UW0EvCmjL/AWRhrcR8MySrmed5BMFpmmpnenr6lblcLkjlrGAbbG7rblNb+ays3TsdDsdvCCHP0qqFkiQFTp8+fTV9T8KNHKZaWVb7eo4ePdp86NAhsP4HtK5dFEWfy+V6kyiKMhMcjm2kPWqkgtDa2HtXH86PZgAi/f39rNvt3sr8R0sknLFGRkYAHlYFQNQR/EeaKczhtZ6enugNN9yQNdB5cu9miYZPqhT8j0aj71tYWEBuaOzX6oIxshfgf3d3d3htbS29EwlAw+FtVLXHFtgr8J+uk3UR+MnzPHxwx/QYKsr8h39JXqcajPMdDK2X7H8gEHib3+//tTwOTqczacS0fnrMUT3q5Hn+TxmGge8f+0lNLkEQFt1u9604c1it1mihUJDPHA1fhCYW3pNK2IsuuuhCu90OUqhmc2O7lhNCNrxe71+kUqkFfK+Gh4fT999//44EyD2xwC4eojP4P13vCjU8zwOvgSKE5lckEvng4uIiAtfgH13t7e2N10mA5JNsxfP8vzEM81daGZAQklxYWHh5Op325nI5WTkbwVxV8S9o1a+9rqfWwH92cHBwyGQyPQwmiQ7GKExPT79oY2NDBm2MJreOHDj/zLLsa3SwDZPP57/vcrmQH6mcHCvrcDg+Twh5vdp2AKR1u913iaIIwBsS7eGWlpZwNBqFE7jmI8ecTucRSZLw0Tukpu+b0jGp2dnZk+l0GqAY5l3w4MGD4Xg8jn/XfL/V9LVc2b1g/iO1x8jISLrhjC03GvX99z1g/ofz+XzA6XQmjOYcOHHixPkWi8Wn5QwQRXHJ5XLdJIpiMcDpwIEDa0YJ7NLSDkaty+Fw/CchRNMo+2w2+y2PxwM5RzhfDBHkZ9Tx2027nU7nCUmSkG+2aTf1bHdvPB7/5Nzc3H9SsF9O89SYC1obunr1sYQQZjM/J1ogH8Lxn6ofyHUC/8ch+08D3MCQRhAAvnlV72/1poD+T94l+F9k/tMczlCcM1yaplIL6wX+j46OvoIG/8tB1Eif1pjX+k/vPX+CjuD/j10u171Q/6Ky/5GlpaVsPQSRcBw3xbKsLuD/plrhW9fW1v5HEITSIKV95R9S8xLsgex/IwhDzYBUWJbn+QcYhvmbCm/f9rZEIvEpn8/3HxaLJWUymSL0u78jqU3L5zfq0sYCV155pT2bzSIQZ1CbGs9eSyQSuWNxcRFBKGUJkHq3RYv69QT/E4nEtNlsDoHoU0J+0qLZNVMHz/OPQZhEjwYtLy/fGgqFENSCsyMCkhEEUPMEWLW2cDgcH99MJ3a72vt2Ki8Iwq8mJydvKRQKpXZrED1VGLnmwH9Ed/E8/xu9XrhMJvOFycnJz9CXLU4IyRnlQAKpzRMnTjzParXi46T52MEWs7OzVycSCcgk4eO3QQgRttrnqquuakun0xMVSDSR1dXVu9bW1iYsFktaEAQserIcsCEWPY7j3sqy7IdVvGPFoqIozkxNTd2Zy+U2rFZrDItWT09PzO/37zs5bD2Z/1ardZ2mrgDzH87YhryX2slaR+X1BP9TqdScyWQqgv9GlK92OBy3EkI+peVwZzKZf5+ZmfmMKIpwGIfa29sDiUQCB+5GZKaWhtapLo7jPs2y7M1aVo9I3eXl5WvC4fDYkSNHouFwuMH21tLAGtWldYS23CxCSGJ0dPSVVEkKawH2lvg+Y41oOLY1Gr9GNdtbgOO4x1mW5bW0D1WaehLz3+/3N8B/LY28TV2Vgv+Q/V9dXf1ZyX4N4L+h043oBP7HR0dHX07Bf1n2H/O64VjTeW5Xo3q9wP9sNvuwx+Mpyv6XyLPWxfrI8zxk/3v1GK+1tbU3h0Khx7BONTU1BZLJJAIkG3uksxh7L2T/S86wjXHQYdIPDAwcN5vNkxpXnZ2bm7shHo/LKRuCnZ2dIJnhzNHwCWpsbJ2rYzmOez/Lsm/X+TkgQP7U5XLdVQLGGnrvoyf4H41GZ5DytM7B/xWGYXp0mHdkbGzsr0VRlNORyGpkhg5I3s5OTqfzWkmSVKfJLmfzSCRyYzAY/AmIniUKko0g5XKGo3/XHEBW+NydioH9f6PJZPqsBnU9pQpBEE5PTk7eaDabA3Jue6NsBgD+X3LJJVabzfYDlmWfp4d9MpnMV30+3yeoRBIikSDV9qQXyuFwvJwQ8k2GYUxq2iBJ0rLH47ktn88nrVZr0mw2B+kYGMIJPDAw0Go2m6EacURNv1E2Fot9Yn5+HooWYPrLzDdIusG+++rSi/lPmVgN2f99NZt27qxe4P/i4uJ1kUgEawGCl+TcjHAmG+bief5RhmH+j5YNjsVi9y4vL/9MEASsbYFDhw6FY7EY1rzGgVtLQ+tUl8PhuJsQ8j6tqxdF8bdjY2Ovrad8elrbqJr1OZ3OCyRJcunB+s9msz+Znp7+uCiKCHTEnhIH3fjIyEhDJr2ag75Pnq0T+D9O00wVZf8pe2PfBfLu9RSqFPynsv+Q2Czm/e3v74+73W5DO9p0Av9jW5j/CNRq5NTc64m+R8/TG/ynRIe6ymerJ/i/srJyczAYxD4M752slNUAnc/yPujI/L/r/7P3JeCNXeXZ91wtlrfxeGYcE8cJk8QzATMz1pVS+NOFmi4spS20xU0CpYQUQhagCwkJfwOIv6GspaSlUHYoe6aUhLUEAgOUhgIDnpEtWbZseZEXWbJ2a7vL+f0q96aK4xlL1j2yrn3v8/iZxeeee893zj3L937v+4XDYZDQKgPYzX5gMC85nc53EULeqGfViqIs+f3+15VKJfgDtTMH/twTAUh62soAdQH36Lbb7Usszqeb2p+fm5t7eTwe96pzsNHUoZ/QnAaB/5pKwp6aH51O51FCSIjF9yFJkt/r9f6NurfWfMh7MsXP0NDQc3me/1ateOF2dlcUJTg1NXVjLpcL9/f3p8Lh8J5IK7Vdu/X6fdOB/wC4h4aGjlssFky+Nr0aWlFPIRgM3pDJZMr5Stxud+rs2bOYtIwSMQL2/wusVuvX9P6YYCNFURYCgcDLC4UCoptjw8PDuTNnzjw+qTudzoOEEEhFH6q1bwAMLSwsnFElobER01j/hsjBJAjCb3Icd6bWdoP55vV6X7GxwYXaQdrhcCDoYd/mP2YI/r8B9oUztqenJ3bHHXeYsv+1DtY9Vp4V+B8KhV6RTCbL6WM6OztXL7/88oyRnMnPeMYzDtntdii8dOnZ5aFQ6KZsNrtICIEChxZgZ+joaT3t0+x1uVyuP6WUfonFe66vr79jcnLyoypQBlUh2SiqSyzs0Ux1CoKAg+g/sHineDz+94uLiz9CuiPIbmP/k06nNaeKUfbdLExj1tkACzCS/R/zer2PM/9N2f8GdCTHcXWC/9/Dfq2jo2M1m82asv9bdBmltBL815j/JvjfmOHd8KewBv9V5v9KPp+Pezye4l5IwycIAoIXL2HRWaFQ6M/VcyWClCLDw8PpSv8bi2cauU6G4P894XAYUuOVwf17Ctxqln4XBAGpxq7V831KpdLPxsfH32a1WjOSJG1OM6bno8y6GmMBpDz+PCHkT1k/LpfLfWJmZuafQIA8evRoYnZ2FkGihlQ+Yg3+V8yPAK731PwoCALOd+9lMd7UNIjfhGKsqp4QHRkZyZ4+fXrPkaQEQUC6jp9yHGfX25alUukL4+Pjb1WDurUU2qZPqQpDNx34r74zpP8/sAHi3VpFG2ouUiqVvjU5OXmvym7HxsBIESPk+PHjh9vb26c4jjtYc+O3v0FeXFy8OZlMnt0kZ11e/ARBQD7AL2xfzRNLKIqyeO7cudeoUotYKHC4KacWUP+v1iobXl4QhHdwHHdPrQ/O5/Nfm5iYgJIFxpmW3wXOJyONu1qbfcHyrMB/lYlVyfw3muw/5mN+ZGSkbLvTp09z2t8rjXn69Gl8i+YCV8WIdDqdLyOEfLaKpw6/NAAAIABJREFUojUVAcidTCYRFarlBMxSSkWjgJlOp9NJCPkfPTdkxWLx+z6fD5tlOIvLKV0GBgYSwWBw36mb1DSYmqiwulEfZfFKlNL16enp52cymem+vr7Ufkx5w8KuetTpdDq/TQh5rh51baqDTkxM3JDP57HfSWqBj+ocYUiHCgMbmVUytAAj5j/A/zuh4oWc1gC3TFYZw05Uq64H/F9cXHxEkqQyqMZxXMpI+7WtLMuI+Z8cGxu7XpKklMPhQPCmlp7FPG+wH94NfwIr8L9UKn0nEAi8W5IkkDzA/N8zrFtBEOBjOMCisyYmJv5EFMWoJEll0Hl4eDhjgv8XtvTQ0NBzeJ5HUJeuVyQSuWdpaQngv8n819WyT6zM5XKdopSe0/sRqVTq/pmZGbBN4WvGtxRzu93rZ8+eNZQ6o952MXB9kP5/ESHkK6zbIEmSLxgMvjqfz2Pd0vY/hgRlGYP/ZQJthZrjXgP/f84o/bg4PT39qlwut6ySQVcqVMj3nE/kxIkTvTabLbgRSNHB4NstRSKR65eWltBX8DEZDfNhYJLqqmxW8J88/elPH3A4HL9gMWCQ235ubu4liUQCeYY0ANpIOYl5QRAgzcskB44sy788f/78LaqTBE4tMPPLi58gCJCu/93qhtf/lspkMh8PBoP/YbVaC5IklYGhvr6+pJEAAJfLNU8pvbzWtsdisb9bWFj4b1XyX1sstUi5fedUaRT4PzIykjdSJN2pU6dcFovlI9uNL0rp+0ZHR8vsXEqpYhTAebt2sfg9Q+a/Bv6XncmDg4OGYv47nc5XEULAwtbrkmZnZ+9IJBLzarS9Fty1J6Ws9DJas9UzODhob2lpwSa6lcW7KYoSCIfDL19bW0PgjDY29tyBh4XtWNV56tSpfovFAhUQ3ZW2isXid30+3/uwh7Tb7WulUklTe3pSOilW7TPr3d8WYMT8h+z/XWoKLzgJEURuCAUzI48GncB/bQ4CEGDY8xcj8B/M/xsRHOFwOJYr0vIZ1k5GHu+s350h+P/w+Pj4e2w2W9JqtS4jOIpSWjD6WdXtdrcpigLCiu6XoiiZc+fOjVit1qwK/sNXpLHZdH/eXqiwAeC/FoRhKjAwGDCCIACgf77OVeenp6dvTafTUK7BWRbBfvBHmGmZdDZ0I6sTBAG515GDnfVVCIVC1yeTyWlVJQrBXobcKzIG/0FArZSs3zPg/+Dg4FNaWlqAD+qqjIqBi5Qkk5OTr1MJEYm2trbIoUOHEgsLC4bfH231YQ4PD1tTqZSf47gBRh/uWiQSuWFpaQlBZPApligk5AkxzywXMXizgv/c8PCwI5lM/oAQ8kwGA4Ymk8m3hEKhhyryahnJGUncbvcB5LzYSf75auy5urp60+Li4k8OHDgQTafTZSe90+n8NULIf1Vzf2UZBFvMzs6+JplMLlut1nVJkjQA3DD5dFwu1x9QSr+6g7bnfD7fn5VKJbQVG1EslnAUgh27L0EPVuC/3++/E4wVlWmAtAqGAv8FQUD+deRhv+glSdKbvF7vvyAgx+12iwZLW7Jd83T9fYOY/8ghayjwf2M+O7sxn7n0MjaipX0+35tkWca8BscxUpuseTweM/WGXkZuUD0ul+tLlFJm8nqiKP7b1NTU24vFIpwyGC9GSrvUoF5o3GMEQbh/Q6nj9QyeSCORyJvUQxn2P3uWJcDAdmaVOlmAEfMf4D+Y/whk1nJam/lkdeqzC1WjF/jvdrsTRmcBMgT/b7DZbGlRFE3Zf8bjeberZwX+FwqFh/1+/3tUnwfG0Z4A/6+99tprZFkGKKD7JYriubGxsbvV4OkyqDIyMrJuJAKD7kbZpkJW4H80GtVk/zVlP6ST3DPgVqP7aavn/cqv/MpTkPtabwVbgGtjY2OvJoSAaAZfK86ZmtKqCQg1Q+fv4B08Hg//4IMPfpkQ8uId3F7TLfl8/vPT09PvE0URY0cjQBrOX88Y/AfzP9bV1RVJpVJ7SvZfTfH8XY7jrDUNnCoKq3uj96uq19r8hPXFkAEmVTQZpOG/21g/762m7E7KyLL8o5mZmVuz2Sz2mpqauDnXX8SYTQv+cxwHmZfbCCEAuXS/RFF8NBAI/BWk/5EfPBqNGg2MRQ4cLIQv0t048Mjnch+fmZn5gJoaIeF2uyVFUZCbCfk7arrS6fTHpqenIdeDAAvIv2FD/QRFgZoqbHxh3uVy/ZxSKtT66Ewm89FgMPgVq9Wah+JBe3t7ZH19Xcs3uS8nJ1bg/xay/4b6pqsF/0ul0n3j4+MfQyRzT0/P+sZBFRHN5sF0i4+TMfN/tkL2X9u81TpFNLy80+n8VULIj/V8cDKZ/IdQKPSIKrtU3tAePXo0beR8aXrax0h1nTp16rcsFgv6ktlVKpU+ipyMCBQZHh4unDlzxkjKS8zs0uiKr7vuutZCoQAH3FP1fjalNDMzM3NHOp1esdlsKThSenp61u644w4zIEhvY5v1XdACrMB/NdhUA/8R6LYnclo381DaKfgfi8XuW1hYwJpW3psMDg4mfT4fcrka9mIE/idHR0evrwD/15Cux2TRGHaYXPTFWYH/kP0fHx9/t+rvWenv74+Hw2HDpzm89tprXyDLMnL16n5ls9kvhEKhT0EKGAFlR44cWYvFYnBkGw500t04F6jQ5XL9FqVU97OKCv5DrVNLE2Mq2OncqW63+1mKosAPYdGzag1cUxU0KvvPDDLX09CNrwuYEHxXNRMQa31VSml2YmLi9wuFQri7uzuWSCTWKaWy0fZBDMF/nOsDFUTOPRUc5XQ630UIeWOt46aa8iDCZjKZOUmSsKYAC0OgH9b5PevDf9rTnna4tbUVczGzS5blH05OTr5STVWmkYqYPc/oFTcz+M8NDAz0dHZ2QsrhUgaGliORyGuWlpZ+3NnZGc1kMhmD5QAkgiD8FsdxiE7S/VIUJeLz+V6M/GPYAA8NDV3F8/yPOI5rr+VhlNLU1NTU7evr63C6YIIry0GrTFlDRDqpEareHags5IPB4O2ZTAbRSOWJ/uDBg9FkMon84IbbSNTS7xcrywr838z8N5q6gtPp/F1CCNJqXPTK5XL3BwKBz3Achw1XYmBgIBMMBuHI3JfBJBczVgOY/9rh0jDgvyAIH9pwLt263Tir9veiKPonJyf/tlQqrVewVmCXHKVUMtqBqdp279Vy6no3xnHcYYZtLORyOU8gEPg05jGPx1PweDymk5Ohwbeq2ul0HiWEYI+tew5bRVEWx8bGbpNlGax/gKQmA6fB/Ws+juNYyv7bbLY1URRX+vr64ktLSybzn/GA2yn4H4/H75ubm3vEbrfHKlKPGOL8eSGTMgb/UxaLJdLZ2QliBM7t5tmC8djejeoZgv9l2X+cT1tbW1cOHz4M8N/waVEEQXjnRoDz3Sz6anV19d5IJPI/hJByoGSFQqT57V3A4G63+zmKonxP7/4wmf96W/TJ9QmC8HGO427W+0nr6+ufmZyc/JzqcwWwFh0ZGcmaChp6W7rx9R09etTR3d09zXEcUgAwvVZXV29dXFxEcArmYvj3DOdjZQj+3x6Px/ek7P/g4GBHS0vLPMdx3XoPMEmSfun1eu+1Wq0lQkjCarWuHjhwIB6JRHB23Mv+L6QqB4Y2qLdNK+qTRVH84NjY2Dt7enrS0WgUNi2nKzevJ1ugqcF/juMwYCBJ+loWnVcoFP4jGAy+HRvtvr6+xC233GI0B7RVEARIkF3Nwj7JZPJvQ6EQpO5Xh4aG/o7n+VtqfY4oij8ZGxu7z2q1QoIJkuzYjMERbBhWttPpHCGEPFBr2yFpNTk5eU+xWITzJNna2hrJ5/MJj8eT389AByvwX2P+OxyOlYroL8MsqE6n8/cIId/Ybpxls9l/nZqa+qLKqjBzKF/EYIyZ/yG73R5VncnlXEPb9d1u/15l+iJdjG6Hp7W1tbfNz8//D+Z4QkgcAWN9fX3JpaUlM8febnf4Dp6PlEupVOqHHMf9yg5ur+UWaX19/bbJyUmkX9K+H8PM17U0tFnLsgqOQnvz+fxXg8HghyRJAviPYCCsVSaDqlkHwx59L5bgvwrQmLL/DRo7Jvj/v4ZmDP6nLRbLMlI3qUH7JgDZoDHeyMewAv8rZP+h9Ij5EX4Po/nXntQVgiCAbPPbDPpIDIVCf5FMJpc0tQT8SSndk3mA9bIfa/DfbrevIoXdsWPHMkZPE6OXzfWoRz1jYqzrDrDF4/G3z83N4fwKhdVIb29v7LbbbtvXPlc9+qxJ6oDi8TcJIc9l/T7ZbPafZ2dnP60GYmEdMxxAywr8X1xcvD0ajQL819Ki7BnZf0EQ/pzjOJBSdL9SqdT9MzMz37ZarbmKlCSGDCypxTiUUuJyuaDiflst9+2krCiK7xgbGwNujDEJtSkzAGALQzY7+E9OnDhxnc1m01WiWLODLMsLPp/vpZIk4XCCSQxOSiMNFP7UqVMvtFgsDyJQYicfysXuURQlNDk5+bLe3t4D3d3dkDqr+RmhUOjmZDIJ5jvA/jLrf2BgIB0MBvFRGuLaWAxmNhaDK2t92Uwm82/BYBAgrdZ2OL8RANH0IGGtba2lvMvlOk8pPVnLPduVlSRpbAvZf0NFflUbZJJOpz8yNzf3ANJItLW1reRyOThWSvs5oORC44MVuBUKhW5KJpMhdU7D+gE1D7HZWe4ul+ufKaW6BdMpihI7d+4covcB9Gt5vWNut3vddJZsN2s17++HhoZex/P8PzXgDcVcLndrIBBAAEDW4/GI5jzWAKurjxAEAXtHJqmjlpeX71pZWUG0N5xw0SNHjkRNGdvG9a35pMcswEr23+v13lUB/gMkNbysdbOPmTrBfzBENaWmpBH2axfrD0bgf2JsbOxGNVAf53YT/G/2j6KO92MI/n/H7/e/S/V3YByB8GHo+XF4eNiaSqUAWPbUYfItb904k8WgEpnNZjE/rXV0dKxks1nNV2QG3lzA4CzB/5WVlUclSYLPDj97StZa7/Fba31DQ0PP4Xled8UGvAeAydXVVeQjB2Cr5Ww39NxTq333cvmhoaG/5nn+fazbKEnSWa/X+3r1+zekegQr8H9+fh7Mf3xjwM3ws2fmR0EQkEYGqtq6XxMTEzeAAKqm1SqrahsQd9yRXVwu1/Mopf+5o5tru0kulUr/PD4+/veqbYG3GQnXra21Oyzd7OA/d80113S2tbX9khG7XUkkEn87Ozv7jfb29tWenp7U7OwsNglG2WyT48eP97W1tZ0nhBza4Ri42G2FpaWlVx45cuT5drv9FbXWXygUzvj9/vdardai6kyAAxh5zACGG+JjdLvdv64oCtId1HoVJiYmXpHP5+H4xsKIA4Qmhb1vJf9hRJbMf5vNllQjNWMej8dQuYUFQXg5x3H/tt1Ay2azH5mamoIShZZvFmPM8JKK27V7J79nyfzPZrMhSZLKzmS3251udrDb6XQeI4T4OI6z7sSWm+9RFCU+OTl5Wz6fz1it1jxkrGw2WzSXy2nj0WRx62HoXaijv7+/taenB9JnR1g/Hvn1isXim/1+P1KZQCUHm3Vz7DA2vNvt7oI0f62pnKp5LUppenR09EbV4Q/p37LqkcqeMMr+upqmmmWa3AKsmP9qminswfYEuNXk3Vh+PT3Bf47jTNn/TZ1OKU2Ojo5erzonV3p7e6ORSATndXPONsIHUuM7MgT/H/b7/e+22WyQsF/u7++Pv+pVryoaObAT6bBEUZwkhHTWaOZti0uSFPT5fH8tyzLYajhTIqDcEGpy2zaOYQGW4H84HH4UwNaBAwciJvNf304UBOEfNvyif6NvrY/VNj09/fJ0Oo1zDQLXKlONsXicWWeDLeByuQYopWCds77yfr//DxVFWVbVPQ3H0GYM/u852X+MLY7jvJRSh96DK5vNfn5qaupzqgo2zo3AhOAT2Re++4GBgZbOzk5gaawVRdF1oiRJn5yenn4byJEjIyMlM+3LE0d004P/HMeRU6dOPc9isYB5rvv7yrI87ff7/6xC4s5QbGGO4yCD8yFCyKv1nqxQX7FY/Jrdbv9VQkjN+X+Rw2xxcfEXKvMdGzFEOoFxgXwnhnAmCILwlo1x97ZabVsoFL4xOTn5QVmWMbFjgi+nO/B4PIY+ANdqh63Km8z/ra3ocrn+mlK6bURrJfivMv/xTZnygFuYlSX4X8H813KCwZnclJfb7bYpioLAkht0ekElm83+29TU1L+rYG26paUlViwWNaZY09pCp/bv6Wo8Hg//4IMPvoMQ8sYGNZRKkvT2SCTygdXVVQSPYPyYAQAMje90On+XEPIwi0dIknTe5/PdQwjJ8zy/ZrfbI095ylNSRlJ8YmEXs87GW4Ax+I+9vQb+m2luGHfvTsH/WCx23/Ly8ve0YE1VjcTQCmyMmP+V4L/J/Gc8nne7eobgP5j/AP8RjL+MtJpLS0vwrRnC77NVv1x77bWCLMs/4TjOrne/5fP5L09MTHxMBfyjBw8eXE0mk1BSk/R+1l6qrxHgvxrcb8r+6zhwBEH4Acdxz9axynJViqIkzp079zIwPu12e6xUKoGYYfad3obe3fr4Db/eFKX0KtavkUwm3xIKhZCKVUtXbKg1jDH4rzH/tXR+hl6rVHDavxOV5+3GIQgugUDg5nw+n7ZarVmLxRLD/JTJZBBQsi98pfApPvTQQzdxHPfRnaiIb2fjrX6vKMrnwuHw3Wtrawi2MBUAKoykO5i+kw7a7p6jR486uru7z3Ecd3y7sjv5/crKysvX1tZ+XpG7GZOYUQ4pSI3Qb7PZkMdZ90OJytC31GpXSuma1+u9WZZlLJZl5nt3d3c8kUgYKrWCy+VCFNiJWtsPZ9PCwgLSVaC9a52dnavqRG+ksVVrs6sqz5L5D5lBh8Ox0tnZGYtGo2CsGAZAcrlc76KUbgu2QfZ/enraZP5XMdoYg/+zdrs92tLSEmn2TZzL5XolpRTOpZpTt2xl5kKhAOfeP1mtVkmSJLC14+3t7bH19XVIVRpJPaeKUbQviyCl0DGLxTLRwNYrkiR92uv1Yg7EuolDkSEUghpoI90eJQjC3RzHvVO3CisqQvDj1NTUBzA3tLS0lPOmplIpMNnQn0bZW7MwjVlngy3ACvxX00xp6kv401COwQZ3gy6Pqwf8X1hYeMRut5cDkbLZLALMTPB/U6+ozH8EiGIfB/YxWMjY35lzti4juLkqYQj+g/n/ngrp7TWjEx8EQUB6s4+z6MHFxcU74/G4V1XIhApp1Gj+CxZ22a7ORoD/YP6n0+k9I2u9nU0b8XtBEAAY6p4+o1gs/tjn892nBtGAlGFIufZG9IFRn4H84Ruqdf9IKf1L1m0olUoPBwIBj5oaOjYyMpIzEoOYFfiP1BqJRGJSkqSy7P/w8HD6zJkzhgb/nU7nMCEEkv+6+Egrx2axWPyhz+d7t8r6x9460tPTk4hGo0YjG9f1yZ04caLXZrONcxxXM5l4hw+miqKcmZycfHk+n9cCAIAJ7fvzjCHAfzVi5F82DqO37nAAXPS2XC73sUAg8EFVIghMDqPlBwL7//Mbks5/ysI+O6hTWlpaemMsFptQwf8y67+/vz8VDocNI3Hicrn+D6UU0l81XVA2CAaDf57NZjHZYKLHRheH33Ujy97VZISLFGYE/ntVZywOaSs9PT2xO+64w2iy/1/mOO6Pt7PzZtn//v7+pJG+q+3ap+fvGYP/IThHOzs7I8ePH29a2f8TJ05cbrPZoMCii4S7LMvhmZmZu9SclEWbzZYQRRFzvCbrbQJ8eg7i3avLMjQ09C6e59/QwFeQZFl+KBaL3cvz/Fw4HNZSAOz7zbrefeB0Or/Eas+YTqc/MD09/bWKlEdwEhgm3ZPetjbr2z0LNAj8x/pntHPj7nXKDp+8U/A/Ho/fNzc3B8cewGycxzR1GcOuK6yY/2NjY9dLklQ+R6lqfXBQGiaIeodDa1/exhD8fwLzfy+oHrpcrgcopSN6DxRZlhfPnz9/i5YiCX5IpEkwz/TbW9oE/7e3UbOVOHXq1LMsFgsUNHS/1tfXPzM5OflZLW2NKv2P4DVz/dLd2rtX4dDQ0B/zPA/VSaYYlqIowUAgcEuhUMBeCMEkCGA3DFObFfg/Pz9/WzweB+EUe2nDg/+nTp1qt1gsP+M47ul6j2pKKdKJ/00ymYSSVpkMqu6rscfGmXHfXMByv/KVr/wVz/NI+9KoCwEA/7W+vn53MBgEibxIKVWMoj7OykhMJ04dXxrS/8ctFgvyFeselUMpXR4bG3uJJEmY3LVIdyMBGGRoaOhlPM8jZ+6uX5IkTfh8vjfKsoyJLdPS0hItFouwq5FkzIjL5frWBvj/vFoNms/nvz4xMYFgEjhNtNwukGYv7vcJB7ZkBP6PAfxXcwxqjBVDMf+rtUsmk/loMBj8ks1mi4uiiDkLY8xkW2/xoTqdzpcRQj5b6ze8XflQKHRTNpsNqTKyWn7GplP1UIH//+E47tLt2lTN7xVFiYZCoTek0+mY1WotSZKE+T1eLBbjg4ODWZ/PZ+g8utXYYB+V4a+++uojBw4c8HIcd0kj242gu2Qyefvs7Cyk5UqUUtlcO/XtAUEQcBA6pW+tj9UWjUbfFA6Hf66CbFij1iilebMPWVjbrPNiFmgE+N/X1xdfWloyZf8ZD8V6wP/FxcVHJEmqzANs6L0KK/B/dHS0zPx3OBzLhUJBS+Nk2CAJxkPS0NUzBP83M/9xRjXs/KhKAqMNbXp3eC6XOx0IBD5ptVpzmJ86OjqgTALSiKGVSfS201b1DQ0NPYfn+e/p/axIJHLP0tLSf6sgDQAuk/mvk5GdTucHCCF36FTdE6pZW1vzzM/PQ3E11draugK254aaZs48d7Cw9q7VSU6ePHnCarX+EmmPWb6FoijxqampV+Ryufn29vbI+vq6phhliP0QQ/D/9ng8PgVVv2KxaHjZf5fL9QlK6StZjKVUKvXBmZkZpI7Aeo51HUQI4GHYDxlaLWEH9gLmbHM6nb8ghDxjB/fv+BZKaSibzb40Ho/7rrzyyvzZs2ebzl+/48bt4EajgP9omkUQBDCJXrCDdm57SyKReNPs7OzX1UgmbeNtiAke0W/9/f2Onp4eyGlcuW1jGRfIZrOfnpqa+pI6ucXb2tpWc7kcFk3DMGNOnTrVb7FY4Bw/VIu5wPqfmpq6aX19HQfFrBr4gMkeEYP7baLf0nTVgty12F2SJEOD/263u01RFHwjtu3avYn5D2AFjGvDKGps1z49f88Y/J9VZa/QB02Xu+mZz3zmYVEUf6RXNCuCl5aXl98YiUSCVqtV1OT+1eCTtMfjKZnKJnqO3l2vC/tDqArdu+E8eesuvA1yor0smUw+GovFtIOSUfZku2Cu2h4pCAIOo9uuN7XV+ljpUCh0czKZnFPnBgRHJbA3Mp1wO7GmeU89FlAdDUI9dWy+F/tNv9//BkmSTNl/PQ27TV07Bf/VNGwAieB0w37NlP3fwtYVsv9JpE9TwX9DBVE3cDga/lEMwf8y879S9t9I/p/NHSsIwo0baUc/z6LDY7HYWxYWFn6q+ojKMsojIyMZI8lLs7BLNXWyYv4D/F9dXX100/ne9N9V0ykXKTM8PGxNpVJgwOqiQrj5UXNzc6+Ox+MhlRiDcwfWedM3Vme/NdvttfhL63x3aX5+/i/S6fS4KIplBV8jBbEzBv8nkbe+VCppighGIsw+PixUJZIfcBzXUudYedLtSH89NTX1OhUPwj66kvUP/8t+9GdZTp06NWKxWL6gt72rqC9XLBbvXl5e/kwikUB/7NsAACOB/2TDifOHhJCvsJB6kSTp516v9w6HwxHBgXdkZCRvsM03PzQ09Cqe5/+VhX2q+KjKRcAM9fv9t5VKJbD80y0tLbEK1r+R5HIQZIJgkJqUJmRZngoEAm9AugNJkrDx1MBZ04GiDiJW4L/f779TzZmnMf8Nk09HzTf0/Wq+Mw38xwHHZrNFcrmcyfy/gOFYgv/JZLIs+6/Ko2o5yptiMzc0NHSc5/nTOjJ7pdXV1bcuLi6OqhsmzGcIOsFmFoFNOGCb+dmr+YCNVYY/cuRI++WXXw42xcndeHVZlu9fWlp6dywWw7eGzbop4VhnRwiCcB3HcWA2sbjE8+fP/7Esy5gXNLANAbWG2f+xMIpZ5+5YgBXzX91vxjWGmZGZrbvTM7U/dafgf4Xsv8n8v4jZN/LoJjTmv3p21ZQQm2JfW/uIMe+4mAUYgv8a8x8+EIB92hnVkHs3p9P5CUKI7sxAsJJ9Pt+flUol7JU0fxFshfOV+c1t8/myAv83cjHfHQ6HIU2PYAwtuN8E/+ucTlUlQqi5OeqsaiugrRgIBP48n89HVfAf8w5IGfBNmNces4AgCN/lOO63WTcrnU6/d3p6+j827YcM4etiCf6n0+kpSZIQEGFY5v+pU6dcFosF6cAO6j2OKKXrkUjkzaurqwFZlgs2my0piiL201jfDYNN6G0X4JOnTp1qI4T8O8/zz2dQ/7ZVyrL8hQ1CEdR9MHa1IIx9td8yDPhPKSXHjh070tnZCTZR67a9W2MBfKhTU1N/vL6+PnfgwIHosWPHMgaThcAHdZnFYoEUDpOoympMmkql/mVubu6bhJAiWDGtra2rkF4yWNQ3JP8foZQ+p5o2V5bJZDL/FgwGvwgJN57n10qlEiaXlMl6+18rNRD8N0zAhcvl+mdK6WurGW/pdPoj09PTD1SwKpFSomCyKp9sPZfL9TJKqe6y//Pz8zetra1p4H/TMP9HRkYsMzMzv60oyrerGUtVlilEo9F3h8NhpA+QrFZrAYFNra2t8Y6OjmQ0Gi2YsuxVWtKYxawnTpx4ns1m+2qtwXB6NZdSOprNZm/OZDKTz372swsGC8zUywy61eN0Ot9ECPl73SqsqEiSpHGk4FHTPJVzAprKRywsbdZZjQUYgv93QaZZBf8BKpsMs2o6pI4y9YD/lbL/g4Mi3t8vAAAgAElEQVSDSZ/PZ2hZbVay/2NjY9cTQtKiKGpB1MiZvK8cY3UMUUPdygr8L5VKD4+Pj7/HZrMlrFarJr9tyDOqylae4jjuqM6dS1Op1P1zc3MPy7Kcs9vtCOZfVaWl91Uu4J3alSH4f084HH7UBP932jNb3+d2u5+F/Mscx1n1rblMPMtMTk6+UhTFNTUdI/wyWtCxuX7pbfBdrs/lct1CKf0w69colUqPjI+PeypSgGhEH9aPrrt+VuD/4uLi7YlEQgP/cb43XFqUa665prOtrQ3A/6/UbegtKsjn89+Ympr6kCzLID1gzKwBW+zv7zfTo3Kc5dixY8c7OjqwxnaxsH8VdS4VCoVXRKPR/zlx4kT++9///r5KLWoY8F/tSN7pdP4zIeT2Kjq25iLZbPZDU1NTH1EjmcBqNIxMvdpYq9PpfIAQ8kc1N16nG0Kh0Cuz2SwiLrPqBixqtFzQQ0NDz+B5fmwnJlHlbpfUxRCOb0R6YeI3RKTgTtpc6z2swH8ADjabLQWnVU9PTywajRoC/B8cHLS3tLRgEXRVY8utwH/T8by15Vgy/7PZbFn2v7OzM5LJZNKUUmk3AzDUvJRgqPwxpVSXyHpI/a+srNy7srLiV1nXiFjFRh9gBw7W+MYMKfdVzbdmlilboJxW6NChQ++zWCy37qJNkoqi/Ou5c+fe7na7i2pwJl7HdOzU2Ckul+vrlNIX1nhbVcVzudy/BwKBj1XsgSBju24GbFRlPrOQzhZgBP5vlv3Hemi086LOlmZf3U7B/y1k/5GGZFf3a/VaixH4nxgbG7tBBf9xjsf51WQh19tZTXo/K/C/UChUMv8RRGLY+dHpdL5YVRzVtReRYiMYDN6SzWZTVqs1o0rMa/4ik2VehbWHhoaew/M80rnoem0EtD8B/B8eHk6fOXPG7JM6rSwIwks4joMioe6Xoigrfr//dkVRKsH/pkvHqHvD92mFg4ODHS0tLSAWMkldp5mVUpoeHR19UYXEPcaUISTbWYH/8/Pzt8fjcQTEGZL5r/rcQZAaZvH5SJLkCwaDb83n88B+EBSOcYq1HT5T+FANqYCko63IwMCAvb29/Y08z/8/HeuttaqsoigPnDt37m/UftHSAOx5n6LRwH9y1VVXHejq6lrkOK691l7erjzY2RMTE88vFArz6oeKiHfDbPigjnDy5MmrbDZbALl6t2uv3r8vFovf9fl8/2i1WsH6R/AEIsI0iRPDTHaCILxlA/B4W632KRaLP/L5fO8EM5YQAokXRJ4aTfWg1mbXXJ4l+K8urhpjxRDgvyAIT+U4DsEmHdUYE7L/oVDoAShrtLW1RQ4dOpQIh8Om43kL47EE/ytk/7WcV7vCJMNG1uFw/NEG4P9OPdkpOEwvLS3dF41GoXBQZvyrTmHM7ZCozHs8Hsnj8Rhmbq/m+zLLbGkBy9GjRzsPHjz4Y0LI4G7aiFJ6RhTFv1tfX//v2dlZRFVj/O35zbpeNne73TZFUbDHfYpedVbWk0gk3j87O/tNdS3G3AjHvyHWYhb2MOvcXQswAv+9Xq/3LnVsY7+pnXPMeYhhd+8U/L+A7P+u7Nf0Mg8j8D85Ojp6vRq4ZTL/9eqsJq2nAeA/zgrlPYDH4yka7aygsgPhT7tU7y6EvywQCLwfKSIrJP9hL4AF5pmqCoOzAv8jkQgkgU3mfxV9UEsRQRDgo7i7lnuqLSvL8sLExMTrSqUS9mIAJTHvAHwzjA+/2raa5coWIIIgwDcF/ynTa2ZmZiSVSk0jxefRo0cTs7OzhkglYYL/Tx4WJ06c6LXZbFCD/R0WgwaEqeXl5bsjkQiCI+CX18hSmh/ETH/4mOH5vr4+R09Pz1d5nmeevuNifQ1lUfjPz50799Xh4WFxP6gAGA38R/9ZBEH4Csdxf8Diw00mk/cuLi4+pMm1qx8vi0exqhPs/28QQp7L6gFb1Yu0CWquQIBE62oUsyb3aigni9Pp/BEh5NdrtV80GvWsrKz8jyRJcHSj7ZocjqHaX2u7ay3PEPx/wyanlRHy6mADi/nsRdXaMZPJfDQYDD5gs9nW1AATzWFgOp43GZGV7H8oFHpFMpmcrZACy1BKxUYy/wHicRx3BaX0G5TSa6odP9WUE0XRNzk5+dZSqZSzWq04POclSUo7HI5koVDQGP9m/vVqjLk3ymCvCPn/P7DZbF/gOM6+281SFOUTqVTqb9va2uI+nw8HKnP+q6JTTp482W21WnEwPVxF8ZqLhMPh10Wj0QmO4xKqJDpYtvlGzo01v7R5w561ACPwH8z/OyH7r+a0xh4M+01zDmI4kuoE/8EQxZkMwABSZTV0v6a3WRiB/wn1HI+93kqhUIjhbG/O3Xr3XnPUxwr8L5VK3xkfH383vrOKtCiGC1B3uVx/QCl9CECTzj0mTU9P35ROp7F+ZMEqbWlpiWYymQzHceZetkpjN0D2v8xsNZn/VXbINsVcLtdPKKXP0qe2J9Yiy/LU+Pj438iynGhpaVlta2tbTSQSpuoqC2M3SZ2CIPyQ47jfYP06y8vLd6ytrf1MTYVkGEIjK/Bflf2frMB5DCH7LwhCH8dxWM+vZTRm5Fgs9raFhYWzatBRtqWlZa1YLMYHBwdTPp/P9JmqhgdZmRAC+f8Tqvy/Lmq19fQriEWFQuGVExMTyx6PRzRasGotbdd7Q1vLs3dUFgNmaGjo5RaL5dM7qmCbm0RR/O7Y2Nj/1aKVR0ZGjJZflh8aGnopz/OfYWGfC9Wpsf4hh6NKr2PTvDYyMpI3ktyrKvk/uoOcVHR6evoV6XQabAkshJrkvyaL3cjuaOpnsQL/4YytUFyIeTyeXLNP3js5vIL5PzU19YDKNsN4AwvbzDe7xahnxfyfn5+/KZVKhdTNL771RsrL8YIgILXLazmOu47juBYdP3h5fX39CwsLC19TJasQuKRJ/WOcoZ34t7mJ1dHoRqhK3aw7Tp48+Tqr1fquJnnnRUVRPpzNZj88PT0Ndhlt9jl/t+126tSpKy0Wy/lqlWZqfF9pfn7+1Wtra/M2my2uOku09anGqszipgXqtwBD8P8NUF8CuHX48OG1cDhs7sHq766L1lAn+I/8npDeLIP/qnQr4zdmVz1D8P9G9QwP2X+Ak1BANINa2HXlrtXMEPx/eHx8/D0IANR8aUY8o7pcLi+l9ITeHbS+vv7FyclJsA8REJF0OBzRQqGAb80IhAW9zbHj+lgx/yH7v7Ky8qgkSaudnZ0Iymjk+X7H9mj2GwVBQPDdERbvKUnSea/XC1UBkBMiR44cicZiMdP/ysLYTVKnIAgf5zjuZtavE4/H3zI3N/edCr8+9kRNn8qXFfgP2f90Oj3J83ysVCppyqdNrbDhcrl+Y4MkBeLKZazGSyaT+VgwGHwQhCmVBIpzBs4cmt/UVPR5ovGBQbc87WlP+53W1tZ/19mXvdNujiqK8uV8Pn/f5OQkzopaWts9dQYyHPiP3uzr62vr7e0Fs+jynfbuhe6jlGZmZmauLxaLM8ViUWOua3kg9H4ci/rIiRMnLrHZbF6O43pYPGCrOpeXl+9aWVmBdDk2WzjElFnvkEAxEmtAEITPcxx3Y612KxaL3/P5fO+tyO+yqsoD4XC3pyaNWm2zuTxL8F+SJGz8DSH7f+21155QFOULtToXtgL/KaWQZDfH2abBxor5D/B/bW1NY/5j88vaOcC73e7jsiz/FiHkTzmOe7bebBRFUcJra2sfC4fD5ahVq9UKZty6KIpoGzaxYKUUjJ4rt975a7/er4L/fGdn58GrrrrqkzzPM1Ff2qF9fyFJ0vs4jvum1+vFvkMx58OtLel2u08qivIzFgctsERnZmZek06nkZoL+0DMjViTDZEjcYdjz7ytiS3gdDp/QQgR9HxFSZK8fr//LpX5b+ic1nrahXVddYL/YP7DERcZHBxMGl0thhX4PzY2doOq8lRm/pspW1iP6t2rnxX4XygUHvb7/Rr4j/nRcMooTqfz1YSQjzDonXwoFLo9mUzCLgCR1jo6OmLZbNbcJ9Vo7J2QJ6p5RAX4Dz+mdr5vanCrmnbtZplnPetZvaVSCWOeySVJ0i+9Xu89FenGzLWLiaWbp1JBEBDsgVQSTK90Ov2B6enpL6rgv4YL7VvwH8z/aDQ6uUnhuCnnR7fb3aUoCnK6I50zq4vm8/kHJyYmPm6xWBQ1lQ/W89iRI0eSsVhMI0yxer5R6wUGzR85cqTt0ksvvddqtb6xWRpCKZ2hlL6nVCo95Pf78c1rQQDN8op1vYchwX+Px8M/9NBDf73BXALYqvtVLBY/7/P5cHDBpg/ygEYD1sAM9WwM1jfrbpwtKpQk6azX630LwCIVfC2z/oeHh/NnzpxpygVhK7u43e5LFUXxcRx3sEa70VAo9BfJZHLJarVmJUkqs0vcbnf27NmzZn6XTcZsBPjf09MTi0ajTZlneGRkxBIMBn+NUvp1QkhnjWON08D/SmalEfMp1trunZRnyfxfW1tDvrFYZ2dnRGUG6BokNjw8bC0Wi7ZisfgCSulbOY47tRMbVHGPnMvlHg6FQh8tlUoIVgLwX5QkCY4pAP/p3t7eTCQSKVJKZRNUrcKie7cIGRwctG3sj9qHhoa+w/O8u8maOpvP5186MTHxi5GREen06dOItDaDoio6ye12P0tRlB8jhZbefUcpTQWDwVsLhcIyz/NRsAIGBwczPp/PTH2kt7HN+qqyACPmv9fr9d6lpl6CQxtSoGau5qp6ZOeF6gT/wfwH0BbJZrMIZjS0vDYj8D85Ojp6vQqgaEEtJvN/50O2qe9kBf6XSqWHA4HAeyRJwncGBQltfjTEXkw9o4NgNKBzB9JUKvX+mZmZ76oBkQmHwxErFAqwD74zkxlYg8FZgv/hcPhRu91e3sOqge+mL6+GvtlcVBCE3+Q47kwdVVz0VhX8LzP/HQ5HpKurKxaJRAC6md8UK6Pvcr1ut/u5iqJ8m/Vr5PP5L05MTHxICx4dHh5OGQHbYMn8j8fjU0ivgXQ16XS6GWX/idvtBsEO+36WRFgqSdKoz+cD5ibKslxUlbMSXV1diVQqlTUJUxf9QoFDW7q7u9uvuOKKzzQZqQgvntpIg/unyWTyR+FwGH6sPeFTNCT4D8bjyZMnr7FarWAotuk98SuKEgoEAjcVCoWFCtm7po/yqrADHPSXt7S0wD5MJJa0Z4Fht7q6+rdLS0vnNrH+NVlFQxz20B6n0/l7hJCvIRKpljEly/LM+Pj46zHpaxJunZ2da80KPtfSNhZlWYH/Xq/3zgqnVdPJ/h89etRx6NAhALl/xXHcr+4gtUS5OyqY/2vIa3bo0KGEKTm79UhlxfwPhUI3JZPJMvi/iRlQ13w3NDR0nBACVv+vEkJOchx3lOUcLknS2Orq6icikQhygCN4AT84MGcdDkfaZrMhDSWcUiWTTc1iNjRenQi+9Hg8tiuuuGLg0KFDpwkhT2+yViDoC5Kdb/Z6vT/fq7JdO7W5y+V6HqX0P3d6/8Xuo5TGAoHA7fl8fkV1nCIQVMtjy+KRZp2mBS5qAYbgP/abZdn/fD5vgv8NGIc6gP+Vsv8m+L+pzyilidHR0Rs09qQaRG2C/w0Y27vxCFbgf6FQ+I7f73+3zWZLWK3WSD6fhwqQYdKi7FQBcrs+lCTJp0qTY+4ps/7BnhwYGMhMTU2VzMDq7Sz4xN+zBv9Vpq+W1s8wRKbarNiY0jtdu6t9uwrwP4k9WXd399rS0pIZkFmtAQ1Yzu12X6EoyhzrVy8Wi4/4fL77Kvx9mkoL60fXVX8jwH9VIbupwH/4UXmeB2EKKqnWuoy4zc0YG4FA4J9kWcaaDuA/I4oilI4SKvHB0OcMlrarqBtYtK23t/eySy+99FOqD7xBj67qMcB/fyqK4t+PjY09PDIyIhudWGRU8J9zu902WZYfJoQMV9V1NRSCVP3Kysot8Xj8bEtLi8bqNNQHDNZoMpn8BiHkuTU0veaiiqJExsbGXiPLMhzuWAAgj6HlCTSUTIbT6fwsIeRltRoBObLV/G1aygNNJsyU/N/CmC6X6zylFMCmbpcsy1MrKyv/YLFYsi0tLbG2trYEz/MFh8NRjvotlUqc3W5//M/ND9Z+v90LoRyuzXVtdb8kSV0cx+HnKM/zz6aU4lvs3u4Z2/0+k8l8NBgMfkllU2iSijjkmNcmC7AC/1dXV++VZXkRzq3W1tY1q9W63tbWVmYGXGisybJsIYS0KoriUIPWunme76OUAvC/Rk3/UPf42G4QAMSXZXkynU5/LRwO/5carQrHBgZ3zm63Z0ulUrq7uzubSCQwrvC7PRHtuJ1tzN9XbQEEyDkGBgaGOjs7ETB3uOo7G1iQUvqALMsfTCQSPw2Hw9p6XFeATgNfn8mjnE7nKwghn2JRuaIoS36//7WlUgn7QDhN8ZNV5xAWjzTrNC1wUQuwBv+RZqqvry++tLSEoLl9PbewHoo7BRDi8fh9c3NzkP3XZJw15j/rV2ZWPyPmfwKy/4SQtCiKWvo0E/xn1ou7WzFD8F+T/X+c+W8UdTqXy3U9pRQSz3pf4vLy8ptWVlagLom9KM6O0Xw+nxgZGSmcPn3aSAQjvW2zo/pYgf+RSOSe1dVVBBCbsv876pkn3yQIwt9tnAPu1am6J1VTKpX+a3x8/G1qihH4YOGHxndmMv9ZGX336yWCIOAbZep/EEXx5xMTE3erab4iR48eTc7Ozja9f3+/gf9DQ0PP4Hn+FkLILZRS+FlZXnI+n//WzMzMx0qlUklVS4Wvowz8w+/h8XhKHo/HnH+q6wX4FO3d3d2XPPWpT31Q71R91b3C9qUopQ9v4Dj3Ly4u/lAl+OLMb7hzv2HBf7CzT548+RtWq5WJjFChUPim3+9HjpDV3t7e+LOf/Wyjbc7JqVOnnmmxWH6y/XDeeYnl5eV7VlZWvCrrH+wX5Lo3xMJY2epnPvOZh0VRBCuk5mthYeG2WCwGFnAawHOxWITDGw4TM1J4C2uyYP7X3GkGvmEL2X9sNJp+I7obJmcF/u9GW/R4JnJyr6yseKLRqF+WZWxKFavVWpIkCcAFgpfA0sUGNud2u0tnz57VNZWBHm0w62gaC0A2vvXw4cP9l19++X8TQpgHrtTR8v8uFAov9fv9Sx6PR/Z4PIbcsNfR/sdvdTqdf0kIeb8edW2uQ5bl+UAg8LpisagxbOGYMfdCLIxt1lmVBViB/36//05JknDmMcH/qnqi/kJ1gv9l2X8tnZ8p+//k/thQJSvL/kO21GKxRAqFAuZxE/yvf+g2ZQ2swP9SqfSd8fHxd0MJEfOj+t01PfP/xIkTvTabbYaFomgqlfqXmZmZb6nzDs5ZsQMHDqz19/dnzbRIO/s8WIH/0WgUfk2A/1oAa1MxW3dmrd29SxCEz3Ec91JWb5HP5/9DlWZPtLW1LedyOfjFmn7OYWWPfVIvcTqdIIH+Dsv2gixz/vz52202W1IURS2NTdP7XFmC/+l0elINjooODw+ndzMNAvAbSZI+RSn9fZbjoLLudDr9sdnZ2QdVPyqIU1jTEx0dHclsNgsfqhl4VHtnwKfY0tXVdemVV175VULIYO1VNOYOSmmgUCj84cTExCywvo3UvNRIyk1GBv/Rw1ZBEH4GxXYG3S2Fw+GXRqNRyNnDgamxl4wU4QH7gO3wGwzsw8myPHv+/PnXqocZbI7hKIgNDw9nd3Mh2ElbBUFArqh31nqvKIpnESQiy3JJzcGOw4IZcXoRQ5rgf62j7InlAf6HQqEHNMezGmXY9BvR+lq9s7tN8L9st0I+n38klUp9b3l5OaBGwgPUL8tUaTL/qpM3NzAwUAgGgybbf2dDbj/dVc7VhQCAK6+8Ujhw4MCHeZ5/WhMbIE8pPaMoyjvOnz+PoEgwrZTH9uzESPu6ukwsCMI7NuaEe+qq5AI3y7I8Nz4+/lpZljWQTQOPTFYbC4ObdW5rAVbgv5pmqgz+qypMJvN/296or0A94P/i4uIjkiSVg5IGBweTPp/PUGp+my3HiPkP8P8GNWdpmfmPgNH9tD7WN0KNdTdD8P/h8fHx96hnU21+bGpn+HXXXde64cz9Bcdxuu9hJUkKBIPBN+fz+YzVas3xPB8vlUrYI0E+2pQm3+FnwxL8D4fDj5qy/zvsmC1uc7lcX6eUvlC/Gp9Ykxpw9C7MORXgv+kXY2XwJqnX6XR+GExvlq8DhePx8fGXS5KEgJJIX18fUko0/X6fJfgfj8eRKlQLjgLw3VCy46lTpy6xWCw3b8ix/x7HcdexlvfXxhelNBuPx/95fn7+x6oPCXMM8EEEOmJ8lNOkmmqpO/oi4VOEAkDr5ZdffvTQoUP/yvP8r+2opsbcJFNKf8Rx3AdHR0cfNFKKUaOD/7zT6XwzIcTDop+z2ez7p6amII+KCS5JKS0Y7BAM+/wFIeQjLOyDSMupqamPybKMw0t5UTTqYUYQBLBCfqtGO9G1tbV3zc/P/0AF0BAkgh8c6AztWKrRDjUVZyH7X9MLGLzwFrL/2HRgI2pemyywj8F/URRFXzab/fbs7OwPVVkiMP3LoL/NZiuIooh5G2x/bFYxfvBvkVIqG2ydM8f97lkAe0jkVGvt6em5qq+v7zM8z5/Yvdep7skbKTb+vVQq3Z9MJn+h5oXcN0oALpfrk5TSm6qzVG2lZFmeHh8ff50sy9p+EPshzDGm9F1tpjRL62QBRuD/mN/vf0NFAKahclrrZNqGV7NT8D8Wi923sLCAM54J/l+k1yilCRX8N2X/Gz66G/9AVuB/oVD4jt/vNwzz3+l0HiSEwHn7m3r3gqIoK6FQ6K50Ol0mhaiBNZiHEm63O3/27Nlyujjzqt0CJvhfu8126w5BEL7PcZzuaXq19hQKha/7/X4omsXb2tpWDh06lAyHwybzf7c6vEHP3Slxr5bXo5RmRkdHX6L69ld6e3tjkUgEPrOmPtcyBv8nVfWa1XQ6zVwZxe12I4XuFYqiPIPjuJcQQl7YAGn/JwwTpBdeXFz8x7W1tXnVl4r1PCOKInzwwH3gS23qIMdaxv1ulUXa8jNnzrQ6HI7u48ePf8Jisfz2br1LDc89L4riXTzP//j8+fNaYFDTkoqMDv6TZzzjGU+32+3jNXRQ1UUlSTo/MTHxGsjfdXR0xGKxGJyYRmIwkWuuueZoW1sbZMx0vyRJ8nm93jeociexrq6u1VQqhQgoQx1m1AMwnNWIOKr6opSWZmdnX5PNZpckScLit3ro0KFYPB7HAmCkcVJ1m/UoaDL/67OiBv4j37wqQYWNh3nI2cKs+xj8hwoRgPzlQqHw00wm86PV1dVRSZKwMc05HI5coVDAeoZ/F91ut3j27NkyE7q+0WnevU8tYEMAgMPhOHL8+PEvWSyWaw1gBwTC/DCbzb56ampqHrnZ9kM6gAaB/2BER3p7e6Mb+VOxNpn7IQN8EHvxFRmB/15N9r+1tXUln8/HPR5PwczvyHYE7RT8j8fj983NzT0O/qssHUMHaDNk/l8PR6bD4Vjp7Oxci0ajpuw/22G9a7WzAv8rZP+1IMCmDo5yuVxfppT+MYuOiEajbwuHwz+tkPuPHzhwIJZOpzWGYNM6iFnYQ886WYP/drs9WiqVIrsta62nzXarLkEQfs5xnJvV81XZ/w+qRDRIs2uy/6weadbbBBZwOp2/Rwj5BuNXoV6v9wWEkJQoiiA5Inir6fGgBoD/URX3YcH8J8985jOPiaL4PDVdyCmO4+Bnwk/Dr3w+/7WpqamPg9UvyzJ8R/BrZB0OR6JQKAD/wXjQGP8Nf789+EDrkSNHWrPZbPexY8feabVabzRAG+HnmspkMn8SDAaDHo9HalafgNHBf25kZMQCdj4h5M8YDAw5Fou9fmFhAcxusP+NyOjmBUF420aU0r1624dSWlxYWLg1nU77RVGEfQyxIG62gyAI929Ei76+VvuIojjq9/vvlWUZkz6kplZzuRwUIvImc/bC1jTB/1pH2hPLV8r+I8JZzW1mypttYdZ9DP5vNchylNI5WZYnKKXIZ/i9iYkJ78jIiHz69GmA/qYTqr5Pcz/fXVYAOHToUKskSb2XX375nTab7VWEkJoC6nbJgJA2fqBYLL7f7/cjf9eeDoIRBAF5Z5/PwtayLAd8Pt/rJUlCQFrZSeLxePLNegBiYQOzzuayACvwv1L2v6+vL24EGdDm6pna36ZO8P97drs9BjDHBP+3tr3G/Fd9HeX525T9r32cGuUOVuB/oVB42O/3v2dTjuSmC1BHrmBRFD/LaD8kJ5PJ+0Oh0PesVisCjXKQje7o6Ihms1mAJSZDsM4PhRX4vxGwes/S0hJk/6FchXmQObO1TlM0/e2CIPg4jns6qxctFov/6fP53qumYKpMNcLqkWa9TWABl8v1G5RSqEogBSGzy+fz/WGxWCwrR6nzQtOT/FiA//ATSpLkp5SGsY/meT5vsVhANFIIIVjXEHjDEUJAAMB1Ib9iN6W0heO4AxzHHaSUdhJCDuHvHMf1qj8dzDq0yoplWQ6vra19eGVl5RwhRJQkqbyWq6RXYIJoM5je+H+TPFWlXaso9nhaUYfDcejKK6/8C4fDgXSVuxL8UcX7VhbJUkofKpVK7/X5fCCnw6fYVOqihgf/MccMDQ39Gs/ziOq319hB2xYXRfEHgUDgLlEUV5Dn5ZZbbjEau4NcffXVPQcOHJjmOE73iVQUxZ8GAoG/VKPhsFHGJGgYlhekZBRFWeQ4rn3bwVBRAAvdwsLC69fW1mBXqB1gU4D245BgKOWDWtqtR1kT/K/PipWy/21tbZFcLodNlgn+b2FWE/y/+FgjhAQURfmixWL5VqFQmBofH0e0vBkEUN8nul/vfjwAIJ/Pd11xxRU3tra23ksI6TSIQdYlSboll8t9d3p6Gkw1hVKKQ+ye+h5Ygv+SJE14vd6/rEgDBTs2vTyiQcan+Zo7sABr8L+1tTWSz+c1ZkZ7JlYAACAASURBVKvp/NlBH1V7S53gP3wE6CcT/L+AwSvAf5xjV3p6emIm87/a0Wm8cqzA/1Kp9PD4+Ph71H2ABsQ1FfjvdrtPKoryVY7jjurdc/APFYvFb09OTn5IlmX4g7AHQkAk5p+yUp+ZXq1+q7MC/6PR6D0rKysIkDfB//q7qVyDIAghFt+a9nrFYvH7Pp/v7Sr4vzwwMJAIBoPwi5nXHrbA0NCQwPP8T1jgP5Vmm56efmk6nYbcu5bnHuB/Q/Pc19qNjMD/Wl/DkOUppbl8Pv+NUCj0RaS2JoTIUE612Wzroihif4wfYD+YYwytItbEHUSGh4ct4+Pjjmg02nns2LHnt7e3v4sQ0tPE71z5aiVFUd4uy/Inx8bGsA9umiCAvQD+c1dddVVXV1cXogr79B4QlNK1mZmZl6fT6emurq7owMBA1oA5umxOp/PrhJDnMrBPaXFx8WXpdPp8sVjERtlQsv+CIDx7I88bogZrYigqirJ87ty5V6uTPgCz1SNHjsQNmBpC7yGxbX0ul+s8pfTktgXNAltaIJ1Of3R6evoB1ZGABQVqE9ic7CmQSo/uN8H/qq2IyF1EsH61UCjcOTExAQcVxhPADOwTzLFVtSn3dUEtWtfBcVznZZddNtjT0/NFQsgRg1gF6TISiqK8UpIkMEk0FYA9M/4bAP5DRaks99vb2xu/7bbbTOa/QQb/XnxNp9P5C0KIoGfbJEkaU2X/1yD7393dbTL/9TTwBeqqB/xfXFz8ngrmrA4ODiZ9Pp+hHXaMZf/L4L8a1G7K/jdgbO/GIxiC/98ZHx9/t5qaDsE2a810RnW5XH9EKf03FoQY9CNYyIFA4IOqPHBezQsM4D8xPDy8fubMGc0JvBvdvmeeyRL8D4fDjzP/Tdn/+ofMxtqN9QSMXiYXwP/Jycm3S5IEMowJ/jOxcvNV6nQ6jxFCziHtIMu3m52dfWkikSiD/wcPHow6nc5ss8/jJvi/sxFRLBZ/uLy8/NFEIgE/hmy1WiHnX5QkCXthje2vyfyba/nOzFztXfAp8r29vY5IJNJ+ySWXXN3X1wef4hXVVtAE5ZKKovy/lZWVj0QiEQSL7PqY2RPgv8fj4b/yla/cwfP8PzHoZJpMJt8aDoe/qkrbYzIwGsuWd7lcL94AXL/MwD5cJpN5VzAY/DwWxaNHjyZnZ2cNYx+n0/kJQsgra7VLLpd7MBAIfMRqtRYkScKhDtGAAMwM0/Za26xXeZP5X58lK5n/qoOuzCQwAdon29XpdL6MEAJZR/Oq3gIlSumPCSEPwkE2OjoKR3BTSRZV3xSz5C5YQAsAsHd0dHS0t7df1dPTc5fNZvtDpAbYhffZySPxDTwiiuJbx8fH4VjYM0EAjQT/VRaOyfzfyQg079HFAqyY/yr4D0dzJbPVZP7r0mtbV1IP+D83N2cy/7fpm0rmv8PhWCkUCloqP3NcMxzXu1U1K/C/QvY/AdVMdR+w6zL3giA8lRDioZS+lBFTVMnn81+fmZn5VKlUwpkcbQZYAL8hzukaOWbPBJPu1tjFc4eGhp7D8/z39H4HMP9V8H/1wIEDq+l02pT9r9PIrMF/URR/NjEx8SYV/Mecg28O36B57WELDA0NXcbzfKBW9d5aTTI7O/uyTCazIElSmfk/PDycMcH/Wq3Y1OUL+Xz+TCKR+M9IJBJUQX8oOwD0B9CPtRsEKQQAYF7B78x0qY3pUjIyMsI/+uij9nA43G63248cO3bs9Xa7/RUcx7U15hXqfgp8iD+WJOl9Xq8XqTd31ae4J8B/lZlodTqdK2rOkLp7qbKCDRbY3Pj4+I1WqxWHYcNJ26MtbrfbpijKTzmOc+pqHMx+irJ07ty5P9FyvI6MjOROnz7d9NL/11xzTWdbWxty/CLPTE3X0tLSX0YikYDVas2CTQJViFQqZSjVg5oarGNhE/yvz5gq+P+AzWZbUx0rJvh/AZOazP/6xpqqLnE/z/OfP3v2LKKe93Q+9LqtZVbwuAUQlOnxeJDTDZvzA8ePH39xW1vbPapkl2H2npTSf0ylUvcfOnRo6ezZs4Yf/yzBf1mWpwOBwGsVRYmpqaBMOXRzTthVC7Bk/hNC1nAuzOfzCAKAQ8gESRn2dp3gP0AigNkRk/m/dSdRSpOjo6PXA7B0OBwRFfw3mf8Mx/RuVs0K/C+VSmXmvwp4IwewNj/uCuh93XXXHSoUCr+/sQ99H8dxhxnZXC6VSj+ampp6f6lUAlMQPwCNAULiZ93j8ZQ8Ho+5RujUAayY/5FI5J6lpaVH7XZ7tFQqQbnCBP/r7DNBEOA7Z6YAJ4ri6NjY2F2Ya9ra2pYvueSShJGIaHWad9/efvLkyW6r1Qo/PnLHM7ump6f/DLL/6pyAAADMCbvO4L1Yg03m/7bDAakdE6VSyb+ysvLpVCq1rMr7o18RuFew2+3rPM9nC4UC9sEgMmBdB/C/K3uZbVu0twvwAwMDtmg02pZKpTqf+tSn/np3d/c7OI7rJ4TUpN69m2ailH6uVCq9w+fzTVWMpYaOJ8M4YKvoKMvQ0NAHeJ6/tYqyNRdZXV29bXFx8QdaXndKqWgkmW044h966KG/3pA5e2/Nja/ihng8fufy8vK3SqVSdHBwMGUESUVBEG7jOO6DVTTvCUUkSQr6fL6/IYTkCSFJVRFCc3I3fdBDre3Vu7wJ/tdn0Ww2+5GpqSnI/sOhgoOpFuHc0MWjvlY05m4T/NfNzmCvfDWZTN4VCoUw1zX1oUe3VpsV1WsBbMhtHMeV0wB0d3c/tb+//y6r1fqieitu4P1w1sYope8YHR39V3Wzbtjxzxr89/l8r5UkqQyyqcFDJijawMFqPuqJFmDE/Ndk/8sSsxXj3NyDMRyA9YL/drs9BjDH7XYnDJi+7wmWZST7nxgbG7tBkiQT/Gc4jpul6kaA/62trcuHDx+Oh8PhXWH+C4Lwhg3W3p2q5Dgzn2cul3sgGAx+DqkgZVlGbuCMKIqVjH+ABibwr+PgZwX+R6PRu8PhMPKIa/m9TfC/zn4TBAHkqPY6q7ng7bIsj8Mvq549Kpn/5p6MldGboF63290GAiLHcV0sXwfgfy6Xm68425rgP0uDs62bSpL0y2Qy+WAikZjKZrNg9MOnI1mt1iIhpCiKItj+APw10L/o8Xgkj8djqqCy7ZvtaodPEQqi8Cl2dHV1XdrX1/dKh8Nxx3Y3NtnvU5TST8Zisf8bDoeRgq6hPkVmG+HdMLLT6fxdQsjDLJ5dKBRO+/3+d6qbQSOyPMjTn/70KxwOByLkdL9EUfzB2NgYDlnYLMM+TS/1KgjCdziO+50ajUETicR7Zmdnz3Acl1OdScghaYiAhxrbyqS4y+U6v5GC4iSTyvdBpVuA/3FKKTYs5iFnU/+zkv3PZrOfFEUxqdr8cbvzPA8llPJb8DxPFUXZvMaibPn/tLKEECshxGGxWJCzzG6xWDrxAxUbnuePEEK6CSFgUDfDhbH2oVwu96HJyUmAe2is6dBqhp5p3nfAZt3CcRzGMJw/B44dO/Z7ra2tN1ksFt2ViBibAXmj3+v1esEiNaTsmyAIcFBD9lb3S5blUCAQuKNYLILlY4L/ulvYrLBWCzAC/71erxeAUqXsP8485h6s1g6qoXy94L8avK+laAMYZ9iLMfgPxzYAFFP237AjZPsXZwX+b5L91/YBDQH/jx496uju7n4uIeR5lNLnchw3sL0l6ipRSCaTHwmFQvA9aoxBAJ1Q5NMY/wAOTNCgLjM/+WaG4P/jsv+qT9ME/+vsuwaA/5M+n+/1FeCs5oc292R19l0z366qGmON6Wb5nirzf0HdQ5bVQCilcjP7XU3m/5NHhCRJ4wsLC+9NJpPwUWC9LoP+KqMfexSc4zTgH8QFnBMAzpoS/yw/sNrq1lKLasqinVdeeeWvd3Z2vspisfxGbVXtbmlK6c8URfnH5eXlr20EHWq4KfM1a8+A/5RSQgixCIIAcPsyvbuTUhobGxt7sZrvBZMGNveYMIx08YIgfIXjOOTe1fWilKbHxsZeZLFYljYicDQJ/KaVRlE3DOjHWqMFC3Nzc6+Lx+PYBOBAAEdSbGRkJGuEVAe6dvoOKzOZ/zs0nHqbJvsPtllbW1skl8vhkINNC/MFo743b/zdrJj/oVDo5kwmE5FlWds4PmFjaLU+ltpckp68ROB3+H/tT80q6r+J9qcaJIA1mhw8ePDSgwcPDjocjuMtLS2/QghpJYQASEX0425cCVmW/3ppaek/YrEYNsoYe2YQwG70hDGeiXHM9/f329PpdGs6ne7A2nv8+PEb29rabieE1LoO72qrKaWfzWazbwoGg3ACGCoVgMvl+iSl9CYWBpRleT4QCNxeLBZhl/LeyJRDZ2Fps85qLcBK9t/r9SLYuQz+9/f3r+0Ws7VaO+yFcvWA/4uLi4+owACCtZNGUKe7WJ8xAv812X+cbcuKFh6PJ2dKle+Fr+fJbWAF/kuSNJZKpT5TKBSm7Hb7Unt7+2pLS8s6cud2dXXJjz76KBzqdakkjoyMWM6fP9/W0dEBB3CXLMsneZ5/CaX0BjXYlHmnKYoSj8Vi71tcXBxV21NQGf8A/pNHjx5dv+mmm0ypf0Y9wRD8v3tlZeUnSOmpBrGCGQoAyLx2aIENBQ7YEOc+JhfOHuPj47fJshxtbW1FKiYz5RgTSzdfpaxTSqDF09PTN6bTaSgMVM4JTYtx4J1N8P/JYxVEuWAw+OfZbBZqpmVpf5vNVuB5Pl8sFvMdHR35Dd8O/r80PDwsnTlzpqGM7Ob7upr2jco+RVUFAKlFy8Siq6+++vc6OzvvMlp6UY7jvp3L5W4LBAJLHo9HZH3m2jPgvzo8+ZMnT/6h1WoFwK37lU6n75uenj6tbgaxudeigXR/FqMKiSAIN2/kx/gYi/ozmcy/BIPBj6pOX0Q8N63MmSAIf78x8b+pVjvIsjwzPj7+elmWEaGTaG1tXe3u7k4sLS0BADOvKizAAvxXFGUxm81+RVEULboecxtV2dVPYFqr/1f5u8fZ2BWvj98T1KfVsZnVjbIqs1sr+zib22azHeR5vsNisfRYLJYr8FOFaaoqojL/MQ/hcAN2DuYiRCia4P8mC7Ji/s/Nzd0cj8dxEMB3X84DZbfblcdSPXKc3W7n8PfNf27VwSgDgF8tjz+JzWbjRVEsA//Y4NhsNosoimBPIzjAZrfbO1tbW7s6OzsHOjo6ftNqtSIgABugRl4lSun5bDZ7UzAYRO4iDQQ1x2Eje8FYz8IYrlQB6Ojt7T166NChG1paWl5OCCl/DAa5ZkVRfPPY2NiXR0ZGSqdPnzZEAIwgCEj9BOBS9wvyixMTE7cVi8UVh8Ox0tXVtRaJRJpeBUp3Q5gVNo0FGIH/Xr/ffychJC6KIvZgJsusAT1eD/g/NzcHtRY4bjXw32T+b+ozSinAf4CncIwu9/T0rEWjUciemnu6BozvRj+CFfhf0Q6NCY89gEgpzRFCAJhAqU6ilCLABD9g7yTxe/VepNWMbqRaArB/WP0/GyHkiKIoR3ieP0gpxf93chwHxbRDOHY10n6SJAUWFhbenUwmMf+jTTiDZx0OR9JutyfT6TTa0rQ+sEbaitWzhoaGnsPzPOZ1Xa9oNKox/03wXyfLCoKAYOAenap7UjWKoixPTEy8Rg08RvAxAo/NswcrgzdRvY1Qk/3lL3/5wo1zMwJYtJR2TR8QZIL/Ww9SpG72+/23Ib2Vutd9XNpfXcsNqerYRJ9kI1+lHADQ09Njj0aj8IF3dHZ29l522WUv2fBB3boLfvF62r6qKMo7z5079+Hh4eESy8CTvQb+k6GhoT6e53/JYpNBKQWr6cZ8Pg/QB8AbNvd1RS/XM0pqvffkyZPdVqt1mpU8DiKqZmZmXpROpwEEaXKBTaeOoOYImq84VFZtyuXl5TeurKx4kQdGlfzH4QALSFNHAFbdwAYUZAH+g2ng8/nukWVZsVqtZSkfSZLwd7CstXmu0oFVZljD6aD+XgsAoFarlaiMba185f3loIIL1Vtxr8bsLt/b1tbWfvjw4eNtbW2DdrvdabVahZ2aepPsv5bbzGT+b2FQVuB/KBS6KZlMLthstpTFYkkUCoVcR0eHnM1CEOYJV3m8dHQ8FvC++ff4/4r/08YZNjO48CfvcDj4QqGggab4EwPXarPZrKIolv9+4MCBrsOHD7tbW1uvtdlsbp7ndVe/uch4zUmS9Obl5eWPxmIxOMAMxYTe6Xdo3rdjC2iSXTZVuaLdbrd3XHLJJe7u7u6brVbrc7TUGDt+QgNvVBTlU8vLy/esrq4aIiBUEIR3bDiq72FhIkVRVqampm4FICqKIhxw2B+ZDjgWxjbrrMoCpux/VWYyRKF6wX+73R612+2r2WxWm6sNC2ozYv4nKsD/MoBCKV1vZmlbQwzcJn3JBoD/Tdryul4rv76+/tXZ2dkvlUolnHfg+8EeB2AQ5pX0wMBALhgMGo0cVJdRduNmhsz/zeC/KftfZwdvrN3wVfXWWc0Fb1cUJeH3+19ZKpXwHA38h4/eVCRkZfQmqVcQBGA+LFMIyl6v9/clSYLfP1oqlTC+MN83Hb5R2SUm+L/1AKWUKolE4q65ubnvqlge5vfiyMiIfPr0aVPev0m+6xpeQ1MBgE/x8VQAvb291/T09Nxis9mQ3nu3VHJraMZjRSmlDyWTyXtmZ2dnR0ZGRBaq4nsN/IfdIP3/bY7jfrtmi29zA6W0FIlE/mJ5efms6tTEhIENviEcCE6n88WEECaqCJrp4vE4JtT/xOZrYGAgHQwGEfncVPZxOp2/Rgj5Ua0AAxzb586de5Uazf245L/RgkD0/i5qrY8V+O/1eu/G92i1WvOSJJVBSJvNRkXxiWptNhvWh8cuURS3ZP1rYwP3q+U4m81Wni/Ve/DXx+dP1LlFXWBw4/9xL5jc5dzXYG739PQ8vbe3953I516r/VTZ/y9VSM4mTcnZra3IUPYf4P+s3W5fK5VK5TQwAwMDUjAYfMJcNzg4+PiL+Xy+i3a1VhblBgYGSKFQ4MPhMO4pBwFoP52dnZZMJqMFAWAwg/Fit9lsdlEUbVar1f6UpzxFOHz48Gt5nu9XmTG1DrOay1NKv5lOp/+K5/n5YDBoRs7WbMF9d0N5PlTHL9hb5SCA9vb2o1dcccWH1AAWLRCmqY1DKV0sFAovSKfT00tLS1pu26ba92gGdLvdr1cU5X4WBqWUrgUCgdfk83lMXKYDjoWRzTprskAjwH9V9t9UX6qpZ2ovXCf4/4i6X4tA9n98fBzs4qaco6uxDCPwPzk2Nna9yogCiAKSg8n8r6ZDDFjGBP9r6jSK9JaLi4tvjcfjQRANVF8QAEb4g0ACwZ9aQIAJOtZk3toLu1yu36KUPlL7nRe/w2T+621RjnO5XPOU0sv1r/nxGgtTU1N/ViwWF0VR1FKOYe0yDEGPoW32dNWswX/M+6Ojo9dbrdasxWKJOhyOVaSxOHPmzL4E/wGes947q6m8mfl/FEWZ8/l8f2Kz2ZZzuRzWbo24tKe/lb3cOI/Hw3s8Hkt/f781HA5DBQA/nYcOHbqsv7//fTzPDxJCmI0pnW0rFgqFF8ZisUc39iPa2NTtvLoXwX9y4sSJp9lsNuTg0l0GrFAofNbv9/8jHJt9fX2Qe0enGGKTLwjCNzmOe4HOA/QJ1ZVKpTOTk5N3qZsvSGE2XeSl0+l8FyHkjbXaIZfLfTUQCHxEbROcIthganljDDEGam0zi/IMwf+7rFYrWMiIvk+1t7cX19fX0S+Pz3Pt7e3c+jrOA49dFf8uBwFs+v1W//ckk3R0dNBsNltmeLe3t5efhWfg7+qztKi0MmDb0tJio5Tau7q6+vv6+t7P8/zxWuy8Gfw3Zf8vbD2WzP9sNhtSc8jCmZypyCFbHgOUUk7dIG+pPKEFRamb3PKirv59c4O0+x9PA4Cx2tfXZymVSpZYLIZxhSAALRAAkY8tVqu1vbu7+7Kenp4/stvtL2mQpPr8hgrCG/1+/9dUmU+J9SGhlm/HLNuUFuAHBwetPp+vpb29vW19fb2ts7PzKYcPH/4/XV1db+R5/ilN+dZPfqmkJEl3e73ez6u55JpSDcjpdL6UEPI5FjallKZCodAtqVRqHg6SQqGAwCgsuOb+iIXBzTq3tQBr8H9TflndDufbNmwfFtgp+B+Lxe5bXl7+nprDedXtdifOnj3blPNztd3KCPwvM/+haAX1Fsj+r66umsz/ajvFYOVM8L/qDhOz2eznwuHwt/L5POTdyqkL4AtqaWlJF4tF+IGybre7aPR5pWqLNEFBhrL/d6+srPwE68WBAwci6XS66SW+m6A7LvoKTqdzhhByJcP3pFBkzGazQW2dHxkZybJgTTJsg1n1DizAGvxHSonx8fGbJUnC3A+/PwLb8femDixhwfwHCTaRSLxXPdsj1S1VlP893iM9Lq7K/8O/N6XNffz3m8tbLBYqyzLK84cPH36FzWZjpuhQKBQ+5Pf733fgwIF4f39/tsKHu4NRaN7SJBYgIyMj/OnTpzEQWzo6Olqz2Wx7W1vb4Z6eHqGrq+sNFovlaU3yrhd9DUppVlGUf1paWnpnLBbDflMj1dX9+nsO/FfBE8sGu/s7hJDhui305ApKk5OTL1xfX5+FJN7w8HC22aO/0ARBEJ7NcdwPGNhjc5Xi0tLSnycSidFSqYRFEgtk06gjXHfdda2FQgGpDy6t1Rarq6t/u7i4+AvI/bS0tMTg3E6lUk0v/VNrO1mXZwj+36lKMWHcaTlYLwg6DAwMcMFgECzr8p+1XlXcR44ePcrNzmKqeCx3u8p01diuLVdfffV1Bw4c+GItz4bsfygUekCSJLTRlP2/iPFYgv/JZDJUkf9LU4H5/+y9CXwjR5k23t06LB/yeDz2eMZxJpPBM8l4Ziy1lAD59lvWwJ+FP+SD5TCBBEgCIeTkCoEEvixKQjgSNkCAZSFcC8sRBghLYIGEY4CFZJeY8SlZtmxZsnzovu9u1edXqZ5VHM9IbXfpsKt/P//mcHV11VvV1VXv8z7PK2coN1t2fTBAUUa9r68PlAIgDUBpEABIHTV3d3f37927980ajeblLMu2bvbBFd4Xg1zoLpfrO+effz4ERSi2Yanw+bRY41lASgWg3r17d1M4HC7m7tq9e/e+np6eq5qaml7TIEEAeUEQvuB0Oj+ZSCTAISztfeoGFDSZTC9HCIE6E4krMzc3d10sFpvHThIJ/K9rJwkJQ9A668MCJMF/jUYTUqvVq7t37w41UiB4fYyM/FZsFvwPhUIfc7lcwBCFdHRwPoAAYVCla9iLJPiPg9ol5n/dBfA37KDVWcMp+H/uAQGgI5/Pj3q93q+Fw+ElURQFtVotrAV5gsw/BDXCuQ9+4N+wnsA+p272enU23RRvDkHZ/w95PJ6nsMIrAH1U9n+Lo0fC77e+ST6f78NLS0v/uQ6grWt29hbNSm9/Bt8gKvsPOeInJiZuxesAnGklbKOuJeIJgf9Zt9t9SygUgvTX0vdQxKlwnzMfpf/HaXYhDa+UErfs3O3s7Ow6cODAN1mWfSZvqsJXoVDwzs/Pvz4ej7vwmQC+49RXobCda1RdEXPp7+9XOxwOIMSBumibXq/f29vb+w/Nzc1vYln2QI3aJuexoiiK34lEIne73W5456R0UlvaZ2478B9blDMYDNdwHPc1ORautGwsFntgcXHx2xqNxpdMJiXm95YGotJnb6bc8PCwyuFwAPD/N5u5X+496XT6e3Nzc/eDfVKpVBjLqdSFfQwGw+s4jvuR3D4VCoXA2NjY1fiAB44j+PgD+5/ms5VpTBKHAEEQJicmJgD8h/cRnFbg5EuXyhOVMKyLLP3SZpf+bh1ju8j+L/k/uG39/Wf7t3QfY7FYWIvFIt17BuiCD9KJEyc+qlarb6nUjLFY7Ctzc3M/AMczsHMo8//sliMt+1/iHIgjhGoqIyvJZJnNZm5kZAQCTUqDAABMhc1Py/Hjxz+m0WheggNRKp12ssuJoviA0+n8VDwelwLAKPtXthV33A2s2WxWj4yMQBALBK4UgwA0Gs3u/v7+m3Q63RUkFJ2UtnKhUPi3ubm52xKJhBQUVDdOApPJ9EKEEDjIIAhN0Qu+twsLC9dGIhEIsIQ9EvyAk5w64BS1NK2sUgsQAv9hv3kbwzBwvlnBZwEq+1/poGyynALgP5zZAMyJArDXyKpEhMD/ouw/y7IQwLkCzH+/309l/zc5X+v9Ngr+n3WEwOE6t7S09NlgMOjGykUS2x/eBzjTAPED/g4+IBrgXIPJTgr893q9d/h8vidLmP8U/N/i+PI8/yTDMC/cYjXnvD2ZTH5rZmYG/P7g/yt+5+nZg6TF66PuKoD/f52YmPgwgP9NTU2+1tZW/1qK47pPKUEQ/L85FArBdxHOPGCHUkDyDK6o1WqZXK7yGFsoL11wH/z70KFDVzY3N4PtiVyiKI6Oj49fhX0VDZXKm4hBtl+lpXgLBAEA+a1Vo9HoL7zwwre0trbeiH2Ndd3zQqHw+NLS0rWBQADwx+xWU29sS/AfQJCBgYF9Op0OHJAAeCh6CYLwX9PT07eqVCqQNZWk7es2WshoNHawLAss1Q5FDXGWyhBCKzhvIESpwCasXuRxOJz64OVy7RCLxb6wsLDwH6IowkFPYo80vANJrh2UKE8Q/AdnLHy8i+D/8PBwuo4lvwCchfVXc+jQofN37doFkasVMbKB+T87O/sDrG5Amf/nmJSEwf9S5r8kC1gPQU7F73qJ9BEAqbCr1ul0umaVStXR3d39go6Ojo+yLCtbAUXGGiCIovgTj8fzvlAoFBweHs7V8fsoo1u0KGELSOktiuks9Hp9syAILel0um3//v1HOzs7r9VqtZC+SHHwWsl+iaL40/Hx8evw4Rgku+oiAOCSSy7hRVEEVpPiabHAfl6v9z3Ly8vwPZPAfwiMEhsZaFNyoHNxQQAAIABJREFUXtC6qmsBguA/BJsGQfZ/z549QY/HI73j1e3gDnraZsF/kP1fXFz8bQkoAA6UulGk28wQEgL/i7L/cI7S6XSrWNqVBrhvZoAa4B4K/j93kHK53H8FAoFHAoHAvCiKRTa/Wq3OCoIAQEdCp9Ml1Wp1MpFIAOgBv4d9HQ1srsF8JwX+r+XYvWN1dRXAf197e7svFotR8H+L48vz/O8YhiGhxnumZblc7k9TU1Mf0Wq1wVwuJ4H/Df2d36LZd8TtpMH/bDb7q5mZmc8IghDV6XRevV7v9/v9da+IRBj8B3W/iE6nC2cymbRery9iYPE4uEKfTZDT6/XFeYh/x6z/97kmaU9PT3tvb+/PGYYhJtUeDodvXFhY+EVnZ2c4FAqlqL9iey0bmBgnBQEAKe5MEMCuXbvO379//zU6nQ5S48L/1+2FEHra4/FcFQgEloeGhjKnTp3atNLUtgT/8cgB+/8+juPuUHokEUKpubm5K+LxuAM+AvFnVrS63WDwPP+lNUD0BqXtcLb6ICIlFAq9z+12g7MFHMAQfQmHpJoCY/39/U16vR6i1fbKsQVCKLmwsHBrJBJZUqvVcZxPCgIAYNzrNuhDTh+rWZYg+F/K/A9aLJakxWKp90M55G5v7unp+TXDMJdVMg7xePzhhYWFR1iWPcP8RwhlKLjyXOtVC/w3m82xOs71CIEmUsoJrZQDCRjVAwMDH9RqtcMkNz2iKD62srLyfr/fD8FgdQOCVvKu0TI1tQCopcBPMXhFr9fr4vE4BEi1HTx48EXt7e03qFSqwZq2sMzDC4XCr/x+P4DhHjz3N71ZV6qfBoPhCMdxAM6DqoLiVzwe/6zD4XgUVFFK8qU2dH5txY1EK6yaBQiB/xM2m+0DJamXgnQPRn5INwv+l8j+F5n/AwMDkTWQoKZKTVu1FiHwv8j8Byc3DqIGe9W9k3urttyp91Pw/5mRLxQKy9lsdtzr9f4kHA4vYjAf9mrgt8pqtdpULpcDEovE9M8ODw8LNJi5tm8OafCf4zgfTl9Kwf8tDrXRaHyUZdl/2GI157wdIRQbHR39B1DF1Gq13mQyWWRJ1tr3TLLPtO6i7P8MwzCHSdkilUqdtNvtX9VoNFFQW+3p6Ql4vV7YF9UU0yjXX1Lg/9LS0k1+v38WK575e3t7k8vLy9IZX8IV0cDAAGu1WovquWazGY2MjDwLcxwYGGDw7xmz2cyMjIxAl84o6eL7VQcOHLiws7PzKZZln4kiUPgSRXHC4XBck0qllvr6+mI0kFthA9dXdZzZbFaNjIwUCXGSEkBfX5+ps7Pz3RzHXcKyLPjL6/VaDoVCwy6XawKUNxBCwmawn20L/kOkx4kTJ/o0Gs0kwzDtSo9iJpP5ts1mexDLPoctFkvGYrHAIldXHwOe5wfWSKBTSve/XH0AmI+Ojr5Yp9OBOoIkj19ToNxgMLxrLW/wv5Rr+/rfFwqFFZvNdiM+/IHMJwQ0wJ91//GX29dqlCcF/mNn7LNk/xskOIM1Go0Psiz73krsXwL+h0Gak8r+n91qpMB/t9t9TTAYXKgn2f9K5g5mS6s7OzubstksMKr1+/bte1FnZ+fnSYGB0C5RFH89Pj7+VmCUDQ0N5bYSsVhhP2mx7WOBYu4uhmEkBYti7i7YtF988cVX63S6W0gGr2zVjAih+dHR0b/Fc39L0bpbbQvcPzg42KdSqWBfvEuJ+tbXkclk/t1ms31Gq9UGMPsGHKeVa/+RaBStc8dagCT4DwGYarV6NZ1OwxmHyv4TnmVms/mGQqEAweyyLgz+n2H+U/B/Y/MhhCKjo6OQWgfOUcCc9APZYTPOJVkDRAvXxAI7GPxHcAmCMLK0tPTVcDi8hH134KMCEAN+YD0H1QsA/FO7d+9O7dq1K3vppZfmT548CX6+eicW1GROVfOhJpPpJQih3yj9zBLmP+T3hnVQIngp/agdUx/P8w8zDANKaEQvu93+6nw+v4RTYoZpUCZRc9dF5TzPw/67k1Rj4vH4lxwOx4+xr3W1t7c3tLy8DN+Huv4GkAL/3W73TbFYbEalUvmz2SyskbA+lqb2k3Cw0pS4xb+fLf0u/D+MH95rngkgwL4frcFg+ArHceBDJHJls9mvW63Wj+/atSsUjUalVKVEnkUrrb0FLBYL99hjj0lBAJJPsa2vr+8FXV1dnyEVaKJQz1fcbvdLgsEg7FthHZJNrtm24D8Y+ODBg7qOjo7fsyz7fIUMfqYaOCTPz8+/ORaLQfQTLH4ABNddXlOe5+9aWzzvUbr/ldTn8/luWFpa+n09qCMMDQ3potEopIHoraTtpWVCodCnXS4XHDBgjCXJf+rQlmtIXJ4U+D8xMfEBKTITjxMc3GsacFKpiQYHB/+PSqX6aSXlJdl/iG7WaDSrqVQKopup43kD4xmNxqtYlv23Suwqp4zT6bwmEomsl/1vFICLHRoaUp06dQrA1Obm5ua2jo6Oge7u7o+vzUGTHDvIKSuK4g89Hs/7IQUABgNrzoKW035atuYWkGS7VLt379blcrnmZDLZtnfv3kN79uy5SqfTva3mLTxLAwqFws/Hxsaux2lpYK2u2dzHaaAcDMPsIWEvQRDGJiYm3qvVakMY/IfvU82Vn0j0ldZZ/xYgBP5P4mBT+JY1jDOw/kfr3C3cIvP/t1qt1o+ZnBGEEGX+rzM3Qqgo+4/PUQB6wXkXwM+6IjU0+jyul/bvJPAfIZQTRdGeTqdPZ7PZmVAo5Ewmk0DigLkN+7G8Wq3OC4IATGHwHYC/B/6EH9i/SHmN6xrwqZe5VY12kGb+Y5VPWAcp83+LA8rz/P9dIx/cu8Vqyt6+prJ2ndfrHcfKNZCWl6atKWu1xi0wMDCgbWpqgneUWFrjUCh0n8vl+p1GowHClZRqte59riTB/1AoBNjXmdR+JPEvAGq/8Y1v9OzevfuXLMsSUXtECPkdDscbEokE4ESST70h8IPGfXtr3nIWp8eViEUtOp2utbm5uXfv3r3Dayn9bmBZlkh6zK32vFAoTDqdztfGYjHf0NBQSi6hbluD/xAxZDQa38qy7De3augN7hfD4fDtCwsLT+DI0BgcLuopQh6CH3bv3g2bIGJyOOeyayqV+rbdbv9MCVO+ZpFyJpPJDPky5M6DQqEQGhsbA1ABDn6Q70dSMgCHCP0wyDUowzAmk2kcIXRiE7ee9RZBECYB/MeMFdicgdOqYcD/yy67rBMrZJQ1CzD/HQ7HIxqNJpjP52HTC9HN2Xpae8p2okoFqgj+g3MA1oiGuEpyIMGmR9Pa2gpM6r3Pe97zPqdSqSAvH4m9gZjNZh9cWFj4bCqVAmZZlubWaojpUm+NlIJXIHeXrrm5uTWdTrd1dXX19/b2WnAqAPhdXV2iKH7f7XbfGYlEAlvN17WVjg0PD6scDgcELp2/lXrOdi+W3nw9lgQsVaYh8ThaJ7XAOS1ACPwH2f/bBUEIrjkIKPO/SnNwi+A/BHAXZf+xc69RgjU3tC4h2X8J/I9hVTGwFwX/qzS/q/2Y7QT+Q7pJfKZIANsXIRQXRdEvCII7mUxOr66uToiiKDGkwHcD5UUM+Bfl/SW2f1tbWzaRSIC/Kjc0NCScOnUKylLQv9oTtMzzDAbDizmOA0UXRS9g/ns8nifBd9ne3u6LxWKU+b9FC/M8D37Uf91iNWVvD4VCd7lcLkijKQWvQRAP9dWWtVxjFjCbzS2QtoWUkh1YZXl5+T1erxfU8oKtra2QTgKCxuo+oJ0w+A+pFopkyKGhodipU6eIkV/BX3nJJZeos9nsyzUaDZDkSPgnGUEQfmu3298NpIX+/v64w+Go+zFuzLe27lotEYvUHR0dRWJRKpUCUlzfgQMH7uE47tJ6VBcFRd2lpaV3B4NBj9lszshJPUzkBaqXYcUAh8ZoNNpYlj2kdLvy+fzvJycnP4AB4WKEIRxA6gWEMxqNd65FrXxc6X7LqC99+vTpl2JlBPhIgJQKsQ/EudplNBpvZ1n2fhltLxZNp9O/nJ6e/rxarU7jHOug8gBpHrINkE9ebnerUp4k8x8HaKxmMhmYb42Uq5LleR7mVlk2Zgn4HyqJQoVNCnVOrJvBpMH/UmnrzebeqcpLd46HABh48uRJAEtb2tvb91x44YXfgc0OoXahdDr9nsXFxR8kk0lwqIDDjR7MCRl7G1cLe1dpww5zt1mn07UVCoX2vr6+V+3atesTddj3Qjqd/qDb7f6uFPyC1+yqsyp5ngfnGOzNiFzz8/NviEajC83NzV4qiU7ExLTSCi1gNBr/yrIsX2HxiooJgjCBg03h3Lfa19cX9Hg8dc8EqqhzdVxoq+C/VqsNSmoklPn/3IEukf2P6XS6lZJzVNW/UXU8DbdN00iB/5AqMZ/PT7Ns0cV4Zu4ghEDWF7R/izYs/btkVHyPVAbY+hAoLP27IIpioFAogGS/r1AoMKlUyq9SqZhYLOYVxeJRAs7BRTa/KIrS38/8H/igNBqNkM/nJTY/rNtwDoEf+L/cwMBA3mq1SgECdO7X6YwnBf57vd47lpeXn8RKMV7S4FadmlfRZvE8/3cMw5xStNINKovFYp+bm5v7AfY7+4eHh+MnT56kPgbShq9R/UCcSqfTCyRlup1O59WRSMSN949ALoNvUt0Hj5IE/0H2Hyuj+Ku0PkLqxyaj0fhDlmVfSWq6RSKRW51O58+6urqCgUBAIhDSPQApg9dXvZJPEdj+RWKRKIr6np6e53d1dX2WZIDRZs2Qz+e/NTk5+WG8JlWsKrqtwX9sTGD/f4Jl2Q9u1rjnuE9cXV29dmVl5b/xRiNeLwDQ3/zN3+iTyeQoiaAHOXZMJBIPuVyur0lSi/iAVfWF1GQyzSGEZAeA+Hy+u5aWlp5Wq9UJyG/T1NTkp1HAcmbAc8sSBP9v02g0MZVK1ZDgv8lkehIh9IJy1pXAf4ZhwPFcZP5T2f+NrWYyma5CCBGR/U8kEk6O40rzWjcM83+9tUBWy2KxFNMAdHd3d+/fv//zKpXqFeXm4mZ+jxAK+P3+N0Wj0fFEIgEBADRwZTOGpPcU/cf4B+ZuEwSwMAzTptfre/r6+t6h0+nehP+vXqyVicfjt6yurj4mzf1aBIzyPP/ptTx9t5Eyis/ne//S0tKf8PcpaLFYUjRYkpS1ab3nsgAp8B/L/oeA+b9nzx4A/wE8ogGYBKfjVsD/paWl33AcJ4H/sGdu2P0amJgk8x/LXEsKapT5T3BO17JqUuB/Lpd7YmpqClTEAKyXWPPg99nI9yPlBX5OfuAS28B9rFqtBnZe8e+4LqRWqyEQAIoW68b/hr9Lz4U/AfAHYk4ul8tBYVir4f0/83Pw4EFhYWEBficFClTdT1XLudCIzyYl+w/gv8/nexICTLByKZX93+IEef7zn78nn88DKYfolc1mf2G1Wj8pBW7gfOQN/a0narAGr9xsNu8vFArAQgf1SsUvhFBwYmLialEUwVcFBC3wuTaEEghJ8L9E9h9sUq31UdXe3r7r0KFDI2uK3gcVH+xnggxdU1NTr9NqtcvJZLKoUErPdSQsXdd1QqCJlAqgmWGY1paWlq7zzz//ipaWFkjf2V5Hrc+l0+n7pqenH16XVvScTdwJ4D9rMBiMHMf9lcRgZTKZb9tsNpC29/b19YXrhf3B8/wlDMP8GSSdSfS70jpFUZyzWq1Xq9XqJSxrXnUJJpPJ9BKEEEg+yrpANs5qtV6by+XgwwY5YOAgIMnJUyefLGv+T+Eqyf5LcpUNM048z3+HYZgry5k1kUh8ZXZ29iRIULW0tKymUilwZMIGhTor1hmPJPgfiURAOhs2vrAuSJvfRh4D1mw2q0dGRnT79+/v27dv3y8ZhjlQbj5u5veFQmHe7Xa/VhRFTywWA+cyldfajCHpPZIFYC8LG3YNyHZls1lIBdC6f//+Y93d3XdxHDdQL7Jd4KiYm5t7fSKRAHBFciJU9TtlMpkuRwg9Rmr6RKPRT87Pz4M8H6yNsEbSNEmkjE3rPacFSMn+lzL/cSAmsEQa+ftf9zNpK+C/y+UCeWhpvwbnOQAEGna8SIL/JUHUfoRQql7UDOt+gjZYA0mB/5lM5gnsF5Pk9LMajUbM55+LwWk0RRcVm8/nkUajKf4pmRH+LYH8+F4ow8DfNRoNwmWRVltMy4pyuSIZs8jYb2pqKrL/s9ks/BtAfelP+Ds0pBgUUBIkcLbghAYb1Z3TXFLgvyT7T5n/is4lULcEn8kFita6rjJBEGwTExM3Y18tALUSgEfysbTuGlnAZDL1I4QgvTGAdIpfuVzuT1NTUx/DZ3XpPFszFWM5HSQM/kPABeynqwn+w35Affz48XdoNJovMAyjkmOPSstms9nvWK3We6BvZrM5IUdOvdJn0HJ1bwHJpwhBADq8vhSJRRdccMG9arUaUgEQCTiSaxmEUGhlZWUYUpP09fXFr7vuurLK5DsB/GfMZrOmUCgAC0lxKWMAt8fHx99aAgyDk7Mm0valE4bneViYD8udRATK5z0ez1ui0ehELpeTPhLVlMuBDefjDMP8f3L7lkqlvmO32wGQBSmNYq6f/fv3R2geGLmWfHZ5Usx/m812myAIsNEvzfVVVVBlK5aplI2JwX+QNStKzmLmPwX/NzA+KfDf7XZfEwwGtxv4D1GvLMuyAKK29Pb29vf09MDa2bWVeX2We0H+/xPT09NfwfNXCgprWGc8ARvRKmVaAM9f2Kxr9Hp9czweByWAXQcPHnxJR0fH3SzLdsiskkhxQRB+OTs7e1MmkwmbzebkyMhIVZkpx44d6wQJQyKdg3w7z+yd/kUC24aGhuIkcwKS6gett/EtQJr5D3uw3t7e0PLyMgX/CU+XLYL/EAAOa553YGAgYrVaKfi/brxKZf/x2QKC3Snzn/C8rlX1BMH/x2dnZx8UBCGp1WojuVwu0dzcnE+n07L29y0tsH0r7ifO3Af/B/9ubW1FyWSy+P9tbW0okUgUwfv29nYUi8Uk5v96BQDwB0AQgAT0y2pPrcaJPndjC1Dwv6FmBmsymX6KELqccKszExMTl+M0rVQZk7Cxa139JZdcclwUxaex8p/izYlEIg85nc6fq9XquFqt9uJUSA0RzF4t8H94eDhaxdQaXE9PT/O+ffu+ynEcKDuSuNIrKytvWF1dhaCS8PDwcKaK/SPRH1rn5i1Qml70TCqAffv2XdLZ2flPLMt2b75q5e5ECC2Mjo7+PcaFIDjpnIS6HQH+AyPs+PHjL9JoNHD4B2BDsQskW71e77tWVlaewgEAUi6Ymh0qSLO65Bovl8v9ZmZm5oNqtdqXTqcBsKxanueLLrpI39LSYmMY5jw57Qa2w8LCwk2RSERi5xUj3IaGhhKnTp2SDo9yqqRlsQVIgf+YiRXV6XSrbW1tkK8HNmiNBP5/aC3C7JPlJsp62f+DBw+GFhYWKPi/geGMRuNVLMsSkf0H5r9Wqw00NTV54/G4JF9fbvga4fdSxGPL8ePH367RaCDXEYkr4/f73+LxeEChBpQTpHxFJJ5F69w5FnhWKoC2trbmRCLRqtfr9/f19b1Fp9O9g2GYIlWshpcQjUbfNT8//wRWFQLgsJpBoxAUuSh3X1SpvfL5/B8mJyf/EdZHnGMb9sVVDXCotK203Pa2QDXAfzhwWyyWDE1tQXYuKQD+B9ra2nyJRIIy/zcYKoRQeHR09E3A/M/n83D2hXMvfJsa5hxFdgZur9pJgv82mw1SC8F53J/JZOB9O3NG7evrYzweT9GYpX/faEqWsbjkZzvzp9lsZkZGRkr/f6O/b6+B3KG92ayqZzlzScx/7NMtVfYrdyv9/TkswPP8P66pfNxN2kgrKyuQWu0vOIANAv7oN4y00WtUv8lkeiFC6I9YplvpVhTcbvct0WjUIQgCfMNgTwQYRkPMJ8Lg/2xTU5Mvm83C+gj+z2r6L9T9/f1H9Hr9CGZlKz3uQISam5+ff3MsFluA/lkslhw93ylu5kaqELBjUJoA3yGojLSt+cY7Dh06dGVLS8stpJRH5BgolUrda7fbv16yRsE7uSEWvVPAf6a7u7utr68PNgMXyzFmJWVFUZy02WzX4cNyzWXheZ7/LsMwb66k7aVlEEIxlmWJ5LLweDxvjMViY9lsFpwJCYSQUA0pQZ7nX8owzK/l2kIURefU1NT7Ic+PRqOJ5PN5L2b3AEBFHSFyDVpSnhT4j5n/ACKudnd3Q15xYBM3zFjxPP92hmG+Vs6065j/NLL5HAYjyPy/OhgMusA5qtfrAfzfDrL/pZZkh4aGVKdOnWo2GAzf5DjudeXm5WZ+LwjCb7BEHxzQpQCKmgXObaYP9J66tcB62a5W2LAfOHDgst27d1s4jgP5yZrtgRFCjpmZmStYll3avXt3zOPxQKQuBBZW4wIWzpMIoReQeFihUHCNjY3B96zItMXqHjS1Bwlj0zrPaYEqgP8rvb29Ycr8Jz8Rtwj+g+w/nM8p8/8sQyUx/zUaTRTOvNhelPlPfmrX5AmkwP9cLvfE1NTU/dh3IqnTnfGdIIQYln1m61X693JGgLJwSfdix+ZGezh6hihnzG3we4PB8GKO42BdV/QC8H91dfVJjuN8uVxOArdo8OoWrczz/OsZhoGUlUTPXYlE4htOp/NhQRBKZdobxhe4RTPvqNt5ngdVX1CoVHxOASZit9uvT6fTsG+UzrIQBADfsrr/xpAC/5eWlm5cI+44MPhfTdl/aW7DWGtOnDjxTrVa/TlS8v+5XO5LU1NTEMQIAR+Sqnfdj/uOWgCq39lielFQGmltbW1OJpNtPT09A/v27XuA4zhQW1eUYC6newihwPz8/OWxWAyIPdI6teF3T/HFUk5Dq1yWMxqND7EsC7mAlL6K0vZ+v38MIkVxjpCabBSPHz/eo9Fo3Jthtnm93jt7eno+obRxoL5EIvFZl8v1DbyRjiKEMlUC/6cYhhmQ26dYLPb5ubm5X8CCD/K4mL0WRwjlqtFuue1tpPIkwX+WZYuMlQYF/0HC6HvlxjIWiz08Nzf3CJX9L2cphiEJ/kej0QVBEALt7e2rsVhMinzdNhtDSUL96NGjJ3Q6HUTYkrjEtSCKa30+339mMhk4XFH5fxJW3tl1SrJd2vb2dl0ul2vjOK7rwgsvvFGr1V5XS9Ok0+lPT09Pfxk7FkCqq2r7RpPJ9HWE0LWE+o+sVuurs9nsCgb/4d0G5h91wBEyOK12YwuYTKa/IoR4Je0jCMKEzWb7AJaWldhANDBYSSNvUJdC4D+Ml6RE0rD7NZPJ9EeE0P9W0uQS8x+UmHQ63Yperw82WhC1kvbY7nWRAv8zmczjNpvtARz0B0EkwWr5fLb7mNH+/Y8FSIH/Xq/3Q8vLy09ptVq/TqfzxmIxKbifmn8LFjCZTGaE0JMYPNlCTee+VRTFqfHx8ZuwcgOsP9VmJhPrG6342RYwGAzXcxwHZ2jFL1EUF6ampt4jimJMUrHr7++PORwOOMvW/UUK/He73TeFQqHZEmWUWrxfxfSkPM//O8MwLyE0GLnV1dU3r6ys/FeJQiP1YRAydqNUi33jqoMHD6oXFhZABaBVq9WCCsBVzc3Nd9SyH/l8/rHZ2dnbs9ksBCzBe7lherudBP4zBoPhPI7jIE8zRG0oesVisfvn5uYAuIONhiRxVtVFYnh4WOVwOH7MMMyr5XZOEIQpq9V655EjR96l0+leJff+cuULhYJjbGwMJHdBAg4ixSSQp9ytm/692Ww2FQoF2aAVQihutVqvzeVywPoHMLko+Y8jv6rFzNt0v+v9RlLgvyT7L+WqtFgsqUaS6TGZTK9FCMH7e85rHfMfHJkNE4larm9K/54U+O90Oq8B2X8pp/XAwACsGcBs3W4X7BG0g4ODd6pUqo+S6FyhUFiYnZ19YyqVAh3Qmnw7SfSL1llXFihNBQCyXZBMtu3w4cOXt7a2fpBlWVlpgZTqGd4XDWOGZdhisaSr9c0ymUwfRAh9Sqm+rK8nGo3ePz8/D98ziUHaUEo8pOxC662uBQiB/6D2dts68B+kQBsWTK7uqGzuaVsE/yHtHzhEgA0I+4yG3q8RAv8jo6OjV+A0THC2AHtR5v/mpmvd31Ul8L80OIquj3U/KxqngWaz+cWFQkFx5r/X673D5/M9KQgC+P1g/0rBfwWmhdls7gJVMHz+UqDGjasoFAqrs7Ozb8c+BRi/mqfjJdbZHV4xz/P3rCnm3UXCDPl8/kmbzXYvKACDr2/Xrl2+aDRa1SD9rfSLJPgfi8VmsbJGLWT/JbOojx49eolOp4P0iW1bsdXZ7i0UCvbZ2dk347UEvgMAplYV2yPRL1qnIhbgzGazamRk5EwqgAMHDlza0dFxt0qlOqrIE2RWghBKLC0tXeH3+4H4DIoVG2KtOwr8B2kQnuch/zMwbBW9CoXC0tjYGDhxSx2d1cyBwpjN5gOFQmGUYZjdMjsnLi4u3hwIBNzd3d2955133j+zLKt4TtxgMPg+t9sNi7SvGtFzPM/fyjDMQzJtwWSz2d9YrdYH1Wp1Guf5kWRrKXNNrjE3KG8ymcYRQicUqOpMFYIggDP2A4IgwCZfclqBM7ZhgjWMRuMrWZb9eTm7xOPxhx0OxyMajSak0Wi8qVQqTFkVG1uNFPjvdruvCQaDkAsKNr6lsoDb0bml6u/v79Tr9U8zDHOg3PyU+3uEUCEcDt/qcrlAug0YwlVLCyO3rbR8w1ugNBUABAC07t2798C+ffu+ynHcRSzLVl2yKxKJfGRpaenHuVzOj4OINozUVdryRqPxVSzL/kzpeqX68vn87ycnJz9SskaC0wQOzdtxjSRlRlrvFi1ASvYfB5vC4bo0Dyid21scr3PdrjD4X5V1lpQ5qgH+9/T0+FdXV1NU7Y7UKNa2XlLgfy6Xe3xqauoM87+vry/o8Xio/6S2w73tnk4K/AfZf4/H8yQw/yXVz2qqcm27gfqfDrE8z88wDNMbH4vzAAAgAElEQVRPuI/p+fn5a6PR6GxLS8sq9ZERtnYNqzeZTD9ACAH2ovgViUQecjqd4JONNTU1+XF+e+LERaU6QhL8D4VCMyU2qQXzH1IGsYcPH9Y2NTVdp9VqAesh4r/JZrNfmZubuz+bzcJ5D/wYZ82lrtTY0XoaxgISsQhI5Toc2NZ+4sSJL6vValBmU1W7J7lc7ntTU1P3YXIiKK0/R7F8p4H/nMFg+AeO435EYjBCodBtLpfrV21tbb5EIiFFGpJ41IZ1Go3G97Is+6Dc3DeCINisVuuHRFHM6HS6/EUXXfQtjuPOV7rhoihOjI+Pv2Ods4xYBBXP8//NMMylcvsRCoU+7nK5/ogZD/729nbfdpT1lmsXpcpXi/mPI56IzS+l7CHVYzQah1iW/V25eoH573Q6fyAIQggfbCjz/yxGMxqNV7EsCwFfil7rmf8l+eoVfU6dVFaUTTcajRAU9k4Sbcrn809MTk7ejoHCqMViyVSLAU2iP7TOurcAHBJhU65ta2trQQjtO3jw4B1arfbKarccInUXFhYuz2QyTr1eH/L7/VUJWjObzfsLhcIyqf4ihFZsNtvV2Wx2CQfFgoOgodm2pGxF6yVnAZLgPwRgQpopDG41RB5QcpYmX/MWwX9giAKTXVLna+i1iBD4Hx4dHQVyBDCcIGULBGNS5j/5qV2TJ5AE/+12+wOCIIRL/D10fazJKG/fhw4ODr5EpVKBoouiVyn439zcvBqNRmsCbinaqTqpjOd5kEUmkl62tIvBYPBut9v9HzqdzpfJZOC7T5XH6mQOKNkMnuftDMMcUbJOqS5gfEM6SvC1Yt8U7IcaJr0XafAfwMX29nZ/jdOiqM4777yO7u7uv7AseyGJeQCkhVgs9t65ublHS+T/G4ZYSMgmtNpnW+BMelEIAGhqatpz6NCha3U63QflYrIKGDa/sLDw2nQ6PZXJZGAPDme4Z5HRdxr4zxiNxg6WZYGp0aSAgZ9VBWY63YY/EvCxACduVcDHgYGBfU1NTfARbJfbr1AodJ/L5foTZrqHDx8+fKytre07cuspVx6c3B6P56pAIDCNI1KIyecYDAae47i/lmvT+t8jhFJ2u/3adDoNLwwEcACrtzQXtdwqafl1FiAN/ut0ulXY7A8PD6dPnjzZMB9onudfxDDM78tNmA2Y/7DWAKuCss7WGY8w+L+g1Wp9uVzOt41l/4sWtVgs3Pe///0DOp1uhGXZznJzdBO/F5aXl98SiURGstlskf1PmRabsCK9Ra4FigEAELGr1+u7+/r6rtPpdLcwDAN5vKp1oVgs9tG5ubmTGJySpOVIr+esyWQaUTofumQ02Eu5XK7rwuGwdV06LNL9qta40ec0gAUIyf5PrGP+S05BOrcJzomtgv+YyQlnOjjfNTR7hyT4D+nuVCrVCji+KWhCcELXuGqS4H8J85/K/td4nLfr40kz/0tUq6jsv0KT6MSJE4fUajWw/4kyIvP5/B8mJyc/DL7mjo4OXyQSkRi7CvWEVlNrC5jNZk2hUIBxVVypWBRF5/j4OPgCAMcBH2tpSueG2OcTBv9nS/bTtV4fNQMDA8ebmpogwLeDxLxECM05nc4rotHo4sGDB2MLCwvU507C0I1dZ6kKAPgQdx05cuR1LS0td7Is213NrmUymX+dm5t7ABRFYb46nc5sqYLbjgP/QRZkcHDwQyqV6uNKDwRCKDo6Ovp/4CPR3t4eOHz4cHxkZASkBYlfJpPpIwihj8l9UKFQ8IyNjd2AHSEAdkOOq8iaBPl/syx7SG595conk8kHZ2ZmvlWSd5FENDhIS32PYRjIXSjrymazv7JarSAfAx/8YGtrqy+ZTEr5IasSyCGrwQ1YmBT4v17232KxpBqJPVwp+A/M/9nZ2R/gDenqwYMHw3QjsvGLQFj23ykxycxmc+zpp58Wtrk8qprn+a8zDPNWEstOOp3+5vT09OekQxZNZUHCyrTODSzADQwMqK1WK0h26Y8cOfLG1tZW2B/Cv6tyCYLw1+np6etVKpUfAy6wLyIduAb7JJAGu5NUJ9dUDD7k9Xp/m8/npSDKqgXEkuoTrbexLECI+S+lmQJwtBTcomcEgtNji+A/MERhvIpOXIRQvpH3a4TA/8jk5OQVgiCAM1dKn0aZ/wTndC2rJgj+PzE1NXW/RqOJgDIKfu9I+HpqaT767BpboArgP/hD4XtRa3CrxpZW9PEcz/OQMlFxddn1rbRarS/PZrOgbgZjWHU1XkWtRit7jgUGBwePq1SqCRKmSaVSP7Tb7eDvguACUI7wgZ+vWpiOEn0iDf5jHMc/NDQUO3XqVFXTXK+zD2CZWoPBcDfHcR9SwnYb1SEIwuMzMzO3ZLNZmA+wL27o1GGk7ETrZWA+qoFk3tra2rp///6X6fX6f4E0o9WyjSiKczab7S35fB6+fZKC2xmf4k4E/9n+/n69Xq93Q1SG0gMRjUYfnJ+f/1ZLS4tv7969VQPlMIPLJLc/0Wj0c/Pz87/CUjYgI+5vbW2NnXfeee9hWVZ2MEEFz0/bbLa/z2Qyy52dnYFQKAQLqKJ5YE+cOLFbrVbDhuC8CtpzpghCKDs3N/eueDwOLwvIfMHGH34oC1WOIcuUJQX+AxNLo9FEsbMBPs5VkU9WyjRywX+QnNVoNJDPDByZmUZ2ZCplw/X1kAL/QfY/kUg4BUGQZGS3vaQ15NcymUyvZxgGGMqKX6IoTo6Pj0NagSJQaLFY4o0UvKO4QWiF1bSAJNkFgH/rkSNHhltbWz9fxQYUXC7XFaFQaBLPf0lmlCjD4NJLL71UEIQ/44OK4t3N5XK/tdvtdwmCAO807KWeIz+m+ENphdQCJRYgxfzHwabACJLALZrTmvDM2yz4HwgEPra4uAjgf9GJi6U7G9pxRwj8PyP7LymoIYSS9GxBeGLXqHpS4H8mk3nCZrPdj98zSB8B6yQF/2s0ztv1sRT8b8iRZY1G449Yln0t6db7/f53ezye/8TgP6xBkOqHBmiSNnyV6ud5/m0Mw/wriccFg8F7lpeX/4wDIb0leAXpoHzFulMN8L8OZP8le6kOHjzY3dHR8QeWZQ8rZsRnVyREo9Fb5+fnf97d3R1eSw8jkTSI+mkI9YVWS9gCQ0ND6lOnToEqSeuFF174dx0dHUB8rpaqKAqHw+9fWFh4QiJ1l6bd3IngPww3MBgfYRjmdUqPPQDI09PTf88wzCLOMwQAJNGIKJPJdDlC6DG5fQFZ1tnZ2euSyaQkswzO2WJEk8FgOMxx3GmGYTRy6y1XPhqN3j0/P//DtrY2byKRgIhacJopdpnN5hcUCgXY8EHkTcWXKIoLU1NT7xNFEcB+YPv7enp6gl6vl7LVKrZi+YIkwX8c3SsxVhoK/DcYDEc4jvtIoVDQFgoFXaFQgNQkZ+YwgK9g3Xg8fmpxcfFJnG8WAlVAwpRKEG0w9QjL/gPzH9ZMcCYDWNfQzuTyby7DGAyG8ziOmyORNgfkZScmJl4tCAK8v5BKIWq1Wre9TSuxOy1TFQtIAQCw52k7evToG3U63QPV2qyn0+lvTU9Pf7YkbRRxZzm8zyzLjhNK5QGDlpuZmXlNMpmEYFtYJ6uV0qAqE4Y+pP4tQAj8n7bZbO+D4D/ICZxOp+EMRcF/wtNhs+B/KBT6mMvlKoL/bW1tvkQiAee7ht5bkAT/QfY/n88DaCsxRqhzk/DcrkX1BMH/x202G+yd4Gy62tfXF/J4PHR9rMUgb+NnkgL/vV7vHcvLy0/i8z1l/is8h3ieh/S4n1a42udUl0wmvzozM/OwTqfzYX98ioL/pK1evfpNJtOn1nAMyKmt+DU3N3d1LBZb1mg04XXKdQ2zF6oG+L+OrKD4OFRaIfjH1wir6qNHj16m0+l+AXnXK71XTjlIX726uvrG1dVVSCst4Vc0oEiOEXdIWTwnOYyjtj7vec97WXt7+xcYhtlTDRMIgjAyMTFxIw5+A0JdWiLU7VTwHyIP38CyLAQAKG6DYDD4Prfb/TjeOILUEDEnw2WXXdacyWRm5bLcMYj4bYfD8X2IyC75wMFhDUBTzmg0PsSy7E1KT9J8Pn/Kbrffjj+oEI2pJEgL7NSfIoQul9vuVCr1Hbvd/h2c4zCEgxOiCKEcZT7ItebZy1cD/O/u7g7cfPPNDSX7DxaDHFYzMzPt2Wy2O5fLgYJFsyAI8PFg1Opn4gAEQYCNRk6r1UZyuRwE64TpHN14vpFk/kcikaLsv16v9x45cgTkwBo6h2yFbzhI9kEk4UsqLC+rWCKR+PTs7Oz3m5ubfel0Wvo20I21LCvSwlu0AKy3xWjdEydOWNRq9c0k9onr2ygIwuTExMS78EZdkpUjGjgKkcnRaBRUki7eos3OenskErnL6XT+HPrV19cX9ng8xIMaSPWF1tt4FiAh+y+K4ozVagV1tCAoTfX29gaXl5fhHNMwjsHGG0mG2Sz4X8L8PyP7T/JcXg3bEgL/Jdl/8FtIihZU9r8aA1qDZxAE/yXmfxH8x8x/Cv7XYIy38yNJgf9rjM47VldXn+Q4zp/L5bxms7lqKVy383hJfcNEl2nS56p8Pv+XycnJ91EV1+05q4xG42Msy8r29ZezRj6fH5ucnPwwYAFarTYEawAmBCpKVCzXjq3+nhT4v7S0dJPf7wfcCQL6fUNDQ/Eay/5LpuIOHjyo3bVr1z9zHHcNqfVFEIRfz8zM3JTNZiXiLDGMb6tzgN5fcwsAxgw/QCpqPXbs2NVarRYC34q4DskLIRSZnZ19UzKZdO7atcsfjUbPqJgrDnyT7IiSdff39zfp9fpTDMO8UMl6oa5sNvvT2dnZezC4DYcfYtGGmOX+B+ysrrgrhUIhYrPZrsvlcgm1Wp0UBKHI+h8YGIhbrVaQRuKOHz9u0mg0wKAHBrJiF6gjeDyeawOBAEROwXMhegqkdLbsODOZTP0IIfgoybpABcFut789nU5H1Gp1TLIHlvwn6oCX1dBtUNhkMo0jhE4o2RVBECYmJiZul5j/AP77/X5i752SbV9XlwrnhYGUJO34vV7/kYD3BDYbkkIFOOfgnaXXOgtUg/nf3t7ujcViVZHproMBZo8fP/53Go3mdyTaIori7Pj4+NXwXdi9e7c/HA4nEUIiDb4iYW1a59ksYLFYOIvFom1ra2u/8MILP6VWq+EgSfRCCEUnJydfx3GcN5fLwaG6KjkqeZ6/a22/dw+pzuVyuZ/PzMzci3OPNVw6HlJ2ofVWxwIkmP+iKDqnpqZuEUXRX8L8p+A/4SHdLPiPmf+/hX0FZf6ffZAQQpLsf1Sn03kxW5KC/4Tnda2qJwn+z87O3i8IAgX/azW4O+C5BoPhxRzHwbqu6AXMf5/P9yT2A3rrIKe1ov2rdWVAckEI/REh9AKSbQFf8+zsLCiPLWGgUjpTbdnXTLLdtO7KLMDzPKgTGysrXXkpr9d75/Ly8ij2sUrpfwGnaCgsgBT473a7bwqFQhL4L2E49WIbVV9f3649e/Y8znGcufJRl1VSzGQyD9lsts/hwEaJwErXFVlm3FGFuYGBAbXVam0/duzYrVqt9v9WIQAgv7y8fIPX630ak4rg+1dUid6x4D9mtt/AsuwXlZ5+CKHY7OzsGwVBcGazWT/JqCij0fgIy7JvlNuHTCbzC5vNBn0H1n8kn8/DAl7KwmcHBwdbVCoVgP+Kf1whQMJqtVpaWlq8qVRKki3fMsPTaDQCGwekc2Vd+Xz+z5OTk/ep1eosPrAW5dQtFkuG5p2WZcqyhavB/C+Rq9zynCrbIWULSBIxkBcGgm4gGECKHIONBfwd+lRk/8P7Ozw8nD158mTD5KFS1lznrq0KzP8dJfsP1jabzS2FQgEkYSE4RekLORyOV8fjcVBVkOQWaWCL0lam9VVigaICwPnnn9+/Z8+eR1mW7a/kpq2UgaDISCQyDkB5b29vuBps4mPHjvVrtVpg4cC3RvGrUCgsj42NXVGSb1tKkaL4s2iF1ALrLcDz/H8xDPN8JS0jiuKi3W6/sVAo+IH5j/ebND2YkkbeoK7Ngv8lzH8IPoLAqghCKN/IQYWkmP+jo6OwVoOje7Wnp8fv9XohiJo6NQnP7VpUTwr8z+Vyj09NTT2AfUtwVgghhDKN/L7VYnzoM89tAVLM//XgP14P6wXc2g7TAhRa34sQ+idS7FzJSKlU6st2u/1hrDwWpOlHtsP0eaYPPM9D+iYgSil2FQqFkM1me0cul0vh7xf4oQAbgSDIhvInVwv8r6fgKJBav+SSS9T5fP7/V6lU/67YxHhuRek19YOrPB7PU5ioAYqGDTU/CNqGVr2xBYr4TldX156+vr7vsSz7ItKGikQiH3c6nT/B516JfFPYyeA/e+LEiYvUavUkCadnMpn84szMzFcws51ITm6e5y9jGObPm5g8aHFx8aZAILAAHzStVhvI5XJ+s9kcffrppwXpgAbst0cfffRmjuMe2sQzznkLMAzm5+evymazM9lsVjGJW57nIdfLK+S2NxQKPeByuSCCGGR+/E1NTf54PA4OEAo8yTVmmfIEwX/II1Z0WnV1dQUDgUDDbdZg43L33XezFotF3d/fz2YymSLr3+PxwFpd6oBDAwMDBavVKknNU+fcBvOOMPMf1k8/yP7DWoEQOrN2KvzK1FV1ELVfKBRGGIZRVL0DdxKtrq7esLKy8hccGAaHLliD6aa6rmbBzmiMpAAAAQBdXV0AIhLJIydZM5lMPux0Or+OVaMCw8PDySoEdkEqjz+RUMGS+uX1et+9vLz8ewl4o+/0znh/6qGXPM+DMtrfKtkWCH6bnp5+F4D/KpVqJZPJgPxjIypNKWkW4nVtFvwvYf4HcDo3Cv5vMFogE1kC/gNoK8maEh9b+oDqW4Ag+P/E1NTU/UCggPN4X19fiIJu1R/f7f5Eksz/5eXlJ+F8D8p+JpMpViey1ttmSA0GA89xHNhYUWXZ9QYqFAquqampqwRBgCBNOFMlqnCm2jbjVK8dMRqNQyzLKq5Amc/nRycnJ4GVC/v5UGtrqzeZTAJjtuHS1ZEG/5uamnxAcK3D4Kii/H97e/uDKpUKcp4TuQqFgsdms/09xotAibfIqibyMFrpdrEAYDna3bt391xwwQWjLMvuJtmxfD7/h+np6Q8LggBB7/CuAi6W38ngP9hbbTAYHuE47nVKG79QKFinpqaukzYc+EOiKDvXaDR+nWXZa+W2PZvN/sFqtX4KO2AjOp3Oj51XknTJmSr7+vqau7u7QZ5f0ZywCKFCJBL5vwsLC49hhzCAtltaOLHkvxXn1pBllpmZGQhECLAsGwXHe1dXVyAQCMDHX9Exk9WobVqYkOw/5Ev+gCT7j1mGjeyMXb82F8F/i8VS/H+LxSJtMOhG4xzvSRWY/xC4JDHUIRXDTrjYtcCzXzEM8zISnQ2FQne5XK7Hwa49PT0Br9dLGZUkDE3rrMgCw8PDqpMnT+oMBsM9HMe9v6KbNlkIp714B96k+6qUaxTe5/vW9l93brLZZW8TBGF8YmLi+pI80s/Za5athBagFtiEBUiA/wihoNVqBXaQV6fTrer1+kZNM7UJi9buli2C/78pUR8BxlhDB3YTZv6Dsxv2tVJgPj1n1G7aE3syQfD/cbvd/sA62f+GA0+IGZ5WrIgFSDL/Mfjva29v91HwX5HhelYlWEEQ/LUXKF/7/9SIEEq43e5rQ6GQDb5pAwMDMavVSnN0kzR6Fermef5La+fJG5R+FBABl5aWfisIAoBk65U9lX4c0foIg/8zYJ9du3b5otGolPaUaH9kVg7y//uAtMGy7Hky7624eC6X++7U1BQEi0CgI8wZiZBXcR204I6zAJA6m44fP/5OjUYDqSOIXVh580o4y+GUd3C22/HgP3vs2LHBpqampxBCOoWtn3a5XFcnEolJYNXjyCjFNhx447TIMEynnHYD6L66uvqh1dVVUDwAcBQi+6F9Z8uFxBkMhvs4jrtDznMqKSuK4qjNZrsBy2YCw3NLYPtmNwO5XO4USNThyD6wh+/gwYPhhYUFyjitZCBlliHF/LfZbB8QBAHmcTHClzKxZA7MNixOmPkP0vSlh4OGdibLGX6TyfSZNZbYe+XcU2nZWCz2hbm5ue+V2BYiamkQVqUGpOUUt8DQ0JB6dnZ21969e4FpQELx4kybJyYmXoajdOE7VpUclSaT6W8RQsCQJnIhhJJut/vqUCg0hYM9JWcBBZWIWJxWKlmA5/mfMwzzSiUtAvPZbre/NZ1Or+Lc6LAP2NL5Rcn2bde6tgj+g7KbtF8D8F+x83gt7E0I/A9PTk6+mWVZSAXo7e7uhqAWcGjSdboWg0z4maTA/0wm87jNZgOfCrxnUloUCv4THs+dVj0p8N/v99/h8XiKzH8cBEVTVSk/uSDo+JY1H7biyrLrmxqJRO5zOp0/hrNHb29vaHl5mUp0Kz+eVasRq08Ck7VDyYdCoIjdbn97Op2Gczd8u2APFPT7/Q0ZrE4Y/J/FZ3kYh3oE/1mz2azOZDLDWq32G8C2VnKuSHUhhLLhcPgml8sFhCiYNxJZie6ZSRh8e9TJDg8Pc0888YT+ggsu+CHHcS8l2S273f6aVCoFeHExnTnM0Z3O/Ad7q3BOSLPSxs9kMj9xOBz3YglXALcV23DwPA8bplvlthlkSsbGxiBaDoCqKLD+W1pagqFQCA74GwEs7MUXX3y4ubnZLvdZlZQPBoPvcbvdjwNz5siRI9GRkZFNsWdPnDixW61WTzAMIzfCS5yenr4ynU6D8kAC5FuwjA3d7FcygJsoQwr834D535Abtk2YlN5yFgtUgfkvOQcAoG5oZ7KcSWQ0Gq9bi6aFPHqKX5lM5mfYcVhUVTCbzbHNfhcUbxytcEdaQMojl06nX9nU1AT5s4hdi4uLV0ajUTsOioSNejWc5iqj0RhmWVZPqmPxePyzDofjX7HDIExzAJOyNK231AImk+kRhNAblbQKQihnt9uvzOfzKxCo09nZ6TvHGUrJR+/ourYI/p9h/g8MDEQanf1HCPwvlf2nQdTb/G0jBf7ncrki8x8HkUD6iJDFYslaLBaavmubz6lqdo+C/9W0NpFnadYCAOCc306kdlypKIru8fHxN+GzhyR9TAkFJI1OsG6s8jutdMrmVCr1E7vdDumaQYUYiIDegwcPRhYWFrakSkzQFOesmhT4v7S0dNNavnsJ/PcPDQ3Va1oUwDhBtfGLHMfJVsmWMW5pn893+dLSEpBqpXTRdK8jw4A7tKj68OHDh9va2v6bYZg2Ujbwer23Li8vQ9pSAP+LKQp3PPgPTl2e529nWRZk8JW+BLfbPRwMBoHtBBsOAIhAEmRLF8/zIJMEdbbKrWhlZeWDmPWf1mq1QY1G48P5bM71cVMZDIafcRz3CrnPK1c+m83+yGq1frwkImVTARJrMtSXMQwDOWU15Z5Z+ntRFBemp6ffm8vlIPgBorYgii1osVhS9KAqx5KVl60G+N/V1RWkaRsqH5PtWrIa4L9er/fF43EpWGhHRHsajcZLWZaFDYviVz6fH5mcnLwdf58g35ok0bsjbKu4QWmFSlkA8si1d3R0gIzcEaUqXV/P8vLyO71e7zhmFFcrlzhrNBpvYln2C6T6JYri4szMDMiPLWcyGUlOmjrgSBmc1lu0AM/zEHDyNqXN4XK53hEKhSAoWmKTK3K+U7qd26k+nuc/tObM+6TcPgWDwbvdbvcpLH3oTSQSRenDRma0EwL/w6Ojo2+WGNuY9UaZ/3InXIOUJwX+ZzKZJ2w22/14HhXBfxrs1yCTooGaWQXwH/yB8AOAzpZ9tw1k2mo1FYKOv8uyrKLBmRs1PhAI3Ly4uAg+YhjPhv/+V2uA6vE5JpPpcoTQTxmGURTD8vl8H15aWoI0x0kgAsJPLBZr2He/SuB/vTL/pamruuiii/pbWlpAyYVYfnVBEH4xMTHxbgyuSvL/NACgHheQ+mkT19vbq+vu7v4Kx3FXkWpWKBT6R5fL9WvAWbu6uvy33HJLUtGFk1TDCdfLDg4OHlSr1WMIIcVZT4lE4r7Z2dlHsJR8VIkIMp7nIScsRKdB3oiKL0EQHFar9X2iKALrHz5o/t27dwfC4bC0UJ2tLvb48eMnNBrNUwzDNFf8wAoKrklHRyYnJ18tCAIcEANDQ0OJU6dOyd5kb1byH9QZZmZmviKKIkh2gjqDtDFsyEi/Ckxe8yImk2kcIaSodLIgCJPA/NdoNFFgTIJc5dDQUPrkyZMUXKj5iNeuAdUC/88///y41WrdMbL/WGkF1kvFL1EU58bHx98F8kQtLS2re/fuDSnx3VS8obTCnWgB1cDAwCVNTU0gkU9ERs7n8922tLQEB1XYi/iHh4eT1fiOXXrppecLgjBG8oAcjUbv9Hg8j+VyueI+CyGUZ1mWBvXsxDepSn3e7NmgXPP8fv9HPR6PJCUPAQBULayc0bb4e57nIbfmvXKr8fv9sO7AmhrQ6/XerajMyX02qfIEwX9gSIJ/AM7kEHxGwX9Sg1jjekmB/7lc7ompqSkJ/Key/zUe5+36+CqA/5KyX8MCgHU+9kC+g+/Nd0m3M5fLPTozM3MfpLPBSiQZSvAibXUy9fM8D3myAWhV7AIsYmJi4lpRFBMajQbSHsEZVUpH3JAgLinw3+123xQKhWa1Wq0fn+XreX0EnFNz9OjRlzU1Nf2IZdkmxSbNuorS6fQ9CwsLX8tkMkBYAkxJNpZFqm203vq0gMVi4b773e/ub21ttZJSwIlGow/Oz88/2tTU5JWUzSn4/8x84IxG4ydZlr1d6ekhCMJfpqenb5E2HErkheR53s0wzPly2xqNRr84Pz8P+S9BDh2AFV8qlYpUIsd20UUX6VtaWkYYhjks97nlysfj8c84HA7IyeIHiR2n05mV4xA2Go0dLMuCk0JWMAS0y+l0Xh2JRGAzGIcoP7BJBcEQ5bpEf38OC5Bi/ttsth+7xFUAACAASURBVNsEQYjpdLpVzCyEj29DbtroBFLGAqTAf8hfHQwGXXjzC+uHtPndKUAWHNqB6diizEj9Ty1wCBsdHR2WAnnAAY0QSsv5JijdJloftQC2QPEgaTQaf8Oy7P8mYZVAIPCRlZWV34OcOGYVA6hIPIgN51GEoIYXkugX1JnP50+BqgdEIPf09IS8Xq+UH4/UI2m9O9wCJpPJghD6qNJmSCQS35ydnYVzSxFQxuo/OyYAUGl7VlKfyWT6LELoPZWULS2zurr63pWVldOgJpTL5WC/JjH/5FZVN+UJgf/Pkf1HCCXp3qtuhl3RhpAG/zGIQpn/io4arUyyQBXBfxrYR2DagfLusWPHNE1NTQB8PI/AI85UWSgUVsfGxl6Pz1SS9D+AczvFZ0PSvFWtm+d5+KbsU/KhOJgX1CzhTBpsa2vzYYUoIAI25EUY/J+Bd2nXrl2+aDQK62M9A92ADTUbjcZHWJZ9FanBXDubgHLWiyCVdkdHR/T666+nAUakjL296gWf4udYlr2RRLcSicTXZ2dnv1miUhin4P8zlgZm+2UajQZkAWXJxlcwUKLf77/R4/H8JzY8OB02veHA0qxfrOC5zyqCEApardZ35nK5lFqtjgmCALKr8CPlqi5XJbf2wQU25j+XKyj397Aps9vtwwzDeAC0HRoayshh//M8Dy+M7Hblcrn/np6evhsrIUisf/hzU6kH5PZ7p5YnBf4D8x879Wiuyp06udb1mxT473Q6r4lEIgt4TS8GDzW6jKzMKQPg/xzDMBfKvK9scYRQanR09LXwLq8L5KGH9LLWowUIW4C1WCzso48+ehXHcd8i8axQKHTv0tLSE4IgSKyjah2sWYPB8FqO435Eol+4zozH43mb3+8HhQHYf0p9o+82QaPv5KpNJtP1CKEvK22DbDb7B6vV+lEMKMOeE852FPxX2tAl9ZlMpm8jhN4i9xGLi4vXBwIBcFaWyjiD7H/DXoTA//Dk5OSbIIhaYv5T8L9hp0jZhpMG/6X0EVhBAvwq9DtfdlRogUotUEXwv56ZrZWaq17LcYODg9eqVKqHlZZxX9/heDz+oMPhgDRQvkbO5V6vA1mNdhmNxv/FsuyflHxWoVBYHhsbA3wD9u9wJoV9opSarp5B7XOagST4H4vFZoGg0CDgPzM0NKR2uVzndXR0gPx5v5Lzp7SuQqEw7XA43sxx3GI8HpfwNUpCJGXw7VEvd/z48RdqNBpF1zXJNKlU6rt2ux3U4mFN85rN5igF/7F1MLMdog/7lJ5L2Wz2P6xW6z/ivPZbApd5ngdm1t/KbWM8Hn/Y4XD8BIBtjUYTyufz4FgOWywWOZFJWqPR6GZZtkfu88uUF7xe7w3Ly8t/LmG6wUe4ooMiz/PQr9fIbVMkEnnI6XT+Akf6gT3ghzrw5BpSZvlqgf/Dw8NU9l/m2Gy34oTBf6dWqw0Ak2xgYABk/xs6h6zcsed5HmR0ibCET58+/XKspuDt7u72+/1+quIhd4BoeVIWYLu6utr6+vpmCeyFmFAodJ/L5XqiRkCVmuf5vzAMYyRlvHw+/7vJycnb8H44zDAMMCvo4ZiUwRWu12w272JZtizrJpVKLVmtVnB+1PQyGo2vZFkWFM8UvbBCzevgHNXa2rqSTCbh7AAAF70IWYDneTivvUJu9XNzc2+JxWLuBpEprah7hMD/IvNfo9HE8vl8Ufafgv8VDUdDFqoC+B9ubm5eTafToUoUJhvSiLTRNbNAFcF/yvwnN8rs0aNH9+l0utE1Etdeco9hmEKhsGi326/KZDKLGAgBljdxVTWSfdppdRuNxgdZln2fkv1OpVIn7Xb7N9VqNShMhkGpua+vL7K4uJhpZNUjkuA/yP43NTX5stksBEpUi6CwlWEH9r/mxIkTV6rV6q9vpaJy96bT6U8sLCx8JZPJSGkjYI2pCM8qVzf9/ba1gNpoNNpZlj2kdA9TqdQjc3NzXwbSd1tbm/fAgQMRCv5jK0PehR//+MeXq1Sqf1fa8BBVZrfb35bJZECuHwBmcIjJjiYbHBzsU6vVCwghlcw2ZpxO542RSAQO84mmpqYASNwfPnw4PjIyIof9AOkR/nHtY6i4hGY2m/2J1Wq9t7m52Q8HRQzIl3UI46ANkPyXrdjgdDrfEYlEPAAy6XQ6H5aKh/yGdDMoc4LJKV4N8L+7uztAAUM5o7I9y5IG/2E91+v1vng8vtNk/xme50Ep5+9IzJzTp0+Dgx9s6u3s7AyEQiH4Zpb9HpBoC62TWmADC8Be6J9Yln2v0tbB4D9Ep5fmG60Woxj6dRvLspCvl8iFEMouLy9f5fP5gP0PjoMUQkhsZCcLEUPVaaVGo/FjJfMezpDrnRrSufI1p0+fhm8E/B7W7po4P06cOGFWq9VPkzCn1Wq9PJvNrrS0tKymUikIZKHsVhKGxnWaTKZxhNAJuY+wWq2vyWazkrqbf2hoKC5HXU7u86pRnhD4D7KlbyoB/wOgxETX5mqMaPWfQQr8z2Qyj8/Ozj6w9p2A3MlF2X+6NlZ/fLf7Ew0Gw4s5jvut0v30er13LC8vQ3B76R5cts9W6XZt4/pURqPxIZZlbyLcRzEQCLxncXER5owEWu4o0gZh+5KuHhSI4b18vpIPwkqeq2q1OoFVkeG9jyOEhEbe+xAG/4uy/yXvUSMA3FxXV1drX1/fYyzLEvFdwrwEH4ff73/D0tISpMqGoHAgOFBcScmXdvvVxZ04ceJtarUaUgkqemUymZ/ZbLbPSMz//v5+Cv6XWBgcVsB6cjAMc0BRyzMMCoVCt7tcrsfxQhlBCOXkfFQgHytC6L8QQrzctmUymZ/YbLaH1Wp1Fke1wYItHcbkLEiQn+kSrVYLeXGUvgS32z0cDAan8AcFQPiygQk8z9+ztqjeJbcxgiCMTUxMfBgfSCWnEHXeyTXkJsqTAv9tNtsHBEGAD60k+0+jejcxPtvpFqPReBXLsv+mdJ/cbvc1wWDQKX1MAahu9IOCXBttVnGlkudg8B+iiSGlgpSfT863qpLH0DLUApu1AEjkv4rjuJ8qLVUpMf+1Wm1Iq9Wu4ryD1QL/mePHjz9Po9HAPqxps8Ypd186nX54enr6C/j9lg7HNQGHy7WV/v7ZFjCZTBMIoePl7BIKhUzRaNQZiURg7sJPTZxDoFRQKBQi5dq7md97PJ53+P3+CbznrDhoeTPPovcwEHAIZ7QOObYoFAq+qampq7GUveSshGDCht5PkAL/18v+MwwDZ3G6NsuZdA1SlhT4n8vlHp+amnoAVFFK1kaq8NMg86JRmlkF5j8AxPDNgED0sv7IRrFbvbUTIcT29fV17t27F/zvsr7vcvsiiuLp8fHxd2JfPN2zyTVgDcsfP368R6PRgN+tWalmpNPpR6enp7+KzyjwvYJ3flvMC8Lg/+y6tKeNEBwFOJ+qr6+vp6ur6ymWZRVX+pbmZaFQGLXZbFfmcjkpkEQW5qfU/Kb1NIwFWKPReAHLsuB7a1Gy1SXgP6xrEIxLwf91BuYMBsMXOY67QUnDQ12iKM6Pj4+/GTs7g3IlyY1G499wHPd7uaz/QqEQdzqdN6VSKb8gCHCIh5wP/i3IVKt4ngcJTZBlVvRKpVJftdvtn5fyMTmdTghWOKvTYXBwsFWlUsEHaL+chiCECh6P5+ZAIAA5u8EJBMoBUt5u+IBRR4ccg8osW0Xwn0qFyxyb7VacFPN/I/Afq7nsmLWD5/mTDMO8gcCcQadPn34llhKTwP+Gd9YTsBOtsoYW4Hl+gGEYkKqUrTp0rmaHQqGPY9n/Yn6uaqYiAiccy7LArvjIWlDD3aTMC5HxLpfrteFw2A570uHh4eTJkycbGowjZat6qtdsNneBklkFcz53+vRpSB0BgA+cO8B5Xivwh+V5HhS+epW2ZTAYvNPtdoO6AQScwjkC+koVapQ2NMMweO6BI03Wlc/n/zw5OQlrWVFJqGScGnq9IQT+F2X/8TfH29PT4/d6vXCO2jH7WlmTq8ELkwL/gflvs9mK4H9zc7N3z549wUaXUG7wod6WzR8cHHyJSqX6jdKd8/v9d3g8nlLmP5X9V9rIz61Phf3vkHud6OX3+6/3eDy/x/5wOrZEra1c5Uaj8YMsy35KuRoZIB2+G4KUBUFI4TSeUvrfhleEIA3+N5jsvzRt2IGBAY1arb5NpVJ9jGEYSAdA5Mrlct9yOBz3ZLNZ8OXAPpriS0QsvT0qHRoaaotGo6AWcUTJHqXT6R9OT09/CQfjAvgfprL/6yxsNBovZVmWBLOd8fl81/r9/qdyuRxElgGYUfHHxWg03s+y7O1yJ0Qul/vj9PT0p1iWzQqCENHpdP5MJgNOqs2yotnBwcHnq1SqP0EEldz2nKu8KIr28fHxt+FoMmmxPKuDhud5A8MwMFZaOe3AgRjvxpF+0RLJ/83aRM7jd3xZCv7v+ClQNQNUAfyXmGQ7kflPBPyHgLWxsbE3rm3O44IgUPC/am8LfZAcC/T29rYAOKJ0lG44HL5nYWHhdyVBicBarhrzH5QMjhw50tva2gqy/Hvk2ERO2Xw+//PJyck7MNNCAocpyCTHiFUuazAYns9xHDjFz+kwEQRhfGJi4mYMhsN5Izw8PJyqRYAHBLSYzebfIIRerLS54vH4lxwOx3ckhZrh4eFELfqodL/qsT6z2TxcKBR+ILdtkUjkIafT+TMJ0MbrasMHBhMC/8Prmf8IoaQclUK540PL184CBMH/J2w2G6QOijQ3N6+m02n4BtCUKLUb6m35ZFKy/xuA/1Jav21pxzrpFDAfDSzLnibdnlwu96uZmZk71Go1pJkNWyyWjMVioUGbpA2/hfrNZnNLoVBQ9LydzWb/YLfbAVsBfAQU6CTWP+wPGzo4FExNCvxfWlq6KRwOzwqCUKqM0gjMf2kGSvL/31/D+4BoROoqRCKR651O5y9hLzQ8PJz5wQ9+UKD7aVLmbvh6gVz9R4ZhLlOyJ8lk8nszMzOgbgLMfyAqUPB/AwND7qEnWZa9VEnjQ12pVOobmNkOgEak0g2H0Wg8yLLsJMMwrXLbtLq6etvKyooVRx3BAQwWa9jIgjN5U45WYNxzHAeSKWWlP2W2V/T5fLcuLS39oZJ2mkymzyKE3iPzGUw6nf7l9PT0QzgAAl4GiV0HzKRN2URuG3ZyeVLg/8TExAewg4/K/u/kCVbSd1Ky/zhHGMiPlea8qiZAV/MRJsX8B2bp2NjY2zHzXzpcUOZ/zUecNmC9BUwm0183k4rpXJYMBAJ3LS4u/mdJShFwSlR1bYE0U6IofoNl2atIjTpCKOHxeK4MBAKTnZ2dwbXUWMCabniHCyl71UO9PM9DcO6/lmtLIpH47uzs7DfxWQPWcAjmrRkrfrPB0+X6mclk/sNms31y3T6AygOXM9wmfm8ymb6IEJKdExifgcfhzL0uPUNDn/VIgf+jo6NvgvdWp9OtZDIZKQi/oW21iem2I24hBf6D7L/dbn9AEAQq+78jZlJtOlkl2X/JZ9pI4FZtBmTrT1UbjcZPsCwLvjxiF0Iotbi4eGUwGATfeMBsNidGRkbovo2YxbdesclkegVC6Bdbr+mZGoBkMjMzc106nQY8BFj/QSzRLp23G37PQwr8d7vdN4VCoZl1555GWx/VF198saG5uRmIrMRSHBYKhUW32/3mcDgM9gKVEfDl0EAjpV7kbVYPz/P/vIZJ3qhkt+Lx+NccDsd3Kfh/DqsCS2RwcPAVarUapO0VVUYoFAresbGx1wHYvHv37kA4HAZnWNkFk+f5hxmGuU7uZMjn8xOYWQWbGvig+bu6ugKBQGCrUW2c0Wi8l2XZD8ttU7nygiCMTE9P35jP54symmcLkBgaGtJFo1E3wzDd5eos/T1I/q+srHzA6/XasGMSwDv4AXCp7FjIeRYtu7EFCIH/ExMTE6CMAfMcZE1kp9ag47X9LECK+S+B/1qt1g9KLjiNSlUBulqPlslk+jFC6LVKt0MQBPvExAQEdcGhrAj+WyyWBI3MV87SRqPxf3EcdxuuUdrnPOewCwBtNpu92Wq1wl4FroY/ECtnRYYxGo1fZFlWNiB1rjbA/iQQCDwtCEJQr9evxuNxKVhTyaaXrau/v79Pr9dDWiVd2cKbLCCK4vj09PRbc7kcBGBCPyk7cJO2rMZtlZ5FgsHgPW63GwJYYD8GY1tTENFgMFzBcdz3lbaRIAiOiYkJyB8rpQ6rtkqH0l2q1/ogdQOkWBmU00Bw8tvt9mvS6TQEeYdaWlpWU6kUAJINH+hNCPwH2X8A/4vnqO7u7qDf74dvP/3uy5l4DVKWFPifyWSA+Q/yzMD891Lmf4NMiAZrJknm/+rq6pOCIIBvEHyRANpQ/yD5+cENDg72chz3NMuyPSQfJwjCX6anp2/AvmZpT0BBOZJG30LdRqPxKyzLwl5bkSuTyfx6Zmbms6Iowl5Q8jWFtlMKOgr+n3OqgN9LOzAw8M6mpqbPKq1kXfpkURR/Z7fb34Xl/2E/XbHqtyKTvQqVAEmZ47h/KnkU2HejcwOr0Wje/dRTTy1hBYSzlatCq+vvETzPA/APAQCKXbFY7CGXy/VTQRDADwP7mYii4LZiLa1tRezRo0f3NTU1TbIs26l0UyKRyF1LS0s/wdL/lUSYgQzEPMMwB+S0BUBun8935/Ly8gRm/YPzA4AUyTm1pcP8oUOHdu3atQvqPl9Ou8qVhVywS0tLb43FYuPZbFZKj/CcPCkmk+ktCKFvl6tv/e8FQZiemJi4Ta1W53BUuiTzA5L/dOMn16CbKE8I/J9cz/wfHh5OUwnWTQzQNrqFNPgvsXMx+L/tNnTnmgo8z0Ou479Terpks9nfW63Wj68D/5MU/FfO0iaTyYwQerqCGlOpVOoyu90+azabhZGRERE9kxh+S/uHCp7bEEV4nn8HwzAgp6XYtbKycmsgEJjgOC6Qy+Ukx2O1A4vgbKAeHBy8X6VSvVexzj23IhSNRm+Zn5//ZWdnZyAUCkmBqXR+ETT6ZqvmeR6c4V1l7s+7XC5ghoAyTpFt3dfXF/J4PDUL7OB5HmT0QFFMvdm+n+U+0Wq1vjqbzULAKQQ5gBO5Zv1UuG91U53RaOxgWRbY+7LOmxBwb7PZbszlcjAPwfEhqbxtWvmuXoxCCPwPS8x/KYgaK3bQ9bheBl7BdhAG/0H2v5T5T9dFBceOVsUwJpPpJQih3yhti/Wy/0NDQ7FTp05R8F9pQ29QH1Yd+8jaGfOjhB8ner3edy4vL0sqawmEkEDPtoStvonqjx071qnVaheVSrGHEIq53e4PxGKxRUEQ4MwpqSJDkE/DB4ZKJiYM/s82NTX51sghfrPZHG9Q5QxIXa1bSzfyKMuyL9vE1Kz0FiGdTt83PT39dbwnktKObZt99eDg4IUqlQqwyrJXLpd79dTU1K+x0iP4FGkqBGw1s9n8qkKhAGnqFLswGeMUVjcpnoEp+L+xeTme50Gy8q2KWR9XJIqizWazvT2fzxfZyVh6/qxSp5sFuQuFwpLNZntPLpeDiDb4AacdPK8itYEK+g3pET7NsqzijuFUKvUlu93+FeyoAafNcw6NPM//iGEYUFGQdUH+R7fb/UtRFEs/+JUEYch6Di18dgtUC/zHQS80oEPmZLz44ov3NDU17dNqtcU7c7lncCfp36X/l0wmHQ6HAzbLdXlVC/zHa+yOko3jeR5S0RxTeuCTyeT3Z2ZmvlGawsNisaQp+K+cpc1m865CoQDf1nJXIR6PX+FwOMBBku7v7884HI6GB07KdbrS3/M8D8EvEASj2OV0Oq+ORCILGKxareHBmjMYDP0cx0GQ5zMfAwIX7IkdDsfVLMsuJpNJif1Pv9sEbL2VKiuV3QQ5TafTeVMsFlsqkZmDPXbNnGrYMQHzWHbqtHI2C4fD9ywsLPxcp9OtZjIZ6UxH5285w8n4/aWXXnpIFMUphJAsFRJBEGxrqjW3i6IITl0pRROsMQ2/VyMF/k9OTr6JZdkoMCJ7enoCq6urKQqIyJisuKjBYDiPYZiO0nPU+r/D2Sqfz89ardZqB/cVW0kQ/H/cZrM9gB3d4GwE8gkQLLaNs1v+jKB3KG2BKsj+wzdDUqWi4L/SA7hxfWx/f79er9f/hWGYIyQfKYripM1mu0aj0aykUinJ10z3biSNLr9u1mQyfQohBMquSlwoFot9eWFh4TFRFOG7W1RF7uzsDG231HOkwX+8p4b1sVGVUQADVV100UXG5ubmX5Eg/EoTFoit4XD4KpfL9afe3t7Y8vIynIe3TZrD/v7+Jr1eD1hd2SuXy90zNTX1L9inmHY4HHAeo+suwzAGg+EIx3H2skaUUWB5efk9Xq93QqvVAqGomHaegv9n2Xz09fXt7u7uVizSrOQxabfb/RbINdTe3u6LxWLSovmcQxFmO0DktNwLBYPBe91u91NqtTotCAIcvGATC5sbWHCUeMm4EydO8Gq1uhL2oKz2A1tjamrq9YIgrAAb7KUvfWmylME9PDyscjgcwNiXq8wgYEaSCz5WUtQaDojYNouwLGPXoDBB8B9krP8fe18CH0lV51+v+sg9R2aGYMjADAQGMjNJVTfgn9V1w+q6uod3UEG5lFPBg0sFIXiL6KoriLeuKK6jsngLKOPJKgxMJulOJ+ncnU76vu+qev98QxXbjjPTXd1Vne5Ov88nH0b7vVf1fu/Ve+93fb/gqoQR1jc0NJRuZP6rn2CO4+4ihAwX0TKdzWZPsdlsMKZiT9FiXyniscVX4TjuEkLIg8W3KK6m4qCTYf89fX198fUy4BX3xtrX4nkemXTbtO45FAp9cm5uDtkcz3P0Ar63YYDWVtKrWeu43/QU6jWZTH52YmIC2e1QkjEnMOI2zktmDfZ/FyEEGc6aFZvN9lpJkgIy5Oh6K9amgYGBO1mWvV1rGqx8gWUymW/KaB/YUxQKpoajQLNVVX5HFovlS5TSqwv1JGdbXy+vYTjDV/r6+qLreT7u2rWreevWrappwgqNFb9ns9lf22y2O5uamjytra3+l73sZfEDBw7gLtRYv8UIsIg6HMddRQhBQLiqkkqlfup0Ou8TBCEKfa+1tdUXCoWwv9T8+aWT8z88Njb2RkEQIs3NzR7oUXIQdWMtq1p5DJIj/kgIeWGBZgLLsq2HDh2CfJW/iulROjr/H5uamrpHEATA/q9s3bo1uLS0lGrc4dUtokbtE0ugUs7/dQzA3ahLwNDf33+RwWAAT7GuJRaLfcDpdB7YvHlzIBKJ1KoTU1cZrWfnMsXvMwzDnKPFe0iSFHI6nTckEgmFigw6ir+3tzdSb4kNejr/o9HolCAI8MN4BwcHYzWMjIJgI3NTU9NbzWYzdAzd/KKSJB0eHx9/S1NTE+gcoYfUldOb53nQRPYW+k5zudzPZUpy+A7g40QybiO4jmGYvr4+IM8jOVyzMj09DTR1V16wTiPz/wTShfL2Y0LIv2g2A3JHyWTyqxMTE/e3tLR4ZS7CYzrkS3VciaK4ZLPZrpO5bJSMBxx0CteIVkMycRz3LCFE8+zPWCz2SafTCVh/HC4K5+2aAcJisdxKKQWfnKoCLmm73X4TIQQBEdhw0Df+24hIVyXJ8irr6Py/WckW3rFjh9/n8zWcVCVMFc/zf2QY5u8KNZUk6Sdzc3OXRSIRHNrZoaEhodqM3pXI/O/o6PDEYjHssxsG9l9WyPB9aV48Hs/73G73IZPJFJL5+IKU0nTDcKitqDmOQ6Tzywv1msvl/jI2NgaEHyWIMNaAR3xOalo7/yVJWh4ZGblSjqRfU6xlZ/h6OatId3f3tq6urieLUeoKraXj/U4pDU1PT786FoshkEK5k1XMCVLqe2+gdizHcSOEkH2FxixJ0vzY2Nj1oiji3u7fsmXLSjgcVgI6CjXX63dwxv+KYRjNoR0xXofDcRWl1CXTuWHcf0NVptfANkK/PM//mWGY89WO1efz3eVyuf4XeoHszPbXCx2YXs7/w4cPv9FkMiHzH4FnDee/2kX33L0ANBVAxkL2/3ELpfTg4cOHgWCI8x1ZiIoxuCLBFno6/8fHxwH7rwTwwsHSgP0vYS01mhxfAgMDAxeyLPsbrWUEHdTr9T6pBOA2nP9aS7hgf6Szs7Pj1FNP/YHOcNyMJEmzIyMj2INx1oWGh4fTDZTBgvNTsQocxw0RQr7HMAyrxUM9Hs+tbrfbZjQaMwhOU+Z9aGgoWW/JYno6/4PBIBy9io2i1oNm2J6eni07dux4lGEYqxbr7Hh9CILwyOTk5E2ZTEYJPql5FDJlrDzPf4VhmLcXkh90ZpvNdonih+vt7Y3VW+BNIRkc7/fBwUFjJBLRbE1QSrOjo6Ovy0O/W0My0i3CpdSBV1E7GIvetAo7pHnkIaU04HQ6L8rlcgtyJsIxofh5nsdGpNpYlUgkvj09Pf09URShbMFgjw06rMOlBrCw57Is+3utYWEFQfizw+G4QTZAKIqjKEOL2BiGOUPtWvF4PLd5vV7wRiYEQfB3dHR4d+7cGbPb7RvGaadWZnrU19H5v5b5j0wzGTK54fxXOYH79+/fajQaAdfbUqCpsLy8/KpVGKOpTCaDfQbGfUTvVdW3VAHnvwIli8vvukB3qpxiTapzHMcRQp7VpLO/7oTOz89fFQwGwR2Fs0vhUW5AzWssbJ7nP7Ea+HZbEd3mZF5rdx4VT9VSfRQxHs2q8Dx/GsMwgOjXpGQymcftdjvgcmNwVrW3t/v8fj/21fVy/mNchv3797/NaDR+SZNBHqcTURSfnp6eviqRSCBCGecJvvlGAICeQi+yb6vVeqokSTD2FKR/yGazB202G4JzcRdTHIjQcdZzDcMhB2oJ0LlpWlbhSMF9dGk8HnfmccqvG8WBpoOrgs7OO++8nYIgALVBbUk7HI63plIpGHiVuwT+WxdOSJ2c/6HDhw/D7gGUH0WPwvlTEWe02gmu1voydCec/6YTvWM2TWa3sQAAIABJREFUm/0Pm832xebm5kw6nYYOoehQFTn39HL+Z7PZx2w22z0I4DUajStykktdfHfVuuY24nvpmfm/srLyvPNfvss0MhMru8gAx93b2tqKwL/Nej46lUp9aWZm5rPNzc1A41Uychtnnp5CL6JvOYhuugSU32P2ns1m/2Cz2WD3wLeMeYYDFn91mbyjo/P/umAwCH3Hu3nzZm8kElG+mSJmtWqrGF/wgheccvLJJyNY+GS93hLw//F4/L1Op/MROTgS96J11Y21GivP89cxDHN/Ef0BhfstwWBwMs/G27gfyoLjeV6zs0cQhNHR0dFb5f1uzR4zODgYbzj/T7BK9+zZ09Ha2gqjw5YiFrOqKpFIZNjlcv1QzhT5G8751UyHV65mOvxcVafPVRYdDsfFqVQqYjQa43Lkav7hVkKXx28iw2kC+l/r7H+s2JcKgrC2WOXIW8FiseynlP6FYZgmNQORJGlpZGTkGjnaD0ZJOO0UNISKKNpq3ree61osliOU0v1ajlEQhLHR0dFG5n+ZQuU4bng1w/quQt1IkuQaGRm5WHbQRNvb2/2rF5ooosyqKUO7As5/BBEpmf8bxvlvtVovliTpO4XWSQm/i0eOHHnt0VGKGymwogSZldREjqj/fjGNg8HgrfPz88iw8XR3dwfdbncDLUeHzH+/3/+xxcXFg3mZlwh8hENgPe8o0BOaeJ5/mGGYVxSzXkqtk0gkhicnJ/9LdtYdMyi21L4b7UqXAM/z2Otx3hcsiUTiazMzMweUqP6uri7fS17yknWnYJIDGxHApIo3vuCAYcEJhz/mcrkezuVy3q6ursBqoDH2x/X8Zot57Zqow3Hc2wkhyChRVXK53KGxsbEPyshu0PUU7ua6CFzTyfkfljP/o7lcbnnHjh0Bn8+HfVgzY5SqSazRyhzH3UoIKYhOuMoxfAs4YM1mcyybzQa6u7sjlbxb6eX8T6fTjyHzX0Hv6unpCS4uLjbQu2p0PVfra1ssln+klIIiTtMio88B7Qp2Qs/g4GC0hmGtNZVNBTuD3gHasXtZlr1B5+eKy8vLb1pZWUGggRIgWBcOOZ3lpmv3PM8DBe9rGj1EdLvdN3k8Hjgc4WgMtbS0+BAcWq8UsTo6/6/Py/zHHqmgnWk0VevSDZAlTP39/dcaDIb/0BP+H6PzeDwvd7vdI3nI1jWvL6rhq4/H45+fm5v7rozuWg12rnVZdMd4KBLPNVsL8Xj8m1NTU0BOUZIx1qg1G87/E083oC7fRwj5qNarIpfLPT4xMfF+GItw2RgeHk4qUEMy7MPjDMP8g9rnxuPxb01NTf237CxRoO2R+aCXAZnlef6O1Y3ybrXvWqh+JpP5sd1uhyPSB+XR5XJlOI57PyHkI4XaHv17Op3++fj4+H2yIUjJAgkjCquanJVqx1WL9XXM/L9ZdprkZ6xotonWoqzVvLOMqgFkjLMKtctms3+cmJj4sCAI2FcUdJG/ouco1Eclfi+VOqXQu83Ozl4ej8dn5eCqNWqSjQSFriJrvJAo/+r3TCbza7vdfq8cpbiGqlDjfGKqxl/JyhzHvYhl2d9SSg2FnptKpb7ncDg+JztQFLiyDW8csVgs51BK7YXkV+Tv4uTk5FsTiYRPMZp3d3eHKukMON57Dg0NGY4cOcK3trY+VeRYSqoG+H+v13uZ2+1GQCmCYuGo2/DrrCRhatTIarW+QJIkZN8UQgNae6LX6715aWkJ94hgS0uLR876rIZgISjVWL+awzpKkrQ4MjKCjGncBdaUa3ndNpymZa5DjuN+RAh5rdpuwuHwf87OziKAHnOBecF9otbhSZ8Xg07O/7XMf5PJtOb8zwuQVyv+DVvfarWaJElCoMnWQkKYnZ29LBwOL8pUN2gDW03FMqD0dP5PTU3dA1jllpaW5Ubmf6GV0Pi9FAnoCfvvdrufNJvNvmw2qwSNNTL/S5mk8tqwmzdv3rx79+6fEkIKUlGW8yhBEH4/Ojp6TUdHh0/m426gN5UjUA3a8jw/zjDM2eV2RSmVotHoAzMzMz+T0Unz6ZAVvvG6u6vr6fyPRqNTgiB4N23a5ItGo/Xg/McyM2zfvr31lFNO+TLLstDndCuU0iNOp/OSeDyOe7aCnFDT/go5GRh32ILJuYIgPD06OvqePHTA9aYG1G2u1XTc19d3clNTE9aEFoV6vd47lpaWnjoqoSjRcP6fWLxk3759p5tMpmcYhtmkxUwofVBKIzMzM2+ORqOAN1Yy29d4Hs4777yTBUEAxGa7mmcCfnJubu6d4XAYzk8F0kYxeOgFx03OOuus7ra2NhjANZURjGfz8/P/lkgknJlMxtff3y8YDAY851Q1ckFdv99/5/LyMgx/MdlhB7nUA1SNWlGse/0KOv8bsP8qZpvjuDNlKPe2Qs3C4fCnZ2dnEaCkXKIVbuqqUpD1zPw/yvm/kWD/9eJPpouLi9f7/X7wfsPx5+3s7PSvZketO2R0oe+hFn+XHddwsrYWen9BEJ4dHR29EXcVGeatbpwohcZ+ot95nn8pwzDYB8sucBiMjY1dJYoi1jsCqqAAKA7wajBMmPv7++8xGAzIwtGEf/FYQpMkaWx8fPxNMLrKXHAKD3LZMm50oF4CFovlIkopAooLFiD/2O32N0qSFBUEIdDW1uZJJBLVEmSLc+sbDMNcVnAgJVRYXl6+YmVlBfspnAURSmmuEVhcgiDzmpx//vnbQI9XzBl19JNcLteNPp9vQt5DMSdK0FpNG9iUcVbI+Y+MnEbmv4plbLVaLZIkHSrUBDag0dHRtxBCgNAIOSvO/4ohiOnl/M+H/Zczuxpc2oUWRON31RLQC/a/kfmveir0agAfhXHv3r1/bzabf1mIRqXcl0ilUh93OBxf2bp1a3BgYCDRQHsoV6Iltyccx91ICPlsyT3kNRQEYcLpdN6RSqVgt4BdGLqJP5FIKKjLdXEnPFpWejr/5cx/hfa0Lpz/lFKymlxqPP3003dv2rTp94SQk7RYf8frI5fL/Whqaup9mUwG9vOaD0Lp6+szNzc3OymlOwvJTZIk79TU1BXJZHK+vb3dG4/H8S3q5acs9DpV87uWlLpIbp6fn78xFovNyEiM8A0jKTzVcP6feMpJX1+fqamp6U96ZIskEomvzM7O3i/z2mNC1jhOeZ7/LsMwb1a7GnO53DNjY2N3IlvKZDKFj4UqoLbPIusbBgYGPsKy7PuKrF90tUgkcrdMj+AZGBg4n2XZnxTdWK4oSdLyyMjIVTLkfxi8Tul0OjA8PJxS0BbU9tmoX7oE9HT+H8VV2XD+q5gmFXw9zOTk5MWJRAIGKwVdBIbVqoO61TPzPxwOw0l99OW3Gpx0KmZdfVU5swmZnWVHZOc/nVLqP3z48OVy5hMyhtayRimlqYYTRf08FWrB83w3wzC2YmiNJEkKjoyMvMFsNvtNJpP3tNNOC9nt9sZFnePeQQj5QiFZF/N7LpcbGRsb+4BM17TmDOjr64va7faKOQMKvCcQIpp5nsd9uL+YMZVaJ5fLHXA6nbe1trYGdu/enTp06NBaYGyjVF4CapyMoiiu2Gy2K0VRxF1AgVpHJgCCAtf9bOR5/vUMw/xADymmUqkvT09Pf9loNHpTqRS+X2Tw1qVRUQ/5HatPi8Vyz2pQ+y1qn4dAqpGREUDGQhcO5unYFcuqVvvOauur+S6L7RvIK8j8hx7V3Ny8kk6n/ZTSZOP+VawEGaZYg3sqlfqJw+G4Xz7vwZ3ri0QiFQ2q1Mv5n06nHx0fH/+UjGSwIlNFNfbD4pdRo2YREtAL9t/n873P5XIB9h9OmTVkP/kOU8RbNapoLAEEGpsHBgY+wLIsaHx0K5RS39TU1MsTicRaAGfjDqebqE/YMcdxWwghsDEVdCIWekMkRU5PT78jFov5jEZjWhAE3G186XQaekldJ5YUexcpJMP83+FQXFhYeB72vw6TQeAXNe/du/dCs9n8CzWyKaVuMpm8Y2Ji4pvyfpMCSkWt3rdl1HIEvhZjHxIWFhauCAQCsEHCKV1R1KtS5qoSbSwWyysopZqsO0ppeGJi4irZHhFsa2tbQTIG9OKG87/AbA4PD7MPP/zwq1mW/ZHWEy9J0sr09DRgP+ZgKBsaGkpMTU3tl7Nv1T4uPT09fU00GsVFFQcajE8KFwuMx3oa3gD9/2KGYX6r9qUL1RdF8fD4+PjVCGTgOO4/SoF/jEQiD8zPz/84zyAJueAD0FsuhYa3IX+3WCxHKKX7tRy8IAjIFryZEBKRMw3qKstHS1kdry+e53EI9xV6FiD/bTbbxxQKDSW7T4Zo1nOfKfRqf/O7Xpn/CwsLlwcCATj/87lkN4SDau/evZ1msxncyQWhndRMWDab/ZPNZgPFjkIlkZ8JVVXrSs24qrVuX19fe1NTk5NhmK5i3jEYDN4+Pz//KzlDTeFF3NDOLZ7nwUcIJ1PZJZlMfn9iYgKZyXAAeLdu3eoNhULVxHsPfcHQ19d3QVNT02Naf/9HCzCRSNw0OTmpcJXBcVBVqDJlT3gNdMBx3HmEkN8XO9eCIDwzOjp6u9FoTLAsuwaZW020LTzP71j9XpFJ3qy1+CVJco6MjFwq3wkUZLHGmi1R0DIC3ijDMNvVdhEOh7+wsLDwc0JIQhAEf0dHhycWi9UVOpNOzv/w4cOH3yg7uxT6NCDkNUqREuB5/lGGYf6pUPXFxcVrZZSrfC5OnPcVu1Pp5fw/OvNfpm2sm8CbQnPb+L0yEtAL9j/P+Y9zHHoozo4Nod9XZuZUP8Wwa9euji1btjxGCDlXdWsVDURR/N/p6emrWZZ179y5M9YIclchPI2qWiyWj66iiH1Ai+6i0eiX5ubmYP/H9xtvamoKmM3mgHwfrOsEBj2d/9FodDKP9rSiQYtarIsCfSDgqJnjuC8TQi7R83kIpkgkEu+ampp6pLu7O+p2u2uZ6hC+QNiG/rEYmSUSifsnJye/JZ+x8Flu+IRNnudvW117nyhGfoXq5HK5J8fGxj6s2GOampq8sVhsLZCx4fwvJL3nfjdaLJZnKaX7iqtedK1cIBC4YWFh4Q/KBZPjuA8SQm4vuge5YiaTedJut39EdmgrkW1BBBQcOHBAd85UmS8cET971b57ofp+v/86j8fz21Xop18zDPOCQvXzf1dgL0KhEAIsYk1NTb5MJgOHHQ4r3eWi5l03Sl0dM/9vgtEKGSsdHR1+n88HJ2LFDCm1PH8DAwMvZ1kWjr1ChQYCgU8sLCz8Tr5I43vKpxYp1L6iv+vl/Je5OufACSgfqIpxoO6d1HooFFgU8rpCAJlCJdGgZtH3azHKnHq9xTxGFEXbkSNHrmpubvYgI7Deo+aLkAlgxOGc0uTO43a7bwwEAlCoQ8hMAPekz+erNmUIOkNTf3//DQaD4ZMMw+imQyBqORKJXDo7O/tn7AnDw8OZBlJTEatSuypQ5BH0/Opiu1SyWWXnIWhbvFVG2wI40a8TQoAwo3mJRqMfnJ6e/h85WxABxnVtXNRcgHkd8jwPepHPq30GpTQ6Ojp6qRzsHZV1PtwlFFhNtV1WZX09nf8mkymay+VAOxNA5lytZiJVeuKsVut2SZIQFHxCykYgKY2NjQEhBc7+UEtLy0oqlQpVGuVKL+d/Op1+bHx8/B55bJ5t27YFXC4XjNoNfbzSi7KOn6cX7P/qvfs2l8v1v0ig2rRpk6eOOK1rdTWswf+fffbZZ7e0tPymlIBANQNPJBJ3yU4pBLkrOljd23bUyEivuv39/f9oMBhg6y+75HK5pyYnJz+azWYReJYym83BbDYb6O7ujrjd7rpHotHDVpef+Q/7ZzabrUtkFGSxLyws7N68eTNskqr8TmoXLqV03uPxXBqPx+2xWCw+PDycrVVbB8/zDzEMA/SwgkWSpCWbzfZmQRAQYFeV1MEFB6FxhVKR34/1Gl6v946lpSVQEcLhDx1YsamLuhnuNJbHenfHDgwMDOsBOSRHSL9fXvhBnudnGIZRzTMSDAY/PD8//6TRaEzK/HHeXbt2RWdnZzMVUtxZjuNeQQj5mdaTlcvlHs1kMr9rb29HcIOqIorijM1mu1EURRz0MMZhk2lkLaqSoraVdXL+j46Pj99yVOZ/tTlOtBWkhr3xPP8VhmHeXqhLcPrCSeX1erFPKRkrCi9o1Rl29HL+I/M/EonMIqvsqMyAulcQeZ7HmLcVWitqfpf5T9+at0/jIoh11QjgUSNIlXXVZK5D6ZucnHy9IAgzssK3YQJejiVWmY/apUUWsSiKi0eOHLnOaDSmBEFYu6dUcbacoaenZ/OOHTv+wjDMGSqXnKrqlFLX3Nzcv4XD4UU52ATO1Ko7Z1QNqkYqy44hILy0FfvKsVjsq06nE7D6yl1boQOqikBbcDryPH+BjGaA7A5NC/SN8fHxS3K5HOSG4OtUJYKvNR1EFXS2f//+rUajEYYKUI2oKoIgPDs6OnqnrAuDlgp7aajenI96Ov/z6dMasP/FLz+LxXIXpXS4UItcLmcfGxu7TYb8hz0CKAsK/3DFdAgdnf+PTk1NfUrmGcX313D+F1oUjd9VS0DHzP/nnf+NzH/V06JXgzU47n379r3GZDIBEUy3goA3t9v9eq/XOwI71/DwcLpWnXG6CUmnjnmeP8gwzD+U2z0C7GZnZ29YzaoOwa5kMpkiBoPBL8P9JymlYoV8I+UOpeT2Ojr/3xEMBifyaE/rLfMfMl/bb84+++x/amlpeRjBRyVPRBENKaVLU1NTr0wkErApISi0JgPHrVbr+yVJAjJwUcXtdr/N4/HAQb0ud+CiXrJClWRKXdBqlo1uI9PoXgHqGux9MvWdgq4gNZz/xU0qGRgY6GNZdqy46qpqCW63+60ej+eZgYGBa1iWfa+q1sBvEASn3W6/Wc50gNENBjcF9rySsJMmnuefYhhmQO0YTlQfPEzYCAkh4ChWVcLh8GdmZ2cflzdTyESJUqsWHl1V46mHyno4/0VRnLTb7TeCzwmHyI4dOxqZ/yoWC8/zQMY4rVATSZKWx8bGrhNFEZc9GK0UaPaqhHTkOO4SQsiDhcal9vfZ2dnLw+EwZObt6OhQoHTqHhbQYrH8P0opuBC1LDQajX5FzpjEOsI+rVCzIFuoYsZQLQdVC31ZrdabJUkCN2sxRfL7/bcuLi4iKl/h6Nqw8zMwMMCzLAsHeNlKYSwW+7rsNFUom7CvIriq6hRAOFAJIcZt27adtHPnzt8TQnYXs3hKrSNJ0l8WFxevDAaDLqvVmjx06FBV8MeXOp5aacfz/I8Zhvl3Ne8bCATulpHM1pyu1cj1/MIXvrArm80CsQMUAFqXtNvtvtLj8Ty7adMmbzQaVYxijTNMhaR5nv/QKjJbSfy+wWDw3vn5eWQHAq5e0fnqCvIfotTJ+R86fPjwm+WzB5n//uHh4WTD8VF48fb397cZDAY4iwoGxKXT6Z+Nj4/fp6Bcyby5WK8V1SH0dP6Pj4/jXgl7FNYRdMVG5n/hZdSooUICOjr/3+dyuaDnKrD/a1C5Kl6tUVUHCQwNDRkee+yxjlNPPfUOg8EApE/diiRJtunp6TfF43Housr8NwKPdZM4w1oslvdTSlUn+R39SkhUWFlZ+eDKygqoTGHrx/0Pji+cQ8o5W/d3ch2d/9cHg8Gpes78l9cU29nZ2b5z5877WJZ9i35Lf61nKgjCI5OTkzfLaLpIXqw5W8fAwMBFLMv+d7GyisfjX5qamkLyIXxzweHh4dRG1TesVutmSZLsDMOo9nUeLe9MJvPExMTEvbJfONDW1uZFIJR8D9cPsrPYia+hegae5xH9o8oYVsz4ksnklxYWFv5rz549DxFCTi2mTV4d0efzfcjlcsHprsDa4COCE7TSyhZgQqHwqQ5gUDnmoqrLkS+A98zJkS9KNikM7FWRiVTUQOqskk7O/1lkTuZnrDSyhotbOBzHXU4IAdd0wZJIJB6anJz89lGGVcVJVbB9pSvo7PwHvCeMA0pAUUUNd5WWJZ5nsVjuWY2Kv0XjZ+fm5+cRSQwuZihmkKd/1TEdP3ToUN3LVGNZqurOYrH8PaUUFB5FlXQ6/aPx8XHAvSsIOkBm2JBnqazkIAOlrCBaSqm0uLh4QyAQmDYajVFBELxbt271DwwMJA4ePFitBke2t7fXZDabX9HU1AQZaM6hnr8gc7ncD51O563pdBr7bQOGs6ivtfRKpQZ5uVyud/p8vnEo8W1tbSuJRALOn6oKEBoeHmYfeeQRON6uLV1Cx28pCMJTDofj+lwuB6NxA2VMpZBlRBVQyBUMRj26a1EUF44cOXK90WjMCoIACjBve3u73+/3J+hzUUt1Y/DVw/kPeT777LOvkJ0dWL9KEsGGPOPVLF2r1Xq2JEnPMAzTUqhdKBT6xNzcHDIcQdHoxbk2NDSUrDRKiF7O/2w2+6jNZvuUyWQKyRlHMOo2smcLLYzG76okwHHcPxFCHlXVqIjKPp9Pcf5DF8WfgnJWROtGFR0lsAb/v2XLlrZdu3YdIIS8TMdnMblc7kdTU1Pvy2QyWAOK3bhu7hB6yk5t33Iw/RMMw2xW2/bo+tFo9IG5ubmfiKIoyAhQuIf7e3p6YvWGAHUiWent/AflqeyortfgKDI4OGg4ePBgK8dxBwkhfLlrs1D7TCZzr91u/6zsy6g59GKLxdJPKUUQbFFFFMVn7Xb7O2D36uzs9AWDwbqiZytKCHIlWYdAkrlqxLujnxMMBj86Pz//BxldzCcHGD+P0FGW0VLNoOqgLtm3b98FJpMJhvKyJyZfHoIgHIlEIl/dtm3b59QakkVRXJmamrohlUph81W4kqGww4lSccPx7t27u7Zs2QKnWEEFWO81kclkfmO32z8DJ7DJZArmcjlvT09P2OVyVWWWst7yqIb+ZViTIwzDnK3l+4iiOGu326+FwS8v87/mDk4tZVJMX7t27WreunXrdLGRZjab7bXZbBaH85phtbW11V9lnL5/NWy9nP8LCwuXBQIBZP6DmxuZ/3UPgc7zPDIlkTHZVczaKrZOJpN5XL7sAp4IxkJvV1dX6LrrrtuwEaDFyq7cejK8MhTjYos4Pj7+8nQ67d7oma08z/+CYRg4SsoqkiStjIyMgHJljZqopaXFk0qlasFpyHZ1dbVs27btiqamJtxdNYdRzxMsFUXx0cnJyavT6bTCw4ksnIYhrqzVd+zGFovlh5TS16ntWr4fhM1msz+bzSoZU1WHsrVnz57u1tZWUBc1qR1jMfXj8fidU1NT39u8ebM/EolUPKO3mHes1joWi+U3lNILS3m/WCx2/+zs7M+UbAfZcVN1ASiljO3oNjzPw8DWr0Vf+X04HI43gLZCEATF+Q+nRyPjsYCg1XB1OhyOi3K5XEiBxZezEitul5Dv9HBsaVpyudzvxsbGPixn/mMdIeuy4uPTdFCNzqpOAhzHXUYI+abWL6Y4/+XMVgQ6N5z/Wgu59P7gtzDt3Llz57Zt235LCDml9K4Kt0ylUsPz8/NfS6VSuEdgD0MgXEPvKCy6omvIGa+A/u4tutFxKqZSqV9OTU19URRF6B2wAYdaWloCqVQKCZH43xtGb9TD+Q+/0tLS0ju8Xi+CvPODoyrubyp3rRRqL6Mcoppp3759LzeZTD8p1EaD34XVoPl3T05O/qC7uzv2ohe9KFPpoNAyx4BE6aLXApJfxsfH/zWTyYDaUUlcrjrEyzJlUlRznuf/i2GYtxZV+QSVKKXh0dHRS/NpdHfs2BHw+XzP0+g2nP8qpLxnz56OlpaWpwkhZ6loVrAqFj+l1Muy7MkFKx9VIR6Pf2NqagocmzjUYBRFZpQC7bAeCruB47gHCCEF+cPVjlVtfb/f/+HFxUXwZxwN/9jIJlUrTI3q9/X1mc1m8xFCyB6NulzrRhTFpSNHjrwtP/O/AVdZWMJy5PzPi4GuFkVx6siRI++WM/nWYH3zMtuqUhnSy/kvw/4jyAmBVh6r1RqtczhqwnHcnYSQgnymhVfd/9UAOsvExMT1qVQKxhXs0zAS+np7e2NOpxPKW1WuKzVjrPK64MDGpbtoA0oymfzqxMTEF45yrKzHXWPdRLtv376dJpPJwTBMa5kvkVtcXLwRFCKCIOBink9NVAsKkLGjo2Pz6aef/kWWZYfKlEWh5lIul/vm9PT0cCqVwj6hIFs19ohCklPxO8dxryaE/I+KJmtVJUlyj4yM4A4GZ2E+Ik7RhgC1zyyjPvSUbxNCAHGueQF038jIyCUtLS2+VCoVopSm6inrXHOByR2uZtcMypmcJrXPgB49Nzf3tnA4vCwjqKzR39UrghDP8/MMw6hFCiwo1rm5ubeGQiEEBON+ryQSbKjzvaCQjqqwf//+041GI4zh5kJtBUFwjI6OAh0RNhucY97e3t7wetx35XsMELc0Lblc7umxsbH3m0ymsNFoXMF5PTw8nNmocK6aCrfR2fMS4DjuekIIUHw0LcFg8CPz8/OPyUGM+RRcmj6n0VnJEoDvonnPnj0XtLa2gp6qreSeCjdMRqPRd09PT+M5SC6CXaKBhFNYbkXX4Hn+i1ogccFG6XA43i8nKCFQA8g6gXQ6jcANJaN4w+iLPM/fuZpQenfRE1Fcxeed/xsg81+RCBIbmvfv3/9Bo9F4m9ok3eLE+n+1KKWxcDh86dzc3B9kuyj2nFq5gxOLxTJOKS3ax5PL5R7HfVGmE92QKFEcx21hWXaBUtqhdr3k14ceHIlEPruwsPBrQkhSEIQ1euajdYyG81+dlFmO4z5CCMEiXfciSZJHNrYB2iYmCAIMbmvKOqVUWCdjEz78F1JKsWlpipCgRuCSJAXHxsauFEURBz4OfgXy//nIFzX9NepqIwHwIrIsC+f/6dr0+FwvkiT5R0ZGwMmjwChivhtzfQIhDw4OGiORCLJXi4JOS6fTP5+cnPyCfKAEOjo6Vnbu3Bm12+1V66TS2/mfl+FY15kBMhQvMs2KdhLPhWmxAAAgAElEQVQX830nk8nvOp3O766eqRlBEJR9WsnsbSjYxQixjDqIbLZYLICq5YrtRhRFx/j4+OVAaNi+fbv/wgsvrDhcbbHvqlc9i8UyvAojfVe5/QuCMD46OnqL0WjMCYKAzIQ1yovBwcFUFUP+5w97LQsHxreBgYGHWJb953JlUqh9Lpf7r+np6dvlAICGIa6QwFT8LiOBPFsK5DruB+Pj459HllyeUQgBXdW4j5P+/v7XGQwGBE7rUtLp9P0zMzOfa2pq8kejUQVub8MYHtUKFcYPQoiTYZhtatuifjwe/97MzMy35WwHBKdiLw3XK4ckz/O6rCWPx3OL2+0G3zWcXr7h4eFYw2l74hXJcdxdxQbGytRpyPBZC5KSEZTWBTaX47gzCSGTpXxvJ2ojCMKzo6Ojt0Ifb2lpWQaSUQP2X2spN/qT7bG3ay2JUCj0ybm5OdhGYFNtOP+1FrA2/cG+jACAl7W2tn5Xg0Ds474VkhS8Xu+b3W437sYKklOtOOO0kbY+vSD54EqGYb5abvegfJqenn5fOp2OiKKIwHDcuQObNm0KRaNRnLUbLpmE53k4/hEAoGWhcuY/4MmVIO+6tn/Kzn52z549XS0tLY8TQs7RUqDH6otS6vH5fK+NxWIT8vqFnb0W9hx800geeFWxMkKwg8vleovf77dv3brVFwqFNhzFCsdxQ4SQ7xcrs+PVo5RGZ2Zm3hGNRr0K5D++08HBwXi+TbHh/Fcp6b6+vvbm5mYfpVRXjtNiXktWIh80Go1pwMchy2Tr1q1Bt9uNiLd12yQgo6amJmQOnFTMOPSoE4/Hv64gIpjN5kA2m1236Ho9xlerfcocg4D9V83neaIxr/KQJw4fPvx6OTJ3zWglO/+r0fBcFdPH8zwO54eLhWv2+/13Li4u/kUONAIvNQ7pajXur8mY47h3EULAn6RpOTrzX153dYsowvP8AwzDXKOlEHFJGR0dvUw21j+f9Q+ljVKaXafgNS2HWBN98Tz/iMqLuuTz+a5fWlr6vbzPKtkQujgjqlCIqiObjzeGcDh87+zs7G/ykJvWHFayoWLd7nAqZY6oeNOWLVtO3r17N9bETpXt1VaXRFF8bGpq6m1wKgwNDWVrDBZP7XgrVl8OaoGxSLVuGA6HPz07O/urPL5wZHsmq9RxSHp6epq3b9/+F0LIPj0EjDupz+d709LSEoLmFBqPxn30OMKWDUavLmUuJEnyORyOt8PoKwiCgvSGQHicTXV3L5N1bBhcNS/hcPhTi4uLPzYYDL5MJgNdal0oBDUfmI4d8jy/zDBMMciNNBAI3L2wsPCkrEcpuuq6UCuce+65vCiKCP7UtIiiOH3kyJFrFSS+7u7uwHrbpTQdYKOzqpCAxWL5OqX0Cq1fJhaL3ed0Og8guL+pqckTi8UQmFt354jWcqtwf7ijIgCg5ZxzzrmyublZczvPUeOJeL3e1y4tLR1G4Nbw8LBw11130YadovRZl5GefqZF4IbL5Xqnz+cDGiec/DhPgx0dHYFYLBYfHh7OVqkeUrrwimjJcdxnCCHvKaKqqirHcP4rwYv1bAMiVqvVGA6H92zatAkUFbpQxuVPhCRJfxkZGblIvkdhTQNFr9plDDndK0kS0K2KLrFY7ONOp/OhtrY27yrtAWxgtRLsUPQYT1TRYrH8ilL68nI7S6VSP3E4HLDXr9GIInixq6srvLKyksw/q1QbeMp9sVpvPzQ0ZHA6nRDsusPaLy4uXhsOhwH9FxcEwd/R0eE766yzqgF+mt2/f/8/G41GwIlXvFBKMy6X611+vx+c3DCQrCEiDA4Oxmokm67iMqvUA2WOQTj/izGUqHoth8Pxulwu5zEYDF4cINXMRa9qYDpVVun0Szkcjktl3iwYshUkjXUNNCokGp7nAdH0iUL11P7udrvfEwgEnmFZVjEOwGGdq0dFsFQY6AIyzS0vL9++srJik4PXcEnx79ixI+jz+QCH2nCSqF2UpdUHnQPQPK5X0xyoQzMzM6+PxWILXV1dQY/Ho3AhqummJuvKmQpfK/fls9nsszMzMx9JpVJwrjx/T6lRZwvb3d3dbDAY+rZt2/YwIaSnXPkUaI8AgO95PJ47PB4POIWhKDa4OMsQ+sDAwIUsyyIQpZRC5+fnrwkGg7OAes7lcpgTBcGlWo0V7L59+15qMpl+WgxcdylCkSRpzOVyvT0QCMz09vZGnU7nhjJoFCkzluf5D6x+vx8sdR6i0ehXpqenkW2iGDxwP0X2v8LxWuSr1Ea1884772RBEOBw1rwkk8nvT0xMAEo7n8+14fg6jqQ5jruHEHJLMRMBSM6FhYVrsU/K63Nd9Sir1XqhJEml7vnHHTKQF0dGRt6UT8Mnf5u1EtBYzHQ26qyzBHieP8gwzD9o/Rpy8tC385D9lABnrR/V6K8MCQC57txzzzUeOnSobd++fdebTKYP6Yk4K0nSU263+2pBEGZDoRDuFlWLelmGWCvS1GKxnCMjBHeW80BkDft8vo/LQbZwjsJJirsf9I/o0NBQrXGmlyOOv2rLcdzXCSGaB0fJiWC/VWhP+/r6YtWMAKuZQBmG7Nq1q2nTpk03GQyGj2jY73G7EkXxV/Pz8++IRCJeq9WargV6WYvFcjml9Btq5EMpDczOzr4xEokgcThQQ+iXaoZ5zLrnnnvuoCiK8Je2lNOZKIqLU1NT74VNUc7698vIYgpazfO2mIbzX72kYSx/VSmcmOofdfwW6XT6Z+Pj4/fLvKdwnMDBDWi1asi0wboy8jwPOLldWo67mL5EUXTZbLZ3iqKIBR9uaWnxIkOsXg1BxcikWuqcd955OwVBgPN/i9bvtLy8fP3KysqRpqYmJWNlw0HHFCtTi8VipZQierGoks1m/2Cz2T4mO2r9edF5VQ2lZbFY7lnNwCvKMFeUIORKgUDgAwsLC38ym82+bDarwALWQlSmmmECOQFQvMhc1JJblmaz2T/ZbLaPA+4czk6DweDPZDKBDaREqJoHPStzHHczIeRTap8RjUZvdblcj2QyGX9fX1/cbrdjL6jrItNfIKO03CIuLy/ftrKyYpeN4kpAVaRW4XERGHvgwIHmnp6e03fs2IFsDr0RAED3c9Dv91+ztLS0JN+FGwEAJazMPXv2dLS1tR2klFpKaM4gy31qaurqRCKxYjKZQrlcbnnXrl3h2dnZTBUHxJELLrigOZVKHSSEnF/KuItpk81mfzg9PX1rOp3GN447acORmic4i8XyCkopAjBKoomT9b1rCSGiIAgIooLBwxeNRv/G4FHMfNVCnYGBgb0sywJ2VfMi3/XvgAEO1F6NrNfji7i/v7/HYDAgE7RYqorUkSNH3iiKItbpGhdnHtJPxYOkVrlZ30gp/Z7WiwgJGGNjY/++mnUYQUC+7CSoy0AcrWXX6K94CfA879Kaig5Pl+2rnz4K9h9Q4o1SfRJg+/r6jC6Xq/3UU0/9wGrw6btLvUsUMzRJkp7xer1vWV5ehs4BatGGzlGM4PLqyHr0r1eRRwdUNv2r6jhngsHgJxcWFv4iZ0UnzWZzOJvN4myFLl0N/pByhlhWW5UJXkU/KxqNfmF6ehqUabCF5NOiVPwOU/RLa1eR7enp2bJ9+/bfEELKWr9FvhLNZDKfnJ2dvS+VSiGoBecQbM1VW2SdDs5sVT7mZDL5xbzA4w2BKLpr167mrVu3AjHxJeVOaDgc/ryMvog1otDoho61D6qamHJfrF7a9/T0tOzYsQPO9rb1GBOlNDkzM3NVMpkMCoKAy4e/vb3dF4/HFWiqatiAkc0BvhkYESpa5A/gl7iYyZG7iK6P1GtmbkWFW+bDLBZLL6UUzv+yIpyO9RoKXKUgCPk8RFV9SJYpzpKay5ChEwzDdBfZAfV6vXcsLS0dgqMWHLaZTAbflGJcLbKbylfjeR5ccG/W+smA615cXPwpEFfyLr915fyUKW4ep5S+UEv5iaI4ZbPZbhFFEfKCQRCKmr+7uzt89dVXpzciPJuW8lXbF8/zyNB6SG07SZLmJycn35hKpWCAw0Wz7o27PM/fwDAMeM3LKplM5rcTExOfVigv5IA17CW1Au12vPEbcbafeuqpA52dnY8QQsrK6ihGyKuwr/OxWOz109PTONMUBIpquAMX8/rrXmdwcNAYiUS+zTAM9oGSiiRJ3snJyetTqVQATsP29nZPPB5X6CtK6lPvRsgaQznzzDP3tLe3w4Fn1umZQjqd/uT4+DgQ42C82TAoKYXkyfP8SxmGOcAwzNZCdY/zuwD0D7fbDZ0iazKZgkaj0ScbyepWznplbEPGoijOHDly5O2QpYzgoXzHjT31qEVosVi+QSm9rFgjZzabPWiz2T4p604476FHrRtfLs/z163SMyKJRPPicDhen0ql4CBbc/5vdEeM5gLe4B3KFJKweWpecrnc78bGxoblu8yKbFut6kQHzYVQQx3Kdzlze3v7pt27d3/CaDSCR16vQiVJAmrbxbFYbGlwcDD9xBNPiFUc5KqXHErqd2Bg4BSWZZE1fkZJHeQ1CgQCn1hYWPiD7AyF/QF3FdyxFXvEhg7M4Hn+jwzD/F25cj66fTKZPDAxMXF/nn+lqnU9jce/ltza29t7VkdHB9ZxsYGf5bxGLplM3joxMfFQd3d3zO12w7lbteiocnIhAnJACVl0Qfa/w+F4LcMw8+l0Gt+xElxVdB+1VpHn+QsYhvkd1lQ5757L5UYmJyfvliQpKQhCQv424QtT9Iu/0t8azv/SpM0ODAxcxrLs10trXl4rQRCetdvtd8JwbDKZEFkNBRLcp8kq4j4l+/fv32c0GuEwNJU34uJbU0ojExMTV8nw5IgcAjd5YGBgIHHw4MENfREoXor61eR5HhBtgGrTvGQymV9OTk5+DFDscjb2uhlVNB+chh3yPA8unnuLNVgh2Ghubu6d8XjcJQjCWjTZjh07Aj6fD46qajYIktWDFRF1/6Sh+Na6SiQSD83MzHyZZdlANpsF/GpdwQL29vY2dXR0fI5hmGs0ll16YWHhvYFAYN5oNIKfF3KDERQBALjo1R16gsby07w7juPOI4Tgoq66pNPpr83MzHwK2f/yN1C388fzfB/DMJBTWUGfkiQtTU5OvjebzcZEUUSAYiibzeKSXrNZ/0ctHCgxraeeeur+bdu2IahEdwQASilkeJPX6/2B3+9XnH4NiOEivmiO4y4jhIDGoqTMazxCFMU5m832LlEUFRQyOHyq/v4Fo/HevXtNZrP5k4QQZIzpVXKpVOoDDocDQRbKXaFqjTd6CSG/33PPPXefKIpACCkZVSiTyfxqYmLii6IopgBzCAQhBKeeeeaZsUOHDtUtwgLHcRevxq18R6d5ys3NzV0aCoWmWlpaPNu2bQu4XC4YGxv7aZ7AOY57zWrm18Nq5mB5eflmv98/Kt97cebjT7n3qulKk7o8z4MSDdRomhfQnfh8Ppvi/JcDGxtrSHNJb8wOrVbrqQhA1mP0giA8Mzo6eiuc/21tbSuJRAKOiIbzXw9ha9cnHE3mtra2LWecccZHWJa9ghCiyvmk5lVEUfyd1+u9bmVlZSEvG7ea7WFqhqdLXSR/MQzzPUqptcwH5GKx2FedTifuj7hHw/GPQKC1jP+GLek56VoslgVKqeb6dy6X+9+xsTFQdUHeoHjbaAGia3vN/v37bzEajaAaqUTxR6PRd05PT4OmCbo1zqOqvE/19/fvNhgMU6XYFHK53K8mJydvMZvNSCBQEpqrcpzlTrqMhD3KMMzmcvoC8qLL5brJ7/crZxHuK76urq7QddddlzpWQl3D+V+axMn555/fmc1mbYSQrtK6KLmV5PF4PuD1egHFjAgPZNoo0eNQ0Kvp8mHgOO6LhJCrSh6tyobZbPYJh8Nxr5xRp0Dphiil6UZkpkph6lCd5/mbZMez5r0jY8Vut7+dZVlAsa/09vbGpqamso15/z9Rl8LrK4riis1mu1YURRit86Eqq22/+as1JWc0IvJVc0jfbDb72MTExMcV5z/4fOtlrVmtVhOl9KNa0yUAos3v9w+7XC5k6QlGozFmMBiCmUxmjZtteHg418j613xbLNjh/v37txqNRsyB6gK+vbm5uVeFw+Hprq6u4Ete8pJ0FQUgqh7P8RrI0FzIMCjLaAHO32AweI+crYD9M9rc3OxrbW0NBIPBdXMCaCao5zqCYmzo7OxsaW5uPuOkk076KSGkWJSZsl5FkqT7lpeXP7xp06Ywz/NCPa7FsgR0VGOLxfJvq4a4n5TbZy6Xe2psbAyc7UADQsCtNxQKKSgW5Xava/vh4WH2Bz/4wSkmk2m83MCeQi+aSqVuygsAgHO6Lo0aheTA8zzgMoG2UHKRM9RvNBqNgPtfy/pqbW31JZNJGCIRAFS3suV5/n0Mw3y8ZOEVaJhKpR5yOBwI/oRtAX91j+qjRpZWq7WVUvpnSum+YttRSqOjo6MXi6KYWYWmDsuoCqBqXDe0K57ngbrxhmLHoKaez+d7v8vlQkYTAsF8Q0NDicZ5rEaCjbonkgDHcX9HCIF+r3mRJMlps9mul+2rnp6enqDL5cKZUk32Vc3HXesdgnrsqaeeMvl8vi29vb33E0JerWcAAMMwC5FI5PUzMzOOBurYiVcPkDpyudwf1ZyZx+oRCL6pVOqA0+n8riiKcPwjCTIKW5KcLYy7Cu7WG/pbhR1PkiRd0EglSVoeGRl5i0zxpjj/IfeNVBAs38Jx3IPYZyo18Egk8ga/3/9ET09P/KKLLhKq0WaK+7EkSXDcl5LNLgSDwWvn5+dBCxIYHBxMHTx4sO4QnHFWTU9Pf5FSWq5/lMo0RV+U97016jvIzmq1xo8XBN9w/pf+xYLT/kGGYd5YehfqW8oRVx+Ro37WMtu3b9/u37dvXzV+IKS/v//FBoMBkUqlbAKqBQQ47tnZWWwaCuyF12q1Rus5C0S1kNaxgcVi+Sml9F/1eAWgPjidzivj8fg0DA7gnJ2bm6tqB7UecjhenzJMHhyvp6l5bjwe/87U1BSyjGDYV6AqsfdUdWaV7LADL2rZ8GJHywswxyMjI6ATQPAVAk3C9eD8f9GLXtSRTCa/uWqYf41ayKZCayoajX5lbm7uJ4QQKCQIXIORHusJl8Q0fQ67b0MrbIVkqNPvBp7nocBtL6V/URQdDofjIgRc5WW11tU8WiyW71NKX1/uN5FOpx+dnJy8Dw4AORMO+4cCzVVPmUVr0HhAANi1axe3ZcuWH1WCAgAGH0rpXyKRyDWzs7OTQ0ND2QMHDsAJWFfrsZTv9Og2PM/vYBjmGYZhesrtL5VK/cjhcHwZSGQGg8GTTqexr9cSZJ9p7969rzSbzeCx1BOpLJnJZD5ot9u/he9/eHg4W43Gm3LXw4nay5CQP2UY5uRynuP3+z/odrufkemDIs3Nzf50Oh20Wq3Jetf39KKzypuPlNPpvCgWi01u2bLFy3FcvB4NcKWsv76+PnNTU9MvVqE6/1FNe0EQxkdHR28yGo1pxako0xFm1uvey/O8nWGYc9SMo9i68Xj8y7Ozs982GAxe0MQNDQ3FGs7/YqXXqFdIAhaL5S2UUiDpaF4kSQrZbLaLFVq/7u7ugNvtruuAMs2FuD4dQu8gPT09TcFgcMvu3bvfZTabdUE2yRsekCGunJyc/IPVak0fOnSobtHvSp3SgYGBswwGwy8opaeX2ofcjgYCgU/KwfPQ6/BNIoAejv9IX19f3G63Q/51G/hZrPz6+/v/3mAwIPhO84IkhvHx8ddkMhm3nPmP5JENFRwFc+WFF15ocLlcezo6OoAI2aq5oI/RIaXUF41Gr5yZmUHgG3TsXDXaTstBnVh1iC/NzMy8IRqNzsn24bpDHuN5HucSfLll+UYFQRi12+0flG2KWA+h1tZWf2dnZ/hEiG0N53/pXysZGBgYZFn20XInT80rhEKhTy4uLv4WMIey4wmGYwVypdoOPLJnz5721tZWQP+fqWacJdZNOxyOS3O5XFgQBDiUkLEA43otGSFLHHr1N5MjPz2U0mad3hb8n+92u93/mzf3DYWNYZjzzjvvZEEQAIHfr0b2uOTNzs5eHYlEFmXDvhdZqi996UurPotD5qx3U0o71Iy5yLq5iYmJ1yaTSVx+kdmicPnWrJPJarXup5TeRyn9+yJlUHQ12TkEmpx8iLZAZ2dnpI4ynouWR5VVJBaL5ZeU0peX+l6pVOozc3NzX5Az2JXI+1K7q6p2FovlnZTS/yz3pRAw5HQ63wMIUaPRmFqFGUf2n3/Hjh1hn88HmdUbDDj0C9PWrVtbWltbd2/fvh00KeeVK8ci26/kcrkPLS0tfTcUCin3v2q7Hxc5FO2rnXfeeafL9wHAcJZd/H7/nYuLi7h34RzEeYiM1mPCzZX9MB06QPb/fffd19rd3f0Ay7KX6PCI57vEnUoQhE+srKzc5/f7oZ8oWUo1e3coVl5Wq/XFkiT9cJVn/KRi2xxdD/ID5Ov09PSPZdkh0DsoU6coVBN1/a1bLJbRcjPoCsifxuPxz09NTYEOBHo09OkNH0gNNLFoNPqxVcQjINipgpRG4N/4+Phn5aA/2G0g13ULopaDv/AOupRsNvsbm812t9ls9jU1NXljsRjWUN1lcOkivEanBSXA8zz2Jl243XHGLC8vXxMMBkdzuZxnx44dfp/Ph3tkXZ8rBYVeGxWgd2Bvbm5vb2877bTTrjabzbfjf+v4+suZTOZ2l8v1SDQaRZJMwwEtC9tisbxiFXoe32pZ6G9AzgmFQl+Yn5//k6wrw7aL+14ISG/RaBRIYxsWTevotc3zPODogcamS/H7/besrKz8TkYwUvwsda/DHCVM7DXms88++3UtLS3fWEXjatJF2H/baSAej189NTWFxNrk8PBw1SEAWCyWb1BKLy9VHrlc7oBMLYG1FaeUCusVJFvqGI7Xjuf5V636RJFQ2V5m36mlpaWbA4HALCEEQcSwKUJesMMkKaXi8WTWcP6XJ3kjx3E/X4We0pxT+jivJdhstjeBKxYwN7lcDgrk2odRxUoV29/ff6XBYPhKeaIu3Doej39zamrqgNFoRFZpsK2tzZtIJBAYseGNFoWlp38NecN7RM8nZbPZR202210wQAMRw+/3b/jAjwsuuKAlnU4/zjDM36mVvSiKriNHjlwrR3UqNBo1EeXJ8/xLGIb5rdoxF1lfXFhYeFsgEACn5Up3d3fQ7XbDgVdzl1/ADzmdzgsZhoFRflOR4y+2Gk2lUg/DiCyKIgwnWQSR5HK54JYtW0LhcFiBhq45uRUrgBqoRziO+wQhBByXJRVQOng8njdHIpE/y7DLOHNr3ZmNoIhLNMouSk1PT1+7ytmGjGh8AzH5/oZM1UQdZ6qyVqvVcOjQoZaWlpbNvb29XzUajSUHmahdnJIk/WppaemKLVu2BJ1OJwxytb4m1Yrgb+pzHLeFEPK0log4MzMzb49EIojSD7S2tnqSySSUz1q7dwPGsZXjuN8SQviyBV2gA0mSHna5XDcEAgHcp4D6Uc9rk+U47k1a8NQLgnDEbrffBWo3BFEJgoC19jyCUJ3Lkenv7+8xGAyLeq9P9L+ysvKGUCj0NBAVGkH0DLOKkARdCPCaqkskEvnczMwMEAPg8EeAFNYs7r/r8t0PDAzcxrLsJ1QPpMgGkiTNjYyMXKGgxfX19YXtdvuGh2MuUnyNaieQgKyz4hvappegMpnMz+12+0cRpNPZ2ekNBoPr9q3qNcY67xf3OTjj2s8555wrmpub4Qw16zhmMZVKvXtpael7sVgMNIbCXXfdtWHRDPGNTk5OXsyyLBz/5aJpZQOBwMcXFhaewnkp3/sUx3/kpJNOSjidzobj//8WN+F5/s/I+9JrvSeTye9MTEzcJ9vafRdeeGFyIyL7YJ0fOHAA8P//TQj5F73kfax+4/H466empp6QUeQQAAA7alXYUrVImgmFQtfNzc39THZm10WCjBwA/3sN1ongdrtv8vv9TlEUsfdhP4Q/GH+4q5wQSbTh/C9vBpD9f4V8uJXXUxGtA4HA8MLCAuBFEPEWBL9hZ2dnqMq5qADB1Lxjxw7AjWuSZXQsUVFKs4uLi+8OBAIzcjCEb/Pmzb5VjvnYwYMHoVxXxYZYxDTXbRWe5/+LYZi36jxAcTWb6gaPx/NEc3OzV47C3bAGB57nAfH/c4Zh+kqReyaTeXxiYuIzoigiiALGKk9fX1+0Fow4Fovls5TSd5Uy7mLaBIPBD7vd7p8C1rKjowOZATV3ObFYLP2ryAifZhhmUA8EG9nx/y0ZmhfcbHB6wliPv4IXlGLmoVGnfAlYLJaLKKX/XU5PlFK3y+V6ld/vn+/t7Y3VujJusVhetwpTiDOrrRy5oK1s+H/UaDQKgiAgWDPY3t4e3L59e3Rubg6X9HrOKCJWq9WIAIDt27e/oKur60qz2fweDQxCxU6LXxTFLwQCgS8sLS1FALO+0aDWFUHJ2Z64D5xbrPAK1ZO5rN8s3xGgeHp6e3tBwVRTNBbPsc4Q0+mnnz6wefNmBA22FBp7ub+vZkbMrQbC3Wiz2X49ODiYha5CKWXqJcMB8unt7W3q6OgAfzyyNMsyAouiOO1wOG7JZrPQgRXI10BLS0tIRvioe8hdnufvXIU2vrvctVdMe0rp/MzMzFA0Gp3Po/Sp57PqmGKRnY3XrzqTPl7qfWB2dvbyeDy+hGCVlpYW79atW9cNShzf5KZNm/5EKbUUsw5KrENdLtfbw+Hws8ie3rVrV3AD3HVKFFWjmRoJ8Dx/KcMwoM7Rs4gul+sSn88H2yXsHoAU37C2JD0FrUffuM9ddNFF7B//+Mcmt9vddsYZZ7y4o6Pj64SQLXo8T+lTkqSf+P3+65eWlmAvAyS3VE/3uWJkJwcYP6AFLbIkSZ6VlZWP+v3+GUII9GfY2dYc/5s3b45EIpE16PM616GLEfvzdfbu3dtpNptHy0VbONFDRf6DNPkAACAASURBVFGcsdvtlwmCsIZiNDg4CF/LRkX2Me7cufO0bdu2PUYI2a1qssqoTClFpvenFxYWvtjV1RWXbW5VEQAg25ZHyhgemibC4fCVs7Ozv+3p6YmeCMa+zOdUpLnFYvl7SimS7EC5WFZJJBLfm56e/i5odAVBwB6IAO1AT09PpBg5NZz/ZYmfYfbv33+60Wh0lGvUKPQakiQtj42NXUsIAV8cjMfYcHG5wL+rmnsbkJoPP/zwZ1mWvaHQOEv9HRnKDofjRqAiyDQIgLMD9CggUTacsaJUOerVTnZCg/5Bt0ht5d1FUTzidDrfJkOyA/lhQ0L/cxz3akIIom5Llnk0Gv3P+fn5nwmCgO9KgapUsrX1Wi5l92u1WlslSVooZ+yFXkIURZvdbr/OYDAA8k3Zi2vi8stx3JmEEATivJNhmK2FxlrC70IymfzRxMQEnKfYf5EFuqawYX/etWtXfHZ2dt24TksYT1036e/vf6HBYACcnioo26OFIknSKDKt/X7/tMJHVouBd+Vk+B0lEzEWi33T6XQ+LDv+U2azGbD/gWQyCRhcnE3rkvlXyQUtO1bBbQbozU19fX3Xm83mtxNCSob/Vvv+lNKnRFH8qNfrffycc87JbLSgUKvVerYkScg83aVWdieqLwiCY3R09L0KnPWmTZs8Z555ZqxGuU+x/zX19fX9m9lshqG4XFi+YkSdlSTpK5lM5l6WZd31xFkqnyvILkZwYVlFFMUlGIG9Xi8QJhBYEm9qago0NTUFZcjXmgo2KUUY8r0WetTZpbQvpQ0MjNFo9JJgMPincDisGNo3TDC91WrdLEkS4HOxx5VkM5MkyTU2NnYN0CqUIOo8usaKy7K/v3+PwWAA+ouu+5soig673X6lIAjLMnR6zQVIl/LNNNroJwFQb0QikSe1DGA83tsmk8lvTExMfF5G6ggPDw9nGvZE/eZWh56xX5Ndu3aZ5+bm2k455ZT+7du3/wfLsgM6PCu/y5VUKnW1w+H4dR6qU8X3eZ3HeKzugfD00lW7238SQvaU+3xBEMZmZ2c/Go/HgZYjyBn/+DfsutCfQS2Wa3yTfy1pjuMGCSFAewX6hW5lFQ3llvn5edDJwt8C295GDY4ifX19JoPB8Eqj0fg/ugn82B0L2Wz206FQ6D632w0bvaIHret+A7/fI488ArtvWZz2lNJpn8931dLSEoLw4O+sST3PYrH8m5xg1Vru+kin0z+bnJwEAhkCy4B+h/1QQb/DHbugH6IkRabcF6+z9uzAwMB9LMsCDk63kk6nfzE+Pv4FJeu/paXFl0qlFJ7panduk/379+8xGo3jegkokUg8ND09/W1RFLHw/e3t7d54PK7wFOr12Ea/xUkA8Mm/o5S+uLjq5dcSRfFph8Px1paWFk8kEqn6AJnyR/x/PfT19Zmbm5u/QCm9qtx+FxcXrwuHw9Mylwxg9pDZh2+sqvccjuNeQwh5uNzxF2ofi8U+7nQ6wd2DbEdkO1fzxYQMDg4aIpEIMv1vLDS2Un8HCovH4xleXl5G1Oca1L/s+McFBX/4HnEprOo1VOr4a7EdghhNJtPhVRSIjnLfX5KkP01MTFzS3t4e8Pv9MHbXTDYmMvymp6fvppSCI7Lsks1m/+RwOD4uiiJkgDWP9a9wcimG8HVV0soeZJEdIADgwgsvNBw8eLCpra2tY+vWrfyOHTvA212Wcljk4/OrOeLx+Os2bdrkPHTokIIKVddzYLVaXw4KhBJkVbBJKpX6pcPhQGY3jHIwPuAPgV41F9QiB6mwXV1dQCu71GQyAdayYnqyIAhXBAKB77/oRS/KHDhwAOdjTa5Lq9VqkiQJvOjIlC67UErjc3NzN4TDYRgZYWBEAKoC9x8bHh7ObgQDsM5UViecp0wmc6PdbkcwJwzuVccxWvYi+9sOgFizTZIkQA2XFTAFBCyn0/llBEQqmXLyfrkeiRuABIZu9GodZHZ0l4LX64Xh9snNmzd7e3t74zUaFFYBUTUeUYwE+vv7/91gMODeqHsBndn8/PzrUqnUeDqdVuB0a+5eo7ugqvwBMjQ39Iy25ubmLWeeeebXjEZj2QGJhYYtSdI9IyMjH5NtZtAB69bmIaPjfFZOKCkkmoK/p9PpR8fHxz9vMBioDGudNJvNMYPBEEylUtAvFErXupVpQSEdp4LFYvnparD7v5bavth2CAydm5t7bTgcnpXtGpiTDTkfcHYPDw83DwwMILjo6mJlqFU9SunvnE7nG+LxuOIgX3f9ked5JODtLHeMlFLn4cOH/xn0jTJVLM7gWlln8H8BWfV75coB7Smly3a7/XoZ/U5JqlvL+rdarcmnn35aKAZppmJGDS0GXY19wFjU39+/WyvD+bHGSClNzszMXJ1MJteySwVBwH/xB2PbeiiPpUyFgeO4nxNC9OB7TTscjitSqRQ+gFhTU5Mvk8nAAFn1GcqlCLLW2lgslndQSv9Db3SMo+SCC+MTbrf7ekLI0uDgYKqWjanFzPkFF1zQkslk3kMpvYxhmDPLNVrLaCNXK3C+ra2t3lrh8uV5HtlRekJark0JpTSwvLx8pcfjeQbG6KGhoXQV8l6B0/1VDMMg0/Z8hmF0y7aVJMnr9/s/J0dp4mzKmEymuAz1j2CsxNDQULYKZVTMJ1a3dc4777yTBUEATNx2LQZJKX3S5XKB79VdKwEAAwMDp7AsCwP9P2sRMZ/NZp9wOByflQ0XuKRHm5ubkakalgPSaiYoQos1kdcHjHDm9vb2dpPJdPIpp5wybDKZXqvxMwp1F14NRnw8Ho/f1dPTM3nw4EFFUa5JZ+vxBitnCt/LMMzFDMNsLiSUUn6PxWJfn5ub+2+gAzU3N6+k02mFy7pWlPOjhw29GBkzbXv37r3WbDbrxot9HHk7JEn6ViQSeWBubg6GnJqiLeM47nJCyK1ydnrZNgbAvrrd7g8Hg8FZBFEZjUY4UMOtra1AT4EOvCHQU2Tkjj8yDNNZyneqQRusQ5soil+KRqP45hWo3braM6E3yUEWtzEM8zIN9FYaCATuXlhYeNJoNMYEQfB0dnb614tDnOO4iwkhCFiuSBEEYcThcFyVy+VceWgHDQdqRaRfXw8599xzeVEU/8AwTNnZc8VKRpKkqampqTclk0ms3ygCAooxrhfbf6NeZSQA59yDDz5ocjqdrR0dHTtOOeWUS5qbm28jhDTp+AagcRpdpT38QCgUOuhyuRSKt7o5M+VAzzev3lOBjlM2tS+lNBEKhR5wuVy/l+kiITM4/qPZbDbc2dkZCwaDSnZr3chRqzVosVheSyn9kVb9FeiH5nK5n4+Njd2sBH2vJk7kNvD+aOzo6NjS29v7G4Zh9ldoDp5/DGjkstnsHXa7HegD+G7W1cbE8/yzDMNwWsgBCADRaPSamZkZIFYhyGRdx1bMmPr6+trNZvMDhJAh2LyKaXOiOrDROp3Oj8jBT2tJdUC+y2QyCISPqfn2ylbMyx1MPbQHf1p7e/tvCSEv1GM8yGqfnJx8UP6YMclrkPa1kIGbJw923759/89kMj2hxUeQL+dsNvtHm82G6EoY2PPlsyHh3vVYg6X2abFYrqKUwqGyLoVS6hEE4e5YLPbL+fl5KG9Vf2CoEZQMgbeXYZi/Wx3bHVpyPCWTyQMTExPfUOB8Ozo6vLFYrKoDjqCIUEo/uqpA3KJGjmXWTSWTyfcvLCz8IJVKITtgvTm8Ab12qhwA8kpCyFu04Bg6kYzAayeK4sTS0tKnIpGIhxAigptNdvwrEG0Ixlpv2ZQ51fXZHJfUpqYmG8MwWDdalZVYLHZZOBx+8rTTTktXa8aXvIf+E8MwyFo4q9zB41sQBOEPk5OTn0fglCiKa9G5uKSbzeawzM1WzQgh5YqgUHvoHYBXhzIEI+6mM8888+K2trb3EkLWw7H1Q8Cur6ys/MHj8cCoVBWceYWEWOh3juM4lmU/sRqIg2AW3UowGPzY/Pz8QZPJBP7BlTx0oFo2zK3BONrt9rZ9+/bdaDKZ4Ahs0U2Ix+7YQyl9gGXZn3i9XrvM41eVa3P//v1bDQbDBaucrLiDXqCVnOTgSvC9TsroKTD6hFtaWkKpVGoN9rUYiEOt3me9+rFarS+glH6/kuhpBe57E4SQL+dyud81NTVNPf3009EaN/iS888/f5cgCOevGlAvZxgG9wFNIHNhkJufn39nKBSakZ3fQFALIqmjwjIj55577l5RFH/JMMwplVzLuVzu4cnJydtbWlpWGtn/lZR83TxLWbuwR5xb6VFJkvTsysrK9R6PZwIJWJTSorLrKv2ejecVlAB0D9PWrVuRKNPW1dX1j5s3bx4mhJxRsGWZFSil34rH459yOp1T8p2lVoNj1ySBTP/JyUkry7Ifkc/LMiXEIGFr0ev1fn5lZQVUyrDVQk+G3Qh3PfwpqJF1ZcctV3BK+71793Y2NTX9cTXLuGK0UHh2Op2+b3Z29p50Og3/y4a4kx9nzrC/GPft2/cio9H4Y0JI2UiapawNSukXo9EoqLbnnU6nEqRbSlfltEHG+y8ppVom/Abi8fgNPp/vFzIFWdWiqVit1hdLkgSUXSTclV1yudzI9PT0x/Ic/9gXg+3t7WHQoqhFv2s4/8uekrUOECkO2P/7tenur3qhLpfrXT6fDxcGHHxrWf99fX1Ru92Og7EmioyQsMVoNMLB8AItXzocDt+7uLj4a0EQEmaz2Z/NZtfg5aocgltLEVRdX4ODg83RaPQ7lNLXlMsjrcHgYDAVKKUP5nK5j/X19c3KKADouiYN1IDpNhqNyOYDtCouGJoYqvJlLe87E0ajMWo0Gj15GX1Vm7VhsVjuWYWIRRRqpc82rKNFQRDeNTo6CuNaxZ3cAwMDZ7Esewmc/ZRSOHGxJioih2Qy+X2n0/mgKIqi0WjMCYKAwCtFYVOM9Ot1CdVgC6nvLmTIPrsWzu+jJCVms9nbbTbb/X19fZlq47OWz6nvUkoBgQuHdNkllUr9eGpq6qtylmoGGdFyUCIU40YAjCxhZOJ8//vfN9rtdjhVN5lMps6+vr4DLMsCtabSZW3/RvYKy7IPHTp0CIa5dYfNK0UIciYO4Nbfrce94Oh3WllZec/y8vKRPOe/YgAq5fWrqQ32A1NHR0f7zp07r2pqatIEwr6EAeK+BcfhnT6f7xEEAdDn+AnW/e6KwKloNPrO1b3zQ5RS8Idrdt8ApOjMzMyN0WgUge4w8sCoiLtEoLOzM7pRsr8uuOCCznQ6DWSp00pYO3o3wdrMEkKQ6fTtYDD4q8svvxyGKGVtrvsaPZEAEFQhSRKyFq+X5av5nRlOfrvdfkk2m11buwp/eKW5S3mefysCNiilzXovimP0jy1rZmlp6ZU+nw8BYgpk8zq8SuORtSYBi8Xy75TSh4DGs47vHlhZWXn58vKyE+uXUipWwxm8jvKoyUfL8Ny42zW3tbW1G43G7p07d37YZDL9SwUGhHvMAz6f71aXywV7SE2hOiny4Xn+NELIg5RSJB1pojdnMhnAlgMpLyMHeqaRPMKybMRkMkXz4Myr1v5YgfVz3Ef09/efZDAYgAxVNvpCCeOgkiT9eX5+/s0yNRcSHjbqPEEHat6/f/+1RqPxMyXIUqsmKUmSbh8ZGXlARgjH3oN3q9idnOd50IS9VasByf0gueZzo6OjH8pDAKiaQKq8BET4ZjTZG0VRnHE4HDeLopiWkUTjSCTKZrNraOeloOlqpqhrPLk1111vb++Ojo4OcBxr6tgWBGFs1cn/AZnLPtLc3OxNp9OY8FpUnpCR+jYooFpO8OTk5CWJRMKHC0Iul/Nu377d7/f7a1E+WoplXfrq7+/fYzAYADt/0aoxSPdo2hIHOS0bU5cJIeAqwloJSZLkY1kWEd3IVE5ms1lATSmPQNDNWpEkibAs+zcH6PH+//x2+DfaHqMuIHlNciZk62rEWAelFDDU7ZIkncqy7EmrWWAnMwyzVc7O1QSe+3jyW+Vrjc3Ozr5jFWZnOQ9NA4YrJTOyRNHr0oy1WCyDyPhnGOb/6fIEdZ0uU0ptLMvOUEonJUmaMRgMKUJIXJIkkWVZOEeeL5IkRVmWPV4gFzJjW0VR7DAajVskSTqJELKZUroL6wNID4QQZIXh3zC+V7QIgjDu9/u/ury8jCARZPtnTSYTMpoA0QaUiFhfX1/KbrdD0a3YpbOiQqiTh3Ec920ZJULrEQH68NFMJnPH+Pg4gv+UaN11Ww8yxP/7GIZ5vZZ3NkB1z8zM/FRWfKEAI2AT33u4p6cnIWfvVo2iovVEl9AfeJWNhw4dAvRmW3t7+47u7u43tLa2voMQousZd4J3nQMlACHkJ88+++zP4MjCH6WUqWZj7wtf+MJNuVzuNkopnFm7S5iLkppMT0+/JRqNLh3l2KqX/V5BqGg/55xz3tjc3PypdUAAyJ8XnKljDMM8A4crIeR/Dx06BGeaUnTfU7F3EkKwxv6BEALjr+ZoHYIgAOng86FQCAE5a45/s9kcAeyrHABQE7CPJX1QcqN9+/adYTKZrmMYBvrUeu2FaoeA9Qc9AfuBnxASoJSGCCGApAwQQjLQLViWjeHfcud+QcAUM4zRaHxez1IenEqlgPTwXIXjFLPZ3JTNZteyrHBXppQ2EUK2QX+ilHYQQk6mlILuqothmG0yBQruzJCrrnYwGZkQugkC/0BHiMx/BATqTtkIVMqOjo5/ZxjmGpnCQO18alqfUuqVJOm70Wj0c3Nzc1gjtcTdqqksGp2dWAJ9fX3m5uZmUIchmP3F1SAvQP5TSp/I5XL32u323x+FJKn72VsNMqiTdyBDQ0PsgQMHoHfAxrK5t7f3Ve3t7e8nhOzQe4xAJF2FBf+hKIoPjo6OPiUHkuCxVbuG5KDiNyHpn2GYC7WyN0mSBB7vB+bn5/8knwc463G/wxmJ+y7+YHdUgiX0np6a6h90r6lUCvryOxiG2bWeLw/YedBCUUq/MzY2BtsxbD9VrTfrJC/DySef3NnV1fUQy7Iv1ekZxXYLe8YPcrncN2w222Ql9xqLxXI7pRTIIJoXSumfc7nccCKROKhQkK3zWmN5nr+FEHI1pfR0rQYMBGan0/ktURRhN4R9PZHL5cJtbW2hRCKBPbKkQBtdlR6tBl8j/Rj6+/vvNhgMt///9r49OpLsrK+e/VRL3ZrWaCxrvJq1ss6OxxppxK69GIKIwWBiBwhoHfIAEsAcIBAnPuGc8Ii1OH9gIHGAxCEh+PgkEMNObGOMCbaxLRy8tnet9ew8NLMzmh3NTI80Ure6W/2sd0W/O/fWXpVaI6nVLbWkqnP69OvWrVvf/ere7/t9r1aNF4LmjRs3fqJarUKZxmaIFA/LJ06cWD2IUe0PglVEdWxsDIBOS+pOa5r2matXr35YURQY1/Iw/lOwfc8jb1s17wehHwgc1Wo1IctyGiCL67pvFQThnYIg4D04DjgFHMe5d/Xq1X/RIFqFAXb7docAtFKp1HHHcfps2/52SZJ+Zi0q4A37NqAjeGEobPV6/TM3b978EyqU8CnaoKwhyqk6MTGhTU9PH0jv9qM2re0U1CktkQL/N2q12h/Mzc0B/NhT4BfghWVZp2RZ/hHXdVuaxhvPw9LS0q/fv39/VlEUC04wNNV/ER665XIZTgCBTLL5Q4WIy1AikYiVy+WuZDL5yODg4K+oqjrRgprLu3mU4SD4R47jfNIwjFfe+MY3Zs+fP99JEQ3S+Pj4Y7Ztf8+abA0D015HxtUvXrz4Q7Zt77lhazeTusNzwZtwzOw6duzY60+ePPmHa1FP+xFds9mwLwiC8DVBEC66rvuSbdswtBZRO7Wvr680PT39UMPpZp0iK0qhUDimKEqvbdtwQMWz+L1rQNKZHdJvJ82RKeYbr7zyyofgPMil+odMAcM/DwR3LFC+kxumbeWnnnqqR9O0E6Iovm6tzjQyOMGBetd1IpsYS3BKCymQy+U+sLi4+BXLskrhcHhZ1/Xs5ORktdX7COQb0zRT4XAYDuMDruu+ba1OKqKuOtIJn5ax+EQoFIIz04qu6+WLFy8C5zpMz3ULOenQdiVOTEzEq9VqyrIsOJIhw8k71gI0fpQaZjv1xq/AqCJJ0pfh2ITsiHDkn5mZAQ8HR4dTgOLRpAwAdehM9PX1DZ04ceJXFUX5dkTv7sUtuK77Sdu2f980zavXrl2700llx8bHx2NrGVOHHcf5TlEU/2UrnYph37As65vXr1//LcMw6kxvhnELzoI0eAR6M7JIdmx6773gEf4awD97enr610rVwXnxe9f2zp+nQWF7PZSHXQ97+B+7rvtZWZZRwgEZmVH2sDIzM9N2p8cOIAQpG7e8vJweHBx8XhTFPS2z9JD7/6rrup8QBOGrsizfXV1dLc7NzUGnastx7ty5d6+VoPjjtnT+oFMD5VRM0/xPV65cuTE1NWVPTU3tZXCN+KY3vemUoiiwfaH0eCvxF211dfUPbt++/X8pxg7bC3AW6MF4NW34B+EC43/ruBKp/8cFQXihVV2ixsPly5fhTABvj5IsyyzqHxtiJwGQO7lleXR09NfXomCRmnu3h3nr1q2fLhaLC5xXPTzr98SrfreD79TzUf85Go2+w3XdOCKNJUkSaNQEPGRRExnKGYz+suu6AKcgPLckvUmn0uSojUvX9S/Ozs7+Fp4llNJAxpFSqbQnz9X4+DipOw6nEtu2j8my3LcWLfKY67qDgiCMCYIArzrwHeO9ozY9+3m/VrVa/eTdu3c/TmsPYR+CMI/IvIphGOVEIlHu6empPfXUU8azzz7rdHK07H4SstOuPT4+/nbHcT7b5nEhgho1M//7Sy+9hPrQfCmItoG+Z8+e/R5Zln/FdV3IaC2t3W3b9vX5+fkP0PTUeB5YusKirusQ0oNU/9tgKpqOU+nt7Y3k83lkAUh1dXWd7u/v/01JkvY1ogHgkyiKddd1L4ui+GFRFP/kXe96FxTNfUtvPTo6OimK4m+spRFFRiBEMO21PmcXi8UP37p16zPU0SULwxbNdtGUwXkbbLJfTTwHgK6uruOnTp36kKIoraxl2Kr7At2xBvHv95Fym0Zh5yVJIpkCXNe9K8sPqkW5rpuybbtLkqSTiB5yXRdyPiLgINvjBVmr7fxVLpc/cuvWrU/R1IYGnLphNKUO3XhnQHDb9opWTYS/HybXUt3pxFqE1GtEUYTT6re4rvs4NXThOd4TWrfrPoN+11EAzlHvppkbIQvg2UMmoB0ZucfGxr5DluUBZIQTBCFJr4DnMwrHZ1EUT7qu24fgCtd1ZVEUw3g/AHOBiBCAmiYi0ujadQnZ91zXheMdDKp1ikGQ9UoUxS+98MILS/sc5XUASNsxQxTPnj373ZIkHQOfOo6D7IfptbrE/aIonnJdF3hSt2+v6ZjBb2MgMDYw53e8I8PJTZrpBIFbCHYyse9allW7cOHCn1HeJVvvNvoPmrSJApwDANZKGPuBcSZPnTr1XT09PR8QRRGZNvfiAA8huv2CKIoffPHFF/+CZRzbDx4ZGRkZlGX5p9b2K5QzRlZSyCUtO9ac7+u5XO6ZxcXFq7Ztwykezw1kO9g2IOdV+vv7q0tLSyyq9Ug8J8ywT2Vy4J7Q7SAnnhRF8VHXdYF/DlAZEfx6EPZ4YDx4MZ0EGQFQOgX7+4rjOAgUQtanu67rWqurq5+dm5sD1nxg10esK88884yIsoayLP+woih/1LKHpzUdYS7wbOH9liiKyAiAjMir+Iyg2itXrpiiSFS+pp+9J5544gnLsp5vzZAf2guwmY/XarV/df36dciObS/JMzo6+sRaNPMzyIBHMcWW6ceO4yxmMplfWllZyXJOURVE/FPDPwsmatoO3LLB7sHkdvwlhoaGIqlUCl7MLfG0XllZ+eC9e/f+2rZtEvW/VpcOUe1YKPHQNv1A7jMh4SnzljXgDCl+dnUgOvn69eu/YJpmybIs0AXRhPnJycl6q73qdzXQA3by6OjokCiKKGEBhSw4jiAFlpeX/929e/ewaeO5wrqDdJzYcNriVTc6OvoVmkL2CFK7828ZdUvr9frn8/n8X2Wz2ZuKoriWZUGgx16E/Qm8AYEdhk4C5rWLVzqfWgdzhGNjYwCT8azv1YG15a8FQfgry7I+HwqFbs7MzDCjYdPyzcjISFwUxSclSXqr67pvFkURCnPLPa9d1zVqtdqzd+/e/Uy9XgdgQZxguFT/7HkInoXtcxR0EpIFgCpUXd3d3f39/f3vjMfj/0gUxZbI1tsfzqYtscbNrUXnzrque1EURZSzgNHiNsfDu1Kc+SuPjo4mJUlCNBKcV8Zd10V5m31LBQ7nwGw2+8lsNota9HBOXqVZt1hpoKaV0hbMTbu6kIaHh9W5ubl4IpFIDwwM/NNYLIa07EgjHhy7oADAjpWVld9ZXFy8yEU5QK7AHoEX5AusrQcqi9CTTz55zDRNAJ3MYLsLKgWnHjQK2LZ94+LFi++lvIu1ERjFjjGcsbGx/0NLFB00ErR8vGtg8vddunTpi9AvEOn1/ve/Hw4ETcuLLR9g0OE6CkxOTspzc3PAEs4FpBFy3/zmN08ODw+7c3NzzNkl4N39ZwzoHazEExwAulKp1Mn+/v5/GIlEfkQUxZaXNtrillE68rIkScjqNKOq6ovRaPQWzaLYMr0CHZ05c+ZkOBwecV33CUEQ8I7MTnC2htNnSw84/ler1T9bXFz8dKVSgc7MnGYIhhSNRkv1ep1F+zO9+dA/H2NjY5l2YBQtnby96QwBRG++cuXKzfHxcWdmZobJ+weVB4hT0dmzZz8oSdLP7oUDdQumqZjP50+rqpqfm5sD3t/0HCBDtKZpe5kJB/jzN4ApOo7zmWq1Onvjxg2DyodY45viI2TVkiQJjgzAXcZFUXxLK1P7c3Pmapr2+cXFxY+Vy+VlmvmOOUVBbyAlqScnJ3cdWBcY/1vwpHBdiCMjI0/KsvzV3T7ktm3fZMioNAAAIABJREFUuXjxIhYLAGtl0zQRUYNXbS+8WlpLlg29yWNjY6iLi5Q1TR/1ev2T165d+x/U+MQUaxYd0nS/R/3EwPh/tDkAht4LFy4g5SgMHIhSWRoYGMgvLCxgE2qL8X9sbOwrgiCgfmxwdA4FXMdxVgzDeP7mzZsfQWo2Ov9QyuCtje8QtqCsVQcHB+uZTIbVZWtKyOqcWz+SI0H2IkSmtaQkTxMUvLVWl/ZvkD3JdV0YUlEr2JBlmTiT1Ot1IRqNCo7jiFzGGaQlTMqy/IjjOGOu6347oild121rykbHcZbz+fx/W1hY+Lpt21CO2PPAahSy9NRBusImGIECcQCfwvF4PFatVuEEAIPreyKRyLtEUdw3w/cWt4OUlfCinxEE4aogCHdc10VmqprjOJaiKJosy9hD16U+tG2bRNasRf0gkhOOD3DEgZH/tCAIo4Ig4H1fD6TpRJaLXC73kcXFxRuKotiob0H3AcgJkMF3bNja15va4cVZdgqWJnZgYGAsnU6/X5ZlOBgF2a92SE/wFGqiv/zyy7+NZ4Ia/plcsdrV1VWqVCooH6Q3W75gh0NqafPA+N9Sch64znRd/wLSGluWBTkZDtQw/kNexvq/bRk5MP6/OvW1Wu3pe/fuTVcqFchc0EkD58oOfjJg/L958+bzrusGxn9BWLl+/fqZarUKngXvsujLDp7BozM0X/YxOAEkBgcHR3p7e99HZby26pVbUBp6xJzrut8UBAGOAa+4rouMwJplWTr0i3A4TJznma7s1yugK1PDPspWfYsgCDD4I7K/3QfGeP3evXu/k8/ngTHYiqKYlmXxGBKc5WunT582nn76aWuP03e3+/4f2n9g/PfIUy0UCt81Pz8/l06n9VwuxwKJti0r7etEbrw4CWY4efLk8XQ6/eVWBQa3+R5Xl5aW3rywsICAY+xReDVdonNsbOy2IAgkm+8+HMAlPiuK4ouu676oKMqKbds6cEWajcfjK7pWqsBgbNvuliTptaIonkNJ67WsAm9qdwkilOorl8t/OD8//zlq9GfBRFgXWZr/+tTUlNEKh9fA+N96blRGR0eRGnQ3NajdlZWVZ+7cufM8rWVfUFV1uVarFaempvRDsCmKo6Oj3yGK4hd2A5jdunXrn9OU/3g4ELGYnZiYqB5EkKj1bNh8j08++eQp0zThcRpE/jdPxgN7Jupwzc7O/grSHFuWxQArgPrYMNsihAXG/85iFxh5VldXn11ZWblUqVRYmRnmpQ2FDd6cADTxju/G1NQUFDbwR1t4pLModDhHMzY2hnX/bIfcHUkHKIqi7bqu3+kIHtUsFbeyh+O1NU378/n5+f9NIxRY+jQ8C8Twn06nq4888ohGI8CDZ6H5yeGjcVhKzq5kMvmaY8eOvaO7uxu1DltawqH5oT70TPAA42O8o/RFI35GJ3B4AF/vJU9vddsWjFjLy8t/WigUFmhKdoABAGYADJSj0egqLQOD9HvkHrfq9AD/L46PjyszMzPgSZSnOJZOp9+aSqU+1G6A4ADTbMPQkRZ5cXHx13K53C0KdiDNP0Bi6HPMiQryBfaBtjidtpuegfG/3RTu7P7L5fJ/nZ+f/xRKV4TD4WVaFgWywo4yowTG/1fnuVAo/PT8/DycRLFOQC/FGnHYysx0NmPvYHSB8f9VYrmuW5idnZ2gjvSrg4OD5bt372qHXF7aAbd0RFO/3tEVCoV6jh8/fra3t/cXZVke6YhRPsBZkN7agswNpUIUxY7TK2zbfvnevXu/u7Kycmet9J7FRbOyLHkkQ97Q0JA2Pz+P8i9HrlRkYPz3nqjawsLCu5eWlm5wOgAzPnfIY7fjYWA9Ufv7+187MDDwYqdnAXNdtzw3N/fOSqWyHIvFSvF4vJTNZlng1471+nPnzn3add137phq7TkBuiTLuOOXwXlMEZ/3zD6u6/pfLywsfKRYLMLeAlkWhn/ItdCDV3t7eysnTpzQWukUtWc315557MheYdj+z6IoImq/2UO7efPmT9RqtZxlWTC8ZHt6enKrq6vYJA9U2sPNCDA0NJRMJpMzqGPTDJEsy3rx0qVLv0qBIVYSgXkqHUigqBk6tOOcwPjfDqoenD7r9fonaEYNsvbQaBWsPW0DWALj/77zB7ywb2qa9vVSqXQhl8vdpEYeh3poIwMNPCarhmFAKMELQjmr14Y1d8eC4b7fdTCAdRQYHR39xFrJlx8MyLKBAq5pmi8Ui8VPZjKZS9QYxWe/KCUSiXK5XGbGqkMhp+03H/hqcoYSiUTENM24pmnx3t7ek729vW+PxWI/IMtyp5QD2G+SteT6AOBQc7ler38pn8//TS6XQ91aVtuWRa0xBzDmBHZg67E3QTRxYmJCnp6ehrMGSRObTqeH+vr6/lkkEnk3rR/bRLeH/xQYQEql0h9nMpnPGYbBarrqqqrWRFEsG4YBWdOf+vVAEiYw/h/IaWvZoO/evfszuVwOZR9IWcKBgYFcMxnUAuP/q1OSz+ffd/v2bZSNRFQX9NPSIciG2TKe67SOgrT/r86I67qrFy5c+H5VVVG/d7mvr6+QzWYhRwWYZacxriBIp0+fVrLZbCibzcYikUhckqTegYEB6BxPy7KMjFzBsQkFLMu6WiqV/nxxcfGrhmFotHa1SeU84EgkYySCR8bHx41DkOK9aV4IjP8e6ep37979SSozIZPcyuTkZPkQlHFGVrjwyMjIz8my/JtNM8oenIjSHNevX/+RWq1Gyv2mUqmVs2fPNh1UOzY29h/WZLR/vQdDP3CXwBpZLBY/vrCw8DwX7Q+dmJXRhfGfldJtKaYYGP/bwC5nz559TJIkpPxsKg1ktVr92M2bN//Qtm2AaVBw8BAWpqamtEMQ9c8oLo2NjU2tOTPAgL/jo1gs/uatW7dQ960WCoWQmho0goK9o3R6O77wETghSPt/BCb5IbdYKBQ+mMlkvohoFWr4hzcaFNQdRavshIqB8X8n1GpJW8txnDKA+Hq9Dq/Dz2uatkrT7rpUUWNRzdiH6tFotFav17V0Oq3lcjli9D+KXtotoX6HdnLu3LnHHcf5MGr/7UOdw06kCkpf3F9dXf1f8/PzSNvGaqBBQCd1CgE+J5PJarFYhHc0IheCGrTtmUnmmY20+Ii67kLktaqq8aGhoXdFIpF/oCgKnEn3MzVne+58D3qlBv9Vy7KurKysfOr+/fvQYeD85dD0/izNshYOh2u6rhPgbmhoSEfETjvlgz24/WYuIU5NTeGFLA0kCwDSxPb09Jw8efLkLyuK8qQoivgtOOAZ6LolXde/Mj8//1GaNcWf+rV82ByoAuP/0WV9x3Gyly9f/nGK4wDIBkaBAIUdZ1ALjP+v8lE2m/23mUwGxv+Vrq6u5UqlgpSo0FUC5+MOfNwC4/+rk0KN/5PIWhGJRO5rmpabmpqqHSJctwM5cFdDAoYPO4nS29sbzufzcPSETNd16tSp7+7u7v4FURSPi6JIynYFh2CiJF6hUPifd+7c+QpKnKEsHpfivxaJRCqapjGHYVb24khnjAyM/w+eHNd163fu3Pm5fD6PyH849kFmAg7dNux5r55Z7IPnz5+Pnj179nclSfqxvYws38k9wvj/8ssv/3i9XkeJKpJRm2ZZasr4/Pjjj79mLXPKh0RR/E6slTsZyyFtC0wxV6vV/uKVV145b9s2yQxJMyny2VAqQ0ND9XZlQwmM/+3hLnl0dPTToii+Y6fdO46zdPny5Z+mCiOAZRje2MO3rk7oTvvutPbDw8PdiURiVhCE1+50bLdv3/7JfD6PaCRsDMRDiXrIHPhNYqe0aHX7kZGRU7IsB2n/W03YA9Lf7du3fyqfz89TxyMIAACuIKS3xTsdtrJz584hjeO3HhASHdRhokbzlVqt9rV8Pj9j23apWq1WbdtmaXWxdlqqqhqmaZqhUEij6QlZ3SdSf2tiYsL50pe+hHRzAdh2UDlh83HDwBpLp9N/K51O/5NwOPxjiHY4fLe59R2hBtfKysrv5nK5S8xYRZ0L66FQiEUuIEqVlL3YTV20rUcTtKAUYCk5YXCFE0A0EonEHMeJybLcE41GX3vixImnQ6HQ94qimAiotjUFXNc1dF3/f6VSabpYLN6sVqtwomU1/kxFUQxRFJH1pUb3g3oqldIKhQID7iAXtEU22Hr0HdGC1HWkJRtQhgJpYru7u7sf7e/v/wlVVd92xJ0ArHK5/LHl5eXPlUolGD9ZNiHwD0BgvEi91+HhYW1sbMw6BJE+hDED439HPJ/7Moh6vf7ZGzdu/DayZVmWRYDs8fHx0szMzI5xnMD4/+oULi8v/9K9e/eeC4VCOcMwsuPj44WgxNK+sPi2Lhqk/X+VTHCAu3DhwtMUt0Tt82xg/N8WG+13I0/GSyaT4WKxSJwAotFoKhqNnhwYGHiPqqpv3+9B7uP1XcMwnrt///7HyuXyIiL9gSVRoz8JHqGO8n6jf1MGxX28z7ZcOjD+PyArZ/xHtiTITPcnJiYqh6iUszowMPCa48ePf1kUxUfawky77BTG/7m5uR9H2n/IrD09Pcs063izmX/hQBXp7+9/fTKZ/P5oNPqzoii+ZpfDPKinAzf5vVwu9/V6vV5CSVPLslgmRaYHw+5LMojSUrptwVYC4397WEgaGRn5e2tpgf50p9H/tVrtT19++eXfp8Y2Puq/fti8Q6EU3Lhx48OiKL5nJ9NgmubXLl++/AGknVZVtWCaJoRoeH+3zUC5k/Ed9LZB2v+DPoPNjx/K6aVLl/6xbdvYiGD0x7MFY8COo1V2Moog8n8n1HpoW0T0Iw1m1rKse5ZlLZummanVaplCoXDXtu06je5nBhsIdDD4E89D0zQxz1hHvdfg4KCZyWTwPzsnMPq3bLo6riMI6khl3S0IQkpV1d7Xve513x2NRt+mKMq3HAEjlo30/uVy+QuZTOYbtm2TtNQUxCDR/uFwuKLruiegU4eAwOlwb1nZ7wSAyGsYXgHKRePx+LHjx4+/JRaLTaiqelYUxfTeDq+jr4ZgnFcMw7hWrVZR4uWiYRhwAoNRFsooqTmHMi+maYLnmfMXADx9eHjYGBwctKenp1mpl2A/WJvuqakp6dlnn1VmZ2cRBQZeRIRYPJ1On+rr6/s+VVW/TZblMx3NGa0bnGtZ1iv1ev25XC73pWKxCCdS8AtxJrEsi3egqg4ODtapjHGoIngD43/rGOqA9eTmcrl/f/fu3a9QQx+AbLwgN+xYVgiM/6/OPjP+04APlvERektwdCAFAuP/q5NCI/9RFghBS4vg4cD434FMu/mQpPHxcXlmZgY6MtM5kIEseuzYsaHjx4+/U1XVNx8ROQ8RrHc0TXu+WCxCzpujqauZvsz0hirNGlkbHBzUMpkMjF1H3WF4HYcFxn+PHPXbt28j8p8Z/6E3tLXk7B6vPtLw8LAqy/K3xmKx84IgHNvj6295OS7y3zP+j42NlXfhgAGsBuslgjFSgiD0nDp16u/G4/EJRVG+VRTF5JaDOuANTNN8qVarfXFxcfG5er3OsihjHWQZRGFvqSSTyVqxWMS62fZMioHxvw1MhUjWN7zhDcfi8ThSl2ybsZF2c3Fx8b1LS0s3FEVh3uJMYQSTHKoDdBoZGXmLoihI4bbdw8lkMr9QKBRuImKEetSzzAiBArhdKj6k3djYGDzSMCfdmCPatBHAi9+29EoCXzeTkk8URdSdbXhdmm4cnoKCKIrr3jFeRCXbtl2EZxVrw98y6xbn7vaQJAmbWrjxUF/tXRRFRIdtOERRlDg672g4m/XZoJOG135AKtErT1Kv179w7do1pP0GSMUAKxj/m/X62/J+aOT/51zXfQsGQ9MhNZwYfi7980p5hefHhiAb6kNuOaj1DdbRiPuLp+lmbUjzRjy4nTFwYyXPEH2WMBfga6Rovmfb9qKmaQvVavUmvK51XSelTxRFAQCPd6RtZu8EgFdVFUZOIxQKmTSq09Q0Te/q6rIqlQrWUfRBrsM944GRZzuTdsDb0PRkMGCR9IbMoKooSvTRRx99dyQS+fuyLMOYCvBj9wvo/tPLhsOMaZovzs3N/Z5hGDVZlrF/sMgFyF4wfLIoVXzWJiYmzOnp6SByYX/nT5ycnJTOnz+PtTiUSCTC5XKZgHKhUCjqum7Edd34yZMn3xqPx39AUZTXi6IInoYyeiQO13V113VrjuPcq1Qq0/fv35+u1+t1yuNsfScGf/pioJ0Wj8f1arVKMr5wCmlT8tyRILYgiBMTE/L09LSXmYKun1hLY/39/WeOHz/+U7IsPw4whJe9DgN9wGe2bd8ul8ufunv37nMUDIZTCXxK2DrK1lKAICTCgSunchjI4N3DU0891atp2ksUBxCp/MbrVOv0J79suokOxORAT/cBHUF7P/Fs216BLuQ4DhH0WbYm13U1OPhupf/AGdhxHAPn45AkSXjYZ/yPA23YZzamRr+xtnzf3HkASXv4e6IlddbJHLIsewAqu0+qC4g4XxRFPIveIUkSAEhPdudk83U6UiO9jD6v/PX9epVEiOy6RiaT+cVcLvcKdZ5e6u/vX7l//36tmYxZnPGf1108PuBuDyWHGurkVD/1zqe0bNS2Ub9bPZfb0ZHINFP6EN7d7HiYfr60tDS1vLz8dcuyWFbMguu6VjN03eqmgv93TwHO+D9G9UlMfEPeZbomj+mwETTAkVql34MXN8NHNuj4fszJT6HNMAr8jvX0pZde+lEu8h8BFtArtsTRdj8TQQ8tpAA2Orm/vz+0tLTEnD1jVOeIJpPJR06cOIH63m8SRRGO9JvxVwuHtCdd4bmtOo5zu1gsnr93796L8CSmzzXTIZj+UIvFYrVarUb0ZeBJU1NT9mELYmwF1anxH9HQWAewPhLcejv7OtrsYG1sSndrIPeQobmuS/ZzbpyeHNBgnYRctKEUNrf2oh/9kBv/Gb4dGRkZea8sywhiJSUvqE2Dx3kZA/j3uW3LZw32NVbGhJfFyG9ULsM6VeMj/6kdAM5qTdsAKKaITI0IziCYoqqqMdM0I8PDw++MRqPAFB8RRRFO802VS2/Fc9jCPjBHJcuyrt+5c+c/lkolOLCw4ApgKdB5PUyxu7u7ViqVgCkawBTps9NWvP0wALctnK+WdiWdPXv2NyRJet92e9V1/bOzs7O/QyMjEMlOasRNTk7WD0saxAa0UMfGxpBi/vR26GTb9r1r1679vOM4FVEUi7IsZ1E3iz5IOzXqbeeSR67N+Pi4WqvVhkzTTJRKJQAr3cgCbts2WZQpaIy1w4FxHTVLZFkWHsiA3kEUPPqNtNkuIRVFERB85jik1CzZGPEbjgdBaQLqSMEww77jNzIenzFqs2uK9Fzyv69vch1f314bNgZFUUQ6NnZtdi30DaMru112LdBN5fr1AMBwOIyb27DhbcchQJZlQhhZlkl/m9FZhbXXtr1rYr7oIUqS5BlCdF0vVyoVGPuxWWH9WZmcnKy2e/154oknTq6srCQNw+jFy7ZtCAhkkH46UMcOci8c2EgcUcCPjA6iKJq4Z8qvhEagDwWkt8uO5DKyLPPzQ3gbdGN8j/8lSWJE9fbVzebwAT7oOdZsGAsDspB+H9fAs4DITDxIAGN1XSeR+MzAzwRI+p14VVOjP1PM8I5U/pZhGMyQQ95TqZRRKBRIyn/O2M/AiG0/tzshaNC24ynA0lhDYAe4EQmHw1Fd16OKoiRSqdRrE4nE6a6urh+kUQ4HUZbUarXap/P5/JcrlUoWabjoHsKM/nCOYanOa93d3XUI6D4jaMdP5BEZIFOqwbcKUnOaphmuVqsRAHKGYcAhIByLxeCUezyZTJ6LRqPfJcvyY4cImPOm2nGcvK7rz1UqlRc0TVusVqtFwzAgM0Oo8kf4wwHMoKk69Xg8rlWrVeIANjw8bCLKH6VepqamjnRdzh0+RywzBWQrrKHgPwAfJDNFKpU6EY/HX9/V1fV3IpHI2w96iQrTNK9WKpW/LJVKl1ZXV2HQAE9BfsdaqluWhXUT9V5riqLUK5UKvuuTk5P2s88+C7ntsMoZ8pkzZ4Y0Teup1WrHdF2Pm6bJAC4Hch2vO/llU8dxkInDA2yhP0AGtCwL0XW8/sPYcwMdeV2H6ja87kJ0K6qvkD2ckyn9uo33CPjO8es+RD5mbfhx0s/rHMq539AP/5/XD36nDqwYKxunp8NQ+Zf8znQvqqMRFaKBnkf0MtoenyGQK+w3qlOhAdtXiB4CfYubL+hOnv4F3QLfqa7gFovFZdu2a6FQKG8YBotQB9/v+Dh79uxjtm0P1Gq1mGEYSehHtm3L4A9fZ+Ap8huvY1CdCY4BvC4OXYKX8wm9qQ65UyyF0IafB3ymeqc3RHyn+hnarxs66OsfM68jsf+q1WpO1/Uil/Z/9Rvf+EZg/N8xV+3ZCSjr96ZqtXqsXq/Hod87jhN1HMdbq6iODtzEkiSJPMe8kxF1YCJZYYAzoT10Y369YM9lE/o9eJEwI/9sczo+w7KYjk/Gx/jVW3g5fZ7tZwx/QFt6v26lUkFGPugaS319fSvZbBZOW4Hxf8/YsWUX8nSOwcFBJZPJEB2DZn3CHh/p7u7ui0ajg8lk8q2RSOR7JEkaaNnV97YjTdO0r62urv5lrVZbKBaLKN8EGYTgSkhdTTOF1SHjaZpWTyaTWrFYZIEkfBDJ3o78AFzt3Llz47VaLaHreqJer6csy4LOwGOOcOAke1wj3NB1XRLwwzB4YISbrI3NZlzAEkn4ncP/gb9ijMwugDUR7bCWYixkj6frNXEUUFVVpjg0ZCWyJiqKQrBphp8Wi8VXdF1H1utcMplcKhaLCERr2vDcidMPY/jnP//5RG9v77daltVlGEbcsizIc0TWx1zjM+hHs7Hy9hTQdlvyGbMPMF4AjSGfQsZTVZXIt5BZMTf0UMFfNItHKRwOZ3VdZ8G1TQe60L0S96Cm0+lQLpcLR6NRyAAsQCMGTDESiQz39PT8sKIoZw9igAYtoYjyidOlUmkeuAuHw7MSinXTNGH4Z87vDFNk2XX3hGUPImC7J4RpxUVoTXvUzoan+UMPROdkMpn3FotFtK9xXs0QEtuacnursbX5f/HMmTPfoarqZylI9tDLaZr2F1evXv0viqKARtggWFpyRJUcVgCpzVOwoXusC9jAEa2Ees/IXgHBlniIccbtRkATMXxvAkyRC23H2E5HhA0Kmx/RtXBtVVXJNU3T9Bv6PR3MzwcUb4Cy6F/v0L/I989Tgrv2dunP98efw5QEHtxi/+OeyGeMj14T7YhAxYNRnEPBhvE8jN60sXfvPOjFOvIBcFYoFKoYhgEBf3VqakrbA29d3C8UJqyVeMH4T8C4ze7bBy7yvOh9pvfKnDE8ELBRnz4abODTTcbC8xQPKIK07L+H7rONnocGaxm7J2aAAa+BpxkwzIR6vNuhUMg2DIM36BPDfiKRABhvwdgPo04mk2FKGfM8DdbQ7T7th78dM2AhwkGlEQ7YB/hXOJlMnkilUuPRaHREluXXy7L8Ohpd3VEUopky5nVdv1ytVi8tLS3NsshUCmQAe2RlL1i0AnkfGBjQFxYWWCquwAjaUTO7bjBsr8V+AuVW6e7uDlmWFXEcJ6xpWkRVVTgGYNMNJxKJdG9v7xsjkcijiqK8QVGUQUmSXkvP7dy7ZAKS6xqu6y6aprlo2/ZdTdPmV1dXr7I065DVACxTI6yX0p86sBjhcFjXdZ3xPHMK8zuBBXtC85zgdwIgjlRU1iHraDgc7kmn02/s6uoaUVX1b8uy/KgkScc7NasK6nI6jnMfUQ2apl1bWlp6oVqtFgAK0hqGkDGQ2h985UWBJRIJAMN6NptlWYWaikJqfir27UysQ9Cl4EhNdClFUSTOeZiX7RoNkv+fgYBEN+IOyIL+53SzfWrT63F9oj/SfSgUQj1fT4bldBTBrz/523LGYDcUCgm0n3Xj9P3eSFb2nAvY/eK6VGfCGJiO2FCnakBQTx9j/eBZa6AfrpPteT2qgczul/XxHfythcPhkq7rcIgBiP2AqDs8KHgajcViSTiR0BSqzDnhofzjd/7YQrdoODJeD0WDBvoTD07znz09iNOvyP+0T95hw3OUp2sf75hCxsXuRVVVZK4paJoGDAiO6k0D0zuciqB5cxQAngT9HngS+BdOcP5oaL/eTq7ErZP4yjAUXpffwP9bBW8wXqL9e/zI8zVzHmqEl/jXAuaQxJPmIdgFw1ewJiDICzpGIGM1x1edcBavc2BTJg6fMG7V63XwfFhV1YgsyzBwvSGRSIyEQqEz0JUlSTrRibqG4zg527ZvGYZxs1qtzubz+Vmarhp8yvQDkrY6FArpoihquq5D1iOlwajNAlH+QaT/9jgUayHWRKyPvYqiwBjMjP/+4De+xw2YJtX52B7NMoB65/C46SZ7Ob/Xbhi9L/DN29/5NZE7aQMGSu0Hm+Gm+B17OfgI+DPWSBhJD5Xxn8o3TC+ATpBUFCUGX2lKOw/n5Wjp7XO+vWWdXcE/v5vMMXiLnMfNJ1nH8B1zgNJsdA4wD62aAw9TpOse9OFwJBKJappG1kqGy6TT6bFIJPJGRVGgEw+JorguC9j2Hqv2tkKJBGS6M03z5Xq9fnVxcfFFBFHQ8okkyy59sfKJoCnDFllGRVbqbk9lgMD4317ekEdHRz8uiuL3b3UZMNC1a9fei+gcpISKRCIsop3Vh9iqiwP7/9DQUDKVSn1DEITXb3ET7t27d382l8vBQQIKXzaZTC4fRs+w/Z5MPvVzJBKJu66r6rpO1otwOOzqOqlC4bLP4XBYxG/0+7pFLBKJkE1G0zR+k1oH6HBthEgkIqAt3nENTSPBEvjO+mi4SLLzGihSRLmLRqNivV4XotGoS98FvDOgAR9oG75/D8iIRqOsPZkefMdB+/B+q9frfvBjXVQ/HSd/3YYgE2iiaRrZkLl7I31TWviFwIb/0XPZ3GGe+PtjY+OjZZw6AAAWy0lEQVTHgM1IS6VS1UKhgHSiexFVgeuHuru7ERkVr9frmHyZAoPkPtln/zsvHIXDkB0E8KcnKHH8yviI8SPPa+T+fbzGuuZ5lZzL+J3jHUY/Qk/ueRDw3PD3wZ4heFsahtGQl31jJs8Vd1/M0M8ERAaiM0M+cQAA+NjX12dns1n+f5zDg+5BxMF+L7YH4/okzSF9wSudRbMyYxYAjhA1qionTpx4vLu7+8lwOPyELMsnIejTFGQNs5y0mARIm0VSENq2fV/X9Zl8Pj9dKBTuwGGaeuKui36mYIW/vjmMV3gxj9zgWWnxRLW5O3Fqakr89Kc/jRqdcjqdVnO5HDH6U/4liib9jN+Js4CiKKF0Og0P9L+jqurjiqIMUb5nPIznYK90J7LW03TgUCQ1y7Ju1+v1mVqtBmXzBoyuNNLCW+ep8kmcv1RVRZAcUULD4bAJaz/la2KEHRgYMBcWFkiGmMnJSff8+fNHxSjbZvZb1z0PerBsACyjCjwwWNQYAY9jsVjXiRMn3hqNRt+iquoZZiyhKcz3KoWst44ipbxhGM9Xq9WZbDZ7sV6vQygnsgTHa4j+AqsRo38kEkG0GAODwXMWIv2PIH9Jg4OD4Uwmg/JgAHh5qz0vp5JobSqDElmVl215wxfVl4i8yukGjc7x/+bXGcj3WAzDEoRarcYb0sR4PO5Wq1Wmz+C7UK0iS/UD4JD+v+E5ou3YGundRzweF9n5aIMD3+nvpB07F33jGptcT4zFYiIdLz5j7Pw41v0GvQ5/croakdOZLshH+LNOmI7F6U8N9TTaft1/VP53IpEIymnhGQBegediWxFbDRYmoh9R/gEI6jnjh0IhIpcYBql6yJwsvDny68NMR2J6ANXrmS7B5trT1Rvo5nzfbKis/Tq93kcbTwcFvSmG4BkH/DqS/ztHE9wvZDJSJ3VyclJrd2a6vdwoDuO1pqampI9+9KOh+fl5OPWTMolUpuLXG8K7jJd980/agXepbs/4lec/vy5NcBI0oNgTaws8hWErhG99a6hftvPwG3r9DZhJKBRC6iTSf6N74H4je2Y0GtXq9TqwXvAwido9jPN+1O4JTlpPP/00K0MGfSIcj8dD1WqVZQSAnsycjyHn9fT19T3R1dX1bVTOA6gIPQPntlvOA8+ZVFdGZsm5Wq323MrKyky5XM4iOpjpypxzPNZdphd75cG435iDfKBD7ID5qXMf9nSsjVgjsRCSCHruRfZmtpage8iLDIunuOQ67JMOgfTB4c7+PZr958et2bpIuuHweO93yDn4j8kQ3HcSKEhxTG+Pb0QStnbSd7QF74DHsDaWJicn9UO6v4NGak9PT2x1dTURDocjuq7zzzyR68LhMHmWsO9x+x+/73n7Gp0nMr+wHfjmnLcBEPbhcAx+T2PzhTKwle7u7sp73vOedgQA4jokUyPogJKNtm2HarUasjWiXCPwxDAyQ1iWpfb39z8KTDESiQBThK2Q4DV0vWxrqQCu3K7pOE7BMIwXS6XScwsLC5epIyvJqEj1YcRabCihSB3h9cHBQZQEYyVQ/HLMDlaN3TXdKwBrd6M8uGeLY2NjPyQIwvmtbmFxcfHfZLPZK0gTR72dkGpjFRkBDnFKREYWaWxs7JfXop1/7WF0sizr2uzs7PuQopRG/S/39/fnl5aWoFwHwPxWTLaD/6kwIg8MDIQ0TUNaGLJWFAoFDwhiCksq9SCxRaEAJ/wNSoybTqeFXC63TrDgfiPnptNpN5fL4Z18x+eHRCgI/f39wtLSktvf3y+u1QD0vvOGfP52BwYeZNtaWFgg74ODg24mkxHxO/vNTx7/OY3abnX+wsLCBoGKXscDV3AvjuMQ+mazeOzJ0Wht9tN+w1xw97ChbW8vnEpfTaNPU+lJxSKczx8cyWQSqZycfD5P0nlxhq8dcE9zTeFw8sILL6iVSgWbvVwsFsWenh5hdRVVCB4c3d3dJDUk/xt/tWQyiXSb/E8u+JPxJmggSRLhtd7eXqQ8wmee1t68MP6jvEra5/N5vAv5fJ5vR86n1xFBQxwYP9799+CjDmtDBDZ2X9w55HeuT14ZYJ+doaEhd34ePlEPAHlOYWC/8SBLcxMUnBVQQBBYjXUCTqRSKbVQKPgNqsQ5gArtSiwWS6iq2hWJRLolSUqEQqFjoVDoNaqqPiJJEn47hjq8TdRGtBDNj1JAjuOsmKZ5V9f1jGEYOdM0K9VqNW+aZpWmOUf2DwYaA8Bg9QmJIZSCcesioJHqfHp6utk0eQGvdBYFsM6yFIVM4WR12dVIJIKsAMQoi3R4KHPEnF3C4TDq08XD4TDh41Ao1KWq6msURUkrijIAHhZFMUVrSaPG9E4VURhZS7Zt513XLdi2jXTRK4Zh3EP2Hcdx6oZh1Ov1+ireabYKfp0nhnsYYZFq3TRNRJaRVP66rpvRaBQnW4lEwiyXyxZ1COMdWnigLgCh28u3bP0EPyqcQworr8KcUfAdZaKIM0okEkmpqtoNPpRlORmNRhEJAf5Ly7I8gEwrlP/WhYNv51YAZriuCz4D3y0jRblpmvd0XV/F+lmv11EyokpTTRJeoeleSVp/GPxp2Qg9EokYmqbpiURCL5fLzHEKcqRfJtnO0A5LG7buEAejVColQY9iMh3k2UKhsM74ymROjgBuX18f+ZrNZvln1G90ZaeQNoODg0ImkyHvOPCZHhue86Eh+DgJApMjh4eHhbm5OYG+u6dPnxZmZ2d5vYK0Z+1Onz7t0v+9awwPD4vog78m+83XPz/XvGzt9c+uhXduXCLGTcfs9TE4OChy90run0Wccb/z+h8+u1QXFKl+if543YB8pnoAT3cxlUqJ0DGSyaTI6R9sjbYmJiZM1PLcpZEPfBRKpVLhQqHgOaAlEgmhXC77eYLQgukReGfH6urqOl7r7e118/n8Oj2V6YrQdzZzpmf6EPuf0YXTq3j6rdNnQSf8yetI5EKuK5ZKJZcfN9OJfLofy2rGdNRg3+rs1ZIA/cCTFhYWmGxFRgz+xRpYKiHJaWMjOOUHb46xduI5S6VSbO3k1xjGa6S9X88H1sTwFujxDItiGBSeeR//+/nY3Yx/wat0rGJ3d7cAXvZNCzNu2UNDQ+b8/Dz2yAC77GzebWZ0xLA2MTEhzc/PK/Pz81ivQ11dXcC3wjh0XSd6MpzmUXIGqd4TiURPKBTqDofDKejJsiwfD4fDQ7Is94uimERGKFEUH3jNbfOAbuG6LuS3BWQUdhxnybKs+yiXa1lWWdO0sq7ryE7jyWkw+j9IukHqlxJdGRH+qA2G7E2apjEHACLjTUxMWFRX3jdj1jbJ0cnNiBGURj7L5TL8BcnBY3fePs32dLbmALfF/snkD7o2Yv3D/k46arCvb8A+6Too4h3n+HB5sjb68E+2PhKZiMpAZI1kpVHYPo+GPjyUrJM46PrPxkPw54mJCb0FclPHzjmc4qampli2EGQplECHnp4eZFFjWPY62Y7ND+MN7G/4zOaY4xdepiPzyWHdjM5++Zb/zpwwmNNqu2QsohO/8sor0szMDHRiBWtjuVxGRgDgMkw3JnQCrijLMvDEOMMUw+FwbygUeq0kSX2qqmKt7KO4DMB4lk1hSz6gRv6S4zgEUwQGg2yKpmkSTFHTtNVKpULKg/KOUWyNVFUV+AvDEbV4PG6g7N3q6ipzBmBleNtFyy3vkTVoZGDa9slBw60pMDAwEENt3HK5nDJNE1ZSbNwSX7cFNdry+fyioiionYMVH5bP3MTERG16evqwpTtpSLTHHnss7bru61HvRtM0GAKIZztXpxy1Y8pIL0nTkax0dXVlaX3ywHN2a1ZspgWJnMOLnuxtJpOTk8L58w98Wuhn8h/7nf+fa8MLMxvWHt85my2O60AXFoGCnOXo/JlnnsF4NwPEAC5A0RRwT+9///uxwa77zJwHuP/JfVE6kGvwn/104cCiRmPgldKGBuepqSnSJXtHf35aNppIP+0mJydFNj++9uvmEP9x7XhhgQFXzfBNU+dwdYGI4sQ6mZiYEKanp8nXRp/537g2PP+sA7Ya8OOOxgtas2MTGuNvKH4YN97JWOg9iOPj48LMzMy68aEN35a2dycmJsTp6emHPQto2uj/fRcudkTUoPFBowB7RgmoR18sepoYrqj3Oj4zpZZFM7AsAhJNf4xUY0iDjAjEmCRJaigUggc8ypB56wDqw+E7wArDMABEsOhT/hkg0Qo01TmJSqUpzFiqQgZakJSFXFouz9GJpirkFe6DNjfBeDenAJNp0IIZUDwPcvBtNBpV6vW6Gg6HiRLKeaczPmfZK8C/4E/wLvuMOockzWc4HI6jxh6t90rq1HLyLMqy1GzbhmEeDr9kj+JLKnG1t/kIHOaMwpRIGPotwzAIQBeJRCxN05hjCwPuADTb8/PzNt1nAmN/ZzwhEpXTpKGhIRkgMV0r+fWTAUMol02cVkzTlBVFwWfGd3gn6zGiRxBZhhSSkiSRMEqU5UQpSfaO3wzDIKmyK5UKog+ZYZSsozzfUcOEx3Oqqto0iwRxMAEY7Iv6MgcHBy1aTogZOwNA+IFMD6DvoZhLA/0JOhVk+YbGXcw5KQILRebB4dc7vOtBp6C6EZFPN2lLrkPVKaIrMZ2J/U4v5bvs+geKP8d33mb9PfSJ3Kw//++NnL9pmw16HNMxKF3Y9Xldz09b1mbLOUTD8+fPs2uiz1YY+MgzDoNSuVwWZ2ZmNqMZ9AZPZ9qsEc3ywvR30mwrXXMz/R58tRVvN5gbQkeMFQf0o/HxcTGRSEAXaqjr+e6F6Kh0fgN9pzP2tIeNgnd8E0+fPi3Ozs5utq6tm3+uU4YxNVq/tqQA+PTKlSsEG9mM1x/2DHD/ebzr0/HJuBo9f+w3+k72RLqIBry75cwd6AZMV2Z6L5PzEPmv1mo1lknPk/Wgc8Drk6Z+J7IeTc9NdGUYvaiMB0MYcZoChR6UDCdW+wpqhlNDFfmNk+tIUxYoQo1Y4EF/mUhmsDJisZhRq9XI976+Piubza4rDRaswbvnTyrGkYh5f/BXA8xw3QWxpvT19SFrG9ZYvG8Y0MP26M3weoZ18lg/lW28/husl2wMPO7Kr5f+sZH/6D2yd6YzHPYMEkyWZA7CnhxKP7C9YR1u77O9bMp8W8hz/B7qybZsHugPTPfbqz2K4CkMU4QjAM3WSPDESCSiUmcAL1Mj9GLTNFkJLEZHVqIaeAzRiYHHIIM1cBje/or7BKaI9ZBbLwn/cSWzeDp42AsXRMTjivjcsIRiJ62TD1Vidr+cBT1QhT8Sj8e7TdM8ZhgGQG0SncHV5hARlUYjKEqs1jYFp/fqodvvyZL6+vpilUolWa/Xj3H1T3geBS0QaaKZppnv7e0tvO1tb6se0pQw+z0fe3H9DUbZvbhocI2DRQEO22SAY6M1cSte2ur/thGFCRp8BhfmEctflP3GtcffR2X9bxv9g47bTgGmrDLBXRoYGJAXFhbgyaw4jqNUKhXewEo+h0Ih2TAMWVVVyTTNdUI7lF9Wc5MCHwA01gF+FMyAgR9R/QQIVlXVM1QhApoK57wx1C+U86UyWgHQt53YwQVaTgHmECANDw/LmqZJmUxG7u3tlfL5PGR1KRaLKbVaDRkCJGRCoiVpiBOA67pQPglAR0fmRWVSHm6UUo9f13mAg3wGH5umCX5G7W3Co6FQCJH9BKDTdd2vgLJIfgbKMTAvAJlbzi6t75AH/k6fPi3Nzs7KfX19cjabJbwWj8dVrKMALyj/MQcUlsVCpCAIW4N5UAkD5gFF3kDsOXmy9ZTxH3gOmSQMw/CDwmw9ZQ5T/P+Q0XBeILe0nk2CHjuPAvulV3jX5fWGBs8dWwd28zzu9T02ul5Txt7OY5dgRJQCDXmqkV7sC6g4KASE45A3Vu65bMXzeFBoEIyzMQWIYer06dPy7OwscG8lm8166a9ZKutwOIxSq9CToWOgnhIzivEyHvlMnZCJnPcgWN87mHznN6YyPRl6BdEZqAMx0ZljsZglyzIyhcHYj9KR9unTp+3Z2Vmmq0Dm2+t94ajw02Z73cP2xb2kTTPzTs7h1vd1dp0G634z19hLGrT8WjzOvctnqxW0I/vXPutxfEYAv+MU0YupMwDDFtGGBRgRXBFro2ma/BpJ9GCskcyZyrdWsnWSYDDgWYrD4DPJrIj1EWslDbTwstv19vYiiJtkT5mYmLA7PRNKYPxv+SO8oUNEeiq3bt2KaprWZdt2FBs6E2hZXStaG8WMx+O1arWKaAxEtR2JqH+OYqymHeqfIC0SSdfB1f4iggxNO8TqZeHh241i234OCK4QUCCgQECBgAIBBY4GBTY4A3Ap1z2vXmrUkqrVKp+O3XMgoKTaYDjlZSbIA7quEyAjEonA6IQXMZJWq1VmIGUGfvbdi3qg1wjkh6PBl9u5S553EYWAVHSo2U0cVJaWlgiv9vT0SI7jwIWcvNdqNZzHHAD84Bwiskm/tDZiQ3CO6gC8hzn5HI/HnWq1SpTPZDJpI72jLMvE0WVhYcED8VipF4qw4BoBX29nxjuvDZ+dQkI07MrKChylJDhL5XI5fg3l107yGXWOwZeU1wjvsc/sVukaygPC+AtrqE3rIzuxWAy8huwATk9Pj726usqvo4TvJicnHRqVzngt4LnO46dgRAEFAgoEFAgoEFAgoEDnUIDZX0g2l+npaSK/DQwMSAsLCyzLmNTV1QU9Q6Z6MtMxWE11JudJqAcOA+KDZEzk8AxZrLQE5Dt8ZjIejfYnenEymXSKxSL5f3Bw0KHZm/hyTay/zqFgMJKAAgEFjgIFPFyGYjIMY/HWSVoywfvOMEcasEHW1gY4DPRjApkYhrHOQSoSiZAACk3T+GyLLMjCwxaHh4edubk5HofB2Do+kCgw/u/BY8Pqp/f394eXlpYUAIe0jhnvBco89MBc7a6xsQd3vfNL0CwJLEWw2tPTI3K1vYk3E2p6I5VvLpdjHjeHPS3MzgkZnBFQIKBAQIGAAgEF9pcCvLc3RkIEeFrKggnzfJo78hsirtEYdWhp/bjN5FQP3EA9MxhEl5aW3MHBQTeTyfCghfe5A7yZ93dGgqvvlAJ8FAbhQ6ThzmazKMeCTAGoac3zssfnqMUH2R/1vf1pHPlBQKaldb8JYNfX1+dks1lnYGAAqdoZL+M/nqd5cI993um9Be07nAK+SBm2Dm5YM1HjnDqn8I4nHi+y2+TrhOI38F6xWHRTqRTKUjio78mnhKXnMWCD/MfSxwdraYczTzC8gAIBBQIKBBQIKBBQoNMpQGQ7rtwOkfHg+DkzMyMODQ1J8/Pz4sDAgLiwsID63RKt373OWdl/k5D3aO1wl9Z+9zIBbKIn02GQUkKBI2enc00wvoACR48CBJOh9kKCx9ASW2QtpJgMWT/7+/vFpaUlTyeGngs8JplMCsVikay5Pp2YrXl8gJDficpzEuBKqR24tTIw/u/dg+PVT0cdDgoe+utXgaFRl6/jvUbaRTa+7jeMBKhjg2vRGid8PRtGowP30LWLdkG/AQUCCgQUCCgQUOCAUGCDYZWNmwr05CutW+a19de0Y3WMITtx0c6BXHBAmOCAD5PxJYm64Wpve1E9DWowEjmWv2++RiNNm85qY/Mp2g84qYLht4ECvA7P1yhfx38NeI05snh8yNWVRySEd0oAArdh1oIuAwoEFAgoEFAgoEBAgYAC26QAdIxnnnnGk/mmpqa8z8DLWTfT09P+Hv2Zmfjvng6zzWEEzQIKBBQIKNCpFPCwQrY+8uskX1KBYoveffi+r1szqbM7a3vg8cX/DzfxAKURPu0dAAAAAElFTkSuQmCC"""
@@ -0,0 +1,206 @@
+"""
+CSV Importer
+Streaming building blocks for bulk CSV imports.
+
+Rows flow through generators (read -> validate -> DatabaseManager bulk insert)
+so only one chunk is held in memory at a time, however large the file is.
+Rejected rows are not collected; they are appended to a sidecar CSV next to
+the source file as they are found, and only the counts are reported.
+"""
+
+import csv
+import os
+import re
+from datetime import datetime
+
+# ===== CUSTOMIZABLE VARIABLES =====
+REJECTS_SUFFIX = "_rejected"  # customers.csv -> customers_rejected.csv
+CSV_ENCODING = "utf-8-sig"  # Also accepts files saved by Excel with a BOM
+DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y")  # Accepted ledger date formats
+# ==================================
+
+# Ledger CSV layout: one row per loan (with its asset) or per repayment.
+# Payment rows refer to their loan by reference id, either from an earlier
+# row of the file or from a loan already in the database.
+#   Loan:    Loan, reference id, date, customer name, phone, loan amount, -, asset description, weight
+#   Payment: Payment, reference id, date, -, -, amount paid, interest, asset description, -
+LEDGER_CSV_HEADER = (
+    "Type", "Reference Id", "Date", "Customer Name", "Phone",
+    "Amount", "Interest", "Asset Description", "Weight"
+)
+
+
+def read_csv_rows(file_name):
+    """
+    Yield (row_number, row) for every data row of a CSV file.
+
+    The header row is skipped; row numbers match what a spreadsheet shows,
+    so the first data row is row 2.
+    """
+    with open(file_name, 'r', encoding=CSV_ENCODING, newline='') as file:
+        csv_reader = csv.reader(file)
+        next(csv_reader, None)  # Skip header row
+
+        for row_number, row in enumerate(csv_reader, 2):
+            if any(field.strip() for field in row):
+                yield row_number, row
+
+
+def validate_customer_row(row):
+    """Return a list of problems with a customer CSV row (name, account number, phone, address)."""
+    if len(row) < 4:
+        return ["Insufficient columns"]
+
+    errors = []
+
+    # Name validation
+    name = row[0].strip()
+    if not name or len(name) < 2:
+        errors.append("Invalid name (must be at least 2 characters)")
+
+    # Phone validation - only if provided
+    phone = row[2].strip()
+    if phone and not re.match(r'^\d{10}$', phone):
+        errors.append("Invalid phone number (must be 10 digits)")
+
+    # Address validation
+    address = row[3].strip()
+    if address and len(address) < 5:
+        errors.append("Invalid address (must be at least 5 characters)")
+
+    return errors
+
+
+def customer_rows(numbered_rows, reject):
+    """
+    Validate customer CSV rows lazily.
+
+    Yields (row_number, name, phone, address) for valid rows and calls
+    reject(row_number, row, message) for the rest.
+    """
+    for row_number, row in numbered_rows:
+        errors = validate_customer_row(row)
+        if errors:
+            reject(row_number, row, "; ".join(errors))
+            continue
+        yield row_number, row[0].strip(), row[2].strip(), row[3].strip()
+
+
+def parse_date(text):
+    """Return an ISO YYYY-MM-DD date for any of DATE_FORMATS, or None."""
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text.strip(), date_format).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+def parse_amount(text):
+    """Parse an amount such as "1,25,000.50" or "₹500"; returns None if it is not a number."""
+    try:
+        return float(text.replace(",", "").replace("₹", "").strip())
+    except ValueError:
+        return None
+
+
+def ledger_rows(numbered_rows, reject):
+    """
+    Validate ledger CSV rows lazily.
+
+    Yields ("loan", row_number, reference_id, date, customer_name, phone,
+    loan_amount, asset_description, weight) and ("payment", row_number,
+    reference_id, date, payment_amount, interest_amount, asset_description);
+    calls reject(row_number, row, message) for the rest.
+    """
+    for row_number, row in numbered_rows:
+        if len(row) < 8:
+            reject(row_number, row, "Insufficient columns")
+            continue
+
+        fields = [field.strip() for field in row] + [""] * (len(LEDGER_CSV_HEADER) - len(row))
+        row_type, reference_id, date_text, name, phone, amount_text, interest_text, description, weight_text = \
+            fields[:len(LEDGER_CSV_HEADER)]
+        row_type = row_type.lower()
+
+        errors = []
+        if row_type not in ("loan", "payment"):
+            errors.append("Type must be Loan or Payment")
+        if not reference_id:
+            errors.append("Missing reference id")
+        date = parse_date(date_text)
+        if not date:
+            errors.append("Invalid date (use YYYY-MM-DD or DD-MM-YYYY)")
+        amount = parse_amount(amount_text)
+        if amount is None or amount <= 0:
+            errors.append("Invalid amount")
+
+        if row_type == "loan":
+            weight = parse_amount(weight_text)
+            if not name and not phone:
+                errors.append("Missing customer name or phone")
+            if not description:
+                errors.append("Missing asset description")
+            if weight is None or weight < 0:
+                errors.append("Invalid weight")
+        elif row_type == "payment":
+            interest = parse_amount(interest_text) if interest_text else 0.0
+            if interest is None or interest < 0:
+                errors.append("Invalid interest")
+
+        if errors:
+            reject(row_number, row, "; ".join(errors))
+        elif row_type == "loan":
+            yield "loan", row_number, reference_id, date, name, phone, amount, description, weight
+        else:
+            yield "payment", row_number, reference_id, date, amount, interest, description or None
+
+
+def ledger_fields(record):
+    """Turn a ledger_rows record back into LEDGER_CSV_HEADER columns (for the rejects file)."""
+    if record[0] == "loan":
+        _, _, reference_id, date, name, phone, amount, description, weight = record
+        return "Loan", reference_id, date, name, phone, amount, "", description, weight
+    _, _, reference_id, date, amount, interest, description = record
+    return "Payment", reference_id, date, "", "", amount, interest, description or "", ""
+
+
+class RejectedRowsWriter:
+    """
+    Callable reject handler that appends rejected rows to a sidecar CSV.
+
+    The file is only created once the first row is rejected. Each line holds
+    the source row number, the reason and the original fields, so the file
+    can be corrected and imported again.
+    """
+
+    def __init__(self, source_file_name, header=()):
+        base, _ = os.path.splitext(source_file_name)
+        self.path = f"{base}{REJECTS_SUFFIX}.csv"
+        self.header = ["Row", "Error", *header]
+        self.count = 0
+        self.file = None
+        self.writer = None
+
+        # Don't leave a report from an earlier import lying around
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __call__(self, row_number, row, message):
+        if self.writer is None:
+            self.file = open(self.path, 'w', encoding=CSV_ENCODING, newline='')
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(self.header)
+        self.writer.writerow([row_number, message, *row])
+        self.count += 1
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
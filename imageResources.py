@@ -0,0 +1,58 @@
+"""
+Image Resources
+Loads the app's images from the assets folder on first use and caches them.
+
+The images used to be embedded as base64 strings in a Python module that had
+to be unmarshalled and decoded on every start. They are now plain PNG files,
+read only when a widget asks for them. A scaled variant is cached on its own,
+so the full-size logo is not kept in memory just to show the header strip.
+"""
+
+import os
+import sys
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon, QPixmap
+
+# ===== CUSTOMIZABLE VARIABLES =====
+ASSETS_DIR = "assets"  # Bundled next to the executable by PyInstaller (--add-data)
+FAVICON_FILE = "favicon.png"
+LOGO_FILE = "logo.png"
+LOGO_SIZE = (250, 20)  # Size the logo is shown at in the header
+# ==================================
+
+# (file name, size or None) -> QPixmap
+_pixmaps = {}
+
+
+def resource_path(*parts):
+    """Path of a bundled file, whether running from source or from a PyInstaller executable."""
+    # PyInstaller unpacks --add-data files under sys._MEIPASS
+    base_dir = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, *parts)
+
+
+def get_pixmap(file_name, size=None):
+    """
+    Return a cached QPixmap of an image in ASSETS_DIR, optionally scaled to size (width, height).
+
+    A missing file gives an empty pixmap (and a printed warning) rather than an error.
+    """
+    key = (file_name, size)
+    if key not in _pixmaps:
+        pixmap = QPixmap(resource_path(ASSETS_DIR, file_name))
+        if pixmap.isNull():
+            print(f"Could not load image: {file_name}")
+        elif size:
+            pixmap = pixmap.scaled(size[0], size[1], transformMode=Qt.SmoothTransformation)
+        _pixmaps[key] = pixmap
+    return _pixmaps[key]
+
+
+def favicon():
+    """Window icon."""
+    return QIcon(get_pixmap(FAVICON_FILE))
+
+
+def logo():
+    """Header logo, pre-scaled to LOGO_SIZE."""
+    return get_pixmap(LOGO_FILE, LOGO_SIZE)
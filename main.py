@@ -65,7 +65,8 @@ def run_pyinstaller():
             return False
         # command = fr'pyinstaller --onefile --windowed --distpath . --add-data=".auth;.auth" --add-data="{font_file_path};fonts\DejaVuSans.ttf" --name LoanApplication app.py'
         # command = fr'pyinstaller --onefile --windowed --distpath . --add-data="{font_file_path};fonts\DejaVuSans.ttf" --name LoanApplication app.py'
-        command = fr'pyinstaller --onefile --windowed --distpath final/ --name LoanApplication app.py'
+        # Images are loaded from assets/ at runtime (see imageResources.resource_path)
+        command = fr'pyinstaller --onefile --windowed --distpath final/ --add-data="assets;assets" --name LoanApplication app.py'
         result = subprocess.run(command, capture_output=True, text=True)
         
         # Log stdout and stderr
@@ -0,0 +1,152 @@
+"""
+Search Index
+In-memory n-gram index for substring search over short texts such as a
+customer's name and phone number.
+
+Every text is broken into overlapping GRAM_SIZE-character grams and each
+gram keeps a posting list of the items containing it. A query only looks at
+the shortest posting list among its grams and checks those candidates with
+a plain substring test, so a search touches a handful of items instead of
+the whole list. Queries shorter than a gram are answered by a scan.
+
+Loan tables are filtered the same way on precomputed per-loan search text
+(see loan_search_text).
+"""
+
+# ===== CUSTOMIZABLE VARIABLES =====
+GRAM_SIZE = 3  # Characters per indexed gram
+# ==================================
+
+
+def normalize_search_text(text):
+    """Lowercase text with runs of whitespace collapsed to single spaces."""
+    return " ".join(str(text or "").lower().split())
+
+
+def text_grams(text):
+    """Distinct GRAM_SIZE grams of every word in text."""
+    grams = set()
+    for word in text.split():
+        for start in range(len(word) - GRAM_SIZE + 1):
+            grams.add(word[start:start + GRAM_SIZE])
+    return grams
+
+
+def query_matches(words, text):
+    """True if every query word occurs somewhere in text."""
+    return all(word in text for word in words)
+
+
+def query_extends(query, previous_query):
+    """
+    True if every match for query is also a match for previous_query.
+
+    Typing more characters (or more words) at the end of a query can only
+    narrow its matches, so the previous result set can be filtered instead of
+    searching again.
+    """
+    return previous_query is not None and query.startswith(previous_query)
+
+
+class NgramIndex:
+    """
+    Substring index: search(query) returns the ids whose text contains every
+    word of the query.
+    """
+
+    def __init__(self):
+        self.texts = {}     # item_id -> normalized text
+        self.postings = {}  # gram -> [item_id, ...]
+
+    def __len__(self):
+        return len(self.texts)
+
+    def add(self, item_id, text):
+        """Index item_id under text, replacing whatever it was indexed under before."""
+        if item_id in self.texts:
+            self.remove(item_id)
+        text = normalize_search_text(text)
+        self.texts[item_id] = text
+        for gram in text_grams(text):
+            self.postings.setdefault(gram, []).append(item_id)
+
+    def remove(self, item_id):
+        text = self.texts.pop(item_id, None)
+        if text is None:
+            return
+        for gram in text_grams(text):
+            posting = self.postings.get(gram)
+            if posting is None:
+                continue
+            posting.remove(item_id)
+            if not posting:
+                del self.postings[gram]
+
+    def candidates(self, words):
+        """Smallest set of ids that can contain all of words (all ids if no word is long enough)."""
+        best = None
+        for word in words:
+            for start in range(len(word) - GRAM_SIZE + 1):
+                posting = self.postings.get(word[start:start + GRAM_SIZE], ())
+                if best is None or len(posting) < len(best):
+                    best = posting
+                if not best:
+                    return ()
+        return self.texts if best is None else best
+
+    def search(self, query, within=None):
+        """
+        Return the ids matching query.
+
+        Args:
+            query: Search text; every whitespace-separated word must occur in an item's text
+            within: Optional ids already known to include every match (e.g. the
+                    results of a query this one extends); only those are checked
+
+        Returns:
+            list: Matching ids, in no particular order
+        """
+        words = normalize_search_text(query).split()
+        if not words:
+            return list(self.texts if within is None else within)
+
+        texts = self.texts
+        if within is None:
+            within = self.candidates(words)
+        return [
+            item_id for item_id in within
+            if item_id in texts and query_matches(words, texts[item_id])
+        ]
+
+
+def loan_search_text(loan):
+    """
+    Lowercase search text for a LoanView row, built once when loans are loaded.
+
+    Holds every column the loan filters look at (the stored and the displayed
+    date, reference id, assets, weight, amounts and status), one per line, so
+    filtering is a single substring test per loan instead of re-formatting
+    each field on every keystroke.
+    """
+    date_part = str(loan[0] or "").split(" ")[0]
+    date_parts = date_part.split('-')
+    display_date = "-".join(reversed(date_parts)) if len(date_parts) == 3 else date_part
+    status = "completed" if float(loan[4] or 0) <= 0 else "pending"
+    fields = (
+        loan[0], display_date, loan[6] or "N/A", loan[1] or "N/A",
+        loan[2], loan[3], loan[4], loan[5], status
+    )
+    return "\n".join(str(field) for field in fields).lower()
+
+
+def index_loans(loans):
+    """Pair every loan with its search text: [(search_text, loan), ...]."""
+    return [(loan_search_text(loan), loan) for loan in loans]
+
+
+def filter_indexed_loans(indexed_loans, text):
+    """Loans (from index_loans) whose search text contains text; all of them if text is empty."""
+    text = text.strip().lower()
+    if not text:
+        return [loan for _, loan in indexed_loans]
+    return [loan for search_text, loan in indexed_loans if text in search_text]